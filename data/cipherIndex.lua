@@ -0,0 +1,177 @@
+-- Auto-generated cipher index from data/cipherData.lua and data/trustData.lua
+-- Generated: 2026-10-17
+
+local cipherIndex = {
+    -- Lowercase cipher name -> cipher_id in cipherData
+    cipherIds = {
+        ['cipher: zeid'] = 10112,
+        ['cipher: lion'] = 10113,
+        ['cipher: tenzen'] = 10114,
+        ['cipher: mihli'] = 10115,
+        ['cipher: valaineral'] = 10116,
+        ['cipher: joachim'] = 10117,
+        ['cipher: naja'] = 10118,
+        ['cipher: rainemard'] = 10119,
+        ['cipher: lehko'] = 10120,
+        ['cipher: ovjang'] = 10121,
+        ['cipher: mnejing'] = 10122,
+        ['cipher: sakura'] = 10123,
+        ['cipher: luzaf'] = 10124,
+        ['cipher: najelith'] = 10125,
+        ['cipher: aldo'] = 10126,
+        ['cipher: moogle'] = 10127,
+        ['cipher: fablinix'] = 10128,
+        ['cipher: domina'] = 10129,
+        ['cipher: elivira'] = 10130,
+        ['cipher: noillurie'] = 10131,
+        ['cipher: lhu'] = 10132,
+        ['cipher: f. coffin'] = 10133,
+        ['cipher: s. sibyl'] = 10134,
+        ['cipher: mumor'] = 10135,
+        ['cipher: uka'] = 10136,
+        ['cipher: lilisette'] = 10137,
+        ['cipher: cid'] = 10138,
+        ['cipher: rahal'] = 10139,
+        ['cipher: koru-moru'] = 10140,
+        ['cipher: kuyin'] = 10141,
+        ['cipher: karaha'] = 10142,
+        ['cipher: babban'] = 10143,
+        ['cipher: abenzio'] = 10144,
+        ['cipher: rughadjeen'] = 10145,
+        ['cipher: kukki'] = 10146,
+        ['cipher: margret'] = 10147,
+        ['cipher: gilgamesh'] = 10148,
+        ['cipher: areuhat'] = 10149,
+        ['cipher: lhe'] = 10150,
+        ['cipher: mayakov'] = 10151,
+        ['cipher: qultada'] = 10152,
+        ['cipher: adelheid'] = 10153,
+        ['cipher: amchuchu'] = 10154,
+        ['cipher: brygid'] = 10155,
+        ['cipher: mildaurion'] = 10156,
+        ['cipher: semih'] = 10157,
+        ['cipher: halver'] = 10158,
+        ['cipher: lion ii'] = 10159,
+        ['cipher: zeid ii'] = 10160,
+        ['cipher: rongelouts'] = 10161,
+        ['cipher: kupofried'] = 10162,
+        ['cipher: leonoyne'] = 10163,
+        ['cipher: maximilian'] = 10164,
+        ['cipher: kayeel'] = 10165,
+        ['cipher: robel-akbel'] = 10166,
+        ['cipher: tenzen ii'] = 10167,
+        ['cipher: prishe ii'] = 10168,
+        ['cipher: abquhbah'] = 10169,
+        ['cipher: nashmeira ii'] = 10170,
+        ['cipher: lilisette ii'] = 10171,
+        ['cipher: balamor'] = 10172,
+        ["cipher: selh'teus"] = 10173,
+        ['cipher: ingrid ii'] = 10174,
+        ['cipher: august'] = 10175,
+        ['cipher: rosulatia'] = 10176,
+        ['cipher: mumor ii'] = 10177,
+        ['cipher: ullegore'] = 10178,
+        ['cipher: teodor'] = 10179,
+        ['cipher: makki'] = 10180,
+        ['cipher: king'] = 10181,
+        ['cipher: morimar'] = 10182,
+        ['cipher: darrcuiln'] = 10183,
+        ['cipher: arciela ii'] = 10184,
+        ['cipher: iroha'] = 10185,
+        ['cipher: iroha ii'] = 10186,
+        ['cipher: shantotto ii'] = 10187,
+        ['cipher: ark hm'] = 10188,
+        ['cipher: ark tt'] = 10189,
+        ['cipher: ark mr'] = 10190,
+        ['cipher: ark ev'] = 10191,
+        ['cipher: ark gk'] = 10192,
+        ['cipher: monberaux'] = 10193,
+    },
+    -- Lowercase cipher name -> trust_id in trustData
+    trustIds = {
+        ['cipher: zeid'] = 906,
+        ['cipher: lion'] = 907,
+        ['cipher: tenzen'] = 908,
+        ['cipher: mihli'] = 909,
+        ['cipher: valaineral'] = 910,
+        ['cipher: joachim'] = 911,
+        ['cipher: naja'] = 912,
+        ['cipher: rainemard'] = 920,
+        ['cipher: lehko'] = 922,
+        ['cipher: ovjang'] = 925,
+        ['cipher: mnejing'] = 926,
+        ['cipher: sakura'] = 927,
+        ['cipher: luzaf'] = 928,
+        ['cipher: najelith'] = 929,
+        ['cipher: aldo'] = 930,
+        ['cipher: moogle'] = 931,
+        ['cipher: fablinix'] = 932,
+        ['cipher: domina'] = 934,
+        ['cipher: elivira'] = 941,
+        ['cipher: noillurie'] = 942,
+        ['cipher: lhu'] = 943,
+        ['cipher: f. coffin'] = 944,
+        ['cipher: s. sibyl'] = 935,
+        ['cipher: mumor'] = 946,
+        ['cipher: uka'] = 947,
+        ['cipher: lilisette'] = 945,
+        ['cipher: cid'] = 937,
+        ['cipher: rahal'] = 951,
+        ['cipher: koru-moru'] = 952,
+        ['cipher: kuyin'] = 950,
+        ['cipher: karaha'] = 936,
+        ['cipher: babban'] = 958,
+        ['cipher: abenzio'] = 959,
+        ['cipher: rughadjeen'] = 960,
+        ['cipher: kukki'] = 961,
+        ['cipher: margret'] = 962,
+        ['cipher: gilgamesh'] = 938,
+        ['cipher: areuhat'] = 939,
+        ['cipher: lhe'] = 964,
+        ['cipher: mayakov'] = 966,
+        ['cipher: qultada'] = 967,
+        ['cipher: adelheid'] = 968,
+        ['cipher: amchuchu'] = 969,
+        ['cipher: brygid'] = 970,
+        ['cipher: mildaurion'] = 971,
+        ['cipher: semih'] = 940,
+        ['cipher: halver'] = 972,
+        ['cipher: lion ii'] = 1009,
+        ['cipher: zeid ii'] = 1010,
+        ['cipher: rongelouts'] = 973,
+        ['cipher: kupofried'] = 978,
+        ['cipher: leonoyne'] = 974,
+        ['cipher: maximilian'] = 975,
+        ['cipher: kayeel'] = 976,
+        ['cipher: robel-akbel'] = 977,
+        ['cipher: tenzen ii'] = 1014,
+        ['cipher: prishe ii'] = 1011,
+        ['cipher: abquhbah'] = 982,
+        ['cipher: nashmeira ii'] = 1012,
+        ['cipher: lilisette ii'] = 1013,
+        ['cipher: balamor'] = 983,
+        ["cipher: selh'teus"] = 979,
+        ['cipher: ingrid ii'] = 1016,
+        ['cipher: august'] = 984,
+        ['cipher: rosulatia'] = 985,
+        ['cipher: mumor ii'] = 1015,
+        ['cipher: ullegore'] = 987,
+        ['cipher: teodor'] = 986,
+        ['cipher: makki'] = 988,
+        ['cipher: king'] = 989,
+        ['cipher: morimar'] = 990,
+        ['cipher: darrcuiln'] = 991,
+        ['cipher: arciela ii'] = 1017,
+        ['cipher: iroha'] = 997,
+        ['cipher: iroha ii'] = 1018,
+        ['cipher: shantotto ii'] = 1019,
+        ['cipher: ark hm'] = 992,
+        ['cipher: ark tt'] = 995,
+        ['cipher: ark mr'] = 994,
+        ['cipher: ark ev'] = 993,
+        ['cipher: ark gk'] = 996,
+        ['cipher: monberaux'] = 999,
+    },
+}
+
+return cipherIndex
@@ -0,0 +1,39 @@
+-- Auto-generated icon atlas from resources/icons
+-- Generated: 2026-10-17
+
+local iconAtlas = {
+    file = 'iconAtlas.png',
+    width = 128,
+    height = 256,
+    -- Icon file name without .png -> pixel rectangle and UVs in the atlas
+    icons = {
+        Compression_SC_Icon = { x = 102, y = 0, width = 16, height = 16, uv0 = { 0.796875, 0.0 }, uv1 = { 0.921875, 0.0625 } },
+        Dark_SC_Icon = { x = 102, y = 18, width = 16, height = 16, uv0 = { 0.796875, 0.0703125 }, uv1 = { 0.921875, 0.1328125 } },
+        Detonation_SC_Icon = { x = 102, y = 36, width = 16, height = 16, uv0 = { 0.796875, 0.140625 }, uv1 = { 0.921875, 0.203125 } },
+        Distortion_SC_Icon = { x = 102, y = 54, width = 16, height = 16, uv0 = { 0.796875, 0.2109375 }, uv1 = { 0.921875, 0.2734375 } },
+        Fragmentation_SC_Icon = { x = 102, y = 72, width = 16, height = 16, uv0 = { 0.796875, 0.28125 }, uv1 = { 0.921875, 0.34375 } },
+        Fusion_SC_Icon = { x = 102, y = 90, width = 16, height = 16, uv0 = { 0.796875, 0.3515625 }, uv1 = { 0.921875, 0.4140625 } },
+        Gravitation_SC_Icon = { x = 0, y = 102, width = 16, height = 16, uv0 = { 0.0, 0.3984375 }, uv1 = { 0.125, 0.4609375 } },
+        Impaction_SC_Icon = { x = 18, y = 102, width = 16, height = 16, uv0 = { 0.140625, 0.3984375 }, uv1 = { 0.265625, 0.4609375 } },
+        Induration_SC_Icon = { x = 36, y = 102, width = 16, height = 16, uv0 = { 0.28125, 0.3984375 }, uv1 = { 0.40625, 0.4609375 } },
+        Light_SC_Icon = { x = 54, y = 102, width = 16, height = 16, uv0 = { 0.421875, 0.3984375 }, uv1 = { 0.546875, 0.4609375 } },
+        Liquefaction_SC_Icon = { x = 72, y = 102, width = 16, height = 16, uv0 = { 0.5625, 0.3984375 }, uv1 = { 0.6875, 0.4609375 } },
+        Radiance_SC_Icon = { x = 90, y = 108, width = 16, height = 16, uv0 = { 0.703125, 0.421875 }, uv1 = { 0.828125, 0.484375 } },
+        Reverberation_SC_Icon = { x = 108, y = 108, width = 16, height = 16, uv0 = { 0.84375, 0.421875 }, uv1 = { 0.96875, 0.484375 } },
+        Scission_SC_Icon = { x = 0, y = 120, width = 16, height = 16, uv0 = { 0.0, 0.46875 }, uv1 = { 0.125, 0.53125 } },
+        Status_Ability = { x = 18, y = 120, width = 16, height = 16, uv0 = { 0.140625, 0.46875 }, uv1 = { 0.265625, 0.53125 } },
+        Transfixion_SC_Icon = { x = 36, y = 120, width = 16, height = 16, uv0 = { 0.28125, 0.46875 }, uv1 = { 0.40625, 0.53125 } },
+        Umbra_SC_Icon = { x = 54, y = 120, width = 16, height = 16, uv0 = { 0.421875, 0.46875 }, uv1 = { 0.546875, 0.53125 } },
+        caster = { x = 0, y = 0, width = 32, height = 32, uv0 = { 0.0, 0.0 }, uv1 = { 0.25, 0.125 } },
+        favorite = { x = 34, y = 0, width = 32, height = 32, uv0 = { 0.265625, 0.0 }, uv1 = { 0.515625, 0.125 } },
+        healer = { x = 68, y = 0, width = 32, height = 32, uv0 = { 0.53125, 0.0 }, uv1 = { 0.78125, 0.125 } },
+        melee = { x = 0, y = 34, width = 32, height = 32, uv0 = { 0.0, 0.1328125 }, uv1 = { 0.25, 0.2578125 } },
+        other = { x = 34, y = 34, width = 32, height = 32, uv0 = { 0.265625, 0.1328125 }, uv1 = { 0.515625, 0.2578125 } },
+        ranged = { x = 68, y = 34, width = 32, height = 32, uv0 = { 0.53125, 0.1328125 }, uv1 = { 0.78125, 0.2578125 } },
+        support = { x = 0, y = 68, width = 32, height = 32, uv0 = { 0.0, 0.265625 }, uv1 = { 0.25, 0.390625 } },
+        tank = { x = 34, y = 68, width = 32, height = 32, uv0 = { 0.265625, 0.265625 }, uv1 = { 0.515625, 0.390625 } },
+        unityconcord = { x = 68, y = 68, width = 32, height = 32, uv0 = { 0.53125, 0.265625 }, uv1 = { 0.78125, 0.390625 } },
+    }
+}
+
+return iconAtlas
@@ -0,0 +1,3211 @@
+-- Auto-generated search index from data/trustData.lua, data/trustAliases.lua, data/trustCategories.lua and data/trustInformation.json
+-- Generated: 2026-10-17
+
+local searchIndex = {
+    -- Lowercase search terms of every trust id: names, categories, job, spells, abilities and weapon skills
+    terms = {
+        [896] = { 'shantotto', 'offensive caster', 'black mage', 'single-target elemental nukes i - v', 'single-target elemental nukes i', 'single-target elemental nukes ii', 'single-target elemental nukes iii', 'single-target elemental nukes iv', 'single-target elemental nukes v' },
+        [897] = { 'naji', 'melee fighter', 'warrior', 'provoke', 'burning blade', 'red lotus blade', 'vorpal blade' },
+        [898] = { 'kupipi', 'healer', 'white mage', 'cure i - vi', 'cure i', 'cure ii', 'cure iii', 'cure iv', 'cure v', 'cure vi', 'protect/ra i - v', 'protect/ra i', 'protect/ra ii', 'protect/ra iii', 'protect/ra iv', 'protect/ra v', 'shell/ra i - v', 'shell/ra i', 'shell/ra ii', 'shell/ra iii', 'shell/ra iv', 'shell/ra v', '-na spells', 'slow', 'paralyze', 'erase', 'starlight', 'moonlight' },
+        [899] = { 'excenmille', 'melee fighter', 'paladin', 'flash', 'cure i - iv', 'cure i', 'cure ii', 'cure iii', 'cure iv', 'sentinel', 'double thrust', 'leg sweep', 'penta thrust' },
+        [900] = { 'ayame', 'melee fighter', 'samurai', 'meditate', 'hasso', 'third eye', 'tachi: enpi', 'tachi: hobaku', 'tachi: goten', 'tachi: kagero', 'tachi: jinpu', 'tachi: koki', 'tachi: yukikaze', 'tachi: gekko', 'tachi: kasha' },
+        [901] = { 'nanaa mihgo', 'melee fighter', 'thief', 'despoil', 'wasp sting', 'dancing edge', 'king cobra clamp', 'aoe' },
+        [902] = { 'curilla', 'tank', 'paladin', 'cure i - iv', 'cure i', 'cure ii', 'cure iii', 'cure iv', 'flash', 'sentinel', 'red lotus blade', 'seraph blade', 'swift blade', 'vorpal blade' },
+        [903] = { 'volker', 'melee fighter', 'warrior', 'aggressor', 'berserk', 'defender', 'provoke', 'retaliation', "warrior's charge", 'warcry', 'berserk-ruf', 'attack boost', 'fast blade', 'savage blade', 'spirits within', 'vorpal blade' },
+        [904] = { 'ajido-marujido', 'offensive caster', 'black mage', 'red mage', 'cure i - iv', 'cure i', 'cure ii', 'cure iii', 'cure iv', 'dispel', 'single-target elemental nukes i - v', 'single-target elemental nukes i', 'single-target elemental nukes ii', 'single-target elemental nukes iii', 'single-target elemental nukes iv', 'single-target elemental nukes v', 'slow', 'paralyze' },
+        [905] = { 'trion', 'tank', 'paladin', 'warrior', 'cure i - iv', 'cure i', 'cure ii', 'cure iii', 'cure iv', 'flash', 'provoke', 'sentinel', 'red lotus blade', 'savage blade', 'royal bash', 'shield bash', 'royal savior', 'palisade', 'stoneskin' },
+        [906] = { 'zeid', 'melee fighter', 'dark knight', 'absorb spells', 'includes', 'absorb-attri', 'and', 'absorb-tp', 'endark', 'drain/aspir i/ii', 'stun', 'last resort', 'nether void', 'souleater', 'freezebite', 'ground strike', 'abyssal drain', 'drain', 'abyssal strike' },
+        [907] = { 'lion', 'melee fighter', 'thief', 'walk the plank', 'aoe', 'pirate pummel', 'powder keg', 'conal', 'grapeshot' },
+        [908] = { 'tenzen', 'melee fighter', 'samurai', 'hasso', 'save tp', 'meditate', 'hagakure', 'third eye', 'amatsu: torimai', 'amatsu: kazakiri', 'amatsu: yukiarashi', 'amatsu: tsukioboro', 'amatsu: hanaikusa', 'amatsu: tsukikage' },
+        [909] = { 'mihli aliapoh', 'healer', 'white mage', 'cure i - vi', 'cure i', 'cure ii', 'cure iii', 'cure iv', 'cure v', 'cure vi', 'protect/ra i - v', 'protect/ra i', 'protect/ra ii', 'protect/ra iii', 'protect/ra iv', 'protect/ra v', 'shell/ra i - v', 'shell/ra i', 'shell/ra ii', 'shell/ra iii', 'shell/ra iv', 'shell/ra v', '-na spells', 'slow', 'paralyze', 'afflatus solace', 'true strike', 'brainshaker', 'hexa strike', 'scouring bubbles (aoe' },
+        [910] = { 'valaineral', 'tank', 'paladin', 'warrior', 'cure i - iv', 'cure i', 'cure ii', 'cure iii', 'cure iv', 'flash', 'protect iv - v', 'protect iv', 'protect v', 'reprisal', 'enlight', 'phalanx', 'provoke', 'sentinel', 'majesty', 'defender', 'fealty', 'divine emblem', 'chivalry', 'palisade', 'rampart', 'circle blade', 'sanguine blade', 'savage blade', 'uriel blade', 'aoe' },
+        [911] = { 'joachim', 'support', 'bard', 'white mage', 'sword/blade madrigal', 'battlefield/carnage elegy', 'advancing/victory march', "army's paeon i - vi", "army's paeon i", "army's paeon ii", "army's paeon iii", "army's paeon iv", "army's paeon v", "army's paeon vi", "mage's ballad i - iii", "mage's ballad i", "mage's ballad ii", "mage's ballad iii", 'valor minuet i - v', 'valor minuet i', 'valor minuet ii', 'valor minuet iii', 'valor minuet iv', 'valor minuet v', "knight's minne i - v", "knight's minne i", "knight's minne ii", "knight's minne iii", "knight's minne iv", "knight's minne v", 'cure i - iv', 'cure i', 'cure ii', 'cure iii', 'cure iv', 'erase', '-na spells' },
+        [912] = { 'naja salaheem', 'melee fighter', 'monk', 'warrior', 'focus', 'dodge', 'counterstance', 'true strike', 'black halo', 'hexa strike', 'peacebreaker' },
+        [913] = { 'prishe', 'melee fighter', 'monk', 'white mage', 'cure i - iv', 'cure i', 'cure ii', 'cure iii', 'cure iv', 'knuckle sandwich', 'damage', 'nullifying dropkick', 'auroral uppercut' },
+        [914] = { 'ulmia', 'support', 'bard', 'sword/blade madrigal', "hunter's/archer's prelude", 'advancing/victory march', 'valor minuet i - v', 'valor minuet i', 'valor minuet ii', 'valor minuet iii', 'valor minuet iv', 'valor minuet v', "mage's ballad i - iii", "mage's ballad i", "mage's ballad ii", "mage's ballad iii", "sentinel's scherzo", 'pianissimo' },
+        [915] = { 'shikaree z', 'melee fighter', 'dragoon', 'white mage', 'cure i - iv', 'cure i', 'cure ii', 'cure iii', 'cure iv', 'haste', '-na spells', 'erase', 'jump', 'high jump', 'super jump', 'ancient circle', 'raiden thrust', 'skewer', 'wheeling thrust', 'impulse drive' },
+        [916] = { 'cherukiki', 'healer', 'white mage', 'black mage', 'cure i - vi', 'cure i', 'cure ii', 'cure iii', 'cure iv', 'cure v', 'cure vi', 'protect/ra i - v', 'protect/ra i', 'protect/ra ii', 'protect/ra iii', 'protect/ra iv', 'protect/ra v', 'shell/ra i - v', 'shell/ra i', 'shell/ra ii', 'shell/ra iii', 'shell/ra iv', 'shell/ra v', 'regen i - iv', 'regen i', 'regen ii', 'regen iii', 'regen iv', 'haste', 'slow', 'paralyze', 'silence' },
+        [917] = { 'iron eater', 'melee fighter', 'warrior', 'provoke', 'berserk', 'restraint', 'shield break', 'armor break', 'steel cyclone' },
+        [918] = { 'gessho', 'tank', 'ninja', 'warrior', 'utsusemi: ichi', 'ni', 'hojo: ichi', 'kurayami: ichi', 'provoke', 'yonin', 'shiko no mitate', 'yagudo parry', 'rinpyotosha', 'yagudo howl', 'attack boost', 'happobarai', 'yagudo sweep', 'hane fubuki', 'feather storm', 'shibaraku (aoe' },
+        [919] = { 'gadalar', 'offensive caster', 'black mage', 'firaga i - iii', 'firaga i', 'firaga ii', 'firaga iii', 'blaze spikes', 'spinning scythe', 'spiral hell', 'salamander flame', 'aoe fire', 'vorpal scythe' },
+        [920] = { 'rainemard', 'melee fighter', 'red mage', 'paladin', 'enspells', 'haste', 'ii', 'distract', 'frazzle', 'phalanx', 'protect i - v', 'protect i', 'protect ii', 'protect iii', 'protect iv', 'protect v', 'shell i - v', 'shell i', 'shell ii', 'shell iii', 'shell iv', 'shell v', 'refresh', 'composure', 'burning blade', 'red lotus blade', 'vorpal blade', 'savage blade' },
+        [921] = { 'ingrid', 'offensive caster', 'white mage', 'haste', 'banish i - iii', 'banish i', 'banish ii', 'banish iii', 'cursna', 'seraph strike', 'judgment', 'hexa strike' },
+        [922] = { 'lehko habhoka', 'melee fighter', 'thief', 'black mage', 'single-target elemental nukes i - ii', 'single-target elemental nukes i', 'single-target elemental nukes ii', 'iridal pierce', 'aoe', 'lunar revolution', 'conal', 'debonair rush', 'inspirit', 'aoe hp+mp restore+', 'erase' },
+        [923] = { 'nashmeira', 'melee fighter', 'puppetmaster', 'white mage', '-na spells', 'cure i - iv', 'cure i', 'cure ii', 'cure iii', 'cure iv', 'imperial authority', 'stun' },
+        [924] = { 'zazarg', 'melee fighter', 'monk', 'focus', 'howling fist', 'dragon kick', 'asuran fists', 'meteoric impact' },
+        [925] = { 'ovjang', 'offensive caster', 'red mage', 'black mage', 'stormwaker', 'slow', 'silence', 'paralyze', 'dispel', 'single-target elemental nukes i - iv', 'single-target elemental nukes i', 'single-target elemental nukes ii', 'single-target elemental nukes iii', 'single-target elemental nukes iv', 'sixth element', 'knockout', 'slapstick' },
+        [926] = { 'mnejing', 'tank', 'paladin', 'valoredge', 'strobe i - ii', 'strobe i', 'strobe ii', 'provoke', 'shield bash', 'stun', 'disruptor', 'dispel', 'flashbulb', 'flash', 'chimera ripper', 'string clipper', 'shield subverter', 'conal aoe, silence' },
+        [927] = { 'sakura', 'special', 'geomancer', 'bard', 'none' },
+        [928] = { 'luzaf', 'melee fighter', 'corsair', 'ninja', 'quick draw', 'triple shot', 'bisection', 'akimbo shot', 'leaden salute', 'grisly horizon' },
+        [929] = { 'najelith', 'ranged fighter', 'ranger', 'barrage', 'double shot', 'cyclone', 'sidewinder', 'empyreal arrow', 'typhonic arrow', 'conal aoe' },
+        [930] = { 'aldo', 'melee fighter', 'thief', 'ninja', 'bully', 'sneak attack', "assassin's charge", 'lock and load', 'shockstorm edge', 'aoe', 'iniquitous stab', 'choreographed carnage' },
+        [931] = { 'moogle', 'special', 'geomancer', 'bard', 'none' },
+        [932] = { 'fablinix', 'melee fighter', 'thief', 'red mage', 'stun', 'enwater', 'cure i - iv', 'cure i', 'cure ii', 'cure iii', 'cure iv', 'bomb toss', 'aoe', 'goblin rush' },
+        [933] = { 'maat', 'melee fighter', 'monk', 'thief', 'mantra', 'perfect counter', 'formless strikes', 'asuran fists', 'one-ilm punch', 'combo', 'dragon kick', 'howling fist', 'bear killer', 'conal' },
+        [934] = { 'd. shantotto', 'domina shantotto', 'offensive caster', 'black mage', 'dark knight', 'single-target elemental nukes i - v', 'single-target elemental nukes i', 'single-target elemental nukes ii', 'single-target elemental nukes iii', 'single-target elemental nukes iv', 'single-target elemental nukes v', 'guillotine', 'cross reaper', 'shadow of death', 'salvation scythe' },
+        [935] = { 'star sibyl', 'special', 'geomancer', 'bard', 'none' },
+        [936] = { 'karaha-baruha', 'healer', 'white mage', 'summoner', 'cure i - vi', 'cure i', 'cure ii', 'cure iii', 'cure iv', 'cure v', 'cure vi', 'protect/ra i - v', 'protect/ra i', 'protect/ra ii', 'protect/ra iii', 'protect/ra iv', 'protect/ra v', 'shell/ra i - v', 'shell/ra i', 'shell/ra ii', 'shell/ra iii', 'shell/ra iv', 'shell/ra v', '-na spells', 'haste', 'barelementra', 'spirit taker', 'sunburst', 'starburst', 'howling moon', 'aoe', 'lunar bay' },
+        [937] = { 'cid', 'melee fighter', 'warrior', 'ranger', 'berserk', 'aggressor', 'true strike', 'hexa strike', 'fiery tailings', 'aoe', 'critical mass' },
+        [938] = { 'gilgamesh', 'melee fighter', 'samurai', 'warrior', 'hasso', 'third eye', 'sekkanoki', 'hagakure', 'tachi: goten', 'tachi: kasha', 'iainuki', 'tachi: kamai', 'aoe' },
+        [939] = { 'areuhat', 'melee fighter', 'warrior', 'paladin', 'aggressor', 'berserk', 'blood rage', 'seraph blade', 'vorpal blade', 'savage blade', 'hurricane wing', 'aoe', 'dragon breath', 'conal aoe' },
+        [940] = { 'semih lafihna', 'ranged fighter', 'ranger', 'warrior', 'sharpshot', 'barrage', 'stealth shot', 'double shot', 'sidewinder', 'arching arrow', 'stellar arrow', 'aoe', 'lux arrow' },
+        [941] = { 'elivira', 'ranged fighter', 'ranger', 'warrior', 'berserk', 'barrage', 'decoy shot', 'double shot', 'coronach', 'slug shot', 'heavy shot', 'split shot' },
+        [942] = { 'noillurie', 'melee fighter', 'samurai', 'paladin', 'cure i - iv', 'cure i', 'cure ii', 'cure iii', 'cure iv', 'hasso', 'third eye', 'meditate', 'sekkanoki', 'tachi: jinpu', 'tachi: yukikaze', 'tachi: gekko', 'tachi: kasha', 'tachi: kaiten' },
+        [943] = { 'lhu mhakaracca', 'melee fighter', 'beastmaster', 'warrior', 'feral howl', 'berserk', 'aggressor', 'spinning axe', 'rampage', 'onslaught', 'decimation' },
+        [944] = { 'ferreous coffin', 'healer', 'white mage', 'warrior', 'cure i - vi', 'cure i', 'cure ii', 'cure iii', 'cure iv', 'cure v', 'cure vi', 'raise i - iii', 'raise i', 'raise ii', 'raise iii', '-na spells', 'haste', 'randgrith' },
+        [945] = { 'lilisette', 'melee fighter', 'dancer', 'whirling edge', 'aoe', "dancer's fury", 'rousing samba', 'sensual dance', 'thorn dance', 'vivifying waltz', 'divine waltz ii' },
+        [946] = { 'mumor', 'melee fighter', 'dancer', 'warrior', 'stutter step', 'haste samba', 'drain samba', 'ii', 'iii', 'saber dance', 'violent flourish', 'skullbreaker' },
+        [947] = { 'uka totlihn', 'melee fighter', 'dancer', 'warrior', 'quickstep', 'drain samba', 'ii', 'iii', 'reverse flourish', 'haste samba', 'curing waltz i - v', 'curing waltz i', 'curing waltz ii', 'curing waltz iii', 'curing waltz iv', 'curing waltz v', 'healing waltz', 'judgment' },
+        [948] = { 'klara', 'melee fighter', 'warrior', 'berserk', 'provoke', 'warcry', 'fast blade', 'vorpal blade', 'savage blade', 'temblor blade (aoe' },
+        [949] = { 'romaa mihgo', 'melee fighter', 'thief', 'warrior', 'feint', 'aura steal', 'sneak attack', 'trick attack', 'fast blade', 'vorpal blade', 'savage blade', 'cobra clamp', 'conal aoe, stun, paralyze' },
+        [950] = { 'kuyin hathdenna', 'special', 'geomancer', 'bard', 'none' },
+        [951] = { 'rahal', 'tank', 'paladin', 'warrior', 'cure i - iv', 'cure i', 'cure ii', 'cure iii', 'cure iv', 'flash', 'phalanx', 'enlight', 'sentinel', 'berserk', 'provoke', 'shield bash', 'fast blade', 'seraph blade', 'swift blade', 'savage blade' },
+        [952] = { 'koru-moru', 'support', 'red mage', 'white mage', 'refresh', 'ii', 'haste', 'flurry', 'protect i - v', 'protect i', 'protect ii', 'protect iii', 'protect iv', 'protect v', 'shell i - v', 'shell i', 'shell ii', 'shell iii', 'shell iv', 'shell v', 'phalanx ii', 'slow', 'dia', 'iii', 'distract', 'dispel', 'cure i - iv', 'cure i', 'cure ii', 'cure iii', 'cure iv', 'convert' },
+        [953] = { 'pieuje (uc', 'healer', 'unity concord', 'white mage', 'paladin', 'cure i - vi', 'cure i', 'cure ii', 'cure iii', 'cure iv', 'cure v', 'cure vi', '-na spells', 'erase', 'esuna', 'protect/ra i - v', 'protect/ra i', 'protect/ra ii', 'protect/ra iii', 'protect/ra iv', 'protect/ra v', 'shell/ra i - v', 'shell/ra i', 'shell/ra ii', 'shell/ra iii', 'shell/ra iv', 'shell/ra v', 'auspice', 'haste', 'afflatus misery', 'sacrosanctity', 'starlight', 'moonlight', 'nott' },
+        [954] = { 'i. shield (uc', 'invincible shield (uc', 'melee fighter', 'unity concord', 'warrior', 'corsair', 'provoke', 'aggressor', 'restraint', 'retaliation', 'warcry', 'blood rage', 'tomahawk', 'savagery', 'raging rush', 'steel cyclone', "soturi's fury" },
+        [955] = { 'apururu (uc', 'healer', 'unity concord', 'white mage', 'red mage', 'cure i - vi', 'cure i', 'cure ii', 'cure iii', 'cure iv', 'cure v', 'cure vi', 'curaga i - v', 'curaga i', 'curaga ii', 'curaga iii', 'curaga iv', 'curaga v', 'protect/ra i - v', 'protect/ra i', 'protect/ra ii', 'protect/ra iii', 'protect/ra iv', 'protect/ra v', 'shell/ra i - v', 'shell/ra i', 'shell/ra ii', 'shell/ra iii', 'shell/ra iv', 'shell/ra v', '-na spells', 'erase', 'stoneskin', 'haste', 'martyr', 'devotion', 'convert', 'nott' },
+        [956] = { 'jakoh (uc', 'jakoh wahcondalo (uc', 'melee fighter', 'unity concord', 'thief', 'warrior', 'conspirator', 'trick attack', 'sneak attack', 'feint', 'dancing edge', 'evisceration', "sarva's storm" },
+        [957] = { 'flaviria (uc', 'melee fighter', 'unity concord', 'dragoon', 'warrior', 'jump', 'high jump', 'super jump', 'angon', 'berserk', 'skewer', 'impulse drive', "celidon's torment" },
+        [958] = { 'babban', 'babban mheillea', 'melee fighter', 'monk', 'wild oats', 'headbutt', 'photosynthesis', 'grants', 'regen', 'petal pirouette', "resets foe's tp to zero) (aoe" },
+        [959] = { 'abenzio', 'melee fighter', 'monk', 'warrior', 'blank gaze', 'conal paralysis', 'antiphase', 'aoe silence', 'uppercut', 'blow', 'damage + stun' },
+        [960] = { 'rughadjeen', 'tank', 'paladin', 'holy', 'flash', 'cure i - iv', 'cure i', 'cure ii', 'cure iii', 'cure iv', 'raise', 'sentinel', 'divine emblem', 'holy circle', 'chivalry', 'power slash', 'sickle moon', 'ground strike', 'victory beacon (conal aoe' },
+        [961] = { 'kukki-chebukki', 'offensive caster', 'black mage', 'single-target elemental nukes i - v', 'single-target elemental nukes i', 'single-target elemental nukes ii', 'single-target elemental nukes iii', 'single-target elemental nukes iv', 'single-target elemental nukes v', 'multi-target elemental nukes i - iii, -aja', 'elemental debuff spells', 'sleepga i - ii', 'sleepga i', 'sleepga ii' },
+        [962] = { 'margret', 'ranged fighter', 'ranger', 'thief', 'decoy shot', 'double shot', 'barrage', 'sharpshot', 'stealth shot', 'sidewinder', 'arching arrow', 'refulgent arrow', 'piercing arrow' },
+        [963] = { 'chacharoon', 'melee fighter', 'thief', 'ranger', 'sharp eye', 'conal', 'tripe gripe', 'pocket sand' },
+        [964] = { 'lhe lhangavo', 'melee fighter', 'monk', 'warrior', 'dodge', 'chakra', 'impetus', 'focus', 'formless strikes', 'provoke', 'backhand blow', 'raging fists', 'dragon kick', 'asuran fists' },
+        [965] = { 'arciela', 'support', 'red mage', 'paladin', 'refresh', 'ii', 'haste', 'protect i - v', 'protect i', 'protect ii', 'protect iii', 'protect iv', 'protect v', 'shell i - v', 'shell i', 'shell ii', 'shell iii', 'shell iv', 'shell v', 'slow', 'paralyze', 'addle', 'dispel', 'bellatrix of light, bellatrix of shadows', 'guiding light', 'aoe atk+def+m.atk+m.def up', 'illustrious aid', 'dynastic gravitas' },
+        [966] = { 'mayakov', 'melee fighter', 'dancer', 'warrior', 'drain samba i - iii', 'drain samba i', 'drain samba ii', 'drain samba iii', 'haste samba', 'feather step', 'saber dance', 'climactic flourish', 'coming up roses', 'fast blade', 'swift blade', 'vorpal blade' },
+        [967] = { 'qultada', 'support', 'corsair', 'ranger', 'triple shot', 'double-up', 'snake eye', "corsair's roll", 'chaos roll', "hunter's roll", "evoker's roll", "fighter's roll", 'light shot', 'dark shot', 'savage blade', 'burning blade', 'sniper shot', 'detonator' },
+        [968] = { 'adelheid', 'offensive caster', 'scholar', 'black mage', 'cure i - iv', 'cure i', 'cure ii', 'cure iii', 'cure iv', 'helices', 'single-target elemental nukes i - v', 'single-target elemental nukes i', 'single-target elemental nukes ii', 'single-target elemental nukes iii', 'single-target elemental nukes iv', 'single-target elemental nukes v', 'storms', 'stun', 'dark arts', 'addendum: black', 'binding microtube', 'paralyzing microtube', 'silencing microtube', 'twirling dervish', 'aoe' },
+        [969] = { 'amchuchu', 'tank', 'rune fencer', 'warrior', 'flash', 'foil', 'stoneskin', 'refresh', 'phalanx', 'regen i - iv', 'regen i', 'regen ii', 'regen iii', 'regen iv', 'protect i - iv', 'protect i', 'protect ii', 'protect iii', 'protect iv', 'shell i - v', 'shell i', 'shell ii', 'shell iii', 'shell iv', 'shell v', 'bar-element spells', 'berserk', 'provoke', 'embolden', 'battuta', 'vallation', 'valiance', 'swordplay', 'vivacious pulse', 'rune enhancement', 'one for all', 'swipe', 'lunge', 'dimidiation', 'power slash', 'sickle moon' },
+        [970] = { 'brygid', 'special', 'geomancer', 'bard', 'none' },
+        [971] = { 'mildaurion', 'melee fighter', 'paladin', 'samurai', 'light blade', 'physical', 'stellar burst', 'magical', 'great wheel', 'physical aoe + knockback', 'vortex', 'magical:wind' },
+        [972] = { 'halver', 'melee fighter', 'paladin', 'warrior', 'cure i - iv', 'cure i', 'cure ii', 'cure iii', 'cure iv', 'flash', 'berserk', 'rampart', 'provoke', 'sentinel', 'penta thrust', 'impulse drive', 'raiden thrust' },
+        [973] = { 'rongelouts', 'melee fighter', 'warrior', 'berserk', 'aggressor', 'warcry', 'tongue lash', 'aoe', 'terror', 'red lotus blade', 'savage blade', 'seraph blade' },
+        [974] = { 'leonoyne', 'offensive caster', 'black mage', 'paladin', 'ice spikes', 'blizzaga i - iii', 'blizzaga i', 'blizzaga ii', 'blizzaga iii', 'freezebite', 'herculean slash', 'shockwave', 'spine chiller', 'terror' },
+        [975] = { 'maximilian', 'melee fighter', 'thief', 'ninja', 'fast blade', 'vorpal blade', 'swift blade' },
+        [976] = { 'kayeel-payeel', 'offensive caster', 'black mage', 'summoner', 'single-target elemental nukes i - v', 'single-target elemental nukes i', 'single-target elemental nukes ii', 'single-target elemental nukes iii', 'single-target elemental nukes iv', 'single-target elemental nukes v', 'multi-target elemental nukes i - iii, -aja', 'ancient magic', 'ii', 'gate of tartarus', 'tartarus torpor', 'aoe sleep, m.def/m.eva down', 'sunburst' },
+        [977] = { 'robel-akbel', 'offensive caster', 'black mage', 'summoner', 'single-target elemental nukes i - v, -aja', 'stun', 'spirit taker', 'null blast', 'restores mp equal to damage dealt', 'quietus sphere', 'aoe dark' },
+        [978] = { 'kupofried', 'special', 'geomancer', 'bard', 'none' },
+        [979] = { "selh'teus", 'melee fighter', 'paladin', 'samurai', 'luminous lance', 'rejuvenation', 'hp+mp+tp restore', 'revelation' },
+        [980] = { 'yoran-oran (uc', 'healer', 'unity concord', 'white mage', 'black mage', 'protectra i - v', 'protectra i', 'protectra ii', 'protectra iii', 'protectra iv', 'protectra v', 'shellra i - v', 'shellra i', 'shellra ii', 'shellra iii', 'shellra iv', 'shellra v', '-na spells', 'cure i - vi', 'cure i', 'cure ii', 'cure iii', 'cure iv', 'cure v', 'cure vi', 'erase', 'stoneskin', 'afflatus solace', 'nott' },
+        [981] = { 'sylvie (uc', 'support', 'unity concord', 'geomancer', 'white mage', 'cure i - iv', 'cure i', 'cure ii', 'cure iii', 'cure iv', '-na spells', 'erase', 'haste', 'indi-haste', 'indi-fury', 'indi-precision', 'indi-refresh', 'indi-regen', 'indi-acumen', 'indi-languor', 'entrust', 'nott' },
+        [982] = { 'abquhbah', 'melee fighter', 'warrior', 'monk', 'berserk', 'warcry', 'restraint', 'combo', 'backhand blow', 'salaheem spirit' },
+        [983] = { 'balamor', 'melee fighter', 'dark knight', 'black mage', 'absorb-stat spells', 'feast of arrows', 'last laugh', 'drain hp', 'regurgitated swarm', 'setting the stage' },
+        [984] = { 'august', 'tank', 'paladin', 'warrior', 'cure i - iv', 'cure i', 'cure ii', 'cure iii', 'cure iv', 'flash', 'holy ii', 'reprisal', 'sentinel', 'provoke', 'divine emblem', 'palisade', 'daybreak (wings', 'neutral', 'alabaster burst', 'null field', 'tartaric sigil', 'daybreak', 'fulminous fury', 'noble frenzy', 'no quarter' },
+        [985] = { 'rosulatia', 'offensive caster', 'black mage', 'dark knight', 'stone i-v', 'stone i', 'stone ii', 'stone iii', 'stone iv', 'stone v', 'baneful blades', 'depraved dandia', 'dryad kiss', 'haste', 'regen', 'matriarchal fiat', 'aoe', 'wildwood indignation' },
+        [986] = { 'teodor', 'melee fighter', 'black mage', 'dark knight', '-ja spells', '-ga spells', 'magic burst', 'only', 'start from scratch', "sinner's cross", 'ravenous assault', 'drain', 'frenzied thrust', 'open coffin', 'hemocladis', "restores teodor's hp" },
+        [987] = { 'ullegore', 'offensive caster', 'black mage', 'dark knight', 'single-target elemental nukes i - v', 'single-target elemental nukes i', 'single-target elemental nukes ii', 'single-target elemental nukes iii', 'single-target elemental nukes iv', 'single-target elemental nukes v', 'comet', 'stun', 'bored to tears', 'slow', 'envoutement', 'memento mori', 'm.atk. boost', 'silence seal', 'aoe silence' },
+        [988] = { 'makki-chebukki', 'ranged fighter', 'ranger', 'black mage', 'flashy shot', 'sharpshot', 'barrage', 'sidewinder', 'empyreal arrow', 'dulling arrow', 'flaming arrow' },
+        [989] = { 'king of hearts', 'support', 'red mage', 'white mage', 'refresh', 'ii', 'haste', 'dia', 'iii', 'temper', 'firaga iv', 'cure i - iv', 'cure i', 'cure ii', 'cure iii', 'cure iv', 'phalanx', '-na spells', 'erase', 'bludgeon', 'shuffle', 'dispel', 'deal out', 'aoe', 'double down' },
+        [990] = { 'morimar', 'melee fighter', 'beastmaster', 'warrior', 'vehement resolution', '12 blades of remorse', 'aoe', 'into the light', 'arduous decision', 'silence', 'camaraderie of the crevasse' },
+        [991] = { 'darrcuiln', 'melee fighter', 'warrior', 'red mage', 'beast', 'howling gust', 'starward yowl', 'righteous rasp', 'aurous charge', 'stalking prey', 'aoe' },
+        [992] = { 'aahm', 'ark angel hm', 'tank', 'ninja', 'warrior', 'migawari: ichi', 'utsusemi: ichi', 'ni', 'hojo: ichi', 'kurayami: ichi', 'innin', 'yonin', 'provoke', 'berserk', 'warcry', 'chant du cygne', 'swift blade', 'cross reaver', 'unique conal', 'stun' },
+        [993] = { 'aaev', 'ark angel ev', 'tank', 'paladin', 'white mage', 'flash', 'phalanx', 'cure i - iv', 'cure i', 'cure ii', 'cure iii', 'cure iv', 'enlight', 'reprisal', 'chivalry', 'palisade', 'sentinel', 'divine emblem', 'rampart', 'shield strike', 'chant du cygne', 'vorpal blade', 'dominion slash', 'aoe', 'arrogance incarnate', 'spirits within' },
+        [994] = { 'aamr', 'ark angel mr', 'melee fighter', 'beastmaster', 'thief', 'sneak attack', 'trick attack', 'cloudsplitter', 'calamity', 'rampage', 'havoc spiral', 'aoe' },
+        [995] = { 'aatt', 'ark angel tt', 'offensive caster', 'black mage', 'dark knight', 'single-target elemental nukes i - v', 'single-target elemental nukes i', 'single-target elemental nukes ii', 'single-target elemental nukes iii', 'single-target elemental nukes iv', 'single-target elemental nukes v', 'sleepga', 'ii', 'bio', 'poison', 'aspir', 'stun', 'elemental seal', 'last resort', 'souleater', 'guillotine', 'amon drive', 'aoe', 'paralyze', 'petrify' },
+        [996] = { 'aagk', 'ark angel gk', 'melee fighter', 'samurai', 'dragoon', 'hasso', 'konzen-ittai', 'hagakure', 'meditate', 'sekkanoki', 'jump', 'high jump', 'tachi: fudo', 'tachi: gekko', 'tachi: kasha', 'tachi: yukikaze', 'dragonfall', 'aoe damage +', 'bind' },
+        [997] = { 'iroha', 'melee fighter', 'samurai', 'white mage', 'protectra v', 'shellra v', 'hagakure', 'hasso', 'meditate', 'third eye', 'save tp', '400), blessing of phoenix (one time reraise', 'amatsu: hanadoki', 'amatsu: choun', 'amatsu: fuga', 'amatsu: gachirin' },
+        [998] = { 'ygnas', 'healer', 'white mage', 'paladin', 'cure i - vi', 'cure i', 'cure ii', 'cure iii', 'cure iv', 'cure v', 'cure vi', 'protect/ra i - v', 'protect/ra i', 'protect/ra ii', 'protect/ra iii', 'protect/ra iv', 'protect/ra v', 'shell/ra i - v', 'shell/ra i', 'shell/ra ii', 'shell/ra iii', 'shell/ra iv', 'shell/ra v', '-na spells', 'erase', 'haste', 'deific gambol', 'aoe', 'phototropic blessing', 'phototropic wrath', 'sacred caper' },
+        [999] = { 'monberaux', 'healer', 'paladin', 'rune fencer', 'chemist', 'cover', 'mix (see below' },
+        [1002] = { 'cornelia', 'special', 'geomancer', 'bard', 'none' },
+        [1003] = { 'matsui-p', 'melee fighter', 'ninja', 'black mage', 'utsusemi: ichi', 'ni', 'san', 'elemental ninjutsu (san', 'single-target elemental nukes i', 'burn', 'migawari: ichi', 'kakka: ichi', 'myoshu: ichi', 'yurin: ichi', 'aisha: ichi', 'aspir', 'stun', 'innin', 'sange', 'elemental seal', 'futae', 'mana wall', 'blade: rin', 'blade: retsu', 'blade: ei', 'blade: jin', 'blade: ten', 'blade: ku', 'blade: kamu', 'blade: hi', 'blade: shun' },
+        [1004] = { 'excenmille [s]', 'excenmille (s', 'melee fighter', 'warrior', 'paladin', "stag's call", 'songbird swoop', 'gyre strike', 'paralyze', 'orcsbane', 'aoe', "stag's charge" },
+        [1005] = { 'ayame (uc', 'melee fighter', 'unity concord', 'samurai', 'warrior', 'blade bash', 'sengikori', 'hasso', 'third eye', 'shikikoyo', 'meditate', 'tachi: jinpu', 'tachi: koki', 'tachi: mudo', 'tachi: kasha', 'tachi: ageha' },
+        [1006] = { 'maat (uc', 'melee fighter', 'unity concord', 'monk', 'warrior', 'chakra', 'counterstance', 'impetus', 'hollow smite' },
+        [1007] = { 'aldo (uc', 'melee fighter', 'unity concord', 'thief', 'ninja', 'bully', 'sneak attack', "sarva's storm" },
+        [1008] = { 'naja (uc', 'naja salaheem (uc', 'melee fighter', 'unity concord', 'monk', 'warrior', 'peacebreaker', 'hexa strike', 'nott', 'black halo', 'justicebreaker' },
+        [1009] = { 'lion ii', 'melee fighter', 'thief', 'ninja', 'utsusemi: ichi', 'ni', 'walk the plank', 'pirate pummel', 'powder keg', 'grapeshot' },
+        [1010] = { 'zeid ii', 'melee fighter', 'dark knight', 'warrior', 'stun', 'absorb-attri', 'last resort', 'souleater', 'ground strike' },
+        [1011] = { 'prishe ii', 'melee fighter', 'white mage', 'monk', 'curaga i - v', 'curaga i', 'curaga ii', 'curaga iii', 'curaga iv', 'curaga v', 'psychoanima, hysteroanima', 'knuckle sandwich', 'nullifying dropkick', 'auroral uppercut' },
+        [1012] = { 'nashmeira ii', 'melee fighter', 'white mage', 'puppetmaster', 'cure i - vi', 'cure i', 'cure ii', 'cure iii', 'cure iv', 'cure v', 'cure vi', 'curaga i - v', 'curaga i', 'curaga ii', 'curaga iii', 'curaga iv', 'curaga v', '-na spells', 'erase', 'imperial authority', 'stun' },
+        [1013] = { 'lilisette ii', 'melee fighter', 'dancer', 'warrior', 'rousing samba', 'whirling edge', "dancer's fury", 'vivifying waltz' },
+        [1014] = { 'tenzen ii', 'ranged fighter', 'samurai', 'ranger', 'oisoya' },
+        [1015] = { 'mumor ii', 'offensive caster', 'black mage', 'dancer', 'single-target elemental nukes i - v', 'single-target elemental nukes i', 'single-target elemental nukes ii', 'single-target elemental nukes iii', 'single-target elemental nukes iv', 'single-target elemental nukes v', 'stun', '-ja spells (magic burst + aura only', 'firesday night fever (boost to all status, grants visible aura', 'lovely miracle waltz', 'shining summer samba', 'neo crystal jig', 'super crusher jig', 'eternal vana illusion', 'final eternal heart', 'aoe' },
+        [1016] = { 'ingrid ii', 'melee fighter', 'white mage', 'warrior', 'banish i - iii', 'banish i', 'banish ii', 'banish iii', 'cursna', 'holy', 'self-aggrandizement', 'merciless strike', 'moonlight', 'inexorable strike', 'ruthlessness', 'conal', 'drain' },
+        [1017] = { 'arciela ii', 'support', 'red mage', 'black mage', 'refresh', 'ii', 'haste', 'flurry ii', 'protect i - v', 'protect i', 'protect ii', 'protect iii', 'protect iv', 'protect v', 'shell i - v', 'shell i', 'shell ii', 'shell iii', 'shell iv', 'shell v', 'slow', 'paralyze', 'addle', 'dispel', 'single target elemental nukes i - v', 'single target elemental nukes i', 'single target elemental nukes ii', 'single target elemental nukes iii', 'single target elemental nukes iv', 'single target elemental nukes v', 'ascension, descension', 'light aura', 'expunge magic', 'harmonic displacement', 'darkness aura', 'darkest hour', 'sight unseen', 'neutral', 'unceasing dread', 'dignified awe', 'amnesia', "naakual's vengeance", 'recover own hp + mp' },
+        [1018] = { 'iroha ii', 'melee fighter', 'samurai', 'white mage', 'protectra v', 'shellra v', 'flare ii', 'hasso', 'save tp', 'meditate', 'third eye', 'amatsu: kyori', 'amatsu: hanadoki', '+ chance to', 'dispel', 'amatsu: suien', 'amatsu: gachirin', 'rise from ashes', 'aoe restore hp + mp +', 'stoneskin' },
+        [1019] = { 'shantotto ii', 'offensive caster', 'black mage', 'white mage', 'single-target elemental nukes i', 'lesson in pain', 'empirical research', 'final exam', 'doctor’s orders' },
+    },
+    -- Every ASCII substring of 1 to 3 characters of the terms -> ids of the trusts having it
+    grams = {
+        [' '] = { 896, 897, 898, 899, 900, 901, 902, 903, 904, 905, 906, 907, 908, 909, 910, 911, 912, 913, 914, 915, 916, 917, 918, 919, 920, 921, 922, 923, 924, 925, 926, 928, 929, 930, 932, 933, 934, 935, 936, 937, 938, 939, 940, 941, 942, 943, 944, 945, 946, 947, 948, 949, 950, 951, 952, 953, 954, 955, 956, 957, 958, 959, 960, 961, 962, 963, 964, 965, 966, 967, 968, 969, 971, 972, 973, 974, 975, 976, 977, 979, 980, 981, 982, 983, 984, 985, 986, 987, 988, 989, 990, 991, 992, 993, 994, 995, 996, 997, 998, 999, 1003, 1004, 1005, 1006, 1007, 1008, 1009, 1010, 1011, 1012, 1013, 1014, 1015, 1016, 1017, 1018, 1019 },
+        [' ('] = { 909, 918, 948, 953, 954, 955, 956, 957, 958, 960, 980, 981, 984, 997, 999, 1003, 1004, 1005, 1006, 1007, 1008, 1015 },
+        [' (a'] = { 909, 918, 948, 958 },
+        [' (b'] = { 1015 },
+        [' (c'] = { 960 },
+        [' (m'] = { 1015 },
+        [' (o'] = { 997 },
+        [' (s'] = { 999, 1003, 1004 },
+        [' (u'] = { 953, 954, 955, 956, 957, 980, 981, 1005, 1006, 1007, 1008 },
+        [' (w'] = { 984 },
+        [' +'] = { 959, 971, 996, 1015, 1017, 1018 },
+        [' + '] = { 959, 971, 1015, 1017, 1018 },
+        [' -'] = { 896, 898, 899, 902, 904, 905, 909, 910, 911, 913, 914, 915, 916, 919, 920, 921, 922, 923, 925, 926, 932, 934, 936, 942, 944, 947, 951, 952, 953, 955, 960, 961, 965, 966, 968, 969, 972, 974, 976, 977, 980, 981, 984, 987, 989, 993, 995, 998, 1011, 1012, 1015, 1016, 1017 },
+        [' - '] = { 896, 898, 899, 902, 904, 905, 909, 910, 911, 913, 914, 915, 916, 919, 920, 921, 922, 923, 925, 926, 932, 934, 936, 942, 944, 947, 951, 952, 953, 955, 960, 961, 965, 966, 968, 969, 972, 974, 976, 977, 980, 981, 984, 987, 989, 993, 995, 998, 1011, 1012, 1015, 1016, 1017 },
+        [' -a'] = { 961, 976, 977 },
+        [' ['] = { 1004 },
+        [' [s'] = { 1004 },
+        [' a'] = { 909, 923, 926, 929, 930, 939, 940, 943, 949, 956, 960, 962, 965, 968, 969, 971, 983, 986, 988, 992, 993, 994, 995, 996, 1005, 1007, 1012, 1015, 1017, 1018 },
+        [' ag'] = { 1005 },
+        [' ai'] = { 965 },
+        [' al'] = { 909, 969, 1015 },
+        [' an'] = { 930, 992, 993, 994, 995, 996 },
+        [' ao'] = { 926, 929, 939, 949, 960, 971 },
+        [' ar'] = { 929, 940, 962, 968, 983, 988 },
+        [' as'] = { 986, 1018 },
+        [' at'] = { 930, 949, 956, 965, 994, 1007 },
+        [' au'] = { 923, 1012, 1015, 1017 },
+        [' aw'] = { 1017 },
+        [' ax'] = { 943 },
+        [' b'] = { 897, 902, 903, 905, 909, 910, 911, 914, 917, 918, 920, 926, 936, 939, 948, 949, 951, 960, 964, 965, 966, 967, 968, 971, 973, 975, 977, 982, 984, 985, 986, 987, 990, 992, 993, 997, 998, 999, 1005, 1015 },
+        [' ba'] = { 905, 911, 914, 926, 936, 951, 1005 },
+        [' be'] = { 960, 965, 999 },
+        [' bl'] = { 897, 902, 903, 905, 910, 920, 939, 948, 949, 951, 964, 966, 967, 968, 971, 973, 975, 977, 982, 985, 990, 992, 993, 997, 998 },
+        [' bo'] = { 903, 918, 987 },
+        [' br'] = { 917, 939 },
+        [' bu'] = { 909, 971, 984, 986, 1015 },
+        [' c'] = { 896, 901, 903, 904, 915, 917, 919, 921, 925, 926, 930, 933, 934, 944, 949, 953, 954, 955, 956, 957, 960, 961, 968, 974, 976, 977, 980, 981, 985, 986, 987, 990, 991, 992, 993, 995, 997, 998, 1004, 1005, 1006, 1007, 1008, 1015, 1018, 1019 },
+        [' ca'] = { 896, 904, 919, 921, 925, 930, 934, 961, 968, 974, 976, 977, 985, 987, 995, 998, 1004, 1015, 1019 },
+        [' ch'] = { 903, 930, 974, 991, 997, 1004, 1018 },
+        [' ci'] = { 915, 960 },
+        [' cl'] = { 901, 926, 949 },
+        [' co'] = { 901, 933, 944, 953, 954, 955, 956, 957, 980, 981, 986, 992, 1005, 1006, 1007, 1008 },
+        [' cr'] = { 986, 990, 1015 },
+        [' cy'] = { 917, 954, 992, 993 },
+        [' d'] = { 906, 913, 915, 928, 934, 945, 946, 957, 961, 966, 968, 972, 976, 977, 985, 989, 990, 992, 993, 995, 996, 1011, 1017 },
+        [' da'] = { 945, 946, 966, 977, 985, 996 },
+        [' de'] = { 934, 961, 968, 977, 990, 1017 },
+        [' di'] = { 1017 },
+        [' do'] = { 976, 989 },
+        [' dr'] = { 906, 913, 915, 928, 957, 972, 995, 1011, 1017 },
+        [' du'] = { 992, 993 },
+        [' e'] = { 896, 900, 901, 904, 908, 910, 911, 917, 922, 925, 930, 934, 938, 942, 945, 956, 960, 961, 963, 967, 968, 969, 976, 977, 984, 987, 993, 995, 997, 1003, 1005, 1013, 1015, 1017, 1018, 1019 },
+        [' ea'] = { 917 },
+        [' ed'] = { 901, 930, 945, 956, 1013 },
+        [' ei'] = { 1003 },
+        [' el'] = { 896, 904, 911, 922, 925, 934, 961, 968, 976, 977, 987, 995, 1003, 1015, 1017, 1019 },
+        [' em'] = { 910, 960, 984, 993 },
+        [' en'] = { 900, 969 },
+        [' eq'] = { 977 },
+        [' et'] = { 1015 },
+        [' ev'] = { 993 },
+        [' ex'] = { 1019 },
+        [' ey'] = { 900, 908, 938, 942, 963, 967, 997, 1005, 1018 },
+        [' f'] = { 897, 899, 900, 901, 903, 906, 907, 908, 912, 913, 915, 917, 918, 919, 920, 922, 923, 924, 928, 929, 930, 932, 933, 937, 938, 939, 940, 941, 942, 943, 945, 946, 947, 948, 949, 954, 956, 957, 958, 959, 962, 963, 964, 966, 969, 971, 972, 973, 975, 979, 982, 983, 984, 985, 986, 988, 990, 991, 994, 996, 997, 999, 1003, 1004, 1005, 1006, 1007, 1008, 1009, 1010, 1011, 1012, 1013, 1014, 1015, 1016, 1018 },
+        [' fe'] = { 969, 999, 1015 },
+        [' fi'] = { 897, 899, 900, 901, 903, 906, 907, 908, 912, 913, 915, 917, 919, 920, 922, 923, 924, 928, 929, 930, 932, 933, 937, 938, 939, 940, 941, 942, 943, 945, 946, 947, 948, 949, 954, 956, 957, 958, 959, 962, 963, 964, 966, 971, 972, 973, 975, 979, 982, 983, 984, 985, 986, 988, 990, 991, 994, 996, 997, 1003, 1004, 1005, 1006, 1007, 1008, 1009, 1010, 1011, 1012, 1013, 1014, 1016, 1018 },
+        [' fl'] = { 919, 946, 947, 966 },
+        [' fo'] = { 958, 969 },
+        [' fr'] = { 984, 986, 1018 },
+        [' fu'] = { 918, 945, 954, 984, 996, 997, 1013 },
+        [' g'] = { 900, 938, 942, 959, 963, 965, 991, 996, 997, 998, 1015, 1018 },
+        [' ga'] = { 959, 997, 998, 1018 },
+        [' ge'] = { 900, 942, 996 },
+        [' gk'] = { 996 },
+        [' go'] = { 900, 938 },
+        [' gr'] = { 963, 965, 1015 },
+        [' gu'] = { 991 },
+        [' h'] = { 900, 908, 912, 918, 919, 922, 928, 943, 950, 983, 986, 989, 992, 997, 1003, 1008, 1011, 1015, 1017, 1018 },
+        [' ha'] = { 908, 912, 922, 950, 997, 1008, 1018 },
+        [' he'] = { 919, 989, 1015 },
+        [' hi'] = { 1003 },
+        [' hm'] = { 992 },
+        [' ho'] = { 900, 918, 928, 943, 1017 },
+        [' hp'] = { 922, 983, 986, 1017, 1018 },
+        [' hy'] = { 1011 },
+        [' i'] = { 896, 898, 899, 902, 904, 905, 906, 909, 910, 911, 913, 914, 915, 916, 918, 919, 920, 921, 922, 923, 924, 925, 926, 932, 934, 936, 942, 944, 945, 947, 951, 952, 953, 955, 960, 961, 965, 966, 968, 969, 972, 974, 976, 977, 980, 981, 984, 985, 987, 989, 992, 993, 995, 998, 1003, 1009, 1010, 1011, 1012, 1013, 1014, 1015, 1016, 1017, 1018, 1019 },
+        [' i '] = { 896, 898, 899, 902, 904, 905, 909, 910, 911, 913, 914, 915, 916, 919, 920, 921, 922, 923, 925, 926, 932, 934, 936, 942, 944, 947, 951, 952, 953, 955, 960, 961, 965, 966, 968, 969, 972, 974, 976, 977, 980, 981, 984, 987, 989, 993, 995, 998, 1011, 1012, 1015, 1016, 1017 },
+        [' i-'] = { 985 },
+        [' i/'] = { 906 },
+        [' ic'] = { 918, 992, 1003, 1009 },
+        [' ii'] = { 896, 898, 899, 902, 904, 905, 909, 910, 911, 913, 914, 915, 916, 919, 920, 921, 922, 923, 925, 926, 932, 934, 936, 942, 944, 945, 947, 951, 952, 953, 955, 960, 961, 965, 966, 968, 969, 972, 974, 976, 980, 981, 984, 985, 987, 989, 993, 995, 998, 1009, 1010, 1011, 1012, 1013, 1014, 1015, 1016, 1017, 1018, 1019 },
+        [' il'] = { 1015 },
+        [' im'] = { 924 },
+        [' in'] = { 985, 993, 1019 },
+        [' iv'] = { 896, 898, 899, 902, 904, 905, 909, 910, 911, 913, 914, 915, 916, 920, 923, 925, 932, 934, 936, 942, 944, 947, 951, 952, 953, 955, 960, 961, 965, 968, 969, 972, 976, 980, 981, 984, 985, 987, 989, 993, 995, 998, 1011, 1012, 1015, 1017 },
+        [' j'] = { 900, 915, 942, 957, 996, 1003, 1005, 1015 },
+        [' ji'] = { 900, 942, 1003, 1005, 1015 },
+        [' ju'] = { 915, 957, 996 },
+        [' k'] = { 900, 906, 907, 908, 924, 933, 934, 938, 942, 964, 971, 983, 985, 986, 987, 995, 996, 1003, 1005, 1009, 1010, 1018 },
+        [' ka'] = { 900, 908, 938, 942, 996, 1003, 1005 },
+        [' ke'] = { 907, 1009 },
+        [' ki'] = { 924, 933, 964, 985 },
+        [' kn'] = { 906, 934, 971, 983, 985, 986, 987, 995, 1010 },
+        [' ko'] = { 900, 1005 },
+        [' ku'] = { 1003 },
+        [' ky'] = { 1018 },
+        [' l'] = { 897, 902, 905, 920, 930, 940, 964, 965, 973, 979, 983, 990 },
+        [' la'] = { 940, 973, 979, 983 },
+        [' lh'] = { 964 },
+        [' li'] = { 965, 990 },
+        [' lo'] = { 897, 902, 905, 920, 930, 973 },
+        [' m'] = { 896, 898, 901, 904, 909, 911, 913, 914, 915, 916, 918, 919, 920, 921, 922, 923, 925, 932, 934, 936, 937, 943, 944, 949, 952, 953, 955, 958, 960, 961, 965, 968, 969, 974, 976, 977, 980, 981, 983, 985, 986, 987, 988, 989, 991, 993, 994, 995, 997, 998, 1003, 1005, 1011, 1012, 1015, 1016, 1017, 1018, 1019 },
+        [' m.'] = { 976 },
+        [' ma'] = { 896, 898, 904, 909, 911, 913, 914, 915, 916, 919, 920, 921, 922, 923, 925, 932, 934, 936, 937, 944, 952, 953, 955, 961, 965, 968, 974, 976, 977, 980, 981, 983, 985, 986, 987, 988, 989, 991, 993, 995, 997, 998, 1003, 1011, 1012, 1015, 1016, 1017, 1018, 1019 },
+        [' mh'] = { 943, 958 },
+        [' mi'] = { 901, 911, 914, 918, 949, 953, 968, 1015 },
+        [' mo'] = { 936, 960, 969, 987 },
+        [' mp'] = { 977, 1017, 1018 },
+        [' mr'] = { 994 },
+        [' mu'] = { 1005 },
+        [' n'] = { 896, 904, 918, 922, 925, 934, 961, 968, 976, 977, 987, 995, 1003, 1015, 1017, 1019 },
+        [' ni'] = { 1003, 1015 },
+        [' no'] = { 918 },
+        [' nu'] = { 896, 904, 922, 925, 934, 961, 968, 976, 977, 987, 995, 1003, 1015, 1017, 1019 },
+        [' o'] = { 934, 958, 965, 976, 983, 989, 990, 997, 1015, 1017, 1019 },
+        [' oa'] = { 958 },
+        [' of'] = { 934, 965, 976, 983, 989, 990, 997 },
+        [' on'] = { 1015 },
+        [' or'] = { 1019 },
+        [' ou'] = { 989 },
+        [' ow'] = { 1017 },
+        [' p'] = { 907, 911, 914, 918, 922, 933, 949, 958, 959, 969, 991, 997, 1009, 1019 },
+        [' pa'] = { 911, 918, 949, 959, 1019 },
+        [' ph'] = { 997 },
+        [' pi'] = { 922, 958 },
+        [' pl'] = { 907, 1009 },
+        [' pr'] = { 914, 991 },
+        [' pu'] = { 907, 933, 969, 1009 },
+        [' q'] = { 984 },
+        [' qu'] = { 984 },
+        [' r'] = { 906, 922, 926, 932, 934, 939, 954, 966, 967, 979, 990, 991, 992, 995, 997, 1003, 1010, 1018, 1019 },
+        [' ra'] = { 939, 954, 991 },
+        [' re'] = { 906, 922, 934, 979, 990, 992, 995, 997, 1003, 1010, 1018, 1019 },
+        [' ri'] = { 926, 1003 },
+        [' ro'] = { 966, 967 },
+        [' ru'] = { 922, 932, 954 },
+        [' s'] = { 898, 899, 901, 905, 906, 909, 911, 912, 913, 914, 915, 918, 919, 921, 923, 926, 928, 929, 930, 933, 934, 935, 936, 937, 940, 941, 944, 945, 946, 947, 949, 953, 954, 955, 956, 959, 960, 961, 962, 963, 964, 965, 966, 967, 969, 974, 976, 977, 980, 981, 982, 983, 984, 986, 987, 988, 989, 993, 994, 995, 998, 1003, 1004, 1006, 1007, 1008, 1010, 1011, 1012, 1013, 1015, 1016, 1018 },
+        [' sa'] = { 905, 912, 913, 928, 945, 946, 947, 963, 966, 1008, 1011, 1013, 1015 },
+        [' sc'] = { 914, 919, 934, 986 },
+        [' se'] = { 987, 995, 1003 },
+        [' sh'] = { 928, 929, 934, 940, 941, 954, 962, 965, 967, 988, 1003 },
+        [' si'] = { 926, 935, 959, 984, 987 },
+        [' sl'] = { 960, 969, 974, 976, 993 },
+        [' sm'] = { 1006 },
+        [' so'] = { 909, 980 },
+        [' sp'] = { 898, 906, 909, 911, 915, 919, 923, 936, 944, 953, 955, 961, 969, 974, 977, 980, 981, 982, 983, 986, 989, 994, 998, 1012, 1015 },
+        [' st'] = { 901, 906, 909, 912, 918, 921, 930, 933, 937, 946, 949, 956, 959, 960, 964, 966, 983, 993, 1004, 1007, 1008, 1010, 1015, 1016 },
+        [' su'] = { 926, 1015, 1018 },
+        [' sw'] = { 899, 918, 983, 1004 },
+        [' t'] = { 899, 907, 908, 915, 932, 936, 937, 947, 957, 958, 972, 976, 977, 983, 986, 987, 990, 995, 997, 1003, 1009, 1015, 1017, 1018 },
+        [' ta'] = { 936, 937, 976, 977, 1017 },
+        [' te'] = { 986, 987, 1003 },
+        [' th'] = { 899, 907, 915, 972, 983, 986, 990, 1009 },
+        [' ti'] = { 997 },
+        [' to'] = { 908, 932, 947, 957, 958, 976, 977, 987, 1015, 1018 },
+        [' tp'] = { 908, 958, 997, 1018 },
+        [' ts'] = { 908 },
+        [' tt'] = { 995 },
+        [' u'] = { 913, 965, 966, 1011, 1017 },
+        [' un'] = { 1017 },
+        [' up'] = { 913, 965, 966, 1011 },
+        [' v'] = { 896, 898, 904, 906, 909, 910, 911, 914, 916, 920, 934, 936, 944, 947, 952, 953, 955, 961, 965, 968, 969, 976, 977, 980, 985, 987, 995, 997, 998, 1011, 1012, 1015, 1017, 1018 },
+        [' v,'] = { 977 },
+        [' va'] = { 1015 },
+        [' ve'] = { 1017 },
+        [' vi'] = { 898, 909, 911, 916, 936, 944, 953, 955, 980, 998, 1012, 1015 },
+        [' vo'] = { 906 },
+        [' w'] = { 903, 939, 945, 947, 956, 971, 993, 998, 1003, 1013, 1015 },
+        [' wa'] = { 945, 947, 956, 1003, 1013, 1015 },
+        [' wh'] = { 971 },
+        [' wi'] = { 903, 939, 993 },
+        [' wr'] = { 998 },
+        [' y'] = { 900, 908, 942, 991, 996 },
+        [' yo'] = { 991 },
+        [' yu'] = { 900, 908, 942, 996 },
+        [' z'] = { 915, 958 },
+        [' ze'] = { 958 },
+        ["'"] = { 903, 911, 914, 930, 945, 954, 956, 957, 958, 967, 979, 986, 1004, 1007, 1013, 1017 },
+        ["'s"] = { 903, 911, 914, 930, 945, 954, 956, 957, 958, 967, 986, 1004, 1007, 1013, 1017 },
+        ["'s "] = { 903, 911, 914, 930, 945, 954, 956, 957, 958, 967, 986, 1004, 1007, 1013, 1017 },
+        ["'s/"] = { 914 },
+        ["'t"] = { 979 },
+        ["'te"] = { 979 },
+        ['('] = { 909, 918, 948, 953, 954, 955, 956, 957, 958, 960, 980, 981, 984, 997, 999, 1003, 1004, 1005, 1006, 1007, 1008, 1015 },
+        ['(a'] = { 909, 918, 948, 958 },
+        ['(ao'] = { 909, 918, 948, 958 },
+        ['(b'] = { 1015 },
+        ['(bo'] = { 1015 },
+        ['(c'] = { 960 },
+        ['(co'] = { 960 },
+        ['(m'] = { 1015 },
+        ['(ma'] = { 1015 },
+        ['(o'] = { 997 },
+        ['(on'] = { 997 },
+        ['(s'] = { 999, 1003, 1004 },
+        ['(sa'] = { 1003 },
+        ['(se'] = { 999 },
+        ['(u'] = { 953, 954, 955, 956, 957, 980, 981, 1005, 1006, 1007, 1008 },
+        ['(uc'] = { 953, 954, 955, 956, 957, 980, 981, 1005, 1006, 1007, 1008 },
+        ['(w'] = { 984 },
+        ['(wi'] = { 984 },
+        [')'] = { 958, 997 },
+        [') '] = { 958 },
+        [') ('] = { 958 },
+        ['),'] = { 997 },
+        ['), '] = { 997 },
+        ['+'] = { 922, 959, 965, 971, 979, 996, 1015, 1017, 1018 },
+        ['+ '] = { 959, 971, 1015, 1017, 1018 },
+        ['+ a'] = { 1015 },
+        ['+ c'] = { 1018 },
+        ['+ k'] = { 971 },
+        ['+ m'] = { 1017, 1018 },
+        ['+ s'] = { 959 },
+        ['+d'] = { 965 },
+        ['+de'] = { 965 },
+        ['+m'] = { 922, 965, 979 },
+        ['+m.'] = { 965 },
+        ['+mp'] = { 922, 979 },
+        ['+t'] = { 979 },
+        ['+tp'] = { 979 },
+        [','] = { 926, 949, 961, 965, 976, 977, 997, 1011, 1015, 1017 },
+        [', '] = { 926, 949, 961, 965, 976, 977, 997, 1011, 1015, 1017 },
+        [', -'] = { 961, 976, 977 },
+        [', b'] = { 965, 997 },
+        [', d'] = { 1017 },
+        [', g'] = { 1015 },
+        [', h'] = { 1011 },
+        [', m'] = { 976 },
+        [', p'] = { 949 },
+        [', s'] = { 926, 949 },
+        ['-'] = { 896, 898, 899, 902, 903, 904, 905, 906, 909, 910, 911, 913, 914, 915, 916, 919, 920, 921, 922, 923, 925, 926, 932, 933, 934, 936, 942, 944, 947, 951, 952, 953, 955, 960, 961, 965, 966, 967, 968, 969, 972, 974, 976, 977, 980, 981, 983, 984, 985, 986, 987, 988, 989, 993, 995, 996, 998, 1003, 1010, 1011, 1012, 1015, 1016, 1017, 1019 },
+        ['- '] = { 896, 898, 899, 902, 904, 905, 909, 910, 911, 913, 914, 915, 916, 919, 920, 921, 922, 923, 925, 926, 932, 934, 936, 942, 944, 947, 951, 952, 953, 955, 960, 961, 965, 966, 968, 969, 972, 974, 976, 977, 980, 981, 984, 987, 989, 993, 995, 998, 1011, 1012, 1015, 1016, 1017 },
+        ['- i'] = { 899, 902, 904, 905, 910, 911, 913, 914, 915, 916, 919, 921, 922, 923, 925, 926, 932, 942, 944, 951, 952, 960, 961, 966, 968, 969, 972, 974, 976, 981, 984, 989, 993, 1016 },
+        ['- v'] = { 896, 898, 904, 909, 910, 911, 914, 916, 920, 934, 936, 944, 947, 952, 953, 955, 961, 965, 968, 969, 976, 977, 980, 987, 995, 998, 1011, 1012, 1015, 1017 },
+        ['-a'] = { 906, 961, 976, 977, 981, 1010, 1016 },
+        ['-ac'] = { 981 },
+        ['-ag'] = { 1016 },
+        ['-aj'] = { 961, 976, 977 },
+        ['-ak'] = { 977 },
+        ['-at'] = { 906, 1010 },
+        ['-b'] = { 936 },
+        ['-ba'] = { 936 },
+        ['-c'] = { 961, 988 },
+        ['-ch'] = { 961, 988 },
+        ['-e'] = { 969 },
+        ['-el'] = { 969 },
+        ['-f'] = { 981 },
+        ['-fu'] = { 981 },
+        ['-g'] = { 986 },
+        ['-ga'] = { 986 },
+        ['-h'] = { 981 },
+        ['-ha'] = { 981 },
+        ['-i'] = { 933, 996 },
+        ['-il'] = { 933 },
+        ['-it'] = { 996 },
+        ['-j'] = { 986, 1015 },
+        ['-ja'] = { 986, 1015 },
+        ['-l'] = { 981 },
+        ['-la'] = { 981 },
+        ['-m'] = { 904, 952 },
+        ['-ma'] = { 904 },
+        ['-mo'] = { 952 },
+        ['-n'] = { 898, 909, 911, 915, 923, 936, 944, 953, 955, 980, 981, 989, 998, 1012 },
+        ['-na'] = { 898, 909, 911, 915, 923, 936, 944, 953, 955, 980, 981, 989, 998, 1012 },
+        ['-o'] = { 980 },
+        ['-or'] = { 980 },
+        ['-p'] = { 976, 981, 1003 },
+        ['-pa'] = { 976 },
+        ['-pr'] = { 981 },
+        ['-r'] = { 903, 981 },
+        ['-re'] = { 981 },
+        ['-ru'] = { 903 },
+        ['-s'] = { 983 },
+        ['-st'] = { 983 },
+        ['-t'] = { 896, 904, 906, 922, 925, 934, 961, 968, 976, 977, 987, 995, 1003, 1015, 1019 },
+        ['-ta'] = { 896, 904, 922, 925, 934, 961, 968, 976, 977, 987, 995, 1003, 1015, 1019 },
+        ['-tp'] = { 906 },
+        ['-u'] = { 967 },
+        ['-up'] = { 967 },
+        ['-v'] = { 985 },
+        ['.'] = { 934, 954, 965, 976, 987 },
+        ['. '] = { 934, 954, 987 },
+        ['. b'] = { 987 },
+        ['. s'] = { 934, 954 },
+        ['.a'] = { 965, 987 },
+        ['.at'] = { 965, 987 },
+        ['.d'] = { 965, 976 },
+        ['.de'] = { 965, 976 },
+        ['.e'] = { 976 },
+        ['.ev'] = { 976 },
+        ['/'] = { 898, 906, 909, 911, 914, 916, 936, 953, 955, 976, 998 },
+        ['/a'] = { 906, 914 },
+        ['/ar'] = { 914 },
+        ['/as'] = { 906 },
+        ['/b'] = { 911, 914 },
+        ['/bl'] = { 911, 914 },
+        ['/c'] = { 911 },
+        ['/ca'] = { 911 },
+        ['/i'] = { 906 },
+        ['/ii'] = { 906 },
+        ['/m'] = { 976 },
+        ['/m.'] = { 976 },
+        ['/r'] = { 898, 909, 916, 936, 953, 955, 998 },
+        ['/ra'] = { 898, 909, 916, 936, 953, 955, 998 },
+        ['/v'] = { 911, 914 },
+        ['/vi'] = { 911, 914 },
+        ['0'] = { 997 },
+        ['0)'] = { 997 },
+        ['0),'] = { 997 },
+        ['00'] = { 997 },
+        ['00)'] = { 997 },
+        ['1'] = { 990 },
+        ['12'] = { 990 },
+        ['12 '] = { 990 },
+        ['2'] = { 990 },
+        ['2 '] = { 990 },
+        ['2 b'] = { 990 },
+        ['4'] = { 997 },
+        ['40'] = { 997 },
+        ['400'] = { 997 },
+        [':'] = { 900, 908, 918, 938, 942, 968, 971, 992, 996, 997, 1003, 1005, 1009, 1018 },
+        [': '] = { 900, 908, 918, 938, 942, 968, 992, 996, 997, 1003, 1005, 1009, 1018 },
+        [': a'] = { 1005 },
+        [': b'] = { 968 },
+        [': c'] = { 997 },
+        [': e'] = { 900, 1003 },
+        [': f'] = { 996, 997 },
+        [': g'] = { 900, 938, 942, 996, 997, 1018 },
+        [': h'] = { 900, 908, 997, 1003, 1018 },
+        [': i'] = { 918, 992, 1003, 1009 },
+        [': j'] = { 900, 942, 1003, 1005 },
+        [': k'] = { 900, 908, 938, 942, 996, 1003, 1005, 1018 },
+        [': m'] = { 1005 },
+        [': r'] = { 1003 },
+        [': s'] = { 1003, 1018 },
+        [': t'] = { 908, 1003 },
+        [': y'] = { 900, 908, 942, 996 },
+        [':w'] = { 971 },
+        [':wi'] = { 971 },
+        ['['] = { 1004 },
+        ['[s'] = { 1004 },
+        ['[s]'] = { 1004 },
+        [']'] = { 1004 },
+        ['a'] = { 896, 897, 898, 899, 900, 901, 902, 903, 904, 905, 906, 907, 908, 909, 910, 911, 912, 913, 914, 915, 916, 917, 918, 919, 920, 921, 922, 923, 924, 925, 926, 927, 928, 929, 930, 931, 932, 933, 934, 935, 936, 937, 938, 939, 940, 941, 942, 943, 944, 945, 946, 947, 948, 949, 950, 951, 952, 953, 954, 955, 956, 957, 958, 959, 960, 961, 962, 963, 964, 965, 966, 967, 968, 969, 970, 971, 972, 973, 974, 975, 976, 977, 978, 979, 980, 981, 982, 983, 984, 985, 986, 987, 988, 989, 990, 991, 992, 993, 994, 995, 996, 997, 998, 999, 1002, 1003, 1004, 1005, 1006, 1007, 1008, 1009, 1010, 1011, 1012, 1013, 1014, 1015, 1016, 1017, 1018, 1019 },
+        ['a '] = { 898, 899, 901, 909, 911, 912, 915, 916, 919, 921, 923, 926, 934, 936, 937, 944, 947, 949, 953, 955, 957, 961, 966, 972, 974, 976, 980, 981, 986, 989, 997, 998, 1003, 1008, 1011, 1012, 1015, 1017, 1018 },
+        ['a ('] = { 957, 1008 },
+        ['a c'] = { 901, 949 },
+        ['a d'] = { 976 },
+        ['a i'] = { 898, 909, 916, 919, 936, 953, 955, 961, 966, 974, 980, 989, 998, 1011, 1012, 1015, 1017, 1018 },
+        ['a m'] = { 901, 949 },
+        ['a o'] = { 1015 },
+        ['a r'] = { 926 },
+        ['a s'] = { 898, 909, 911, 912, 915, 921, 923, 934, 936, 937, 944, 949, 953, 955, 980, 981, 986, 989, 998, 1008, 1012, 1015 },
+        ['a t'] = { 899, 947, 972 },
+        ['a v'] = { 898, 909, 916, 936, 953, 955, 980, 997, 998, 1011, 1012, 1018 },
+        ['a w'] = { 1003 },
+        ["a'"] = { 956, 1007 },
+        ["a's"] = { 956, 1007 },
+        ['a,'] = { 1011 },
+        ['a, '] = { 1011 },
+        ['a-'] = { 936 },
+        ['a-b'] = { 936 },
+        ['a:'] = { 1003 },
+        ['a: '] = { 1003 },
+        ['aa'] = { 901, 933, 949, 992, 993, 994, 995, 996, 1006, 1017 },
+        ['aa '] = { 901, 949 },
+        ['aae'] = { 993 },
+        ['aag'] = { 996 },
+        ['aah'] = { 992 },
+        ['aak'] = { 1017 },
+        ['aam'] = { 994 },
+        ['aat'] = { 933, 995, 1006 },
+        ['ab'] = { 906, 922, 930, 932, 946, 958, 959, 966, 982, 983, 984, 1010, 1016 },
+        ['aba'] = { 984 },
+        ['abb'] = { 958 },
+        ['abe'] = { 946, 959, 966 },
+        ['abh'] = { 922 },
+        ['abl'] = { 932, 1016 },
+        ['abq'] = { 982 },
+        ['abs'] = { 906, 983, 1010 },
+        ['aby'] = { 906 },
+        ['ac'] = { 896, 900, 903, 904, 909, 911, 912, 916, 918, 919, 920, 922, 924, 925, 930, 934, 938, 941, 942, 943, 949, 952, 953, 956, 960, 961, 963, 964, 966, 968, 969, 971, 974, 976, 977, 980, 981, 982, 983, 985, 986, 987, 988, 994, 995, 996, 997, 998, 1003, 1005, 1007, 1008, 1015, 1017, 1018, 1019 },
+        ['acc'] = { 943 },
+        ['ace'] = { 909, 912, 980, 1008, 1017 },
+        ['ach'] = { 900, 911, 938, 941, 942, 963, 996, 997, 1005, 1018 },
+        ['aci'] = { 969 },
+        ['ack'] = { 896, 903, 904, 912, 916, 918, 919, 922, 925, 930, 934, 949, 956, 961, 964, 968, 971, 974, 976, 977, 980, 982, 983, 985, 986, 987, 988, 994, 995, 1003, 1007, 1008, 1015, 1017, 1019 },
+        ['acl'] = { 1015 },
+        ['aco'] = { 960 },
+        ['acr'] = { 953, 998 },
+        ['act'] = { 920, 924, 952, 966 },
+        ['acu'] = { 981 },
+        ['ad'] = { 897, 899, 902, 903, 905, 910, 911, 914, 919, 920, 926, 928, 930, 934, 939, 942, 948, 949, 951, 953, 958, 960, 965, 966, 967, 968, 971, 972, 973, 974, 975, 979, 984, 985, 986, 990, 992, 993, 997, 998, 999, 1003, 1004, 1005, 1017, 1018 },
+        ['ad '] = { 911, 914, 985 },
+        ['ada'] = { 919, 967 },
+        ['adb'] = { 958 },
+        ['add'] = { 965, 968, 1017 },
+        ['ade'] = { 897, 902, 903, 905, 910, 911, 914, 920, 928, 939, 948, 949, 951, 966, 967, 968, 971, 973, 975, 984, 985, 990, 992, 993, 1003, 1005 },
+        ['adi'] = { 899, 902, 905, 910, 920, 926, 939, 942, 951, 953, 960, 965, 971, 972, 974, 979, 984, 986, 993, 998, 999, 1004 },
+        ['adj'] = { 960 },
+        ['ado'] = { 934, 965, 997, 1018 },
+        ['adr'] = { 911, 914 },
+        ['adv'] = { 911, 914 },
+        ['ae'] = { 911, 993, 1003 },
+        ['aeo'] = { 911 },
+        ['aev'] = { 993 },
+        ['af'] = { 909, 928, 940, 953, 980 },
+        ['aff'] = { 909, 953, 980 },
+        ['afi'] = { 940 },
+        ['ag'] = { 896, 898, 900, 903, 904, 905, 908, 909, 910, 911, 913, 914, 915, 916, 918, 919, 920, 921, 922, 923, 924, 925, 929, 930, 932, 933, 934, 936, 937, 938, 939, 940, 941, 943, 944, 948, 949, 951, 952, 953, 954, 955, 957, 959, 961, 962, 964, 965, 967, 968, 971, 973, 974, 976, 977, 980, 981, 983, 985, 986, 987, 988, 989, 991, 993, 994, 995, 996, 997, 998, 1003, 1004, 1005, 1011, 1012, 1015, 1016, 1017, 1018, 1019 },
+        ["ag'"] = { 1004 },
+        ['aga'] = { 908, 919, 938, 955, 974, 989, 996, 997, 1011, 1012 },
+        ['age'] = { 896, 898, 900, 903, 904, 905, 908, 909, 910, 911, 913, 914, 915, 916, 919, 920, 921, 922, 923, 925, 929, 930, 932, 934, 936, 939, 940, 941, 943, 944, 948, 949, 951, 952, 953, 954, 955, 959, 961, 962, 965, 967, 968, 973, 974, 976, 977, 980, 981, 983, 985, 986, 987, 988, 989, 991, 993, 994, 995, 996, 997, 998, 1003, 1005, 1011, 1012, 1015, 1016, 1017, 1018, 1019 },
+        ['agg'] = { 903, 937, 939, 943, 954, 973, 1016 },
+        ['agi'] = { 954, 964, 971, 976, 986, 1015, 1017 },
+        ['agk'] = { 996 },
+        ['ago'] = { 915, 924, 933, 939, 957, 964, 996 },
+        ['agu'] = { 918 },
+        ['ah'] = { 912, 936, 951, 954, 956, 982, 992, 1008 },
+        ['aha'] = { 936, 951, 954 },
+        ['ahc'] = { 956 },
+        ['ahe'] = { 912, 982, 1008 },
+        ['ahm'] = { 992 },
+        ['ai'] = { 900, 906, 908, 909, 910, 915, 917, 918, 920, 922, 928, 937, 938, 942, 944, 946, 947, 954, 960, 965, 966, 967, 971, 972, 979, 982, 983, 986, 996, 997, 1003, 1005, 1014, 1016, 1018, 1019 },
+        ['aid'] = { 915, 965, 972 },
+        ['aik'] = { 908 },
+        ['ail'] = { 937 },
+        ['ain'] = { 906, 909, 910, 917, 920, 938, 946, 947, 954, 966, 982, 983, 986, 1016, 1019 },
+        ['air'] = { 922, 928, 954, 967 },
+        ['ais'] = { 944, 960, 997, 1003 },
+        ['ait'] = { 942 },
+        ['aj'] = { 897, 904, 910, 912, 929, 961, 976, 977, 1008 },
+        ['aja'] = { 912, 961, 976, 977, 1008 },
+        ['aje'] = { 910, 929 },
+        ['aji'] = { 897, 904 },
+        ['ak'] = { 900, 908, 909, 912, 917, 918, 925, 927, 928, 930, 936, 938, 943, 946, 949, 956, 964, 966, 967, 977, 984, 988, 994, 996, 997, 1003, 1006, 1007, 1008, 1017 },
+        ['ak '] = { 930, 949, 956, 984, 994, 1007 },
+        ['aka'] = { 943 },
+        ['akb'] = { 977 },
+        ['ake'] = { 909, 912, 925, 936, 946, 967, 977, 1008 },
+        ['aki'] = { 908, 928 },
+        ['akk'] = { 988, 1003 },
+        ['ako'] = { 956, 966 },
+        ['akr'] = { 964, 1006 },
+        ['aku'] = { 900, 908, 918, 927, 938, 996, 997, 1017 },
+        ['al'] = { 896, 897, 898, 899, 902, 903, 904, 905, 906, 907, 909, 910, 911, 912, 913, 914, 916, 919, 920, 922, 923, 925, 926, 927, 928, 929, 930, 931, 933, 934, 935, 936, 937, 939, 940, 942, 943, 944, 945, 947, 948, 949, 950, 951, 952, 953, 954, 955, 956, 958, 959, 960, 961, 962, 963, 965, 966, 968, 969, 970, 971, 972, 974, 975, 976, 977, 978, 979, 980, 982, 983, 984, 985, 987, 988, 989, 991, 992, 993, 994, 995, 996, 998, 999, 1002, 1003, 1004, 1007, 1008, 1009, 1011, 1012, 1013, 1015, 1016, 1017, 1019 },
+        ['al '] = { 896, 897, 902, 903, 904, 905, 906, 913, 919, 920, 922, 923, 925, 926, 929, 934, 937, 939, 943, 945, 948, 949, 958, 959, 960, 961, 966, 968, 971, 975, 976, 977, 985, 987, 988, 989, 993, 995, 1003, 1011, 1012, 1015, 1017, 1019 },
+        ["al'"] = { 1017 },
+        ['al:'] = { 971 },
+        ['ala'] = { 899, 902, 905, 910, 912, 919, 920, 926, 939, 942, 951, 952, 953, 960, 965, 969, 971, 972, 974, 979, 982, 983, 984, 989, 993, 994, 998, 999, 1004, 1008 },
+        ['ald'] = { 930, 1007 },
+        ['ale'] = { 898, 909, 916, 936, 944, 953, 955, 980, 998, 999 },
+        ['ali'] = { 903, 905, 909, 910, 947, 954, 969, 984, 993 },
+        ['alk'] = { 907, 991, 1009 },
+        ['all'] = { 911, 914, 969, 996, 1003, 1004, 1015 },
+        ['alo'] = { 911, 912, 914, 926, 956, 1008 },
+        ['alr'] = { 910, 960, 993 },
+        ['alt'] = { 910, 940, 945, 947, 962, 977, 1013, 1015 },
+        ['alu'] = { 928 },
+        ['alv'] = { 934, 972 },
+        ['aly'] = { 898, 904, 909, 916, 925, 949, 959, 965, 968, 995, 1004, 1017 },
+        ['am'] = { 900, 901, 908, 910, 913, 918, 919, 938, 942, 943, 945, 946, 947, 949, 959, 966, 969, 971, 972, 977, 979, 983, 988, 990, 992, 993, 994, 995, 996, 997, 998, 1003, 1005, 1013, 1014, 1015, 1017, 1018, 1019 },
+        ['ama'] = { 908, 913, 919, 938, 959, 977, 990, 996, 997, 1018 },
+        ['amb'] = { 945, 946, 947, 966, 998, 1013, 1015 },
+        ['amc'] = { 969 },
+        ['ame'] = { 900, 919, 938, 1005 },
+        ['ami'] = { 918, 988, 992, 994 },
+        ['amn'] = { 1017 },
+        ['amo'] = { 983, 995 },
+        ['amp'] = { 901, 910, 943, 949, 972, 993, 994 },
+        ['amr'] = { 994 },
+        ['amu'] = { 900, 908, 938, 942, 971, 979, 996, 997, 1003, 1005, 1014, 1018 },
+        ['an'] = { 896, 901, 902, 905, 906, 907, 908, 910, 911, 912, 913, 914, 915, 918, 919, 920, 921, 924, 925, 926, 927, 929, 930, 931, 933, 934, 935, 937, 938, 939, 940, 941, 942, 944, 945, 946, 947, 950, 951, 952, 953, 956, 957, 958, 959, 960, 962, 963, 964, 966, 967, 969, 970, 974, 975, 976, 978, 979, 980, 981, 982, 984, 985, 988, 989, 992, 993, 994, 995, 996, 997, 1002, 1003, 1004, 1006, 1009, 1011, 1013, 1014, 1015, 1016, 1017, 1018, 1019 },
+        ['an '] = { 924, 933, 958, 964, 974, 980 },
+        ['an-'] = { 980 },
+        ['ana'] = { 901, 908, 997, 1003, 1015, 1018 },
+        ['anc'] = { 901, 911, 912, 914, 915, 927, 931, 935, 945, 946, 947, 950, 953, 956, 966, 969, 970, 976, 978, 979, 981, 993, 1002, 1006, 1013, 1015, 1017, 1018 },
+        ['and'] = { 906, 913, 919, 930, 944, 963, 964, 982, 985, 1011, 1016 },
+        ['ane'] = { 918, 939, 985, 1004 },
+        ['ang'] = { 910, 925, 929, 937, 940, 941, 957, 962, 963, 964, 967, 981, 988, 992, 993, 994, 995, 996, 1003, 1014 },
+        ['ani'] = { 914, 921, 1011, 1016 },
+        ['ank'] = { 902, 905, 907, 910, 918, 926, 951, 959, 960, 969, 984, 992, 993, 1009 },
+        ['ano'] = { 938, 942, 996 },
+        ['ant'] = { 896, 933, 934, 958, 959, 992, 993, 1015, 1019 },
+        ['anx'] = { 910, 920, 951, 952, 969, 989, 993 },
+        ['ao'] = { 901, 907, 909, 910, 918, 919, 922, 926, 929, 930, 932, 936, 937, 938, 939, 940, 945, 948, 949, 958, 959, 960, 965, 967, 968, 971, 973, 976, 977, 985, 987, 989, 990, 991, 993, 994, 995, 996, 998, 1004, 1015, 1018 },
+        ['aoe'] = { 901, 907, 909, 910, 918, 919, 922, 926, 929, 930, 932, 936, 937, 938, 939, 940, 945, 948, 949, 958, 959, 960, 965, 968, 971, 973, 976, 977, 985, 987, 989, 990, 991, 993, 994, 995, 996, 998, 1004, 1015, 1018 },
+        ['aos'] = { 967 },
+        ['ap'] = { 902, 907, 909, 918, 921, 925, 930, 934, 939, 951, 955, 973, 998, 1009 },
+        ['ape'] = { 907, 934, 998, 1009 },
+        ['aph'] = { 902, 921, 930, 939, 951, 973 },
+        ['apo'] = { 909 },
+        ['app'] = { 918 },
+        ['aps'] = { 925 },
+        ['apu'] = { 955 },
+        ['ar'] = { 896, 897, 898, 903, 904, 905, 906, 908, 909, 910, 911, 912, 914, 915, 916, 917, 918, 919, 920, 922, 924, 925, 927, 929, 930, 931, 933, 934, 935, 936, 937, 938, 939, 940, 941, 943, 944, 946, 947, 948, 949, 950, 951, 953, 954, 955, 956, 957, 959, 961, 962, 963, 964, 965, 966, 967, 968, 969, 970, 971, 972, 973, 976, 977, 978, 982, 983, 984, 985, 986, 987, 988, 989, 990, 991, 992, 993, 994, 995, 996, 1002, 1003, 1004, 1005, 1006, 1007, 1008, 1010, 1013, 1015, 1016, 1017, 1018, 1019 },
+        ['ar '] = { 922, 933, 935, 936, 940, 971 },
+        ['ar-'] = { 969 },
+        ['ara'] = { 898, 904, 908, 909, 916, 918, 925, 936, 943, 948, 949, 959, 965, 968, 990, 995, 1004, 1017 },
+        ['arb'] = { 936 },
+        ['arc'] = { 903, 911, 914, 940, 948, 954, 962, 965, 973, 982, 985, 992, 1017, 1019 },
+        ['ard'] = { 911, 914, 920, 927, 931, 935, 950, 970, 978, 990, 991, 1002 },
+        ['are'] = { 915, 936, 939, 1018 },
+        ['arg'] = { 896, 903, 904, 922, 924, 925, 930, 934, 961, 962, 968, 976, 977, 987, 991, 995, 1003, 1004, 1015, 1017, 1019 },
+        ['ari'] = { 984, 992, 1003 },
+        ['ark'] = { 906, 934, 967, 968, 977, 983, 985, 986, 987, 992, 993, 994, 995, 996, 1010, 1017 },
+        ['arl'] = { 898, 953 },
+        ['arm'] = { 911, 917, 983, 1017 },
+        ['arn'] = { 911, 930, 993 },
+        ['aro'] = { 963 },
+        ['arp'] = { 940, 962, 963, 988 },
+        ['arr'] = { 897, 903, 905, 910, 912, 917, 918, 929, 937, 938, 939, 940, 941, 943, 944, 946, 947, 948, 949, 951, 954, 956, 957, 959, 962, 964, 966, 969, 972, 973, 982, 983, 984, 988, 990, 991, 992, 993, 1004, 1005, 1006, 1008, 1010, 1013, 1016 },
+        ['ars'] = { 987 },
+        ['art'] = { 910, 955, 968, 972, 976, 984, 986, 989, 993, 1015 },
+        ['aru'] = { 904, 936, 976 },
+        ['arv'] = { 956, 1007 },
+        ['arw'] = { 991 },
+        ['as'] = { 896, 898, 899, 900, 901, 902, 903, 904, 905, 906, 908, 910, 911, 915, 916, 919, 920, 921, 922, 923, 924, 925, 926, 930, 933, 934, 936, 937, 938, 942, 943, 944, 946, 947, 948, 949, 951, 952, 953, 955, 959, 960, 961, 964, 965, 966, 968, 969, 972, 973, 974, 975, 976, 977, 980, 981, 983, 984, 985, 986, 987, 988, 989, 990, 991, 993, 994, 995, 996, 997, 998, 1003, 1005, 1010, 1012, 1015, 1017, 1018, 1019 },
+        ['asc'] = { 1017 },
+        ['ase'] = { 898, 911, 915, 922, 953, 955, 959, 980, 981, 989, 998, 1012 },
+        ['ash'] = { 899, 900, 902, 905, 908, 910, 923, 926, 938, 942, 951, 960, 969, 972, 973, 974, 984, 988, 993, 996, 1005, 1012, 1018 },
+        ['asi'] = { 1017 },
+        ['asp'] = { 901, 906, 991, 995, 1003 },
+        ['ass'] = { 900, 908, 930, 937, 938, 942, 986, 990, 996, 997, 1005, 1018 },
+        ['ast'] = { 896, 903, 904, 906, 915, 916, 919, 920, 921, 923, 925, 934, 936, 943, 944, 946, 947, 948, 949, 951, 952, 953, 955, 961, 965, 966, 968, 974, 975, 976, 977, 981, 983, 984, 985, 987, 989, 990, 991, 994, 995, 998, 1010, 1012, 1015, 1017, 1019 },
+        ['asu'] = { 924, 933, 964 },
+        ['at'] = { 900, 903, 906, 907, 908, 909, 911, 917, 918, 930, 932, 933, 934, 939, 942, 943, 949, 950, 953, 954, 956, 958, 965, 966, 967, 969, 971, 976, 979, 980, 983, 985, 986, 987, 993, 994, 995, 996, 997, 998, 1003, 1005, 1006, 1007, 1009, 1010, 1015, 1018 },
+        ['at '] = { 971, 983, 1006 },
+        ['atc'] = { 986 },
+        ['ate'] = { 900, 906, 907, 908, 917, 918, 932, 942, 976, 983, 993, 995, 996, 997, 1005, 1009, 1010, 1018 },
+        ['ath'] = { 918, 934, 939, 950, 966, 998 },
+        ['ati'] = { 903, 934, 943, 954, 956, 969, 979, 985 },
+        ['atk'] = { 965, 987 },
+        ['ato'] = { 956, 967 },
+        ['atr'] = { 965, 985 },
+        ['ats'] = { 908, 958, 997, 1003, 1018 },
+        ['att'] = { 903, 906, 911, 918, 930, 949, 956, 969, 994, 995, 1007, 1010 },
+        ['atu'] = { 909, 953, 980, 1015 },
+        ['au'] = { 913, 923, 943, 949, 953, 971, 983, 984, 986, 991, 999, 1011, 1012, 1015, 1017 },
+        ['aug'] = { 943, 983, 984 },
+        ['aul'] = { 986 },
+        ['aur'] = { 913, 949, 971, 991, 1011, 1015, 1017 },
+        ['aus'] = { 953 },
+        ['aut'] = { 923, 1012 },
+        ['aux'] = { 999 },
+        ['av'] = { 903, 905, 908, 910, 920, 939, 941, 948, 949, 951, 954, 957, 964, 965, 967, 973, 974, 985, 986, 992, 994, 997, 1018 },
+        ['ava'] = { 903, 905, 910, 920, 939, 948, 949, 951, 954, 967, 973 },
+        ['ave'] = { 908, 974, 985, 986, 992, 997, 1018 },
+        ['avi'] = { 905, 957, 965 },
+        ['avo'] = { 964, 994 },
+        ['avy'] = { 941 },
+        ['aw'] = { 928, 954, 992, 1003, 1017 },
+        ['awa'] = { 992, 1003 },
+        ['awe'] = { 1017 },
+        ['awk'] = { 954 },
+        ['ax'] = { 943, 975 },
+        ['axe'] = { 943 },
+        ['axi'] = { 975 },
+        ['ay'] = { 900, 918, 936, 966, 969, 976, 984, 992, 1005, 1015 },
+        ['ay '] = { 1015 },
+        ['aya'] = { 900, 918, 966, 992, 1005 },
+        ['ayb'] = { 984 },
+        ['aye'] = { 976 },
+        ['az'] = { 900, 908, 919, 920, 924, 942, 959, 996 },
+        ['aza'] = { 908, 924 },
+        ['aze'] = { 900, 919, 942, 959, 996 },
+        ['azz'] = { 920 },
+        ['b'] = { 896, 897, 899, 900, 901, 902, 903, 904, 905, 906, 908, 909, 910, 911, 912, 914, 916, 917, 918, 919, 920, 921, 922, 925, 926, 927, 928, 929, 930, 931, 932, 933, 934, 935, 936, 937, 939, 940, 941, 943, 945, 946, 947, 948, 949, 950, 951, 954, 957, 958, 959, 960, 961, 962, 964, 965, 966, 967, 968, 969, 970, 971, 972, 973, 974, 975, 976, 977, 978, 980, 982, 983, 984, 985, 986, 987, 988, 989, 990, 991, 992, 993, 994, 995, 996, 997, 998, 999, 1002, 1003, 1004, 1005, 1007, 1008, 1010, 1013, 1015, 1016, 1017, 1019 },
+        ['b '] = { 906, 932 },
+        ['b s'] = { 906 },
+        ['b t'] = { 932 },
+        ['b-'] = { 906, 983, 1010 },
+        ['b-a'] = { 906, 1010 },
+        ['b-s'] = { 983 },
+        ['b-t'] = { 906 },
+        ['ba'] = { 900, 905, 911, 914, 918, 921, 926, 927, 929, 931, 935, 936, 940, 941, 945, 946, 947, 950, 951, 958, 962, 964, 966, 969, 970, 971, 978, 982, 983, 984, 985, 988, 1002, 1004, 1005, 1013, 1015, 1016 },
+        ['ba '] = { 966 },
+        ['bab'] = { 958 },
+        ['bac'] = { 964, 971, 982 },
+        ['bah'] = { 982 },
+        ['bak'] = { 900 },
+        ['bal'] = { 911, 914, 983 },
+        ['ban'] = { 921, 958, 985, 1004, 1016 },
+        ['bar'] = { 911, 914, 918, 927, 929, 931, 935, 936, 940, 941, 950, 962, 969, 970, 978, 988, 1002 },
+        ['bas'] = { 905, 926, 951, 984, 1005 },
+        ['bat'] = { 911, 969 },
+        ['bay'] = { 936 },
+        ['bb'] = { 909, 958 },
+        ['bba'] = { 958 },
+        ['bbl'] = { 909 },
+        ['be'] = { 903, 917, 926, 933, 937, 939, 941, 943, 946, 948, 951, 957, 959, 960, 965, 966, 968, 969, 972, 973, 977, 982, 990, 991, 992, 994, 999 },
+        ['be '] = { 926 },
+        ['bea'] = { 933, 943, 960, 990, 991, 994 },
+        ['bel'] = { 965, 977, 999 },
+        ['ben'] = { 959 },
+        ['ber'] = { 903, 917, 937, 939, 941, 943, 946, 948, 951, 957, 966, 969, 972, 973, 982, 992, 999 },
+        ['bh'] = { 922 },
+        ['bho'] = { 922 },
+        ['bi'] = { 906, 928, 968, 974, 995, 996, 1004 },
+        ['bin'] = { 968, 996 },
+        ['bio'] = { 995 },
+        ['bir'] = { 1004 },
+        ['bis'] = { 928 },
+        ['bit'] = { 906, 974 },
+        ['bl'] = { 896, 897, 899, 902, 903, 904, 905, 909, 910, 911, 912, 914, 916, 919, 920, 922, 925, 929, 932, 934, 939, 940, 941, 948, 949, 951, 954, 959, 960, 961, 962, 964, 966, 967, 968, 971, 973, 974, 975, 976, 977, 980, 982, 983, 984, 985, 986, 987, 988, 989, 990, 992, 993, 995, 997, 998, 1003, 1005, 1008, 1015, 1016, 1017, 1019 },
+        ['bla'] = { 896, 897, 902, 903, 904, 905, 910, 911, 912, 914, 916, 919, 920, 922, 925, 934, 939, 948, 949, 951, 959, 961, 966, 967, 968, 971, 973, 974, 975, 976, 977, 980, 983, 985, 986, 987, 988, 990, 992, 993, 995, 1003, 1005, 1008, 1015, 1017, 1019 },
+        ['ble'] = { 899, 909, 910, 929, 940, 941, 954, 960, 962, 967, 984, 989, 993, 997, 998, 1015, 1016 },
+        ['bli'] = { 932, 974 },
+        ['blo'] = { 939, 948, 954, 959, 964, 982 },
+        ['blu'] = { 989 },
+        ['bo'] = { 903, 908, 918, 922, 928, 932, 933, 969, 982, 987, 998, 1015 },
+        ['bo '] = { 928 },
+        ['bol'] = { 969, 998 },
+        ['bom'] = { 932 },
+        ['bon'] = { 922 },
+        ['boo'] = { 903, 918, 987, 1015 },
+        ['bor'] = { 908, 987 },
+        ['bq'] = { 982 },
+        ['bqu'] = { 982 },
+        ['br'] = { 901, 909, 912, 917, 939, 946, 949, 970, 984, 1008 },
+        ['bra'] = { 901, 909, 949 },
+        ['bre'] = { 912, 917, 939, 946, 984, 1008 },
+        ['bry'] = { 970 },
+        ['bs'] = { 906, 983, 1010 },
+        ['bso'] = { 906, 983, 1010 },
+        ['bu'] = { 897, 909, 918, 920, 926, 930, 936, 958, 961, 967, 971, 976, 984, 986, 988, 1003, 1007, 1015 },
+        ['bub'] = { 909 },
+        ['buf'] = { 961 },
+        ['buk'] = { 918, 961, 988 },
+        ['bul'] = { 926, 930, 1007 },
+        ['bur'] = { 897, 920, 936, 967, 971, 976, 984, 986, 1003, 1015 },
+        ['but'] = { 958 },
+        ['bv'] = { 926 },
+        ['bve'] = { 926 },
+        ['by'] = { 906, 935 },
+        ['byl'] = { 935 },
+        ['bys'] = { 906 },
+        ['c'] = { 896, 898, 899, 900, 901, 902, 903, 904, 905, 906, 907, 909, 910, 911, 912, 913, 914, 915, 916, 917, 918, 919, 920, 921, 922, 923, 924, 925, 926, 927, 928, 929, 930, 931, 932, 933, 934, 935, 936, 937, 938, 939, 940, 941, 942, 943, 944, 945, 946, 947, 948, 949, 950, 951, 952, 953, 954, 955, 956, 957, 959, 960, 961, 962, 963, 964, 965, 966, 967, 968, 969, 970, 971, 972, 973, 974, 976, 977, 978, 979, 980, 981, 982, 983, 984, 985, 986, 987, 988, 989, 990, 991, 992, 993, 994, 995, 996, 997, 998, 999, 1002, 1003, 1004, 1005, 1006, 1007, 1008, 1009, 1011, 1012, 1013, 1015, 1016, 1017, 1018, 1019 },
+        ['c '] = { 924, 929, 965, 966, 984, 986, 994, 998, 1015, 1017 },
+        ['c a'] = { 929 },
+        ['c b'] = { 986, 998, 1015 },
+        ['c d'] = { 1017 },
+        ['c f'] = { 966 },
+        ['c g'] = { 965, 998 },
+        ['c i'] = { 924 },
+        ['c s'] = { 984, 994 },
+        ['c w'] = { 998 },
+        ['ca'] = { 896, 904, 911, 919, 921, 925, 930, 934, 937, 939, 943, 961, 968, 971, 974, 976, 977, 985, 987, 990, 993, 994, 995, 998, 1004, 1015, 1019 },
+        ['cal'] = { 937, 971, 994, 1004, 1019 },
+        ['cam'] = { 990 },
+        ['can'] = { 939 },
+        ['cap'] = { 998 },
+        ['car'] = { 911, 930, 993 },
+        ['cas'] = { 896, 904, 919, 921, 925, 934, 961, 968, 974, 976, 977, 985, 987, 995, 1015, 1019 },
+        ['cc'] = { 943 },
+        ['cca'] = { 943 },
+        ['ce'] = { 899, 909, 912, 916, 922, 925, 926, 927, 931, 935, 945, 946, 947, 950, 953, 956, 957, 959, 966, 968, 969, 970, 974, 978, 979, 980, 981, 987, 990, 993, 999, 1002, 1004, 1006, 1008, 1013, 1015, 1017, 1018 },
+        ['ce '] = { 974, 987, 993, 1018 },
+        ['cea'] = { 1017 },
+        ['ceb'] = { 912, 1008 },
+        ['cel'] = { 957 },
+        ['cem'] = { 969, 1017 },
+        ['cen'] = { 899, 1004, 1017 },
+        ['cer'] = { 927, 931, 935, 945, 946, 947, 950, 956, 966, 969, 970, 978, 981, 999, 1002, 1013, 1015 },
+        ['ces'] = { 968 },
+        ['ch'] = { 900, 903, 910, 911, 913, 914, 916, 918, 926, 930, 933, 938, 940, 941, 942, 960, 961, 962, 963, 964, 967, 968, 969, 974, 985, 986, 988, 991, 992, 993, 996, 997, 999, 1003, 1004, 1005, 1006, 1009, 1011, 1018, 1019 },
+        ['cha'] = { 903, 930, 963, 964, 967, 985, 991, 992, 993, 1004, 1006, 1018 },
+        ['che'] = { 914, 916, 961, 988, 999 },
+        ['chi'] = { 900, 910, 911, 918, 926, 938, 940, 942, 960, 962, 974, 992, 993, 996, 997, 1003, 1005, 1009, 1018 },
+        ['cho'] = { 930, 968, 997, 1011 },
+        ['chu'] = { 969 },
+        ['ci'] = { 901, 910, 911, 914, 915, 927, 931, 935, 937, 943, 950, 954, 956, 960, 962, 965, 968, 969, 970, 976, 978, 981, 990, 1002, 1016, 1017 },
+        ['cia'] = { 927, 931, 935, 950, 970, 978, 1002 },
+        ['cib'] = { 954 },
+        ['cid'] = { 937 },
+        ['cie'] = { 915, 965, 976, 1017 },
+        ['cil'] = { 1016 },
+        ['cim'] = { 943 },
+        ['cin'] = { 901, 911, 914, 956, 962, 968 },
+        ['cio'] = { 969 },
+        ['cir'] = { 910, 915, 960 },
+        ['cis'] = { 981, 990 },
+        ['ck'] = { 896, 903, 904, 912, 913, 916, 918, 919, 922, 924, 925, 928, 930, 933, 934, 947, 949, 956, 960, 961, 963, 964, 968, 969, 971, 974, 976, 977, 980, 982, 983, 985, 986, 987, 988, 994, 995, 1003, 1007, 1008, 1011, 1015, 1017, 1019 },
+        ['ck '] = { 896, 903, 904, 912, 916, 918, 919, 922, 925, 928, 930, 934, 949, 956, 961, 968, 974, 976, 977, 980, 983, 985, 986, 987, 988, 994, 995, 1003, 1008, 1015, 1017, 1019 },
+        ['ckb'] = { 971 },
+        ['cke'] = { 963 },
+        ['ckh'] = { 964, 982 },
+        ['ckl'] = { 913, 960, 969, 1011 },
+        ['cko'] = { 925 },
+        ['cks'] = { 930, 947 },
+        ['ckw'] = { 974 },
+        ['cl'] = { 901, 906, 910, 915, 917, 926, 929, 949, 954, 960, 966, 986, 994, 1015 },
+        ['cla'] = { 901, 949, 986 },
+        ['cle'] = { 910, 915, 960, 1015 },
+        ['cli'] = { 926, 966 },
+        ['clo'] = { 917, 929, 954, 994 },
+        ['clu'] = { 906 },
+        ['co'] = { 901, 907, 909, 912, 920, 922, 926, 928, 929, 933, 939, 941, 944, 949, 952, 953, 954, 955, 956, 957, 959, 960, 962, 963, 966, 967, 980, 981, 982, 986, 987, 992, 999, 1002, 1005, 1006, 1007, 1008, 1016, 1017 },
+        ['cob'] = { 901, 949 },
+        ['cof'] = { 944, 986 },
+        ['com'] = { 920, 933, 966, 982, 987 },
+        ['con'] = { 907, 922, 926, 929, 933, 939, 949, 952, 953, 954, 955, 956, 957, 959, 960, 963, 980, 981, 992, 1005, 1006, 1007, 1008, 1016 },
+        ['cor'] = { 928, 941, 953, 954, 955, 956, 957, 967, 980, 981, 1002, 1005, 1006, 1007, 1008 },
+        ['cou'] = { 909, 912, 933, 1006 },
+        ['cov'] = { 999, 1017 },
+        ['coy'] = { 941, 962 },
+        ['cr'] = { 903, 934, 937, 948, 953, 954, 968, 973, 982, 986, 990, 992, 998, 1015 },
+        ['cra'] = { 986 },
+        ['cre'] = { 990, 998 },
+        ['cri'] = { 937 },
+        ['cro'] = { 934, 953, 968, 986, 992 },
+        ['cru'] = { 1015 },
+        ['cry'] = { 903, 948, 954, 973, 982, 992, 1015 },
+        ['cs'] = { 1004 },
+        ['csb'] = { 1004 },
+        ['ct'] = { 898, 909, 910, 911, 914, 916, 920, 924, 928, 933, 936, 952, 953, 955, 960, 965, 966, 969, 980, 997, 998, 1017, 1018, 1019 },
+        ['ct '] = { 910, 920, 933, 952, 965, 969, 1017 },
+        ['ct/'] = { 898, 909, 916, 936, 953, 955, 998 },
+        ['cti'] = { 928, 953, 966 },
+        ['cto'] = { 911, 914, 960, 1019 },
+        ['ctr'] = { 980, 997, 1018 },
+        ['cu'] = { 898, 899, 902, 904, 905, 909, 910, 911, 912, 913, 915, 916, 921, 923, 924, 932, 936, 942, 944, 947, 951, 952, 953, 955, 959, 960, 964, 968, 972, 974, 980, 981, 984, 989, 991, 993, 998, 1011, 1012, 1016 },
+        ['cui'] = { 991 },
+        ['cul'] = { 974 },
+        ['cum'] = { 981 },
+        ['cur'] = { 898, 899, 902, 904, 905, 909, 910, 911, 913, 915, 916, 921, 923, 932, 936, 942, 944, 947, 951, 952, 953, 955, 960, 968, 972, 980, 981, 984, 989, 993, 998, 1011, 1012, 1016 },
+        ['cus'] = { 912, 924, 964 },
+        ['cut'] = { 913, 959, 1011 },
+        ['cy'] = { 917, 919, 929, 934, 954, 992, 993 },
+        ['cyc'] = { 917, 929, 954 },
+        ['cyg'] = { 992, 993 },
+        ['cyt'] = { 919, 934 },
+        ['d'] = { 897, 899, 900, 901, 902, 903, 904, 905, 906, 907, 908, 910, 911, 912, 913, 914, 915, 917, 918, 919, 920, 921, 922, 924, 925, 926, 927, 928, 929, 930, 931, 932, 933, 934, 935, 937, 938, 939, 940, 941, 942, 943, 944, 945, 946, 947, 948, 949, 950, 951, 952, 953, 954, 955, 956, 957, 958, 959, 960, 961, 962, 963, 964, 965, 966, 967, 968, 969, 970, 971, 972, 973, 974, 975, 976, 977, 978, 979, 980, 981, 982, 983, 984, 985, 986, 987, 988, 989, 990, 991, 992, 993, 994, 995, 996, 997, 998, 999, 1002, 1003, 1004, 1005, 1006, 1007, 1008, 1009, 1010, 1011, 1013, 1014, 1015, 1016, 1017, 1018, 1019 },
+        ['d '] = { 897, 900, 902, 904, 905, 906, 908, 911, 914, 917, 920, 925, 926, 929, 930, 932, 938, 939, 940, 941, 942, 951, 952, 954, 955, 958, 960, 962, 964, 965, 973, 982, 983, 985, 986, 987, 988, 989, 991, 993, 997, 998, 1004, 1005, 1010, 1014, 1016, 1017, 1018 },
+        ['d ('] = { 954 },
+        ['d a'] = { 1017 },
+        ['d b'] = { 905, 917, 926, 951, 964, 982 },
+        ['d c'] = { 930, 998 },
+        ['d d'] = { 985 },
+        ['d e'] = { 900, 908, 938, 942, 997, 1005, 1018 },
+        ['d f'] = { 929, 940, 941, 962, 988, 1014 },
+        ['d i'] = { 911, 914, 985, 1010, 1016 },
+        ['d k'] = { 985 },
+        ['d l'] = { 897, 902, 905, 920, 930, 973 },
+        ['d m'] = { 904, 920, 925, 932, 952, 955, 965, 989, 991, 1017 },
+        ['d o'] = { 958 },
+        ['d r'] = { 939, 954 },
+        ['d s'] = { 906, 926, 960, 983, 993, 1004, 1010 },
+        ['d t'] = { 986, 987 },
+        ['d y'] = { 991 },
+        ['d.'] = { 934 },
+        ['d. '] = { 934 },
+        ['d/'] = { 911, 914 },
+        ['d/b'] = { 911, 914 },
+        ['d/c'] = { 911 },
+        ['da'] = { 901, 906, 913, 919, 922, 934, 945, 946, 947, 956, 959, 966, 967, 968, 971, 977, 983, 984, 985, 986, 987, 991, 995, 996, 1010, 1013, 1015, 1017 },
+        ['dal'] = { 919, 922, 956 },
+        ['dam'] = { 913, 959, 977, 996 },
+        ['dan'] = { 901, 945, 946, 947, 956, 966, 985, 1013, 1015 },
+        ['dar'] = { 906, 934, 967, 968, 977, 983, 985, 986, 987, 991, 995, 1010, 1017 },
+        ['dau'] = { 971 },
+        ['day'] = { 984, 1015 },
+        ['db'] = { 958 },
+        ['dbu'] = { 958 },
+        ['dd'] = { 965, 968, 1017 },
+        ['dde'] = { 968 },
+        ['ddl'] = { 965, 1017 },
+        ['de'] = { 897, 901, 902, 903, 905, 906, 907, 910, 911, 914, 915, 919, 920, 922, 928, 929, 934, 939, 940, 941, 943, 948, 949, 950, 951, 955, 961, 962, 965, 966, 967, 968, 969, 971, 972, 973, 975, 976, 977, 984, 985, 988, 989, 990, 992, 993, 998, 1003, 1005, 1009, 1017, 1019 },
+        ['de '] = { 911, 914, 948, 1005 },
+        ['de:'] = { 1003 },
+        ['dea'] = { 934, 977, 989 },
+        ['deb'] = { 922, 961 },
+        ['dec'] = { 941, 943, 962, 990 },
+        ['def'] = { 903, 910, 965, 976 },
+        ['dei'] = { 998 },
+        ['del'] = { 968 },
+        ['den'] = { 915, 928, 950, 968, 969, 972 },
+        ['dep'] = { 985 },
+        ['der'] = { 903, 907, 910, 919, 929, 940, 962, 968, 988, 990, 1009, 1019 },
+        ['des'] = { 901, 906, 985, 990, 1017 },
+        ['det'] = { 967 },
+        ['dev'] = { 955 },
+        ['dew'] = { 929, 940, 962, 988 },
+        ['dg'] = { 901, 912, 921, 926, 930, 944, 945, 947, 956, 964, 989, 1013 },
+        ['dge'] = { 901, 912, 926, 930, 945, 956, 964, 989, 1013 },
+        ['dgm'] = { 921, 947 },
+        ['dgr'] = { 944 },
+        ['di'] = { 899, 900, 902, 904, 905, 908, 910, 920, 925, 926, 939, 942, 945, 951, 952, 953, 960, 965, 968, 969, 971, 972, 974, 979, 981, 984, 985, 986, 989, 993, 996, 997, 998, 999, 1004, 1005, 1016, 1017, 1018 },
+        ['di-'] = { 981 },
+        ['dia'] = { 952, 969, 985, 989 },
+        ['dig'] = { 985, 1017 },
+        ['dim'] = { 969 },
+        ['din'] = { 899, 902, 905, 910, 920, 926, 939, 942, 951, 953, 960, 965, 968, 971, 972, 974, 979, 984, 993, 998, 999, 1004 },
+        ['dis'] = { 904, 920, 925, 926, 952, 965, 986, 989, 1017, 1018 },
+        ['dit'] = { 900, 908, 942, 996, 997, 1005, 1018 },
+        ['div'] = { 910, 945, 960, 984, 993 },
+        ['diz'] = { 1016 },
+        ['dj'] = { 960 },
+        ['dje'] = { 960 },
+        ['dl'] = { 965, 1017 },
+        ['dle'] = { 965, 1017 },
+        ['do'] = { 899, 904, 912, 918, 929, 930, 934, 940, 941, 957, 962, 964, 965, 967, 976, 986, 989, 993, 996, 997, 1005, 1007, 1018, 1019 },
+        ['do '] = { 918, 1007 },
+        ['do-'] = { 904 },
+        ['doc'] = { 1019 },
+        ['dod'] = { 912, 964 },
+        ['dok'] = { 997, 1018 },
+        ['dom'] = { 934, 993 },
+        ['don'] = { 957 },
+        ['dor'] = { 986 },
+        ['dou'] = { 899, 929, 940, 941, 962, 967, 989 },
+        ['dow'] = { 934, 965, 976, 989 },
+        ['dp'] = { 969 },
+        ['dpl'] = { 969 },
+        ['dr'] = { 906, 911, 913, 914, 915, 924, 928, 933, 939, 946, 947, 957, 964, 966, 972, 983, 985, 986, 995, 996, 1011, 1016, 1017 },
+        ['dra'] = { 906, 915, 924, 928, 933, 939, 946, 947, 957, 964, 966, 983, 986, 996, 1016 },
+        ['dre'] = { 1017 },
+        ['dri'] = { 911, 914, 915, 957, 972, 995 },
+        ['dro'] = { 913, 1011 },
+        ['dry'] = { 985 },
+        ['ds'] = { 994 },
+        ['dsp'] = { 994 },
+        ['du'] = { 968, 988, 990, 992, 993 },
+        ['du '] = { 992, 993 },
+        ['dul'] = { 988 },
+        ['dum'] = { 968 },
+        ['duo'] = { 990 },
+        ['dv'] = { 911, 914 },
+        ['dva'] = { 911, 914 },
+        ['dw'] = { 913, 985, 1011 },
+        ['dwi'] = { 913, 1011 },
+        ['dwo'] = { 985 },
+        ['dy'] = { 965 },
+        ['dyn'] = { 965 },
+        ['e'] = { 896, 897, 898, 899, 900, 901, 902, 903, 904, 905, 906, 907, 908, 909, 910, 911, 912, 913, 914, 915, 916, 917, 918, 919, 920, 921, 922, 923, 924, 925, 926, 927, 928, 929, 930, 931, 932, 933, 934, 935, 936, 937, 938, 939, 940, 941, 942, 943, 944, 945, 946, 947, 948, 949, 950, 951, 952, 953, 954, 955, 956, 957, 958, 959, 960, 961, 962, 963, 964, 965, 966, 967, 968, 969, 970, 971, 972, 973, 974, 975, 976, 977, 978, 979, 980, 981, 982, 983, 984, 985, 986, 987, 988, 989, 990, 991, 992, 993, 994, 995, 996, 997, 998, 999, 1002, 1003, 1004, 1005, 1006, 1007, 1008, 1009, 1010, 1011, 1012, 1013, 1014, 1015, 1016, 1017, 1018, 1019 },
+        ['e '] = { 896, 897, 898, 899, 900, 901, 902, 903, 904, 905, 906, 907, 908, 909, 910, 911, 912, 913, 914, 915, 916, 917, 918, 919, 920, 921, 922, 923, 924, 925, 926, 928, 929, 930, 932, 933, 934, 936, 937, 938, 939, 940, 941, 942, 943, 944, 945, 946, 947, 948, 949, 951, 952, 953, 954, 955, 956, 957, 958, 959, 960, 961, 962, 963, 964, 965, 966, 967, 968, 969, 971, 972, 973, 974, 975, 976, 977, 979, 980, 981, 982, 983, 984, 985, 986, 987, 989, 990, 991, 992, 993, 994, 995, 996, 997, 998, 999, 1003, 1004, 1005, 1006, 1007, 1008, 1009, 1010, 1011, 1012, 1013, 1015, 1016, 1017, 1018, 1019 },
+        ['e ('] = { 948, 953, 981, 1004, 1005 },
+        ['e +'] = { 959, 971, 996 },
+        ['e ['] = { 1004 },
+        ['e a'] = { 965, 1015 },
+        ['e b'] = { 903, 905, 910, 920, 939, 948, 949, 951, 967, 973, 999, 1005 },
+        ['e c'] = { 896, 904, 919, 921, 925, 934, 961, 968, 974, 976, 977, 985, 987, 990, 992, 995, 1015, 1019 },
+        ['e d'] = { 915, 957, 972, 977, 989, 996 },
+        ['e e'] = { 910, 911, 960, 967, 969, 984, 993 },
+        ['e f'] = { 897, 899, 900, 901, 903, 906, 907, 908, 912, 913, 915, 917, 918, 919, 920, 922, 923, 924, 928, 930, 932, 933, 937, 938, 939, 942, 943, 945, 946, 947, 948, 949, 954, 956, 957, 958, 959, 963, 964, 966, 969, 971, 972, 973, 975, 979, 982, 983, 984, 986, 990, 991, 994, 996, 997, 999, 1003, 1004, 1005, 1006, 1007, 1008, 1009, 1010, 1011, 1012, 1013, 1016, 1018 },
+        ['e g'] = { 963 },
+        ['e h'] = { 922, 1018 },
+        ['e i'] = { 898, 899, 902, 904, 905, 909, 910, 911, 913, 915, 916, 923, 926, 932, 936, 942, 944, 951, 952, 953, 955, 960, 968, 972, 980, 981, 984, 985, 989, 993, 998, 1011, 1012, 1013, 1018 },
+        ['e l'] = { 964, 973, 990 },
+        ['e m'] = { 898, 909, 911, 913, 914, 915, 916, 921, 923, 936, 944, 952, 953, 955, 960, 969, 980, 981, 989, 993, 997, 998, 1011, 1012, 1016, 1017, 1018, 1019 },
+        ['e o'] = { 976, 990 },
+        ['e p'] = { 907, 1009 },
+        ['e r'] = { 997, 1018 },
+        ['e s'] = { 909, 912, 913, 919, 928, 929, 937, 940, 941, 946, 947, 954, 959, 962, 966, 967, 974, 976, 983, 987, 1004, 1011, 1016 },
+        ['e t'] = { 899, 908, 997, 1017, 1018 },
+        ['e v'] = { 898, 909, 911, 916, 936, 944, 953, 955, 980, 985, 998, 1012 },
+        ['e w'] = { 939, 945, 1015 },
+        ['e z'] = { 915 },
+        ["e'"] = { 911, 914, 958 },
+        ["e's"] = { 911, 914, 958 },
+        ['e+'] = { 922 },
+        ['e,'] = { 926, 949 },
+        ['e, '] = { 926, 949 },
+        ['e-'] = { 896, 904, 922, 925, 933, 934, 961, 967, 968, 976, 977, 987, 995, 1003, 1015, 1019 },
+        ['e-i'] = { 933 },
+        ['e-t'] = { 896, 904, 922, 925, 934, 961, 968, 976, 977, 987, 995, 1003, 1015, 1019 },
+        ['e-u'] = { 967 },
+        ['e:'] = { 1003 },
+        ['e: '] = { 1003 },
+        ['ea'] = { 898, 906, 909, 910, 912, 916, 917, 918, 928, 929, 930, 933, 934, 936, 939, 940, 941, 943, 944, 946, 947, 949, 953, 955, 956, 958, 960, 962, 966, 971, 974, 977, 980, 983, 984, 987, 988, 989, 990, 991, 992, 994, 995, 998, 999, 1003, 1007, 1008, 1010, 1015, 1017, 1019 },
+        ['eac'] = { 912, 960, 1008 },
+        ['ead'] = { 928, 958, 1017 },
+        ['eak'] = { 912, 917, 930, 946, 949, 956, 984, 994, 1007, 1008 },
+        ['eal'] = { 898, 909, 910, 916, 929, 936, 940, 944, 947, 949, 953, 955, 962, 977, 980, 987, 988, 989, 995, 998, 999, 1003 },
+        ['ean'] = { 974, 1017 },
+        ['eap'] = { 934 },
+        ['ear'] = { 933, 987, 989, 1015, 1019 },
+        ['eas'] = { 943, 983, 990, 991, 994, 1017 },
+        ['eat'] = { 906, 917, 918, 934, 939, 966, 971, 995, 1010 },
+        ['eav'] = { 941, 992 },
+        ['eb'] = { 906, 912, 922, 961, 974, 988, 1008 },
+        ['ebi'] = { 906, 974 },
+        ['ebo'] = { 922 },
+        ['ebr'] = { 912, 1008 },
+        ['ebu'] = { 961, 988 },
+        ['ec'] = { 898, 909, 910, 916, 920, 927, 928, 931, 933, 935, 936, 941, 943, 950, 952, 953, 955, 962, 965, 969, 970, 978, 980, 981, 990, 997, 998, 1002, 1017, 1018 },
+        ['eci'] = { 927, 931, 935, 943, 950, 970, 978, 981, 990, 1002 },
+        ['eco'] = { 941, 962, 1017 },
+        ['ect'] = { 898, 909, 910, 916, 920, 928, 933, 936, 952, 953, 955, 965, 969, 980, 997, 998, 1017, 1018 },
+        ['ed'] = { 897, 900, 901, 902, 904, 905, 908, 920, 925, 926, 929, 930, 932, 940, 941, 942, 945, 952, 955, 956, 962, 965, 973, 978, 983, 985, 986, 987, 988, 989, 991, 996, 997, 998, 1005, 1013, 1014, 1017, 1018 },
+        ['ed '] = { 897, 902, 904, 905, 920, 925, 929, 930, 932, 940, 941, 952, 955, 962, 965, 973, 983, 985, 986, 987, 988, 989, 991, 998, 1014, 1017 },
+        ['edg'] = { 901, 926, 930, 945, 956, 1013 },
+        ['edi'] = { 900, 908, 942, 996, 997, 1005, 1018 },
+        ['ee'] = { 897, 899, 900, 901, 903, 906, 907, 908, 912, 913, 915, 917, 918, 920, 922, 923, 924, 928, 930, 932, 933, 937, 938, 939, 942, 943, 945, 946, 947, 948, 949, 954, 956, 957, 958, 959, 960, 961, 963, 964, 966, 971, 972, 973, 974, 975, 976, 979, 982, 983, 986, 990, 991, 994, 995, 996, 997, 999, 1003, 1004, 1005, 1006, 1007, 1008, 1009, 1010, 1011, 1012, 1013, 1016, 1017, 1018 },
+        ['ee '] = { 897, 899, 900, 901, 903, 906, 907, 908, 912, 913, 915, 917, 920, 922, 923, 924, 928, 930, 932, 933, 937, 938, 939, 942, 943, 945, 946, 947, 948, 949, 954, 956, 957, 958, 959, 963, 964, 966, 971, 972, 973, 975, 979, 982, 983, 986, 990, 991, 994, 996, 997, 999, 1003, 1004, 1005, 1006, 1007, 1008, 1009, 1010, 1011, 1012, 1013, 1016, 1018 },
+        ['eel'] = { 915, 917, 954, 971, 976 },
+        ['eem'] = { 912, 982, 1008 },
+        ['een'] = { 960, 1017 },
+        ['eep'] = { 899, 918, 961, 976, 995 },
+        ['eez'] = { 906, 974 },
+        ['ef'] = { 901, 903, 907, 910, 911, 920, 922, 930, 932, 933, 949, 952, 956, 962, 963, 965, 969, 975, 976, 981, 985, 989, 994, 1007, 1009, 1017 },
+        ['ef '] = { 965 },
+        ['ef+'] = { 965 },
+        ['ef/'] = { 976 },
+        ['efe'] = { 903, 910 },
+        ['efi'] = { 911 },
+        ['efr'] = { 920, 952, 965, 969, 981, 989, 1017 },
+        ['efu'] = { 962, 985 },
+        ['eg'] = { 899, 907, 911, 916, 958, 969, 981, 983, 985, 987, 1009 },
+        ['eg '] = { 899 },
+        ['ege'] = { 916, 958, 969, 981, 985 },
+        ['ego'] = { 987 },
+        ['egu'] = { 983 },
+        ['egy'] = { 911 },
+        ['eh'] = { 922, 990, 1005 },
+        ['eha'] = { 1005 },
+        ['ehe'] = { 990 },
+        ['ehk'] = { 922 },
+        ['ei'] = { 906, 923, 949, 956, 958, 968, 998, 1003, 1010, 1012 },
+        ['eid'] = { 906, 968, 1010 },
+        ['eif'] = { 998 },
+        ['eil'] = { 958 },
+        ['ein'] = { 949, 956 },
+        ['eir'] = { 923, 1012 },
+        ['ej'] = { 926, 979 },
+        ['eji'] = { 926 },
+        ['eju'] = { 979 },
+        ['ek'] = { 900, 938, 942, 996 },
+        ['ekk'] = { 900, 938, 942, 996 },
+        ['el'] = { 896, 897, 898, 899, 900, 901, 902, 903, 904, 905, 906, 907, 908, 909, 910, 911, 912, 913, 914, 915, 916, 917, 919, 920, 922, 923, 924, 925, 926, 928, 929, 930, 932, 933, 934, 936, 937, 938, 939, 940, 941, 942, 943, 944, 945, 946, 947, 948, 949, 951, 952, 953, 954, 955, 956, 957, 958, 959, 960, 961, 963, 964, 965, 966, 968, 969, 971, 972, 973, 975, 976, 977, 979, 980, 981, 982, 983, 984, 986, 987, 989, 990, 991, 992, 993, 994, 995, 996, 997, 998, 999, 1002, 1003, 1004, 1005, 1006, 1007, 1008, 1009, 1010, 1011, 1012, 1013, 1015, 1016, 1017, 1018, 1019 },
+        ['el '] = { 910, 917, 954, 992, 993, 994, 995, 996 },
+        ["el'"] = { 914 },
+        ['el-'] = { 976, 977 },
+        ['ela'] = { 965, 979, 1017 },
+        ['eld'] = { 905, 911, 917, 926, 951, 954, 984, 993 },
+        ['ele'] = { 896, 897, 899, 900, 901, 903, 904, 906, 907, 908, 911, 912, 913, 915, 917, 920, 922, 923, 924, 925, 928, 930, 932, 933, 934, 936, 937, 938, 939, 942, 943, 945, 946, 947, 948, 949, 954, 956, 957, 958, 959, 961, 963, 964, 966, 968, 969, 971, 972, 973, 975, 976, 977, 979, 982, 983, 986, 987, 990, 991, 994, 995, 996, 997, 1003, 1004, 1005, 1006, 1007, 1008, 1009, 1010, 1011, 1012, 1013, 1015, 1016, 1017, 1018, 1019 },
+        ['elf'] = { 1016 },
+        ['elh'] = { 968, 979 },
+        ['eli'] = { 915, 929, 941, 957, 968, 1002 },
+        ['ell'] = { 898, 906, 909, 911, 915, 916, 919, 920, 923, 936, 940, 944, 952, 953, 955, 961, 965, 969, 971, 980, 981, 983, 986, 989, 997, 998, 1012, 1015, 1017, 1018 },
+        ['elo'] = { 973, 999 },
+        ['elu'] = { 914 },
+        ['ely'] = { 1015 },
+        ['em'] = { 896, 904, 910, 912, 918, 920, 922, 925, 929, 934, 936, 940, 948, 960, 961, 968, 969, 976, 977, 982, 984, 986, 987, 988, 989, 990, 992, 993, 995, 999, 1003, 1008, 1009, 1015, 1016, 1017, 1019 },
+        ['em '] = { 982, 1008 },
+        ['ema'] = { 920 },
+        ['emb'] = { 910, 948, 960, 969, 984, 993 },
+        ['eme'] = { 896, 904, 922, 925, 934, 936, 961, 968, 969, 976, 977, 987, 990, 995, 1003, 1015, 1016, 1017, 1019 },
+        ['emi'] = { 918, 940, 992, 999, 1003, 1009 },
+        ['emo'] = { 986, 990 },
+        ['emp'] = { 929, 988, 989, 1019 },
+        ['en'] = { 896, 899, 900, 902, 903, 904, 905, 906, 908, 910, 914, 915, 916, 919, 920, 921, 922, 925, 926, 928, 932, 934, 936, 938, 942, 945, 946, 947, 950, 951, 957, 958, 959, 960, 961, 962, 968, 969, 972, 974, 976, 977, 979, 981, 984, 985, 986, 987, 990, 993, 995, 996, 997, 999, 1003, 1004, 1005, 1014, 1015, 1016, 1017, 1018, 1019 },
+        ['en '] = { 915, 916, 928, 969, 972, 986, 1014 },
+        ['en-'] = { 996 },
+        ['ena'] = { 979 },
+        ['enc'] = { 916, 925, 926, 959, 968, 969, 987, 990, 999 },
+        ['end'] = { 903, 906, 910, 968 },
+        ['eng'] = { 1005, 1017 },
+        ['enh'] = { 969 },
+        ['eni'] = { 997 },
+        ['enl'] = { 910, 951, 993 },
+        ['enm'] = { 899, 1004 },
+        ['enn'] = { 950 },
+        ['eno'] = { 986 },
+        ['enp'] = { 900 },
+        ['ens'] = { 896, 904, 919, 920, 921, 925, 934, 945, 961, 968, 974, 976, 977, 985, 987, 995, 1015, 1017, 1019 },
+        ['ent'] = { 896, 899, 902, 904, 905, 910, 914, 915, 921, 922, 925, 934, 936, 946, 947, 951, 957, 960, 961, 962, 968, 969, 972, 976, 977, 981, 984, 987, 990, 993, 995, 1003, 1015, 1016, 1017, 1019 },
+        ['env'] = { 987 },
+        ['enw'] = { 932 },
+        ['enz'] = { 908, 959, 984, 986, 1014 },
+        ['eo'] = { 911, 924, 927, 930, 931, 935, 944, 950, 970, 974, 978, 981, 986, 989, 991, 1002, 1015 },
+        ['eo '] = { 1015 },
+        ['eod'] = { 986 },
+        ['eog'] = { 930 },
+        ['eom'] = { 927, 931, 935, 950, 970, 978, 981, 1002 },
+        ['eon'] = { 911, 974, 989 },
+        ['eor'] = { 924 },
+        ['eou'] = { 944, 991 },
+        ['ep'] = { 899, 910, 918, 946, 947, 961, 966, 976, 984, 985, 993, 995 },
+        ['ep,'] = { 976 },
+        ['epg'] = { 961, 995 },
+        ['epr'] = { 910, 984, 985, 993 },
+        ['eq'] = { 977 },
+        ['equ'] = { 977 },
+        ['er'] = { 896, 897, 898, 899, 900, 901, 902, 903, 904, 906, 907, 908, 909, 910, 911, 912, 913, 914, 915, 916, 917, 918, 919, 920, 921, 922, 923, 924, 925, 926, 927, 928, 929, 930, 931, 932, 933, 934, 935, 936, 937, 938, 939, 940, 941, 942, 943, 944, 945, 946, 947, 948, 949, 950, 951, 952, 953, 954, 955, 956, 957, 958, 959, 960, 961, 962, 963, 964, 966, 967, 968, 969, 970, 971, 972, 973, 974, 975, 976, 977, 978, 979, 980, 981, 982, 983, 984, 985, 986, 987, 988, 989, 990, 991, 992, 994, 995, 996, 997, 998, 999, 1002, 1003, 1004, 1005, 1006, 1007, 1008, 1009, 1010, 1011, 1012, 1013, 1014, 1015, 1016, 1017, 1018, 1019 },
+        ['er '] = { 906, 907, 915, 918, 919, 946, 957, 960, 966, 967, 969, 984, 1009, 1015, 1017 },
+        ["er'"] = { 914, 945, 967, 986, 1013 },
+        ['era'] = { 898, 902, 910, 911, 915, 921, 922, 926, 939, 943, 951, 953, 955, 956, 973, 980, 981, 989, 997, 998, 999, 1012 },
+        ['erc'] = { 913, 922, 959, 962, 974, 1011, 1016 },
+        ['ere'] = { 977 },
+        ['erf'] = { 933 },
+        ['eri'] = { 923, 990, 1012 },
+        ['erk'] = { 903, 917, 937, 939, 941, 943, 948, 951, 957, 969, 972, 973, 982, 992 },
+        ['ern'] = { 1015 },
+        ['ero'] = { 900, 958, 1011 },
+        ['err'] = { 944, 973, 974 },
+        ['ers'] = { 903, 912, 917, 937, 939, 941, 943, 947, 948, 951, 957, 969, 972, 973, 982, 992, 1006, 1019 },
+        ['ert'] = { 926, 952, 955 },
+        ['eru'] = { 916 },
+        ['erv'] = { 968 },
+        ['ery'] = { 937, 953, 954 },
+        ['erz'] = { 914 },
+        ['es'] = { 896, 901, 903, 904, 905, 906, 907, 909, 910, 917, 918, 919, 920, 922, 925, 933, 934, 937, 938, 939, 943, 952, 953, 954, 955, 958, 961, 964, 965, 966, 968, 969, 973, 974, 976, 977, 979, 980, 981, 982, 985, 986, 987, 989, 990, 995, 997, 998, 1003, 1009, 1010, 1015, 1016, 1017, 1018, 1019 },
+        ['es '] = { 896, 904, 909, 922, 925, 934, 961, 968, 976, 977, 986, 987, 990, 995, 1003, 1015, 1017, 1019 },
+        ['esc'] = { 1017 },
+        ['esd'] = { 1015 },
+        ['ese'] = { 958, 1019 },
+        ['esh'] = { 907, 920, 938, 952, 965, 969, 981, 989, 1009, 1017 },
+        ['esi'] = { 958, 1017 },
+        ['esk'] = { 905, 955, 969, 980, 1018 },
+        ['eso'] = { 906, 990, 995, 1010 },
+        ['esp'] = { 901 },
+        ['ess'] = { 903, 918, 933, 937, 939, 943, 954, 964, 973, 997, 998, 1016, 1017, 1019 },
+        ['est'] = { 910, 917, 922, 954, 977, 979, 982, 986, 1017, 1018 },
+        ['esu'] = { 953 },
+        ['et'] = { 896, 903, 904, 906, 911, 914, 922, 923, 924, 925, 934, 945, 954, 958, 961, 962, 963, 964, 967, 968, 976, 977, 983, 987, 995, 1003, 1006, 1012, 1013, 1015, 1017, 1019 },
+        ['et '] = { 896, 904, 911, 914, 922, 925, 934, 961, 963, 968, 976, 977, 987, 995, 1003, 1015, 1017, 1019 },
+        ['eta'] = { 903, 954, 958 },
+        ['ete'] = { 924, 1015 },
+        ['eth'] = { 906 },
+        ['etm'] = { 923, 1012 },
+        ['eto'] = { 967 },
+        ['etr'] = { 995 },
+        ['ets'] = { 958, 1003 },
+        ['ett'] = { 945, 958, 983, 1013 },
+        ['etu'] = { 964, 977, 1006 },
+        ['eu'] = { 939, 953, 979, 984, 1017 },
+        ['euh'] = { 939 },
+        ['euj'] = { 953 },
+        ['eus'] = { 979 },
+        ['eut'] = { 984, 1017 },
+        ['ev'] = { 922, 947, 955, 956, 967, 976, 979, 990, 993, 1015 },
+        ['eva'] = { 976, 990 },
+        ['eve'] = { 947, 979, 1015 },
+        ['evi'] = { 956 },
+        ['evo'] = { 922, 955, 967 },
+        ['ew'] = { 915, 929, 940, 957, 962, 988 },
+        ['ewe'] = { 915, 957 },
+        ['ewi'] = { 929, 940, 962, 988 },
+        ['ex'] = { 899, 909, 912, 921, 937, 971, 1004, 1008, 1016, 1017, 1019 },
+        ['exa'] = { 909, 912, 921, 937, 1008, 1019 },
+        ['exc'] = { 899, 1004 },
+        ['exo'] = { 1016 },
+        ['exp'] = { 1017 },
+        ['ey'] = { 900, 908, 938, 942, 963, 967, 991, 997, 1005, 1018 },
+        ['eye'] = { 900, 908, 938, 942, 963, 967, 997, 1005, 1018 },
+        ['ez'] = { 906, 974 },
+        ['eze'] = { 906, 974 },
+        ['f'] = { 896, 897, 899, 900, 901, 902, 903, 904, 905, 906, 907, 908, 909, 910, 911, 912, 913, 915, 917, 918, 919, 920, 921, 922, 923, 924, 925, 926, 928, 929, 930, 932, 933, 934, 937, 938, 939, 940, 941, 942, 943, 944, 945, 946, 947, 948, 949, 951, 952, 953, 954, 956, 957, 958, 959, 960, 961, 962, 963, 964, 965, 966, 967, 968, 969, 971, 972, 973, 974, 975, 976, 977, 978, 979, 980, 981, 982, 983, 984, 985, 986, 987, 988, 989, 990, 991, 992, 993, 994, 995, 996, 997, 998, 999, 1003, 1004, 1005, 1006, 1007, 1008, 1009, 1010, 1011, 1012, 1013, 1014, 1015, 1016, 1017, 1018, 1019 },
+        ['f '] = { 934, 961, 965, 976, 983, 989, 990, 997 },
+        ['f a'] = { 983 },
+        ['f d'] = { 934 },
+        ['f h'] = { 989 },
+        ['f l'] = { 965 },
+        ['f p'] = { 997 },
+        ['f r'] = { 990 },
+        ['f s'] = { 961, 965 },
+        ['f t'] = { 976, 990 },
+        ['f u'] = { 965 },
+        ['f+'] = { 965 },
+        ['f+m'] = { 965 },
+        ['f-'] = { 1016 },
+        ['f-a'] = { 1016 },
+        ['f/'] = { 976 },
+        ['f/m'] = { 976 },
+        ['fa'] = { 903, 932, 948, 949, 951, 966, 975, 996 },
+        ['fab'] = { 932 },
+        ['fal'] = { 996 },
+        ['fas'] = { 903, 948, 949, 951, 966, 975 },
+        ['fe'] = { 896, 903, 904, 910, 918, 919, 921, 925, 933, 934, 943, 944, 949, 956, 961, 966, 968, 969, 974, 976, 977, 983, 985, 987, 995, 999, 1015, 1019 },
+        ['fea'] = { 910, 918, 966, 983 },
+        ['fec'] = { 933 },
+        ['fei'] = { 949, 956 },
+        ['fen'] = { 896, 903, 904, 910, 919, 921, 925, 934, 961, 968, 969, 974, 976, 977, 985, 987, 995, 999, 1015, 1019 },
+        ['fer'] = { 943, 944 },
+        ['fev'] = { 1015 },
+        ['ff'] = { 896, 904, 909, 919, 921, 925, 934, 944, 953, 961, 968, 974, 976, 977, 980, 985, 986, 987, 989, 995, 1015, 1019 },
+        ['ff '] = { 961 },
+        ['ffe'] = { 896, 904, 919, 921, 925, 934, 961, 968, 974, 976, 977, 985, 987, 995, 1015, 1019 },
+        ['ffi'] = { 944, 986 },
+        ['ffl'] = { 909, 953, 980, 989 },
+        ['fi'] = { 897, 899, 900, 901, 903, 906, 907, 908, 911, 912, 913, 915, 917, 919, 920, 922, 923, 924, 928, 929, 930, 932, 933, 937, 938, 939, 940, 941, 942, 943, 944, 945, 946, 947, 948, 949, 954, 956, 957, 958, 959, 962, 963, 964, 966, 967, 971, 972, 973, 975, 979, 982, 983, 984, 985, 986, 988, 989, 990, 991, 994, 996, 997, 998, 1003, 1004, 1005, 1006, 1007, 1008, 1009, 1010, 1011, 1012, 1013, 1014, 1015, 1016, 1017, 1018, 1019 },
+        ['fia'] = { 985 },
+        ['fic'] = { 998 },
+        ['fie'] = { 911, 937, 984, 1017 },
+        ['fig'] = { 897, 899, 900, 901, 903, 906, 907, 908, 912, 913, 915, 917, 920, 922, 923, 924, 928, 929, 930, 932, 933, 937, 938, 939, 940, 941, 942, 943, 945, 946, 947, 948, 949, 954, 956, 957, 958, 959, 962, 963, 964, 966, 967, 971, 972, 973, 975, 979, 982, 983, 986, 988, 990, 991, 994, 996, 997, 1003, 1004, 1005, 1006, 1007, 1008, 1009, 1010, 1011, 1012, 1013, 1014, 1016, 1018 },
+        ['fih'] = { 940 },
+        ['fin'] = { 944, 986, 1015, 1019 },
+        ['fir'] = { 919, 989, 1015 },
+        ['fis'] = { 924, 933, 964 },
+        ['fl'] = { 899, 902, 905, 909, 910, 919, 926, 946, 947, 951, 952, 953, 957, 960, 966, 969, 972, 980, 984, 988, 989, 993, 1017, 1018 },
+        ['fla'] = { 899, 902, 905, 909, 910, 919, 926, 951, 953, 957, 960, 969, 972, 980, 984, 988, 993, 1018 },
+        ['fle'] = { 989 },
+        ['flo'] = { 946, 947, 966 },
+        ['flu'] = { 952, 1017 },
+        ['fo'] = { 912, 924, 933, 958, 964, 969 },
+        ['foc'] = { 912, 924, 964 },
+        ['foe'] = { 958 },
+        ['foi'] = { 969 },
+        ['for'] = { 933, 964, 969 },
+        ['fr'] = { 906, 920, 952, 965, 969, 974, 978, 981, 984, 986, 989, 1017, 1018 },
+        ['fra'] = { 920 },
+        ['fre'] = { 906, 920, 952, 965, 969, 974, 981, 984, 986, 989, 1017 },
+        ['fri'] = { 978 },
+        ['fro'] = { 986, 1018 },
+        ['ft'] = { 902, 951, 966, 975, 992 },
+        ['ft '] = { 902, 951, 966, 975, 992 },
+        ['fu'] = { 918, 945, 954, 962, 981, 984, 985, 996, 997, 1003, 1013 },
+        ['fub'] = { 918 },
+        ['fud'] = { 996 },
+        ['fug'] = { 997 },
+        ['ful'] = { 962, 984, 985 },
+        ['fur'] = { 945, 954, 981, 984, 1013 },
+        ['fut'] = { 1003 },
+        ['fy'] = { 913, 945, 995, 1011, 1013 },
+        ['fyi'] = { 913, 945, 1011, 1013 },
+        ['g'] = { 896, 897, 898, 899, 900, 901, 903, 904, 905, 906, 907, 908, 909, 910, 911, 912, 913, 914, 915, 916, 917, 918, 919, 920, 921, 922, 923, 924, 925, 926, 927, 928, 929, 930, 931, 932, 933, 934, 935, 936, 937, 938, 939, 940, 941, 942, 943, 944, 945, 946, 947, 948, 949, 950, 951, 952, 953, 954, 955, 956, 957, 958, 959, 960, 961, 962, 963, 964, 965, 966, 967, 968, 969, 970, 971, 972, 973, 974, 975, 976, 977, 978, 979, 980, 981, 982, 983, 984, 985, 986, 987, 988, 989, 990, 991, 992, 993, 994, 995, 996, 997, 998, 1002, 1003, 1004, 1005, 1006, 1007, 1008, 1009, 1010, 1011, 1012, 1013, 1014, 1015, 1016, 1017, 1018, 1019 },
+        ['g '] = { 897, 899, 901, 909, 913, 915, 919, 920, 924, 926, 933, 936, 940, 941, 943, 945, 947, 954, 956, 962, 964, 965, 966, 967, 968, 983, 988, 989, 991, 997, 1011, 1013, 1015, 1017 },
+        ['g a'] = { 940, 943, 962, 988 },
+        ['g b'] = { 897, 909, 920, 967 },
+        ['g c'] = { 901, 926 },
+        ['g d'] = { 913, 968, 1011, 1017 },
+        ['g e'] = { 901, 945, 956, 1013 },
+        ['g f'] = { 924, 933, 964 },
+        ['g g'] = { 991 },
+        ['g l'] = { 965 },
+        ['g m'] = { 936, 968 },
+        ['g o'] = { 989, 997 },
+        ['g p'] = { 991 },
+        ['g r'] = { 954 },
+        ['g s'] = { 899, 919, 941, 945, 1013, 1015 },
+        ['g t'] = { 915, 983 },
+        ['g u'] = { 966 },
+        ['g w'] = { 945, 947, 1013 },
+        ["g'"] = { 1004 },
+        ["g's"] = { 1004 },
+        ['g/'] = { 911, 914 },
+        ['g/v'] = { 911, 914 },
+        ['ga'] = { 908, 911, 914, 919, 938, 955, 959, 961, 964, 974, 976, 986, 989, 992, 993, 995, 996, 997, 998, 1003, 1011, 1012, 1018 },
+        ['ga '] = { 919, 955, 961, 974, 986, 989, 1011, 1012 },
+        ['gac'] = { 997, 1018 },
+        ['gad'] = { 919 },
+        ['gak'] = { 908, 938, 996, 997 },
+        ['gal'] = { 911, 914 },
+        ['gam'] = { 938, 998 },
+        ['gan'] = { 993 },
+        ['gat'] = { 976 },
+        ['gav'] = { 964 },
+        ['gaw'] = { 992, 1003 },
+        ['gaz'] = { 959 },
+        ['gb'] = { 1004 },
+        ['gbi'] = { 1004 },
+        ['ge'] = { 896, 898, 900, 901, 903, 904, 905, 908, 909, 910, 911, 912, 913, 914, 915, 916, 918, 919, 920, 921, 922, 923, 925, 926, 927, 929, 930, 931, 932, 934, 935, 936, 937, 939, 940, 941, 942, 943, 944, 945, 948, 949, 950, 951, 952, 953, 954, 955, 956, 958, 959, 961, 962, 963, 964, 965, 967, 968, 969, 970, 973, 974, 976, 977, 978, 980, 981, 983, 985, 986, 987, 988, 989, 991, 992, 993, 994, 995, 996, 997, 998, 1002, 1003, 1004, 1005, 1011, 1012, 1013, 1014, 1015, 1016, 1017, 1018, 1019 },
+        ['ge '] = { 903, 905, 910, 911, 920, 939, 948, 949, 951, 959, 967, 973, 977, 996, 1017 },
+        ["ge'"] = { 911, 914 },
+        ['gea'] = { 1017 },
+        ['ged'] = { 929, 940, 941, 962, 988, 1014 },
+        ['geh'] = { 1005 },
+        ['gek'] = { 900, 942, 996 },
+        ['gel'] = { 973, 992, 993, 994, 995, 996 },
+        ['gen'] = { 916, 958, 962, 969, 981, 985 },
+        ['geo'] = { 927, 931, 935, 950, 970, 978, 981, 989, 1002 },
+        ['ger'] = { 900, 929, 937, 940, 941, 954, 962, 963, 967, 988, 1014 },
+        ['ges'] = { 918 },
+        ['get'] = { 896, 904, 922, 925, 934, 961, 968, 976, 977, 987, 995, 1003, 1015, 1017, 1019 },
+        ['gg'] = { 903, 937, 939, 943, 954, 973, 1016 },
+        ['ggr'] = { 903, 937, 939, 943, 954, 973, 1016 },
+        ['gh'] = { 897, 898, 899, 900, 901, 903, 906, 907, 908, 910, 911, 912, 913, 915, 917, 920, 922, 923, 924, 928, 929, 930, 932, 933, 934, 937, 938, 939, 940, 941, 942, 943, 945, 946, 947, 948, 949, 951, 953, 954, 956, 957, 958, 959, 960, 962, 963, 964, 965, 966, 967, 971, 972, 973, 975, 979, 982, 983, 985, 986, 987, 988, 990, 991, 993, 994, 995, 996, 997, 1003, 1004, 1005, 1006, 1007, 1008, 1009, 1010, 1011, 1012, 1013, 1014, 1015, 1016, 1017, 1018 },
+        ['gh '] = { 915, 957, 996 },
+        ['gha'] = { 960 },
+        ['ght'] = { 897, 898, 899, 900, 901, 903, 906, 907, 908, 910, 911, 912, 913, 915, 917, 920, 922, 923, 924, 928, 929, 930, 932, 933, 934, 937, 938, 939, 940, 941, 942, 943, 945, 946, 947, 948, 949, 951, 953, 954, 956, 957, 958, 959, 962, 963, 964, 965, 966, 967, 971, 972, 973, 975, 979, 982, 983, 985, 986, 987, 988, 990, 991, 993, 994, 995, 996, 997, 1003, 1004, 1005, 1006, 1007, 1008, 1009, 1010, 1011, 1012, 1013, 1014, 1015, 1016, 1017, 1018 },
+        ['gi'] = { 938, 954, 964, 970, 971, 976, 983, 984, 986, 1005, 1015, 1017 },
+        ['gic'] = { 971, 976, 986, 1015, 1017 },
+        ['gid'] = { 970 },
+        ['gik'] = { 1005 },
+        ['gil'] = { 938, 984 },
+        ['gin'] = { 954, 964 },
+        ['git'] = { 983 },
+        ['gk'] = { 996 },
+        ['gl'] = { 896, 904, 922, 925, 931, 934, 961, 968, 976, 977, 987, 995, 1003, 1015, 1017, 1019 },
+        ['gle'] = { 896, 904, 922, 925, 931, 934, 961, 968, 976, 977, 987, 995, 1003, 1015, 1017, 1019 },
+        ['gm'] = { 921, 947 },
+        ['gme'] = { 921, 947 },
+        ['gn'] = { 985, 992, 993, 998, 1017 },
+        ['gna'] = { 985, 998 },
+        ['gne'] = { 992, 993 },
+        ['gni'] = { 1017 },
+        ['go'] = { 900, 901, 915, 924, 932, 933, 938, 939, 949, 957, 964, 987, 996 },
+        ['gob'] = { 932 },
+        ['gon'] = { 924, 933, 939, 957, 964, 996 },
+        ['goo'] = { 915, 957, 996 },
+        ['gor'] = { 987 },
+        ['got'] = { 900, 938 },
+        ['gr'] = { 903, 906, 907, 921, 928, 930, 937, 939, 943, 944, 954, 958, 960, 962, 963, 965, 971, 973, 1009, 1010, 1015, 1016 },
+        ['gra'] = { 907, 930, 958, 965, 1009, 1015, 1016 },
+        ['gre'] = { 903, 937, 939, 943, 954, 962, 971, 973 },
+        ['gri'] = { 921, 928, 944, 963, 1016 },
+        ['gro'] = { 906, 960, 1010 },
+        ['gs'] = { 937, 984 },
+        ['gu'] = { 910, 918, 934, 965, 973, 981, 983, 984, 991, 995 },
+        ['gud'] = { 918 },
+        ['gue'] = { 973 },
+        ['gui'] = { 910, 934, 965, 995 },
+        ['guo'] = { 981 },
+        ['gur'] = { 983 },
+        ['gus'] = { 984, 991 },
+        ['gy'] = { 911, 1004 },
+        ['gyr'] = { 1004 },
+        ['h'] = { 896, 897, 898, 899, 900, 901, 902, 903, 905, 906, 907, 908, 909, 910, 911, 912, 913, 914, 915, 916, 917, 918, 919, 920, 921, 922, 923, 924, 925, 926, 928, 929, 930, 932, 933, 934, 936, 937, 938, 939, 940, 941, 942, 943, 944, 945, 946, 947, 948, 949, 950, 951, 952, 953, 954, 955, 956, 957, 958, 959, 960, 961, 962, 963, 964, 965, 966, 967, 968, 969, 971, 972, 973, 974, 975, 977, 979, 980, 981, 982, 983, 984, 985, 986, 987, 988, 989, 990, 991, 992, 993, 994, 995, 996, 997, 998, 999, 1003, 1004, 1005, 1006, 1007, 1008, 1009, 1010, 1011, 1012, 1013, 1014, 1015, 1016, 1017, 1018, 1019 },
+        ['h '] = { 902, 915, 921, 925, 939, 940, 951, 956, 957, 962, 973, 996, 1016 },
+        ['h ('] = { 956 },
+        ['h b'] = { 902, 939, 951, 973 },
+        ['h e'] = { 925 },
+        ['h i'] = { 921, 1016 },
+        ['h j'] = { 915, 957, 996 },
+        ['h l'] = { 940 },
+        ['h s'] = { 921, 940, 962 },
+        ['h w'] = { 956 },
+        ["h'"] = { 979 },
+        ["h't"] = { 979 },
+        ['ha'] = { 896, 900, 903, 908, 909, 910, 912, 915, 916, 918, 920, 921, 922, 930, 934, 936, 938, 939, 940, 942, 943, 944, 946, 947, 950, 951, 952, 953, 954, 955, 959, 960, 962, 963, 964, 965, 966, 967, 969, 972, 981, 982, 985, 988, 989, 991, 992, 993, 994, 996, 997, 998, 1003, 1004, 1005, 1006, 1008, 1017, 1018, 1019 },
+        ['ha '] = { 1018 },
+        ['ha-'] = { 936 },
+        ['ha:'] = { 1003 },
+        ['hab'] = { 922 },
+        ['hac'] = { 963 },
+        ['had'] = { 934, 960, 965 },
+        ['hag'] = { 908, 938, 996, 997 },
+        ['hak'] = { 909, 943, 964, 1006 },
+        ['hal'] = { 910, 912, 920, 951, 952, 969, 972, 985, 989, 993, 1008 },
+        ['han'] = { 896, 908, 918, 934, 964, 969, 982, 992, 993, 997, 1018, 1019 },
+        ['hao'] = { 967 },
+        ['hap'] = { 918 },
+        ['har'] = { 903, 930, 940, 962, 963, 988, 991, 1004, 1017 },
+        ['has'] = { 900, 908, 915, 916, 920, 921, 936, 938, 942, 944, 946, 947, 952, 953, 955, 959, 965, 966, 981, 985, 989, 996, 997, 998, 1005, 1017, 1018 },
+        ['hat'] = { 939, 950 },
+        ['hav'] = { 994 },
+        ['haw'] = { 954 },
+        ['hb'] = { 926, 982 },
+        ['hba'] = { 982 },
+        ['hbu'] = { 926 },
+        ['hc'] = { 956 },
+        ['hco'] = { 956 },
+        ['hd'] = { 950 },
+        ['hde'] = { 950 },
+        ['he'] = { 898, 906, 907, 909, 912, 913, 914, 915, 916, 918, 919, 920, 921, 930, 934, 936, 937, 941, 944, 947, 952, 953, 955, 958, 961, 964, 965, 966, 968, 969, 971, 974, 977, 980, 982, 983, 986, 988, 989, 990, 997, 998, 999, 1008, 1009, 1011, 1015, 1017, 1018 },
+        ['he '] = { 907, 964, 983, 990, 1009, 1011 },
+        ['hea'] = { 898, 909, 916, 936, 941, 944, 947, 953, 955, 958, 980, 989, 998, 999, 1015 },
+        ['heb'] = { 961, 988 },
+        ['hed'] = { 930 },
+        ['hee'] = { 912, 915, 971, 982, 1008 },
+        ['hei'] = { 958, 968 },
+        ['hel'] = { 898, 909, 916, 919, 920, 936, 952, 953, 955, 965, 968, 969, 980, 997, 998, 1017, 1018 },
+        ['hem'] = { 986, 990, 999 },
+        ['her'] = { 906, 914, 916, 918, 966, 974, 977, 1015 },
+        ['hes'] = { 958, 1018 },
+        ['hex'] = { 909, 912, 921, 937, 1008 },
+        ['hg'] = { 901, 949 },
+        ['hgo'] = { 901, 949 },
+        ['hi'] = { 898, 900, 901, 903, 905, 907, 908, 909, 910, 911, 913, 915, 916, 917, 918, 921, 922, 923, 926, 930, 932, 933, 936, 938, 940, 942, 944, 945, 949, 951, 952, 953, 954, 955, 956, 957, 960, 962, 963, 974, 975, 980, 981, 989, 992, 993, 994, 996, 997, 998, 1003, 1005, 1007, 1009, 1011, 1012, 1013, 1015, 1016, 1018, 1019 },
+        ['hi:'] = { 900, 938, 942, 996, 1005 },
+        ['hib'] = { 918 },
+        ['hie'] = { 901, 905, 907, 917, 922, 926, 930, 932, 933, 949, 951, 954, 956, 962, 963, 975, 993, 994, 1007, 1009 },
+        ['hig'] = { 915, 957, 996 },
+        ['hik'] = { 915, 918, 1005 },
+        ['hil'] = { 974 },
+        ['him'] = { 911, 926 },
+        ['hin'] = { 903, 940, 962, 993, 1015 },
+        ['hir'] = { 900, 908, 938, 942, 945, 997, 1005, 1013, 1018 },
+        ['hit'] = { 898, 909, 911, 913, 915, 916, 921, 923, 936, 944, 952, 953, 955, 980, 981, 989, 993, 997, 998, 1011, 1012, 1016, 1018, 1019 },
+        ['hiv'] = { 910, 960, 993 },
+        ['hk'] = { 922 },
+        ['hko'] = { 922 },
+        ['hl'] = { 909, 1016 },
+        ['hle'] = { 1016 },
+        ['hli'] = { 909 },
+        ['hm'] = { 923, 992, 1012 },
+        ['hme'] = { 923, 1012 },
+        ['hn'] = { 940, 947 },
+        ['hna'] = { 940 },
+        ['ho'] = { 900, 907, 918, 922, 923, 924, 928, 929, 930, 933, 936, 940, 941, 943, 945, 958, 960, 962, 967, 968, 974, 984, 988, 991, 992, 997, 998, 1006, 1009, 1011, 1012, 1016, 1017 },
+        ['hoa'] = { 1011 },
+        ['hob'] = { 900 },
+        ['hoc'] = { 930, 974 },
+        ['hoe'] = { 997 },
+        ['hoj'] = { 918, 992 },
+        ['hok'] = { 922 },
+        ['hol'] = { 960, 968, 984, 1006, 1016 },
+        ['hon'] = { 929 },
+        ['hor'] = { 923, 928, 930, 945, 1012 },
+        ['hot'] = { 907, 928, 929, 940, 941, 958, 962, 967, 988, 998, 1009 },
+        ['hou'] = { 997, 1017 },
+        ['how'] = { 918, 924, 933, 936, 943, 991 },
+        ['hp'] = { 922, 979, 983, 986, 1017, 1018 },
+        ['hp '] = { 1017, 1018 },
+        ['hp+'] = { 922, 979 },
+        ['hr'] = { 899, 915, 972, 986 },
+        ['hru'] = { 899, 915, 972, 986 },
+        ['ht'] = { 897, 898, 899, 900, 901, 903, 906, 907, 908, 910, 911, 912, 913, 915, 917, 920, 922, 923, 924, 928, 929, 930, 932, 933, 934, 937, 938, 939, 940, 941, 942, 943, 945, 946, 947, 948, 949, 951, 953, 954, 956, 957, 958, 959, 962, 963, 964, 965, 966, 967, 971, 972, 973, 975, 979, 982, 983, 985, 986, 987, 988, 990, 991, 993, 994, 995, 996, 997, 1003, 1004, 1005, 1006, 1007, 1008, 1009, 1010, 1011, 1012, 1013, 1014, 1015, 1016, 1017, 1018 },
+        ['ht '] = { 967, 971, 1015, 1017 },
+        ["ht'"] = { 911 },
+        ['ht,'] = { 965 },
+        ['hte'] = { 897, 899, 900, 901, 903, 906, 907, 908, 912, 913, 915, 917, 920, 922, 923, 924, 928, 929, 930, 932, 933, 937, 938, 939, 940, 941, 942, 943, 945, 946, 947, 948, 949, 954, 956, 957, 958, 959, 962, 963, 964, 966, 967, 971, 972, 973, 975, 979, 982, 983, 986, 988, 990, 991, 994, 996, 997, 1003, 1004, 1005, 1006, 1007, 1008, 1009, 1010, 1011, 1012, 1013, 1014, 1016, 1018 },
+        ['hu'] = { 914, 939, 943, 967, 969, 989, 1003 },
+        ['hu '] = { 943 },
+        ['hu:'] = { 1003 },
+        ['huc'] = { 969 },
+        ['huf'] = { 989 },
+        ['hun'] = { 914, 967, 1003 },
+        ['hur'] = { 939 },
+        ['hy'] = { 971, 988, 1011 },
+        ['hy '] = { 988 },
+        ['hys'] = { 971, 1011 },
+        ['i'] = { 896, 897, 898, 899, 900, 901, 902, 903, 904, 905, 906, 907, 908, 909, 910, 911, 912, 913, 914, 915, 916, 917, 918, 919, 920, 921, 922, 923, 924, 925, 926, 927, 928, 929, 930, 931, 932, 933, 934, 935, 936, 937, 938, 939, 940, 941, 942, 943, 944, 945, 946, 947, 948, 949, 950, 951, 952, 953, 954, 955, 956, 957, 958, 959, 960, 961, 962, 963, 964, 965, 966, 967, 968, 969, 970, 971, 972, 973, 974, 975, 976, 977, 978, 979, 980, 981, 982, 983, 984, 985, 986, 987, 988, 989, 990, 991, 992, 993, 994, 995, 996, 997, 998, 999, 1002, 1003, 1004, 1005, 1006, 1007, 1008, 1009, 1010, 1011, 1012, 1013, 1014, 1015, 1016, 1017, 1018, 1019 },
+        ['i '] = { 896, 898, 899, 902, 904, 905, 909, 910, 911, 913, 914, 915, 916, 919, 920, 921, 922, 923, 925, 926, 932, 934, 936, 942, 944, 947, 951, 952, 953, 955, 960, 961, 965, 966, 968, 969, 972, 974, 976, 977, 980, 981, 984, 987, 989, 993, 995, 998, 1011, 1012, 1015, 1016, 1017 },
+        ['i -'] = { 896, 898, 899, 902, 904, 905, 909, 910, 911, 913, 914, 915, 916, 919, 920, 921, 922, 923, 925, 926, 932, 934, 936, 942, 944, 947, 951, 952, 953, 955, 960, 961, 965, 966, 968, 969, 972, 974, 976, 977, 980, 981, 984, 987, 989, 993, 995, 998, 1011, 1012, 1015, 1016, 1017 },
+        ['i a'] = { 909 },
+        ["i'"] = { 954 },
+        ["i's"] = { 954 },
+        ['i,'] = { 961, 976 },
+        ['i, '] = { 961, 976 },
+        ['i-'] = { 961, 976, 981, 985, 988, 1003 },
+        ['i-a'] = { 981 },
+        ['i-c'] = { 961, 988 },
+        ['i-f'] = { 981 },
+        ['i-h'] = { 981 },
+        ['i-l'] = { 981 },
+        ['i-p'] = { 981, 1003 },
+        ['i-r'] = { 981 },
+        ['i-t'] = { 961, 976 },
+        ['i-v'] = { 985 },
+        ['i.'] = { 954 },
+        ['i. '] = { 954 },
+        ['i/'] = { 906 },
+        ['i/i'] = { 906 },
+        ['i:'] = { 900, 918, 938, 942, 992, 996, 1003, 1005, 1009 },
+        ['i: '] = { 900, 918, 938, 942, 992, 996, 1003, 1005, 1009 },
+        ['ia'] = { 903, 908, 909, 914, 923, 927, 931, 935, 938, 950, 952, 954, 957, 969, 970, 975, 978, 985, 989, 1002, 1012, 1017 },
+        ['ia '] = { 957 },
+        ['iai'] = { 938 },
+        ['ial'] = { 923, 927, 931, 935, 950, 970, 978, 1002, 1012 },
+        ['ian'] = { 914, 969, 975 },
+        ['iap'] = { 909 },
+        ['iar'] = { 908, 985 },
+        ['iat'] = { 903, 954, 969, 985 },
+        ['ib'] = { 918, 935, 954, 1015 },
+        ['iba'] = { 918 },
+        ['ibl'] = { 954, 1015 },
+        ['iby'] = { 935 },
+        ['ic'] = { 911, 913, 914, 918, 924, 925, 928, 929, 933, 937, 939, 947, 949, 953, 956, 960, 964, 965, 966, 968, 969, 971, 974, 976, 984, 986, 992, 994, 998, 1003, 1008, 1009, 1011, 1015, 1017, 1019 },
+        ['ic '] = { 924, 929, 965, 966, 984, 986, 998, 1015, 1017 },
+        ['ica'] = { 937, 939, 971, 1019 },
+        ['ice'] = { 953, 968, 974, 1008 },
+        ['ich'] = { 913, 918, 992, 1003, 1009, 1011 },
+        ['ick'] = { 913, 924, 925, 928, 933, 947, 949, 956, 960, 964, 969, 994, 1011 },
+        ['icr'] = { 968 },
+        ['ict'] = { 911, 914, 960 },
+        ['id'] = { 904, 906, 915, 921, 922, 929, 937, 940, 957, 962, 965, 968, 969, 970, 972, 988, 1010, 1016 },
+        ['id '] = { 1010, 1016 },
+        ['ida'] = { 922 },
+        ['ide'] = { 915, 929, 940, 962, 972, 988 },
+        ['idi'] = { 965, 969 },
+        ['ido'] = { 904, 957 },
+        ['ie'] = { 901, 905, 907, 910, 911, 915, 917, 922, 926, 930, 932, 933, 937, 942, 949, 951, 953, 954, 956, 962, 963, 965, 975, 976, 977, 978, 981, 984, 986, 990, 993, 994, 1007, 1009, 1017, 1018 },
+        ['ie '] = { 981, 990 },
+        ['ied'] = { 978, 986, 1017 },
+        ['ief'] = { 901, 907, 922, 930, 932, 933, 949, 956, 962, 963, 975, 994, 1007, 1009 },
+        ['iel'] = { 905, 910, 911, 917, 926, 951, 954, 965, 984, 993, 1017 },
+        ['ien'] = { 915, 976, 1018 },
+        ['ier'] = { 922, 937, 962 },
+        ['iet'] = { 977 },
+        ['ieu'] = { 953 },
+        ['if'] = { 902, 913, 945, 951, 966, 975, 992, 995, 998, 1011, 1013, 1017 },
+        ['ifi'] = { 998, 1017 },
+        ['ift'] = { 902, 951, 966, 975, 992 },
+        ['ify'] = { 913, 945, 995, 1011, 1013 },
+        ['ig'] = { 897, 898, 899, 900, 901, 903, 906, 907, 908, 910, 911, 912, 913, 914, 915, 917, 920, 922, 923, 924, 928, 929, 930, 932, 933, 934, 937, 938, 939, 940, 941, 942, 943, 945, 946, 947, 948, 949, 951, 953, 954, 956, 957, 958, 959, 962, 963, 964, 965, 966, 967, 971, 972, 973, 975, 979, 982, 983, 984, 985, 986, 987, 988, 990, 991, 992, 993, 994, 995, 996, 997, 1003, 1004, 1005, 1006, 1007, 1008, 1009, 1010, 1011, 1012, 1013, 1014, 1015, 1016, 1017, 1018 },
+        ['iga'] = { 911, 914, 992, 1003 },
+        ['igh'] = { 897, 898, 899, 900, 901, 903, 906, 907, 908, 910, 911, 912, 913, 915, 917, 920, 922, 923, 924, 928, 929, 930, 932, 933, 934, 937, 938, 939, 940, 941, 942, 943, 945, 946, 947, 948, 949, 951, 953, 954, 956, 957, 958, 959, 962, 963, 964, 965, 966, 967, 971, 972, 973, 975, 979, 982, 983, 985, 986, 987, 988, 990, 991, 993, 994, 995, 996, 997, 1003, 1004, 1005, 1006, 1007, 1008, 1009, 1010, 1011, 1012, 1013, 1014, 1015, 1016, 1017, 1018 },
+        ['igi'] = { 984 },
+        ['ign'] = { 985, 1017 },
+        ['ih'] = { 901, 909, 940, 947, 949 },
+        ['ih '] = { 940 },
+        ['ihg'] = { 901, 949 },
+        ['ihl'] = { 909 },
+        ['ihn'] = { 940, 947 },
+        ['ii'] = { 896, 898, 899, 902, 904, 905, 906, 909, 910, 911, 913, 914, 915, 916, 919, 920, 921, 922, 923, 925, 926, 932, 934, 936, 942, 944, 945, 946, 947, 951, 952, 953, 955, 960, 961, 965, 966, 968, 969, 972, 974, 976, 980, 981, 984, 985, 987, 989, 993, 995, 998, 1009, 1010, 1011, 1012, 1013, 1014, 1015, 1016, 1017, 1018, 1019 },
+        ['ii,'] = { 961, 976 },
+        ['iii'] = { 896, 898, 899, 902, 904, 905, 909, 910, 911, 913, 914, 915, 916, 919, 920, 921, 923, 925, 932, 934, 936, 942, 944, 946, 947, 951, 952, 953, 955, 960, 961, 965, 966, 968, 969, 972, 974, 976, 980, 981, 984, 985, 987, 989, 993, 995, 998, 1011, 1012, 1015, 1016, 1017 },
+        ['ik'] = { 900, 906, 908, 909, 912, 915, 916, 918, 919, 921, 933, 937, 942, 960, 964, 974, 993, 996, 1004, 1005, 1008, 1010, 1016 },
+        ['ika'] = { 900, 908, 915, 942, 996 },
+        ['ike'] = { 906, 909, 912, 919, 921, 933, 937, 960, 964, 974, 993, 1004, 1008, 1010, 1016 },
+        ['iki'] = { 916, 1005 },
+        ['iko'] = { 918, 1005 },
+        ['iku'] = { 908 },
+        ['il'] = { 899, 901, 902, 916, 925, 926, 933, 934, 937, 938, 942, 945, 958, 959, 965, 968, 969, 971, 974, 975, 984, 985, 987, 990, 991, 995, 1004, 1013, 1015, 1016 },
+        ['ild'] = { 958, 971, 985 },
+        ['ile'] = { 916, 925, 926, 959, 968, 987, 990, 1016 },
+        ['ilg'] = { 938 },
+        ['ili'] = { 937, 945, 975, 1013 },
+        ['ill'] = { 899, 902, 933, 934, 942, 958, 965, 974, 995, 1004, 1015 },
+        ['ilm'] = { 933 },
+        ['iln'] = { 991 },
+        ['im'] = { 908, 911, 914, 915, 923, 924, 926, 928, 943, 957, 964, 966, 969, 972, 975, 990, 997, 1006, 1011, 1012 },
+        ['ima'] = { 908, 943, 966, 990, 1011 },
+        ['imb'] = { 928 },
+        ['ime'] = { 926, 997 },
+        ['imi'] = { 969, 975 },
+        ['imo'] = { 914 },
+        ['imp'] = { 915, 923, 924, 957, 964, 972, 1006, 1012 },
+        ['in'] = { 896, 897, 899, 900, 901, 902, 903, 904, 905, 906, 909, 910, 911, 913, 914, 915, 917, 918, 919, 920, 921, 922, 924, 925, 926, 928, 929, 930, 932, 933, 934, 936, 937, 938, 939, 940, 942, 943, 944, 945, 946, 947, 949, 950, 951, 953, 954, 955, 956, 960, 961, 962, 964, 965, 966, 967, 968, 969, 971, 972, 974, 975, 976, 977, 979, 980, 981, 982, 983, 984, 985, 986, 987, 988, 989, 990, 991, 992, 993, 995, 996, 997, 998, 999, 1003, 1004, 1005, 1007, 1009, 1011, 1013, 1015, 1016, 1017, 1018, 1019 },
+        ['in '] = { 932, 946, 947, 950, 966, 983, 1019 },
+        ["in'"] = { 930 },
+        ['in/'] = { 906 },
+        ['in:'] = { 1003 },
+        ['ina'] = { 934, 1015, 1019 },
+        ['inc'] = { 906, 954, 993 },
+        ['ind'] = { 929, 940, 962, 968, 971, 981, 985, 988, 996 },
+        ['ine'] = { 899, 902, 905, 910, 914, 920, 934, 945, 951, 960, 972, 974, 984, 993, 995, 1016 },
+        ['ing'] = { 896, 897, 901, 904, 909, 911, 913, 914, 915, 919, 920, 921, 922, 924, 925, 926, 933, 934, 936, 937, 939, 940, 943, 945, 947, 954, 956, 961, 962, 964, 965, 966, 967, 968, 976, 977, 983, 984, 987, 988, 989, 991, 995, 997, 998, 1003, 1011, 1013, 1015, 1016, 1017, 1019 },
+        ['ini'] = { 930, 932, 993, 1015 },
+        ['inj'] = { 918, 928, 930, 975, 992, 1003, 1007, 1009 },
+        ['inn'] = { 911, 919, 943, 986, 992, 1003 },
+        ['ino'] = { 979, 984 },
+        ['inp'] = { 900, 918, 942, 1005 },
+        ['ins'] = { 909, 922 },
+        ['int'] = { 917, 949, 954, 956, 982, 990 },
+        ['inu'] = { 911, 914, 938 },
+        ['inv'] = { 954 },
+        ['io'] = { 897, 903, 905, 907, 908, 910, 912, 917, 918, 922, 928, 934, 937, 938, 939, 940, 941, 943, 944, 946, 947, 948, 949, 951, 954, 955, 956, 957, 959, 964, 965, 966, 969, 971, 972, 973, 979, 981, 982, 984, 985, 990, 991, 992, 993, 995, 1004, 1005, 1006, 1008, 1009, 1010, 1013, 1015, 1016, 1017 },
+        ['iob'] = { 908 },
+        ['iol'] = { 946 },
+        ['ion'] = { 903, 905, 907, 922, 928, 934, 943, 954, 955, 956, 969, 971, 979, 981, 985, 990, 993, 1009, 1015, 1017 },
+        ['ior'] = { 897, 903, 905, 910, 912, 917, 918, 937, 938, 939, 940, 941, 943, 944, 946, 947, 948, 949, 951, 954, 956, 957, 959, 964, 966, 969, 972, 973, 982, 984, 990, 991, 992, 1004, 1005, 1006, 1008, 1010, 1013, 1016 },
+        ['iou'] = { 965, 969 },
+        ['ip'] = { 898, 926, 928, 959, 963, 967, 969 },
+        ['ipe'] = { 963, 967, 969 },
+        ['iph'] = { 959 },
+        ['ipi'] = { 898 },
+        ['ipl'] = { 928, 967 },
+        ['ipp'] = { 926 },
+        ['iq'] = { 930, 992 },
+        ['iqu'] = { 930, 992 },
+        ['ir'] = { 900, 903, 906, 907, 908, 910, 915, 917, 919, 922, 923, 928, 936, 938, 941, 942, 945, 954, 956, 957, 958, 960, 967, 968, 977, 982, 989, 993, 994, 995, 997, 1003, 1004, 1005, 1009, 1012, 1013, 1015, 1018, 1019 },
+        ['ir '] = { 906, 922 },
+        ["ir'"] = { 967 },
+        ['ira'] = { 907, 919, 923, 941, 956, 989, 994, 1009, 1012, 1015 },
+        ['irc'] = { 910, 915, 960 },
+        ['ird'] = { 900, 908, 938, 942, 997, 1004, 1005, 1018 },
+        ['ire'] = { 919, 1015 },
+        ['iri'] = { 903, 908, 922, 936, 957, 977, 982, 993, 997, 1018, 1019 },
+        ['irl'] = { 945, 968, 1013 },
+        ['iro'] = { 917, 958, 997, 1018 },
+        ['is'] = { 904, 905, 910, 913, 914, 920, 921, 924, 925, 926, 928, 933, 944, 945, 946, 947, 952, 953, 956, 958, 959, 960, 964, 965, 966, 968, 981, 984, 985, 986, 989, 990, 993, 995, 997, 999, 1003, 1011, 1013, 1014, 1015, 1016, 1017, 1018 },
+        ['isa'] = { 905, 910, 984, 993 },
+        ['isc'] = { 956 },
+        ['ise'] = { 928, 944, 945, 953, 960, 997, 1013, 1018 },
+        ['ish'] = { 913, 921, 946, 947, 966, 968, 1003, 1011, 1016 },
+        ['isi'] = { 981, 990, 1015 },
+        ['isl'] = { 928 },
+        ['iso'] = { 995, 1014 },
+        ['isp'] = { 904, 925, 926, 952, 965, 989, 1017, 1018 },
+        ['isr'] = { 926 },
+        ['iss'] = { 914, 985 },
+        ['ist'] = { 920, 924, 933, 952, 964, 999 },
+        ['it'] = { 898, 900, 903, 906, 908, 909, 911, 913, 915, 916, 918, 921, 922, 923, 929, 930, 936, 937, 941, 942, 944, 952, 953, 954, 955, 956, 957, 965, 974, 977, 980, 981, 982, 983, 989, 993, 994, 996, 997, 998, 1005, 1006, 1007, 1008, 1011, 1012, 1016, 1018, 1019 },
+        ['it '] = { 936, 941, 977 },
+        ['ita'] = { 900, 908, 918, 942, 965, 983, 996, 997, 1005, 1018 },
+        ['ite'] = { 898, 906, 909, 911, 913, 915, 916, 921, 923, 936, 942, 944, 952, 953, 955, 974, 980, 981, 989, 993, 997, 998, 1006, 1011, 1012, 1016, 1018, 1019 },
+        ['ith'] = { 903, 929, 944, 993 },
+        ['iti'] = { 937 },
+        ['ito'] = { 930 },
+        ['its'] = { 903, 993 },
+        ['itt'] = { 994, 996 },
+        ['ity'] = { 923, 953, 954, 955, 956, 957, 980, 981, 994, 1005, 1006, 1007, 1008, 1012 },
+        ['iv'] = { 896, 898, 899, 902, 904, 905, 909, 910, 911, 913, 914, 915, 916, 919, 920, 921, 923, 925, 932, 934, 936, 941, 942, 944, 945, 947, 951, 952, 953, 955, 957, 960, 961, 965, 968, 969, 972, 974, 976, 977, 980, 981, 984, 985, 987, 989, 993, 995, 998, 1011, 1012, 1013, 1015, 1017, 1019 },
+        ['iv '] = { 910 },
+        ['iva'] = { 910, 960, 969, 993 },
+        ['ive'] = { 896, 904, 915, 919, 921, 925, 934, 957, 961, 968, 972, 974, 976, 977, 985, 987, 995, 1015, 1019 },
+        ['ivi'] = { 910, 941, 945, 960, 984, 993, 1013 },
+        ['ix'] = { 925, 932, 965, 997, 999 },
+        ['ix '] = { 965, 997, 999 },
+        ['ixt'] = { 925 },
+        ['iz'] = { 928, 974, 1016 },
+        ['ize'] = { 1016 },
+        ['izo'] = { 928 },
+        ['izz'] = { 974 },
+        ['j'] = { 897, 900, 904, 910, 911, 912, 915, 918, 921, 925, 926, 928, 929, 930, 942, 947, 953, 956, 957, 960, 961, 975, 976, 977, 979, 986, 992, 996, 1003, 1005, 1007, 1008, 1009, 1015 },
+        ['ja'] = { 912, 918, 925, 928, 930, 956, 961, 975, 976, 977, 986, 992, 1003, 1007, 1008, 1009, 1015 },
+        ['ja '] = { 912, 986, 1008, 1015 },
+        ['jak'] = { 956 },
+        ['jan'] = { 925 },
+        ['je'] = { 910, 929, 953, 960 },
+        ['je '] = { 953 },
+        ['jee'] = { 960 },
+        ['jel'] = { 929 },
+        ['jes'] = { 910 },
+        ['ji'] = { 897, 900, 904, 926, 942, 1003, 1005, 1015 },
+        ['jid'] = { 904 },
+        ['jig'] = { 1015 },
+        ['jin'] = { 900, 926, 942, 1003, 1005 },
+        ['jo'] = { 911, 918, 992 },
+        ['jo:'] = { 918, 992 },
+        ['joa'] = { 911 },
+        ['ju'] = { 915, 921, 947, 957, 979, 996, 1003, 1008 },
+        ['jud'] = { 921, 947 },
+        ['jum'] = { 915, 957, 996 },
+        ['jus'] = { 1008 },
+        ['jut'] = { 1003 },
+        ['juv'] = { 979 },
+        ['k'] = { 896, 897, 898, 900, 901, 902, 903, 904, 905, 906, 907, 908, 909, 910, 911, 912, 913, 915, 916, 917, 918, 919, 921, 922, 924, 925, 926, 927, 928, 930, 933, 934, 936, 937, 938, 939, 941, 942, 943, 946, 947, 948, 949, 950, 951, 952, 954, 955, 956, 957, 958, 959, 960, 961, 963, 964, 965, 966, 967, 968, 969, 971, 972, 973, 974, 976, 977, 978, 980, 982, 983, 984, 985, 986, 987, 988, 989, 991, 992, 993, 994, 995, 996, 997, 1003, 1004, 1005, 1006, 1007, 1008, 1009, 1010, 1011, 1015, 1016, 1017, 1018, 1019 },
+        ['k '] = { 896, 903, 904, 906, 907, 912, 916, 918, 919, 922, 925, 928, 930, 934, 949, 956, 959, 961, 967, 968, 974, 976, 977, 980, 983, 984, 985, 986, 987, 988, 992, 993, 994, 995, 996, 1003, 1007, 1008, 1009, 1010, 1015, 1017, 1019 },
+        ['k ('] = { 984 },
+        ['k a'] = { 930, 949, 956, 968, 992, 993, 994, 995, 996, 1007 },
+        ['k b'] = { 903, 918 },
+        ['k d'] = { 928 },
+        ['k g'] = { 959 },
+        ['k h'] = { 912, 1008 },
+        ['k k'] = { 906, 934, 983, 985, 986, 987, 995, 1010 },
+        ['k m'] = { 896, 904, 916, 919, 922, 925, 934, 961, 968, 974, 976, 977, 980, 983, 985, 986, 987, 988, 995, 1003, 1015, 1017, 1019 },
+        ['k s'] = { 967 },
+        ['k t'] = { 907, 1009 },
+        ['k+'] = { 965 },
+        ['k+d'] = { 965 },
+        ['k+m'] = { 965 },
+        ['k-'] = { 903 },
+        ['k-r'] = { 903 },
+        ['k.'] = { 987 },
+        ['k. '] = { 987 },
+        ['ka'] = { 900, 908, 915, 922, 936, 938, 942, 943, 947, 976, 996, 1003, 1005 },
+        ['ka '] = { 947 },
+        ['ka:'] = { 1003 },
+        ['kag'] = { 900, 908 },
+        ['kai'] = { 942 },
+        ['kak'] = { 1003 },
+        ['kam'] = { 938, 1003 },
+        ['kan'] = { 938, 942, 996 },
+        ['kar'] = { 915, 936, 943 },
+        ['kas'] = { 900, 938, 942, 996, 1005 },
+        ['kay'] = { 976 },
+        ['kaz'] = { 900, 908, 942, 996 },
+        ['kb'] = { 971, 977 },
+        ['kba'] = { 971 },
+        ['kbe'] = { 977 },
+        ['ke'] = { 896, 897, 903, 904, 905, 906, 907, 909, 910, 912, 915, 917, 918, 919, 921, 922, 925, 926, 933, 934, 936, 937, 946, 948, 951, 954, 957, 960, 961, 963, 964, 967, 968, 969, 972, 974, 976, 977, 984, 987, 992, 993, 995, 1003, 1004, 1008, 1009, 1010, 1015, 1016, 1017, 1019 },
+        ['ke '] = { 967 },
+        ['keg'] = { 907, 1009 },
+        ['ker'] = { 903, 909, 912, 925, 936, 946, 967, 977, 1008 },
+        ['kes'] = { 896, 904, 919, 922, 925, 933, 934, 961, 964, 968, 974, 976, 977, 987, 995, 1003, 1015, 1017, 1019 },
+        ['ket'] = { 963 },
+        ['kew'] = { 915, 957 },
+        ['kh'] = { 964, 982 },
+        ['kha'] = { 964, 982 },
+        ['ki'] = { 900, 901, 905, 908, 913, 916, 918, 924, 928, 933, 938, 942, 955, 961, 964, 969, 980, 985, 988, 989, 991, 996, 997, 1005, 1011, 1018 },
+        ['ki-'] = { 961, 988 },
+        ['kia'] = { 908 },
+        ['kic'] = { 913, 924, 933, 964, 1011 },
+        ['kik'] = { 900, 908, 916, 942, 996, 1005 },
+        ['kil'] = { 933 },
+        ['kim'] = { 928 },
+        ['kin'] = { 901, 905, 955, 969, 980, 989, 991, 1018 },
+        ['kio'] = { 908 },
+        ['kir'] = { 908 },
+        ['kis'] = { 985 },
+        ['kk'] = { 900, 938, 942, 961, 988, 996, 1003 },
+        ['kka'] = { 938, 942, 996, 1003 },
+        ['kki'] = { 961, 988 },
+        ['kko'] = { 900, 942, 996 },
+        ['kl'] = { 913, 948, 960, 969, 1011 },
+        ['kla'] = { 948 },
+        ['kle'] = { 913, 960, 969, 1011 },
+        ['kn'] = { 906, 911, 913, 925, 934, 971, 983, 985, 986, 987, 995, 1010, 1011, 1017 },
+        ['kne'] = { 1017 },
+        ['kni'] = { 906, 911, 934, 983, 985, 986, 987, 995, 1010 },
+        ['kno'] = { 925, 971 },
+        ['knu'] = { 913, 1011 },
+        ['ko'] = { 900, 918, 922, 925, 942, 952, 956, 966, 996, 1005 },
+        ['ko '] = { 918, 922 },
+        ['koh'] = { 956 },
+        ['kok'] = { 900, 1005 },
+        ['kon'] = { 996 },
+        ['kor'] = { 952, 1005 },
+        ['kou'] = { 925 },
+        ['kov'] = { 966 },
+        ['koy'] = { 1005 },
+        ['kr'] = { 964, 1006 },
+        ['kra'] = { 964, 1006 },
+        ['ks'] = { 930, 947 },
+        ['kst'] = { 930, 947 },
+        ['ku'] = { 898, 900, 908, 918, 927, 938, 946, 950, 961, 978, 992, 996, 997, 1003, 1017 },
+        ['ku '] = { 918 },
+        ['kua'] = { 1017 },
+        ['kuk'] = { 961 },
+        ['kul'] = { 946 },
+        ['kup'] = { 898, 978 },
+        ['kur'] = { 908, 918, 927, 938, 992, 996, 997 },
+        ['kus'] = { 908 },
+        ['kuy'] = { 950 },
+        ['kw'] = { 974 },
+        ['kwa'] = { 974 },
+        ['ky'] = { 1018 },
+        ['kyo'] = { 1018 },
+        ['l'] = { 896, 897, 898, 899, 900, 901, 902, 903, 904, 905, 906, 907, 908, 909, 910, 911, 912, 913, 914, 915, 916, 917, 918, 919, 920, 922, 923, 924, 925, 926, 927, 928, 929, 930, 931, 932, 933, 934, 935, 936, 937, 938, 939, 940, 941, 942, 943, 944, 945, 946, 947, 948, 949, 950, 951, 952, 953, 954, 955, 956, 957, 958, 959, 960, 961, 962, 963, 964, 965, 966, 967, 968, 969, 970, 971, 972, 973, 974, 975, 976, 977, 978, 979, 980, 981, 982, 983, 984, 985, 986, 987, 988, 989, 990, 991, 992, 993, 994, 995, 996, 997, 998, 999, 1002, 1003, 1004, 1005, 1006, 1007, 1008, 1009, 1010, 1011, 1012, 1013, 1015, 1016, 1017, 1018, 1019 },
+        ['l '] = { 896, 897, 902, 903, 904, 905, 906, 910, 913, 917, 919, 920, 922, 923, 925, 926, 929, 934, 937, 939, 943, 945, 948, 949, 952, 954, 958, 959, 960, 961, 965, 966, 968, 969, 971, 975, 976, 977, 984, 985, 987, 988, 989, 992, 993, 994, 995, 996, 1003, 1011, 1012, 1015, 1017, 1019 },
+        ['l a'] = { 923, 926, 929, 939, 949, 960, 971, 988, 1012 },
+        ['l b'] = { 897, 902, 903, 905, 910, 920, 939, 948, 949, 966, 975, 977, 985, 993 },
+        ['l c'] = { 917, 954 },
+        ['l d'] = { 906, 945, 961 },
+        ['l e'] = { 993, 1015, 1019 },
+        ['l f'] = { 984, 985 },
+        ['l g'] = { 996 },
+        ['l h'] = { 919, 943, 992, 1015 },
+        ['l i'] = { 920, 952, 965, 969, 1017 },
+        ['l j'] = { 1015 },
+        ['l m'] = { 937, 994 },
+        ['l n'] = { 896, 904, 922, 925, 934, 961, 968, 976, 977, 987, 995, 1003, 1015, 1017, 1019 },
+        ['l o'] = { 989 },
+        ['l p'] = { 922, 958, 959 },
+        ['l r'] = { 1019 },
+        ['l s'] = { 905, 906, 919, 995, 1003, 1015 },
+        ['l t'] = { 977, 995 },
+        ['l u'] = { 913, 1011 },
+        ['l v'] = { 920, 952, 965, 969, 1015, 1017 },
+        ["l'"] = { 914, 1017 },
+        ["l's"] = { 914, 1017 },
+        ['l-'] = { 976, 977 },
+        ['l-a'] = { 977 },
+        ['l-p'] = { 976 },
+        ['l/'] = { 898, 909, 916, 936, 953, 955, 998 },
+        ['l/r'] = { 898, 909, 916, 936, 953, 955, 998 },
+        ['l:'] = { 971 },
+        ['l:w'] = { 971 },
+        ['la'] = { 896, 897, 899, 901, 902, 903, 904, 905, 906, 907, 909, 910, 911, 912, 914, 916, 919, 920, 922, 925, 926, 934, 939, 940, 942, 943, 948, 949, 951, 952, 953, 957, 959, 960, 961, 965, 966, 967, 968, 969, 971, 972, 973, 974, 975, 976, 977, 979, 980, 981, 982, 983, 984, 985, 986, 987, 988, 989, 990, 992, 993, 994, 995, 998, 999, 1003, 1004, 1005, 1008, 1009, 1010, 1015, 1017, 1018, 1019 },
+        ['la '] = { 1017 },
+        ['lab'] = { 984 },
+        ['lac'] = { 896, 904, 909, 912, 916, 919, 922, 925, 934, 961, 968, 974, 976, 977, 980, 983, 985, 986, 987, 988, 995, 1003, 1008, 1015, 1017, 1019 },
+        ['lad'] = { 897, 899, 902, 903, 905, 910, 911, 914, 920, 926, 939, 942, 948, 949, 951, 953, 960, 965, 966, 967, 971, 972, 973, 974, 975, 979, 984, 985, 986, 990, 992, 993, 998, 999, 1003, 1004, 1005 },
+        ['laf'] = { 940 },
+        ['lah'] = { 912, 982, 1008 },
+        ['lai'] = { 910 },
+        ['lam'] = { 901, 919, 949, 983, 988, 994 },
+        ['lan'] = { 907, 910, 920, 951, 952, 959, 969, 979, 981, 989, 993, 1009 },
+        ['lap'] = { 925 },
+        ['lar'] = { 919, 940, 948, 968, 971, 1018 },
+        ['las'] = { 899, 902, 905, 906, 910, 926, 951, 960, 969, 972, 973, 974, 977, 983, 984, 988, 993, 995, 1010 },
+        ['lat'] = { 909, 953, 965, 969, 979, 980, 985 },
+        ['lau'] = { 943, 983 },
+        ['lav'] = { 957 },
+        ['lay'] = { 969 },
+        ['laz'] = { 919 },
+        ['lb'] = { 926, 946 },
+        ['lbr'] = { 946 },
+        ['ld'] = { 905, 911, 917, 926, 930, 951, 954, 958, 969, 971, 984, 985, 993, 1007 },
+        ['ld '] = { 905, 917, 926, 951, 954, 958, 993 },
+        ['ld/'] = { 911 },
+        ['lda'] = { 971 },
+        ['lde'] = { 969 },
+        ['ldo'] = { 930, 1007 },
+        ['ldw'] = { 985 },
+        ['le'] = { 896, 897, 898, 899, 900, 901, 903, 904, 906, 907, 908, 909, 910, 911, 912, 913, 915, 916, 917, 920, 922, 923, 924, 925, 926, 928, 929, 930, 931, 932, 933, 934, 936, 937, 938, 939, 940, 941, 942, 943, 944, 945, 946, 947, 948, 949, 953, 954, 955, 956, 957, 958, 959, 960, 961, 962, 963, 964, 965, 966, 967, 968, 969, 971, 972, 973, 974, 975, 976, 977, 979, 980, 982, 983, 984, 986, 987, 989, 990, 991, 993, 994, 995, 996, 997, 998, 999, 1003, 1004, 1005, 1006, 1007, 1008, 1009, 1010, 1011, 1012, 1013, 1015, 1016, 1017, 1018, 1019 },
+        ['le '] = { 899, 910, 913, 928, 929, 940, 941, 954, 960, 962, 967, 969, 984, 989, 1004, 1011, 1015, 1016, 1017 },
+        ['le-'] = { 896, 904, 922, 925, 934, 961, 967, 968, 976, 977, 987, 995, 1003, 1015, 1019 },
+        ['lea'] = { 906, 928, 958, 974, 995, 1010 },
+        ['lee'] = { 897, 899, 900, 901, 903, 906, 907, 908, 912, 913, 915, 917, 920, 922, 923, 924, 928, 930, 932, 933, 937, 938, 939, 942, 943, 945, 946, 947, 948, 949, 954, 956, 957, 958, 959, 961, 963, 964, 966, 971, 972, 973, 975, 976, 979, 982, 983, 986, 990, 991, 994, 995, 996, 997, 1003, 1004, 1005, 1006, 1007, 1008, 1009, 1010, 1011, 1012, 1013, 1016, 1018 },
+        ['lef'] = { 911 },
+        ['leg'] = { 899, 911, 987 },
+        ['leh'] = { 922 },
+        ['lem'] = { 896, 904, 910, 922, 925, 934, 936, 960, 961, 968, 969, 976, 977, 984, 987, 993, 995, 1003, 1015, 1017, 1019 },
+        ['len'] = { 916, 925, 926, 946, 959, 968, 987, 990 },
+        ['leo'] = { 974 },
+        ['ler'] = { 898, 909, 916, 933, 936, 944, 953, 955, 974, 980, 998, 999 },
+        ['les'] = { 909, 933, 964, 997, 998, 1016, 1019 },
+        ['lf'] = { 1016 },
+        ['lf-'] = { 1016 },
+        ['lg'] = { 938, 962 },
+        ['lga'] = { 938 },
+        ['lge'] = { 962 },
+        ['lh'] = { 943, 964, 968, 979 },
+        ["lh'"] = { 979 },
+        ['lha'] = { 964 },
+        ['lhe'] = { 964, 968 },
+        ['lhu'] = { 943 },
+        ['li'] = { 898, 903, 905, 907, 909, 910, 913, 915, 924, 926, 929, 932, 933, 936, 937, 941, 945, 947, 951, 953, 954, 957, 965, 966, 967, 968, 969, 971, 974, 975, 984, 988, 990, 991, 993, 994, 1002, 1009, 1011, 1013, 1016, 1017 },
+        ['li '] = { 909 },
+        ['lia'] = { 903, 909, 954, 969, 975, 1002 },
+        ['lic'] = { 968 },
+        ['lid'] = { 957 },
+        ['lif'] = { 913, 1011 },
+        ['lig'] = { 898, 910, 951, 953, 965, 967, 971, 990, 993, 1016, 1017 },
+        ['lih'] = { 947 },
+        ['lil'] = { 945, 1013 },
+        ['lim'] = { 966 },
+        ['lin'] = { 915, 924, 932, 933, 936, 937, 945, 947, 968, 988, 991, 1013 },
+        ['lio'] = { 907, 1009 },
+        ['lip'] = { 926 },
+        ['lis'] = { 905, 910, 945, 984, 993, 1013 },
+        ['lit'] = { 929, 941, 994 },
+        ['liv'] = { 941 },
+        ['liz'] = { 974 },
+        ['lk'] = { 903, 907, 991, 1009 },
+        ['lk '] = { 907, 1009 },
+        ['lke'] = { 903 },
+        ['lki'] = { 991 },
+        ['ll'] = { 898, 899, 902, 906, 909, 911, 913, 914, 915, 916, 919, 920, 923, 930, 933, 934, 936, 940, 942, 944, 946, 952, 953, 955, 958, 961, 965, 967, 969, 971, 974, 977, 980, 981, 983, 984, 986, 987, 988, 989, 995, 996, 997, 998, 1003, 1004, 1006, 1007, 1011, 1012, 1015, 1017, 1018 },
+        ['ll '] = { 920, 952, 965, 969, 977, 984, 1015, 1017 },
+        ['ll/'] = { 898, 909, 916, 936, 953, 955, 998 },
+        ['lla'] = { 902, 911, 914, 940, 965, 969, 971 },
+        ['llb'] = { 946 },
+        ['lle'] = { 899, 933, 958, 974, 987, 1004 },
+        ['lli'] = { 913, 988, 1011 },
+        ['llo'] = { 934, 995, 1006 },
+        ['llr'] = { 980, 997, 1018 },
+        ['lls'] = { 898, 906, 909, 911, 915, 920, 923, 936, 944, 953, 955, 961, 969, 980, 981, 983, 986, 989, 998, 1012, 1015 },
+        ['llu'] = { 942, 965, 1015 },
+        ['lly'] = { 930, 1007 },
+        ['lm'] = { 914, 933, 984 },
+        ['lm '] = { 933 },
+        ['lmi'] = { 914, 984 },
+        ['ln'] = { 991 },
+        ['lo'] = { 897, 898, 902, 904, 905, 909, 911, 912, 914, 916, 917, 920, 925, 926, 929, 930, 934, 939, 946, 947, 948, 952, 954, 956, 959, 964, 965, 966, 973, 982, 987, 994, 995, 999, 1006, 1008, 1015, 1017 },
+        ['lo '] = { 956 },
+        ['loa'] = { 930 },
+        ['loc'] = { 930 },
+        ['lon'] = { 917, 929, 954 },
+        ['loo'] = { 939, 954 },
+        ['lor'] = { 911, 914, 926, 948 },
+        ['lot'] = { 897, 902, 905, 920, 934, 973, 995 },
+        ['lou'] = { 946, 947, 966, 973, 994 },
+        ['lov'] = { 1015 },
+        ['low'] = { 898, 904, 909, 916, 925, 952, 959, 964, 965, 982, 987, 999, 1006, 1017 },
+        ['lr'] = { 910, 960, 980, 993, 997, 1018 },
+        ['lra'] = { 980, 997, 1018 },
+        ['lry'] = { 910, 960, 993 },
+        ['ls'] = { 898, 906, 909, 911, 915, 920, 923, 936, 944, 953, 955, 957, 961, 969, 972, 980, 981, 983, 986, 989, 998, 1012, 1015 },
+        ['ls '] = { 1015 },
+        ['lse'] = { 915, 957, 969, 972 },
+        ['lt'] = { 910, 940, 945, 947, 961, 962, 967, 976, 977, 986, 1013, 1015 },
+        ['lta'] = { 967 },
+        ['lth'] = { 940, 962 },
+        ['lti'] = { 961, 976 },
+        ['lty'] = { 910 },
+        ['ltz'] = { 945, 947, 1013, 1015 },
+        ['lu'] = { 906, 914, 922, 928, 936, 940, 941, 942, 952, 965, 969, 979, 989, 990, 1015, 1017 },
+        ['lud'] = { 906, 914, 989 },
+        ['lug'] = { 941 },
+        ['lum'] = { 979 },
+        ['lun'] = { 922, 936, 969 },
+        ['lur'] = { 942, 952, 1017 },
+        ['lus'] = { 965, 1015 },
+        ['lut'] = { 922, 928, 990 },
+        ['lux'] = { 940 },
+        ['luz'] = { 928 },
+        ['lv'] = { 934, 972, 981 },
+        ['lva'] = { 934 },
+        ['lve'] = { 972 },
+        ['lvi'] = { 981 },
+        ['ly'] = { 898, 904, 909, 916, 925, 928, 930, 949, 959, 960, 965, 968, 984, 986, 995, 1004, 1007, 1015, 1016, 1017 },
+        ['ly '] = { 928, 960, 984, 1015 },
+        ['lys'] = { 959 },
+        ['lyz'] = { 898, 904, 909, 916, 925, 949, 965, 968, 995, 1004, 1017 },
+        ['m'] = { 896, 897, 898, 899, 900, 901, 903, 904, 906, 907, 908, 909, 910, 911, 912, 913, 914, 915, 916, 917, 918, 919, 920, 921, 922, 923, 924, 925, 926, 927, 928, 929, 930, 931, 932, 933, 934, 935, 936, 937, 938, 939, 940, 942, 943, 944, 945, 946, 947, 948, 949, 950, 952, 953, 954, 955, 956, 957, 958, 959, 960, 961, 962, 963, 964, 965, 966, 968, 969, 970, 971, 972, 973, 974, 975, 976, 977, 978, 979, 980, 981, 982, 983, 984, 985, 986, 987, 988, 989, 990, 991, 992, 993, 994, 995, 996, 997, 998, 999, 1002, 1003, 1004, 1005, 1006, 1007, 1008, 1009, 1010, 1011, 1012, 1013, 1014, 1015, 1016, 1017, 1018, 1019 },
+        ['m '] = { 930, 933, 982, 986, 1008, 1018 },
+        ['m ('] = { 1008 },
+        ['m a'] = { 1018 },
+        ['m e'] = { 930 },
+        ['m p'] = { 933 },
+        ['m s'] = { 982, 986 },
+        ['m.'] = { 965, 976, 987 },
+        ['m.a'] = { 965, 987 },
+        ['m.d'] = { 965, 976 },
+        ['m.e'] = { 976 },
+        ['m:'] = { 968 },
+        ['m: '] = { 968 },
+        ['ma'] = { 896, 898, 904, 908, 909, 910, 911, 913, 914, 915, 916, 919, 920, 921, 922, 923, 925, 927, 931, 932, 933, 934, 935, 936, 937, 938, 943, 944, 949, 950, 952, 953, 954, 955, 959, 961, 962, 965, 966, 968, 970, 971, 974, 975, 976, 977, 978, 980, 981, 983, 985, 986, 987, 988, 989, 990, 991, 993, 994, 995, 996, 997, 998, 1002, 1003, 1006, 1011, 1012, 1015, 1016, 1017, 1018, 1019 },
+        ['ma,'] = { 1011 },
+        ['maa'] = { 933, 949, 1006 },
+        ['mac'] = { 966 },
+        ['mad'] = { 911, 914 },
+        ['mag'] = { 896, 898, 904, 909, 911, 913, 914, 915, 916, 919, 920, 921, 922, 923, 925, 932, 934, 936, 944, 952, 953, 955, 959, 961, 965, 968, 971, 974, 976, 977, 980, 981, 983, 985, 986, 987, 988, 989, 991, 993, 995, 996, 997, 998, 1003, 1011, 1012, 1015, 1016, 1017, 1018, 1019 },
+        ['mah'] = { 954 },
+        ['mai'] = { 908, 938 },
+        ['maj'] = { 910 },
+        ['mak'] = { 988 },
+        ['man'] = { 919, 927, 931, 933, 935, 950, 970, 978, 981, 1002, 1003 },
+        ['mar'] = { 904, 911, 914, 920, 955, 962, 990 },
+        ['mas'] = { 923, 937, 943, 990, 994, 1012 },
+        ['mat'] = { 908, 943, 985, 997, 1003, 1018 },
+        ['max'] = { 975 },
+        ['may'] = { 966 },
+        ['mb'] = { 910, 928, 932, 933, 945, 946, 947, 948, 960, 966, 969, 982, 984, 993, 998, 1013, 1015 },
+        ['mb '] = { 932 },
+        ['mba'] = { 945, 946, 947, 966, 1013, 1015 },
+        ['mbl'] = { 910, 948, 960, 984, 993 },
+        ['mbo'] = { 928, 933, 969, 982, 998 },
+        ['mc'] = { 969 },
+        ['mch'] = { 969 },
+        ['me'] = { 896, 897, 899, 900, 901, 903, 904, 906, 907, 908, 912, 913, 915, 917, 919, 920, 921, 922, 923, 924, 925, 926, 928, 930, 932, 933, 934, 936, 937, 938, 939, 942, 943, 945, 946, 947, 948, 949, 954, 956, 957, 958, 959, 961, 963, 964, 966, 968, 969, 971, 972, 973, 975, 976, 977, 979, 981, 982, 983, 986, 987, 990, 991, 994, 995, 996, 997, 1003, 1004, 1005, 1006, 1007, 1008, 1009, 1010, 1011, 1012, 1013, 1015, 1016, 1017, 1018, 1019 },
+        ['me '] = { 997, 1005 },
+        ['med'] = { 900, 908, 942, 996, 997, 1005, 1018 },
+        ['mei'] = { 923, 1012 },
+        ['mel'] = { 897, 899, 900, 901, 903, 906, 907, 908, 912, 913, 915, 917, 920, 922, 923, 924, 928, 930, 932, 933, 937, 938, 939, 942, 943, 945, 946, 947, 948, 949, 954, 956, 957, 958, 959, 963, 964, 966, 971, 972, 973, 975, 979, 982, 983, 986, 990, 991, 994, 996, 997, 1003, 1004, 1005, 1006, 1007, 1008, 1009, 1010, 1011, 1012, 1013, 1016, 1018 },
+        ['mem'] = { 987 },
+        ['men'] = { 896, 904, 921, 922, 925, 934, 936, 947, 957, 961, 968, 969, 976, 977, 981, 987, 990, 995, 1003, 1015, 1016, 1017, 1019 },
+        ['mer'] = { 926, 1015, 1016 },
+        ['mes'] = { 938 },
+        ['met'] = { 924, 987 },
+        ['mh'] = { 943, 958 },
+        ['mha'] = { 943 },
+        ['mhe'] = { 958 },
+        ['mi'] = { 899, 901, 909, 911, 914, 918, 934, 940, 949, 953, 966, 968, 969, 971, 975, 979, 984, 988, 992, 993, 994, 999, 1003, 1004, 1006, 1009, 1015 },
+        ['mi:'] = { 918, 992, 1003, 1009 },
+        ['mia'] = { 914 },
+        ['mic'] = { 968 },
+        ['mid'] = { 969 },
+        ['mig'] = { 992, 1003 },
+        ['mih'] = { 901, 909, 940, 949 },
+        ['mil'] = { 899, 971, 975, 1004 },
+        ['min'] = { 911, 914, 934, 966, 979, 984, 988, 993 },
+        ['mir'] = { 1015 },
+        ['mis'] = { 953, 999 },
+        ['mit'] = { 918, 994, 1006 },
+        ['mix'] = { 999 },
+        ['ml'] = { 933, 964 },
+        ['mle'] = { 933, 964 },
+        ['mm'] = { 907, 936, 976, 977, 1009, 1015 },
+        ['mme'] = { 907, 1009, 1015 },
+        ['mmo'] = { 936, 976, 977 },
+        ['mn'] = { 926, 1017 },
+        ['mne'] = { 926, 1017 },
+        ['mo'] = { 898, 912, 913, 914, 917, 924, 931, 933, 936, 946, 952, 953, 958, 959, 960, 964, 969, 976, 977, 982, 983, 986, 987, 990, 995, 999, 1006, 1008, 1011, 1015, 1016, 1017 },
+        ['moc'] = { 986 },
+        ['mon'] = { 912, 913, 924, 933, 936, 958, 959, 964, 976, 977, 982, 995, 999, 1006, 1008, 1011, 1017 },
+        ['moo'] = { 898, 931, 936, 953, 960, 969, 1016 },
+        ['mor'] = { 917, 946, 952, 983, 987, 990, 1015 },
+        ['mp'] = { 901, 910, 915, 920, 922, 923, 924, 929, 943, 949, 957, 964, 972, 977, 979, 988, 989, 993, 994, 996, 1006, 1012, 1017, 1018, 1019 },
+        ['mp '] = { 922, 977, 1018 },
+        ['mp+'] = { 979 },
+        ['mpa'] = { 910, 924, 943, 972, 993, 994 },
+        ['mpe'] = { 923, 964, 989, 1006, 1012 },
+        ['mpi'] = { 1019 },
+        ['mpo'] = { 920 },
+        ['mpu'] = { 915, 957, 972 },
+        ['mpy'] = { 929, 988 },
+        ['mr'] = { 994 },
+        ['ms'] = { 968 },
+        ['mu'] = { 900, 908, 938, 942, 946, 961, 971, 976, 979, 996, 997, 1003, 1005, 1014, 1015, 1018 },
+        ['mud'] = { 1005 },
+        ['mul'] = { 961, 976 },
+        ['mum'] = { 946, 1015 },
+        ['mur'] = { 900, 908, 938, 942, 971, 979, 996, 997, 1005, 1014, 1018 },
+        ['mw'] = { 925 },
+        ['mwa'] = { 925 },
+        ['my'] = { 911, 1003 },
+        ["my'"] = { 911 },
+        ['myo'] = { 1003 },
+        ['n'] = { 896, 897, 898, 899, 900, 901, 902, 903, 904, 905, 906, 907, 908, 909, 910, 911, 912, 913, 914, 915, 916, 917, 918, 919, 920, 921, 922, 923, 924, 925, 926, 927, 928, 929, 930, 931, 932, 933, 934, 935, 936, 937, 938, 939, 940, 941, 942, 943, 944, 945, 946, 947, 949, 950, 951, 952, 953, 954, 955, 956, 957, 958, 959, 960, 961, 962, 963, 964, 965, 966, 967, 968, 969, 970, 971, 972, 973, 974, 975, 976, 977, 978, 979, 980, 981, 982, 983, 984, 985, 986, 987, 988, 989, 990, 991, 992, 993, 994, 995, 996, 997, 998, 999, 1002, 1003, 1004, 1005, 1006, 1007, 1008, 1009, 1010, 1011, 1012, 1013, 1014, 1015, 1016, 1017, 1018, 1019 },
+        ['n '] = { 911, 915, 916, 917, 924, 928, 932, 933, 934, 939, 945, 946, 947, 950, 958, 960, 964, 966, 969, 972, 974, 980, 983, 986, 993, 995, 1009, 1014, 1017, 1019 },
+        ['n ('] = { 960, 980 },
+        ['n b'] = { 939 },
+        ['n c'] = { 986 },
+        ['n d'] = { 945, 995 },
+        ['n e'] = { 917 },
+        ['n f'] = { 924, 933, 964 },
+        ['n h'] = { 950, 983, 1017 },
+        ['n i'] = { 911, 916, 969, 1009, 1014, 1019 },
+        ['n k'] = { 924, 933, 964 },
+        ['n m'] = { 958 },
+        ['n p'] = { 1019 },
+        ['n r'] = { 932 },
+        ['n s'] = { 928, 934, 946, 947, 966, 974, 993 },
+        ['n t'] = { 915, 972 },
+        ['n v'] = { 911 },
+        ["n'"] = { 930, 957 },
+        ["n's"] = { 930, 957 },
+        ['n,'] = { 949, 1017 },
+        ['n, '] = { 949, 1017 },
+        ['n-'] = { 980, 996 },
+        ['n-i'] = { 996 },
+        ['n-o'] = { 980 },
+        ['n/'] = { 906 },
+        ['n/a'] = { 906 },
+        ['n:'] = { 1003 },
+        ['n: '] = { 1003 },
+        ['na'] = { 897, 898, 901, 907, 908, 909, 911, 912, 915, 921, 922, 923, 926, 929, 930, 933, 934, 936, 939, 940, 941, 944, 949, 950, 953, 955, 959, 960, 963, 965, 967, 979, 980, 981, 985, 989, 992, 993, 997, 998, 1003, 1008, 1012, 1015, 1016, 1017, 1018, 1019 },
+        ['na '] = { 898, 909, 911, 915, 923, 934, 936, 944, 953, 955, 980, 981, 989, 998, 1003, 1012, 1015 },
+        ['naa'] = { 901, 1017 },
+        ['nac'] = { 941 },
+        ['nad'] = { 997, 1018 },
+        ['nag'] = { 911, 930 },
+        ['nai'] = { 908, 922 },
+        ['naj'] = { 897, 912, 929, 1008 },
+        ['nak'] = { 967 },
+        ['nal'] = { 907, 922, 926, 929, 933, 939, 949, 959, 960, 963, 992, 1015, 1016, 1019 },
+        ['nan'] = { 901 },
+        ['nar'] = { 922, 936 },
+        ['nas'] = { 923, 965, 998, 1012 },
+        ['nat'] = { 967, 979, 985, 993 },
+        ['nb'] = { 936, 976, 999 },
+        ['nbe'] = { 999 },
+        ['nbu'] = { 936, 976 },
+        ['nc'] = { 901, 906, 911, 912, 914, 915, 916, 925, 926, 927, 931, 933, 935, 945, 946, 947, 950, 953, 954, 955, 956, 957, 959, 966, 968, 969, 970, 976, 978, 979, 980, 981, 987, 990, 993, 999, 1002, 1005, 1006, 1007, 1008, 1013, 1015, 1017, 1018 },
+        ['nca'] = { 993 },
+        ['nce'] = { 912, 916, 925, 926, 927, 931, 935, 945, 946, 947, 950, 959, 966, 969, 970, 978, 979, 981, 987, 990, 993, 999, 1002, 1006, 1013, 1015, 1017, 1018 },
+        ['nch'] = { 933 },
+        ['nci'] = { 901, 911, 914, 915, 954, 956, 968, 976 },
+        ['ncl'] = { 906 },
+        ['nco'] = { 953, 954, 955, 956, 957, 980, 981, 1005, 1006, 1007, 1008 },
+        ['nct'] = { 953 },
+        ['nd'] = { 903, 906, 910, 913, 919, 929, 930, 940, 944, 956, 960, 962, 963, 964, 968, 971, 981, 982, 985, 988, 996, 1010, 1011, 1016 },
+        ['nd '] = { 906, 930, 960, 964, 982, 1010 },
+        ['nda'] = { 906, 956 },
+        ['nde'] = { 903, 910, 919, 929, 940, 962, 988 },
+        ['ndg'] = { 944 },
+        ['ndi'] = { 968, 981, 985, 1016 },
+        ['ndu'] = { 968 },
+        ['ndw'] = { 913, 1011 },
+        ['ne'] = { 899, 902, 905, 906, 910, 911, 914, 917, 918, 920, 926, 927, 929, 930, 931, 933, 934, 935, 936, 939, 945, 949, 950, 951, 954, 955, 956, 960, 969, 970, 972, 974, 976, 977, 978, 980, 984, 985, 986, 992, 993, 994, 995, 997, 999, 1002, 1004, 1007, 1015, 1016, 1017, 1018 },
+        ['ne '] = { 910, 911, 918, 939, 945, 960, 969, 974, 984, 985, 993, 997, 999 },
+        ['ne-'] = { 933 },
+        ['nea'] = { 930, 949, 956, 994, 1007 },
+        ['nef'] = { 985 },
+        ['nej'] = { 926 },
+        ['nel'] = { 899, 902, 905, 910, 914, 951, 960, 972, 984, 993, 1002 },
+        ['nem'] = { 920 },
+        ['neo'] = { 1015 },
+        ['ner'] = { 910, 936, 976, 977, 986 },
+        ['nes'] = { 905, 955, 969, 980, 1016, 1017, 1018 },
+        ['net'] = { 906 },
+        ['neu'] = { 984, 1017 },
+        ['nex'] = { 1016 },
+        ['nf'] = { 996 },
+        ['nfa'] = { 996 },
+        ['ng'] = { 896, 897, 901, 904, 909, 910, 911, 913, 914, 915, 919, 920, 921, 922, 924, 925, 926, 929, 933, 934, 936, 937, 939, 940, 941, 943, 945, 947, 954, 956, 957, 961, 962, 963, 964, 965, 966, 967, 968, 969, 973, 976, 977, 981, 983, 984, 987, 988, 989, 991, 992, 993, 994, 995, 996, 997, 998, 1003, 1004, 1005, 1011, 1013, 1014, 1015, 1016, 1017, 1019 },
+        ['ng '] = { 897, 901, 909, 913, 915, 919, 920, 924, 926, 933, 936, 940, 943, 945, 947, 954, 956, 962, 964, 965, 966, 967, 968, 983, 988, 989, 991, 997, 1011, 1013, 1015, 1017 },
+        ['ng/'] = { 911, 914 },
+        ['nga'] = { 964 },
+        ['ngb'] = { 1004 },
+        ['nge'] = { 929, 937, 940, 941, 962, 963, 967, 969, 973, 988, 992, 993, 994, 995, 996, 1003, 1014, 1017 },
+        ['ngi'] = { 1005 },
+        ['ngl'] = { 896, 904, 922, 925, 934, 961, 968, 976, 977, 987, 995, 1003, 1015, 1017, 1019 },
+        ['ngo'] = { 957 },
+        ['ngr'] = { 921, 1016 },
+        ['ngs'] = { 937, 984 },
+        ['ngu'] = { 910, 973, 981 },
+        ['nh'] = { 969 },
+        ['nha'] = { 969 },
+        ['ni'] = { 897, 906, 911, 914, 918, 919, 920, 921, 928, 929, 930, 932, 934, 943, 953, 954, 955, 956, 957, 967, 975, 980, 981, 983, 985, 986, 987, 992, 993, 995, 997, 1003, 1005, 1006, 1007, 1008, 1009, 1010, 1011, 1015, 1016, 1017 },
+        ['nic'] = { 929, 1017 },
+        ['nif'] = { 1017 },
+        ['nig'] = { 906, 911, 934, 983, 985, 986, 987, 995, 1010, 1015 },
+        ['nim'] = { 1011 },
+        ['nin'] = { 897, 918, 919, 920, 928, 930, 943, 967, 975, 992, 1003, 1007, 1009, 1015 },
+        ['nio'] = { 993 },
+        ['nip'] = { 967 },
+        ['niq'] = { 930, 992 },
+        ['nis'] = { 914, 921, 1016 },
+        ['nit'] = { 953, 954, 955, 956, 957, 980, 981, 1005, 1006, 1007, 1008 },
+        ['nix'] = { 932, 997 },
+        ['nj'] = { 918, 928, 930, 975, 992, 1003, 1007, 1009 },
+        ['nja'] = { 918, 928, 930, 975, 992, 1003, 1007, 1009 },
+        ['nju'] = { 1003 },
+        ['nk'] = { 902, 905, 907, 910, 912, 913, 918, 924, 926, 933, 951, 958, 959, 960, 964, 969, 982, 984, 992, 993, 1006, 1008, 1009, 1011 },
+        ['nk '] = { 959 },
+        ['nl'] = { 898, 910, 951, 953, 986, 993, 1015, 1016 },
+        ['nli'] = { 898, 910, 951, 953, 993, 1016 },
+        ['nly'] = { 986, 1015 },
+        ['nm'] = { 899, 1004 },
+        ['nmi'] = { 899, 1004 },
+        ['nn'] = { 911, 919, 943, 950, 986, 992, 1003 },
+        ['nna'] = { 950 },
+        ['nne'] = { 911, 986 },
+        ['nni'] = { 919, 943, 992, 1003 },
+        ['no'] = { 918, 925, 927, 931, 935, 938, 942, 950, 953, 955, 970, 971, 974, 978, 979, 980, 981, 984, 986, 996, 1002, 1008 },
+        ['no '] = { 918, 984 },
+        ['nob'] = { 984 },
+        ['noc'] = { 925, 971 },
+        ['noi'] = { 942 },
+        ['nok'] = { 938, 942, 996 },
+        ['non'] = { 927, 931, 935, 950, 970, 978, 1002 },
+        ['not'] = { 953, 955, 980, 981, 1008 },
+        ['nou'] = { 979, 984, 986 },
+        ['noy'] = { 974 },
+        ['np'] = { 900, 918, 942, 1005 },
+        ['npi'] = { 900 },
+        ['npu'] = { 900, 942, 1005 },
+        ['npy'] = { 918 },
+        ['ns'] = { 896, 904, 909, 919, 920, 921, 922, 925, 934, 943, 945, 956, 961, 968, 974, 976, 977, 985, 987, 995, 1015, 1017, 1019 },
+        ['nse'] = { 1017 },
+        ['nsh'] = { 909 },
+        ['nsi'] = { 896, 904, 919, 921, 925, 934, 961, 968, 974, 976, 977, 985, 987, 995, 1015, 1017, 1019 },
+        ['nsl'] = { 943 },
+        ['nsp'] = { 920, 922, 956 },
+        ['nsu'] = { 945 },
+        ['nt'] = { 896, 899, 902, 904, 905, 910, 912, 914, 915, 917, 921, 922, 925, 933, 934, 936, 946, 947, 949, 951, 954, 956, 957, 958, 959, 960, 961, 962, 967, 968, 969, 972, 976, 977, 981, 982, 984, 987, 990, 992, 993, 995, 1003, 1006, 1015, 1016, 1017, 1019 },
+        ['nt '] = { 915, 946, 962, 969, 976, 990, 992, 993 },
+        ['nta'] = { 896, 899, 904, 922, 925, 934, 961, 968, 972, 976, 977, 987, 995, 1003, 1015, 1017, 1019 },
+        ['nte'] = { 912, 914, 933, 967, 1006 },
+        ['nth'] = { 958 },
+        ['nti'] = { 899, 902, 905, 910, 914, 951, 959, 960, 972, 984, 993 },
+        ['nto'] = { 896, 934, 987, 990, 1019 },
+        ['ntr'] = { 933, 936, 981 },
+        ['nts'] = { 958, 1015 },
+        ['nu'] = { 896, 904, 911, 913, 914, 922, 925, 934, 938, 961, 968, 976, 977, 984, 987, 995, 1003, 1011, 1015, 1017, 1019 },
+        ['nuc'] = { 913, 1011 },
+        ['nue'] = { 911, 914 },
+        ['nuk'] = { 896, 904, 922, 925, 934, 938, 961, 968, 976, 977, 987, 995, 1003, 1015, 1017, 1019 },
+        ['nul'] = { 913, 977, 984, 1011 },
+        ['nv'] = { 952, 954, 955, 987 },
+        ['nve'] = { 952, 955 },
+        ['nvi'] = { 954 },
+        ['nvo'] = { 987 },
+        ['nw'] = { 932 },
+        ['nwa'] = { 932 },
+        ['nx'] = { 910, 920, 951, 952, 969, 989, 993 },
+        ['nx '] = { 952 },
+        ['nz'] = { 908, 959, 984, 986, 996, 1014 },
+        ['nze'] = { 908, 996, 1014 },
+        ['nzi'] = { 959, 986 },
+        ['nzy'] = { 984 },
+        ['o'] = { 896, 897, 898, 899, 900, 901, 902, 903, 904, 905, 906, 907, 908, 909, 910, 911, 912, 913, 914, 915, 916, 917, 918, 919, 920, 921, 922, 923, 924, 925, 926, 927, 928, 929, 930, 931, 932, 933, 934, 935, 936, 937, 938, 939, 940, 941, 942, 943, 944, 945, 946, 947, 948, 949, 950, 951, 952, 953, 954, 955, 956, 957, 958, 959, 960, 961, 962, 963, 964, 965, 966, 967, 968, 969, 970, 971, 972, 973, 974, 975, 976, 977, 978, 979, 980, 981, 982, 983, 984, 985, 986, 987, 988, 989, 990, 991, 992, 993, 994, 995, 996, 997, 998, 999, 1002, 1003, 1004, 1005, 1006, 1007, 1008, 1009, 1010, 1011, 1012, 1013, 1014, 1015, 1016, 1017, 1018, 1019 },
+        ['o '] = { 918, 922, 928, 956, 958, 977, 984, 987, 990, 1007, 1015, 1019 },
+        ['o ('] = { 956, 1007 },
+        ['o a'] = { 1015 },
+        ['o c'] = { 1015 },
+        ['o d'] = { 977 },
+        ['o h'] = { 918, 922 },
+        ['o i'] = { 1019 },
+        ['o m'] = { 918, 987 },
+        ['o n'] = { 918 },
+        ['o p'] = { 918 },
+        ['o q'] = { 984 },
+        ['o s'] = { 918, 928 },
+        ['o t'] = { 987, 990 },
+        ['o z'] = { 958 },
+        ['o)'] = { 958 },
+        ['o) '] = { 958 },
+        ['o-'] = { 904 },
+        ['o-m'] = { 904 },
+        ['o:'] = { 918, 992 },
+        ['o: '] = { 918, 992 },
+        ['oa'] = { 911, 930, 958, 1011 },
+        ['oac'] = { 911 },
+        ['oad'] = { 930 },
+        ['oan'] = { 1011 },
+        ['oat'] = { 958 },
+        ['ob'] = { 900, 901, 908, 918, 926, 932, 949, 977, 984 },
+        ['oba'] = { 900, 918 },
+        ['obe'] = { 926, 977 },
+        ['obl'] = { 932, 984 },
+        ['obo'] = { 908 },
+        ['obr'] = { 901, 949 },
+        ['oc'] = { 912, 924, 925, 930, 963, 964, 971, 974, 986, 994, 1019 },
+        ['oc '] = { 994 },
+        ['ock'] = { 925, 930, 963, 971, 974 },
+        ['ocl'] = { 986 },
+        ['oct'] = { 1019 },
+        ['ocu'] = { 912, 924, 964 },
+        ['od'] = { 912, 939, 954, 964, 985, 986 },
+        ['od '] = { 939, 954, 985 },
+        ['odg'] = { 912, 964 },
+        ['odo'] = { 986 },
+        ['oe'] = { 901, 907, 909, 910, 918, 919, 922, 926, 929, 930, 932, 936, 937, 938, 939, 940, 945, 948, 949, 958, 959, 960, 965, 968, 971, 973, 976, 977, 985, 987, 989, 990, 991, 993, 994, 995, 996, 997, 998, 1004, 1015, 1018 },
+        ['oe '] = { 919, 922, 959, 965, 971, 976, 977, 987, 996, 1018 },
+        ["oe'"] = { 958 },
+        ['oe,'] = { 926, 949 },
+        ['oen'] = { 997 },
+        ['of'] = { 896, 904, 919, 921, 925, 934, 944, 961, 965, 968, 974, 976, 977, 978, 983, 985, 986, 987, 989, 990, 995, 997, 1015, 1019 },
+        ['of '] = { 934, 965, 976, 983, 989, 990, 997 },
+        ['off'] = { 896, 904, 919, 921, 925, 934, 944, 961, 968, 974, 976, 977, 985, 986, 987, 995, 1015, 1019 },
+        ['ofr'] = { 978 },
+        ['og'] = { 930, 931, 993 },
+        ['oga'] = { 993 },
+        ['ogl'] = { 931 },
+        ['ogr'] = { 930 },
+        ['oh'] = { 909, 956, 997, 1018 },
+        ['oh '] = { 956 },
+        ['oha'] = { 997, 1018 },
+        ['oi'] = { 901, 906, 942, 969, 995, 1014 },
+        ['oid'] = { 906 },
+        ['oil'] = { 901, 942, 969 },
+        ['ois'] = { 995, 1014 },
+        ['oj'] = { 918, 992 },
+        ['ojo'] = { 918, 992 },
+        ['ok'] = { 897, 900, 903, 905, 910, 917, 918, 922, 926, 938, 942, 948, 951, 954, 964, 967, 969, 972, 984, 992, 996, 997, 1005, 1018 },
+        ['oka'] = { 922 },
+        ['oke'] = { 897, 903, 905, 910, 917, 918, 926, 948, 951, 954, 964, 967, 969, 972, 984, 992 },
+        ['oki'] = { 900, 938, 942, 996, 997, 1005, 1018 },
+        ['ol'] = { 903, 909, 922, 946, 960, 967, 968, 969, 980, 984, 990, 998, 1006, 1016 },
+        ['ola'] = { 909, 968, 980 },
+        ['old'] = { 969 },
+        ['ole'] = { 946 },
+        ['olk'] = { 903 },
+        ['oll'] = { 967, 1006 },
+        ['olu'] = { 922, 990 },
+        ['oly'] = { 960, 984, 1016 },
+        ['om'] = { 920, 927, 931, 932, 933, 934, 935, 949, 950, 954, 966, 970, 978, 981, 982, 986, 987, 993, 1002, 1018 },
+        ['om '] = { 986, 1018 },
+        ['oma'] = { 927, 931, 935, 949, 950, 954, 970, 978, 981, 1002 },
+        ['omb'] = { 932, 933, 982 },
+        ['ome'] = { 987 },
+        ['omi'] = { 934, 966, 993 },
+        ['omp'] = { 920 },
+        ['on'] = { 898, 903, 905, 907, 911, 912, 913, 915, 917, 918, 922, 924, 926, 927, 928, 929, 931, 933, 934, 935, 936, 939, 941, 943, 949, 950, 952, 953, 954, 955, 956, 957, 958, 959, 960, 963, 964, 967, 969, 970, 971, 973, 974, 976, 977, 978, 979, 980, 981, 982, 985, 986, 989, 990, 992, 993, 995, 996, 997, 999, 1002, 1004, 1005, 1006, 1007, 1008, 1009, 1011, 1015, 1016, 1017, 1018, 1019 },
+        ['on '] = { 911, 917, 924, 933, 934, 939, 960, 964, 993, 995, 1009, 1019 },
+        ["on'"] = { 957 },
+        ['on,'] = { 1017 },
+        ['ona'] = { 907, 922, 926, 929, 933, 939, 941, 949, 959, 960, 963, 967, 992, 1016 },
+        ['onb'] = { 999 },
+        ['onc'] = { 953, 954, 955, 956, 957, 980, 981, 1005, 1006, 1007, 1008 },
+        ['ond'] = { 956 },
+        ['one'] = { 905, 917, 927, 929, 931, 933, 935, 936, 950, 954, 955, 969, 970, 976, 977, 978, 980, 985, 997, 1002, 1018 },
+        ['onf'] = { 996 },
+        ['ong'] = { 973, 1004 },
+        ['oni'] = { 918, 929, 992, 1017 },
+        ['onk'] = { 912, 913, 924, 933, 958, 959, 964, 982, 1006, 1008, 1011 },
+        ['onl'] = { 898, 953, 986, 1015, 1016 },
+        ['ono'] = { 974 },
+        ['ons'] = { 943, 956 },
+        ['onv'] = { 952, 955 },
+        ['onz'] = { 996 },
+        ['oo'] = { 898, 903, 915, 918, 931, 936, 939, 953, 954, 957, 960, 963, 969, 985, 987, 996, 1004, 1015, 1016 },
+        ['ood'] = { 939, 954, 985 },
+        ['oog'] = { 931 },
+        ['oon'] = { 898, 915, 936, 953, 957, 960, 963, 969, 996, 1016 },
+        ['oop'] = { 1004 },
+        ['oos'] = { 903, 918, 987, 1015 },
+        ['op'] = { 913, 986, 998, 1004, 1011 },
+        ['ope'] = { 986 },
+        ['opi'] = { 998 },
+        ['opk'] = { 913, 1011 },
+        ['or'] = { 897, 902, 903, 905, 906, 908, 910, 911, 912, 913, 914, 917, 918, 919, 920, 922, 923, 924, 925, 926, 928, 930, 933, 937, 938, 939, 940, 941, 943, 944, 945, 946, 947, 948, 949, 951, 952, 953, 954, 955, 956, 957, 959, 960, 964, 965, 966, 967, 968, 969, 971, 972, 973, 974, 975, 976, 977, 979, 980, 981, 982, 983, 984, 986, 987, 989, 990, 991, 992, 993, 995, 1002, 1004, 1005, 1006, 1007, 1008, 1010, 1011, 1012, 1013, 1015, 1016, 1017, 1018, 1019 },
+        ['or '] = { 911, 914, 917, 948, 969, 1015 },
+        ["or'"] = { 903, 986 },
+        ['ora'] = { 913, 980, 1011, 1016 },
+        ['orb'] = { 906, 983, 1010 },
+        ['orc'] = { 1004 },
+        ['ord'] = { 911, 914, 953, 954, 955, 956, 957, 969, 980, 981, 1005, 1006, 1007, 1008, 1019 },
+        ['ore'] = { 922, 926, 930, 977, 979, 986, 987, 1018 },
+        ['ori'] = { 908, 923, 924, 928, 987, 990, 1005, 1012, 1018 },
+        ['orm'] = { 918, 925, 930, 933, 956, 957, 964, 968, 1007 },
+        ['orn'] = { 945, 1002 },
+        ['oro'] = { 908, 941 },
+        ['orp'] = { 897, 902, 903, 919, 920, 939, 948, 949, 966, 975, 976, 993 },
+        ['ors'] = { 928, 954, 967, 990 },
+        ['ort'] = { 906, 911, 914, 952, 965, 967, 971, 981, 989, 995, 1010, 1017 },
+        ['oru'] = { 952 },
+        ['ory'] = { 911, 914, 960 },
+        ['os'] = { 903, 918, 920, 932, 934, 953, 958, 966, 967, 985, 986, 987, 992, 1003, 1015 },
+        ['os '] = { 967 },
+        ['osa'] = { 953 },
+        ['ose'] = { 966 },
+        ['osh'] = { 918, 1003 },
+        ['oss'] = { 932, 934, 986, 992 },
+        ['ost'] = { 903, 918, 987, 1015 },
+        ['osu'] = { 920, 985 },
+        ['osy'] = { 958 },
+        ['ot'] = { 896, 897, 898, 900, 902, 905, 907, 909, 910, 916, 918, 920, 928, 929, 934, 936, 938, 940, 941, 947, 952, 953, 954, 955, 958, 962, 965, 967, 968, 969, 973, 980, 981, 988, 995, 997, 998, 1008, 1009, 1017, 1018, 1019 },
+        ['ote'] = { 898, 900, 909, 910, 916, 920, 936, 938, 952, 953, 955, 965, 969, 980, 997, 998, 1017, 1018 },
+        ['oti'] = { 934, 955, 995 },
+        ['otl'] = { 947 },
+        ['oto'] = { 918, 958, 998 },
+        ['otr'] = { 998 },
+        ['ott'] = { 896, 934, 953, 955, 980, 981, 1008, 1019 },
+        ['otu'] = { 897, 902, 905, 920, 954, 968, 973 },
+        ['ou'] = { 899, 906, 909, 912, 925, 929, 930, 933, 940, 941, 944, 945, 946, 947, 958, 960, 962, 965, 966, 967, 969, 973, 979, 984, 986, 987, 989, 990, 991, 994, 995, 997, 1006, 1010, 1013, 1017 },
+        ['oub'] = { 899, 929, 940, 941, 962, 967, 989 },
+        ['oud'] = { 994 },
+        ['oue'] = { 958 },
+        ['oul'] = { 906, 995, 1010 },
+        ['oun'] = { 906, 912, 933, 960, 997, 1006, 1010 },
+        ['our'] = { 909, 946, 947, 966, 1017 },
+        ['ous'] = { 930, 944, 945, 965, 969, 979, 984, 986, 990, 991, 1013 },
+        ['out'] = { 925, 973, 987, 989 },
+        ['ov'] = { 897, 903, 905, 910, 917, 918, 925, 926, 948, 951, 954, 964, 966, 969, 972, 984, 992, 999, 1015, 1017 },
+        ['ove'] = { 999, 1015, 1017 },
+        ['ovj'] = { 925 },
+        ['ovo'] = { 897, 903, 905, 910, 917, 918, 926, 948, 951, 954, 964, 969, 972, 984, 992 },
+        ['ow'] = { 898, 904, 907, 909, 916, 918, 924, 925, 929, 933, 934, 936, 940, 943, 952, 959, 960, 962, 964, 965, 969, 976, 982, 983, 987, 988, 989, 991, 999, 1006, 1009, 1017 },
+        ['ow '] = { 934, 1006 },
+        ['owd'] = { 907, 1009 },
+        ['owe'] = { 960, 969 },
+        ['owl'] = { 918, 924, 933, 936, 943, 991 },
+        ['own'] = { 976, 989, 1017 },
+        ['ows'] = { 965, 983 },
+        ['oy'] = { 905, 941, 962, 974, 1005, 1014 },
+        ['oy '] = { 941, 962 },
+        ['oya'] = { 905, 1014 },
+        ['oyn'] = { 974 },
+        ['oyo'] = { 1005 },
+        ['p'] = { 897, 898, 899, 900, 901, 902, 903, 904, 905, 906, 907, 908, 909, 910, 911, 912, 913, 914, 915, 916, 917, 918, 919, 920, 921, 922, 923, 924, 925, 926, 927, 928, 929, 930, 931, 933, 934, 935, 936, 939, 940, 941, 942, 943, 944, 946, 947, 948, 949, 950, 951, 952, 953, 954, 955, 956, 957, 958, 959, 960, 961, 962, 963, 964, 965, 966, 967, 968, 969, 970, 971, 972, 973, 974, 975, 976, 977, 978, 979, 980, 981, 982, 983, 984, 985, 986, 988, 989, 991, 992, 993, 994, 995, 996, 997, 998, 999, 1002, 1003, 1004, 1005, 1006, 1008, 1009, 1011, 1012, 1015, 1017, 1018, 1019 },
+        ['p '] = { 901, 922, 958, 963, 966, 977, 979, 1017, 1018 },
+        ['p +'] = { 1017, 1018 },
+        ['p e'] = { 963, 977 },
+        ['p r'] = { 922, 966, 979 },
+        ['p s'] = { 901 },
+        ['p t'] = { 958 },
+        ['p+'] = { 922, 979 },
+        ['p+m'] = { 922, 979 },
+        ['p+t'] = { 979 },
+        ['p,'] = { 976 },
+        ['p, '] = { 976 },
+        ['pa'] = { 897, 898, 899, 902, 903, 904, 905, 909, 910, 911, 916, 918, 919, 920, 924, 925, 926, 939, 942, 943, 948, 949, 951, 953, 959, 960, 965, 966, 968, 971, 972, 974, 975, 976, 979, 984, 993, 994, 995, 998, 999, 1004, 1017, 1019 },
+        ['pac'] = { 924 },
+        ['pae'] = { 911 },
+        ['pag'] = { 943, 994 },
+        ['pai'] = { 1019 },
+        ['pal'] = { 897, 899, 902, 903, 905, 910, 919, 920, 926, 939, 942, 948, 949, 951, 953, 960, 965, 966, 971, 972, 974, 975, 979, 984, 993, 998, 999, 1004 },
+        ['par'] = { 898, 904, 909, 910, 916, 918, 925, 949, 959, 965, 968, 972, 993, 995, 1004, 1017 },
+        ['pay'] = { 976 },
+        ['pe'] = { 898, 899, 904, 906, 907, 909, 911, 912, 913, 915, 920, 923, 925, 926, 927, 931, 933, 934, 935, 936, 944, 950, 952, 953, 955, 957, 958, 959, 961, 963, 964, 965, 967, 969, 970, 972, 978, 980, 981, 983, 986, 989, 995, 998, 1002, 1006, 1008, 1009, 1011, 1012, 1015, 1017, 1018 },
+        ['pe '] = { 963 },
+        ['pea'] = { 912, 1008 },
+        ['pec'] = { 927, 931, 935, 950, 970, 978, 1002 },
+        ['pel'] = { 898, 904, 906, 909, 911, 915, 920, 923, 925, 926, 936, 944, 952, 953, 955, 961, 965, 969, 980, 981, 983, 986, 989, 998, 1012, 1015, 1017, 1018 },
+        ['pen'] = { 899, 972, 986 },
+        ['per'] = { 913, 915, 923, 926, 933, 934, 957, 959, 967, 989, 998, 1011, 1012, 1015 },
+        ['pes'] = { 907, 1009 },
+        ['pet'] = { 923, 958, 964, 995, 1006, 1012 },
+        ['pg'] = { 961, 995 },
+        ['pga'] = { 961, 995 },
+        ['ph'] = { 902, 910, 920, 921, 929, 930, 939, 951, 952, 958, 959, 969, 971, 973, 977, 989, 993, 997, 998 },
+        ['ph '] = { 902, 921, 939, 951, 973 },
+        ['pha'] = { 910, 920, 951, 952, 959, 969, 989, 993 },
+        ['phe'] = { 930, 977 },
+        ['pho'] = { 929, 958, 997, 998 },
+        ['phy'] = { 971 },
+        ['pi'] = { 898, 900, 903, 906, 907, 914, 919, 922, 936, 943, 953, 956, 958, 962, 974, 977, 982, 993, 994, 995, 998, 1003, 1009, 1019 },
+        ['pia'] = { 914 },
+        ['pic'] = { 953, 998 },
+        ['pie'] = { 922, 953, 962 },
+        ['pik'] = { 919, 974 },
+        ['pin'] = { 919, 943, 974 },
+        ['pip'] = { 898 },
+        ['pir'] = { 903, 906, 907, 919, 922, 936, 956, 958, 977, 982, 993, 994, 995, 1003, 1009, 1019 },
+        ['pk'] = { 913, 1011 },
+        ['pki'] = { 913, 1011 },
+        ['pl'] = { 907, 928, 941, 967, 969, 994, 1009, 1017 },
+        ['pla'] = { 907, 969, 1009, 1017 },
+        ['ple'] = { 928, 967 },
+        ['pli'] = { 941, 994 },
+        ['po'] = { 901, 907, 909, 911, 914, 918, 920, 952, 960, 963, 965, 967, 969, 976, 978, 981, 989, 995, 1009, 1017 },
+        ['pob'] = { 918 },
+        ['poc'] = { 963 },
+        ['pof'] = { 978 },
+        ['poh'] = { 909 },
+        ['poi'] = { 901, 995 },
+        ['por'] = { 911, 914, 952, 965, 967, 976, 981, 989, 1017 },
+        ['pos'] = { 920 },
+        ['pow'] = { 907, 960, 969, 1009 },
+        ['pp'] = { 911, 913, 914, 918, 923, 926, 952, 959, 965, 967, 981, 989, 1011, 1012, 1017 },
+        ['ppe'] = { 913, 923, 926, 959, 1011, 1012 },
+        ['ppo'] = { 911, 914, 918, 952, 965, 967, 981, 989, 1017 },
+        ['pr'] = { 897, 898, 903, 905, 909, 910, 913, 914, 916, 917, 918, 920, 926, 936, 948, 951, 952, 953, 954, 955, 964, 965, 969, 972, 980, 981, 984, 985, 991, 992, 993, 997, 998, 1011, 1017, 1018 },
+        ['pra'] = { 985 },
+        ['pre'] = { 914, 981, 991 },
+        ['pri'] = { 910, 913, 984, 993, 1011 },
+        ['pro'] = { 897, 898, 903, 905, 909, 910, 916, 917, 918, 920, 926, 936, 948, 951, 952, 953, 954, 955, 964, 965, 969, 972, 980, 984, 992, 997, 998, 1017, 1018 },
+        ['ps'] = { 925, 940, 962, 988, 1011 },
+        ['psh'] = { 940, 962, 988 },
+        ['pst'] = { 925 },
+        ['psy'] = { 1011 },
+        ['pt'] = { 926 },
+        ['pto'] = { 926 },
+        ['pu'] = { 900, 907, 915, 923, 933, 942, 955, 957, 969, 972, 1005, 1009, 1012, 1017 },
+        ['pul'] = { 915, 957, 969, 972 },
+        ['pum'] = { 907, 1009 },
+        ['pun'] = { 933, 1017 },
+        ['pup'] = { 923, 1012 },
+        ['pur'] = { 955 },
+        ['py'] = { 918, 929, 988 },
+        ['pyo'] = { 918 },
+        ['pyr'] = { 929, 988 },
+        ['q'] = { 928, 930, 947, 967, 977, 982, 984, 992 },
+        ['qu'] = { 928, 930, 947, 967, 977, 982, 984, 992 },
+        ['qua'] = { 977, 984 },
+        ['que'] = { 992 },
+        ['quh'] = { 982 },
+        ['qui'] = { 928, 930, 947, 977 },
+        ['qul'] = { 967 },
+        ['r'] = { 896, 897, 898, 899, 900, 901, 902, 903, 904, 905, 906, 907, 908, 909, 910, 911, 912, 913, 914, 915, 916, 917, 918, 919, 920, 921, 922, 923, 924, 925, 926, 927, 928, 929, 930, 931, 932, 933, 934, 935, 936, 937, 938, 939, 940, 941, 942, 943, 944, 945, 946, 947, 948, 949, 950, 951, 952, 953, 954, 955, 956, 957, 958, 959, 960, 961, 962, 963, 964, 965, 966, 967, 968, 969, 970, 971, 972, 973, 974, 975, 976, 977, 978, 979, 980, 981, 982, 983, 984, 985, 986, 987, 988, 989, 990, 991, 992, 993, 994, 995, 996, 997, 998, 999, 1002, 1003, 1004, 1005, 1006, 1007, 1008, 1009, 1010, 1011, 1012, 1013, 1014, 1015, 1016, 1017, 1018, 1019 },
+        ['r '] = { 906, 907, 911, 914, 915, 917, 918, 919, 922, 933, 935, 936, 940, 946, 948, 957, 960, 966, 967, 969, 971, 984, 1009, 1015, 1017 },
+        ['r ('] = { 1015 },
+        ['r a'] = { 940, 969 },
+        ['r b'] = { 917, 936, 948, 971, 984 },
+        ['r c'] = { 1015 },
+        ['r d'] = { 946, 966 },
+        ['r f'] = { 919 },
+        ['r i'] = { 906, 1015 },
+        ['r j'] = { 915, 957, 1015 },
+        ['r k'] = { 907, 933, 1009 },
+        ['r m'] = { 911, 914 },
+        ['r o'] = { 1017 },
+        ['r r'] = { 922 },
+        ['r s'] = { 918, 935, 946, 960, 966, 967, 969, 1015 },
+        ['r v'] = { 906 },
+        ["r'"] = { 903, 914, 945, 967, 986, 1013 },
+        ["r's"] = { 903, 914, 945, 967, 986, 1013 },
+        ['r-'] = { 969 },
+        ['r-e'] = { 969 },
+        ['ra'] = { 898, 900, 901, 902, 904, 906, 907, 908, 909, 910, 911, 913, 915, 916, 917, 918, 919, 920, 921, 922, 923, 924, 925, 926, 927, 928, 929, 930, 933, 936, 937, 938, 939, 940, 941, 942, 943, 944, 946, 947, 948, 949, 951, 952, 953, 954, 955, 956, 957, 958, 959, 960, 962, 963, 964, 965, 966, 967, 968, 971, 972, 973, 979, 980, 981, 982, 983, 984, 985, 986, 988, 989, 990, 991, 992, 993, 994, 995, 996, 997, 998, 999, 1004, 1005, 1006, 1009, 1011, 1012, 1014, 1015, 1016, 1017, 1018 },
+        ['ra '] = { 898, 901, 909, 916, 926, 936, 949, 953, 955, 980, 997, 998, 1012, 1015, 1018 },
+        ['rab'] = { 1016 },
+        ['rac'] = { 920, 943, 952, 1015 },
+        ['rad'] = { 990 },
+        ['rag'] = { 915, 919, 924, 929, 933, 939, 940, 941, 954, 955, 957, 962, 964, 988, 989, 996, 1011, 1012 },
+        ['rah'] = { 936, 951 },
+        ['rai'] = { 900, 906, 908, 909, 915, 917, 918, 920, 938, 942, 944, 946, 947, 954, 960, 966, 971, 972, 979, 982, 983, 986, 996, 997, 1005, 1014, 1016, 1018 },
+        ['rak'] = { 918 },
+        ['ral'] = { 898, 904, 909, 910, 913, 916, 919, 925, 943, 949, 959, 965, 968, 984, 994, 995, 1004, 1011, 1017 },
+        ['ram'] = { 910, 943, 972, 993, 994 },
+        ['ran'] = { 924, 929, 933, 937, 940, 941, 944, 958, 962, 963, 964, 967, 980, 988, 1014, 1015, 1016 },
+        ['rap'] = { 902, 907, 921, 930, 939, 951, 973, 1009 },
+        ['ras'] = { 898, 908, 911, 915, 922, 953, 955, 980, 981, 989, 991, 998, 1012 },
+        ['rat'] = { 907, 956, 986, 998, 1009 },
+        ['rau'] = { 999 },
+        ['rav'] = { 965, 985, 986 },
+        ['raw'] = { 928 },
+        ['ray'] = { 918, 992 },
+        ['raz'] = { 920 },
+        ['rb'] = { 906, 936, 983, 1010 },
+        ['rb '] = { 906 },
+        ['rb-'] = { 906, 983, 1010 },
+        ['rbu'] = { 936 },
+        ['rc'] = { 903, 910, 911, 913, 914, 915, 922, 940, 948, 954, 959, 960, 962, 965, 973, 974, 982, 985, 991, 992, 1004, 1011, 1016, 1017, 1019 },
+        ['rce'] = { 922 },
+        ['rch'] = { 911, 914, 940, 962, 985, 1019 },
+        ['rci'] = { 962, 965, 1016, 1017 },
+        ['rcl'] = { 910, 915, 960 },
+        ['rcr'] = { 903, 948, 954, 973, 982, 992 },
+        ['rcs'] = { 1004 },
+        ['rcu'] = { 913, 959, 974, 991, 1011 },
+        ['rd'] = { 900, 908, 911, 914, 920, 927, 931, 935, 938, 942, 950, 953, 954, 955, 956, 957, 969, 970, 978, 980, 981, 990, 991, 997, 1002, 1004, 1005, 1006, 1007, 1008, 1018, 1019 },
+        ['rd '] = { 900, 908, 938, 942, 991, 997, 1004, 1005, 1018 },
+        ['rd/'] = { 911, 914 },
+        ['rde'] = { 1019 },
+        ['rdp'] = { 969 },
+        ['rdu'] = { 990 },
+        ['re'] = { 897, 898, 899, 902, 903, 904, 905, 906, 908, 909, 910, 911, 912, 913, 914, 915, 916, 917, 919, 920, 922, 923, 925, 926, 929, 930, 932, 934, 936, 937, 938, 939, 942, 943, 944, 946, 947, 951, 952, 953, 954, 955, 958, 960, 962, 965, 968, 969, 971, 972, 973, 974, 977, 979, 980, 981, 982, 983, 984, 985, 986, 987, 988, 989, 990, 991, 992, 993, 995, 996, 997, 998, 1003, 1004, 1008, 1010, 1012, 1015, 1017, 1018, 1019 },
+        ['re '] = { 898, 899, 902, 904, 905, 909, 910, 911, 913, 915, 916, 923, 932, 936, 942, 944, 951, 952, 953, 955, 960, 968, 972, 980, 981, 984, 989, 993, 998, 1004, 1012, 1018 },
+        ['re+'] = { 922 },
+        ['rea'] = { 912, 917, 929, 934, 939, 946, 971, 984, 988, 992, 1008, 1017 },
+        ['rec'] = { 981, 1017 },
+        ['red'] = { 897, 902, 904, 905, 920, 925, 926, 932, 952, 955, 965, 973, 987, 989, 991, 998, 1017 },
+        ['ree'] = { 906, 915, 974 },
+        ['ref'] = { 920, 952, 962, 965, 969, 981, 989, 1017 },
+        ['reg'] = { 916, 958, 969, 981, 983, 985 },
+        ['rej'] = { 979 },
+        ['rel'] = { 914, 936 },
+        ['rem'] = { 990 },
+        ['ren'] = { 984, 986 },
+        ['reo'] = { 930, 944 },
+        ['rep'] = { 910, 984, 993 },
+        ['rer'] = { 997 },
+        ['res'] = { 903, 906, 917, 920, 922, 937, 939, 943, 952, 954, 958, 965, 969, 973, 977, 979, 981, 982, 986, 989, 990, 995, 1010, 1015, 1017, 1018, 1019 },
+        ['ret'] = { 903, 954, 962, 1003 },
+        ['reu'] = { 939 },
+        ['rev'] = { 922, 947, 979, 990 },
+        ['rey'] = { 991 },
+        ['rf'] = { 933 },
+        ['rfe'] = { 933 },
+        ['rg'] = { 896, 903, 904, 922, 924, 925, 930, 934, 961, 962, 968, 976, 977, 983, 987, 991, 995, 1003, 1004, 1015, 1017, 1019 },
+        ['rge'] = { 896, 903, 904, 922, 925, 930, 934, 961, 968, 976, 977, 987, 991, 995, 1003, 1004, 1015, 1017, 1019 },
+        ['rgi'] = { 983 },
+        ['rgr'] = { 962 },
+        ['ri'] = { 897, 902, 903, 905, 906, 908, 909, 910, 911, 912, 913, 914, 915, 917, 918, 921, 922, 923, 924, 926, 928, 933, 936, 937, 938, 939, 940, 941, 942, 943, 944, 946, 947, 948, 949, 951, 954, 956, 957, 959, 960, 963, 964, 965, 966, 967, 969, 971, 972, 973, 977, 978, 982, 984, 985, 987, 990, 991, 992, 993, 994, 995, 997, 1003, 1004, 1005, 1006, 1008, 1010, 1011, 1012, 1013, 1016, 1018, 1019 },
+        ["ri'"] = { 954 },
+        ['ri:'] = { 992, 1003 },
+        ['ria'] = { 923, 957, 985, 1012 },
+        ['ric'] = { 924, 939, 949, 956, 984, 994, 1019 },
+        ['rid'] = { 921, 922, 1016 },
+        ['rie'] = { 910, 942, 978, 990 },
+        ['rif'] = { 995 },
+        ['rig'] = { 911, 914, 991 },
+        ['rik'] = { 906, 909, 912, 921, 933, 937, 960, 964, 993, 1004, 1008, 1010, 1016 },
+        ['ril'] = { 902 },
+        ['rim'] = { 908, 990 },
+        ['rin'] = { 909, 918, 926, 947, 997, 1003, 1018 },
+        ['rio'] = { 897, 903, 905, 910, 912, 917, 918, 937, 938, 939, 940, 941, 943, 944, 946, 947, 948, 949, 951, 954, 956, 957, 959, 964, 965, 966, 969, 971, 972, 973, 982, 984, 990, 991, 992, 1004, 1005, 1006, 1008, 1010, 1013, 1016 },
+        ['rip'] = { 926, 928, 963, 967 },
+        ['ris'] = { 910, 913, 928, 946, 947, 966, 984, 993, 1011, 1018 },
+        ['rit'] = { 903, 922, 923, 936, 937, 944, 977, 982, 993, 1012 },
+        ['riv'] = { 915, 957, 972, 995 },
+        ['rix'] = { 965 },
+        ['riz'] = { 928 },
+        ['rk'] = { 903, 906, 917, 934, 937, 939, 941, 943, 948, 951, 957, 967, 968, 969, 972, 973, 977, 982, 983, 985, 986, 987, 992, 993, 994, 995, 996, 1010, 1017 },
+        ['rk '] = { 906, 934, 967, 968, 983, 985, 986, 987, 992, 993, 994, 995, 996, 1010 },
+        ['rk-'] = { 903 },
+        ['rke'] = { 1017 },
+        ['rkn'] = { 1017 },
+        ['rl'] = { 898, 945, 953, 968, 1013 },
+        ['rli'] = { 898, 945, 953, 968, 1013 },
+        ['rm'] = { 911, 917, 918, 925, 930, 933, 956, 957, 964, 968, 983, 1007, 1017 },
+        ['rm '] = { 930 },
+        ['rme'] = { 957 },
+        ['rml'] = { 933, 964 },
+        ['rmo'] = { 917, 1017 },
+        ['rms'] = { 968 },
+        ['rmw'] = { 925 },
+        ['rmy'] = { 911 },
+        ['rn'] = { 897, 911, 920, 930, 945, 967, 993, 1002, 1003, 1015 },
+        ['rn '] = { 945 },
+        ['rna'] = { 911, 930, 993, 1015 },
+        ['rne'] = { 1002 },
+        ['rni'] = { 897, 920, 967 },
+        ['ro'] = { 897, 898, 900, 903, 905, 906, 908, 909, 910, 913, 916, 917, 918, 920, 926, 929, 934, 936, 940, 941, 945, 948, 949, 951, 952, 953, 954, 955, 958, 960, 962, 963, 964, 965, 966, 967, 968, 969, 972, 973, 974, 977, 980, 983, 984, 985, 986, 988, 991, 992, 993, 997, 998, 1010, 1011, 1013, 1017, 1018 },
+        ['ro)'] = { 958 },
+        ['roa'] = { 1011 },
+        ['rob'] = { 926, 977 },
+        ['rog'] = { 993 },
+        ['roh'] = { 997, 1018 },
+        ['rol'] = { 967 },
+        ['rom'] = { 949, 986, 1018 },
+        ['ron'] = { 917, 941, 973 },
+        ['roo'] = { 963 },
+        ['rop'] = { 913, 998, 1011 },
+        ['ror'] = { 913, 973, 974, 1011 },
+        ['ros'] = { 934, 953, 966, 985, 986, 992 },
+        ['rot'] = { 898, 909, 910, 916, 920, 936, 952, 953, 955, 965, 968, 969, 980, 997, 998, 1017, 1018 },
+        ['rou'] = { 906, 945, 958, 960, 991, 1010, 1013 },
+        ['rov'] = { 897, 903, 905, 910, 917, 918, 926, 948, 951, 954, 964, 969, 972, 984, 992 },
+        ['row'] = { 929, 940, 962, 983, 988 },
+        ['roy'] = { 905 },
+        ['rp'] = { 897, 902, 903, 919, 920, 939, 940, 948, 949, 962, 963, 966, 975, 976, 988, 993 },
+        ['rp '] = { 963 },
+        ['rpa'] = { 897, 902, 903, 919, 920, 939, 948, 949, 966, 975, 993 },
+        ['rpo'] = { 976 },
+        ['rps'] = { 940, 962, 988 },
+        ['rr'] = { 897, 903, 905, 910, 912, 917, 918, 929, 937, 938, 939, 940, 941, 943, 944, 946, 947, 948, 949, 951, 952, 954, 956, 957, 959, 962, 964, 966, 969, 972, 973, 974, 982, 983, 984, 988, 990, 991, 992, 993, 1004, 1005, 1006, 1008, 1010, 1013, 1016, 1017 },
+        ['rra'] = { 929, 940, 941, 962, 988 },
+        ['rrc'] = { 991 },
+        ['rre'] = { 944 },
+        ['rri'] = { 897, 903, 905, 910, 912, 917, 918, 937, 938, 939, 940, 941, 943, 944, 946, 947, 948, 949, 951, 954, 956, 957, 959, 964, 966, 969, 972, 973, 982, 984, 990, 991, 992, 1004, 1005, 1006, 1008, 1010, 1013, 1016 },
+        ['rro'] = { 929, 940, 962, 973, 974, 983, 988, 993 },
+        ['rry'] = { 918, 952, 1017 },
+        ['rs'] = { 903, 912, 917, 921, 928, 936, 937, 939, 941, 943, 947, 948, 951, 954, 957, 967, 969, 971, 972, 973, 976, 982, 984, 986, 987, 990, 992, 1006, 1015, 1016, 1019 },
+        ['rsa'] = { 928, 954, 967 },
+        ['rse'] = { 903, 917, 937, 939, 941, 943, 947, 948, 951, 957, 969, 972, 973, 982, 990, 992 },
+        ['rsn'] = { 921, 1016 },
+        ['rst'] = { 912, 936, 971, 976, 984, 986, 1006, 1015 },
+        ['rt'] = { 906, 910, 911, 914, 926, 952, 955, 965, 967, 968, 971, 972, 976, 981, 984, 986, 989, 993, 995, 1010, 1015, 1017 },
+        ['rt '] = { 986 },
+        ['rta'] = { 976, 984 },
+        ['rte'] = { 926, 971, 984 },
+        ['rts'] = { 968, 989 },
+        ['rty'] = { 955 },
+        ['ru'] = { 899, 903, 904, 909, 912, 915, 916, 922, 926, 932, 936, 937, 952, 954, 955, 960, 969, 972, 976, 981, 986, 999, 1015, 1016 },
+        ['ru '] = { 955 },
+        ['ru-'] = { 952 },
+        ['rue'] = { 909, 912, 937 },
+        ['ruf'] = { 903 },
+        ['rug'] = { 960 },
+        ['ruh'] = { 936 },
+        ['ruj'] = { 904 },
+        ['ruk'] = { 916 },
+        ['run'] = { 969, 999 },
+        ['rup'] = { 926 },
+        ['rur'] = { 955 },
+        ['rus'] = { 899, 915, 922, 932, 954, 972, 976, 981, 986, 1015 },
+        ['rut'] = { 1016 },
+        ['rv'] = { 956, 968, 1007 },
+        ['rva'] = { 956, 1007 },
+        ['rvi'] = { 968 },
+        ['rw'] = { 991 },
+        ['rwa'] = { 991 },
+        ['ry'] = { 903, 910, 911, 914, 918, 937, 945, 948, 952, 953, 954, 960, 970, 973, 981, 982, 984, 985, 992, 993, 1013, 1015, 1017 },
+        ['ry '] = { 911, 914, 937, 960, 1017 },
+        ['rya'] = { 985 },
+        ['ryg'] = { 970 },
+        ['rys'] = { 1015 },
+        ['rz'] = { 914 },
+        ['rzo'] = { 914 },
+        ['s'] = { 896, 897, 898, 899, 900, 901, 902, 903, 904, 905, 906, 907, 908, 909, 910, 911, 912, 913, 914, 915, 916, 917, 918, 919, 920, 921, 922, 923, 924, 925, 926, 927, 928, 929, 930, 931, 932, 933, 934, 935, 936, 937, 938, 939, 940, 941, 942, 943, 944, 945, 946, 947, 948, 949, 950, 951, 952, 953, 954, 955, 956, 957, 958, 959, 960, 961, 962, 963, 964, 965, 966, 967, 968, 969, 970, 971, 972, 973, 974, 975, 976, 977, 978, 979, 980, 981, 982, 983, 984, 985, 986, 987, 988, 989, 990, 991, 992, 993, 994, 995, 996, 997, 998, 999, 1002, 1003, 1004, 1005, 1006, 1007, 1008, 1009, 1010, 1011, 1012, 1013, 1014, 1015, 1016, 1017, 1018, 1019 },
+        ['s '] = { 896, 897, 902, 903, 904, 905, 909, 911, 914, 920, 922, 925, 930, 933, 934, 944, 945, 953, 954, 956, 957, 958, 961, 964, 965, 967, 968, 969, 973, 976, 977, 979, 980, 984, 986, 987, 990, 991, 992, 993, 995, 1003, 1004, 1007, 1013, 1015, 1016, 1017, 1019 },
+        ['s ('] = { 909, 1015 },
+        ['s a'] = { 965, 986, 1017 },
+        ['s b'] = { 897, 902, 905, 911, 914, 920, 973 },
+        ['s c'] = { 903, 930, 944, 986, 991, 1004 },
+        ['s d'] = { 990 },
+        ['s f'] = { 945, 954, 958, 984, 1013 },
+        ['s h'] = { 986 },
+        ['s i'] = { 896, 904, 922, 925, 934, 961, 968, 976, 977, 987, 995, 1003, 1015, 1017, 1019 },
+        ['s l'] = { 979 },
+        ['s m'] = { 911, 953, 977 },
+        ['s o'] = { 990, 1019 },
+        ['s p'] = { 911, 914, 969 },
+        ['s r'] = { 934, 967, 991, 992 },
+        ['s s'] = { 909, 914, 930, 933, 956, 964, 977, 980, 1007, 1016 },
+        ['s t'] = { 957, 958, 976, 986 },
+        ['s v'] = { 896, 904, 934, 961, 968, 976, 987, 995, 1015, 1017 },
+        ['s w'] = { 903, 993 },
+        ['s,'] = { 1015 },
+        ['s, '] = { 1015 },
+        ['s/'] = { 914 },
+        ['s/a'] = { 914 },
+        ['s]'] = { 1004 },
+        ['sa'] = { 900, 903, 905, 906, 908, 910, 912, 913, 919, 920, 927, 928, 930, 934, 938, 939, 942, 945, 946, 947, 948, 949, 951, 953, 954, 956, 963, 966, 967, 971, 973, 979, 982, 984, 986, 993, 996, 997, 998, 1003, 1005, 1007, 1008, 1011, 1013, 1014, 1015, 1018 },
+        ['sab'] = { 946, 966 },
+        ['sac'] = { 953, 998 },
+        ['sad'] = { 905, 910, 984, 993 },
+        ['sai'] = { 928, 954, 967 },
+        ['sak'] = { 927 },
+        ['sal'] = { 906, 910, 912, 919, 928, 934, 982, 984, 993, 1008 },
+        ['sam'] = { 900, 908, 938, 942, 945, 946, 947, 966, 971, 979, 996, 997, 1005, 1013, 1014, 1015, 1018 },
+        ['san'] = { 910, 913, 953, 963, 1003, 1011 },
+        ['sar'] = { 956, 1007 },
+        ['sas'] = { 930 },
+        ['sau'] = { 986 },
+        ['sav'] = { 903, 905, 908, 910, 920, 939, 948, 949, 951, 954, 967, 973, 997, 1018 },
+        ['sb'] = { 1004 },
+        ['sba'] = { 1004 },
+        ['sc'] = { 909, 914, 919, 934, 956, 968, 986, 1017 },
+        ['sce'] = { 956, 1017 },
+        ['sch'] = { 914, 968 },
+        ['sco'] = { 909 },
+        ['scr'] = { 986 },
+        ['scy'] = { 919, 934 },
+        ['sd'] = { 1015 },
+        ['sda'] = { 1015 },
+        ['se'] = { 898, 899, 902, 903, 905, 910, 911, 914, 915, 917, 918, 921, 922, 928, 937, 938, 939, 940, 941, 942, 943, 944, 945, 947, 948, 951, 953, 955, 957, 958, 959, 960, 966, 969, 972, 973, 979, 980, 981, 982, 983, 984, 987, 989, 990, 992, 993, 995, 996, 997, 998, 999, 1003, 1005, 1009, 1012, 1013, 1016, 1017, 1018, 1019 },
+        ['se '] = { 915, 944, 947, 957, 972, 1018 },
+        ['sea'] = { 987, 995, 1003, 1019 },
+        ['sec'] = { 928 },
+        ['see'] = { 999, 1017 },
+        ['sek'] = { 938, 942, 996 },
+        ['sel'] = { 979, 1016 },
+        ['sem'] = { 918, 940, 992, 1003, 1009 },
+        ['sen'] = { 899, 902, 905, 910, 914, 945, 951, 960, 972, 984, 993, 1005 },
+        ['ser'] = { 902, 903, 917, 921, 937, 939, 941, 943, 948, 951, 953, 957, 969, 972, 973, 982, 992 },
+        ['ses'] = { 966 },
+        ['set'] = { 945, 958, 983, 1013 },
+        ['sh'] = { 896, 898, 899, 900, 902, 905, 907, 908, 909, 910, 913, 915, 916, 917, 918, 920, 921, 922, 923, 926, 928, 929, 930, 932, 934, 936, 938, 940, 941, 942, 946, 947, 951, 952, 953, 954, 955, 960, 962, 963, 965, 966, 967, 968, 969, 972, 973, 974, 980, 981, 984, 988, 989, 993, 996, 997, 998, 1003, 1005, 1009, 1011, 1012, 1015, 1016, 1017, 1018, 1019 },
+        ['sh '] = { 921, 1016 },
+        ['sha'] = { 896, 900, 909, 918, 934, 938, 940, 942, 962, 963, 965, 988, 996, 1003, 1005, 1019 },
+        ['shb'] = { 926 },
+        ['she'] = { 898, 909, 913, 916, 920, 936, 952, 953, 955, 965, 969, 980, 997, 998, 1011, 1015, 1017, 1018 },
+        ['shi'] = { 905, 908, 915, 917, 918, 926, 951, 954, 993, 1005, 1015 },
+        ['shm'] = { 923, 1012 },
+        ['sho'] = { 907, 918, 928, 929, 930, 940, 941, 962, 967, 974, 988, 1009 },
+        ['shu'] = { 989, 1003 },
+        ['shy'] = { 988 },
+        ['si'] = { 896, 904, 914, 916, 919, 921, 922, 925, 926, 929, 930, 934, 935, 940, 945, 958, 959, 960, 961, 962, 968, 969, 971, 974, 976, 977, 981, 984, 985, 986, 987, 988, 990, 995, 997, 998, 1003, 1013, 1015, 1017, 1019 },
+        ['sia'] = { 1017 },
+        ['sib'] = { 935, 1015 },
+        ['sic'] = { 960, 969, 971 },
+        ['sid'] = { 929, 940, 962, 988 },
+        ['sig'] = { 984, 1017 },
+        ['sil'] = { 916, 925, 926, 959, 968, 987, 990 },
+        ['sim'] = { 914 },
+        ['sin'] = { 896, 904, 922, 925, 930, 934, 945, 961, 968, 976, 977, 986, 987, 995, 997, 998, 1003, 1013, 1015, 1017, 1019 },
+        ['sio'] = { 981, 990, 1015, 1017 },
+        ['sis'] = { 958, 959 },
+        ['siv'] = { 896, 904, 919, 921, 925, 934, 961, 968, 974, 976, 977, 985, 987, 995, 1015, 1019 },
+        ['six'] = { 925 },
+        ['sk'] = { 905, 915, 946, 955, 957, 969, 980, 1018 },
+        ['ske'] = { 915, 957 },
+        ['ski'] = { 905, 955, 969, 980, 1018 },
+        ['sku'] = { 946 },
+        ['sl'] = { 898, 904, 909, 916, 925, 928, 941, 943, 952, 960, 961, 965, 969, 974, 976, 987, 993, 995, 1017 },
+        ['sla'] = { 925, 943, 960, 969, 974, 993 },
+        ['sle'] = { 961, 976, 995 },
+        ['slo'] = { 898, 904, 909, 916, 925, 952, 965, 987, 1017 },
+        ['slu'] = { 941 },
+        ['sly'] = { 928 },
+        ['sm'] = { 1006 },
+        ['smi'] = { 1006 },
+        ['sn'] = { 921, 930, 949, 956, 967, 994, 1007, 1016 },
+        ['sna'] = { 921, 967, 1016 },
+        ['sne'] = { 930, 949, 956, 994, 1007, 1016 },
+        ['sni'] = { 967 },
+        ['so'] = { 900, 903, 906, 908, 909, 937, 938, 939, 942, 943, 954, 973, 980, 983, 990, 995, 996, 997, 1004, 1005, 1010, 1014, 1018, 1019 },
+        ['sol'] = { 909, 980, 990 },
+        ['son'] = { 995, 1004, 1019 },
+        ['sor'] = { 903, 906, 937, 939, 943, 954, 973, 983, 995, 1010 },
+        ['sot'] = { 954 },
+        ['sou'] = { 906, 995, 1010 },
+        ['soy'] = { 1014 },
+        ['sp'] = { 898, 901, 903, 904, 906, 909, 911, 915, 919, 920, 922, 923, 925, 926, 927, 931, 935, 936, 941, 943, 944, 950, 952, 953, 955, 956, 961, 965, 969, 970, 974, 977, 978, 980, 981, 982, 983, 986, 989, 991, 993, 994, 995, 998, 1002, 1003, 1012, 1015, 1017, 1018 },
+        ['sp '] = { 901 },
+        ['spe'] = { 898, 904, 906, 909, 911, 915, 920, 923, 925, 926, 927, 931, 935, 936, 944, 950, 952, 953, 955, 961, 965, 969, 970, 978, 980, 981, 983, 986, 989, 998, 1002, 1012, 1015, 1017, 1018 },
+        ['sph'] = { 977 },
+        ['spi'] = { 903, 906, 919, 922, 936, 943, 953, 956, 974, 977, 982, 993, 994, 995, 1003 },
+        ['spl'] = { 941, 994, 1017 },
+        ['spo'] = { 901 },
+        ['sr'] = { 926 },
+        ['sru'] = { 926 },
+        ['ss'] = { 900, 903, 906, 908, 914, 918, 930, 932, 933, 934, 937, 938, 939, 942, 943, 954, 964, 973, 985, 986, 990, 992, 996, 997, 998, 1005, 1016, 1017, 1018, 1019 },
+        ['ss '] = { 933, 934, 964, 992, 1016, 1017 },
+        ['ssa'] = { 906, 930, 986 },
+        ['sse'] = { 990 },
+        ['ssh'] = { 918 },
+        ['ssi'] = { 914, 930, 997, 998 },
+        ['ssn'] = { 1016 },
+        ['sso'] = { 900, 903, 908, 937, 938, 939, 942, 943, 954, 973, 996, 997, 1005, 1018, 1019 },
+        ['st'] = { 896, 898, 899, 901, 903, 904, 905, 906, 909, 910, 912, 915, 916, 917, 918, 919, 920, 921, 922, 923, 924, 925, 926, 930, 932, 933, 934, 935, 936, 937, 940, 943, 944, 946, 947, 948, 949, 951, 952, 953, 954, 955, 956, 959, 960, 961, 962, 964, 965, 966, 968, 969, 971, 972, 974, 975, 976, 977, 979, 980, 981, 982, 983, 984, 985, 986, 987, 989, 990, 991, 992, 993, 994, 995, 998, 999, 1003, 1004, 1006, 1007, 1008, 1010, 1011, 1012, 1015, 1016, 1017, 1018, 1019 },
+        ['st '] = { 903, 906, 948, 949, 951, 966, 975, 983, 995, 1010, 1015, 1017 },
+        ['sta'] = { 898, 912, 930, 935, 936, 953, 983, 986, 991, 1004, 1006, 1015 },
+        ['ste'] = { 896, 904, 915, 916, 917, 919, 920, 921, 923, 925, 934, 936, 940, 943, 944, 946, 947, 949, 952, 953, 954, 955, 961, 962, 965, 966, 968, 971, 974, 976, 977, 981, 984, 985, 987, 989, 990, 994, 995, 998, 1011, 1012, 1015, 1017, 1019 },
+        ['sti'] = { 901, 925, 965, 1008 },
+        ['stm'] = { 943, 990, 994 },
+        ['sto'] = { 905, 918, 922, 925, 930, 955, 956, 968, 969, 977, 979, 980, 985, 986, 1007, 1018 },
+        ['str'] = { 906, 909, 912, 917, 920, 921, 926, 933, 937, 952, 954, 960, 964, 965, 982, 993, 1004, 1008, 1010, 1016 },
+        ['sts'] = { 924, 933, 964 },
+        ['stu'] = { 906, 923, 926, 932, 946, 949, 959, 968, 977, 987, 992, 995, 1003, 1010, 1012, 1015 },
+        ['sty'] = { 910 },
+        ['su'] = { 908, 911, 914, 915, 918, 920, 924, 926, 933, 936, 945, 952, 953, 957, 964, 965, 967, 976, 977, 981, 985, 989, 992, 997, 1003, 1009, 1015, 1017, 1018 },
+        ['su '] = { 1003 },
+        ['su:'] = { 908, 997, 1018 },
+        ['sua'] = { 945 },
+        ['sub'] = { 926 },
+        ['sui'] = { 1003, 1018 },
+        ['suk'] = { 908 },
+        ['sul'] = { 985 },
+        ['sum'] = { 936, 976, 977, 1015 },
+        ['sun'] = { 936, 953, 976 },
+        ['sup'] = { 911, 914, 915, 952, 957, 965, 967, 981, 989, 1015, 1017 },
+        ['sur'] = { 920, 924, 933, 964 },
+        ['sus'] = { 918, 992, 1003, 1009 },
+        ['sw'] = { 899, 902, 911, 914, 918, 951, 966, 969, 975, 983, 992, 1004 },
+        ['swa'] = { 983 },
+        ['swe'] = { 899, 918 },
+        ['swi'] = { 902, 951, 966, 969, 975, 992 },
+        ['swo'] = { 911, 914, 969, 1004 },
+        ['sy'] = { 958, 981, 1011 },
+        ['syc'] = { 1011 },
+        ['syl'] = { 981 },
+        ['syn'] = { 958 },
+        ['t'] = { 896, 897, 898, 899, 900, 901, 902, 903, 904, 905, 906, 907, 908, 909, 910, 911, 912, 913, 914, 915, 916, 917, 918, 919, 920, 921, 922, 923, 924, 925, 926, 928, 929, 930, 932, 933, 934, 935, 936, 937, 938, 939, 940, 941, 942, 943, 944, 945, 946, 947, 948, 949, 950, 951, 952, 953, 954, 955, 956, 957, 958, 959, 960, 961, 962, 963, 964, 965, 966, 967, 968, 969, 971, 972, 973, 974, 975, 976, 977, 979, 980, 981, 982, 983, 984, 985, 986, 987, 988, 989, 990, 991, 992, 993, 994, 995, 996, 997, 998, 999, 1003, 1004, 1005, 1006, 1007, 1008, 1009, 1010, 1011, 1012, 1013, 1014, 1015, 1016, 1017, 1018, 1019 },
+        ['t '] = { 896, 902, 903, 904, 906, 910, 911, 914, 915, 920, 922, 925, 933, 934, 936, 941, 946, 948, 949, 951, 952, 961, 962, 963, 965, 966, 967, 968, 969, 971, 975, 976, 977, 983, 986, 987, 990, 992, 993, 995, 1003, 1006, 1010, 1015, 1017, 1019 },
+        ['t ('] = { 1006 },
+        ['t +'] = { 1015 },
+        ['t a'] = { 962, 1017 },
+        ['t b'] = { 902, 903, 948, 949, 951, 966, 971, 975, 992 },
+        ['t c'] = { 915, 933 },
+        ['t d'] = { 992, 993 },
+        ['t e'] = { 896, 904, 922, 925, 934, 961, 968, 976, 977, 987, 995, 1003, 1015, 1017, 1019 },
+        ['t f'] = { 946, 986, 1015 },
+        ['t h'] = { 1017 },
+        ['t i'] = { 910, 911, 914, 920, 952, 965, 969, 1017 },
+        ['t l'] = { 983 },
+        ['t m'] = { 976 },
+        ['t o'] = { 983 },
+        ['t r'] = { 906, 990, 995, 1010 },
+        ['t s'] = { 941, 963, 967, 969, 983 },
+        ['t t'] = { 936, 977, 1015 },
+        ['t u'] = { 1017 },
+        ['t v'] = { 910, 911, 914, 920, 952, 965, 1017 },
+        ['t w'] = { 971 },
+        ["t'"] = { 911 },
+        ["t's"] = { 911 },
+        ['t,'] = { 965 },
+        ['t, '] = { 965 },
+        ['t/'] = { 898, 909, 916, 936, 953, 955, 998 },
+        ['t/r'] = { 898, 909, 916, 936, 953, 955, 998 },
+        ['ta'] = { 896, 898, 899, 900, 902, 903, 904, 905, 908, 910, 912, 918, 922, 925, 926, 930, 934, 935, 936, 937, 938, 942, 949, 951, 953, 954, 956, 958, 960, 961, 965, 967, 968, 969, 972, 976, 977, 983, 984, 986, 987, 991, 992, 993, 994, 995, 996, 997, 1003, 1004, 1005, 1006, 1007, 1015, 1017, 1018, 1019 },
+        ['ta '] = { 899, 972 },
+        ['tab'] = { 930 },
+        ['tac'] = { 900, 903, 918, 930, 938, 942, 949, 956, 994, 996, 1005, 1007 },
+        ['tad'] = { 967 },
+        ['tae'] = { 1003 },
+        ['tag'] = { 983, 1004 },
+        ['tai'] = { 937, 996 },
+        ['tak'] = { 936, 977 },
+        ['tal'] = { 896, 903, 904, 922, 925, 934, 954, 958, 961, 968, 976, 977, 987, 991, 995, 1003, 1015, 1017, 1019 },
+        ['tan'] = { 902, 905, 910, 912, 918, 926, 951, 960, 969, 984, 992, 993, 1006 },
+        ['tar'] = { 896, 898, 904, 922, 925, 934, 935, 936, 953, 961, 968, 976, 977, 984, 986, 987, 991, 995, 1003, 1015, 1017, 1019 },
+        ['tas'] = { 965 },
+        ['tat'] = { 900, 908, 918, 942, 983, 996, 997, 1005, 1015, 1018 },
+        ['tc'] = { 986 },
+        ['tch'] = { 986 },
+        ['te'] = { 896, 897, 898, 899, 900, 901, 903, 904, 906, 907, 908, 909, 910, 911, 912, 913, 914, 915, 916, 917, 918, 919, 920, 921, 922, 923, 924, 925, 926, 928, 929, 930, 932, 933, 934, 936, 937, 938, 939, 940, 941, 942, 943, 944, 945, 946, 947, 948, 949, 952, 953, 954, 955, 956, 957, 958, 959, 961, 962, 963, 964, 965, 966, 967, 968, 969, 971, 972, 973, 974, 975, 976, 977, 979, 980, 981, 982, 983, 984, 985, 986, 987, 988, 989, 990, 991, 993, 994, 995, 996, 997, 998, 1003, 1004, 1005, 1006, 1007, 1008, 1009, 1010, 1011, 1012, 1013, 1014, 1015, 1016, 1017, 1018, 1019 },
+        ['te '] = { 898, 907, 909, 911, 913, 915, 916, 921, 923, 936, 944, 946, 947, 952, 953, 955, 966, 976, 980, 981, 989, 993, 997, 998, 1009, 1011, 1012, 1013, 1016, 1018, 1019 },
+        ['tea'] = { 940, 949, 962, 987 },
+        ['tec'] = { 898, 909, 910, 916, 920, 936, 952, 953, 955, 965, 969, 980, 997, 998, 1017, 1018 },
+        ['ted'] = { 983 },
+        ['tee'] = { 917, 954 },
+        ['tel'] = { 940, 971 },
+        ['tem'] = { 948, 987, 989 },
+        ['ten'] = { 900, 908, 938, 942, 1003, 1014 },
+        ['teo'] = { 924, 986, 991 },
+        ['tep'] = { 946, 947, 966 },
+        ['ter'] = { 896, 897, 899, 900, 901, 903, 904, 906, 907, 908, 912, 913, 914, 915, 917, 919, 920, 921, 922, 923, 924, 925, 926, 928, 929, 930, 932, 933, 934, 937, 938, 939, 940, 941, 942, 943, 945, 946, 947, 948, 949, 954, 956, 957, 958, 959, 961, 962, 963, 964, 966, 967, 968, 971, 972, 973, 974, 975, 976, 977, 979, 982, 983, 984, 985, 986, 987, 988, 990, 991, 994, 995, 996, 997, 1003, 1004, 1005, 1006, 1007, 1008, 1009, 1010, 1011, 1012, 1013, 1014, 1015, 1016, 1018, 1019 },
+        ['teu'] = { 979 },
+        ['tex'] = { 971 },
+        ['th'] = { 899, 900, 901, 903, 906, 907, 908, 915, 918, 919, 922, 923, 925, 929, 930, 932, 933, 934, 938, 939, 940, 942, 944, 945, 949, 950, 956, 958, 962, 963, 966, 972, 975, 983, 986, 990, 993, 994, 997, 998, 1005, 1007, 1009, 1012, 1016, 1018 },
+        ['th '] = { 925, 940, 962 },
+        ['thd'] = { 950 },
+        ['the'] = { 906, 907, 918, 919, 934, 958, 966, 983, 990, 1009 },
+        ['thi'] = { 900, 901, 903, 907, 908, 922, 930, 932, 933, 938, 942, 949, 956, 962, 963, 975, 993, 994, 997, 1005, 1007, 1009, 1018 },
+        ['thl'] = { 1016 },
+        ['tho'] = { 923, 945, 1012 },
+        ['thr'] = { 899, 915, 972, 986 },
+        ['ti'] = { 899, 901, 902, 903, 905, 910, 914, 922, 925, 928, 934, 937, 943, 951, 953, 954, 955, 956, 959, 960, 961, 965, 966, 969, 972, 976, 979, 983, 984, 985, 990, 993, 995, 997, 1008 },
+        ['ti-'] = { 961, 976 },
+        ['tia'] = { 985 },
+        ['tic'] = { 925, 937, 965, 966, 1008 },
+        ['tim'] = { 997 },
+        ['tin'] = { 899, 901, 902, 905, 910, 914, 934, 951, 960, 972, 983, 984, 993, 995 },
+        ['tio'] = { 903, 922, 928, 934, 943, 954, 955, 956, 969, 979, 985, 990 },
+        ['tip'] = { 959 },
+        ['tit'] = { 953 },
+        ['tk'] = { 965, 987 },
+        ['tk+'] = { 965 },
+        ['tk.'] = { 987 },
+        ['tl'] = { 911, 947 },
+        ['tle'] = { 911 },
+        ['tli'] = { 947 },
+        ['tm'] = { 923, 943, 990, 994, 1012 },
+        ['tma'] = { 923, 943, 990, 994, 1012 },
+        ['to'] = { 896, 905, 908, 911, 914, 918, 922, 925, 926, 930, 932, 934, 947, 954, 955, 956, 957, 958, 960, 967, 968, 969, 973, 976, 977, 979, 980, 985, 986, 987, 990, 998, 1007, 1015, 1018, 1019 },
+        ['to '] = { 958, 977, 987, 990, 1015, 1019 },
+        ['tom'] = { 954 },
+        ['ton'] = { 905, 955, 967, 969, 973, 980, 985, 1018 },
+        ['tor'] = { 908, 911, 914, 918, 922, 925, 926, 930, 956, 957, 960, 967, 968, 976, 977, 979, 986, 1007, 1018, 1019 },
+        ['tos'] = { 918, 932, 958 },
+        ['tot'] = { 896, 934, 947, 998, 1019 },
+        ['tou'] = { 930 },
+        ['tp'] = { 906, 908, 958, 979, 997, 1018 },
+        ['tp '] = { 958, 979 },
+        ['tr'] = { 905, 906, 909, 912, 917, 920, 921, 926, 928, 933, 936, 937, 949, 952, 954, 956, 960, 963, 964, 965, 967, 980, 981, 982, 984, 985, 993, 994, 995, 997, 998, 1004, 1008, 1010, 1016, 1017, 1018 },
+        ['tra'] = { 917, 920, 933, 936, 952, 954, 980, 982, 984, 997, 1017, 1018 },
+        ['tri'] = { 905, 906, 909, 912, 921, 926, 928, 933, 937, 949, 956, 960, 963, 964, 965, 967, 985, 993, 994, 995, 1004, 1008, 1010, 1016 },
+        ['tro'] = { 926, 998 },
+        ['tru'] = { 909, 912, 937, 981 },
+        ['ts'] = { 903, 908, 918, 924, 933, 958, 964, 968, 973, 989, 992, 993, 997, 1003, 1009, 1015, 1018 },
+        ['ts '] = { 903, 958, 993, 1015 },
+        ['tsu'] = { 908, 918, 992, 997, 1003, 1009, 1018 },
+        ['tt'] = { 896, 903, 906, 911, 918, 930, 934, 945, 946, 949, 953, 955, 956, 958, 969, 980, 981, 983, 994, 995, 996, 1007, 1008, 1010, 1013, 1019 },
+        ['tta'] = { 903, 918, 930, 949, 956, 994, 996, 1007 },
+        ['tte'] = { 945, 946, 958, 994, 1013 },
+        ['tti'] = { 983 },
+        ['ttl'] = { 911 },
+        ['tto'] = { 896, 934, 1019 },
+        ['ttr'] = { 906, 1010 },
+        ['ttu'] = { 969 },
+        ['tu'] = { 897, 902, 905, 906, 909, 920, 923, 926, 932, 946, 949, 953, 954, 959, 964, 968, 969, 973, 977, 980, 987, 992, 995, 1003, 1006, 1010, 1012, 1015 },
+        ['tub'] = { 968 },
+        ['tun'] = { 906, 923, 926, 932, 949, 959, 968, 977, 987, 992, 995, 1003, 1010, 1012, 1015 },
+        ['tur'] = { 954 },
+        ['tus'] = { 897, 902, 905, 909, 920, 953, 964, 973, 977, 980, 1006, 1015 },
+        ['tut'] = { 946, 969 },
+        ['tw'] = { 968 },
+        ['twi'] = { 968 },
+        ['ty'] = { 910, 923, 929, 953, 954, 955, 956, 957, 980, 981, 994, 1005, 1006, 1007, 1008, 1012 },
+        ['ty '] = { 953, 954, 955, 956, 957, 980, 981, 1005, 1006, 1007, 1008 },
+        ['typ'] = { 929 },
+        ['tyr'] = { 955 },
+        ['tz'] = { 945, 947, 1013, 1015 },
+        ['tz '] = { 945, 947 },
+        ['u'] = { 896, 897, 898, 899, 900, 902, 903, 904, 905, 906, 907, 908, 909, 910, 911, 912, 913, 914, 915, 916, 918, 920, 921, 922, 923, 924, 925, 926, 927, 928, 929, 930, 932, 933, 934, 936, 937, 938, 939, 940, 941, 942, 943, 944, 945, 946, 947, 949, 950, 951, 952, 953, 954, 955, 956, 957, 958, 959, 960, 961, 962, 964, 965, 966, 967, 968, 969, 971, 972, 973, 974, 976, 977, 978, 979, 980, 981, 982, 983, 984, 985, 986, 987, 988, 989, 990, 991, 992, 993, 994, 995, 996, 997, 998, 999, 1003, 1005, 1006, 1007, 1008, 1009, 1010, 1011, 1012, 1013, 1014, 1015, 1016, 1017, 1018, 1019 },
+        ['u '] = { 918, 943, 955, 992, 993, 1003 },
+        ['u ('] = { 918, 955, 1003 },
+        ['u c'] = { 992, 993 },
+        ['u m'] = { 943 },
+        ['u-'] = { 952 },
+        ['u-m'] = { 952 },
+        ['u:'] = { 908, 997, 1003, 1018 },
+        ['u: '] = { 908, 997, 1003, 1018 },
+        ['ua'] = { 945, 977, 984, 1017 },
+        ['ual'] = { 945, 977, 1017 },
+        ['uar'] = { 984 },
+        ['ub'] = { 899, 909, 918, 926, 929, 940, 941, 962, 967, 968, 989 },
+        ['ubb'] = { 909 },
+        ['ube'] = { 968 },
+        ['ubl'] = { 899, 929, 940, 941, 962, 967, 989 },
+        ['ubu'] = { 918 },
+        ['ubv'] = { 926 },
+        ['uc'] = { 913, 953, 954, 955, 956, 957, 969, 980, 981, 1005, 1006, 1007, 1008, 1011 },
+        ['uch'] = { 969 },
+        ['uck'] = { 913, 1011 },
+        ['ud'] = { 906, 914, 918, 921, 947, 989, 994, 996, 1005 },
+        ['ude'] = { 906, 914 },
+        ['udg'] = { 921, 947, 989 },
+        ['udo'] = { 918, 996, 1005 },
+        ['uds'] = { 994 },
+        ['ue'] = { 909, 911, 912, 914, 937, 958, 973, 992 },
+        ['ue '] = { 909, 912, 937, 973, 992 },
+        ['uet'] = { 911, 914, 958 },
+        ['uf'] = { 903, 961, 989 },
+        ['uff'] = { 961, 989 },
+        ['ug'] = { 941, 943, 960, 983, 984, 997 },
+        ['ug '] = { 941 },
+        ['uga'] = { 997 },
+        ['ugh'] = { 943, 960, 983 },
+        ['ugu'] = { 984 },
+        ['uh'] = { 936, 939, 982 },
+        ['uha'] = { 936, 939 },
+        ['uhb'] = { 982 },
+        ['ui'] = { 910, 928, 930, 934, 947, 965, 977, 991, 995, 1003, 1018 },
+        ['ui-'] = { 1003 },
+        ['uic'] = { 928, 947 },
+        ['uid'] = { 965 },
+        ['uie'] = { 977, 1018 },
+        ['uil'] = { 934, 991, 995 },
+        ['uin'] = { 910 },
+        ['uit'] = { 930 },
+        ['uj'] = { 904, 953 },
+        ['uje'] = { 953 },
+        ['uji'] = { 904 },
+        ['uk'] = { 896, 900, 904, 908, 916, 918, 922, 925, 934, 938, 942, 947, 961, 968, 976, 977, 987, 988, 995, 996, 1003, 1015, 1017, 1019 },
+        ['uka'] = { 947 },
+        ['uke'] = { 896, 904, 922, 925, 934, 961, 968, 976, 977, 987, 995, 1003, 1015, 1017, 1019 },
+        ['uki'] = { 900, 908, 916, 918, 938, 942, 996 },
+        ['ukk'] = { 961, 988 },
+        ['ul'] = { 906, 913, 914, 915, 926, 930, 946, 957, 961, 962, 967, 969, 972, 974, 976, 977, 984, 985, 986, 987, 988, 995, 1007, 1010, 1011 },
+        ['ul '] = { 985 },
+        ['ula'] = { 985 },
+        ['ulb'] = { 926 },
+        ['ule'] = { 906, 974, 995, 1010 },
+        ['ulg'] = { 962 },
+        ['ull'] = { 913, 930, 946, 977, 984, 987, 988, 1007, 1011 },
+        ['ulm'] = { 914, 984 },
+        ['uls'] = { 915, 957, 969, 972 },
+        ['ult'] = { 961, 967, 976, 986 },
+        ['um'] = { 907, 915, 936, 946, 957, 968, 976, 977, 979, 981, 996, 1009, 1015 },
+        ['um:'] = { 968 },
+        ['ume'] = { 981 },
+        ['umi'] = { 979 },
+        ['umm'] = { 907, 936, 976, 977, 1009, 1015 },
+        ['umo'] = { 946, 1015 },
+        ['ump'] = { 915, 957, 996 },
+        ['un'] = { 906, 912, 914, 922, 923, 926, 932, 933, 936, 949, 953, 954, 955, 956, 957, 959, 960, 967, 968, 969, 976, 977, 980, 981, 987, 992, 995, 997, 999, 1003, 1005, 1006, 1007, 1008, 1010, 1012, 1015, 1017 },
+        ['un,'] = { 949 },
+        ['una'] = { 922, 936, 953 },
+        ['unb'] = { 936, 976 },
+        ['unc'] = { 933, 1017 },
+        ['und'] = { 906, 960, 1010 },
+        ['une'] = { 969, 999 },
+        ['ung'] = { 969, 1017 },
+        ['uni'] = { 953, 954, 955, 956, 957, 980, 981, 992, 1005, 1006, 1007, 1008 },
+        ['uns'] = { 1017 },
+        ['unt'] = { 912, 914, 933, 967, 1006 },
+        ['uo'] = { 981, 990 },
+        ['uor'] = { 981 },
+        ['uou'] = { 990 },
+        ['up'] = { 898, 911, 913, 914, 915, 923, 926, 952, 957, 959, 965, 966, 967, 978, 981, 989, 1011, 1012, 1015, 1017 },
+        ['up '] = { 966 },
+        ['upe'] = { 915, 957, 1015 },
+        ['upi'] = { 898 },
+        ['upo'] = { 978 },
+        ['upp'] = { 911, 913, 914, 923, 952, 959, 965, 967, 981, 989, 1011, 1012, 1017 },
+        ['upt'] = { 926 },
+        ['ur'] = { 897, 898, 899, 900, 902, 904, 905, 908, 909, 910, 911, 913, 915, 916, 918, 920, 921, 923, 924, 927, 932, 933, 936, 938, 939, 942, 944, 945, 946, 947, 949, 951, 952, 953, 954, 955, 960, 964, 966, 967, 968, 971, 972, 976, 979, 980, 981, 983, 984, 986, 989, 991, 992, 993, 996, 997, 998, 1003, 1005, 1011, 1012, 1013, 1014, 1015, 1016, 1017, 1018 },
+        ['ura'] = { 900, 908, 918, 924, 927, 933, 938, 942, 949, 955, 964, 971, 979, 992, 996, 997, 1005, 1011, 1012, 1014, 1015, 1017, 1018 },
+        ['ure'] = { 898, 899, 902, 904, 905, 908, 909, 910, 911, 913, 915, 916, 920, 923, 932, 936, 938, 942, 944, 951, 952, 953, 955, 960, 968, 972, 980, 981, 984, 989, 993, 996, 997, 998, 1012 },
+        ['urg'] = { 983 },
+        ['uri'] = { 902, 909, 910, 942, 946, 947, 954, 966, 971, 1003 },
+        ['urn'] = { 897, 920, 967, 1003 },
+        ['uro'] = { 913, 991, 1011 },
+        ['urr'] = { 939, 952, 1017 },
+        ['urs'] = { 921, 936, 971, 976, 984, 986, 1015, 1016 },
+        ['uru'] = { 955 },
+        ['ury'] = { 945, 954, 981, 984, 1013 },
+        ['us'] = { 897, 899, 902, 905, 908, 909, 912, 915, 918, 920, 922, 924, 930, 932, 944, 945, 953, 954, 964, 965, 969, 972, 973, 976, 977, 979, 980, 981, 984, 986, 990, 991, 992, 1003, 1006, 1008, 1009, 1013, 1015 },
+        ['us '] = { 897, 902, 905, 909, 920, 930, 944, 953, 965, 969, 973, 976, 977, 979, 980, 984, 986, 990, 991 },
+        ['us,'] = { 1015 },
+        ['usa'] = { 908 },
+        ['use'] = { 918, 992, 1003, 1009 },
+        ['ush'] = { 922, 932, 954, 1015 },
+        ['usi'] = { 945, 1013, 1015 },
+        ['usp'] = { 953 },
+        ['ust'] = { 899, 915, 965, 972, 981, 984, 986, 991, 1008 },
+        ['ut'] = { 913, 918, 922, 923, 925, 928, 946, 958, 959, 969, 973, 984, 987, 989, 990, 992, 1003, 1009, 1011, 1012, 1016, 1017 },
+        ['uta'] = { 969, 1003 },
+        ['ute'] = { 928, 987 },
+        ['uth'] = { 923, 1012, 1016 },
+        ['uti'] = { 922, 990 },
+        ['utr'] = { 984, 1017 },
+        ['uts'] = { 918, 973, 992, 1003, 1009 },
+        ['utt'] = { 946, 958 },
+        ['uv'] = { 979 },
+        ['uve'] = { 979 },
+        ['ux'] = { 940, 999 },
+        ['ux '] = { 940 },
+        ['uy'] = { 950 },
+        ['uyi'] = { 950 },
+        ['uz'] = { 928 },
+        ['uza'] = { 928 },
+        ['v'] = { 896, 897, 898, 899, 902, 903, 904, 905, 906, 908, 909, 910, 911, 913, 914, 915, 916, 917, 918, 919, 920, 921, 922, 923, 925, 926, 932, 934, 936, 939, 941, 942, 944, 945, 946, 947, 948, 949, 951, 952, 953, 954, 955, 956, 957, 960, 961, 964, 965, 966, 967, 968, 969, 971, 972, 973, 974, 975, 976, 977, 979, 980, 981, 984, 985, 986, 987, 989, 990, 992, 993, 994, 995, 997, 998, 999, 1007, 1011, 1012, 1013, 1015, 1017, 1018, 1019 },
+        ['v '] = { 910 },
+        ['v -'] = { 910 },
+        ['v,'] = { 977 },
+        ['v, '] = { 977 },
+        ['va'] = { 903, 905, 910, 911, 914, 920, 926, 934, 939, 948, 949, 951, 954, 956, 960, 967, 969, 973, 976, 990, 993, 1007, 1015 },
+        ['va '] = { 976 },
+        ["va'"] = { 956, 1007 },
+        ['vac'] = { 969 },
+        ['vag'] = { 903, 905, 910, 920, 939, 948, 949, 951, 954, 967, 973 },
+        ['val'] = { 910, 911, 914, 926, 960, 969, 993 },
+        ['van'] = { 911, 914, 1015 },
+        ['vas'] = { 990 },
+        ['vat'] = { 934 },
+        ['ve'] = { 896, 904, 908, 915, 919, 921, 925, 926, 934, 947, 952, 955, 957, 961, 968, 972, 974, 976, 977, 979, 985, 986, 987, 990, 992, 995, 997, 999, 1015, 1017, 1018, 1019 },
+        ['ve '] = { 896, 904, 908, 919, 921, 925, 934, 961, 968, 974, 976, 977, 985, 987, 995, 997, 1015, 1018, 1019 },
+        ['ved'] = { 985 },
+        ['veh'] = { 990 },
+        ['vel'] = { 979, 1015 },
+        ['ven'] = { 979, 986, 1017 },
+        ['ver'] = { 926, 947, 952, 955, 972, 992, 999, 1015, 1017 },
+        ['vi'] = { 898, 905, 909, 910, 911, 914, 916, 936, 941, 944, 945, 946, 953, 954, 955, 956, 957, 960, 965, 968, 969, 980, 981, 984, 993, 998, 1012, 1013, 1015 },
+        ['vic'] = { 911, 914, 960 },
+        ['vie'] = { 981 },
+        ['vif'] = { 945, 1013 },
+        ['vin'] = { 910, 945, 954, 960, 984, 993 },
+        ['vio'] = { 905, 946 },
+        ['vir'] = { 941, 957 },
+        ['vis'] = { 956, 968, 1015 },
+        ['vit'] = { 965 },
+        ['viv'] = { 945, 969, 1013 },
+        ['vj'] = { 925 },
+        ['vja'] = { 925 },
+        ['vo'] = { 897, 902, 903, 905, 906, 910, 917, 918, 919, 920, 922, 926, 939, 948, 949, 951, 954, 955, 964, 966, 967, 969, 971, 972, 975, 984, 987, 992, 993, 994 },
+        ['voc'] = { 994 },
+        ['voi'] = { 906 },
+        ['vok'] = { 897, 903, 905, 910, 917, 918, 926, 948, 951, 954, 964, 967, 969, 972, 984, 992 },
+        ['vol'] = { 903, 922 },
+        ['vor'] = { 897, 902, 903, 919, 920, 939, 948, 949, 966, 971, 975, 993 },
+        ['vot'] = { 955 },
+        ['vou'] = { 987 },
+        ['vy'] = { 941 },
+        ['vy '] = { 941 },
+        ['w'] = { 897, 898, 899, 901, 902, 903, 904, 905, 907, 909, 910, 911, 912, 913, 914, 915, 916, 917, 918, 921, 923, 924, 925, 928, 929, 932, 933, 934, 936, 937, 938, 939, 940, 941, 943, 944, 945, 946, 947, 948, 949, 951, 952, 953, 954, 955, 956, 957, 958, 959, 960, 962, 964, 965, 966, 968, 969, 971, 972, 973, 974, 975, 976, 980, 981, 982, 983, 984, 985, 987, 988, 989, 990, 991, 992, 993, 997, 998, 999, 1003, 1004, 1005, 1006, 1008, 1009, 1010, 1011, 1012, 1013, 1015, 1016, 1017, 1018, 1019 },
+        ['w '] = { 934, 1006 },
+        ['w o'] = { 934 },
+        ['w s'] = { 1006 },
+        ['wa'] = { 897, 901, 903, 905, 907, 910, 912, 917, 918, 925, 932, 937, 938, 939, 940, 941, 943, 944, 945, 946, 947, 948, 949, 951, 954, 956, 957, 959, 964, 966, 969, 972, 973, 974, 982, 983, 984, 990, 991, 992, 1003, 1004, 1005, 1006, 1008, 1009, 1010, 1013, 1015, 1016 },
+        ['wah'] = { 956 },
+        ['wak'] = { 925 },
+        ['wal'] = { 907, 945, 947, 1003, 1009, 1013, 1015 },
+        ['war'] = { 897, 903, 905, 910, 912, 917, 918, 937, 938, 939, 940, 941, 943, 944, 946, 947, 948, 949, 951, 954, 956, 957, 959, 964, 966, 969, 972, 973, 982, 983, 984, 990, 991, 992, 1003, 1004, 1005, 1006, 1008, 1010, 1013, 1016 },
+        ['was'] = { 901 },
+        ['wat'] = { 932 },
+        ['wav'] = { 974 },
+        ['wd'] = { 907, 1009 },
+        ['wde'] = { 907, 1009 },
+        ['we'] = { 899, 915, 918, 957, 960, 969, 1017 },
+        ['wee'] = { 899, 918 },
+        ['wer'] = { 915, 957, 960, 969 },
+        ['wh'] = { 898, 909, 911, 913, 915, 916, 921, 923, 936, 944, 945, 952, 953, 955, 971, 980, 981, 989, 993, 997, 998, 1011, 1012, 1013, 1016, 1018, 1019 },
+        ['whe'] = { 915, 971 },
+        ['whi'] = { 898, 909, 911, 913, 915, 916, 921, 923, 936, 944, 945, 952, 953, 955, 980, 981, 989, 993, 997, 998, 1011, 1012, 1013, 1016, 1018, 1019 },
+        ['wi'] = { 902, 903, 913, 929, 939, 940, 951, 958, 962, 966, 968, 969, 971, 975, 984, 985, 988, 992, 993, 1011 },
+        ['wic'] = { 913, 1011 },
+        ['wif'] = { 902, 951, 966, 975, 992 },
+        ['wil'] = { 958, 985 },
+        ['win'] = { 929, 939, 940, 962, 971, 984, 988 },
+        ['wip'] = { 969 },
+        ['wir'] = { 968 },
+        ['wit'] = { 903, 993 },
+        ['wk'] = { 954 },
+        ['wl'] = { 918, 924, 933, 936, 943, 991 },
+        ['wli'] = { 924, 933, 936, 991 },
+        ['wn'] = { 976, 989, 1017 },
+        ['wn '] = { 1017 },
+        ['wo'] = { 911, 914, 969, 985, 1004 },
+        ['woo'] = { 985, 1004 },
+        ['wor'] = { 911, 914, 969 },
+        ['wr'] = { 998 },
+        ['wra'] = { 998 },
+        ['ws'] = { 965, 983 },
+        ['x'] = { 899, 909, 910, 912, 920, 921, 925, 932, 937, 940, 943, 951, 952, 965, 969, 971, 975, 989, 993, 997, 999, 1004, 1008, 1016, 1017, 1019 },
+        ['x '] = { 940, 952, 965, 997, 999 },
+        ['x ('] = { 997, 999 },
+        ['x a'] = { 940 },
+        ['x i'] = { 952 },
+        ['x o'] = { 965 },
+        ['xa'] = { 909, 912, 921, 937, 1008, 1019 },
+        ['xa '] = { 909, 912, 921, 937, 1008 },
+        ['xam'] = { 1019 },
+        ['xc'] = { 899, 1004 },
+        ['xce'] = { 899, 1004 },
+        ['xe'] = { 943 },
+        ['xi'] = { 975 },
+        ['xim'] = { 975 },
+        ['xo'] = { 1016 },
+        ['xor'] = { 1016 },
+        ['xp'] = { 1017 },
+        ['xpu'] = { 1017 },
+        ['xt'] = { 925 },
+        ['xth'] = { 925 },
+        ['y'] = { 898, 900, 903, 904, 905, 906, 908, 909, 910, 911, 913, 914, 916, 917, 918, 919, 923, 925, 928, 929, 930, 934, 935, 936, 937, 938, 941, 942, 945, 948, 949, 950, 952, 953, 954, 955, 956, 957, 958, 959, 960, 962, 963, 965, 966, 967, 968, 969, 970, 971, 973, 974, 976, 980, 981, 982, 984, 985, 986, 988, 991, 992, 993, 994, 995, 996, 997, 998, 1003, 1004, 1005, 1006, 1007, 1008, 1011, 1012, 1013, 1014, 1015, 1016, 1017, 1018 },
+        ['y '] = { 911, 914, 928, 937, 941, 953, 954, 955, 956, 957, 960, 962, 980, 981, 984, 988, 1005, 1006, 1007, 1008, 1015, 1017 },
+        ['y b'] = { 960 },
+        ['y c'] = { 953, 954, 955, 956, 957, 960, 980, 981, 1005, 1006, 1007, 1008 },
+        ['y h'] = { 928 },
+        ['y i'] = { 984, 1017 },
+        ['y m'] = { 911, 914, 1015 },
+        ['y n'] = { 1015 },
+        ['y s'] = { 941, 962, 988 },
+        ['y t'] = { 937 },
+        ["y'"] = { 911 },
+        ["y's"] = { 911 },
+        ['ya'] = { 900, 905, 918, 966, 985, 992, 1005, 1014 },
+        ['yad'] = { 985 },
+        ['yag'] = { 918 },
+        ['yak'] = { 966 },
+        ['yal'] = { 905 },
+        ['yam'] = { 900, 918, 992, 1005 },
+        ['yb'] = { 984 },
+        ['ybr'] = { 984 },
+        ['yc'] = { 917, 929, 954, 1011 },
+        ['ych'] = { 1011 },
+        ['ycl'] = { 917, 929, 954 },
+        ['ye'] = { 900, 908, 938, 942, 963, 967, 976, 997, 1005, 1018 },
+        ['yee'] = { 976 },
+        ['yg'] = { 970, 992, 993, 998 },
+        ['ygi'] = { 970 },
+        ['ygn'] = { 992, 993, 998 },
+        ['yi'] = { 913, 945, 950, 1011, 1013 },
+        ['yin'] = { 913, 945, 950, 1011, 1013 },
+        ['yl'] = { 935, 981 },
+        ['ylv'] = { 981 },
+        ['yn'] = { 958, 965, 974 },
+        ['yna'] = { 965 },
+        ['yne'] = { 974 },
+        ['ynt'] = { 958 },
+        ['yo'] = { 918, 980, 991, 992, 1003, 1005, 1018 },
+        ['yon'] = { 918, 992 },
+        ['yor'] = { 980, 1018 },
+        ['yos'] = { 1003 },
+        ['yot'] = { 918 },
+        ['yow'] = { 991 },
+        ['yp'] = { 929 },
+        ['yph'] = { 929 },
+        ['yr'] = { 929, 955, 988, 1004 },
+        ['yre'] = { 929, 988, 1004 },
+        ['ys'] = { 906, 959, 971, 1011, 1015 },
+        ['ysi'] = { 959, 971 },
+        ['yss'] = { 906 },
+        ['yst'] = { 1011, 1015 },
+        ['yt'] = { 919, 934 },
+        ['yth'] = { 919, 934 },
+        ['yu'] = { 900, 908, 942, 996, 1003 },
+        ['yuk'] = { 900, 908, 942, 996 },
+        ['yur'] = { 1003 },
+        ['yz'] = { 898, 904, 909, 916, 925, 949, 965, 968, 995, 1004, 1017 },
+        ['yze'] = { 898, 904, 909, 916, 925, 949, 965, 995, 1004, 1017 },
+        ['yzi'] = { 968 },
+        ['z'] = { 898, 900, 904, 906, 908, 909, 914, 915, 916, 919, 920, 924, 925, 928, 942, 945, 947, 949, 958, 959, 965, 968, 974, 984, 986, 995, 996, 1004, 1010, 1013, 1014, 1015, 1016, 1017 },
+        ['z '] = { 945, 947 },
+        ['z i'] = { 945, 947 },
+        ['z v'] = { 947 },
+        ['za'] = { 908, 924, 928, 974 },
+        ['zaf'] = { 928 },
+        ['zag'] = { 974 },
+        ['zak'] = { 908 },
+        ['zar'] = { 924 },
+        ['zaz'] = { 924 },
+        ['ze'] = { 898, 900, 904, 906, 908, 909, 916, 919, 925, 942, 949, 958, 959, 965, 974, 995, 996, 1004, 1010, 1014, 1016, 1017 },
+        ['ze '] = { 919 },
+        ['zeb'] = { 906, 974 },
+        ['zei'] = { 906, 1010 },
+        ['zem'] = { 1016 },
+        ['zen'] = { 908, 996, 1014 },
+        ['zer'] = { 958 },
+        ['zi'] = { 959, 968, 986 },
+        ['zie'] = { 986 },
+        ['zin'] = { 968 },
+        ['zio'] = { 959 },
+        ['zl'] = { 920 },
+        ['zle'] = { 920 },
+        ['zo'] = { 914, 928 },
+        ['zon'] = { 928 },
+        ['zy'] = { 984 },
+        ['zz'] = { 920, 974 },
+        ['zza'] = { 974 },
+        ['zzl'] = { 920 },
+    },
+}
+
+return searchIndex
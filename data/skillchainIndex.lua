@@ -0,0 +1,435 @@
+-- Auto-generated skillchain index from FFXI Wiki
+-- Source: https://www.bg-wiki.com/ffxi/Category:Trust
+-- Generated: 2026-10-17
+
+local skillchainIndex = {
+    -- Weapon skill -> skillchain properties, empty when it does not skillchain
+    weaponSkills = {
+        ['Dimidiation'] = { 'Light', 'Fragmentation' },
+        ['Power Slash'] = { 'Transfixion' },
+        ['Sickle Moon'] = { 'Scission', 'Impaction' },
+        ['Chant du Cygne'] = { 'Light', 'Distortion' },
+        ['Vorpal Blade'] = { 'Scission', 'Impaction' },
+        ['Dominion Slash'] = {},
+        ['Arrogance Incarnate'] = {},
+        ['Swift Blade'] = { 'Gravitation' },
+        ['Cross Reaver'] = {},
+        ['Alabaster Burst'] = { 'Distortion', 'Detonation' },
+        ['Null Field'] = { 'Fusion', 'Transfixion' },
+        ['Tartaric Sigil'] = { 'Compression', 'Scission' },
+        ['Fulminous Fury'] = { 'Fragmentation', 'Scission' },
+        ['Noble Frenzy'] = { 'Gravitation', 'Scission' },
+        ['No Quarter'] = { 'Light', 'Distortion' },
+        ['Red Lotus Blade'] = { 'Liquefaction', 'Detonation' },
+        ['Seraph Blade'] = { 'Scission' },
+        ['Happobarai'] = { 'Reverberation', 'Impaction' },
+        ['Hane Fubuki'] = { 'Transfixion' },
+        ['Shibaraku'] = { 'Dark', 'Gravitation' },
+        ['Chimera Ripper'] = { 'Induration', 'Detonation' },
+        ['String Clipper'] = { 'Scission', 'Impaction' },
+        ['Shield Subverter'] = { 'Light', 'Fusion' },
+        ['Fast Blade'] = { 'Scission' },
+        ['Savage Blade'] = { 'Fragmentation', 'Scission' },
+        ['Ground Strike'] = { 'Fragmentation', 'Distortion' },
+        ['Victory Beacon'] = { 'Light', 'Distortion' },
+        ['Royal Bash'] = {},
+        ['Royal Savior'] = {},
+        ['Circle Blade'] = { 'Reverberation', 'Impaction' },
+        ['Sanguine Blade'] = {},
+        ['Uriel Blade'] = { 'Light', 'Fragmentation' },
+        ['Blank Gaze'] = {},
+        ['Antiphase'] = {},
+        ['Uppercut'] = { 'Liquefaction', 'Impaction' },
+        ['Blow'] = {},
+        ['Combo'] = { 'Impaction' },
+        ['Backhand Blow'] = { 'Detonation' },
+        ['Salaheem Spirit'] = {},
+        ['Lock and Load'] = { 'Fusion', 'Reverberation' },
+        ['Shockstorm Edge'] = { 'Impaction', 'Detonation' },
+        ['Iniquitous Stab'] = { 'Gravitation', 'Transfixion' },
+        ['Choreographed Carnage'] = { 'Dark', 'Distortion' },
+        ["Sarva's Storm"] = { 'Dark', 'Distortion' },
+        ['Hurricane Wing'] = { 'Scission', 'Detonation' },
+        ['Dragon Breath'] = { 'Light', 'Fusion' },
+        ['Tachi: Fudo'] = { 'Light', 'Distortion' },
+        ['Tachi: Gekko'] = { 'Distortion', 'Reverberation' },
+        ['Tachi: Yukikaze'] = { 'Induration', 'Detonation' },
+        ['Dragonfall'] = {},
+        ['Cloudsplitter'] = { 'Dark', 'Fragmentation' },
+        ['Calamity'] = { 'Scission', 'Impaction' },
+        ['Rampage'] = { 'Scission' },
+        ['Havoc Spiral'] = {},
+        ['Tachi: Enpi'] = { 'Transfixion', 'Scission' },
+        ['Tachi: Hobaku'] = { 'Induration' },
+        ['Tachi: Goten'] = { 'Transfixion', 'Impaction' },
+        ['Tachi: Kagero'] = { 'Liquefaction' },
+        ['Tachi: Koki'] = { 'Reverberation', 'Impaction' },
+        ['Tachi: Mudo'] = { 'Distortion' },
+        ['Tachi: Ageha'] = { 'Compression' },
+        ['Wild Oats'] = { 'Transfixion' },
+        ['Headbutt'] = {},
+        ['Photosynthesis'] = {},
+        ['Petal Pirouette'] = {},
+        ['Feast of Arrows'] = { 'Gravitation', 'Transfixion' },
+        ['Last Laugh'] = { 'Dark', 'Gravitation' },
+        ['Regurgitated Swarm'] = { 'Fusion', 'Compression' },
+        ['Setting the Stage'] = { 'Gravitation', 'Induration' },
+        ['Sharp Eye'] = {},
+        ['Tripe Gripe'] = {},
+        ['Pocket Sand'] = {},
+        ['True Strike'] = { 'Detonation', 'Impaction' },
+        ['Hexa Strike'] = { 'Fusion' },
+        ['Fiery Tailings'] = { 'Light', 'Fusion' },
+        ['Critical Mass'] = { 'Fusion', 'Impaction' },
+        ['Howling Gust'] = { 'Fragmentation', 'Compression' },
+        ['Starward Yowl'] = { 'Gravitation', 'Reverberation' },
+        ['Righteous Rasp'] = { 'Fusion', 'Transfixion' },
+        ['Aurous Charge'] = { 'Liquefaction', 'Transfixion' },
+        ['Stalking Prey'] = { 'Light', 'Fragmentation' },
+        ['Double Thrust'] = { 'Transfixion' },
+        ['Leg Sweep'] = { 'Impaction' },
+        ['Penta Thrust'] = { 'Compression' },
+        ['Songbird Swoop'] = { 'Reverberation', 'Impaction' },
+        ['Gyre Strike'] = { 'Fragmentation' },
+        ['Orcsbane'] = { 'Light', 'Distortion' },
+        ["Stag's Charge"] = { 'Gravitation', 'Induration' },
+        ['Bomb Toss'] = { 'Liquefaction', 'Detonation' },
+        ['Goblin Rush'] = { 'Fusion', 'Impaction' },
+        ['Skewer'] = { 'Transfixion', 'Impaction' },
+        ['Impulse Drive'] = { 'Gravitation', 'Induration' },
+        ["Celidon's Torment"] = { 'Light', 'Fragmentation' },
+        ['Iainuki'] = { 'Light', 'Fragmentation' },
+        ['Tachi: Kamai'] = { 'Gravitation', 'Scission' },
+        ['Raiden Thrust'] = { 'Transfixion', 'Impaction' },
+        ['Merciless Strike'] = { 'Detonation', 'Impaction' },
+        ['Moonlight'] = {},
+        ['Inexorable Strike'] = { 'Light', 'Fusion' },
+        ['Ruthlessness'] = {},
+        ['Raging Rush'] = { 'Induration', 'Reverberation' },
+        ['Steel Cyclone'] = { 'Distortion', 'Detonation' },
+        ["Soturi's Fury"] = { 'Light', 'Fragmentation' },
+        ['Amatsu: Hanadoki'] = { 'Reverberation', 'Impaction' },
+        ['Amatsu: Choun'] = { 'Liquefaction' },
+        ['Amatsu: Fuga'] = { 'Impaction' },
+        ['Amatsu: Gachirin'] = { 'Light', 'Fragmentation' },
+        ['Amatsu: Kyori'] = { 'Induration' },
+        ['Amatsu: Suien'] = { 'Fusion' },
+        ['Rise From Ashes'] = {},
+        ['Shield Break'] = { 'Impaction' },
+        ['Armor Break'] = { 'Impaction' },
+        ['Dancing Edge'] = { 'Scission', 'Detonation' },
+        ['Evisceration'] = { 'Gravitation', 'Transfixion' },
+        ['Temblor Blade'] = { 'Reverberation', 'Impaction' },
+        ['Iridal Pierce'] = { 'Light', 'Fragmentation' },
+        ['Lunar Revolution'] = { 'Gravitation', 'Reverberation' },
+        ['Debonair Rush'] = { 'Scission', 'Detonation' },
+        ['Inspirit'] = {},
+        ['Raging Fists'] = { 'Impaction' },
+        ['Dragon Kick'] = { 'Fragmentation' },
+        ['Asuran Fists'] = { 'Gravitation', 'Liquefaction' },
+        ['Spinning Axe'] = { 'Liquefaction', 'Scission', 'Impaction' },
+        ['Onslaught'] = { 'Dark', 'Gravitation' },
+        ['Decimation'] = { 'Fusion', 'Reverberation' },
+        ['Whirling Edge'] = { 'Distortion', 'Reverberation' },
+        ["Dancer's Fury"] = { 'Fragmentation', 'Scission' },
+        ['Rousing Samba'] = {},
+        ['Sensual Dance'] = {},
+        ['Thorn Dance'] = {},
+        ['Vivifying Waltz'] = {},
+        ['Walk the Plank'] = { 'Light', 'Distortion' },
+        ['Pirate Pummel'] = { 'Fusion', 'Impaction' },
+        ['Powder Keg'] = { 'Fusion', 'Compression' },
+        ['Grapeshot'] = { 'Reverberation', 'Transfixion' },
+        ['Bisection'] = { 'Scission', 'Detonation' },
+        ['Akimbo Shot'] = { 'Compression' },
+        ['Leaden Salute'] = { 'Gravitation', 'Transfixion' },
+        ['Grisly Horizon'] = { 'Dark', 'Distortion' },
+        ['One-Ilm Punch'] = { 'Compression' },
+        ['Howling Fist'] = { 'Transfixion', 'Impaction' },
+        ['Bear Killer'] = { 'Reverberation', 'Impaction' },
+        ['Hollow Smite'] = { 'Light', 'Fragmentation' },
+        ['Blade: Rin'] = { 'Transfixion' },
+        ['Blade: Retsu'] = { 'Scission' },
+        ['Blade: Ei'] = { 'Compression' },
+        ['Blade: Jin'] = { 'Impaction', 'Detonation' },
+        ['Blade: Ten'] = { 'Gravitation' },
+        ['Blade: Ku'] = { 'Gravitation', 'Transfixion' },
+        ['Blade: Kamu'] = { 'Fragmentation', 'Compression' },
+        ['Blade: Hi'] = { 'Dark', 'Gravitation' },
+        ['Blade: Shun'] = { 'Fusion', 'Impaction' },
+        ['Coming Up Roses'] = { 'Light', 'Fusion' },
+        ['Light Blade'] = { 'Light', 'Fusion' },
+        ['Stellar Burst'] = { 'Dark', 'Gravitation' },
+        ['Great Wheel'] = { 'Fragmentation', 'Scission' },
+        ['Vortex'] = { 'Distortion', 'Reverberation' },
+        ['12 Blades of Remorse'] = { 'Light', 'Distortion' },
+        ['Into the Light'] = { 'Fusion', 'Impaction' },
+        ['Arduous Decision'] = { 'Fragmentation', 'Compression' },
+        ['Camaraderie of the Crevasse'] = { 'Detonation', 'Impaction' },
+        ['Skullbreaker'] = { 'Induration', 'Reverberation' },
+        ['Black Halo'] = { 'Fragmentation', 'Compression' },
+        ['Peacebreaker'] = { 'Distortion', 'Reverberation' },
+        ['Nott'] = {},
+        ['Justicebreaker'] = { 'Dark', 'Gravitation' },
+        ['Burning Blade'] = { 'Liquefaction' },
+        ['Wasp Sting'] = { 'Scission' },
+        ['King Cobra Clamp'] = { 'Fragmentation', 'Distortion' },
+        ['Imperial Authority'] = { 'Fragmentation', 'Distortion' },
+        ['Tachi: Kaiten'] = { 'Light', 'Fragmentation' },
+        ['Knuckle Sandwich'] = { 'Fusion', 'Compression' },
+        ['Nullifying Dropkick'] = { 'Induration', 'Detonation', 'Impaction' },
+        ['Auroral Uppercut'] = { 'Light', 'Fragmentation' },
+        ['Cobra Clamp'] = { 'Fragmentation', 'Distortion' },
+        ['Tongue Lash'] = {},
+        ['Luminous Lance'] = { 'Light', 'Fusion' },
+        ['Rejuvenation'] = {},
+        ['Revelation'] = { 'Fusion', 'Transfixion' },
+        ['Wheeling Thrust'] = { 'Fusion' },
+        ['Amatsu: Torimai'] = { 'Transfixion', 'Scission' },
+        ['Amatsu: Kazakiri'] = { 'Scission', 'Detonation' },
+        ['Amatsu: Yukiarashi'] = { 'Induration', 'Detonation' },
+        ['Amatsu: Tsukioboro'] = { 'Distortion', 'Reverberation' },
+        ['Amatsu: Hanaikusa'] = { 'Fusion', 'Compression' },
+        ['Amatsu: Tsukikage'] = { 'Dark', 'Fragmentation' },
+        ["Sinner's Cross"] = { 'Gravitation', 'Scission' },
+        ['Ravenous Assault'] = {},
+        ['Frenzied Thrust'] = { 'Fragmentation', 'Transfixion' },
+        ['Open Coffin'] = { 'Fusion', 'Compression' },
+        ['Hemocladis'] = { 'Dark', 'Distortion' },
+        ['Judgment'] = { 'Impaction' },
+        ['Berserk-Ruf'] = {},
+        ['Spirits Within'] = {},
+        ['Meteoric Impact'] = { 'Dark', 'Fragmentation' },
+        ['Freezebite'] = { 'Induration', 'Detonation' },
+        ['Abyssal Drain'] = {},
+        ['Abyssal Strike'] = {},
+        ['Coronach'] = { 'Dark', 'Fragmentation' },
+        ['Slug Shot'] = { 'Reverberation', 'Transfixion', 'Detonation' },
+        ['Heavy Shot'] = { 'Fusion' },
+        ['Split Shot'] = { 'Reverberation', 'Transfixion' },
+        ['Sidewinder'] = { 'Reverberation', 'Transfixion', 'Detonation' },
+        ['Empyreal Arrow'] = { 'Fusion', 'Transfixion' },
+        ['Dulling Arrow'] = { 'Liquefaction', 'Transfixion' },
+        ['Flaming Arrow'] = { 'Liquefaction', 'Transfixion' },
+        ['Arching Arrow'] = { 'Fusion' },
+        ['Refulgent Arrow'] = { 'Reverberation', 'Transfixion' },
+        ['Piercing Arrow'] = { 'Reverberation', 'Transfixion' },
+        ['Cyclone'] = { 'Detonation', 'Impaction' },
+        ['Typhonic Arrow'] = { 'Light', 'Fragmentation' },
+        ['Stellar Arrow'] = { 'Dark', 'Gravitation' },
+        ['Lux Arrow'] = { 'Fragmentation', 'Distortion' },
+        ['Oisoya'] = { 'Light', 'Distortion' },
+        ['Binding Microtube'] = { 'Gravitation', 'Induration' },
+        ['Paralyzing Microtube'] = { 'Induration', 'Reverberation' },
+        ['Silencing Microtube'] = { 'Liquefaction', 'Detonation' },
+        ['Twirling Dervish'] = { 'Light', 'Fusion' },
+        ['Guillotine'] = { 'Induration' },
+        ['Amon Drive'] = {},
+        ['Cross Reaper'] = { 'Distortion' },
+        ['Shadow of Death'] = { 'Induration', 'Reverberation' },
+        ['Salvation Scythe'] = { 'Dark' },
+        ['Spinning Scythe'] = { 'Reverberation', 'Scission' },
+        ['Spiral Hell'] = { 'Distortion', 'Scission' },
+        ['Salamander Flame'] = { 'Light', 'Fusion' },
+        ['Vorpal Scythe'] = { 'Transfixion', 'Scission' },
+        ['Seraph Strike'] = { 'Impaction' },
+        ['Gate of Tartarus'] = { 'Dark', 'Distortion' },
+        ['Tartarus Torpor'] = {},
+        ['Sunburst'] = { 'Compression', 'Reverberation' },
+        ['Herculean Slash'] = { 'Induration', 'Detonation', 'Impaction' },
+        ['Shockwave'] = { 'Reverberation' },
+        ['Spine Chiller'] = { 'Distortion', 'Detonation' },
+        ['Lovely Miracle Waltz'] = { 'Liquefaction', 'Scission', 'Impaction' },
+        ['Shining Summer Samba'] = { 'Liquefaction', 'Transfixion' },
+        ['Neo Crystal Jig'] = { 'Fusion', 'Transfixion' },
+        ['Super Crusher Jig'] = { 'Gravitation', 'Reverberation' },
+        ['Eternal Vana Illusion'] = { 'Fusion' },
+        ['Final Eternal Heart'] = { 'Fragmentation' },
+        ['Sixth Element'] = { 'Dark', 'Gravitation' },
+        ['Knockout'] = { 'Scission', 'Detonation' },
+        ['Slapstick'] = { 'Reverberation', 'Impaction' },
+        ['Spirit Taker'] = {},
+        ['Null Blast'] = { 'Fusion', 'Compression' },
+        ['Quietus Sphere'] = { 'Dark', 'Gravitation' },
+        ['Baneful Blades'] = {},
+        ['Depraved Dandia'] = {},
+        ['Dryad Kiss'] = {},
+        ['Matriarchal Fiat'] = {},
+        ['Wildwood Indignation'] = {},
+        ['Lesson in Pain'] = { 'Distortion', 'Scission' },
+        ['Empirical Research'] = { 'Fragmentation', 'Transfixion' },
+        ['Final Exam'] = { 'Light', 'Fusion' },
+        ['Doctor’s Orders'] = { 'Dark', 'Gravitation' },
+        ['Bored to Tears'] = {},
+        ['Envoutement'] = {},
+        ['Memento Mori'] = {},
+        ['Silence Seal'] = {},
+        ['Randgrith'] = { 'Light', 'Fragmentation' },
+        ['Starburst'] = { 'Compression', 'Reverberation' },
+        ['Howling Moon'] = { 'Dark', 'Distortion' },
+        ['Lunar Bay'] = { 'Gravitation', 'Transfixion' },
+        ['Starlight'] = {},
+        ['Brainshaker'] = { 'Reverberation' },
+        ['Scouring Bubbles'] = { 'Dark', 'Distortion' },
+        ['Deific Gambol'] = {},
+        ['Phototropic Blessing'] = {},
+        ['Phototropic Wrath'] = {},
+        ['Sacred Caper'] = {},
+        ['Guiding Light'] = {},
+        ['Illustrious Aid'] = {},
+        ['Dynastic Gravitas'] = {},
+        ['Expunge Magic'] = { 'Distortion', 'Scission' },
+        ['Harmonic Displacement'] = { 'Fusion', 'Reverberation' },
+        ['Darkest Hour'] = { 'Gravitation', 'Liquefaction' },
+        ['Sight Unseen'] = { 'Fragmentation', 'Compression' },
+        ['Unceasing Dread'] = {},
+        ['Dignified Awe'] = {},
+        ["Naakual's Vengeance"] = { 'Light', 'Fusion' },
+        ['Bludgeon'] = { 'Fusion', 'Liquefaction' },
+        ['Shuffle'] = {},
+        ['Deal Out'] = {},
+        ['Double Down'] = {},
+        ['Sniper Shot'] = { 'Liquefaction', 'Transfixion' },
+        ['Detonator'] = { 'Fusion', 'Transfixion' },
+    },
+    -- Trust -> weapon skill -> skillchain properties, for the weapon skills whose properties differ
+    -- between trusts and are not in weaponSkills
+    trustWeaponSkills = {
+        ['Ark Angel GK'] = { ['Tachi: Kasha'] = { 'Fusion', 'Compression' } },
+        ['Ayame'] = { ['Tachi: Kasha'] = { 'Fusion', 'Compression' }, ['Tachi: Jinpu'] = { 'Scission', 'Detonation' } },
+        ['Ayame (UC)'] = { ['Tachi: Kasha'] = { 'Fusion' }, ['Tachi: Jinpu'] = { 'Scission' } },
+        ['Gilgamesh'] = { ['Tachi: Kasha'] = { 'Fusion', 'Compression' } },
+        ['Noillurie'] = { ['Tachi: Kasha'] = { 'Fusion', 'Compression' }, ['Tachi: Jinpu'] = { 'Scission', 'Detonation' } },
+    },
+    -- Trust -> weapon skills
+    trusts = {
+        ['Amchuchu'] = { 'Dimidiation', 'Power Slash', 'Sickle Moon' },
+        ['Ark Angel EV'] = { 'Chant du Cygne', 'Vorpal Blade', 'Dominion Slash', 'Arrogance Incarnate' },
+        ['Ark Angel HM'] = { 'Chant du Cygne', 'Swift Blade', 'Cross Reaver' },
+        ['August'] = { 'Alabaster Burst', 'Null Field', 'Tartaric Sigil', 'Fulminous Fury', 'Noble Frenzy', 'No Quarter' },
+        ['Curilla'] = { 'Red Lotus Blade', 'Seraph Blade', 'Swift Blade', 'Vorpal Blade' },
+        ['Gessho'] = { 'Happobarai', 'Hane Fubuki', 'Shibaraku' },
+        ['Mnejing'] = { 'Chimera Ripper', 'String Clipper', 'Shield Subverter' },
+        ['Rahal'] = { 'Fast Blade', 'Seraph Blade', 'Swift Blade', 'Savage Blade' },
+        ['Rughadjeen'] = { 'Power Slash', 'Sickle Moon', 'Ground Strike', 'Victory Beacon' },
+        ['Trion'] = { 'Red Lotus Blade', 'Savage Blade', 'Royal Bash', 'Royal Savior' },
+        ['Valaineral'] = { 'Circle Blade', 'Sanguine Blade', 'Savage Blade', 'Uriel Blade' },
+        ['Abenzio'] = { 'Blank Gaze', 'Antiphase', 'Uppercut', 'Blow' },
+        ['Abquhbah'] = { 'Combo', 'Backhand Blow', 'Salaheem Spirit' },
+        ['Aldo'] = { 'Lock and Load', 'Shockstorm Edge', 'Iniquitous Stab', 'Choreographed Carnage' },
+        ['Aldo (UC)'] = { "Sarva's Storm" },
+        ['Areuhat'] = { 'Seraph Blade', 'Vorpal Blade', 'Savage Blade', 'Hurricane Wing', 'Dragon Breath' },
+        ['Ark Angel GK'] = { 'Tachi: Fudo', 'Tachi: Gekko', 'Tachi: Kasha', 'Tachi: Yukikaze', 'Dragonfall' },
+        ['Ark Angel MR'] = { 'Cloudsplitter', 'Calamity', 'Rampage', 'Havoc Spiral' },
+        ['Ayame'] = { 'Tachi: Enpi', 'Tachi: Hobaku', 'Tachi: Goten', 'Tachi: Kagero', 'Tachi: Jinpu', 'Tachi: Koki', 'Tachi: Yukikaze', 'Tachi: Gekko', 'Tachi: Kasha' },
+        ['Ayame (UC)'] = { 'Tachi: Jinpu', 'Tachi: Koki', 'Tachi: Mudo', 'Tachi: Kasha', 'Tachi: Ageha' },
+        ['Babban Mheillea'] = { 'Wild Oats', 'Headbutt', 'Photosynthesis', 'Petal Pirouette' },
+        ['Balamor'] = { 'Feast of Arrows', 'Last Laugh', 'Regurgitated Swarm', 'Setting the Stage' },
+        ['Chacharoon'] = { 'Sharp Eye', 'Tripe Gripe', 'Pocket Sand' },
+        ['Cid'] = { 'True Strike', 'Hexa Strike', 'Fiery Tailings', 'Critical Mass' },
+        ['Darrcuiln'] = { 'Howling Gust', 'Starward Yowl', 'Righteous Rasp', 'Aurous Charge', 'Stalking Prey' },
+        ['Excenmille'] = { 'Double Thrust', 'Leg Sweep', 'Penta Thrust' },
+        ['Excenmille (S)'] = { 'Songbird Swoop', 'Gyre Strike', 'Orcsbane', "Stag's Charge" },
+        ['Fablinix'] = { 'Bomb Toss', 'Goblin Rush' },
+        ['Flaviria (UC)'] = { 'Skewer', 'Impulse Drive', "Celidon's Torment" },
+        ['Gilgamesh'] = { 'Tachi: Goten', 'Tachi: Kasha', 'Iainuki', 'Tachi: Kamai' },
+        ['Halver'] = { 'Penta Thrust', 'Impulse Drive', 'Raiden Thrust' },
+        ['Ingrid II'] = { 'Merciless Strike', 'Moonlight', 'Inexorable Strike', 'Ruthlessness' },
+        ['Invincible Shield (UC)'] = { 'Raging Rush', 'Steel Cyclone', "Soturi's Fury" },
+        ['Iroha'] = { 'Amatsu: Hanadoki', 'Amatsu: Choun', 'Amatsu: Fuga', 'Amatsu: Gachirin' },
+        ['Iroha II'] = { 'Amatsu: Kyori', 'Amatsu: Hanadoki', 'Amatsu: Suien', 'Amatsu: Gachirin', 'Rise From Ashes' },
+        ['Iron Eater'] = { 'Shield Break', 'Armor Break', 'Steel Cyclone' },
+        ['Jakoh Wahcondalo (UC)'] = { 'Dancing Edge', 'Evisceration', "Sarva's Storm" },
+        ['Klara'] = { 'Fast Blade', 'Vorpal Blade', 'Savage Blade', 'Temblor Blade' },
+        ['Lehko Habhoka'] = { 'Iridal Pierce', 'Lunar Revolution', 'Debonair Rush', 'Inspirit' },
+        ['Lhe Lhangavo'] = { 'Backhand Blow', 'Raging Fists', 'Dragon Kick', 'Asuran Fists' },
+        ['Lhu Mhakaracca'] = { 'Spinning Axe', 'Rampage', 'Onslaught', 'Decimation' },
+        ['Lilisette'] = { 'Whirling Edge', "Dancer's Fury", 'Rousing Samba', 'Sensual Dance', 'Thorn Dance', 'Vivifying Waltz' },
+        ['Lilisette II'] = { 'Whirling Edge', "Dancer's Fury", 'Vivifying Waltz' },
+        ['Lion'] = { 'Walk the Plank', 'Pirate Pummel', 'Powder Keg', 'Grapeshot' },
+        ['Lion II'] = { 'Walk the Plank', 'Pirate Pummel', 'Powder Keg', 'Grapeshot' },
+        ['Luzaf'] = { 'Bisection', 'Akimbo Shot', 'Leaden Salute', 'Grisly Horizon' },
+        ['Maat'] = { 'Asuran Fists', 'One-Ilm Punch', 'Combo', 'Dragon Kick', 'Howling Fist', 'Bear Killer' },
+        ['Maat (UC)'] = { 'Hollow Smite' },
+        ['Matsui-P'] = { 'Blade: Rin', 'Blade: Retsu', 'Blade: Ei', 'Blade: Jin', 'Blade: Ten', 'Blade: Ku', 'Blade: Kamu', 'Blade: Hi', 'Blade: Shun' },
+        ['Maximilian'] = { 'Fast Blade', 'Vorpal Blade', 'Swift Blade' },
+        ['Mayakov'] = { 'Coming Up Roses', 'Fast Blade', 'Swift Blade', 'Vorpal Blade' },
+        ['Mildaurion'] = { 'Light Blade', 'Stellar Burst', 'Great Wheel', 'Vortex' },
+        ['Morimar'] = { '12 Blades of Remorse', 'Into the Light', 'Arduous Decision', 'Camaraderie of the Crevasse' },
+        ['Mumor'] = { 'Skullbreaker' },
+        ['Naja Salaheem'] = { 'True Strike', 'Black Halo', 'Hexa Strike', 'Peacebreaker' },
+        ['Naja Salaheem (UC)'] = { 'Peacebreaker', 'Hexa Strike', 'Nott', 'Black Halo', 'Justicebreaker' },
+        ['Naji'] = { 'Burning Blade', 'Red Lotus Blade', 'Vorpal Blade' },
+        ['Nanaa Mihgo'] = { 'Wasp Sting', 'Dancing Edge', 'King Cobra Clamp' },
+        ['Nashmeira'] = { 'Imperial Authority' },
+        ['Noillurie'] = { 'Tachi: Jinpu', 'Tachi: Yukikaze', 'Tachi: Gekko', 'Tachi: Kasha', 'Tachi: Kaiten' },
+        ['Prishe'] = { 'Knuckle Sandwich', 'Nullifying Dropkick', 'Auroral Uppercut' },
+        ['Prishe II'] = { 'Knuckle Sandwich', 'Nullifying Dropkick', 'Auroral Uppercut' },
+        ['Rainemard'] = { 'Burning Blade', 'Red Lotus Blade', 'Vorpal Blade', 'Savage Blade' },
+        ['Romaa Mihgo'] = { 'Fast Blade', 'Vorpal Blade', 'Savage Blade', 'Cobra Clamp' },
+        ['Rongelouts'] = { 'Tongue Lash', 'Red Lotus Blade', 'Savage Blade', 'Seraph Blade' },
+        ["Selh'teus"] = { 'Luminous Lance', 'Rejuvenation', 'Revelation' },
+        ['Shikaree Z'] = { 'Raiden Thrust', 'Skewer', 'Wheeling Thrust', 'Impulse Drive' },
+        ['Tenzen'] = { 'Amatsu: Torimai', 'Amatsu: Kazakiri', 'Amatsu: Yukiarashi', 'Amatsu: Tsukioboro', 'Amatsu: Hanaikusa', 'Amatsu: Tsukikage' },
+        ['Teodor'] = { "Sinner's Cross", 'Ravenous Assault', 'Frenzied Thrust', 'Open Coffin', 'Hemocladis' },
+        ['Uka Totlihn'] = { 'Judgment' },
+        ['Volker'] = { 'Berserk-Ruf', 'Fast Blade', 'Savage Blade', 'Spirits Within', 'Vorpal Blade' },
+        ['Zazarg'] = { 'Howling Fist', 'Dragon Kick', 'Asuran Fists', 'Meteoric Impact' },
+        ['Zeid'] = { 'Freezebite', 'Ground Strike', 'Abyssal Drain', 'Abyssal Strike' },
+        ['Zeid II'] = { 'Ground Strike' },
+        ['Elivira'] = { 'Coronach', 'Slug Shot', 'Heavy Shot', 'Split Shot' },
+        ['Makki-Chebukki'] = { 'Sidewinder', 'Empyreal Arrow', 'Dulling Arrow', 'Flaming Arrow' },
+        ['Margret'] = { 'Sidewinder', 'Arching Arrow', 'Refulgent Arrow', 'Piercing Arrow' },
+        ['Najelith'] = { 'Cyclone', 'Sidewinder', 'Empyreal Arrow', 'Typhonic Arrow' },
+        ['Semih Lafihna'] = { 'Sidewinder', 'Arching Arrow', 'Stellar Arrow', 'Lux Arrow' },
+        ['Tenzen II'] = { 'Oisoya' },
+        ['Adelheid'] = { 'Binding Microtube', 'Paralyzing Microtube', 'Silencing Microtube', 'Twirling Dervish' },
+        ['Ark Angel TT'] = { 'Guillotine', 'Amon Drive' },
+        ['Domina Shantotto'] = { 'Guillotine', 'Cross Reaper', 'Shadow of Death', 'Salvation Scythe' },
+        ['Gadalar'] = { 'Spinning Scythe', 'Spiral Hell', 'Salamander Flame', 'Vorpal Scythe' },
+        ['Ingrid'] = { 'Seraph Strike', 'Judgment', 'Hexa Strike' },
+        ['Kayeel-Payeel'] = { 'Gate of Tartarus', 'Tartarus Torpor', 'Sunburst' },
+        ['Leonoyne'] = { 'Freezebite', 'Herculean Slash', 'Shockwave', 'Spine Chiller' },
+        ['Mumor II'] = { 'Lovely Miracle Waltz', 'Shining Summer Samba', 'Neo Crystal Jig', 'Super Crusher Jig', 'Eternal Vana Illusion', 'Final Eternal Heart' },
+        ['Ovjang'] = { 'Sixth Element', 'Knockout', 'Slapstick' },
+        ['Robel-Akbel'] = { 'Spirit Taker', 'Null Blast', 'Quietus Sphere' },
+        ['Rosulatia'] = { 'Baneful Blades', 'Depraved Dandia', 'Dryad Kiss', 'Matriarchal Fiat', 'Wildwood Indignation' },
+        ['Shantotto II'] = { 'Lesson in Pain', 'Empirical Research', 'Final Exam', 'Doctor’s Orders' },
+        ['Ullegore'] = { 'Bored to Tears', 'Envoutement', 'Memento Mori', 'Silence Seal' },
+        ['Apururu (UC)'] = { 'Nott' },
+        ['Ferreous Coffin'] = { 'Randgrith' },
+        ['Karaha-Baruha'] = { 'Spirit Taker', 'Sunburst', 'Starburst', 'Howling Moon', 'Lunar Bay' },
+        ['Kupipi'] = { 'Starlight', 'Moonlight' },
+        ['Mihli Aliapoh'] = { 'True Strike', 'Brainshaker', 'Hexa Strike', 'Scouring Bubbles' },
+        ['Nashmeira II'] = { 'Imperial Authority' },
+        ['Pieuje (UC)'] = { 'Starlight', 'Moonlight', 'Nott' },
+        ['Yoran-Oran (UC)'] = { 'Nott' },
+        ['Ygnas'] = { 'Deific Gambol', 'Phototropic Blessing', 'Phototropic Wrath', 'Sacred Caper' },
+        ['Arciela'] = { 'Guiding Light', 'Illustrious Aid', 'Dynastic Gravitas' },
+        ['Arciela II'] = { 'Expunge Magic', 'Harmonic Displacement', 'Darkest Hour', 'Sight Unseen', 'Unceasing Dread', 'Dignified Awe', "Naakual's Vengeance" },
+        ['King of Hearts'] = { 'Bludgeon', 'Shuffle', 'Deal Out', 'Double Down' },
+        ['Qultada'] = { 'Savage Blade', 'Burning Blade', 'Sniper Shot', 'Detonator' },
+        ['Sylvie (UC)'] = { 'Nott' },
+    },
+    -- Skillchain property -> trusts with a weapon skill that has it
+    elements = {
+        Compression = { 'August', 'Ark Angel GK', 'Ayame', 'Ayame (UC)', 'Balamor', 'Darrcuiln', 'Excenmille', 'Gilgamesh', 'Halver', 'Lion', 'Lion II', 'Luzaf', 'Maat', 'Matsui-P', 'Morimar', 'Naja Salaheem', 'Naja Salaheem (UC)', 'Noillurie', 'Prishe', 'Prishe II', 'Tenzen', 'Teodor', 'Kayeel-Payeel', 'Robel-Akbel', 'Karaha-Baruha', 'Arciela II' },
+        Dark = { 'Gessho', 'Aldo', 'Aldo (UC)', 'Ark Angel MR', 'Balamor', 'Jakoh Wahcondalo (UC)', 'Lhu Mhakaracca', 'Luzaf', 'Matsui-P', 'Mildaurion', 'Naja Salaheem (UC)', 'Tenzen', 'Teodor', 'Zazarg', 'Elivira', 'Semih Lafihna', 'Domina Shantotto', 'Kayeel-Payeel', 'Ovjang', 'Robel-Akbel', 'Shantotto II', 'Karaha-Baruha', 'Mihli Aliapoh' },
+        Detonation = { 'August', 'Curilla', 'Mnejing', 'Trion', 'Abquhbah', 'Aldo', 'Areuhat', 'Ark Angel GK', 'Ayame', 'Cid', 'Fablinix', 'Ingrid II', 'Invincible Shield (UC)', 'Iron Eater', 'Jakoh Wahcondalo (UC)', 'Lehko Habhoka', 'Lhe Lhangavo', 'Luzaf', 'Matsui-P', 'Morimar', 'Naja Salaheem', 'Naji', 'Nanaa Mihgo', 'Noillurie', 'Prishe', 'Prishe II', 'Rainemard', 'Rongelouts', 'Tenzen', 'Zeid', 'Elivira', 'Makki-Chebukki', 'Margret', 'Najelith', 'Semih Lafihna', 'Adelheid', 'Leonoyne', 'Ovjang', 'Mihli Aliapoh' },
+        Distortion = { 'Ark Angel EV', 'Ark Angel HM', 'August', 'Rughadjeen', 'Aldo', 'Aldo (UC)', 'Ark Angel GK', 'Ayame', 'Ayame (UC)', 'Excenmille (S)', 'Invincible Shield (UC)', 'Iron Eater', 'Jakoh Wahcondalo (UC)', 'Lilisette', 'Lilisette II', 'Lion', 'Lion II', 'Luzaf', 'Mildaurion', 'Morimar', 'Naja Salaheem', 'Naja Salaheem (UC)', 'Nanaa Mihgo', 'Nashmeira', 'Noillurie', 'Romaa Mihgo', 'Tenzen', 'Teodor', 'Zeid', 'Zeid II', 'Semih Lafihna', 'Tenzen II', 'Domina Shantotto', 'Gadalar', 'Kayeel-Payeel', 'Leonoyne', 'Shantotto II', 'Karaha-Baruha', 'Mihli Aliapoh', 'Nashmeira II', 'Arciela II' },
+        Fragmentation = { 'Amchuchu', 'August', 'Rahal', 'Rughadjeen', 'Trion', 'Valaineral', 'Areuhat', 'Ark Angel MR', 'Darrcuiln', 'Excenmille (S)', 'Flaviria (UC)', 'Gilgamesh', 'Invincible Shield (UC)', 'Iroha', 'Iroha II', 'Klara', 'Lehko Habhoka', 'Lhe Lhangavo', 'Lilisette', 'Lilisette II', 'Maat', 'Maat (UC)', 'Matsui-P', 'Mildaurion', 'Morimar', 'Naja Salaheem', 'Naja Salaheem (UC)', 'Nanaa Mihgo', 'Nashmeira', 'Noillurie', 'Prishe', 'Prishe II', 'Rainemard', 'Romaa Mihgo', 'Rongelouts', 'Tenzen', 'Teodor', 'Volker', 'Zazarg', 'Zeid', 'Zeid II', 'Elivira', 'Najelith', 'Semih Lafihna', 'Mumor II', 'Shantotto II', 'Ferreous Coffin', 'Nashmeira II', 'Arciela II', 'Qultada' },
+        Fusion = { 'August', 'Mnejing', 'Aldo', 'Areuhat', 'Ark Angel GK', 'Ayame', 'Ayame (UC)', 'Balamor', 'Cid', 'Darrcuiln', 'Fablinix', 'Gilgamesh', 'Ingrid II', 'Iroha II', 'Lhu Mhakaracca', 'Lion', 'Lion II', 'Matsui-P', 'Mayakov', 'Mildaurion', 'Morimar', 'Naja Salaheem', 'Naja Salaheem (UC)', 'Noillurie', 'Prishe', 'Prishe II', "Selh'teus", 'Shikaree Z', 'Tenzen', 'Teodor', 'Elivira', 'Makki-Chebukki', 'Margret', 'Najelith', 'Semih Lafihna', 'Adelheid', 'Gadalar', 'Ingrid', 'Mumor II', 'Robel-Akbel', 'Shantotto II', 'Mihli Aliapoh', 'Arciela II', 'King of Hearts', 'Qultada' },
+        Gravitation = { 'Ark Angel HM', 'August', 'Curilla', 'Gessho', 'Rahal', 'Aldo', 'Balamor', 'Darrcuiln', 'Excenmille (S)', 'Flaviria (UC)', 'Gilgamesh', 'Halver', 'Jakoh Wahcondalo (UC)', 'Lehko Habhoka', 'Lhe Lhangavo', 'Lhu Mhakaracca', 'Luzaf', 'Maat', 'Matsui-P', 'Maximilian', 'Mayakov', 'Mildaurion', 'Naja Salaheem (UC)', 'Shikaree Z', 'Teodor', 'Zazarg', 'Semih Lafihna', 'Adelheid', 'Mumor II', 'Ovjang', 'Robel-Akbel', 'Shantotto II', 'Karaha-Baruha', 'Arciela II' },
+        Impaction = { 'Amchuchu', 'Ark Angel EV', 'Curilla', 'Gessho', 'Mnejing', 'Rughadjeen', 'Valaineral', 'Abenzio', 'Abquhbah', 'Aldo', 'Areuhat', 'Ark Angel MR', 'Ayame', 'Ayame (UC)', 'Cid', 'Excenmille', 'Excenmille (S)', 'Fablinix', 'Flaviria (UC)', 'Gilgamesh', 'Halver', 'Ingrid II', 'Iroha', 'Iroha II', 'Iron Eater', 'Klara', 'Lhe Lhangavo', 'Lhu Mhakaracca', 'Lion', 'Lion II', 'Maat', 'Matsui-P', 'Maximilian', 'Mayakov', 'Morimar', 'Naja Salaheem', 'Naji', 'Prishe', 'Prishe II', 'Rainemard', 'Romaa Mihgo', 'Shikaree Z', 'Uka Totlihn', 'Volker', 'Zazarg', 'Najelith', 'Ingrid', 'Leonoyne', 'Mumor II', 'Ovjang', 'Mihli Aliapoh' },
+        Induration = { 'Mnejing', 'Ark Angel GK', 'Ayame', 'Balamor', 'Excenmille (S)', 'Flaviria (UC)', 'Halver', 'Invincible Shield (UC)', 'Iroha II', 'Mumor', 'Noillurie', 'Prishe', 'Prishe II', 'Shikaree Z', 'Tenzen', 'Zeid', 'Adelheid', 'Ark Angel TT', 'Domina Shantotto', 'Leonoyne' },
+        Light = { 'Amchuchu', 'Ark Angel EV', 'Ark Angel HM', 'August', 'Mnejing', 'Rughadjeen', 'Valaineral', 'Areuhat', 'Ark Angel GK', 'Cid', 'Darrcuiln', 'Excenmille (S)', 'Flaviria (UC)', 'Gilgamesh', 'Ingrid II', 'Invincible Shield (UC)', 'Iroha', 'Iroha II', 'Lehko Habhoka', 'Lion', 'Lion II', 'Maat (UC)', 'Mayakov', 'Mildaurion', 'Morimar', 'Noillurie', 'Prishe', 'Prishe II', "Selh'teus", 'Najelith', 'Tenzen II', 'Adelheid', 'Gadalar', 'Shantotto II', 'Ferreous Coffin', 'Arciela II' },
+        Liquefaction = { 'Curilla', 'Trion', 'Abenzio', 'Ayame', 'Darrcuiln', 'Fablinix', 'Iroha', 'Lhe Lhangavo', 'Lhu Mhakaracca', 'Maat', 'Naji', 'Rainemard', 'Rongelouts', 'Zazarg', 'Makki-Chebukki', 'Adelheid', 'Mumor II', 'Arciela II', 'King of Hearts', 'Qultada' },
+        Radiance = {},
+        Reverberation = { 'Gessho', 'Valaineral', 'Aldo', 'Ark Angel GK', 'Ayame', 'Ayame (UC)', 'Darrcuiln', 'Excenmille (S)', 'Invincible Shield (UC)', 'Iroha', 'Iroha II', 'Klara', 'Lehko Habhoka', 'Lhu Mhakaracca', 'Lilisette', 'Lilisette II', 'Lion', 'Lion II', 'Maat', 'Mildaurion', 'Mumor', 'Naja Salaheem', 'Naja Salaheem (UC)', 'Noillurie', 'Tenzen', 'Elivira', 'Makki-Chebukki', 'Margret', 'Najelith', 'Semih Lafihna', 'Adelheid', 'Domina Shantotto', 'Gadalar', 'Kayeel-Payeel', 'Leonoyne', 'Mumor II', 'Ovjang', 'Karaha-Baruha', 'Mihli Aliapoh', 'Arciela II' },
+        Scission = { 'Amchuchu', 'Ark Angel EV', 'August', 'Curilla', 'Mnejing', 'Rahal', 'Rughadjeen', 'Trion', 'Valaineral', 'Areuhat', 'Ark Angel MR', 'Ayame', 'Ayame (UC)', 'Gilgamesh', 'Jakoh Wahcondalo (UC)', 'Klara', 'Lehko Habhoka', 'Lhu Mhakaracca', 'Lilisette', 'Lilisette II', 'Luzaf', 'Matsui-P', 'Maximilian', 'Mayakov', 'Mildaurion', 'Naji', 'Nanaa Mihgo', 'Noillurie', 'Rainemard', 'Romaa Mihgo', 'Rongelouts', 'Tenzen', 'Teodor', 'Volker', 'Gadalar', 'Mumor II', 'Ovjang', 'Shantotto II', 'Arciela II', 'Qultada' },
+        Transfixion = { 'Amchuchu', 'August', 'Gessho', 'Rughadjeen', 'Aldo', 'Ayame', 'Babban Mheillea', 'Balamor', 'Darrcuiln', 'Excenmille', 'Flaviria (UC)', 'Gilgamesh', 'Halver', 'Jakoh Wahcondalo (UC)', 'Lion', 'Lion II', 'Luzaf', 'Maat', 'Matsui-P', "Selh'teus", 'Shikaree Z', 'Tenzen', 'Teodor', 'Zazarg', 'Elivira', 'Makki-Chebukki', 'Margret', 'Najelith', 'Semih Lafihna', 'Gadalar', 'Mumor II', 'Shantotto II', 'Karaha-Baruha', 'Qultada' },
+        Umbra = {},
+    },
+}
+
+return skillchainIndex
@@ -0,0 +1,16 @@
+-- Name mapping: in-game name -> wiki name (for info/category lookup)
+local trustAliases = {
+    ['AAEV'] = 'Ark Angel EV',
+    ['AAGK'] = 'Ark Angel GK',
+    ['AAHM'] = 'Ark Angel HM',
+    ['AAMR'] = 'Ark Angel MR',
+    ['AATT'] = 'Ark Angel TT',
+    ['Babban'] = 'Babban Mheillea',
+    ['D. Shantotto'] = 'Domina Shantotto',
+    ['Excenmille [S]'] = 'Excenmille (S)',
+    ['I. Shield (UC)'] = 'Invincible Shield (UC)',
+    ['Jakoh (UC)'] = 'Jakoh Wahcondalo (UC)',
+    ['Naja (UC)'] = 'Naja Salaheem (UC)'
+}
+
+return trustAliases
@@ -1,157 +1,157 @@
--- Auto-generated trust categories from FFXI Wiki
--- Source: https://www.bg-wiki.com/ffxi/Category:Trust
--- Generated: 2026-01-02
-
-local trustCategories = {
-    ["Tank"] = {
-        "Amchuchu",
-        "Ark Angel EV",
-        "Ark Angel HM",
-        "August",
-        "Curilla",
-        "Gessho",
-        "Mnejing",
-        "Rahal",
-        "Rughadjeen",
-        "Trion",
-        "Valaineral",
-    },
-    ["Melee Fighter"] = {
-        "Abenzio",
-        "Abquhbah",
-        "Aldo",
-        "Aldo (UC)",
-        "Areuhat",
-        "Ark Angel GK",
-        "Ark Angel MR",
-        "Ayame",
-        "Ayame (UC)",
-        "Babban Mheillea",
-        "Balamor",
-        "Chacharoon",
-        "Cid",
-        "Darrcuiln",
-        "Excenmille",
-        "Excenmille (S)",
-        "Fablinix",
-        "Flaviria (UC)",
-        "Gilgamesh",
-        "Halver",
-        "Ingrid II",
-        "Invincible Shield (UC)",
-        "Iroha",
-        "Iroha II",
-        "Iron Eater",
-        "Jakoh Wahcondalo (UC)",
-        "Klara",
-        "Lehko Habhoka",
-        "Lhe Lhangavo",
-        "Lhu Mhakaracca",
-        "Lilisette",
-        "Lilisette II",
-        "Lion",
-        "Lion II",
-        "Luzaf",
-        "Maat",
-        "Maat (UC)",
-        "Matsui-P",
-        "Maximilian",
-        "Mayakov",
-        "Mildaurion",
-        "Morimar",
-        "Mumor",
-        "Naja Salaheem",
-        "Naja Salaheem (UC)",
-        "Naji",
-        "Nanaa Mihgo",
-        "Nashmeira",
-        "Nashmeira II",
-        "Noillurie",
-        "Prishe",
-        "Prishe II",
-        "Rainemard",
-        "Romaa Mihgo",
-        "Rongelouts",
-        "Selh'teus",
-        "Shikaree Z",
-        "Tenzen",
-        "Teodor",
-        "Uka Totlihn",
-        "Volker",
-        "Zazarg",
-        "Zeid",
-        "Zeid II",
-    },
-    ["Ranged Fighter"] = {
-        "Elivira",
-        "Makki-Chebukki",
-        "Margret",
-        "Najelith",
-        "Semih Lafihna",
-        "Tenzen II",
-    },
-    ["Offensive Caster"] = {
-        "Adelheid",
-        "Ajido-Marujido",
-        "Ark Angel TT",
-        "Domina Shantotto",
-        "Gadalar",
-        "Ingrid",
-        "Kayeel-Payeel",
-        "Kukki-Chebukki",
-        "Leonoyne",
-        "Mumor II",
-        "Ovjang",
-        "Robel-Akbel",
-        "Rosulatia",
-        "Shantotto",
-        "Shantotto II",
-        "Ullegore",
-    },
-    ["Healer"] = {
-        "Apururu (UC)",
-        "Cherukiki",
-        "Ferreous Coffin",
-        "Karaha-Baruha",
-        "Kupipi",
-        "Mihli Aliapoh",
-        "Monberaux",
-        "Pieuje (UC)",
-        "Yoran-Oran (UC)",
-        "Ygnas",
-    },
-    ["Support"] = {
-        "Arciela",
-        "Arciela II",
-        "Joachim",
-        "King of Hearts",
-        "Koru-Moru",
-        "Qultada",
-        "Sylvie (UC)",
-        "Ulmia",
-    },
-    ["Special"] = {
-        "Brygid",
-        "Cornelia",
-        "Kupofried",
-        "Kuyin Hathdenna",
-        "Moogle",
-        "Sakura",
-        "Star Sibyl",
-    },
-    ["Unity Concord"] = {
-        "Aldo (UC)",
-        "Apururu (UC)",
-        "Ayame (UC)",
-        "Flaviria (UC)",
-        "Invincible Shield (UC)",
-        "Jakoh Wahcondalo (UC)",
-        "Maat (UC)",
-        "Naja Salaheem (UC)",
-        "Pieuje (UC)",
-        "Sylvie (UC)",
-        "Yoran-Oran (UC)",
-    },
-}
-
+-- Auto-generated trust categories from FFXI Wiki
+-- Source: https://www.bg-wiki.com/ffxi/Category:Trust
+-- Generated: 2026-01-02
+
+local trustCategories = {
+    ["Tank"] = {
+        "Amchuchu",
+        "Ark Angel EV",
+        "Ark Angel HM",
+        "August",
+        "Curilla",
+        "Gessho",
+        "Mnejing",
+        "Rahal",
+        "Rughadjeen",
+        "Trion",
+        "Valaineral",
+    },
+    ["Melee Fighter"] = {
+        "Abenzio",
+        "Abquhbah",
+        "Aldo",
+        "Aldo (UC)",
+        "Areuhat",
+        "Ark Angel GK",
+        "Ark Angel MR",
+        "Ayame",
+        "Ayame (UC)",
+        "Babban Mheillea",
+        "Balamor",
+        "Chacharoon",
+        "Cid",
+        "Darrcuiln",
+        "Excenmille",
+        "Excenmille (S)",
+        "Fablinix",
+        "Flaviria (UC)",
+        "Gilgamesh",
+        "Halver",
+        "Ingrid II",
+        "Invincible Shield (UC)",
+        "Iroha",
+        "Iroha II",
+        "Iron Eater",
+        "Jakoh Wahcondalo (UC)",
+        "Klara",
+        "Lehko Habhoka",
+        "Lhe Lhangavo",
+        "Lhu Mhakaracca",
+        "Lilisette",
+        "Lilisette II",
+        "Lion",
+        "Lion II",
+        "Luzaf",
+        "Maat",
+        "Maat (UC)",
+        "Matsui-P",
+        "Maximilian",
+        "Mayakov",
+        "Mildaurion",
+        "Morimar",
+        "Mumor",
+        "Naja Salaheem",
+        "Naja Salaheem (UC)",
+        "Naji",
+        "Nanaa Mihgo",
+        "Nashmeira",
+        "Nashmeira II",
+        "Noillurie",
+        "Prishe",
+        "Prishe II",
+        "Rainemard",
+        "Romaa Mihgo",
+        "Rongelouts",
+        "Selh'teus",
+        "Shikaree Z",
+        "Tenzen",
+        "Teodor",
+        "Uka Totlihn",
+        "Volker",
+        "Zazarg",
+        "Zeid",
+        "Zeid II",
+    },
+    ["Ranged Fighter"] = {
+        "Elivira",
+        "Makki-Chebukki",
+        "Margret",
+        "Najelith",
+        "Semih Lafihna",
+        "Tenzen II",
+    },
+    ["Offensive Caster"] = {
+        "Adelheid",
+        "Ajido-Marujido",
+        "Ark Angel TT",
+        "Domina Shantotto",
+        "Gadalar",
+        "Ingrid",
+        "Kayeel-Payeel",
+        "Kukki-Chebukki",
+        "Leonoyne",
+        "Mumor II",
+        "Ovjang",
+        "Robel-Akbel",
+        "Rosulatia",
+        "Shantotto",
+        "Shantotto II",
+        "Ullegore",
+    },
+    ["Healer"] = {
+        "Apururu (UC)",
+        "Cherukiki",
+        "Ferreous Coffin",
+        "Karaha-Baruha",
+        "Kupipi",
+        "Mihli Aliapoh",
+        "Monberaux",
+        "Pieuje (UC)",
+        "Yoran-Oran (UC)",
+        "Ygnas",
+    },
+    ["Support"] = {
+        "Arciela",
+        "Arciela II",
+        "Joachim",
+        "King of Hearts",
+        "Koru-Moru",
+        "Qultada",
+        "Sylvie (UC)",
+        "Ulmia",
+    },
+    ["Special"] = {
+        "Brygid",
+        "Cornelia",
+        "Kupofried",
+        "Kuyin Hathdenna",
+        "Moogle",
+        "Sakura",
+        "Star Sibyl",
+    },
+    ["Unity Concord"] = {
+        "Aldo (UC)",
+        "Apururu (UC)",
+        "Ayame (UC)",
+        "Flaviria (UC)",
+        "Invincible Shield (UC)",
+        "Jakoh Wahcondalo (UC)",
+        "Maat (UC)",
+        "Naja Salaheem (UC)",
+        "Pieuje (UC)",
+        "Sylvie (UC)",
+        "Yoran-Oran (UC)",
+    },
+}
+
 return trustCategories
\ No newline at end of file
@@ -0,0 +1,293 @@
+-- Auto-generated trust category index from FFXI Wiki, data/trustData.lua and data/trustAliases.lua
+-- Source: https://www.bg-wiki.com/ffxi/Category:Trust
+-- Generated: 2026-10-17
+
+local trustCategoryIndex = {
+    -- Category -> bit of the masks
+    bits = {
+        ['Tank'] = 1,
+        ['Melee Fighter'] = 2,
+        ['Ranged Fighter'] = 4,
+        ['Offensive Caster'] = 8,
+        ['Healer'] = 16,
+        ['Support'] = 32,
+        ['Special'] = 64,
+        ['Unity Concord'] = 128,
+    },
+    -- Mask -> its categories, in bit order
+    categories = {
+        [1] = { 'Tank' },
+        [2] = { 'Melee Fighter' },
+        [4] = { 'Ranged Fighter' },
+        [8] = { 'Offensive Caster' },
+        [16] = { 'Healer' },
+        [32] = { 'Support' },
+        [64] = { 'Special' },
+        [130] = { 'Melee Fighter', 'Unity Concord' },
+        [144] = { 'Healer', 'Unity Concord' },
+        [160] = { 'Support', 'Unity Concord' },
+    },
+    -- Trust id in trustData -> mask
+    ids = {
+        [896] = 8,
+        [897] = 2,
+        [898] = 16,
+        [899] = 2,
+        [900] = 2,
+        [901] = 2,
+        [902] = 1,
+        [903] = 2,
+        [904] = 8,
+        [905] = 1,
+        [906] = 2,
+        [907] = 2,
+        [908] = 2,
+        [909] = 16,
+        [910] = 1,
+        [911] = 32,
+        [912] = 2,
+        [913] = 2,
+        [914] = 32,
+        [915] = 2,
+        [916] = 16,
+        [917] = 2,
+        [918] = 1,
+        [919] = 8,
+        [920] = 2,
+        [921] = 8,
+        [922] = 2,
+        [923] = 2,
+        [924] = 2,
+        [925] = 8,
+        [926] = 1,
+        [927] = 64,
+        [928] = 2,
+        [929] = 4,
+        [930] = 2,
+        [931] = 64,
+        [932] = 2,
+        [933] = 2,
+        [934] = 8,
+        [935] = 64,
+        [936] = 16,
+        [937] = 2,
+        [938] = 2,
+        [939] = 2,
+        [940] = 4,
+        [941] = 4,
+        [942] = 2,
+        [943] = 2,
+        [944] = 16,
+        [945] = 2,
+        [946] = 2,
+        [947] = 2,
+        [948] = 2,
+        [949] = 2,
+        [950] = 64,
+        [951] = 1,
+        [952] = 32,
+        [953] = 144,
+        [954] = 130,
+        [955] = 144,
+        [956] = 130,
+        [957] = 130,
+        [958] = 2,
+        [959] = 2,
+        [960] = 1,
+        [961] = 8,
+        [962] = 4,
+        [963] = 2,
+        [964] = 2,
+        [965] = 32,
+        [966] = 2,
+        [967] = 32,
+        [968] = 8,
+        [969] = 1,
+        [970] = 64,
+        [971] = 2,
+        [972] = 2,
+        [973] = 2,
+        [974] = 8,
+        [975] = 2,
+        [976] = 8,
+        [977] = 8,
+        [978] = 64,
+        [979] = 2,
+        [980] = 144,
+        [981] = 160,
+        [982] = 2,
+        [983] = 2,
+        [984] = 1,
+        [985] = 8,
+        [986] = 2,
+        [987] = 8,
+        [988] = 4,
+        [989] = 32,
+        [990] = 2,
+        [991] = 2,
+        [992] = 1,
+        [993] = 1,
+        [994] = 2,
+        [995] = 8,
+        [996] = 2,
+        [997] = 2,
+        [998] = 16,
+        [999] = 16,
+        [1002] = 64,
+        [1003] = 2,
+        [1004] = 2,
+        [1005] = 130,
+        [1006] = 130,
+        [1007] = 130,
+        [1008] = 130,
+        [1009] = 2,
+        [1010] = 2,
+        [1011] = 2,
+        [1012] = 2,
+        [1013] = 2,
+        [1014] = 4,
+        [1015] = 8,
+        [1016] = 2,
+        [1017] = 32,
+        [1018] = 2,
+        [1019] = 8,
+    },
+    -- In-game and wiki name -> mask
+    names = {
+        ['Shantotto'] = 8,
+        ['Naji'] = 2,
+        ['Kupipi'] = 16,
+        ['Excenmille'] = 2,
+        ['Ayame'] = 2,
+        ['Nanaa Mihgo'] = 2,
+        ['Curilla'] = 1,
+        ['Volker'] = 2,
+        ['Ajido-Marujido'] = 8,
+        ['Trion'] = 1,
+        ['Zeid'] = 2,
+        ['Lion'] = 2,
+        ['Tenzen'] = 2,
+        ['Mihli Aliapoh'] = 16,
+        ['Valaineral'] = 1,
+        ['Joachim'] = 32,
+        ['Naja Salaheem'] = 2,
+        ['Prishe'] = 2,
+        ['Ulmia'] = 32,
+        ['Shikaree Z'] = 2,
+        ['Cherukiki'] = 16,
+        ['Iron Eater'] = 2,
+        ['Gessho'] = 1,
+        ['Gadalar'] = 8,
+        ['Rainemard'] = 2,
+        ['Ingrid'] = 8,
+        ['Lehko Habhoka'] = 2,
+        ['Nashmeira'] = 2,
+        ['Zazarg'] = 2,
+        ['Ovjang'] = 8,
+        ['Mnejing'] = 1,
+        ['Sakura'] = 64,
+        ['Luzaf'] = 2,
+        ['Najelith'] = 4,
+        ['Aldo'] = 2,
+        ['Moogle'] = 64,
+        ['Fablinix'] = 2,
+        ['Maat'] = 2,
+        ['D. Shantotto'] = 8,
+        ['Domina Shantotto'] = 8,
+        ['Star Sibyl'] = 64,
+        ['Karaha-Baruha'] = 16,
+        ['Cid'] = 2,
+        ['Gilgamesh'] = 2,
+        ['Areuhat'] = 2,
+        ['Semih Lafihna'] = 4,
+        ['Elivira'] = 4,
+        ['Noillurie'] = 2,
+        ['Lhu Mhakaracca'] = 2,
+        ['Ferreous Coffin'] = 16,
+        ['Lilisette'] = 2,
+        ['Mumor'] = 2,
+        ['Uka Totlihn'] = 2,
+        ['Klara'] = 2,
+        ['Romaa Mihgo'] = 2,
+        ['Kuyin Hathdenna'] = 64,
+        ['Rahal'] = 1,
+        ['Koru-Moru'] = 32,
+        ['Pieuje (UC)'] = 144,
+        ['I. Shield (UC)'] = 130,
+        ['Invincible Shield (UC)'] = 130,
+        ['Apururu (UC)'] = 144,
+        ['Jakoh (UC)'] = 130,
+        ['Jakoh Wahcondalo (UC)'] = 130,
+        ['Flaviria (UC)'] = 130,
+        ['Babban'] = 2,
+        ['Babban Mheillea'] = 2,
+        ['Abenzio'] = 2,
+        ['Rughadjeen'] = 1,
+        ['Kukki-Chebukki'] = 8,
+        ['Margret'] = 4,
+        ['Chacharoon'] = 2,
+        ['Lhe Lhangavo'] = 2,
+        ['Arciela'] = 32,
+        ['Mayakov'] = 2,
+        ['Qultada'] = 32,
+        ['Adelheid'] = 8,
+        ['Amchuchu'] = 1,
+        ['Brygid'] = 64,
+        ['Mildaurion'] = 2,
+        ['Halver'] = 2,
+        ['Rongelouts'] = 2,
+        ['Leonoyne'] = 8,
+        ['Maximilian'] = 2,
+        ['Kayeel-Payeel'] = 8,
+        ['Robel-Akbel'] = 8,
+        ['Kupofried'] = 64,
+        ["Selh'teus"] = 2,
+        ['Yoran-Oran (UC)'] = 144,
+        ['Sylvie (UC)'] = 160,
+        ['Abquhbah'] = 2,
+        ['Balamor'] = 2,
+        ['August'] = 1,
+        ['Rosulatia'] = 8,
+        ['Teodor'] = 2,
+        ['Ullegore'] = 8,
+        ['Makki-Chebukki'] = 4,
+        ['King of Hearts'] = 32,
+        ['Morimar'] = 2,
+        ['Darrcuiln'] = 2,
+        ['AAHM'] = 1,
+        ['Ark Angel HM'] = 1,
+        ['AAEV'] = 1,
+        ['Ark Angel EV'] = 1,
+        ['AAMR'] = 2,
+        ['Ark Angel MR'] = 2,
+        ['AATT'] = 8,
+        ['Ark Angel TT'] = 8,
+        ['AAGK'] = 2,
+        ['Ark Angel GK'] = 2,
+        ['Iroha'] = 2,
+        ['Ygnas'] = 16,
+        ['Monberaux'] = 16,
+        ['Cornelia'] = 64,
+        ['Matsui-P'] = 2,
+        ['Excenmille [S]'] = 2,
+        ['Excenmille (S)'] = 2,
+        ['Ayame (UC)'] = 130,
+        ['Maat (UC)'] = 130,
+        ['Aldo (UC)'] = 130,
+        ['Naja (UC)'] = 130,
+        ['Naja Salaheem (UC)'] = 130,
+        ['Lion II'] = 2,
+        ['Zeid II'] = 2,
+        ['Prishe II'] = 2,
+        ['Nashmeira II'] = 2,
+        ['Lilisette II'] = 2,
+        ['Tenzen II'] = 4,
+        ['Mumor II'] = 8,
+        ['Ingrid II'] = 2,
+        ['Arciela II'] = 32,
+        ['Iroha II'] = 2,
+        ['Shantotto II'] = 8,
+    },
+}
+
+return trustCategoryIndex
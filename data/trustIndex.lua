@@ -0,0 +1,146 @@
+-- Auto-generated trust index from data/trustData.lua
+-- Generated: 2026-10-17
+
+local trustIndex = {
+    -- Lowercase English name -> id in trustData
+    ids = {
+        ['shantotto'] = 896,
+        ['naji'] = 897,
+        ['kupipi'] = 898,
+        ['excenmille'] = 899,
+        ['ayame'] = 900,
+        ['nanaa mihgo'] = 901,
+        ['curilla'] = 902,
+        ['volker'] = 903,
+        ['ajido-marujido'] = 904,
+        ['trion'] = 905,
+        ['zeid'] = 906,
+        ['lion'] = 907,
+        ['tenzen'] = 908,
+        ['mihli aliapoh'] = 909,
+        ['valaineral'] = 910,
+        ['joachim'] = 911,
+        ['naja salaheem'] = 912,
+        ['prishe'] = 913,
+        ['ulmia'] = 914,
+        ['shikaree z'] = 915,
+        ['cherukiki'] = 916,
+        ['iron eater'] = 917,
+        ['gessho'] = 918,
+        ['gadalar'] = 919,
+        ['rainemard'] = 920,
+        ['ingrid'] = 921,
+        ['lehko habhoka'] = 922,
+        ['nashmeira'] = 923,
+        ['zazarg'] = 924,
+        ['ovjang'] = 925,
+        ['mnejing'] = 926,
+        ['sakura'] = 927,
+        ['luzaf'] = 928,
+        ['najelith'] = 929,
+        ['aldo'] = 930,
+        ['moogle'] = 931,
+        ['fablinix'] = 932,
+        ['maat'] = 933,
+        ['d. shantotto'] = 934,
+        ['star sibyl'] = 935,
+        ['karaha-baruha'] = 936,
+        ['cid'] = 937,
+        ['gilgamesh'] = 938,
+        ['areuhat'] = 939,
+        ['semih lafihna'] = 940,
+        ['elivira'] = 941,
+        ['noillurie'] = 942,
+        ['lhu mhakaracca'] = 943,
+        ['ferreous coffin'] = 944,
+        ['lilisette'] = 945,
+        ['mumor'] = 946,
+        ['uka totlihn'] = 947,
+        ['klara'] = 948,
+        ['romaa mihgo'] = 949,
+        ['kuyin hathdenna'] = 950,
+        ['rahal'] = 951,
+        ['koru-moru'] = 952,
+        ['pieuje (uc)'] = 953,
+        ['i. shield (uc)'] = 954,
+        ['apururu (uc)'] = 955,
+        ['jakoh (uc)'] = 956,
+        ['flaviria (uc)'] = 957,
+        ['babban'] = 958,
+        ['abenzio'] = 959,
+        ['rughadjeen'] = 960,
+        ['kukki-chebukki'] = 961,
+        ['margret'] = 962,
+        ['chacharoon'] = 963,
+        ['lhe lhangavo'] = 964,
+        ['arciela'] = 965,
+        ['mayakov'] = 966,
+        ['qultada'] = 967,
+        ['adelheid'] = 968,
+        ['amchuchu'] = 969,
+        ['brygid'] = 970,
+        ['mildaurion'] = 971,
+        ['halver'] = 972,
+        ['rongelouts'] = 973,
+        ['leonoyne'] = 974,
+        ['maximilian'] = 975,
+        ['kayeel-payeel'] = 976,
+        ['robel-akbel'] = 977,
+        ['kupofried'] = 978,
+        ["selh'teus"] = 979,
+        ['yoran-oran (uc)'] = 980,
+        ['sylvie (uc)'] = 981,
+        ['abquhbah'] = 982,
+        ['balamor'] = 983,
+        ['august'] = 984,
+        ['rosulatia'] = 985,
+        ['teodor'] = 986,
+        ['ullegore'] = 987,
+        ['makki-chebukki'] = 988,
+        ['king of hearts'] = 989,
+        ['morimar'] = 990,
+        ['darrcuiln'] = 991,
+        ['aahm'] = 992,
+        ['aaev'] = 993,
+        ['aamr'] = 994,
+        ['aatt'] = 995,
+        ['aagk'] = 996,
+        ['iroha'] = 997,
+        ['ygnas'] = 998,
+        ['monberaux'] = 999,
+        ['cornelia'] = 1002,
+        ['matsui-p'] = 1003,
+        ['excenmille [s]'] = 1004,
+        ['ayame (uc)'] = 1005,
+        ['maat (uc)'] = 1006,
+        ['aldo (uc)'] = 1007,
+        ['naja (uc)'] = 1008,
+        ['lion ii'] = 1009,
+        ['zeid ii'] = 1010,
+        ['prishe ii'] = 1011,
+        ['nashmeira ii'] = 1012,
+        ['lilisette ii'] = 1013,
+        ['tenzen ii'] = 1014,
+        ['mumor ii'] = 1015,
+        ['ingrid ii'] = 1016,
+        ['arciela ii'] = 1017,
+        ['iroha ii'] = 1018,
+        ['shantotto ii'] = 1019,
+    },
+    -- Unity Concord trusts, named (UC)
+    uc = {
+        [953] = true,
+        [954] = true,
+        [955] = true,
+        [956] = true,
+        [957] = true,
+        [980] = true,
+        [981] = true,
+        [1005] = true,
+        [1006] = true,
+        [1007] = true,
+        [1008] = true,
+    },
+}
+
+return trustIndex
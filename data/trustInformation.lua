@@ -0,0 +1,11312 @@
+-- Auto-generated trust information from FFXI Wiki
+-- Source: https://www.bg-wiki.com/ffxi/Category:Trust
+-- Generated: 2026-01-02
+
+local trustInformation = {
+    ['Amchuchu'] = {
+        name = 'Amchuchu',
+        job = {
+            {
+                { type = 'link', text = 'Rune Fencer', url = 'https://www.bg-wiki.com/ffxi/Rune_Fencer' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Warrior', url = 'https://www.bg-wiki.com/ffxi/Warrior' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Flash,', url = 'https://www.bg-wiki.com/ffxi/Flash' },
+                { type = 'link', text = 'Foil,', url = 'https://www.bg-wiki.com/ffxi/Foil' },
+                { type = 'link', text = 'Stoneskin,', url = 'https://www.bg-wiki.com/ffxi/Stoneskin' },
+                { type = 'link', text = 'Refresh,', url = 'https://www.bg-wiki.com/ffxi/Refresh' },
+                { type = 'link', text = 'Phalanx,', url = 'https://www.bg-wiki.com/ffxi/Phalanx' },
+                { type = 'link', text = 'Regen I - IV,', url = 'https://www.bg-wiki.com/ffxi/Category:Regen_Spell' },
+                { type = 'link', text = 'Protect I - IV,', url = 'https://www.bg-wiki.com/ffxi/Category:Protect_Spell' },
+                { type = 'link', text = 'Shell I - V,', url = 'https://www.bg-wiki.com/ffxi/Category:Shell_Spell' },
+                { type = 'link', text = 'Bar-element spells', url = 'https://www.bg-wiki.com/ffxi/Category:Barspell' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Berserk,', url = 'https://www.bg-wiki.com/ffxi/Berserk' },
+                { type = 'link', text = 'Provoke,', url = 'https://www.bg-wiki.com/ffxi/Provoke' },
+                { type = 'link', text = 'Embolden,', url = 'https://www.bg-wiki.com/ffxi/Embolden' },
+                { type = 'link', text = 'Battuta,', url = 'https://www.bg-wiki.com/ffxi/Battuta' },
+                { type = 'link', text = 'Vallation,', url = 'https://www.bg-wiki.com/ffxi/Vallation' },
+                { type = 'link', text = 'Valiance,', url = 'https://www.bg-wiki.com/ffxi/Valiance' },
+                { type = 'link', text = 'Swordplay,', url = 'https://www.bg-wiki.com/ffxi/Swordplay' },
+                { type = 'link', text = 'Vivacious Pulse,', url = 'https://www.bg-wiki.com/ffxi/Vivacious_Pulse' },
+                { type = 'link', text = 'Rune Enhancement,', url = 'https://www.bg-wiki.com/ffxi/Rune' },
+                { type = 'link', text = 'One for All,', url = 'https://www.bg-wiki.com/ffxi/One_for_All' },
+                { type = 'link', text = 'Swipe,', url = 'https://www.bg-wiki.com/ffxi/Swipe' },
+                { type = 'link', text = 'Lunge', url = 'https://www.bg-wiki.com/ffxi/Lunge' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Dimidiation', url = 'https://www.bg-wiki.com/ffxi/Dimidiation' },
+                { type = 'skillchain', value = 'Light' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Fragmentation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Power Slash', url = 'https://www.bg-wiki.com/ffxi/Power_Slash' },
+                { type = 'skillchain', value = 'Transfixion' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Sickle Moon', url = 'https://www.bg-wiki.com/ffxi/Sickle_Moon' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Impaction' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Amchuchu', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Amchuchu' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Repeat Login Campaign', url = 'https://www.bg-wiki.com/ffxi/Repeat_Login_Campaign' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses' },
+                { type = 'link', text = 'Inspiration', url = 'https://www.bg-wiki.com/ffxi/Inspiration' },
+                { type = 'text', value = '(50%' },
+                { type = 'link', text = 'Fast Cast', url = 'https://www.bg-wiki.com/ffxi/Fast_Cast' },
+                { type = 'text', value = 'effect during' },
+                { type = 'link', text = 'Vallation,', url = 'https://www.bg-wiki.com/ffxi/Vallation' },
+                { type = 'text', value = 'is party-wide during' },
+                { type = 'link', text = 'Valiance', url = 'https://www.bg-wiki.com/ffxi/Valiance' },
+                { type = 'text', value = '), Converts 5% of Physical Damage Taken to MP.' },
+            },
+            {
+                { type = 'text', value = 'Only casts enhancing spells on herself.' },
+            },
+            {
+                { type = 'text', value = 'Uses' },
+                { type = 'link', text = 'Embolden', url = 'https://www.bg-wiki.com/ffxi/Embolden' },
+                { type = 'text', value = 'when casting' },
+                { type = 'link', text = 'Protect.', url = 'https://www.bg-wiki.com/ffxi/Protect' },
+            },
+            {
+                { type = 'text', value = 'She can rapidly generate' },
+                { type = 'link', text = 'Volatile Enmity', url = 'https://www.bg-wiki.com/ffxi/Volatile_Enmity' },
+                { type = 'text', value = 'for initial threat or recovery from enmity reset attacks with a cornucopia of abilties and spells like' },
+                { type = 'link', text = 'Provoke,', url = 'https://www.bg-wiki.com/ffxi/Provoke' },
+                { type = 'link', text = 'Flash,', url = 'https://www.bg-wiki.com/ffxi/Flash' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = 'Foil.', url = 'https://www.bg-wiki.com/ffxi/Foil' },
+            },
+            {
+                { type = 'text', value = 'Uses' },
+                { type = 'link', text = 'Runes', url = 'https://www.bg-wiki.com/ffxi/Category:Rune' },
+                { type = 'text', value = 'resisting the element of the current day. After taking magic damage, uses the appropriate' },
+                { type = 'link', text = 'Bar-spell', url = 'https://www.bg-wiki.com/ffxi/Category:Barspell' },
+                { type = 'text', value = 'and changes runes.' },
+            },
+            {
+                { type = 'text', value = 'Uses' },
+                { type = 'link', text = 'One for All', url = 'https://www.bg-wiki.com/ffxi/One_for_All' },
+                { type = 'text', value = 'in response to enemies casting high-tier damaging spells.' },
+            },
+            {
+                { type = 'link', text = 'Magic Bursts', url = 'https://www.bg-wiki.com/ffxi/Magic_Burst' },
+                { type = 'link', text = 'Level 4 Light', url = 'https://www.bg-wiki.com/ffxi/Level_4_Light' },
+                { type = 'text', value = 'or' },
+                { type = 'link', text = 'Level 4 Darkness', url = 'https://www.bg-wiki.com/ffxi/Level_4_Darkness' },
+                { type = 'text', value = 'skillchains using' },
+                { type = 'link', text = 'Lunge.', url = 'https://www.bg-wiki.com/ffxi/Lunge' },
+            },
+            {
+                { type = 'link', text = 'Berserk', url = 'https://www.bg-wiki.com/ffxi/Berserk' },
+                { type = 'text', value = 'could be a risk when using Amchuchu outside of her role as a magic tank.' },
+            },
+            {
+                { type = 'text', value = 'Holds up to 3000 TP to close skillchains. Weapon skills are a lower priority,' },
+            },
+        },
+    },
+    ['Ark Angel EV'] = {
+        name = 'Ark Angel EV',
+        job = {
+            {
+                { type = 'link', text = 'Paladin', url = 'https://www.bg-wiki.com/ffxi/Paladin' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'White Mage', url = 'https://www.bg-wiki.com/ffxi/White_Mage' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Flash,', url = 'https://www.bg-wiki.com/ffxi/Flash' },
+                { type = 'link', text = 'Phalanx,', url = 'https://www.bg-wiki.com/ffxi/Phalanx' },
+                { type = 'link', text = 'Cure I - IV,', url = 'https://www.bg-wiki.com/ffxi/Category:Cure_Spell' },
+                { type = 'link', text = 'Enlight,', url = 'https://www.bg-wiki.com/ffxi/Enlight' },
+                { type = 'link', text = 'Reprisal', url = 'https://www.bg-wiki.com/ffxi/Reprisal' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Chivalry,', url = 'https://www.bg-wiki.com/ffxi/Chivalry' },
+                { type = 'link', text = 'Palisade,', url = 'https://www.bg-wiki.com/ffxi/Palisade' },
+                { type = 'link', text = 'Sentinel,', url = 'https://www.bg-wiki.com/ffxi/Sentinel' },
+                { type = 'link', text = 'Divine Emblem,', url = 'https://www.bg-wiki.com/ffxi/Divine_Emblem' },
+                { type = 'link', text = 'Rampart,', url = 'https://www.bg-wiki.com/ffxi/Rampart' },
+                { type = 'link', text = 'Shield Strike', url = 'https://www.bg-wiki.com/ffxi/Shield_Bash' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Chant du Cygne', url = 'https://www.bg-wiki.com/ffxi/Chant_du_Cygne' },
+                { type = 'skillchain', value = 'Light' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Distortion' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Vorpal Blade', url = 'https://www.bg-wiki.com/ffxi/Vorpal_Blade' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Impaction' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Dominion Slash', url = 'https://www.bg-wiki.com/ffxi/Dominion_Slash' },
+                { type = 'text', value = '(AoE)' },
+                { type = 'skillchain', value = 'Status_Ability' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Arrogance Incarnate', url = 'https://www.bg-wiki.com/ffxi/Arrogance_Incarnate' },
+                { type = 'text', value = '(AoE' },
+                { type = 'link', text = 'Spirits Within', url = 'https://www.bg-wiki.com/ffxi/Spirits_Within' },
+                { type = 'text', value = ')' },
+                { type = 'skillchain', value = 'Status_Ability' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Ark EV', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Ark_EV' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'text', value = 'Complete' },
+                { type = 'link', text = 'Dawn', url = 'https://www.bg-wiki.com/ffxi/Dawn' },
+                { type = 'text', value = 'and all its cutscenes.' },
+            },
+            {
+                { type = 'text', value = 'Be in possession of the' },
+                { type = 'link', text = 'Bundle of scrolls', url = 'https://www.bg-wiki.com/ffxi/Bundle_of_scrolls' },
+                { type = 'text', value = 'key item.' },
+            },
+            {
+                { type = 'text', value = 'Have obtained the additional following Trust spells: Rainemard, & Ark Angel GK' },
+            },
+            {
+                { type = 'text', value = 'Speak with' },
+                { type = 'link', text = 'Jamal', url = 'https://www.bg-wiki.com/ffxi/Jamal' },
+                { type = 'text', value = 'in' },
+                { type = 'link', text = "Ru'Lude Gardens", url = 'https://www.bg-wiki.com/ffxi/Ru%27Lude_Gardens' },
+                { type = 'text', value = '(H-5).' },
+            },
+            {
+                { type = 'text', value = "After trading Ark Angel GK 's cipher, you must speak to" },
+                { type = 'link', text = 'Jamal,', url = 'https://www.bg-wiki.com/ffxi/Jamal' },
+                { type = 'text', value = 'zone, and speak to' },
+                { type = 'link', text = 'Jamal', url = 'https://www.bg-wiki.com/ffxi/Jamal' },
+                { type = 'text', value = 'again to unlock the Objective for' },
+                { type = 'link', text = 'Cipher: Ark EV.', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Ark_EV' },
+                { type = 'text', value = 'Be sure before zoning' },
+                { type = 'link', text = 'Jamal', url = 'https://www.bg-wiki.com/ffxi/Jamal' },
+                { type = 'text', value = 'asks you to "Please come by again later."' },
+            },
+            {
+                { type = 'text', value = 'Complete the' },
+                { type = 'link', text = 'Records of Eminence Objective:', url = 'https://www.bg-wiki.com/ffxi/Category:Records_of_Eminence#RoE_Quests_3' },
+                { type = 'text', value = 'Temper Your Arrogance Warp to' },
+                { type = 'link', text = "Tu'Lia", url = 'https://www.bg-wiki.com/ffxi/Tu%27Lia' },
+                { type = 'text', value = '→' },
+                { type = 'link', text = "Ru'Aun Gardens", url = 'https://www.bg-wiki.com/ffxi/Ru%27Aun_Gardens' },
+                { type = 'text', value = '#4 to battle the Ark Angel with a' },
+                { type = 'link', text = 'Phantom gem of arrogance', url = 'https://www.bg-wiki.com/ffxi/Phantom_gem_of_arrogance' },
+                { type = 'text', value = 'on any difficulty. Players will be unable to receive the alter ego when trading the Cipher if they have not completed the' },
+                { type = 'link', text = "Rhapsodies of Vana'diel", url = 'https://www.bg-wiki.com/ffxi/Rhapsodies_of_Vana%27diel' },
+                { type = 'text', value = 'mission "' },
+                { type = 'link', text = 'Exploring the Ruins.', url = 'https://www.bg-wiki.com/ffxi/Exploring_the_Ruins' },
+                { type = 'text', value = '" Completing that cutscene/mission will allow the cipher to be traded.' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses' },
+                { type = 'link', text = 'Fast Cast,', url = 'https://www.bg-wiki.com/ffxi/Fast_Cast' },
+                { type = 'link', text = 'Cure Potency Bonus', url = 'https://www.bg-wiki.com/ffxi/Cure_Potency' },
+                { type = 'text', value = '+50%,' },
+                { type = 'link', text = 'Damage Taken', url = 'https://www.bg-wiki.com/ffxi/Damage_Taken' },
+                { type = 'text', value = '-10%, HP+20%, MP+50%, Converts 5% of Damage Taken to MP.' },
+            },
+            {
+                { type = 'text', value = 'Lacks' },
+                { type = 'link', text = 'Provoke;', url = 'https://www.bg-wiki.com/ffxi/Provoke' },
+                { type = 'text', value = "however, AAEV's additional" },
+                { type = 'link', text = 'Fast Cast', url = 'https://www.bg-wiki.com/ffxi/Fast_Cast' },
+                { type = 'text', value = 'trait reduces the recast time on' },
+                { type = 'link', text = 'Flash', url = 'https://www.bg-wiki.com/ffxi/Flash' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = 'Reprisal', url = 'https://www.bg-wiki.com/ffxi/Reprisal' },
+                { type = 'text', value = 'for solid enmity control.' },
+            },
+            {
+                { type = 'text', value = 'Recast times can be improved further by providing' },
+                { type = 'link', text = 'Haste.', url = 'https://www.bg-wiki.com/ffxi/Haste' },
+            },
+            {
+                { type = 'text', value = 'AAEV has improved Shield stats compared to other trusts, implied by the [' },
+                { type = 'link', text = 'Nov 2021 Patch Notes', url = 'https://forum.square-enix.com/ffxi/threads/58770-November-10-2021-%28JST%29-Version-Update' },
+                { type = 'text', value = ']. This would also make her' },
+                { type = 'link', text = 'Reprisal', url = 'https://www.bg-wiki.com/ffxi/Reprisal' },
+                { type = 'text', value = 'better.' },
+            },
+            {
+                { type = 'text', value = "Ark Angel Elvaan doesn't use any WHM-only abilities or spells, but /WHM has" },
+                { type = 'link', text = 'Auto-Regen', url = 'https://www.bg-wiki.com/ffxi/Auto-Regen' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = 'Magic Defense Bonus,', url = 'https://www.bg-wiki.com/ffxi/Magic_Defense_Bonus' },
+                { type = 'text', value = 'making her a good physical/magical hybrid tank.' },
+            },
+            {
+                { type = 'text', value = 'Uses' },
+                { type = 'link', text = 'Rampart', url = 'https://www.bg-wiki.com/ffxi/Rampart' },
+                { type = 'text', value = 'when her target is under the effects of' },
+                { type = 'link', text = 'Chainspell,', url = 'https://www.bg-wiki.com/ffxi/Chainspell' },
+                { type = 'link', text = 'Manafont,', url = 'https://www.bg-wiki.com/ffxi/Manafont' },
+                { type = 'text', value = 'or' },
+                { type = 'link', text = 'Astral Flow.', url = 'https://www.bg-wiki.com/ffxi/Astral_Flow' },
+            },
+            {
+                { type = 'text', value = 'Uses' },
+                { type = 'link', text = 'Shield Strike', url = 'https://www.bg-wiki.com/ffxi/Shield_Bash' },
+                { type = 'text', value = 'to interrupt enemies casting high tier spells.' },
+            },
+            {
+                { type = 'text', value = 'Holds up to 2000 TP to try to close skillchains.' },
+            },
+            {
+                { type = 'text', value = 'With two weapon skills that have no skillchain properties, tends to not interrupt skillchains performed by other party members.' },
+            },
+        },
+    },
+    ['Ark Angel HM'] = {
+        name = 'Ark Angel HM',
+        job = {
+            {
+                { type = 'link', text = 'Ninja', url = 'https://www.bg-wiki.com/ffxi/Ninja' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Warrior', url = 'https://www.bg-wiki.com/ffxi/Warrior' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Migawari: Ichi,', url = 'https://www.bg-wiki.com/ffxi/Migawari:_Ichi' },
+                { type = 'link', text = 'Utsusemi: Ichi', url = 'https://www.bg-wiki.com/ffxi/Utsusemi:_Ichi' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Ni,', url = 'https://www.bg-wiki.com/ffxi/Utsusemi:_Ni' },
+                { type = 'link', text = 'Hojo: Ichi', url = 'https://www.bg-wiki.com/ffxi/Hojo:_Ichi' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Ni,', url = 'https://www.bg-wiki.com/ffxi/Hojo:_Ni' },
+                { type = 'link', text = 'Kurayami: Ichi', url = 'https://www.bg-wiki.com/ffxi/Kurayami:_Ichi' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Ni', url = 'https://www.bg-wiki.com/ffxi/Kurayami:_Ni' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Innin,', url = 'https://www.bg-wiki.com/ffxi/Innin' },
+                { type = 'link', text = 'Yonin,', url = 'https://www.bg-wiki.com/ffxi/Yonin' },
+                { type = 'link', text = 'Provoke,', url = 'https://www.bg-wiki.com/ffxi/Provoke' },
+                { type = 'link', text = 'Berserk,', url = 'https://www.bg-wiki.com/ffxi/Berserk' },
+                { type = 'link', text = 'Warcry', url = 'https://www.bg-wiki.com/ffxi/Warcry' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Chant du Cygne', url = 'https://www.bg-wiki.com/ffxi/Chant_du_Cygne' },
+                { type = 'skillchain', value = 'Light' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Distortion' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Swift Blade', url = 'https://www.bg-wiki.com/ffxi/Swift_Blade' },
+                { type = 'skillchain', value = 'Gravitation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Cross Reaver', url = 'https://www.bg-wiki.com/index.php?title=Cross_Reaver&amp;action=edit&amp;redlink=1' },
+                { type = 'text', value = '(Unique Conal' },
+                { type = 'link', text = 'Stun', url = 'https://www.bg-wiki.com/ffxi/Stun' },
+                { type = 'text', value = ')' },
+                { type = 'skillchain', value = 'Status_Ability' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Ark HM', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Ark_HM' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'text', value = 'Complete' },
+                { type = 'link', text = 'Dawn', url = 'https://www.bg-wiki.com/ffxi/Dawn' },
+                { type = 'text', value = 'and all its cutscenes.' },
+            },
+            {
+                { type = 'text', value = 'Be in possession of the' },
+                { type = 'link', text = 'Bundle of scrolls', url = 'https://www.bg-wiki.com/ffxi/Bundle_of_scrolls' },
+                { type = 'text', value = 'key item.' },
+            },
+            {
+                { type = 'text', value = 'Have obtained the additional following Trust spells: Rainemard, Ark Angel GK, Ark Angel EV, Ark Angel MR, & Ark Angel TT' },
+            },
+            {
+                { type = 'text', value = 'Speak with' },
+                { type = 'link', text = 'Jamal', url = 'https://www.bg-wiki.com/ffxi/Jamal' },
+                { type = 'text', value = 'in' },
+                { type = 'link', text = "Ru'Lude Gardens", url = 'https://www.bg-wiki.com/ffxi/Ru%27Lude_Gardens' },
+                { type = 'text', value = '(H-5).' },
+            },
+            {
+                { type = 'text', value = "After trading Ark Angel TT 's cipher, you must speak to" },
+                { type = 'link', text = 'Jamal,', url = 'https://www.bg-wiki.com/ffxi/Jamal' },
+                { type = 'text', value = 'zone, and speak to' },
+                { type = 'link', text = 'Jamal', url = 'https://www.bg-wiki.com/ffxi/Jamal' },
+                { type = 'text', value = 'again to unlock the Objective for' },
+                { type = 'link', text = 'Cipher: Ark HM.', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Ark_HM' },
+                { type = 'text', value = 'Be sure before zoning' },
+                { type = 'link', text = 'Jamal', url = 'https://www.bg-wiki.com/ffxi/Jamal' },
+                { type = 'text', value = 'asks you to "Please come by again later."' },
+            },
+            {
+                { type = 'text', value = "You may need to zone and talk to him again if you haven't talked to him since trading Ark Angel TT 's cipher in order for him to unlock the Objective." },
+            },
+            {
+                { type = 'text', value = 'Complete the' },
+                { type = 'link', text = 'Records of Eminence Objective:', url = 'https://www.bg-wiki.com/ffxi/Category:Records_of_Eminence#RoE_Quests_3' },
+                { type = 'text', value = 'Eliminate Your Apathy Warp to' },
+                { type = 'link', text = "Tu'Lia", url = 'https://www.bg-wiki.com/ffxi/Tu%27Lia' },
+                { type = 'text', value = '→' },
+                { type = 'link', text = "Ru'Aun Gardens", url = 'https://www.bg-wiki.com/ffxi/Ru%27Aun_Gardens' },
+                { type = 'text', value = '#1 to battle the Ark Angel with a' },
+                { type = 'link', text = 'Phantom gem of apathy', url = 'https://www.bg-wiki.com/ffxi/Phantom_gem_of_apathy' },
+                { type = 'text', value = 'on any difficulty. Players will be unable to receive the alter ego when trading the Cipher if they have not completed the' },
+                { type = 'link', text = "Rhapsodies of Vana'diel", url = 'https://www.bg-wiki.com/ffxi/Rhapsodies_of_Vana%27diel' },
+                { type = 'text', value = 'mission "' },
+                { type = 'link', text = 'Exploring the Ruins.', url = 'https://www.bg-wiki.com/ffxi/Exploring_the_Ruins' },
+                { type = 'text', value = '" Completing that cutscene/mission will allow the cipher to be traded.' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses HP+20%' },
+            },
+            {
+                { type = 'text', value = 'Possesses an Utsusemi +1 trait which grants AA HM an extra shadow.' },
+            },
+            {
+                { type = 'text', value = 'If there is a NIN, PLD, or RUN in the party, behaves as a damage dealer: Uses' },
+                { type = 'link', text = 'Innin,', url = 'https://www.bg-wiki.com/ffxi/Innin' },
+                { type = 'link', text = 'Berserk.', url = 'https://www.bg-wiki.com/ffxi/Berserk' },
+            },
+            {
+                { type = 'text', value = 'If there are no other tanks in the party, behaves as a tank: Uses' },
+                { type = 'link', text = 'Yonin,', url = 'https://www.bg-wiki.com/ffxi/Yonin' },
+                { type = 'link', text = 'Warcry.', url = 'https://www.bg-wiki.com/ffxi/Warcry' },
+            },
+            {
+                { type = 'text', value = 'Uses Provoke in both situations in order to be sub tank.' },
+            },
+            {
+                { type = 'text', value = 'Casts debuffs when does not have hate.' },
+            },
+            {
+                { type = 'text', value = 'Starts fights with Migawari if available.' },
+            },
+            {
+                { type = 'text', value = 'Uses weapon skills at 1000 TP and does not try to skillchain.' },
+            },
+        },
+    },
+    ['August'] = {
+        name = 'August',
+        job = {
+            {
+                { type = 'link', text = 'Paladin', url = 'https://www.bg-wiki.com/ffxi/Paladin' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Warrior', url = 'https://www.bg-wiki.com/ffxi/Warrior' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Cure I - IV,', url = 'https://www.bg-wiki.com/ffxi/Category:Cure_Spell' },
+                { type = 'link', text = 'Flash,', url = 'https://www.bg-wiki.com/ffxi/Flash' },
+                { type = 'link', text = 'Holy II,', url = 'https://www.bg-wiki.com/ffxi/Holy_II' },
+                { type = 'link', text = 'Reprisal', url = 'https://www.bg-wiki.com/ffxi/Reprisal' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Sentinel,', url = 'https://www.bg-wiki.com/ffxi/Sentinel' },
+                { type = 'link', text = 'Provoke,', url = 'https://www.bg-wiki.com/ffxi/Provoke' },
+                { type = 'link', text = 'Divine Emblem,', url = 'https://www.bg-wiki.com/ffxi/Divine_Emblem' },
+                { type = 'link', text = 'Palisade,', url = 'https://www.bg-wiki.com/ffxi/Palisade' },
+                { type = 'text', value = 'Daybreak (Wings)' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'text', value = 'Neutral:' },
+                { type = 'link', text = 'Alabaster Burst', url = 'https://www.bg-wiki.com/index.php?title=Alabaster_Burst&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Distortion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Detonation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Null Field', url = 'https://www.bg-wiki.com/index.php?title=Null_Field&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Fusion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Transfixion' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Tartaric Sigil', url = 'https://www.bg-wiki.com/index.php?title=Tartaric_Sigil&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Compression' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Scission' },
+            },
+            {
+                { type = 'text', value = 'Daybreak:' },
+                { type = 'link', text = 'Fulminous Fury', url = 'https://www.bg-wiki.com/index.php?title=Fulminous_Fury&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Fragmentation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Noble Frenzy', url = 'https://www.bg-wiki.com/index.php?title=Noble_Frenzy&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Gravitation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'No Quarter', url = 'https://www.bg-wiki.com/index.php?title=No_Quarter&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Light' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Distortion' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: August', url = 'https://www.bg-wiki.com/ffxi/Cipher:_August' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Sinister Reign', url = 'https://www.bg-wiki.com/ffxi/Sinister_Reign' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+            {
+                { type = 'link', text = 'Records of Eminence', url = 'https://www.bg-wiki.com/ffxi/Records_of_Eminence' },
+                { type = 'text', value = 'Quest' },
+                { type = 'link', text = 'Way Over Capacity', url = 'https://www.bg-wiki.com/ffxi/Way_Over_Capacity' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses HP+10%' },
+            },
+            {
+                { type = 'text', value = 'Uses' },
+                { type = 'link', text = 'Divine Emblem', url = 'https://www.bg-wiki.com/ffxi/Divine_Emblem' },
+                { type = 'text', value = 'to enhance' },
+                { type = 'link', text = 'Holy II.', url = 'https://www.bg-wiki.com/ffxi/Holy_II' },
+            },
+            {
+                { type = 'text', value = "August's attacks are not affected by Sambas." },
+            },
+            {
+                { type = 'text', value = 'August wears the' },
+                { type = 'link', text = "Founder's Gear", url = 'https://www.bg-wiki.com/ffxi/Dec.:_August#Notes' },
+                { type = 'text', value = 'and has accordingly all Killer Effects and high resistance to Terror.' },
+            },
+            {
+                { type = 'text', value = 'August can switch weapons at will while auto attacking and performing weapon skills, it is unknown if this changes his damage type or is merely cosmetic.' },
+            },
+            {
+                { type = 'text', value = 'He has been observed wielding H2H, Dagger and Axe, Bow (Auto Attacks), Great Axe and Scythe (Alabaster Burst), Great Sword (Tartaric Sigil), Dual Katanas and Great Katana (Noble Frenzy) Club and Staff (Fulminous Fury), All Weapons combined (No Quarter), and Flute (Daybreak) in addition to his default Sword and Shield.' },
+            },
+            {
+                { type = 'text', value = 'August is considered to be wielding a' },
+                { type = 'link', text = 'Great Sword', url = 'https://www.bg-wiki.com/ffxi/Great_Sword' },
+                { type = 'text', value = 'for the purposes of' },
+                { type = 'link', text = 'Damage Limit+', url = 'https://www.bg-wiki.com/ffxi/Damage_Limit%2B' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = 'Inundation.', url = 'https://www.bg-wiki.com/ffxi/Inundation' },
+                { type = 'text', value = '[' },
+                { type = 'link', text = 'Reference:Patch Notes', url = 'https://forum.square-enix.com/ffxi/threads/54790-December.-11-2018-%28JST%29-Version-Update?p=611714&amp;viewfull=1#post611714' },
+                { type = 'text', value = ']' },
+            },
+            {
+                { type = 'text', value = 'Uses weapon skills at 1000 TP and does not try to skillchain.' },
+            },
+            {
+                { type = 'text', value = 'Daybreak (~3 min cooldown, ~1 min 30 sec duration)' },
+            },
+            {
+                { type = 'text', value = "When August's HP drops below a certain threshold (~66%), he uses Daybreak if it's available which partially restores some HP and MP, resets his TP, and activates an aura with wings of light" },
+            },
+            {
+                { type = 'text', value = 'Daybreak is a -50%' },
+                { type = 'link', text = 'PDT', url = 'https://www.bg-wiki.com/ffxi/PDT' },
+                { type = 'text', value = 'effect, full' },
+                { type = 'link', text = 'Erase,', url = 'https://www.bg-wiki.com/ffxi/Erase' },
+                { type = 'link', text = 'Stats', url = 'https://www.bg-wiki.com/ffxi/Category:Base_Stats' },
+                { type = 'text', value = 'boost,' },
+                { type = 'link', text = 'Regen,', url = 'https://www.bg-wiki.com/ffxi/Regen' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = 'Store TP', url = 'https://www.bg-wiki.com/ffxi/Store_TP' },
+            },
+            {
+                { type = 'text', value = "During Daybreak, August's next weapon skill will be Fulminous Fury or Noble Frenzy, followed by No Quarter" },
+            },
+            {
+                { type = 'text', value = 'Daybreak is removed after the use of No Quarter.' },
+            },
+            {
+                { type = 'text', value = "Daybreak's cooldown may start when No Quarter is used (meaning it's about a 1.5min cooldown)" },
+            },
+        },
+    },
+    ['Curilla'] = {
+        name = 'Curilla',
+        job = {
+            {
+                { type = 'link', text = 'Paladin', url = 'https://www.bg-wiki.com/ffxi/Paladin' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Paladin', url = 'https://www.bg-wiki.com/ffxi/Paladin' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Cure I - IV,', url = 'https://www.bg-wiki.com/ffxi/Category:Cure_Spell' },
+                { type = 'link', text = 'Flash', url = 'https://www.bg-wiki.com/ffxi/Flash' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Sentinel', url = 'https://www.bg-wiki.com/ffxi/Sentinel' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'text', value = '(5)' },
+                { type = 'link', text = 'Red Lotus Blade', url = 'https://www.bg-wiki.com/ffxi/Red_Lotus_Blade' },
+                { type = 'skillchain', value = 'Liquefaction' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Detonation' },
+                { type = 'text', value = ', (25)' },
+                { type = 'link', text = 'Seraph Blade', url = 'https://www.bg-wiki.com/ffxi/Seraph_Blade' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ', (50)' },
+                { type = 'link', text = 'Swift Blade', url = 'https://www.bg-wiki.com/ffxi/Swift_Blade' },
+                { type = 'skillchain', value = 'Gravitation' },
+                { type = 'text', value = ', (60)' },
+                { type = 'link', text = 'Vorpal Blade', url = 'https://www.bg-wiki.com/ffxi/Vorpal_Blade' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Impaction' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Complete the initiation quest in' },
+                { type = 'link', text = 'San d’Oria.', url = 'https://www.bg-wiki.com/ffxi/Trust:_San_d%27Oria' },
+            },
+            {
+                { type = 'text', value = 'Must be Rank 3 or higher in any nation.' },
+            },
+            {
+                { type = 'text', value = 'Speak with' },
+                { type = 'link', text = 'Curilla', url = 'https://www.bg-wiki.com/ffxi/Curilla' },
+                { type = 'text', value = 'in' },
+                { type = 'link', text = "Chateau d'Oraguille", url = 'https://www.bg-wiki.com/ffxi/Chateau_d%27Oraguille' },
+                { type = 'text', value = 'at (I-9).' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses MP+30%,' },
+                { type = 'link', text = 'Guardian', url = 'https://www.bg-wiki.com/ffxi/Guardian' },
+                { type = 'text', value = '(Sentinel enmity loss -95%), Sentinel Recast merited (-50 sec),' },
+                { type = 'link', text = 'Cure Potency Bonus', url = 'https://www.bg-wiki.com/ffxi/Cure_Potency' },
+                { type = 'text', value = '+25%, and' },
+                { type = 'link', text = 'Cure Casting Time Down.', url = 'https://www.bg-wiki.com/ffxi/Spell_Casting_Time' },
+            },
+            {
+                { type = 'text', value = 'Does not use' },
+                { type = 'link', text = 'Provoke,', url = 'https://www.bg-wiki.com/ffxi/Provoke' },
+                { type = 'text', value = 'but will use' },
+                { type = 'link', text = 'Flash.', url = 'https://www.bg-wiki.com/ffxi/Flash' },
+                { type = 'text', value = 'This leads to poor hate control.' },
+            },
+            {
+                { type = 'text', value = 'Uses TP randomly and does not try to skillchain.' },
+            },
+            {
+                { type = 'text', value = 'Cures players and trusts in yellow (<75%) HP.' },
+            },
+        },
+    },
+    ['Gessho'] = {
+        name = 'Gessho',
+        job = {
+            {
+                { type = 'link', text = 'Ninja', url = 'https://www.bg-wiki.com/ffxi/Ninja' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Warrior', url = 'https://www.bg-wiki.com/ffxi/Warrior' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Utsusemi: Ichi', url = 'https://www.bg-wiki.com/ffxi/Utsusemi:_Ichi' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Ni,', url = 'https://www.bg-wiki.com/ffxi/Utsusemi:_Ni' },
+                { type = 'link', text = 'Hojo: Ichi', url = 'https://www.bg-wiki.com/ffxi/Hojo:_Ichi' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Ni,', url = 'https://www.bg-wiki.com/ffxi/Hojo:_Ni' },
+                { type = 'link', text = 'Kurayami: Ichi', url = 'https://www.bg-wiki.com/ffxi/Kurayami:_Ichi' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Ni', url = 'https://www.bg-wiki.com/ffxi/Kurayami:_Ni' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Provoke,', url = 'https://www.bg-wiki.com/ffxi/Provoke' },
+                { type = 'link', text = 'Yonin,', url = 'https://www.bg-wiki.com/ffxi/Yonin' },
+                { type = 'text', value = 'Shiko no Mitate (' },
+                { type = 'link', text = 'Yagudo Parry', url = 'https://www.bg-wiki.com/ffxi/Category:Yagudo#Abilities' },
+                { type = 'text', value = '), Rinpyotosha (' },
+                { type = 'link', text = 'Yagudo Howl:', url = 'https://www.bg-wiki.com/ffxi/Category:Yagudo#Abilities' },
+                { type = 'link', text = 'Attack Boost', url = 'https://www.bg-wiki.com/ffxi/Attack_Boost' },
+                { type = 'text', value = ')' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'text', value = 'Happobarai (' },
+                { type = 'link', text = 'Yagudo Sweep', url = 'https://www.bg-wiki.com/ffxi/Category:Yagudo#Abilities' },
+                { type = 'text', value = ')' },
+                { type = 'skillchain', value = 'Reverberation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Impaction' },
+                { type = 'text', value = ', Hane Fubuki (' },
+                { type = 'link', text = 'Feather Storm', url = 'https://www.bg-wiki.com/ffxi/Feather_Storm' },
+                { type = 'text', value = ')' },
+                { type = 'skillchain', value = 'Transfixion' },
+                { type = 'text', value = ', Shibaraku (AoE)' },
+                { type = 'skillchain', value = 'Dark' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Gravitation' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Complete' },
+                { type = 'link', text = 'Passing Glory.', url = 'https://www.bg-wiki.com/ffxi/Passing_Glory' },
+            },
+            {
+                { type = 'text', value = 'Examine the cushion in' },
+                { type = 'link', text = 'Aht Urhgan Whitegate', url = 'https://www.bg-wiki.com/ffxi/Aht_Urhgan_Whitegate' },
+                { type = 'text', value = '(J-12).' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Will only use the highest tier debuff available, but will use both' },
+                { type = 'link', text = 'Utsusemi', url = 'https://www.bg-wiki.com/ffxi/Utsusemi' },
+                { type = 'text', value = 'spells.' },
+            },
+            {
+                { type = 'text', value = 'Will maintain' },
+                { type = 'link', text = 'Yonin', url = 'https://www.bg-wiki.com/ffxi/Yonin' },
+                { type = 'text', value = 'full time.' },
+            },
+            {
+                { type = 'text', value = 'Greatly benefits from capping magical haste as it will allow for better maintenance of Utsusemi shadows.' },
+            },
+            {
+                { type = 'text', value = 'Holds TP until 1500 to try to close skillchains.' },
+            },
+            {
+                { type = 'text', value = "Gessho is a good tank choice for players trying to avoid Light-based damage since his weapon skills won't accidentally open Light skillchains." },
+            },
+            {
+                { type = 'text', value = 'Special abilities:' },
+            },
+            {
+                { type = 'text', value = 'Shiko no Mitate : Defense Boost +' },
+                { type = 'link', text = 'Stoneskin', url = 'https://www.bg-wiki.com/ffxi/Stoneskin' },
+                { type = 'text', value = '+' },
+                { type = 'link', text = 'Issekigan', url = 'https://www.bg-wiki.com/ffxi/Issekigan' },
+            },
+            {
+                { type = 'text', value = 'Rinpyotosha : Party members gain a 3 minute' },
+                { type = 'link', text = 'Attack Boost', url = 'https://www.bg-wiki.com/ffxi/Attack_Boost' },
+                { type = 'text', value = '(+25% Attack) effect. 5 minute cooldown.' },
+            },
+        },
+    },
+    ['Mnejing'] = {
+        name = 'Mnejing',
+        job = {
+            {
+                { type = 'link', text = 'Paladin', url = 'https://www.bg-wiki.com/ffxi/Paladin' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Paladin', url = 'https://www.bg-wiki.com/ffxi/Paladin' },
+                { type = 'text', value = '"' },
+                { type = 'link', text = 'Valoredge', url = 'https://www.bg-wiki.com/ffxi/Valoredge' },
+                { type = 'text', value = '"' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Strobe I - II', url = 'https://www.bg-wiki.com/ffxi/Strobe' },
+                { type = 'text', value = '(' },
+                { type = 'link', text = 'Provoke', url = 'https://www.bg-wiki.com/ffxi/Provoke' },
+                { type = 'text', value = '),' },
+                { type = 'link', text = 'Shield Bash', url = 'https://www.bg-wiki.com/ffxi/Shield_Bash' },
+                { type = 'text', value = '(' },
+                { type = 'link', text = 'Stun', url = 'https://www.bg-wiki.com/ffxi/Stun' },
+                { type = 'text', value = '),' },
+                { type = 'link', text = 'Disruptor', url = 'https://www.bg-wiki.com/ffxi/Disruptor' },
+                { type = 'text', value = '(' },
+                { type = 'link', text = 'Dispel', url = 'https://www.bg-wiki.com/ffxi/Dispel' },
+                { type = 'text', value = '),' },
+                { type = 'link', text = 'Flashbulb', url = 'https://www.bg-wiki.com/ffxi/Flashbulb' },
+                { type = 'text', value = '(' },
+                { type = 'link', text = 'Flash', url = 'https://www.bg-wiki.com/ffxi/Flash' },
+                { type = 'text', value = ')' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Chimera Ripper', url = 'https://www.bg-wiki.com/ffxi/Chimera_Ripper' },
+                { type = 'skillchain', value = 'Induration' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Detonation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'String Clipper', url = 'https://www.bg-wiki.com/ffxi/String_Clipper' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Impaction' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Shield Subverter', url = 'https://www.bg-wiki.com/ffxi/Shield_Subverter' },
+                { type = 'text', value = '(Conal AoE, Silence)' },
+                { type = 'skillchain', value = 'Light' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Fusion' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Mnejing', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Mnejing' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Repeat Login Campaign', url = 'https://www.bg-wiki.com/ffxi/Repeat_Login_Campaign' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Passive -37.5% Damage Taken Reduction.' },
+            },
+            {
+                { type = 'text', value = 'Possesses lower HP than most tanks, but takes significantly less damage.' },
+            },
+            {
+                { type = 'text', value = 'Possesses a moderate amount of MP, despite the fact he cannot use magic.' },
+            },
+            {
+                { type = 'text', value = 'Possesses' },
+                { type = 'link', text = 'Barrier Module', url = 'https://www.bg-wiki.com/ffxi/Barrier_Module' },
+                { type = 'text', value = '(Increased Block Chance, Shield Mastery)' },
+            },
+            {
+                { type = 'text', value = 'Mnejing will hold up to 1500 TP to close skillchains; however, he will not always choose to close with a weapon skill which will create the highest tier skillchain possible.' },
+            },
+            {
+                { type = 'text', value = '(i.e.: he will sometimes use' },
+                { type = 'link', text = 'Chimera Ripper', url = 'https://www.bg-wiki.com/ffxi/Chimera_Ripper' },
+                { type = 'text', value = 'to skillchain with' },
+                { type = 'link', text = 'Savage Blade', url = 'https://www.bg-wiki.com/ffxi/Savage_Blade' },
+                { type = 'text', value = 'to create a tier 1 skillchain instead of Shield Subverter to create a tier 3 skillchain)' },
+            },
+            {
+                { type = 'text', value = 'Mnejing tries to interrupt TP-abilities with' },
+                { type = 'link', text = 'Shield Bash.', url = 'https://www.bg-wiki.com/ffxi/Shield_Bash' },
+            },
+            {
+                { type = 'text', value = 'Mnejing will' },
+                { type = 'link', text = 'Flash', url = 'https://www.bg-wiki.com/ffxi/Flash' },
+                { type = 'text', value = 'its target using the' },
+                { type = 'link', text = 'Flashbulb', url = 'https://www.bg-wiki.com/ffxi/Flashbulb' },
+                { type = 'text', value = "(Mnejing's Flash generates considerable enmity)." },
+            },
+            {
+                { type = 'text', value = 'Mnejing can use the effects of his attachments (Strobe, Barrier Module, Flashbulb, and Disruptor) despite not having any maneuvers effects.' },
+            },
+            {
+                { type = 'text', value = "Mnejing's Disruptor" },
+                { type = 'link', text = 'Dispel', url = 'https://www.bg-wiki.com/ffxi/Dispel' },
+                { type = 'text', value = 'is highly accurate and he will use it against enemies other trusts will not attempt to dispel due to M.ACC.' },
+            },
+        },
+    },
+    ['Rahal'] = {
+        name = 'Rahal',
+        job = {
+            {
+                { type = 'link', text = 'Paladin', url = 'https://www.bg-wiki.com/ffxi/Paladin' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Warrior', url = 'https://www.bg-wiki.com/ffxi/Warrior' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Cure I - IV,', url = 'https://www.bg-wiki.com/ffxi/Category:Cure_Spell' },
+                { type = 'link', text = 'Flash,', url = 'https://www.bg-wiki.com/ffxi/Flash' },
+                { type = 'link', text = 'Phalanx,', url = 'https://www.bg-wiki.com/ffxi/Phalanx' },
+                { type = 'link', text = 'Enlight', url = 'https://www.bg-wiki.com/ffxi/Enlight' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Sentinel,', url = 'https://www.bg-wiki.com/ffxi/Sentinel' },
+                { type = 'link', text = 'Berserk,', url = 'https://www.bg-wiki.com/ffxi/Berserk' },
+                { type = 'link', text = 'Provoke,', url = 'https://www.bg-wiki.com/ffxi/Provoke' },
+                { type = 'link', text = 'Shield Bash', url = 'https://www.bg-wiki.com/ffxi/Shield_Bash' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Fast Blade', url = 'https://www.bg-wiki.com/ffxi/Fast_Blade' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Seraph Blade', url = 'https://www.bg-wiki.com/ffxi/Seraph_Blade' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Swift Blade', url = 'https://www.bg-wiki.com/ffxi/Swift_Blade' },
+                { type = 'skillchain', value = 'Gravitation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Savage Blade', url = 'https://www.bg-wiki.com/ffxi/Savage_Blade' },
+                { type = 'skillchain', value = 'Fragmentation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Scission' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Rahal', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Rahal' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Repeat Login Campaign', url = 'https://www.bg-wiki.com/ffxi/Repeat_Login_Campaign' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses' },
+                { type = 'link', text = 'Dragon Killer.', url = 'https://www.bg-wiki.com/ffxi/Dragon_Killer' },
+            },
+            {
+                { type = 'text', value = 'Rahal is an aggressive tank who uses' },
+                { type = 'link', text = 'Berserk.', url = 'https://www.bg-wiki.com/ffxi/Berserk' },
+            },
+            {
+                { type = 'text', value = 'Prioritizes' },
+                { type = 'link', text = 'Flash', url = 'https://www.bg-wiki.com/ffxi/Flash' },
+                { type = 'text', value = 'over' },
+                { type = 'link', text = 'Provoke.', url = 'https://www.bg-wiki.com/ffxi/Provoke' },
+            },
+            {
+                { type = 'text', value = 'Will only cast' },
+                { type = 'link', text = 'Cure', url = 'https://www.bg-wiki.com/ffxi/Category:Cure_Spell' },
+                { type = 'text', value = 'when a party member is below 33% health and will use the highest tier available.' },
+            },
+            {
+                { type = 'text', value = 'Will only use' },
+                { type = 'link', text = 'Sentinel', url = 'https://www.bg-wiki.com/ffxi/Sentinel' },
+                { type = 'text', value = 'when he is below 33% health.' },
+            },
+            {
+                { type = 'text', value = 'He tries to interrupt TP-abilities and high-tier spells with' },
+                { type = 'link', text = 'Shield Bash.', url = 'https://www.bg-wiki.com/ffxi/Shield_Bash' },
+            },
+            {
+                { type = 'text', value = 'Holds up to 2500 TP to close skillchains.' },
+            },
+        },
+    },
+    ['Rughadjeen'] = {
+        name = 'Rughadjeen',
+        job = {
+            {
+                { type = 'link', text = 'Paladin', url = 'https://www.bg-wiki.com/ffxi/Paladin' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Paladin', url = 'https://www.bg-wiki.com/ffxi/Paladin' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Holy,', url = 'https://www.bg-wiki.com/ffxi/Holy' },
+                { type = 'link', text = 'Flash,', url = 'https://www.bg-wiki.com/ffxi/Flash' },
+                { type = 'link', text = 'Cure I - IV,', url = 'https://www.bg-wiki.com/ffxi/Category:Cure_Spell' },
+                { type = 'link', text = 'Raise', url = 'https://www.bg-wiki.com/ffxi/Raise' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Sentinel,', url = 'https://www.bg-wiki.com/ffxi/Sentinel' },
+                { type = 'link', text = 'Divine Emblem,', url = 'https://www.bg-wiki.com/ffxi/Divine_Emblem' },
+                { type = 'link', text = 'Holy Circle,', url = 'https://www.bg-wiki.com/ffxi/Holy_Circle' },
+                { type = 'link', text = 'Chivalry', url = 'https://www.bg-wiki.com/ffxi/Chivalry' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Power Slash', url = 'https://www.bg-wiki.com/ffxi/Power_Slash' },
+                { type = 'skillchain', value = 'Transfixion' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Sickle Moon', url = 'https://www.bg-wiki.com/ffxi/Sickle_Moon' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Impaction' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Ground Strike', url = 'https://www.bg-wiki.com/ffxi/Ground_Strike' },
+                { type = 'skillchain', value = 'Fragmentation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Distortion' },
+                { type = 'text', value = ', Victory Beacon (Conal AoE)' },
+                { type = 'skillchain', value = 'Light' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Distortion' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Rughadjeen', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Rughadjeen' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Repeat Login Campaign', url = 'https://www.bg-wiki.com/ffxi/Repeat_Login_Campaign' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Red)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Red)' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses' },
+                { type = 'link', text = 'Fast Cast,', url = 'https://www.bg-wiki.com/ffxi/Fast_Cast' },
+                { type = 'link', text = 'Cure Potency Received', url = 'https://www.bg-wiki.com/ffxi/Cure_Potency_Received' },
+                { type = 'text', value = '+30%,' },
+                { type = 'link', text = 'Damage Taken', url = 'https://www.bg-wiki.com/ffxi/Damage_Taken' },
+                { type = 'text', value = '-5%, HP+20%, MP+20%.' },
+            },
+            {
+                { type = 'text', value = 'He wields the Algol and so has an enfire effect and a 3% triple attack rate.' },
+            },
+            {
+                { type = 'text', value = 'Uses' },
+                { type = 'link', text = 'Holy Circle', url = 'https://www.bg-wiki.com/ffxi/Holy_Circle' },
+                { type = 'text', value = 'if the enemy is' },
+                { type = 'link', text = 'Undead.', url = 'https://www.bg-wiki.com/ffxi/Category:Undead' },
+            },
+            {
+                { type = 'text', value = 'Will only cast' },
+                { type = 'link', text = 'Cure I - IV', url = 'https://www.bg-wiki.com/ffxi/Category:Cure_Spell' },
+                { type = 'text', value = 'when a party member is below 75% (yellow) HP or asleep.' },
+            },
+            {
+                { type = 'text', value = 'Tries to use weapon skills at 1000 TP, but it is lower priority.' },
+            },
+            {
+                { type = 'text', value = 'Uses' },
+                { type = 'link', text = 'Chivalry', url = 'https://www.bg-wiki.com/ffxi/Chivalry' },
+                { type = 'text', value = "at 50% MP if it's available." },
+            },
+            {
+                { type = 'text', value = 'Will cast' },
+                { type = 'link', text = 'Raise', url = 'https://www.bg-wiki.com/ffxi/Raise' },
+                { type = 'text', value = "on KO'd party members in casting range." },
+            },
+        },
+    },
+    ['Trion'] = {
+        name = 'Trion',
+        job = {
+            {
+                { type = 'link', text = 'Paladin', url = 'https://www.bg-wiki.com/ffxi/Paladin' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Warrior', url = 'https://www.bg-wiki.com/ffxi/Warrior' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Cure I - IV,', url = 'https://www.bg-wiki.com/ffxi/Category:Cure_Spell' },
+                { type = 'link', text = 'Flash', url = 'https://www.bg-wiki.com/ffxi/Flash' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Provoke,', url = 'https://www.bg-wiki.com/ffxi/Provoke' },
+                { type = 'link', text = 'Sentinel', url = 'https://www.bg-wiki.com/ffxi/Sentinel' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Red Lotus Blade', url = 'https://www.bg-wiki.com/ffxi/Red_Lotus_Blade' },
+                { type = 'skillchain', value = 'Liquefaction' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Detonation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Savage Blade', url = 'https://www.bg-wiki.com/ffxi/Savage_Blade' },
+                { type = 'skillchain', value = 'Fragmentation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ', Royal Bash (' },
+                { type = 'link', text = 'Shield Bash', url = 'https://www.bg-wiki.com/ffxi/Shield_Bash' },
+                { type = 'text', value = ')' },
+                { type = 'skillchain', value = 'Status_Ability' },
+                { type = 'text', value = ', Royal Savior (' },
+                { type = 'link', text = 'Palisade,', url = 'https://www.bg-wiki.com/ffxi/Palisade' },
+                { type = 'link', text = 'Sentinel,', url = 'https://www.bg-wiki.com/ffxi/Sentinel' },
+                { type = 'link', text = 'Stoneskin', url = 'https://www.bg-wiki.com/ffxi/Stoneskin' },
+                { type = 'text', value = ')' },
+                { type = 'skillchain', value = 'Status_Ability' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Complete the initiation quest in' },
+                { type = 'link', text = 'San d’Oria.', url = 'https://www.bg-wiki.com/ffxi/Trust:_San_d%27Oria' },
+            },
+            {
+                { type = 'text', value = 'Must be Rank 6 or higher in any nation.' },
+            },
+            {
+                { type = 'text', value = 'Examine the "Door: Prince Royal’s Room" in' },
+                { type = 'link', text = "Chateau d'Oraguille", url = 'https://www.bg-wiki.com/ffxi/Chateau_d%27Oraguille' },
+                { type = 'text', value = 'at (H-7).' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Royal Bash is stronger than a normal' },
+                { type = 'link', text = 'Shield Bash.', url = 'https://www.bg-wiki.com/ffxi/Shield_Bash' },
+                { type = 'text', value = 'Royal Saviour is a secondary, stronger version of' },
+                { type = 'link', text = 'Sentinel.', url = 'https://www.bg-wiki.com/ffxi/Sentinel' },
+                { type = 'text', value = 'Trion alternates between this and the normal version of Sentinel.' },
+            },
+            {
+                { type = 'text', value = 'Trion tries to interrupt TP-abilities with Royal Bash.' },
+            },
+            {
+                { type = 'text', value = 'Uses TP randomly and does not try to skillchain.' },
+            },
+            {
+                { type = 'text', value = "With his two defensive TP moves, he's not likely to interrupt skillchains much." },
+            },
+        },
+    },
+    ['Valaineral'] = {
+        name = 'Valaineral',
+        job = {
+            {
+                { type = 'link', text = 'Paladin', url = 'https://www.bg-wiki.com/ffxi/Paladin' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Warrior', url = 'https://www.bg-wiki.com/ffxi/Warrior' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Cure I - IV,', url = 'https://www.bg-wiki.com/ffxi/Category:Cure_Spell' },
+                { type = 'link', text = 'Flash,', url = 'https://www.bg-wiki.com/ffxi/Flash' },
+                { type = 'link', text = 'Protect IV - V,', url = 'https://www.bg-wiki.com/ffxi/Category:Protect_Spell' },
+                { type = 'link', text = 'Reprisal,', url = 'https://www.bg-wiki.com/ffxi/Reprisal' },
+                { type = 'link', text = 'Enlight,', url = 'https://www.bg-wiki.com/ffxi/Enlight' },
+                { type = 'link', text = 'Phalanx', url = 'https://www.bg-wiki.com/ffxi/Phalanx' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Provoke,', url = 'https://www.bg-wiki.com/ffxi/Provoke' },
+                { type = 'link', text = 'Sentinel,', url = 'https://www.bg-wiki.com/ffxi/Sentinel' },
+                { type = 'link', text = 'Majesty,', url = 'https://www.bg-wiki.com/ffxi/Majesty' },
+                { type = 'link', text = 'Defender,', url = 'https://www.bg-wiki.com/ffxi/Defender' },
+                { type = 'link', text = 'Fealty,', url = 'https://www.bg-wiki.com/ffxi/Fealty' },
+                { type = 'link', text = 'Divine Emblem,', url = 'https://www.bg-wiki.com/ffxi/Divine_Emblem' },
+                { type = 'link', text = 'Chivalry,', url = 'https://www.bg-wiki.com/ffxi/Chivalry' },
+                { type = 'link', text = 'Palisade,', url = 'https://www.bg-wiki.com/ffxi/Palisade' },
+                { type = 'link', text = 'Rampart', url = 'https://www.bg-wiki.com/ffxi/Rampart' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Circle Blade', url = 'https://www.bg-wiki.com/ffxi/Circle_Blade' },
+                { type = 'skillchain', value = 'Reverberation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Impaction' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Sanguine Blade', url = 'https://www.bg-wiki.com/ffxi/Sanguine_Blade' },
+                { type = 'skillchain', value = 'Status_Ability' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Savage Blade', url = 'https://www.bg-wiki.com/ffxi/Savage_Blade' },
+                { type = 'skillchain', value = 'Fragmentation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Uriel Blade', url = 'https://www.bg-wiki.com/ffxi/Uriel_Blade' },
+                { type = 'text', value = '(AoE)' },
+                { type = 'skillchain', value = 'Light' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Fragmentation' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Valaineral', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Valaineral' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Records of Eminence: Basic Tutorial Objective', url = 'https://www.bg-wiki.com/ffxi/Category:Records_of_Eminence#Tutorial' },
+                { type = 'text', value = 'Reward' },
+            },
+            {
+                { type = 'link', text = 'Repeat Login Campaign', url = 'https://www.bg-wiki.com/ffxi/Repeat_Login_Campaign' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses Enmity+,' },
+                { type = 'link', text = 'Cure Potency Bonus', url = 'https://www.bg-wiki.com/ffxi/Cure_Potency' },
+                { type = 'text', value = '+50%, Spell interruption rate decrease, Refresh+ (+3mp/tick' },
+                { type = 'link', text = 'Auto Refresh,', url = 'https://www.bg-wiki.com/ffxi/Auto_Refresh' },
+                { type = 'text', value = 'stacks with PLD trait), and Damage Taken -8%, HP+10%, MP+20%' },
+            },
+            {
+                { type = 'link', text = 'Uriel Blade', url = 'https://www.bg-wiki.com/ffxi/Uriel_Blade' },
+                { type = 'text', value = 'can be used under 1000 TP based on certain conditions, making him excellent at engaging multiple targets. He can even use it when engaging a single target and any time the player draws enmity. This makes him a good SC opener for Ark GK, who can use that to close Light SCs right after engaging an enemy with no TP requirement for either of them.' },
+            },
+            {
+                { type = 'text', value = 'Very powerful at low levels due to his special ability letting him use' },
+                { type = 'link', text = 'Uriel Blade', url = 'https://www.bg-wiki.com/ffxi/Uriel_Blade' },
+                { type = 'text', value = 'before he has access to it as a normal weapon skill (lv.50).' },
+            },
+            {
+                { type = 'text', value = 'Casts' },
+                { type = 'link', text = 'Protect', url = 'https://www.bg-wiki.com/ffxi/Protect' },
+                { type = 'text', value = 'spells on himself under the effect of' },
+                { type = 'link', text = 'Majesty', url = 'https://www.bg-wiki.com/ffxi/Majesty' },
+                { type = 'text', value = 'with the added defense of' },
+                { type = 'link', text = 'Shield Barrier', url = 'https://www.bg-wiki.com/ffxi/Shield_Barrier' },
+                { type = 'text', value = '(defense varies by ilvl, up to 350), but does not attempt to overwrite other Protect effects even if he would gain more defense from doing so.' },
+            },
+            {
+                { type = 'text', value = 'Uses' },
+                { type = 'link', text = 'Divine Emblem', url = 'https://www.bg-wiki.com/ffxi/Divine_Emblem' },
+                { type = 'text', value = 'before casting' },
+                { type = 'link', text = 'Flash', url = 'https://www.bg-wiki.com/ffxi/Flash' },
+                { type = 'text', value = 'if it is available.' },
+            },
+            {
+                { type = 'link', text = 'Rampart', url = 'https://www.bg-wiki.com/ffxi/Rampart' },
+                { type = 'text', value = 'will be used when his target is under the effect of' },
+                { type = 'link', text = 'Chainspell,', url = 'https://www.bg-wiki.com/ffxi/Chainspell' },
+                { type = 'link', text = 'Manafont,', url = 'https://www.bg-wiki.com/ffxi/Manafont' },
+                { type = 'text', value = 'or' },
+                { type = 'link', text = 'Astral Flow.', url = 'https://www.bg-wiki.com/ffxi/Astral_Flow' },
+            },
+            {
+                { type = 'text', value = "Against SMNs, Rampart trigger seems to be based on whether there's an avatar summoned. Certain Tonberry NMs have a Light Spirit or their avatar appears after Astral Flow, which could explain why Rampart didn't trigger." },
+            },
+            {
+                { type = 'link', text = 'Fealty', url = 'https://www.bg-wiki.com/ffxi/Fealty' },
+                { type = 'text', value = 'can be used under certain conditions including anticipating' },
+                { type = 'link', text = 'Mijin Gakure', url = 'https://www.bg-wiki.com/ffxi/Mijin_Gakure' },
+                { type = 'text', value = 'and negating its damage.' },
+            },
+            {
+                { type = 'text', value = 'Uses weapon skills randomly around 2000 TP and does not try to close skillchains.' },
+            },
+        },
+    },
+    ['Abenzio'] = {
+        name = 'Abenzio',
+        job = {
+            {
+                { type = 'link', text = 'Monk', url = 'https://www.bg-wiki.com/ffxi/Monk' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Warrior', url = 'https://www.bg-wiki.com/ffxi/Warrior' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Blank Gaze', url = 'https://www.bg-wiki.com/ffxi/Category:Goobbue#Abilities' },
+                { type = 'text', value = '(Conal paralysis)' },
+                { type = 'skillchain', value = 'Status_Ability' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Antiphase', url = 'https://www.bg-wiki.com/ffxi/Category:Goobbue#Abilities' },
+                { type = 'text', value = '(AoE silence)' },
+                { type = 'skillchain', value = 'Status_Ability' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Uppercut', url = 'https://www.bg-wiki.com/ffxi/Uppercut' },
+                { type = 'skillchain', value = 'Liquefaction' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Impaction' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Blow', url = 'https://www.bg-wiki.com/ffxi/Category:Goobbue#Abilities' },
+                { type = 'text', value = '(Damage + Stun)' },
+                { type = 'skillchain', value = 'Status_Ability' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Abenzio', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Abenzio' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Repeat Login Campaign', url = 'https://www.bg-wiki.com/ffxi/Repeat_Login_Campaign' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Red)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Red)' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses HP+20%' },
+            },
+            {
+                { type = 'text', value = "Abenzio's job is" },
+                { type = 'link', text = 'Monk', url = 'https://www.bg-wiki.com/ffxi/Monk' },
+                { type = 'text', value = 'unlike most' },
+                { type = 'link', text = 'Goobbue', url = 'https://www.bg-wiki.com/ffxi/Goobbue' },
+                { type = 'text', value = 'which are' },
+                { type = 'link', text = 'Warriors.', url = 'https://www.bg-wiki.com/ffxi/Warrior' },
+            },
+            {
+                { type = 'text', value = 'He has the normal MNK/WAR traits, but he does' },
+                { type = 'link', text = 'Kick Attacks', url = 'https://www.bg-wiki.com/ffxi/Kick_Attacks' },
+                { type = 'text', value = "with his arm vines because Goobbue don't have a kick animation." },
+            },
+            {
+                { type = 'text', value = 'Possesses a monstrous' },
+                { type = 'link', text = 'Max HP Boost', url = 'https://www.bg-wiki.com/ffxi/Max_HP_Boost' },
+                { type = 'text', value = 'among other' },
+                { type = 'link', text = 'Job Traits,', url = 'https://www.bg-wiki.com/ffxi/Job_Traits' },
+                { type = 'text', value = "but doesn't use" },
+                { type = 'link', text = 'Job Abilities.', url = 'https://www.bg-wiki.com/ffxi/Job_Abilities' },
+            },
+            {
+                { type = 'text', value = 'As a' },
+                { type = 'link', text = 'Plantoid,', url = 'https://www.bg-wiki.com/ffxi/Category:Plantoids' },
+                { type = 'text', value = 'he intimidates beasts, is intimidated by vermin, and is subject to' },
+                { type = 'link', text = 'Plantoid Killer.', url = 'https://www.bg-wiki.com/ffxi/Plantoid_Killer' },
+            },
+            {
+                { type = 'text', value = 'Uses TP randomly and does not try to skillchain.' },
+            },
+            {
+                { type = 'text', value = 'Summoning, Dismiss and death text can only be understood if summoner is wearing (or lockstyled) mandragora costume gear (Mandragora Suit and Mansque, etc).' },
+            },
+        },
+    },
+    ['Abquhbah'] = {
+        name = 'Abquhbah',
+        job = {
+            {
+                { type = 'link', text = 'Warrior', url = 'https://www.bg-wiki.com/ffxi/Warrior' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Monk', url = 'https://www.bg-wiki.com/ffxi/Monk' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Berserk,', url = 'https://www.bg-wiki.com/ffxi/Berserk' },
+                { type = 'link', text = 'Warcry,', url = 'https://www.bg-wiki.com/ffxi/Warcry' },
+                { type = 'link', text = 'Restraint', url = 'https://www.bg-wiki.com/ffxi/Restraint' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Combo', url = 'https://www.bg-wiki.com/ffxi/Combo' },
+                { type = 'skillchain', value = 'Impaction' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Backhand Blow', url = 'https://www.bg-wiki.com/ffxi/Backhand_Blow' },
+                { type = 'skillchain', value = 'Detonation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Salaheem Spirit', url = 'https://www.bg-wiki.com/ffxi/Salaheem_Spirit' },
+                { type = 'skillchain', value = 'Status_Ability' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Abquhbah', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Abquhbah' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired by talking with' },
+                { type = 'link', text = 'Abquhbah', url = 'https://www.bg-wiki.com/ffxi/Abquhbah' },
+                { type = 'text', value = 'in' },
+                { type = 'link', text = 'Aht Urhgan Whitegate', url = 'https://www.bg-wiki.com/ffxi/Aht_Urhgan_Whitegate' },
+                { type = 'text', value = '(I-10) after completion of:' },
+            },
+            {
+                { type = 'text', value = 'Complete' },
+                { type = 'link', text = 'President Salaheem.', url = 'https://www.bg-wiki.com/ffxi/Aht_Urhgan_Mission_3' },
+            },
+            {
+                { type = 'text', value = 'Complete' },
+                { type = 'link', text = 'Ever Forward.', url = 'https://www.bg-wiki.com/ffxi/Ever_Forward' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Salaheem Spirit' },
+            },
+            {
+                { type = 'text', value = 'All nearby party members receive a +24 bonus to all base attributes, i.e.: STR, DEX, etc. (Bonuses degrade over time: about a rate of -1 per' },
+                { type = 'link', text = 'tock.', url = 'https://www.bg-wiki.com/ffxi/Tock' },
+                { type = 'text', value = 'Usually +13 to +16 left when the effect ends based on initial duration).' },
+            },
+            {
+                { type = 'text', value = 'Duration is based on TP (~70 seconds @1500 TP, ~90 seconds @2000 TP, 120 seconds @3000 TP)' },
+            },
+            {
+                { type = 'text', value = "Salaheem Spirit's attribute bonus seems to be determined on your level ÷ 4 (+18 @ level 72, +24 @ level 99)" },
+            },
+            {
+                { type = 'text', value = 'Holds up to 1500 TP to try to close skillchains.' },
+            },
+            {
+                { type = 'text', value = 'When not able to close a skillchain, uses' },
+                { type = 'link', text = 'Berserk', url = 'https://www.bg-wiki.com/ffxi/Berserk' },
+                { type = 'text', value = '+' },
+                { type = 'link', text = 'Warcry', url = 'https://www.bg-wiki.com/ffxi/Warcry' },
+                { type = 'text', value = '+ random weapon skill.' },
+            },
+            {
+                { type = 'text', value = 'Without any conditions to increase Salaheem Spirit usage: maintaining the bonus is up to luck. External TP Bonuses () and TP gain rate increases (' },
+                { type = 'link', text = 'Regain', url = 'https://www.bg-wiki.com/ffxi/Atma_of_the_Voracious_Violet' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Haste', url = 'https://www.bg-wiki.com/ffxi/Citrullus_memento' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Store TP', url = 'https://www.bg-wiki.com/ffxi/Blazing_wyrm_memento' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Double Attack', url = 'https://www.bg-wiki.com/ffxi/Avatar%27s_Favor' },
+                { type = 'text', value = ') can help.' },
+            },
+        },
+    },
+    ['Aldo'] = {
+        name = 'Aldo',
+        job = {
+            {
+                { type = 'link', text = 'Thief', url = 'https://www.bg-wiki.com/ffxi/Thief' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Ninja', url = 'https://www.bg-wiki.com/ffxi/Ninja' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Bully,', url = 'https://www.bg-wiki.com/ffxi/Bully' },
+                { type = 'link', text = 'Sneak Attack,', url = 'https://www.bg-wiki.com/ffxi/Sneak_Attack' },
+                { type = 'link', text = "Assassin's Charge", url = 'https://www.bg-wiki.com/ffxi/Assassin%27s_Charge' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Lock and Load', url = 'https://www.bg-wiki.com/index.php?title=Lock_and_Load&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Fusion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Reverberation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Shockstorm Edge', url = 'https://www.bg-wiki.com/index.php?title=Shockstorm_Edge&amp;action=edit&amp;redlink=1' },
+                { type = 'text', value = '(AoE)' },
+                { type = 'skillchain', value = 'Impaction' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Detonation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Iniquitous Stab', url = 'https://www.bg-wiki.com/index.php?title=Iniquitous_Stab&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Gravitation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Transfixion' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Choreographed Carnage', url = 'https://www.bg-wiki.com/index.php?title=Choreographed_Carnage&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Dark' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Distortion' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Aldo', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Aldo' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Adventurer Appreciation Campaigns', url = 'https://www.bg-wiki.com/ffxi/Adventurer_Appreciation_Campaign' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Red)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Red)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses THF/NIN traits, limited to' },
+                { type = 'link', text = 'Treasure Hunter I.', url = 'https://www.bg-wiki.com/ffxi/Treasure_Hunter' },
+            },
+            {
+                { type = 'text', value = "Holds up to 2000 TP in order to close skillchains. If he's not able to close a skillchain, will use" },
+                { type = 'link', text = "Assassin's Charge", url = 'https://www.bg-wiki.com/ffxi/Assassin%27s_Charge' },
+                { type = 'text', value = 'in combination with the WS.' },
+            },
+            {
+                { type = 'text', value = 'Can be made to spam Shockstorm Edge (to close) by opening with a Weapon Skill that leaves no alternative (like' },
+                { type = 'link', text = 'Cyclone', url = 'https://www.bg-wiki.com/ffxi/Cyclone' },
+                { type = 'text', value = ')' },
+            },
+            {
+                { type = 'text', value = 'Lock and Load is a marksmanship weapon skill, which Aldo seems to have a lower proficiency in since this weapon skill misses more often than others.' },
+            },
+            {
+                { type = 'text', value = 'Uses' },
+                { type = 'link', text = 'Sneak Attack', url = 'https://www.bg-wiki.com/ffxi/Sneak_Attack' },
+                { type = 'text', value = 'regardless of positioning and does not try to combine it with weapon skills.' },
+            },
+            {
+                { type = 'text', value = 'Will use' },
+                { type = 'link', text = 'Bully', url = 'https://www.bg-wiki.com/ffxi/Bully' },
+                { type = 'text', value = 'before' },
+                { type = 'link', text = 'Sneak Attack', url = 'https://www.bg-wiki.com/ffxi/Sneak_Attack' },
+                { type = 'text', value = '(to remove the directional requirement on Sneak Attack), so try readying a skillchain when you see Aldo use Bully.' },
+            },
+            {
+                { type = 'link', text = 'Sneak Attack', url = 'https://www.bg-wiki.com/ffxi/Sneak_Attack' },
+                { type = 'text', value = 'does not work on ranged or magic weapon skills.' },
+            },
+            {
+                { type = 'text', value = 'Gains TP quickly with Dual Wield and Triple Attack trait: 50 TP/hit x2.' },
+            },
+        },
+    },
+    ['Aldo (UC)'] = {
+        name = 'Aldo (UC)',
+        job = {
+            {
+                { type = 'link', text = 'Thief', url = 'https://www.bg-wiki.com/ffxi/Thief' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Ninja', url = 'https://www.bg-wiki.com/ffxi/Ninja' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Bully,', url = 'https://www.bg-wiki.com/ffxi/Bully' },
+                { type = 'link', text = 'Sneak Attack', url = 'https://www.bg-wiki.com/ffxi/Sneak_Attack' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'text', value = '(50)' },
+                { type = 'link', text = "Sarva's Storm", url = 'https://www.bg-wiki.com/ffxi/Sarva%27s_Storm' },
+                { type = 'skillchain', value = 'Dark' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Distortion' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Be a member of the Aldo Unity Concord.' },
+            },
+            {
+                { type = 'text', value = 'Obtain 5000 Unity Accolades through' },
+                { type = 'link', text = 'Records of Eminence', url = 'https://www.bg-wiki.com/ffxi/Records_of_Eminence' },
+                { type = 'text', value = 'objectives for a Partial Personal Evaluation of 5pt.' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses 5/5' },
+                { type = 'link', text = 'Triple Attack', url = 'https://www.bg-wiki.com/ffxi/Triple_Attack' },
+                { type = 'text', value = 'Rate merits at lv75.' },
+            },
+            {
+                { type = 'text', value = 'Excellent skillchain partner with thieves using' },
+                { type = 'link', text = "Rudra's Storm.", url = 'https://www.bg-wiki.com/ffxi/Rudra%27s_Storm' },
+            },
+            {
+                { type = 'text', value = 'Uses' },
+                { type = 'link', text = 'Sneak Attack', url = 'https://www.bg-wiki.com/ffxi/Sneak_Attack' },
+                { type = 'text', value = 'when behind the target or after using' },
+                { type = 'link', text = 'Bully,', url = 'https://www.bg-wiki.com/ffxi/Bully' },
+                { type = 'text', value = 'but does not try to combine it with weapon skills.' },
+            },
+            {
+                { type = 'text', value = 'Uses' },
+                { type = 'link', text = "Sarva's Storm", url = 'https://www.bg-wiki.com/ffxi/Sarva%27s_Storm' },
+                { type = 'text', value = 'whenever another party member has 1000 TP in order to open skillchains.' },
+            },
+            {
+                { type = 'text', value = "If no other party members gain TP, will use Sarva's Storm at 3000 TP." },
+            },
+        },
+    },
+    ['Areuhat'] = {
+        name = 'Areuhat',
+        job = {
+            {
+                { type = 'link', text = 'Warrior', url = 'https://www.bg-wiki.com/ffxi/Warrior' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Paladin', url = 'https://www.bg-wiki.com/ffxi/Paladin' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Aggressor,', url = 'https://www.bg-wiki.com/ffxi/Aggressor' },
+                { type = 'link', text = 'Berserk,', url = 'https://www.bg-wiki.com/ffxi/Berserk' },
+                { type = 'link', text = 'Blood Rage', url = 'https://www.bg-wiki.com/ffxi/Blood_Rage' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Seraph Blade', url = 'https://www.bg-wiki.com/ffxi/Seraph_Blade' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Vorpal Blade', url = 'https://www.bg-wiki.com/ffxi/Vorpal_Blade' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Impaction' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Savage Blade', url = 'https://www.bg-wiki.com/ffxi/Savage_Blade' },
+                { type = 'skillchain', value = 'Fragmentation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Hurricane Wing', url = 'https://www.bg-wiki.com/ffxi/Category:Wyrm#Abilities' },
+                { type = 'text', value = '(AoE)' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Detonation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Dragon Breath', url = 'https://www.bg-wiki.com/ffxi/Category:Wyrm#Abilities' },
+                { type = 'text', value = '(Conal AoE)' },
+                { type = 'skillchain', value = 'Light' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Fusion' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Areuhat', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Areuhat' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Repeat Login Campaign', url = 'https://www.bg-wiki.com/ffxi/Repeat_Login_Campaign' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Red)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Red)' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses enhanced' },
+                { type = 'link', text = 'Blood Rage', url = 'https://www.bg-wiki.com/ffxi/Blood_Rage' },
+                { type = 'text', value = 'duration (60s duration, 5m cooldown).' },
+            },
+            {
+                { type = 'text', value = 'Areuhat is capable of wielding TP attacks commonly employed by' },
+                { type = 'link', text = 'wyrms.', url = 'https://www.bg-wiki.com/ffxi/Wyrm' },
+            },
+            {
+                { type = 'text', value = 'Even in her Elvaan form, she is susceptible to' },
+                { type = 'link', text = 'Monster Correlation:', url = 'https://www.bg-wiki.com/ffxi/Monster_Correlation' },
+                { type = 'text', value = 'She can intimidate' },
+                { type = 'link', text = 'Demons', url = 'https://www.bg-wiki.com/ffxi/Demon' },
+                { type = 'text', value = 'and be intimidated by them in turn.' },
+            },
+            {
+                { type = 'text', value = 'She waits for' },
+                { type = 'link', text = 'Warcry', url = 'https://www.bg-wiki.com/ffxi/Warcry' },
+                { type = 'text', value = 'effects to expire before using' },
+                { type = 'link', text = 'Blood Rage,', url = 'https://www.bg-wiki.com/ffxi/Blood_Rage' },
+                { type = 'text', value = 'but it will sometimes be immediately overwritten by other' },
+                { type = 'link', text = 'Warrior', url = 'https://www.bg-wiki.com/ffxi/Warrior' },
+                { type = 'text', value = 'trusts using' },
+                { type = 'link', text = 'Warcry', url = 'https://www.bg-wiki.com/ffxi/Warcry' },
+                { type = 'text', value = 'at the same time she casts' },
+                { type = 'link', text = 'Blood Rage', url = 'https://www.bg-wiki.com/ffxi/Blood_Rage' },
+                { type = 'text', value = 'since they tend to have the same buffing logic.' },
+            },
+            {
+                { type = 'text', value = 'Holds up to 2000 TP to close skillchains.' },
+            },
+        },
+    },
+    ['Ark Angel GK'] = {
+        name = 'Ark Angel GK',
+        job = {
+            {
+                { type = 'link', text = 'Samurai', url = 'https://www.bg-wiki.com/ffxi/Samurai' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Dragoon', url = 'https://www.bg-wiki.com/ffxi/Dragoon' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Hasso,', url = 'https://www.bg-wiki.com/ffxi/Hasso' },
+                { type = 'link', text = 'Konzen-ittai,', url = 'https://www.bg-wiki.com/ffxi/Konzen-ittai' },
+                { type = 'link', text = 'Hagakure,', url = 'https://www.bg-wiki.com/ffxi/Hagakure' },
+                { type = 'link', text = 'Meditate,', url = 'https://www.bg-wiki.com/ffxi/Meditate' },
+                { type = 'link', text = 'Sekkanoki,', url = 'https://www.bg-wiki.com/ffxi/Sekkanoki' },
+                { type = 'link', text = 'Jump,', url = 'https://www.bg-wiki.com/ffxi/Jump' },
+                { type = 'link', text = 'High Jump', url = 'https://www.bg-wiki.com/ffxi/High_Jump' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Tachi: Fudo', url = 'https://www.bg-wiki.com/ffxi/Tachi:_Fudo' },
+                { type = 'skillchain', value = 'Light' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Distortion' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Tachi: Gekko', url = 'https://www.bg-wiki.com/ffxi/Tachi:_Gekko' },
+                { type = 'skillchain', value = 'Distortion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Reverberation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Tachi: Kasha', url = 'https://www.bg-wiki.com/ffxi/Tachi:_Kasha' },
+                { type = 'skillchain', value = 'Fusion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Compression' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Tachi: Yukikaze', url = 'https://www.bg-wiki.com/ffxi/Tachi:_Yukikaze' },
+                { type = 'skillchain', value = 'Induration' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Detonation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Dragonfall', url = 'https://www.bg-wiki.com/index.php?title=Dragonfall&amp;action=edit&amp;redlink=1' },
+                { type = 'text', value = '(AoE Damage +' },
+                { type = 'link', text = 'Bind', url = 'https://www.bg-wiki.com/ffxi/Bind' },
+                { type = 'text', value = ')' },
+                { type = 'skillchain', value = 'Status_Ability' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Ark GK', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Ark_GK' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'text', value = 'Complete' },
+                { type = 'link', text = 'Dawn', url = 'https://www.bg-wiki.com/ffxi/Dawn' },
+                { type = 'text', value = 'and all its cutscenes.' },
+            },
+            {
+                { type = 'text', value = 'Complete' },
+                { type = 'link', text = 'Awakening', url = 'https://www.bg-wiki.com/ffxi/Awakening' },
+                { type = 'text', value = 'and all its cutscenes.' },
+            },
+            {
+                { type = 'text', value = 'Be in possession of the' },
+                { type = 'link', text = 'Bundle of scrolls', url = 'https://www.bg-wiki.com/ffxi/Bundle_of_scrolls' },
+                { type = 'text', value = 'key item.' },
+            },
+            {
+                { type = 'text', value = 'Have obtained the additional following Trust spells:' },
+                { type = 'link', text = 'Rainemard', url = 'https://www.bg-wiki.com/ffxi/BGWiki:Trusts#Rainemard' },
+            },
+            {
+                { type = 'text', value = 'Speak with' },
+                { type = 'link', text = 'Jamal', url = 'https://www.bg-wiki.com/ffxi/Jamal' },
+                { type = 'text', value = 'in' },
+                { type = 'link', text = "Ru'Lude Gardens", url = 'https://www.bg-wiki.com/ffxi/Ru%27Lude_Gardens' },
+                { type = 'text', value = '(H-5).' },
+            },
+            {
+                { type = 'text', value = 'Complete the' },
+                { type = 'link', text = 'Records of Eminence Objective:', url = 'https://www.bg-wiki.com/ffxi/Category:Records_of_Eminence#RoE_Quests_3' },
+                { type = 'text', value = 'Quell Your Rage Warp to' },
+                { type = 'link', text = "Tu'Lia", url = 'https://www.bg-wiki.com/ffxi/Tu%27Lia' },
+                { type = 'text', value = '→' },
+                { type = 'link', text = "Ru'Aun Gardens", url = 'https://www.bg-wiki.com/ffxi/Ru%27Aun_Gardens' },
+                { type = 'text', value = '#5 to battle the Ark Angel with a' },
+                { type = 'link', text = 'Phantom gem of rage', url = 'https://www.bg-wiki.com/ffxi/Phantom_gem_of_rage' },
+                { type = 'text', value = 'on any difficulty. Players will be unable to receive the alter ego when trading the Cipher if they have not completed the' },
+                { type = 'link', text = "Rhapsodies of Vana'diel", url = 'https://www.bg-wiki.com/ffxi/Rhapsodies_of_Vana%27diel' },
+                { type = 'text', value = 'mission "' },
+                { type = 'link', text = 'Exploring the Ruins.', url = 'https://www.bg-wiki.com/ffxi/Exploring_the_Ruins' },
+                { type = 'text', value = '" Completing that cutscene/mission will allow the cipher to be traded.' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses HP+20%' },
+            },
+            {
+                { type = 'text', value = 'Occassionally able to use' },
+                { type = 'link', text = 'Weapon Skills', url = 'https://www.bg-wiki.com/ffxi/Weapon_Skill' },
+                { type = 'text', value = 'without consuming TP. Can do this to close' },
+                { type = 'link', text = 'Skillchains', url = 'https://www.bg-wiki.com/ffxi/Skillchain' },
+                { type = 'text', value = 'under 1000 TP or to use Dragonfall twice at high TP.' },
+            },
+            {
+                { type = 'text', value = 'There is a short delay before he can use it again.' },
+            },
+            {
+                { type = 'text', value = 'Has a high TP return on' },
+                { type = 'link', text = 'Jump', url = 'https://www.bg-wiki.com/ffxi/Jump' },
+                { type = 'text', value = '(790 TP), uses it at low TP.' },
+            },
+            {
+                { type = 'text', value = 'Uses' },
+                { type = 'link', text = 'High Jump', url = 'https://www.bg-wiki.com/ffxi/High_Jump' },
+                { type = 'text', value = 'when in the top enmity slot.' },
+            },
+            {
+                { type = 'text', value = 'He will use' },
+                { type = 'link', text = 'Konzen-ittai', url = 'https://www.bg-wiki.com/ffxi/Konzen-ittai' },
+                { type = 'text', value = 'if available when the player has 1000 TP but he does not. Never tries to close a' },
+                { type = 'link', text = 'Skillchain', url = 'https://www.bg-wiki.com/ffxi/Skillchain' },
+                { type = 'text', value = 'with it.' },
+            },
+            {
+                { type = 'text', value = 'Holds up to 3000 TP to try to close skillchains.' },
+            },
+            {
+                { type = 'text', value = 'If' },
+                { type = 'link', text = 'Sekkanoki', url = 'https://www.bg-wiki.com/ffxi/Sekkanoki' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = 'Meditate', url = 'https://www.bg-wiki.com/ffxi/Meditate' },
+                { type = 'text', value = 'are available, self-skillchains at 2000 TP.' },
+            },
+        },
+    },
+    ['Ark Angel MR'] = {
+        name = 'Ark Angel MR',
+        job = {
+            {
+                { type = 'link', text = 'Beastmaster', url = 'https://www.bg-wiki.com/ffxi/Beastmaster' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Thief', url = 'https://www.bg-wiki.com/ffxi/Thief' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Sneak Attack,', url = 'https://www.bg-wiki.com/ffxi/Sneak_Attack' },
+                { type = 'link', text = 'Trick Attack', url = 'https://www.bg-wiki.com/ffxi/Trick_Attack' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Cloudsplitter', url = 'https://www.bg-wiki.com/ffxi/Cloudsplitter' },
+                { type = 'skillchain', value = 'Dark' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Fragmentation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Calamity', url = 'https://www.bg-wiki.com/ffxi/Calamity' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Impaction' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Rampage', url = 'https://www.bg-wiki.com/ffxi/Rampage' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Havoc Spiral', url = 'https://www.bg-wiki.com/index.php?title=Havoc_Spiral&amp;action=edit&amp;redlink=1' },
+                { type = 'text', value = '(AoE)' },
+                { type = 'skillchain', value = 'Status_Ability' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Ark MR', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Ark_MR' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'text', value = 'Complete' },
+                { type = 'link', text = 'Dawn', url = 'https://www.bg-wiki.com/ffxi/Dawn' },
+                { type = 'text', value = 'and all its cutscenes.' },
+            },
+            {
+                { type = 'text', value = 'Be in possession of the' },
+                { type = 'link', text = 'Bundle of scrolls', url = 'https://www.bg-wiki.com/ffxi/Bundle_of_scrolls' },
+                { type = 'text', value = 'key item.' },
+            },
+            {
+                { type = 'text', value = 'Have obtained the additional following Trust spells: Rainemard, Ark Angel GK, & Ark Angel EV' },
+            },
+            {
+                { type = 'text', value = 'Speak with' },
+                { type = 'link', text = 'Jamal', url = 'https://www.bg-wiki.com/ffxi/Jamal' },
+                { type = 'text', value = 'in' },
+                { type = 'link', text = "Ru'Lude Gardens", url = 'https://www.bg-wiki.com/ffxi/Ru%27Lude_Gardens' },
+                { type = 'text', value = '(H-5).' },
+            },
+            {
+                { type = 'text', value = "After trading Ark Angel EV 's cipher, you must speak to" },
+                { type = 'link', text = 'Jamal,', url = 'https://www.bg-wiki.com/ffxi/Jamal' },
+                { type = 'text', value = 'zone, and speak to' },
+                { type = 'link', text = 'Jamal', url = 'https://www.bg-wiki.com/ffxi/Jamal' },
+                { type = 'text', value = 'again to unlock the Objective for' },
+                { type = 'link', text = 'Cipher: Ark MR.', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Ark_MR' },
+                { type = 'text', value = 'Be sure before zoning' },
+                { type = 'link', text = 'Jamal', url = 'https://www.bg-wiki.com/ffxi/Jamal' },
+                { type = 'text', value = 'asks you to "Please come by again later."' },
+            },
+            {
+                { type = 'text', value = 'Complete the' },
+                { type = 'link', text = 'Records of Eminence Objective:', url = 'https://www.bg-wiki.com/ffxi/Category:Records_of_Eminence#RoE_Quests_3' },
+                { type = 'text', value = 'Stifle Your Envy Warp to' },
+                { type = 'link', text = "Tu'Lia", url = 'https://www.bg-wiki.com/ffxi/Tu%27Lia' },
+                { type = 'text', value = '→' },
+                { type = 'link', text = "Ru'Aun Gardens", url = 'https://www.bg-wiki.com/ffxi/Ru%27Aun_Gardens' },
+                { type = 'text', value = '#3 to battle the Ark Angel with a' },
+                { type = 'link', text = 'Phantom gem of envy', url = 'https://www.bg-wiki.com/ffxi/Phantom_gem_of_envy' },
+                { type = 'text', value = 'on any difficulty. Players will be unable to receive the alter ego when trading the Cipher if they have not completed the' },
+                { type = 'link', text = "Rhapsodies of Vana'diel", url = 'https://www.bg-wiki.com/ffxi/Rhapsodies_of_Vana%27diel' },
+                { type = 'text', value = 'mission "' },
+                { type = 'link', text = 'Exploring the Ruins.', url = 'https://www.bg-wiki.com/ffxi/Exploring_the_Ruins' },
+                { type = 'text', value = '" Completing that cutscene/mission will allow the cipher to be traded.' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses HP+20%,' },
+                { type = 'link', text = 'BST', url = 'https://www.bg-wiki.com/ffxi/BST' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'THF', url = 'https://www.bg-wiki.com/ffxi/THF' },
+                { type = 'link', text = 'Traits', url = 'https://www.bg-wiki.com/ffxi/Traits' },
+                { type = 'text', value = 'except TH is limited to' },
+                { type = 'link', text = 'Treasure Hunter', url = 'https://www.bg-wiki.com/ffxi/Treasure_Hunter' },
+                { type = 'text', value = 'I.' },
+            },
+            {
+                { type = 'text', value = 'Will' },
+                { type = 'link', text = 'Sneak Attack', url = 'https://www.bg-wiki.com/ffxi/Sneak_Attack' },
+                { type = 'text', value = '+' },
+                { type = 'link', text = 'Weapon Skill', url = 'https://www.bg-wiki.com/ffxi/Weapon_Skill' },
+                { type = 'text', value = 'if behind the enemy.' },
+            },
+            {
+                { type = 'text', value = 'Will' },
+                { type = 'link', text = 'Trick Attack', url = 'https://www.bg-wiki.com/ffxi/Trick_Attack' },
+                { type = 'text', value = '+' },
+                { type = 'link', text = 'Weapon Skill', url = 'https://www.bg-wiki.com/ffxi/Weapon_Skill' },
+                { type = 'text', value = 'if behind a player or trust.' },
+            },
+            {
+                { type = 'text', value = 'If conditions for both are possible will' },
+                { type = 'link', text = 'Sneak Attack', url = 'https://www.bg-wiki.com/ffxi/Sneak_Attack' },
+                { type = 'text', value = '+' },
+                { type = 'link', text = 'Trick Attack', url = 'https://www.bg-wiki.com/ffxi/Trick_Attack' },
+                { type = 'text', value = '+' },
+                { type = 'link', text = 'Weapon Skill.', url = 'https://www.bg-wiki.com/ffxi/Weapon_Skill' },
+            },
+            {
+                { type = 'text', value = "AAMR's" },
+                { type = 'link', text = 'Cloudsplitter', url = 'https://www.bg-wiki.com/ffxi/Cloudsplitter' },
+                { type = 'text', value = 'can deal massive damage (~8000+) at ilvl119.' },
+            },
+            {
+                { type = 'text', value = 'Rarely ever uses Havoc Spiral which does AoE damage (~100-300) and Additional Effect:' },
+                { type = 'link', text = 'Sleep.', url = 'https://www.bg-wiki.com/ffxi/Sleep' },
+            },
+            {
+                { type = 'text', value = 'Uses weapon skill as soon as' },
+                { type = 'link', text = 'Sneak Attack', url = 'https://www.bg-wiki.com/ffxi/Sneak_Attack' },
+                { type = 'text', value = 'or' },
+                { type = 'link', text = 'Trick Attack', url = 'https://www.bg-wiki.com/ffxi/Trick_Attack' },
+                { type = 'text', value = 'are possible with 1000+ TP: favoring' },
+                { type = 'link', text = 'Calamity', url = 'https://www.bg-wiki.com/ffxi/Calamity' },
+            },
+            {
+                { type = 'text', value = 'When in front of the target without' },
+                { type = 'link', text = 'Trick Attack,', url = 'https://www.bg-wiki.com/ffxi/Trick_Attack' },
+                { type = 'text', value = 'uses weapon skill with 1000+ TP: favoring' },
+                { type = 'link', text = 'Cloudsplitter', url = 'https://www.bg-wiki.com/ffxi/Cloudsplitter' },
+            },
+            {
+                { type = 'text', value = 'Holds TP up to 3000 to wait for the previously mentioned conditions, does not try to skillchain.' },
+            },
+        },
+    },
+    ['Ayame'] = {
+        name = 'Ayame',
+        job = {
+            {
+                { type = 'link', text = 'Samurai', url = 'https://www.bg-wiki.com/ffxi/Samurai' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Samurai', url = 'https://www.bg-wiki.com/ffxi/Samurai' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Meditate,', url = 'https://www.bg-wiki.com/ffxi/Meditate' },
+                { type = 'link', text = 'Hasso,', url = 'https://www.bg-wiki.com/ffxi/Hasso' },
+                { type = 'link', text = 'Third Eye', url = 'https://www.bg-wiki.com/ffxi/Third_Eye' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'text', value = '(1)' },
+                { type = 'link', text = 'Tachi: Enpi', url = 'https://www.bg-wiki.com/ffxi/Tachi:_Enpi' },
+                { type = 'skillchain', value = 'Transfixion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ', (9)' },
+                { type = 'link', text = 'Tachi: Hobaku', url = 'https://www.bg-wiki.com/ffxi/Tachi:_Hobaku' },
+                { type = 'skillchain', value = 'Induration' },
+                { type = 'text', value = ', (23)' },
+                { type = 'link', text = 'Tachi: Goten', url = 'https://www.bg-wiki.com/ffxi/Tachi:_Goten' },
+                { type = 'skillchain', value = 'Transfixion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Impaction' },
+                { type = 'text', value = ', (33)' },
+                { type = 'link', text = 'Tachi: Kagero', url = 'https://www.bg-wiki.com/ffxi/Tachi:_Kagero' },
+                { type = 'skillchain', value = 'Liquefaction' },
+                { type = 'text', value = ', (49)' },
+                { type = 'link', text = 'Tachi: Jinpu', url = 'https://www.bg-wiki.com/ffxi/Tachi:_Jinpu' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Detonation' },
+                { type = 'text', value = ', (55)' },
+                { type = 'link', text = 'Tachi: Koki', url = 'https://www.bg-wiki.com/ffxi/Tachi:_Koki' },
+                { type = 'skillchain', value = 'Reverberation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Impaction' },
+                { type = 'text', value = ', (60)' },
+                { type = 'link', text = 'Tachi: Yukikaze', url = 'https://www.bg-wiki.com/ffxi/Tachi:_Yukikaze' },
+                { type = 'skillchain', value = 'Induration' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Detonation' },
+                { type = 'text', value = ', (65)' },
+                { type = 'link', text = 'Tachi: Gekko', url = 'https://www.bg-wiki.com/ffxi/Tachi:_Gekko' },
+                { type = 'skillchain', value = 'Distortion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Reverberation' },
+                { type = 'text', value = ', (71)' },
+                { type = 'link', text = 'Tachi: Kasha', url = 'https://www.bg-wiki.com/ffxi/Tachi:_Kasha' },
+                { type = 'skillchain', value = 'Fusion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Compression' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Complete the initiation quest in' },
+                { type = 'link', text = 'Bastok.', url = 'https://www.bg-wiki.com/ffxi/Trust:_Bastok' },
+            },
+            {
+                { type = 'text', value = 'Must be Rank 3 or higher in any nation.' },
+            },
+            {
+                { type = 'text', value = 'Speak with' },
+                { type = 'link', text = 'Ayame', url = 'https://www.bg-wiki.com/ffxi/Ayame' },
+                { type = 'text', value = 'in' },
+                { type = 'link', text = 'Metalworks', url = 'https://www.bg-wiki.com/ffxi/Metalworks' },
+                { type = 'text', value = 'at (K-7).' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Skillchains:' },
+            },
+            {
+                { type = 'text', value = 'Once the player uses a' },
+                { type = 'link', text = 'Weapon Skill', url = 'https://www.bg-wiki.com/ffxi/Weapon_Skill' },
+                { type = 'text', value = 'with Ayame summoned, she will hold off using weapon skills until the player has 1000 or more TP.' },
+            },
+            {
+                { type = 'text', value = 'This helps to open the highest level' },
+                { type = 'link', text = 'Skillchain', url = 'https://www.bg-wiki.com/ffxi/Skillchain' },
+                { type = 'text', value = 'possible determined by the previously used weapon skill.' },
+            },
+            {
+                { type = 'text', value = 'She can open' },
+                { type = 'link', text = 'Light', url = 'https://www.bg-wiki.com/ffxi/Light' },
+                { type = 'text', value = 'or' },
+                { type = 'link', text = 'Darkness', url = 'https://www.bg-wiki.com/ffxi/Darkness' },
+                { type = 'text', value = 'skillchains to be closed by weapon skills with' },
+                { type = 'link', text = 'Fragmentation', url = 'https://www.bg-wiki.com/ffxi/Fragmentation' },
+                { type = 'text', value = 'or' },
+                { type = 'link', text = 'Gravitation', url = 'https://www.bg-wiki.com/ffxi/Gravitation' },
+                { type = 'text', value = 'properties.' },
+            },
+            {
+                { type = 'text', value = 'Ayame will always try to open a' },
+                { type = 'link', text = 'Skillchain', url = 'https://www.bg-wiki.com/ffxi/Skillchain' },
+                { type = 'text', value = 'rather than close it.' },
+            },
+            {
+                { type = 'text', value = 'She will' },
+                { type = 'link', text = 'Weapon Skills', url = 'https://www.bg-wiki.com/ffxi/Weapon_Skill' },
+                { type = 'text', value = 'regardless how much HP is remaining on the current monster.' },
+            },
+            {
+                { type = 'text', value = 'Holds TP until 3000 to open skillchains for the player.' },
+            },
+            {
+                { type = 'text', value = 'Uses' },
+                { type = 'link', text = 'Meditate,', url = 'https://www.bg-wiki.com/ffxi/Meditate' },
+                { type = 'text', value = 'when the ability is ready, in situations where the player has TP but she does not.' },
+            },
+            {
+                { type = 'text', value = 'Only uses' },
+                { type = 'link', text = 'Third Eye', url = 'https://www.bg-wiki.com/ffxi/Third_Eye' },
+                { type = 'text', value = 'when she pulls hate.' },
+            },
+        },
+    },
+    ['Ayame (UC)'] = {
+        name = 'Ayame (UC)',
+        job = {
+            {
+                { type = 'link', text = 'Samurai', url = 'https://www.bg-wiki.com/ffxi/Samurai' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Warrior', url = 'https://www.bg-wiki.com/ffxi/Warrior' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Blade Bash,', url = 'https://www.bg-wiki.com/ffxi/Blade_Bash' },
+                { type = 'link', text = 'Sengikori,', url = 'https://www.bg-wiki.com/ffxi/Sengikori' },
+                { type = 'link', text = 'Hasso,', url = 'https://www.bg-wiki.com/ffxi/Hasso' },
+                { type = 'link', text = 'Third Eye,', url = 'https://www.bg-wiki.com/ffxi/Third_Eye' },
+                { type = 'link', text = 'Shikikoyo,', url = 'https://www.bg-wiki.com/ffxi/Shikikoyo' },
+                { type = 'link', text = 'Meditate', url = 'https://www.bg-wiki.com/ffxi/Meditate' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'text', value = '(5)' },
+                { type = 'link', text = 'Tachi: Jinpu', url = 'https://www.bg-wiki.com/ffxi/Tachi:_Jinpu' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = '/, (25)' },
+                { type = 'link', text = 'Tachi: Koki', url = 'https://www.bg-wiki.com/ffxi/Tachi:_Koki' },
+                { type = 'skillchain', value = 'Reverberation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Impaction' },
+                { type = 'text', value = ', (50)' },
+                { type = 'link', text = 'Tachi: Mudo', url = 'https://www.bg-wiki.com/ffxi/Tachi:_Mudo' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Distortion' },
+                { type = 'text', value = ', (60)' },
+                { type = 'link', text = 'Tachi: Kasha', url = 'https://www.bg-wiki.com/ffxi/Tachi:_Kasha' },
+                { type = 'skillchain', value = 'Fusion' },
+                { type = 'text', value = '/, (70)' },
+                { type = 'link', text = 'Tachi: Ageha', url = 'https://www.bg-wiki.com/ffxi/Tachi:_Ageha' },
+                { type = 'skillchain', value = 'Compression' },
+                { type = 'text', value = ' / ' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Be a member of the Ayame Unity Concord.' },
+            },
+            {
+                { type = 'text', value = 'Obtain 5000 Unity Accolades through' },
+                { type = 'link', text = 'Records of Eminence', url = 'https://www.bg-wiki.com/ffxi/Records_of_Eminence' },
+                { type = 'text', value = 'objectives for a Partial Personal Evaluation of 5pt.' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses 5/5' },
+                { type = 'link', text = 'Shikikoyo', url = 'https://www.bg-wiki.com/ffxi/Shikikoyo' },
+                { type = 'text', value = 'merits at level 75 (shared TP +48%)' },
+            },
+            {
+                { type = 'text', value = 'Skillchains' },
+            },
+            {
+                { type = 'text', value = 'Specializes in two-person 3-step or 5-step skillchains with the player, resulting in higher' },
+                { type = 'link', text = 'Skillchain damage', url = 'https://www.bg-wiki.com/ffxi/Category:Skillchain#Skillchain_Damage' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = 'Magic Burst Damage Bonus', url = 'https://www.bg-wiki.com/ffxi/Magic_Burst#Damage_Bonus' },
+                { type = 'text', value = 'with each step.' },
+            },
+            {
+                { type = 'text', value = 'Completes skillchains while using' },
+                { type = 'link', text = 'Sengikori', url = 'https://www.bg-wiki.com/ffxi/Sengikori' },
+                { type = 'text', value = 'if ready.' },
+            },
+            {
+                { type = 'text', value = 'Only closes skillchains started by the player (or their pet). Waits at 3000 TP until conditions are met.' },
+            },
+            {
+                { type = 'text', value = "Always closes a higher level skillchain, ignores the skillchain if she can't." },
+            },
+            {
+                { type = 'text', value = 'Due to the weapon skills available, cannot close skillchains started with' },
+                { type = 'link', text = 'Distortion', url = 'https://www.bg-wiki.com/ffxi/Distortion' },
+                { type = 'text', value = 'or' },
+                { type = 'link', text = 'Fusion.', url = 'https://www.bg-wiki.com/ffxi/Fusion' },
+            },
+            {
+                { type = 'text', value = 'Does not close' },
+                { type = 'link', text = 'Level 4 Light', url = 'https://www.bg-wiki.com/ffxi/Level_4_Light' },
+                { type = 'text', value = 'skillchains,' },
+                { type = 'link', text = 'Tachi: Mudo', url = 'https://www.bg-wiki.com/ffxi/Tachi:_Mudo' },
+                { type = 'text', value = 'is only used to close' },
+                { type = 'link', text = 'Darkness.', url = 'https://www.bg-wiki.com/ffxi/Darkness' },
+            },
+            {
+                { type = 'text', value = 'Always chooses' },
+                { type = 'link', text = 'Tachi: Ageha', url = 'https://www.bg-wiki.com/ffxi/Tachi:_Ageha' },
+                { type = 'text', value = 'following a' },
+                { type = 'link', text = 'Detonation', url = 'https://www.bg-wiki.com/ffxi/Detonation' },
+                { type = 'text', value = 'opener.' },
+            },
+            {
+                { type = 'text', value = 'Level 1' },
+                { type = 'link', text = 'Chainbound (Status)', url = 'https://www.bg-wiki.com/ffxi/Chainbound_(Status)' },
+                { type = 'text', value = 'will be closed by' },
+                { type = 'link', text = 'Tachi: Koki', url = 'https://www.bg-wiki.com/ffxi/Tachi:_Koki' },
+                { type = 'text', value = 'for' },
+                { type = 'link', text = 'Fragmentation.', url = 'https://www.bg-wiki.com/ffxi/Fragmentation' },
+            },
+            {
+                { type = 'text', value = 'Abilities are used based on skillchain level and battle condition, so she may' },
+                { type = 'link', text = 'Meditate', url = 'https://www.bg-wiki.com/ffxi/Meditate' },
+                { type = 'text', value = 'before a weaponskill instead of waiting for you to reach 1000 TP.' },
+            },
+            {
+                { type = 'text', value = "Ayame's consistent weapon skill choice and timing make her a good choice for parties who want to set up magic bursts of a specific element boosted by" },
+                { type = 'link', text = 'Sengikori', url = 'https://www.bg-wiki.com/ffxi/Sengikori' },
+                { type = 'text', value = '(+25%' },
+                { type = 'link', text = 'Magic Burst', url = 'https://www.bg-wiki.com/ffxi/Magic_Burst' },
+                { type = 'text', value = 'Damage).' },
+            },
+            {
+                { type = 'text', value = 'High TP gain rate with' },
+                { type = 'link', text = 'Hasso', url = 'https://www.bg-wiki.com/ffxi/Hasso' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Zanshin', url = 'https://www.bg-wiki.com/ffxi/Zanshin' },
+                { type = 'text', value = 'and >250 TP per hit depending on level of SAM' },
+                { type = 'link', text = 'Store TP', url = 'https://www.bg-wiki.com/ffxi/Store_TP' },
+                { type = 'text', value = 'trait.' },
+            },
+            {
+                { type = 'link', text = 'Tachi: Ageha', url = 'https://www.bg-wiki.com/ffxi/Tachi:_Ageha' },
+                { type = 'text', value = 'is the' },
+                { type = 'link', text = '2015 version.', url = 'https://www.bg-wiki.com//www.bg-wiki.com/index.php?title=Tachi:_Ageha&amp;oldid=380421' },
+            },
+            {
+                { type = 'link', text = 'Defense Down', url = 'https://www.bg-wiki.com/ffxi/Defense_Down' },
+                { type = 'text', value = 'could need more TP and' },
+                { type = 'link', text = 'Magic Accuracy', url = 'https://www.bg-wiki.com/ffxi/Magic_Accuracy' },
+                { type = 'text', value = "than the player's version to land on high-level enemies." },
+            },
+            {
+                { type = 'text', value = 'Trust weapon skills have different IDs than the ones players use and have a separate implementation.' },
+            },
+            {
+                { type = 'text', value = 'When she has 2000+ TP, she uses' },
+                { type = 'link', text = 'Shikikoyo', url = 'https://www.bg-wiki.com/ffxi/Shikikoyo' },
+                { type = 'text', value = 'on the party leader after they use a weapon skill.' },
+            },
+            {
+                { type = 'text', value = 'After summoning Ayame, if she reaches 2000 TP before the party leader has used a weapon skill, uses' },
+                { type = 'link', text = 'Shikikoyo', url = 'https://www.bg-wiki.com/ffxi/Shikikoyo' },
+                { type = 'text', value = 'immediately.' },
+            },
+            {
+                { type = 'text', value = 'If she gets hate, uses' },
+                { type = 'link', text = 'Third Eye.', url = 'https://www.bg-wiki.com/ffxi/Third_Eye' },
+            },
+            {
+                { type = 'text', value = 'Stuns enemies with' },
+                { type = 'link', text = 'Blade Bash,', url = 'https://www.bg-wiki.com/ffxi/Blade_Bash' },
+                { type = 'text', value = 'only to interrupt spellcasting.' },
+            },
+        },
+    },
+    ['Babban Mheillea'] = {
+        name = 'Babban Mheillea',
+        job = {
+            {
+                { type = 'link', text = 'Monk', url = 'https://www.bg-wiki.com/ffxi/Monk' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Monk', url = 'https://www.bg-wiki.com/ffxi/Monk' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Wild Oats', url = 'https://www.bg-wiki.com/ffxi/Wild_Oats' },
+                { type = 'skillchain', value = 'Transfixion' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Headbutt', url = 'https://www.bg-wiki.com/ffxi/Category:Mandragora#Abilities' },
+                { type = 'skillchain', value = 'Status_Ability' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Photosynthesis', url = 'https://www.bg-wiki.com/ffxi/Category:Mandragora#Abilities' },
+                { type = 'text', value = '(Grants' },
+                { type = 'link', text = 'Regen', url = 'https://www.bg-wiki.com/ffxi/Regen' },
+                { type = 'text', value = ')' },
+                { type = 'skillchain', value = 'Status_Ability' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Petal Pirouette', url = 'https://www.bg-wiki.com/ffxi/Category:Mandragora#Abilities' },
+                { type = 'text', value = "(Resets foe's TP to zero) (AoE)" },
+                { type = 'skillchain', value = 'Status_Ability' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Babban', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Babban' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Sunshine Seekers', url = 'https://www.bg-wiki.com/ffxi/Sunshine_Seeker' },
+                { type = 'text', value = 'event (300 tiny seeds)' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses' },
+                { type = 'link', text = 'Job Traits', url = 'https://www.bg-wiki.com/ffxi/Job_Traits' },
+                { type = 'text', value = 'but no' },
+                { type = 'link', text = 'Job Abilities.', url = 'https://www.bg-wiki.com/ffxi/Job_Abilities' },
+                { type = 'text', value = 'HP-10%' },
+            },
+            {
+                { type = 'link', text = 'Guards', url = 'https://www.bg-wiki.com/ffxi/Guarding' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = 'Counters', url = 'https://www.bg-wiki.com/ffxi/Counter' },
+                { type = 'text', value = 'melee attacks directed at her.' },
+            },
+            {
+                { type = 'text', value = 'As a' },
+                { type = 'link', text = 'Plantoid,', url = 'https://www.bg-wiki.com/ffxi/Category:Plantoids' },
+                { type = 'text', value = 'she is subject to' },
+                { type = 'link', text = 'Plantoid Killer', url = 'https://www.bg-wiki.com/ffxi/Plantoid_Killer' },
+                { type = 'text', value = '(intimidated by' },
+                { type = 'link', text = 'Vermin', url = 'https://www.bg-wiki.com/ffxi/Vermin' },
+                { type = 'text', value = ').' },
+            },
+            {
+                { type = 'text', value = 'Uses TP randomly and does not try to skillchain.' },
+            },
+            {
+                { type = 'text', value = 'Has a large HP pool common to non-humanoids.' },
+            },
+            {
+                { type = 'text', value = "Petal Pirouette normally reduces enemy TP to 0, but it has a reduced effect on NMs: enemy's remaining TP will be written in the log." },
+            },
+            {
+                { type = 'text', value = 'Photosynthesis will only be used during daytime (6:00~18:00).' },
+            },
+            {
+                { type = 'text', value = 'Summoning, Dismiss and death text can only be understood if the summoner is wearing (or lockstyle) mandragora costume gear (Mandragora Suit and Mansque, etc).' },
+            },
+        },
+    },
+    ['Balamor'] = {
+        name = 'Balamor',
+        job = {
+            {
+                { type = 'link', text = 'Dark Knight', url = 'https://www.bg-wiki.com/ffxi/Dark_Knight' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Black Mage', url = 'https://www.bg-wiki.com/ffxi/Black_Mage' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Absorb-STAT spells', url = 'https://www.bg-wiki.com/ffxi/Category:Absorb_Spell#Absorb-STAT_spells' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Feast of Arrows', url = 'https://www.bg-wiki.com/ffxi/Category:Defiant#Abilities' },
+                { type = 'skillchain', value = 'Gravitation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Transfixion' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Last Laugh', url = 'https://www.bg-wiki.com/ffxi/Category:Defiant#Abilities' },
+                { type = 'text', value = '(Drain HP)' },
+                { type = 'skillchain', value = 'Dark' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Gravitation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Regurgitated Swarm', url = 'https://www.bg-wiki.com/ffxi/Category:Defiant#Abilities' },
+                { type = 'skillchain', value = 'Fusion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Compression' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Setting the Stage', url = 'https://www.bg-wiki.com/ffxi/Category:Defiant#Abilities' },
+                { type = 'skillchain', value = 'Gravitation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Induration' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Balamor', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Balamor' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'text', value = 'Complete' },
+                { type = 'link', text = 'Pretender to the Throne.', url = 'https://www.bg-wiki.com/ffxi/Pretender_to_the_Throne' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses HP+40%, MP+100%' },
+            },
+            {
+                { type = 'text', value = 'Is' },
+                { type = 'link', text = 'Undead', url = 'https://www.bg-wiki.com/ffxi/Category:Undead' },
+                { type = 'text', value = 'so he takes damage from' },
+                { type = 'link', text = 'Cure', url = 'https://www.bg-wiki.com/ffxi/Cure' },
+                { type = 'text', value = 'spells and cannot be healed by' },
+                { type = 'link', text = 'Curing Waltzes', url = 'https://www.bg-wiki.com/ffxi/Curing_Waltz' },
+                { type = 'text', value = 'or' },
+                { type = 'link', text = 'Divine Waltz.', url = 'https://www.bg-wiki.com/ffxi/Divine_Waltz' },
+            },
+            {
+                { type = 'link', text = 'Regen', url = 'https://www.bg-wiki.com/ffxi/Regen' },
+                { type = 'text', value = 'spells,' },
+                { type = 'link', text = 'Indi-Regen,', url = 'https://www.bg-wiki.com/ffxi/Indi-Regen' },
+                { type = 'link', text = 'Blue Magic,', url = 'https://www.bg-wiki.com/ffxi/Blue_Magic' },
+                { type = 'text', value = 'and curative' },
+                { type = 'link', text = 'Blood Pacts', url = 'https://www.bg-wiki.com/ffxi/Blood_Pact' },
+                { type = 'text', value = '( ) all can heal him.' },
+            },
+            {
+                { type = 'text', value = 'Immune to' },
+                { type = 'link', text = 'Drain', url = 'https://www.bg-wiki.com/ffxi/Drain' },
+                { type = 'text', value = 'type spells and drain effects from TP moves such as' },
+                { type = 'link', text = 'Blood Saber', url = 'https://www.bg-wiki.com/ffxi/Blood_Saber' },
+                { type = 'text', value = 'but can still be damaged by them.' },
+            },
+            {
+                { type = 'text', value = 'Can use Last Laugh to drain HP from enemies.' },
+            },
+            {
+                { type = 'text', value = 'Uses TP randomly and does not try to skillchain.' },
+            },
+            {
+                { type = 'text', value = 'Auto-attack is dark elemental magic damage. May appear to be AoE even though it is not.' },
+            },
+            {
+                { type = 'text', value = 'Since his attacks are special moves, he does not benefit from' },
+                { type = 'link', text = 'Sambas', url = 'https://www.bg-wiki.com/ffxi/Samba' },
+                { type = 'text', value = 'or' },
+                { type = 'link', text = 'Haste,', url = 'https://www.bg-wiki.com/ffxi/Haste' },
+                { type = 'text', value = 'but likewise is not affected by' },
+                { type = 'link', text = 'Slow', url = 'https://www.bg-wiki.com/ffxi/Slow' },
+                { type = 'text', value = 'or' },
+                { type = 'link', text = 'Spikes.', url = 'https://www.bg-wiki.com/ffxi/Spikes' },
+            },
+        },
+    },
+    ['Chacharoon'] = {
+        name = 'Chacharoon',
+        job = {
+            {
+                { type = 'link', text = 'Thief', url = 'https://www.bg-wiki.com/ffxi/Thief' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Ranger', url = 'https://www.bg-wiki.com/ffxi/Ranger' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Sharp Eye', url = 'https://www.bg-wiki.com/ffxi/Sharp_Eye' },
+                { type = 'text', value = '(Conal)' },
+                { type = 'skillchain', value = 'Status_Ability' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Tripe Gripe', url = 'https://www.bg-wiki.com/ffxi/Tripe_Gripe' },
+                { type = 'skillchain', value = 'Status_Ability' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Pocket Sand', url = 'https://www.bg-wiki.com/ffxi/Pocket_Sand' },
+                { type = 'text', value = '(Conal)' },
+                { type = 'skillchain', value = 'Status_Ability' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Complete' },
+                { type = 'link', text = 'Trial of the Chacharoon.', url = 'https://www.bg-wiki.com/ffxi/Trial_of_the_Chacharoon' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses HP-10%, MP-10%' },
+            },
+            {
+                { type = 'text', value = 'Very low delay, but also has relatively low base damage.' },
+            },
+            {
+                { type = 'text', value = 'Occasionally performs a throwing ranged attack on the enemy.' },
+            },
+            {
+                { type = 'text', value = "Chacharoon's" },
+                { type = 'link', text = 'Sharp Eye', url = 'https://www.bg-wiki.com/ffxi/Sharp_Eye' },
+                { type = 'text', value = 'resembles a' },
+                { type = 'link', text = 'Gaze attack', url = 'https://www.bg-wiki.com/ffxi/Target_Types#Gaze' },
+                { type = 'text', value = 'but it has no directional requirement.' },
+            },
+            {
+                { type = 'text', value = 'The status effects Chacharoon applies could be used in kiting or evasion strategies.' },
+            },
+            {
+                { type = 'text', value = 'The effect may be difficult to land on higher level enemies.' },
+            },
+            {
+                { type = 'link', text = 'Gravity', url = 'https://www.bg-wiki.com/ffxi/Gravity' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = 'Defense Down', url = 'https://www.bg-wiki.com/ffxi/Defense_Down' },
+                { type = 'text', value = 'are wind-based status effects.' },
+            },
+            {
+                { type = 'text', value = 'If half-' },
+                { type = 'link', text = 'resisted,', url = 'https://www.bg-wiki.com/ffxi/Resist' },
+                { type = 'text', value = 'duration will be halved.' },
+            },
+            {
+                { type = 'text', value = 'Uses weapon skills at 1000 TP.' },
+            },
+            {
+                { type = 'link', text = 'Tripe Gripe', url = 'https://www.bg-wiki.com/ffxi/Tripe_Gripe' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = 'Sharp Eye', url = 'https://www.bg-wiki.com/ffxi/Sharp_Eye' },
+                { type = 'text', value = 'do not deal damage, only applying status effects:' },
+            },
+            {
+                { type = 'link', text = 'Tripe Gripe', url = 'https://www.bg-wiki.com/ffxi/Tripe_Gripe' },
+                { type = 'text', value = 'applies' },
+                { type = 'link', text = 'Amnesia', url = 'https://www.bg-wiki.com/ffxi/Amnesia' },
+                { type = 'text', value = '(30s?) and' },
+                { type = 'link', text = 'Attack Boost', url = 'https://www.bg-wiki.com/ffxi/Attack_Boost' },
+                { type = 'text', value = 'effects to an enemy.' },
+            },
+            {
+                { type = 'link', text = 'Sharp Eye', url = 'https://www.bg-wiki.com/ffxi/Sharp_Eye' },
+                { type = 'text', value = 'applies' },
+                { type = 'link', text = 'Gravity II', url = 'https://www.bg-wiki.com/ffxi/Gravity_II' },
+                { type = 'text', value = '(60s) and 25%' },
+                { type = 'link', text = 'Defense Down', url = 'https://www.bg-wiki.com/ffxi/Defense_Down' },
+                { type = 'text', value = '(30s or 60s ). The Defense Down effect will show in the log when Gravity is fully resisted.' },
+            },
+            {
+                { type = 'link', text = 'Pocket Sand', url = 'https://www.bg-wiki.com/ffxi/Pocket_Sand' },
+                { type = 'text', value = 'applies' },
+                { type = 'link', text = 'Blind', url = 'https://www.bg-wiki.com/ffxi/Blind' },
+                { type = 'text', value = '(Up to -50' },
+                { type = 'link', text = 'Accuracy,', url = 'https://www.bg-wiki.com/ffxi/Accuracy' },
+                { type = 'text', value = '60s) and deals damage.' },
+            },
+        },
+    },
+    ['Cid'] = {
+        name = 'Cid',
+        job = {
+            {
+                { type = 'link', text = 'Warrior', url = 'https://www.bg-wiki.com/ffxi/Warrior' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Ranger', url = 'https://www.bg-wiki.com/ffxi/Ranger' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Berserk,', url = 'https://www.bg-wiki.com/ffxi/Berserk' },
+                { type = 'link', text = 'Aggressor', url = 'https://www.bg-wiki.com/ffxi/Aggressor' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'True Strike', url = 'https://www.bg-wiki.com/ffxi/True_Strike' },
+                { type = 'skillchain', value = 'Detonation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Impaction' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Hexa Strike', url = 'https://www.bg-wiki.com/ffxi/Hexa_Strike' },
+                { type = 'skillchain', value = 'Fusion' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Fiery Tailings', url = 'https://www.bg-wiki.com/ffxi/Fiery_Tailings' },
+                { type = 'text', value = '(AoE)' },
+                { type = 'skillchain', value = 'Light' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Fusion' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Critical Mass', url = 'https://www.bg-wiki.com/ffxi/Critical_Mass' },
+                { type = 'skillchain', value = 'Fusion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Impaction' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Cid', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Cid' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Repeat Login Campaign', url = 'https://www.bg-wiki.com/ffxi/Repeat_Login_Campaign' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Both melees and shoots.' },
+            },
+            {
+                { type = 'text', value = 'Uses' },
+                { type = 'link', text = 'Aggressor', url = 'https://www.bg-wiki.com/ffxi/Aggressor' },
+                { type = 'text', value = 'hopefully augmented with' },
+                { type = 'link', text = 'Aggressive Aim', url = 'https://www.bg-wiki.com/ffxi/Aggressive_Aim' },
+                { type = 'text', value = 'merits.' },
+            },
+            {
+                { type = 'text', value = 'Saves up to 2500 TP waiting to close a skillchain.' },
+            },
+            {
+                { type = 'text', value = 'Will save' },
+                { type = 'link', text = 'Berserk', url = 'https://www.bg-wiki.com/ffxi/Berserk' },
+                { type = 'text', value = 'until he is about to use a weapon skill.' },
+            },
+        },
+    },
+    ['Darrcuiln'] = {
+        name = 'Darrcuiln',
+        job = {
+            {
+                { type = 'link', text = 'Warrior', url = 'https://www.bg-wiki.com/ffxi/Warrior' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Red Mage', url = 'https://www.bg-wiki.com/ffxi/Red_Mage' },
+                { type = 'text', value = '"' },
+                { type = 'link', text = 'Beast', url = 'https://www.bg-wiki.com/ffxi/Beast' },
+                { type = 'text', value = '"' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Howling Gust', url = 'https://www.bg-wiki.com/ffxi/Howling_Gust' },
+                { type = 'skillchain', value = 'Fragmentation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Compression' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Starward Yowl', url = 'https://www.bg-wiki.com/ffxi/Starward_Yowl' },
+                { type = 'skillchain', value = 'Gravitation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Reverberation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Righteous Rasp', url = 'https://www.bg-wiki.com/ffxi/Righteous_Rasp' },
+                { type = 'skillchain', value = 'Fusion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Transfixion' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Aurous Charge', url = 'https://www.bg-wiki.com/ffxi/Aurous_Charge' },
+                { type = 'skillchain', value = 'Liquefaction' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Transfixion' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Stalking Prey', url = 'https://www.bg-wiki.com/ffxi/Stalking_Prey' },
+                { type = 'text', value = '(AoE)' },
+                { type = 'skillchain', value = 'Light' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Fragmentation' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Darrcuiln', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Darrcuiln' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Repeat Login Campaign', url = 'https://www.bg-wiki.com/ffxi/Repeat_Login_Campaign' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses HP+~42%' },
+            },
+            {
+                { type = 'text', value = 'Has several auto-attack animations. Although none can miss, only the roar appears to do magic damage (element unknown). He will exclusively roar if the monster is out of range.' },
+            },
+            {
+                { type = 'text', value = 'Since his attacks are special moves, he does not benefit from' },
+                { type = 'link', text = 'Sambas', url = 'https://www.bg-wiki.com/ffxi/Samba' },
+                { type = 'text', value = 'or' },
+                { type = 'link', text = 'Haste,', url = 'https://www.bg-wiki.com/ffxi/Haste' },
+                { type = 'text', value = 'but likewise is not affected by' },
+                { type = 'link', text = 'Slow', url = 'https://www.bg-wiki.com/ffxi/Slow' },
+                { type = 'text', value = 'or' },
+                { type = 'link', text = 'Spikes.', url = 'https://www.bg-wiki.com/ffxi/Spikes' },
+            },
+            {
+                { type = 'text', value = 'Has a large HP pool common to non-humanoids.' },
+            },
+            {
+                { type = 'text', value = 'Can treat as a' },
+                { type = 'link', text = 'Warrior', url = 'https://www.bg-wiki.com/ffxi/Warrior' },
+                { type = 'text', value = 'for job interaction purposes (buffs/behaviors of other trusts).' },
+            },
+            {
+                { type = 'text', value = 'Holds TP randomly between (1500-2000), but does not attempt to close skillchains.' },
+            },
+        },
+    },
+    ['Excenmille'] = {
+        name = 'Excenmille',
+        job = {
+            {
+                { type = 'link', text = 'Paladin', url = 'https://www.bg-wiki.com/ffxi/Paladin' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Paladin', url = 'https://www.bg-wiki.com/ffxi/Paladin' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Flash,', url = 'https://www.bg-wiki.com/ffxi/Flash' },
+                { type = 'link', text = 'Cure I - IV', url = 'https://www.bg-wiki.com/ffxi/Category:Cure_Spell' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Sentinel', url = 'https://www.bg-wiki.com/ffxi/Sentinel' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Double Thrust', url = 'https://www.bg-wiki.com/ffxi/Double_Thrust' },
+                { type = 'skillchain', value = 'Transfixion' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Leg Sweep', url = 'https://www.bg-wiki.com/ffxi/Leg_Sweep' },
+                { type = 'skillchain', value = 'Impaction' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Penta Thrust', url = 'https://www.bg-wiki.com/ffxi/Penta_Thrust' },
+                { type = 'skillchain', value = 'Compression' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Complete the initiation quest in' },
+                { type = 'link', text = 'San d’Oria.', url = 'https://www.bg-wiki.com/ffxi/Trust:_San_d%27Oria' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Uses TP randomly and does not try to skillchain.' },
+            },
+            {
+                { type = 'text', value = 'Uses' },
+                { type = 'link', text = 'Sentinel', url = 'https://www.bg-wiki.com/ffxi/Sentinel' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = 'Flash', url = 'https://www.bg-wiki.com/ffxi/Flash' },
+                { type = 'text', value = 'on cooldown for enmity.' },
+            },
+            {
+                { type = 'text', value = 'Casts' },
+                { type = 'link', text = 'Cure', url = 'https://www.bg-wiki.com/ffxi/Category:Cure_Spell' },
+                { type = 'text', value = 'on party members in orange HP (<50%).' },
+            },
+            {
+                { type = 'text', value = 'Prioritizes healing if there is no WHM in the party.' },
+            },
+            {
+                { type = 'text', value = 'Cure threshold changes to party members under <75%.' },
+            },
+        },
+    },
+    ['Excenmille (S)'] = {
+        name = 'Excenmille (S)',
+        job = {
+            {
+                { type = 'link', text = 'Warrior', url = 'https://www.bg-wiki.com/ffxi/Warrior' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Paladin', url = 'https://www.bg-wiki.com/ffxi/Paladin' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'text', value = "Stag's Call" },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Songbird Swoop', url = 'https://www.bg-wiki.com/index.php?title=Songbird_Swoop&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Reverberation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Impaction' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Gyre Strike', url = 'https://www.bg-wiki.com/index.php?title=Gyre_Strike&amp;action=edit&amp;redlink=1' },
+                { type = 'text', value = '(Paralyze)' },
+                { type = 'skillchain', value = 'Fragmentation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Orcsbane', url = 'https://www.bg-wiki.com/index.php?title=Orcsbane&amp;action=edit&amp;redlink=1' },
+                { type = 'text', value = '(AoE)' },
+                { type = 'skillchain', value = 'Light' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Distortion' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = "Stag's Charge", url = 'https://www.bg-wiki.com/index.php?title=Stag%27s_Charge&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Gravitation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Induration' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Notice: Acquiring this trust is a long process of 12 quests; many of which have "a game day of waiting" between them. Setting aside a good amount of time is advised to see this done. The starting quest =' },
+                { type = 'link', text = 'Gifts of the Griffon', url = 'https://www.bg-wiki.com/ffxi/Gifts_of_the_Griffon' },
+                { type = 'text', value = "and you don't need to be allied to" },
+                { type = 'link', text = "San d'Oria (S)", url = 'https://www.bg-wiki.com/index.php?title=San_d%27Oria_(S)&amp;action=edit&amp;redlink=1' },
+                { type = 'text', value = 'in order to start or obtain this trust.' },
+            },
+            {
+                { type = 'text', value = 'Be in possession of the' },
+                { type = 'link', text = 'Bundle of scrolls', url = 'https://www.bg-wiki.com/ffxi/Bundle_of_scrolls' },
+                { type = 'text', value = 'key item.' },
+            },
+            {
+                { type = 'text', value = 'Complete' },
+                { type = 'link', text = 'Face of the Future', url = 'https://www.bg-wiki.com/ffxi/Face_of_the_Future' },
+                { type = 'text', value = 'which is the end of the 12 quest process.' },
+            },
+            {
+                { type = 'text', value = 'Speak with' },
+                { type = 'link', text = 'Rholont', url = 'https://www.bg-wiki.com/ffxi/Rholont' },
+                { type = 'text', value = 'in' },
+                { type = 'link', text = "Southern San d'Oria (S)", url = 'https://www.bg-wiki.com/ffxi/Southern_San_d%27Oria_(S)' },
+                { type = 'text', value = '(E-7).' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = "Stag's Call is an AoE Haste +15%, Attack +15%, and MAB +15 buff which lasts for 3 minutes (recast is 5 minutes)." },
+            },
+            {
+                { type = 'text', value = 'The attack buff does not overwrite' },
+                { type = 'link', text = "Nature's Meditation.", url = 'https://www.bg-wiki.com/ffxi/Nature%27s_Meditation' },
+            },
+            {
+                { type = 'text', value = 'The Haste buff is overwritten by' },
+                { type = 'link', text = 'Haste', url = 'https://www.bg-wiki.com/ffxi/Haste' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = 'Haste II.', url = 'https://www.bg-wiki.com/ffxi/Haste_II' },
+                { type = 'text', value = 'Other trust alter egos will cast over it.' },
+            },
+            {
+                { type = 'text', value = 'Uses weapon skills at 1000 TP.' },
+            },
+        },
+    },
+    ['Fablinix'] = {
+        name = 'Fablinix',
+        job = {
+            {
+                { type = 'link', text = 'Thief', url = 'https://www.bg-wiki.com/ffxi/Thief' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Red Mage', url = 'https://www.bg-wiki.com/ffxi/Red_Mage' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Stun,', url = 'https://www.bg-wiki.com/ffxi/Stun' },
+                { type = 'link', text = 'Enwater,', url = 'https://www.bg-wiki.com/ffxi/Enwater' },
+                { type = 'link', text = 'Cure I - IV', url = 'https://www.bg-wiki.com/ffxi/Category:Cure_Spell' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Bomb Toss', url = 'https://www.bg-wiki.com/ffxi/Category:Goblin#Abilities' },
+                { type = 'text', value = '(AoE)' },
+                { type = 'skillchain', value = 'Liquefaction' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Detonation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Goblin Rush', url = 'https://www.bg-wiki.com/ffxi/Category:Goblin#Abilities' },
+                { type = 'skillchain', value = 'Fusion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Impaction' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Fablinix', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Fablinix' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Adventurer Appreciation Campaigns', url = 'https://www.bg-wiki.com/ffxi/Adventurer_Appreciation_Campaign' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Red)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Red)' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses MP+250%.' },
+            },
+            {
+                { type = 'text', value = 'Occasionally uses his crossbow in addition to dagger melee attacks. The long ranged attack delay can cause him to miss' },
+                { type = 'link', text = 'Stun', url = 'https://www.bg-wiki.com/ffxi/Stun' },
+                { type = 'text', value = 'opportunities.' },
+            },
+            {
+                { type = 'text', value = 'Casts' },
+                { type = 'link', text = 'Stun', url = 'https://www.bg-wiki.com/ffxi/Stun' },
+                { type = 'text', value = 'to interrupt enemy TP moves.' },
+            },
+            {
+                { type = 'text', value = 'Uses' },
+                { type = 'link', text = 'Cure', url = 'https://www.bg-wiki.com/ffxi/Category:Cure_Spell' },
+                { type = 'text', value = 'spells on party members in orange HP (<50%) or asleep, with higher priority for the tank (<75%).' },
+            },
+            {
+                { type = 'text', value = 'Holds up to 1500 TP in order to close skillchains.' },
+            },
+            {
+                { type = 'text', value = "Fablinix's high MP pool and access to" },
+                { type = 'link', text = 'Stun', url = 'https://www.bg-wiki.com/ffxi/Stun' },
+                { type = 'text', value = 'at the BLM level (lv.42) may give the impression that he is a BLM or has multiple main jobs. However, if you use him in area with subjob restrictions he will have 0 MP. If you give him at least +8MP through' },
+                { type = 'link', text = 'AoE Food', url = 'https://www.bg-wiki.com/ffxi/AoE_Food' },
+                { type = 'text', value = '(before applying his +350%) or by raising your item level, he will still be able to cast Stun but none of the other spells. He might have a different version of Stun than players, which may explain reports of his Stun recast being shorter.' },
+            },
+        },
+    },
+    ['Flaviria (UC)'] = {
+        name = 'Flaviria (UC)',
+        job = {
+            {
+                { type = 'link', text = 'Dragoon', url = 'https://www.bg-wiki.com/ffxi/Dragoon' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Warrior', url = 'https://www.bg-wiki.com/ffxi/Warrior' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Jump,', url = 'https://www.bg-wiki.com/ffxi/Jump' },
+                { type = 'link', text = 'High Jump,', url = 'https://www.bg-wiki.com/ffxi/High_Jump' },
+                { type = 'link', text = 'Super Jump,', url = 'https://www.bg-wiki.com/ffxi/Super_Jump' },
+                { type = 'link', text = 'Angon,', url = 'https://www.bg-wiki.com/ffxi/Angon_(Ability)' },
+                { type = 'link', text = 'Berserk', url = 'https://www.bg-wiki.com/ffxi/Berserk' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'text', value = '(5)' },
+                { type = 'link', text = 'Skewer', url = 'https://www.bg-wiki.com/ffxi/Skewer' },
+                { type = 'skillchain', value = 'Transfixion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Impaction' },
+                { type = 'text', value = ', (25)' },
+                { type = 'link', text = 'Impulse Drive', url = 'https://www.bg-wiki.com/ffxi/Impulse_Drive' },
+                { type = 'skillchain', value = 'Gravitation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Induration' },
+                { type = 'text', value = ', (50)' },
+                { type = 'link', text = "Celidon's Torment", url = 'https://www.bg-wiki.com/ffxi/Celidon%27s_Torment' },
+                { type = 'skillchain', value = 'Light' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Fragmentation' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Be a member of the Flaviria Unity Concord.' },
+            },
+            {
+                { type = 'text', value = 'Obtain 5000 Unity Accolades through' },
+                { type = 'link', text = 'Records of Eminence', url = 'https://www.bg-wiki.com/ffxi/Records_of_Eminence' },
+                { type = 'text', value = 'objectives for a Partial Personal Evaluation of 5pt.' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses' },
+                { type = 'link', text = 'merits', url = 'https://www.bg-wiki.com/ffxi/Dragoon#Merits' },
+                { type = 'text', value = 'in' },
+                { type = 'link', text = 'Jump', url = 'https://www.bg-wiki.com/ffxi/Jump' },
+                { type = 'text', value = 'recast down,' },
+                { type = 'link', text = 'High Jump', url = 'https://www.bg-wiki.com/ffxi/High_Jump' },
+                { type = 'text', value = 'recast down, and' },
+                { type = 'link', text = 'Angon', url = 'https://www.bg-wiki.com/ffxi/Angon_(Ability)' },
+                { type = 'text', value = 'at level 75.' },
+            },
+            {
+                { type = 'text', value = 'Uses weapon skills at 1000 TP. Does not try to skillchain.' },
+            },
+            {
+                { type = 'link', text = "Celidon's Torment", url = 'https://www.bg-wiki.com/ffxi/Celidon%27s_Torment' },
+                { type = 'text', value = 'is a Unity Leader version of' },
+                { type = 'link', text = "Camlann's Torment", url = 'https://www.bg-wiki.com/ffxi/Camlann%27s_Torment' },
+                { type = 'text', value = 'which has a similar Ignores Defense property.' },
+            },
+            {
+                { type = 'text', value = 'Aggressive weapon skill usage and' },
+                { type = 'link', text = 'Jumps', url = 'https://www.bg-wiki.com/ffxi/Jump' },
+                { type = 'text', value = 'enhanced by' },
+                { type = 'link', text = 'Berserk,', url = 'https://www.bg-wiki.com/ffxi/Berserk' },
+                { type = 'text', value = 'boosted Unity Leader stats (and' },
+                { type = 'link', text = 'Flaviria Unity Shirt', url = 'https://www.bg-wiki.com/ffxi/Flaviria_Unity_Shirt' },
+                { type = 'text', value = '), and early access to higher level weapon skills make Flaviria a strong physical damage dealer to have while leveling.' },
+            },
+            {
+                { type = 'text', value = 'An advantage of the Piercing' },
+                { type = 'link', text = 'Damage Type,', url = 'https://www.bg-wiki.com/ffxi/Damage_Type' },
+                { type = 'text', value = 'is that enemies weak to it like' },
+                { type = 'link', text = 'Mandragora,', url = 'https://www.bg-wiki.com/ffxi/Category:Mandragora' },
+                { type = 'link', text = 'Birds,', url = 'https://www.bg-wiki.com/ffxi/Category:Birds' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = 'Flys', url = 'https://www.bg-wiki.com/ffxi/Category:Fly' },
+                { type = 'text', value = "are common across Vana'diel." },
+            },
+        },
+    },
+    ['Gilgamesh'] = {
+        name = 'Gilgamesh',
+        job = {
+            {
+                { type = 'link', text = 'Samurai', url = 'https://www.bg-wiki.com/ffxi/Samurai' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Warrior', url = 'https://www.bg-wiki.com/ffxi/Warrior' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Hasso,', url = 'https://www.bg-wiki.com/ffxi/Hasso' },
+                { type = 'link', text = 'Third Eye,', url = 'https://www.bg-wiki.com/ffxi/Third_Eye' },
+                { type = 'link', text = 'Sekkanoki,', url = 'https://www.bg-wiki.com/ffxi/Sekkanoki' },
+                { type = 'link', text = 'Hagakure', url = 'https://www.bg-wiki.com/ffxi/Hagakure' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Tachi: Goten', url = 'https://www.bg-wiki.com/ffxi/Tachi:_Goten' },
+                { type = 'skillchain', value = 'Transfixion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Impaction' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Tachi: Kasha', url = 'https://www.bg-wiki.com/ffxi/Tachi:_Kasha' },
+                { type = 'skillchain', value = 'Fusion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Compression' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Iainuki', url = 'https://www.bg-wiki.com/ffxi/Iainuki' },
+                { type = 'skillchain', value = 'Light' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Fragmentation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Tachi: Kamai', url = 'https://www.bg-wiki.com/ffxi/Tachi:_Kamai' },
+                { type = 'text', value = '(AoE)' },
+                { type = 'skillchain', value = 'Gravitation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Scission' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Gilgamesh', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Gilgamesh' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Repeat Login Campaign', url = 'https://www.bg-wiki.com/ffxi/Repeat_Login_Campaign' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Holds up to 2000 TP to close skillchains.' },
+            },
+            {
+                { type = 'text', value = 'If he has 2000 TP and' },
+                { type = 'link', text = 'Sekkanoki', url = 'https://www.bg-wiki.com/ffxi/Sekkanoki' },
+                { type = 'text', value = 'is ready, he self' },
+                { type = 'link', text = 'Skillchains.', url = 'https://www.bg-wiki.com/ffxi/Skillchain' },
+            },
+        },
+    },
+    ['Halver'] = {
+        name = 'Halver',
+        job = {
+            {
+                { type = 'link', text = 'Paladin', url = 'https://www.bg-wiki.com/ffxi/Paladin' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Warrior', url = 'https://www.bg-wiki.com/ffxi/Warrior' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Cure I - IV,', url = 'https://www.bg-wiki.com/ffxi/Category:Cure_Spell' },
+                { type = 'link', text = 'Flash', url = 'https://www.bg-wiki.com/ffxi/Flash' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Berserk,', url = 'https://www.bg-wiki.com/ffxi/Berserk' },
+                { type = 'link', text = 'Rampart,', url = 'https://www.bg-wiki.com/ffxi/Rampart' },
+                { type = 'link', text = 'Provoke,', url = 'https://www.bg-wiki.com/ffxi/Provoke' },
+                { type = 'link', text = 'Sentinel', url = 'https://www.bg-wiki.com/ffxi/Sentinel' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Penta Thrust', url = 'https://www.bg-wiki.com/ffxi/Penta_Thrust' },
+                { type = 'skillchain', value = 'Compression' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Impulse Drive', url = 'https://www.bg-wiki.com/ffxi/Impulse_Drive' },
+                { type = 'skillchain', value = 'Gravitation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Induration' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Raiden Thrust', url = 'https://www.bg-wiki.com/ffxi/Raiden_Thrust' },
+                { type = 'skillchain', value = 'Transfixion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Impaction' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Halver', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Halver' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'text', value = 'Speak to' },
+                { type = 'link', text = 'Halver', url = 'https://www.bg-wiki.com/ffxi/Halver' },
+                { type = 'text', value = 'in' },
+                { type = 'link', text = "Chateau d'Oraguille", url = 'https://www.bg-wiki.com/ffxi/Chateau_d%27Oraguille' },
+                { type = 'text', value = '(I-9) during Mission 2-3 for any nation (' },
+                { type = 'link', text = 'Journey Abroad', url = 'https://www.bg-wiki.com/ffxi/Journey_Abroad' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'The Emissary', url = 'https://www.bg-wiki.com/ffxi/The_Emissary' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'The Three Kingdoms', url = 'https://www.bg-wiki.com/ffxi/The_Three_Kingdoms' },
+                { type = 'text', value = ').' },
+            },
+            {
+                { type = 'text', value = "Alternatively speak to Halver in Chateau d'Oraguille once the" },
+                { type = 'link', text = 'Rhapsodies of Vanadiel Mission 1-7', url = 'https://www.bg-wiki.com/ffxi/Rhapsodies_of_Vanadiel_Mission_1-7' },
+                { type = 'text', value = '(The Path Untraveled) is complete.' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses MP+30%' },
+            },
+            {
+                { type = 'text', value = 'Uses' },
+                { type = 'link', text = 'Berserk', url = 'https://www.bg-wiki.com/ffxi/Berserk' },
+                { type = 'text', value = 'as often as possible.' },
+            },
+            {
+                { type = 'text', value = "When party member's HP is low (under 40%), he acts like a tank and uses his abilities and magic more frequently." },
+            },
+            {
+                { type = 'text', value = 'Uses' },
+                { type = 'link', text = 'Sentinel', url = 'https://www.bg-wiki.com/ffxi/Sentinel' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = 'Rampart', url = 'https://www.bg-wiki.com/ffxi/Rampart' },
+                { type = 'text', value = 'as soon as he starts doing tank behavior.' },
+            },
+            {
+                { type = 'text', value = 'Uses weapon skills at 1000 TP, but it is lower priority.' },
+            },
+        },
+    },
+    ['Ingrid II'] = {
+        name = 'Ingrid II',
+        job = {
+            {
+                { type = 'link', text = 'White Mage', url = 'https://www.bg-wiki.com/ffxi/White_Mage' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Warrior', url = 'https://www.bg-wiki.com/ffxi/Warrior' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Banish I - III,', url = 'https://www.bg-wiki.com/ffxi/Category:Banish_Spells' },
+                { type = 'link', text = 'Cursna,', url = 'https://www.bg-wiki.com/ffxi/Cursna' },
+                { type = 'link', text = 'Holy', url = 'https://www.bg-wiki.com/ffxi/Category:Holy_Spells' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Self-Aggrandizement', url = 'https://www.bg-wiki.com/ffxi/Self-Aggrandizement' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Merciless Strike', url = 'https://www.bg-wiki.com/ffxi/True_Strike' },
+                { type = 'skillchain', value = 'Detonation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Impaction' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Moonlight', url = 'https://www.bg-wiki.com/ffxi/Moonlight' },
+                { type = 'skillchain', value = 'Status_Ability' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Inexorable Strike', url = 'https://www.bg-wiki.com/ffxi/Inexorable_Strike' },
+                { type = 'skillchain', value = 'Light' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Fusion' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Ruthlessness', url = 'https://www.bg-wiki.com/ffxi/Ruthlessness' },
+                { type = 'text', value = '(Conal' },
+                { type = 'link', text = 'Drain', url = 'https://www.bg-wiki.com/ffxi/Drain' },
+                { type = 'text', value = ')' },
+                { type = 'skillchain', value = 'Status_Ability' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Ingrid II', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Ingrid_II' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Sinister Reign', url = 'https://www.bg-wiki.com/ffxi/Sinister_Reign' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+            {
+                { type = 'link', text = 'Filled to Capacity', url = 'https://www.bg-wiki.com/ffxi/Filled_to_Capacity' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses' },
+                { type = 'link', text = 'Undead Killer,', url = 'https://www.bg-wiki.com/ffxi/Undead_Killer' },
+                { type = 'link', text = 'Banish', url = 'https://www.bg-wiki.com/ffxi/Category:Banish_Spells' },
+                { type = 'text', value = 'effectiveness vs' },
+                { type = 'link', text = 'Undead', url = 'https://www.bg-wiki.com/ffxi/Category:Undead' },
+                { type = 'text', value = '+10 (28/256).' },
+            },
+            {
+                { type = 'text', value = 'Saves up to 2500 TP while waiting to close a skillchain.' },
+            },
+            {
+                { type = 'text', value = "Ingrid II's weapon skills are especially effective at creating" },
+                { type = 'link', text = 'Light', url = 'https://www.bg-wiki.com/ffxi/Light' },
+                { type = 'text', value = '-based skillchains.' },
+            },
+            {
+                { type = 'text', value = 'Ingrid II only casts spells in order to' },
+                { type = 'link', text = 'Magic Burst,', url = 'https://www.bg-wiki.com/ffxi/Magic_Burst' },
+                { type = 'text', value = 'doing so with the' },
+                { type = 'link', text = 'Banish', url = 'https://www.bg-wiki.com/ffxi/Category:Banish_Spells' },
+                { type = 'text', value = 'line of Divine Magic.' },
+            },
+            {
+                { type = 'link', text = 'Moonlight', url = 'https://www.bg-wiki.com/ffxi/Moonlight' },
+                { type = 'text', value = "use doesn't appear to be triggered by anything specific (such as her or party members lacking MP)." },
+            },
+            {
+                { type = 'text', value = 'Self-Aggrandizement: Recovers HP and removes one status ailment for the entire party. Used when 3 or more party members are in yellow HP (<75%) or a party member is asleep. Recast: 00:30.' },
+            },
+            {
+                { type = 'text', value = 'Ingrid II is especially effective against' },
+                { type = 'link', text = 'undead', url = 'https://www.bg-wiki.com/ffxi/Undead' },
+                { type = 'text', value = 'enemies due to her propensity to create Light skillchains and magic bursting with powerful' },
+                { type = 'link', text = 'Banish', url = 'https://www.bg-wiki.com/ffxi/Category:Banish_Spells' },
+                { type = 'text', value = 'spells.' },
+            },
+        },
+    },
+    ['Invincible Shield (UC)'] = {
+        name = 'Invincible Shield (UC)',
+        job = {
+            {
+                { type = 'link', text = 'Warrior', url = 'https://www.bg-wiki.com/ffxi/Warrior' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Corsair', url = 'https://www.bg-wiki.com/ffxi/Corsair' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Provoke,', url = 'https://www.bg-wiki.com/ffxi/Provoke' },
+                { type = 'link', text = 'Aggressor,', url = 'https://www.bg-wiki.com/ffxi/Aggressor' },
+                { type = 'link', text = 'Restraint,', url = 'https://www.bg-wiki.com/ffxi/Restraint' },
+                { type = 'link', text = 'Retaliation,', url = 'https://www.bg-wiki.com/ffxi/Retaliation' },
+                { type = 'link', text = 'Warcry,', url = 'https://www.bg-wiki.com/ffxi/Warcry' },
+                { type = 'link', text = 'Blood Rage,', url = 'https://www.bg-wiki.com/ffxi/Blood_Rage' },
+                { type = 'link', text = 'Tomahawk,', url = 'https://www.bg-wiki.com/ffxi/Tomahawk_(Ability)' },
+                { type = 'link', text = 'Savagery', url = 'https://www.bg-wiki.com/ffxi/Savagery' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'text', value = '(5)' },
+                { type = 'link', text = 'Raging Rush', url = 'https://www.bg-wiki.com/ffxi/Raging_Rush' },
+                { type = 'skillchain', value = 'Induration' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Reverberation' },
+                { type = 'text', value = ', (25)' },
+                { type = 'link', text = 'Steel Cyclone', url = 'https://www.bg-wiki.com/ffxi/Steel_Cyclone' },
+                { type = 'skillchain', value = 'Distortion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Detonation' },
+                { type = 'text', value = ', (50)' },
+                { type = 'link', text = "Soturi's Fury", url = 'https://www.bg-wiki.com/ffxi/Soturi%27s_Fury' },
+                { type = 'skillchain', value = 'Light' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Fragmentation' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Be a member of the Invincible Shield Unity Concord.' },
+            },
+            {
+                { type = 'text', value = 'Obtain 5000 Unity Accolades through' },
+                { type = 'link', text = 'Records of Eminence', url = 'https://www.bg-wiki.com/ffxi/Records_of_Eminence' },
+                { type = 'text', value = 'objectives for a Partial Personal Evaluation of 5pt.' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses' },
+                { type = 'link', text = 'Damage Taken', url = 'https://www.bg-wiki.com/ffxi/Damage_Taken' },
+                { type = 'text', value = '-20%. WAR/traits.' },
+            },
+            {
+                { type = 'text', value = 'Depending on Unity Ranking: HP+20%~+30%.' },
+            },
+            {
+                { type = 'text', value = 'Uses' },
+                { type = 'link', text = 'Warcry', url = 'https://www.bg-wiki.com/ffxi/Warcry' },
+                { type = 'text', value = 'then' },
+                { type = 'link', text = 'Blood Rage', url = 'https://www.bg-wiki.com/ffxi/Blood_Rage' },
+                { type = 'text', value = 'as soon as' },
+                { type = 'link', text = 'Warcry', url = 'https://www.bg-wiki.com/ffxi/Warcry' },
+                { type = 'text', value = 'ends.' },
+            },
+            {
+                { type = 'text', value = 'Uses' },
+                { type = 'link', text = 'Tomahawk', url = 'https://www.bg-wiki.com/ffxi/Tomahawk_(Ability)' },
+                { type = 'text', value = 'on' },
+                { type = 'link', text = 'Skeletons,', url = 'https://www.bg-wiki.com/ffxi/Category:Skeleton' },
+                { type = 'link', text = 'Slimes,', url = 'https://www.bg-wiki.com/ffxi/Category:Slime' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = 'Elementals.', url = 'https://www.bg-wiki.com/ffxi/Category:Elemental' },
+            },
+            {
+                { type = 'text', value = 'He is a damage dealer who' },
+                { type = 'link', text = 'Provokes.', url = 'https://www.bg-wiki.com/ffxi/Provoke' },
+            },
+            {
+                { type = 'text', value = "When you don't need a tank, he'll do more damage with" },
+                { type = 'link', text = 'Retaliation.', url = 'https://www.bg-wiki.com/ffxi/Retaliation' },
+            },
+            {
+                { type = 'text', value = 'To get the most out of' },
+                { type = 'link', text = 'Retaliation,', url = 'https://www.bg-wiki.com/ffxi/Retaliation' },
+                { type = 'text', value = 'this version of' },
+                { type = 'link', text = 'Ginuva', url = 'https://www.bg-wiki.com/ffxi/Ginuva%27s_Theory' },
+                { type = 'text', value = 'does not have his shield.' },
+            },
+            {
+                { type = 'text', value = 'Holds up to 1500 TP to close skillchains.' },
+            },
+            {
+                { type = 'text', value = 'At item level, he gets the same ilvl stat increase as the tanks and Monberaux.' },
+            },
+        },
+    },
+    ['Iroha'] = {
+        name = 'Iroha',
+        job = {
+            {
+                { type = 'link', text = 'Samurai', url = 'https://www.bg-wiki.com/ffxi/Samurai' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'White Mage', url = 'https://www.bg-wiki.com/ffxi/White_Mage' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Protectra V,', url = 'https://www.bg-wiki.com/ffxi/Category:Protect_Spell' },
+                { type = 'link', text = 'Shellra V', url = 'https://www.bg-wiki.com/ffxi/Category:Shell_Spell' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Hagakure,', url = 'https://www.bg-wiki.com/ffxi/Hagakure' },
+                { type = 'link', text = 'Hasso,', url = 'https://www.bg-wiki.com/ffxi/Hasso' },
+                { type = 'link', text = 'Meditate,', url = 'https://www.bg-wiki.com/ffxi/Meditate' },
+                { type = 'link', text = 'Third Eye,', url = 'https://www.bg-wiki.com/ffxi/Third_Eye' },
+                { type = 'link', text = 'Save TP', url = 'https://www.bg-wiki.com/ffxi/Save_TP' },
+                { type = 'text', value = '(400), Blessing of Phoenix (one time Reraise)' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Amatsu: Hanadoki', url = 'https://www.bg-wiki.com/index.php?title=Tachi:Koki&amp;action=edit&amp;redlink=1' },
+                { type = 'text', value = '()' },
+                { type = 'skillchain', value = 'Reverberation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Impaction' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Amatsu: Choun', url = 'https://www.bg-wiki.com/ffxi/Tachi:_Kagero' },
+                { type = 'text', value = '()' },
+                { type = 'skillchain', value = 'Liquefaction' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Amatsu: Fuga', url = 'https://www.bg-wiki.com/index.php?title=Amatsu:_Fuga&amp;action=edit&amp;redlink=1' },
+                { type = 'text', value = '()' },
+                { type = 'skillchain', value = 'Impaction' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Amatsu: Gachirin', url = 'https://www.bg-wiki.com/index.php?title=Amatsu:_Gachirin&amp;action=edit&amp;redlink=1' },
+                { type = 'text', value = '()' },
+                { type = 'skillchain', value = 'Light' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Fragmentation' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Iroha', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Iroha' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'text', value = 'Complete' },
+                { type = 'link', text = 'Nary a Cloud in Sight.', url = 'https://www.bg-wiki.com/ffxi/Nary_a_Cloud_in_Sight' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses MP+50%' },
+            },
+            {
+                { type = 'text', value = 'If' },
+                { type = 'link', text = 'Hagakure', url = 'https://www.bg-wiki.com/ffxi/Hagakure' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = 'Meditate', url = 'https://www.bg-wiki.com/ffxi/Meditate' },
+                { type = 'text', value = 'are available, does not try to close skillchains created by other weapon skills or existing skillchains: focuses on making a solo skillchain at 2000 TP.' },
+            },
+            {
+                { type = 'text', value = "Iroha's skillchain is as follows: Hanadoki > Choun = > Fuga = > Gachirin = > Gachirin = ." },
+            },
+            {
+                { type = 'text', value = 'Holds up to 2500 TP to close skillchains.' },
+            },
+            {
+                { type = 'text', value = 'Has access to' },
+                { type = 'link', text = 'Protectra V', url = 'https://www.bg-wiki.com/ffxi/Protectra_V' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = 'Shellra V', url = 'https://www.bg-wiki.com/ffxi/Shellra_V' },
+                { type = 'text', value = 'at level 75 but no lower tier versions.' },
+            },
+            {
+                { type = 'text', value = 'Iroha possesses the blessing of Phoenix which will revive her at full HP if she is killed in battle (occurs only once per summoning).' },
+            },
+        },
+    },
+    ['Iroha II'] = {
+        name = 'Iroha II',
+        job = {
+            {
+                { type = 'link', text = 'Samurai', url = 'https://www.bg-wiki.com/ffxi/Samurai' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'White Mage', url = 'https://www.bg-wiki.com/ffxi/White_Mage' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Protectra V,', url = 'https://www.bg-wiki.com/ffxi/Protectra_V' },
+                { type = 'link', text = 'Shellra V,', url = 'https://www.bg-wiki.com/ffxi/Shellra_V' },
+                { type = 'link', text = 'Flare II', url = 'https://www.bg-wiki.com/ffxi/Flare_II' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Hasso,', url = 'https://www.bg-wiki.com/ffxi/Hasso' },
+                { type = 'link', text = 'Save TP', url = 'https://www.bg-wiki.com/ffxi/Save_TP' },
+                { type = 'text', value = '(400),' },
+                { type = 'link', text = 'Meditate,', url = 'https://www.bg-wiki.com/ffxi/Meditate' },
+                { type = 'link', text = 'Third Eye', url = 'https://www.bg-wiki.com/ffxi/Third_Eye' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Amatsu: Kyori', url = 'https://www.bg-wiki.com/index.php?title=Amatsu:_Kyori&amp;action=edit&amp;redlink=1' },
+                { type = 'text', value = '()' },
+                { type = 'skillchain', value = 'Induration' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Amatsu: Hanadoki', url = 'https://www.bg-wiki.com/ffxi/Tachi:_Koki' },
+                { type = 'text', value = '( + Chance to' },
+                { type = 'link', text = 'Dispel', url = 'https://www.bg-wiki.com/ffxi/Dispel' },
+                { type = 'text', value = ')' },
+                { type = 'skillchain', value = 'Reverberation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Impaction' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Amatsu: Suien', url = 'https://www.bg-wiki.com/index.php?title=Amatsu:_Suien&amp;action=edit&amp;redlink=1' },
+                { type = 'text', value = '()' },
+                { type = 'skillchain', value = 'Fusion' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Amatsu: Gachirin', url = 'https://www.bg-wiki.com/index.php?title=Amatsu:_Gachirin&amp;action=edit&amp;redlink=1' },
+                { type = 'text', value = '()' },
+                { type = 'skillchain', value = 'Light' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Fragmentation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Rise From Ashes', url = 'https://www.bg-wiki.com/index.php?title=Rise_From_Ashes&amp;action=edit&amp;redlink=1' },
+                { type = 'text', value = '(AoE Restore HP + MP +' },
+                { type = 'link', text = 'Stoneskin', url = 'https://www.bg-wiki.com/ffxi/Stoneskin' },
+                { type = 'text', value = ')' },
+                { type = 'skillchain', value = 'Status_Ability' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Iroha II', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Iroha_II' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'text', value = 'Complete' },
+                { type = 'link', text = "The Orb's Radiance.", url = 'https://www.bg-wiki.com/ffxi/The_Orb%27s_Radiance' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses HP-5%, MP+250%' },
+            },
+            {
+                { type = 'text', value = 'Gains 205 TP per hit.' },
+            },
+            {
+                { type = 'text', value = 'Has access to' },
+                { type = 'link', text = 'Protectra V', url = 'https://www.bg-wiki.com/ffxi/Protectra_V' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = 'Shellra V', url = 'https://www.bg-wiki.com/ffxi/Shellra_V' },
+                { type = 'text', value = 'at level 75 but no lower tier versions.' },
+            },
+            {
+                { type = 'text', value = 'Iroha will normally hold her TP in order to close any potential skillchains.' },
+            },
+            {
+                { type = 'text', value = 'When Iroha has 2000+ TP and' },
+                { type = 'link', text = 'Meditate', url = 'https://www.bg-wiki.com/ffxi/Meditate' },
+                { type = 'text', value = 'is ready, she will attempt to perform a 4 part' },
+                { type = 'link', text = 'Double Light', url = 'https://www.bg-wiki.com/ffxi/Double_Light' },
+                { type = 'text', value = 'skillchain.' },
+            },
+            {
+                { type = 'text', value = 'Iroha will magic burst fire-based skillchains using a near instant cast' },
+                { type = 'link', text = 'Flare II.', url = 'https://www.bg-wiki.com/ffxi/Flare_II' },
+            },
+            {
+                { type = 'text', value = 'This version of Iroha has taken on a fiery new appearance and the blessing of Phoenix was upgraded; her Reraise was replaced with the AoE healing skill, Rise From Ashes.' },
+            },
+            {
+                { type = 'text', value = 'Rise from Ashes is a weapon skill that restores 25% HP of all party members, restores MP, and provides a 500HP' },
+                { type = 'link', text = 'Stoneskin', url = 'https://www.bg-wiki.com/ffxi/Stoneskin' },
+                { type = 'text', value = 'buff.' },
+            },
+            {
+                { type = 'text', value = 'She will use Rise From Ashes if 3 or more party members are at yellow HP (75%) or if a party member is asleep.' },
+            },
+        },
+    },
+    ['Iron Eater'] = {
+        name = 'Iron Eater',
+        job = {
+            {
+                { type = 'link', text = 'Warrior', url = 'https://www.bg-wiki.com/ffxi/Warrior' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Warrior', url = 'https://www.bg-wiki.com/ffxi/Warrior' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Provoke,', url = 'https://www.bg-wiki.com/ffxi/Provoke' },
+                { type = 'link', text = 'Berserk,', url = 'https://www.bg-wiki.com/ffxi/Berserk' },
+                { type = 'link', text = 'Restraint', url = 'https://www.bg-wiki.com/ffxi/Restraint' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Shield Break', url = 'https://www.bg-wiki.com/ffxi/Shield_Break' },
+                { type = 'skillchain', value = 'Impaction' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Armor Break', url = 'https://www.bg-wiki.com/ffxi/Armor_Break' },
+                { type = 'skillchain', value = 'Impaction' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Steel Cyclone', url = 'https://www.bg-wiki.com/ffxi/Steel_Cyclone' },
+                { type = 'skillchain', value = 'Distortion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Detonation' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Complete the initiation quest in' },
+                { type = 'link', text = 'Bastok.', url = 'https://www.bg-wiki.com/ffxi/Trust:_Bastok' },
+            },
+            {
+                { type = 'text', value = 'Have obtained the following Trust spells: Naji, Ayame, & Volker' },
+            },
+            {
+                { type = 'text', value = 'Speak to' },
+                { type = 'link', text = 'Iron Eater', url = 'https://www.bg-wiki.com/ffxi/Iron_Eater' },
+                { type = 'text', value = 'in the' },
+                { type = 'link', text = 'Metalworks', url = 'https://www.bg-wiki.com/ffxi/Metalworks' },
+                { type = 'text', value = '(J-8).' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses 5/5' },
+                { type = 'link', text = 'Double Attack', url = 'https://www.bg-wiki.com/ffxi/Double_Attack' },
+                { type = 'text', value = 'merits, enhanced' },
+                { type = 'link', text = 'Double Attack', url = 'https://www.bg-wiki.com/ffxi/Double_Attack' },
+                { type = 'text', value = 'rate, enhanced' },
+                { type = 'link', text = 'Store TP.', url = 'https://www.bg-wiki.com/ffxi/Store_TP' },
+            },
+            {
+                { type = 'text', value = 'Will only use' },
+                { type = 'link', text = 'Provoke', url = 'https://www.bg-wiki.com/ffxi/Provoke' },
+                { type = 'text', value = 'if your HP is low.' },
+            },
+            {
+                { type = 'text', value = 'Will use' },
+                { type = 'link', text = 'Restraint', url = 'https://www.bg-wiki.com/ffxi/Restraint' },
+                { type = 'text', value = 'and waits until 35~40 attacks have landed (long after reaching 3000 TP) to use a random weaponskill.' },
+            },
+            {
+                { type = 'text', value = 'While not using' },
+                { type = 'link', text = 'Restraint,', url = 'https://www.bg-wiki.com/ffxi/Restraint' },
+                { type = 'text', value = 'uses TP as soon as he gets it.' },
+            },
+        },
+    },
+    ['Jakoh Wahcondalo (UC)'] = {
+        name = 'Jakoh Wahcondalo (UC)',
+        job = {
+            {
+                { type = 'link', text = 'Thief', url = 'https://www.bg-wiki.com/ffxi/Thief' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Warrior', url = 'https://www.bg-wiki.com/ffxi/Warrior' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Conspirator,', url = 'https://www.bg-wiki.com/ffxi/Conspirator' },
+                { type = 'link', text = 'Trick Attack,', url = 'https://www.bg-wiki.com/ffxi/Trick_Attack' },
+                { type = 'link', text = 'Sneak Attack,', url = 'https://www.bg-wiki.com/ffxi/Sneak_Attack' },
+                { type = 'link', text = 'Feint', url = 'https://www.bg-wiki.com/ffxi/Feint' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'text', value = '(5)' },
+                { type = 'link', text = 'Dancing Edge', url = 'https://www.bg-wiki.com/ffxi/Dancing_Edge' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Detonation' },
+                { type = 'text', value = ', (25)' },
+                { type = 'link', text = 'Evisceration', url = 'https://www.bg-wiki.com/ffxi/Evisceration' },
+                { type = 'skillchain', value = 'Gravitation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Transfixion' },
+                { type = 'text', value = ', (50)' },
+                { type = 'link', text = "Sarva's Storm", url = 'https://www.bg-wiki.com/ffxi/Sarva%27s_Storm' },
+                { type = 'skillchain', value = 'Dark' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Distortion' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Be a member of the Jakoh Wahcondalo Unity Concord.' },
+            },
+            {
+                { type = 'text', value = 'Obtain 5000 Unity Accolades through' },
+                { type = 'link', text = 'Records of Eminence', url = 'https://www.bg-wiki.com/ffxi/Records_of_Eminence' },
+                { type = 'text', value = 'objectives for a Partial Personal Evaluation of 5pt.' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Uses weapon skills at >2000 TP with' },
+                { type = 'link', text = 'Trick Attack', url = 'https://www.bg-wiki.com/ffxi/Trick_Attack' },
+                { type = 'text', value = 'and/or' },
+                { type = 'link', text = 'Sneak Attack.', url = 'https://www.bg-wiki.com/ffxi/Sneak_Attack' },
+            },
+            {
+                { type = 'text', value = 'Holds up to 3000 TP to wait for positioning.' },
+            },
+            {
+                { type = 'text', value = 'Weapon skill used is random. Does not try to close skillchains.' },
+            },
+            {
+                { type = 'text', value = 'Will open with' },
+                { type = 'link', text = 'Feint', url = 'https://www.bg-wiki.com/ffxi/Feint' },
+                { type = 'text', value = 'and uses it on cooldown.' },
+            },
+            {
+                { type = 'text', value = 'Wields a knife. Gains 55 TP on hit.' },
+            },
+        },
+    },
+    ['Klara'] = {
+        name = 'Klara',
+        job = {
+            {
+                { type = 'link', text = 'Warrior', url = 'https://www.bg-wiki.com/ffxi/Warrior' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Warrior', url = 'https://www.bg-wiki.com/ffxi/Warrior' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Berserk,', url = 'https://www.bg-wiki.com/ffxi/Berserk' },
+                { type = 'link', text = 'Provoke,', url = 'https://www.bg-wiki.com/ffxi/Provoke' },
+                { type = 'link', text = 'Warcry', url = 'https://www.bg-wiki.com/ffxi/Warcry' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Fast Blade', url = 'https://www.bg-wiki.com/ffxi/Fast_Blade' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Vorpal Blade', url = 'https://www.bg-wiki.com/ffxi/Vorpal_Blade' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Impaction' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Savage Blade', url = 'https://www.bg-wiki.com/ffxi/Savage_Blade' },
+                { type = 'skillchain', value = 'Fragmentation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ', Temblor Blade (AoE)' },
+                { type = 'skillchain', value = 'Reverberation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Impaction' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Notice: Acquiring this trust is a long process of 12 quests; many of which have "a game day of waiting" between them. Setting aside a good amount of time is advised to see this done. The starting quest =' },
+                { type = 'link', text = 'Better Part of Valor', url = 'https://www.bg-wiki.com/ffxi/Better_Part_of_Valor' },
+                { type = 'text', value = "and you don't need to be allied to" },
+                { type = 'link', text = 'Bastok (S)', url = 'https://www.bg-wiki.com/index.php?title=Bastok_(S)&amp;action=edit&amp;redlink=1' },
+                { type = 'text', value = 'in order to start or obtain this trust.' },
+            },
+            {
+                { type = 'text', value = 'Be in possession of the' },
+                { type = 'link', text = 'Bundle of scrolls', url = 'https://www.bg-wiki.com/ffxi/Bundle_of_scrolls' },
+                { type = 'text', value = 'key item.' },
+            },
+            {
+                { type = 'text', value = 'Complete' },
+                { type = 'link', text = 'Bonds of Mythril', url = 'https://www.bg-wiki.com/ffxi/Bonds_of_Mythril' },
+                { type = 'text', value = 'which is the end of the 12 quest process.' },
+            },
+            {
+                { type = 'text', value = 'Speak with' },
+                { type = 'link', text = 'Gentle Tiger', url = 'https://www.bg-wiki.com/ffxi/Gentle_Tiger' },
+                { type = 'text', value = 'in' },
+                { type = 'link', text = 'Bastok Markets (S)', url = 'https://www.bg-wiki.com/ffxi/Bastok_Markets_(S)' },
+                { type = 'text', value = '(H-6).' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Temblor Blade is a significantly stronger variant of' },
+                { type = 'link', text = 'Circle Blade.', url = 'https://www.bg-wiki.com/ffxi/Circle_Blade' },
+            },
+            {
+                { type = 'text', value = 'Uses TP as soon as she gets it.' },
+            },
+            {
+                { type = 'link', text = 'Provokes', url = 'https://www.bg-wiki.com/ffxi/Provoke' },
+                { type = 'text', value = 'when the player is in orange (50%) HP.' },
+            },
+        },
+    },
+    ['Lehko Habhoka'] = {
+        name = 'Lehko Habhoka',
+        job = {
+            {
+                { type = 'link', text = 'Thief', url = 'https://www.bg-wiki.com/ffxi/Thief' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Black Mage', url = 'https://www.bg-wiki.com/ffxi/Black_Mage' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Single-target elemental nukes I - II', url = 'https://www.bg-wiki.com/ffxi/Category:Elemental_Magic' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Iridal Pierce', url = 'https://www.bg-wiki.com/ffxi/Iridal_Pierce' },
+                { type = 'text', value = '(AoE)' },
+                { type = 'skillchain', value = 'Light' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Fragmentation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Lunar Revolution', url = 'https://www.bg-wiki.com/ffxi/Lunar_Revolution' },
+                { type = 'text', value = '(Conal)' },
+                { type = 'skillchain', value = 'Gravitation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Reverberation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Debonair Rush', url = 'https://www.bg-wiki.com/ffxi/Debonair_Rush' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Detonation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Inspirit', url = 'https://www.bg-wiki.com/ffxi/Inspirit' },
+                { type = 'text', value = '(AoE HP+MP restore+' },
+                { type = 'link', text = 'Erase', url = 'https://www.bg-wiki.com/ffxi/Erase' },
+                { type = 'text', value = ')' },
+                { type = 'skillchain', value = 'Status_Ability' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Lehko', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Lehko' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Repeat Login Campaign', url = 'https://www.bg-wiki.com/ffxi/Repeat_Login_Campaign' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Red)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Red)' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses MP+150%, enhanced' },
+                { type = 'link', text = 'Magic Accuracy.', url = 'https://www.bg-wiki.com/ffxi/Magic_Accuracy' },
+            },
+            {
+                { type = 'text', value = 'Has an abnormally high Double/Triple attack rate.' },
+            },
+            {
+                { type = 'text', value = 'Tends to use a weapon skill right when he hits 1000TP.' },
+            },
+            {
+                { type = 'text', value = 'Regularly uses a throwing Ranged Attack in conjunction with his auto-attacks.' },
+            },
+            {
+                { type = 'text', value = 'Spells are used more frequently against enemies resistant to piercing damage, such as elementals.' },
+            },
+            {
+                { type = 'text', value = 'Occasionally uses elemental magic for moderate damage. (Does not attempt to magic burst)' },
+            },
+            {
+                { type = 'text', value = 'Use of Inspirit does not appear to be triggered by party condition (i.e. he can use it if everyone is at full HP).' },
+            },
+        },
+    },
+    ['Lhe Lhangavo'] = {
+        name = 'Lhe Lhangavo',
+        job = {
+            {
+                { type = 'link', text = 'Monk', url = 'https://www.bg-wiki.com/ffxi/Monk' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Warrior', url = 'https://www.bg-wiki.com/ffxi/Warrior' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Dodge,', url = 'https://www.bg-wiki.com/ffxi/Dodge' },
+                { type = 'link', text = 'Chakra,', url = 'https://www.bg-wiki.com/ffxi/Chakra' },
+                { type = 'link', text = 'Impetus,', url = 'https://www.bg-wiki.com/ffxi/Impetus' },
+                { type = 'link', text = 'Focus,', url = 'https://www.bg-wiki.com/ffxi/Focus' },
+                { type = 'link', text = 'Formless Strikes,', url = 'https://www.bg-wiki.com/ffxi/Formless_Strikes' },
+                { type = 'link', text = 'Provoke', url = 'https://www.bg-wiki.com/ffxi/Provoke' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Backhand Blow', url = 'https://www.bg-wiki.com/ffxi/Backhand_Blow' },
+                { type = 'skillchain', value = 'Detonation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Raging Fists', url = 'https://www.bg-wiki.com/ffxi/Raging_Fists' },
+                { type = 'skillchain', value = 'Impaction' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Dragon Kick', url = 'https://www.bg-wiki.com/ffxi/Dragon_Kick' },
+                { type = 'skillchain', value = 'Fragmentation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Asuran Fists', url = 'https://www.bg-wiki.com/ffxi/Asuran_Fists' },
+                { type = 'skillchain', value = 'Gravitation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Liquefaction' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Lhe', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Lhe' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Repeat Login Campaigns', url = 'https://www.bg-wiki.com/ffxi/Repeat_Login_Campaign' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Red)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Red)' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses' },
+                { type = 'link', text = 'Invigorate', url = 'https://www.bg-wiki.com/ffxi/Invigorate' },
+                { type = 'text', value = '(' },
+                { type = 'link', text = 'Chakra:', url = 'https://www.bg-wiki.com/ffxi/Chakra' },
+                { type = 'text', value = '+Regen).' },
+            },
+            {
+                { type = 'text', value = 'Uses' },
+                { type = 'link', text = 'Focus', url = 'https://www.bg-wiki.com/ffxi/Focus' },
+                { type = 'text', value = 'if accuracy is below a certain threshold.' },
+            },
+            {
+                { type = 'link', text = 'Provokes', url = 'https://www.bg-wiki.com/ffxi/Provoke' },
+                { type = 'text', value = 'when the player who summoned her falls below half hp.' },
+            },
+            {
+                { type = 'text', value = 'Uses' },
+                { type = 'link', text = 'Dodge', url = 'https://www.bg-wiki.com/ffxi/Dodge' },
+                { type = 'text', value = 'when in the top enmity slot.' },
+            },
+            {
+                { type = 'text', value = 'Uses' },
+                { type = 'link', text = 'Formless Strikes', url = 'https://www.bg-wiki.com/ffxi/Formless_Strikes' },
+                { type = 'text', value = 'if the target is resistant to physical damage (' },
+                { type = 'link', text = 'leech,', url = 'https://www.bg-wiki.com/ffxi/Leech' },
+                { type = 'link', text = 'slime,', url = 'https://www.bg-wiki.com/ffxi/Slime' },
+                { type = 'link', text = 'elemental,', url = 'https://www.bg-wiki.com/ffxi/Elemental' },
+                { type = 'link', text = 'ghost', url = 'https://www.bg-wiki.com/ffxi/Ghost' },
+                { type = 'text', value = ')' },
+            },
+            {
+                { type = 'text', value = 'Holds TP until 2000 to try to close skillchains.' },
+            },
+        },
+    },
+    ['Lhu Mhakaracca'] = {
+        name = 'Lhu Mhakaracca',
+        job = {
+            {
+                { type = 'link', text = 'Beastmaster', url = 'https://www.bg-wiki.com/ffxi/Beastmaster' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Warrior', url = 'https://www.bg-wiki.com/ffxi/Warrior' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Feral Howl,', url = 'https://www.bg-wiki.com/ffxi/Feral_Howl' },
+                { type = 'link', text = 'Berserk,', url = 'https://www.bg-wiki.com/ffxi/Berserk' },
+                { type = 'link', text = 'Aggressor', url = 'https://www.bg-wiki.com/ffxi/Aggressor' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Spinning Axe', url = 'https://www.bg-wiki.com/ffxi/Spinning_Axe' },
+                { type = 'skillchain', value = 'Liquefaction' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Impaction' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Rampage', url = 'https://www.bg-wiki.com/ffxi/Rampage' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Onslaught', url = 'https://www.bg-wiki.com/ffxi/Onslaught' },
+                { type = 'skillchain', value = 'Dark' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Gravitation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Decimation', url = 'https://www.bg-wiki.com/ffxi/Decimation' },
+                { type = 'skillchain', value = 'Fusion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Reverberation' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Lhu', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Lhu' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Repeat Login Campaign', url = 'https://www.bg-wiki.com/ffxi/Repeat_Login_Campaign' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Favors' },
+                { type = 'link', text = 'Spinning Axe.', url = 'https://www.bg-wiki.com/ffxi/Spinning_Axe' },
+            },
+            {
+                { type = 'text', value = 'Gains 91 TP per hit.' },
+            },
+            {
+                { type = 'text', value = 'Uses TP as soon as she gets it.' },
+            },
+            {
+                { type = 'text', value = 'Uses' },
+                { type = 'link', text = 'Feral Howl', url = 'https://www.bg-wiki.com/ffxi/Feral_Howl' },
+                { type = 'text', value = 'when the enemy is < 20% HP, which can help to prevent abilities triggered by low-hp (e.g. Healing abilities,' },
+                { type = 'link', text = 'Final Sting', url = 'https://www.bg-wiki.com/ffxi/Final_Sting' },
+                { type = 'text', value = "), especially job abilities you wouldn't be able to" },
+                { type = 'link', text = 'Stun', url = 'https://www.bg-wiki.com/ffxi/Stun' },
+                { type = 'text', value = 'normally (e.g.' },
+                { type = 'link', text = 'Benediction,', url = 'https://www.bg-wiki.com/ffxi/Benediction' },
+                { type = 'link', text = 'Mijin Gakure', url = 'https://www.bg-wiki.com/ffxi/Mijin_Gakure' },
+                { type = 'text', value = ')' },
+            },
+        },
+    },
+    ['Lilisette'] = {
+        name = 'Lilisette',
+        job = {
+            {
+                { type = 'link', text = 'Dancer', url = 'https://www.bg-wiki.com/ffxi/Dancer' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Dancer', url = 'https://www.bg-wiki.com/ffxi/Dancer' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Whirling Edge', url = 'https://www.bg-wiki.com/index.php?title=Whirling_Edge&amp;action=edit&amp;redlink=1' },
+                { type = 'text', value = '(AoE)' },
+                { type = 'skillchain', value = 'Distortion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Reverberation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = "Dancer's Fury", url = 'https://www.bg-wiki.com/index.php?title=Dancer%27s_Fury&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Fragmentation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Rousing Samba', url = 'https://www.bg-wiki.com/index.php?title=Rousing_Samba&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Status_Ability' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Sensual Dance', url = 'https://www.bg-wiki.com/index.php?title=Sensual_Dance&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Status_Ability' },
+                { type = 'text', value = ', Thorn Dance' },
+                { type = 'skillchain', value = 'Status_Ability' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Vivifying Waltz', url = 'https://www.bg-wiki.com/index.php?title=Vivifying_Waltz&amp;action=edit&amp;redlink=1' },
+                { type = 'text', value = '(' },
+                { type = 'link', text = 'Divine Waltz II', url = 'https://www.bg-wiki.com/ffxi/Divine_Waltz_II' },
+                { type = 'text', value = ')' },
+                { type = 'skillchain', value = 'Status_Ability' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Lilisette', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Lilisette' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'text', value = 'Complete' },
+                { type = 'link', text = 'A Forbidden Reunion.', url = 'https://www.bg-wiki.com/ffxi/A_Forbidden_Reunion' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Even though she appears to Dual Wield, she only attacks with a single attack per round.' },
+            },
+            {
+                { type = 'text', value = 'Does not try to participate in skillchains.' },
+            },
+            {
+                { type = 'text', value = 'Waits until ~1500 TP to use a TP move, Vivifying Waltz and Thorn Dance are prioritized when conditions are met.' },
+            },
+            {
+                { type = 'text', value = 'Vivifying Waltz will be used @ 1500 TP when at least 2 party members are in yellow HP (<75%), or as soon as 1000 TP when a party member is in orange (<50%) HP. The amount healed varies with TP.' },
+            },
+            {
+                { type = 'text', value = "All of Lilisette's abilities are considered TP moves and will return 0 TP if not damaging to the enemy." },
+            },
+            {
+                { type = 'text', value = 'Rousing Samba does not create samba animations on attacks, and is an AoE critical hit rate (10%).' },
+            },
+            {
+                { type = 'text', value = 'Sensual Dance is an AoE party attack (15%) and magic attack boost, but can miss party members due to positioning.' },
+            },
+            {
+                { type = 'text', value = 'Sensual Dance affects other party members with Lilisette in their line of sight (like a beneficial Gaze attack), and does not include herself.' },
+            },
+            {
+                { type = 'text', value = 'Sensual Dance can affect Lilisette, but the positioning is different. One way to do it is for Lilisette to be in front of the target and behind the player (the "' },
+                { type = 'link', text = 'Trick Attack', url = 'https://www.bg-wiki.com/ffxi/Trick_Attack' },
+                { type = 'text', value = 'to the face" position) and still close to the target. Then they would need to be facing each other to both receive the buff.' },
+            },
+            {
+                { type = 'text', value = 'The two boosts applied during Sensual Dance can wear off at different times, one at ~50 seconds, the other at ~55 seconds.' },
+            },
+            {
+                { type = 'text', value = 'Thorn Dance is a self-targeted Defense Bonus used when taking the top enmity slot. She can prioritize this ability and use it under 1500 TP.' },
+            },
+        },
+    },
+    ['Lilisette II'] = {
+        name = 'Lilisette II',
+        job = {
+            {
+                { type = 'link', text = 'Dancer', url = 'https://www.bg-wiki.com/ffxi/Dancer' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Warrior', url = 'https://www.bg-wiki.com/ffxi/Warrior' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'text', value = 'Rousing Samba' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Whirling Edge', url = 'https://www.bg-wiki.com/index.php?title=Whirling_Edge&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Distortion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Reverberation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = "Dancer's Fury", url = 'https://www.bg-wiki.com/index.php?title=Dancer%27s_Fury&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Fragmentation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Vivifying Waltz', url = 'https://www.bg-wiki.com/index.php?title=Vivifying_Waltz&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Status_Ability' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Lilisette II', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Lilisette_II' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'text', value = 'Complete' },
+                { type = 'link', text = 'Ganged Up On.', url = 'https://www.bg-wiki.com/ffxi/Ganged_Up_On' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Holds up to 2000 TP to close skillchains.' },
+            },
+            {
+                { type = 'text', value = 'Appears to have a very fast attack rate and TP gain even with low/moderate Haste.' },
+            },
+            {
+                { type = 'text', value = "Like other Alter Ego II's, her weapon skills have been changed to single target." },
+            },
+            {
+                { type = 'text', value = 'Vivifying Waltz changed to trigger when 3 party members in yellow HP (<75%), and will be used with at least 1000 TP.' },
+            },
+            {
+                { type = 'text', value = 'Rousing Samba changed to a normal samba ability that casts 350 TP, so Lilisette II can easily maintain the effect.' },
+            },
+            {
+                { type = 'text', value = 'Rousing Samba is an AoE critical hit rate (10%) .' },
+            },
+            {
+                { type = 'text', value = "She's valuable for party members using weapon skills with crit TP modifiers such as" },
+                { type = 'link', text = 'Victory Smite.', url = 'https://www.bg-wiki.com/ffxi/Victory_Smite' },
+            },
+            {
+                { type = 'text', value = 'If you avoid using weapon skills she can skillchain with (like' },
+                { type = 'link', text = "Rudra's Storm", url = 'https://www.bg-wiki.com/ffxi/Rudra%27s_Storm' },
+                { type = 'text', value = '), she will save TP for healing.' },
+            },
+            {
+                { type = 'text', value = 'Rousing Samba has a noticeably higher effect on Lilisette herself, granting her an extremely high critical hit rate (approx. 75%).' },
+            },
+        },
+    },
+    ['Lion'] = {
+        name = 'Lion',
+        job = {
+            {
+                { type = 'link', text = 'Thief', url = 'https://www.bg-wiki.com/ffxi/Thief' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Thief', url = 'https://www.bg-wiki.com/ffxi/Thief' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Walk the Plank', url = 'https://www.bg-wiki.com/index.php?title=Walk_the_Plank&amp;action=edit&amp;redlink=1' },
+                { type = 'text', value = '(AoE)' },
+                { type = 'skillchain', value = 'Light' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Distortion' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Pirate Pummel', url = 'https://www.bg-wiki.com/index.php?title=Pirate_Pummel&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Fusion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Impaction' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Powder Keg', url = 'https://www.bg-wiki.com/index.php?title=Powder_Keg&amp;action=edit&amp;redlink=1' },
+                { type = 'text', value = '(Conal)' },
+                { type = 'skillchain', value = 'Fusion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Compression' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Grapeshot', url = 'https://www.bg-wiki.com/index.php?title=Grapeshot&amp;action=edit&amp;redlink=1' },
+                { type = 'text', value = '(Conal)' },
+                { type = 'skillchain', value = 'Reverberation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Transfixion' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Lion', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Lion' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Repeat Login Campaign', url = 'https://www.bg-wiki.com/ffxi/Repeat_Login_Campaign' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Red)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Red)' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses THF traits such as' },
+                { type = 'link', text = 'Treasure Hunter', url = 'https://www.bg-wiki.com/ffxi/Treasure_Hunter' },
+                { type = 'text', value = 'I,' },
+                { type = 'link', text = 'Gilfinder,', url = 'https://www.bg-wiki.com/ffxi/Gilfinder' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = 'Triple Attack.', url = 'https://www.bg-wiki.com/ffxi/Triple_Attack' },
+            },
+            {
+                { type = 'text', value = 'Uses TP as soon as she gets it.' },
+            },
+            {
+                { type = 'text', value = 'If the enemy is readying a TP move when she is ready to use a weapon skill, Lion will stun it with Grape Shot.' },
+            },
+            {
+                { type = 'text', value = 'Walk the Plank - AoE damage, bind, knock back, and dispel.' },
+            },
+            {
+                { type = 'text', value = 'Pirate Pummel - Damage and burn effect.' },
+            },
+            {
+                { type = 'text', value = 'Powder Keg - Conal damage, knock back, defense down, and magic defense down.' },
+            },
+            {
+                { type = 'text', value = 'Grape Shot - Conal damage and stun effect.' },
+            },
+        },
+    },
+    ['Lion II'] = {
+        name = 'Lion II',
+        job = {
+            {
+                { type = 'link', text = 'Thief', url = 'https://www.bg-wiki.com/ffxi/Thief' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Ninja', url = 'https://www.bg-wiki.com/ffxi/Ninja' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Utsusemi: Ichi', url = 'https://www.bg-wiki.com/ffxi/Utsusemi:_Ichi' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Ni', url = 'https://www.bg-wiki.com/ffxi/Utsusemi:_Ni' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Walk the Plank', url = 'https://www.bg-wiki.com/index.php?title=Walk_the_Plank&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Light' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Distortion' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Pirate Pummel', url = 'https://www.bg-wiki.com/index.php?title=Pirate_Pummel&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Fusion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Impaction' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Powder Keg', url = 'https://www.bg-wiki.com/index.php?title=Powder_Keg&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Fusion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Compression' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Grapeshot', url = 'https://www.bg-wiki.com/index.php?title=Grapeshot&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Reverberation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Transfixion' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Lion II', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Lion_II' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'text', value = 'Complete' },
+                { type = 'link', text = 'A Land After Time.', url = 'https://www.bg-wiki.com/ffxi/A_Land_After_Time' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses THF/NIN traits such as' },
+                { type = 'link', text = 'Treasure Hunter', url = 'https://www.bg-wiki.com/ffxi/Treasure_Hunter' },
+                { type = 'text', value = 'I,' },
+                { type = 'link', text = 'Gilfinder,', url = 'https://www.bg-wiki.com/ffxi/Gilfinder' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = 'Triple Attack', url = 'https://www.bg-wiki.com/ffxi/Triple_Attack' },
+            },
+            {
+                { type = 'text', value = "Lion II's weaponskills are single target versions of Lion's weaponskills, with the same name and animation." },
+            },
+            {
+                { type = 'text', value = 'Holds up to 3000 TP to try to close skillchains.' },
+            },
+            {
+                { type = 'text', value = 'Walk the Plank - Damage, bind, knock back, and dispel.' },
+            },
+            {
+                { type = 'text', value = 'Pirate Pummel - Damage and burn effect.' },
+            },
+            {
+                { type = 'text', value = 'Powder Keg - Damage, knock back, defense down, and magic defense down.' },
+            },
+            {
+                { type = 'text', value = 'Grape Shot - Damage and stun effect.' },
+            },
+        },
+    },
+    ['Luzaf'] = {
+        name = 'Luzaf',
+        job = {
+            {
+                { type = 'link', text = 'Corsair', url = 'https://www.bg-wiki.com/ffxi/Corsair' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Ninja', url = 'https://www.bg-wiki.com/ffxi/Ninja' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Quick Draw,', url = 'https://www.bg-wiki.com/ffxi/Quick_Draw' },
+                { type = 'link', text = 'Triple Shot', url = 'https://www.bg-wiki.com/ffxi/Triple_Shot' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'text', value = '(5)' },
+                { type = 'link', text = 'Bisection', url = 'https://www.bg-wiki.com/index.php?title=Bisection&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Detonation' },
+                { type = 'text', value = ', (25)' },
+                { type = 'link', text = 'Akimbo Shot', url = 'https://www.bg-wiki.com/index.php?title=Akimbo_Shot&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Compression' },
+                { type = 'text', value = ', (50)' },
+                { type = 'link', text = 'Leaden Salute', url = 'https://www.bg-wiki.com/ffxi/Leaden_Salute' },
+                { type = 'skillchain', value = 'Gravitation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Transfixion' },
+                { type = 'text', value = ', (60)' },
+                { type = 'link', text = 'Grisly Horizon', url = 'https://www.bg-wiki.com/index.php?title=Grisly_Horizon&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Dark' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Distortion' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Luzaf', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Luzaf' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Repeat Login Campaign', url = 'https://www.bg-wiki.com/ffxi/Repeat_Login_Campaign' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Red)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Red)' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses' },
+                { type = 'link', text = 'Skillchain Bonus,', url = 'https://www.bg-wiki.com/ffxi/Skillchain_Bonus' },
+                { type = 'link', text = 'Magic Accuracy Bonus,', url = 'https://www.bg-wiki.com/ffxi/Magic_Accuracy_Bonus' },
+                { type = 'link', text = 'Quick Draw', url = 'https://www.bg-wiki.com/ffxi/Quick_Draw' },
+                { type = 'text', value = 'Recast Down and' },
+                { type = 'link', text = 'Quick Draw', url = 'https://www.bg-wiki.com/ffxi/Quick_Draw' },
+                { type = 'text', value = 'Magic Accuracy from Merits, and A+ skill ranks on Sword, Dagger, and Gun [' },
+                { type = 'link', text = 'Official Note', url = 'https://forum.square-enix.com/ffxi/threads/49425?p=567979#post567979' },
+                { type = 'text', value = ']' },
+            },
+            {
+                { type = 'text', value = 'Does not use' },
+                { type = 'link', text = 'Phantom Roll.', url = 'https://www.bg-wiki.com/ffxi/Category:Phantom_Roll' },
+            },
+            {
+                { type = 'text', value = 'Dual wields and shoots, leading to high rate of TP gain.' },
+            },
+            {
+                { type = 'text', value = "Uses Quick Draw to deal damage based on the enemy's elemental weakness(s)." },
+            },
+            {
+                { type = 'text', value = 'Holds up to 2500 TP waiting for the player to reach 1000 and then weapon skills in order to open a skillchain.' },
+            },
+            {
+                { type = 'text', value = 'Prefers to open skillchains for his player but will close skillchains opened by another party member or trust.' },
+            },
+            {
+                { type = 'text', value = 'Selects one of his weapon skills randomly upon summoning and uses it exclusively unless attempting to close a skillchain.' },
+            },
+            {
+                { type = 'text', value = 'Great choice for closing' },
+                { type = 'link', text = 'Distortion', url = 'https://www.bg-wiki.com/ffxi/Distortion' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = 'Darkness', url = 'https://www.bg-wiki.com/ffxi/Darkness' },
+                { type = 'text', value = 'skillchains with other trusts due to not having access to' },
+                { type = 'link', text = 'Light,', url = 'https://www.bg-wiki.com/ffxi/Light' },
+                { type = 'link', text = 'Fusion', url = 'https://www.bg-wiki.com/ffxi/Fusion' },
+                { type = 'text', value = 'or' },
+                { type = 'link', text = 'Fragmentation', url = 'https://www.bg-wiki.com/ffxi/Fragmentation' },
+                { type = 'text', value = 'properties.' },
+            },
+        },
+    },
+    ['Maat'] = {
+        name = 'Maat',
+        job = {
+            {
+                { type = 'link', text = 'Monk', url = 'https://www.bg-wiki.com/ffxi/Monk' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Thief', url = 'https://www.bg-wiki.com/ffxi/Thief' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Mantra,', url = 'https://www.bg-wiki.com/ffxi/Mantra' },
+                { type = 'link', text = 'Perfect Counter,', url = 'https://www.bg-wiki.com/ffxi/Perfect_Counter' },
+                { type = 'link', text = 'Formless Strikes', url = 'https://www.bg-wiki.com/ffxi/Formless_Strikes' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Asuran Fists', url = 'https://www.bg-wiki.com/ffxi/Asuran_Fists' },
+                { type = 'skillchain', value = 'Gravitation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Liquefaction' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'One-Ilm Punch', url = 'https://www.bg-wiki.com/ffxi/One_Inch_Punch' },
+                { type = 'skillchain', value = 'Compression' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Combo', url = 'https://www.bg-wiki.com/ffxi/Combo' },
+                { type = 'skillchain', value = 'Impaction' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Dragon Kick', url = 'https://www.bg-wiki.com/ffxi/Dragon_Kick' },
+                { type = 'skillchain', value = 'Fragmentation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Howling Fist', url = 'https://www.bg-wiki.com/ffxi/Howling_Fist' },
+                { type = 'skillchain', value = 'Transfixion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Impaction' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Bear Killer', url = 'https://www.bg-wiki.com/ffxi/Bear_Killer' },
+                { type = 'text', value = '(Conal)' },
+                { type = 'skillchain', value = 'Reverberation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Impaction' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Complete' },
+                { type = 'link', text = 'Shattering Stars', url = 'https://www.bg-wiki.com/ffxi/Shattering_Stars' },
+                { type = 'text', value = 'for six or more jobs.' },
+            },
+            {
+                { type = 'text', value = 'Speak with' },
+                { type = 'link', text = 'Maat', url = 'https://www.bg-wiki.com/ffxi/Maat' },
+                { type = 'text', value = 'in' },
+                { type = 'link', text = "Ru'Lude Gardens", url = 'https://www.bg-wiki.com/ffxi/Ru%27Lude_Gardens' },
+                { type = 'text', value = '(H-5).' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses' },
+                { type = 'link', text = 'Treasure Hunter', url = 'https://www.bg-wiki.com/ffxi/Treasure_Hunter' },
+            },
+            {
+                { type = 'text', value = 'Mantra gives both an HP boost as well as' },
+                { type = 'link', text = 'Haste.', url = 'https://www.bg-wiki.com/ffxi/Haste' },
+            },
+            {
+                { type = 'text', value = 'Uses weapon skills at 1000 TP.' },
+            },
+            {
+                { type = 'text', value = 'Uses' },
+                { type = 'link', text = 'Formless Strikes', url = 'https://www.bg-wiki.com/ffxi/Formless_Strikes' },
+                { type = 'text', value = 'for enemies resistance to blunt damage (slimes, leeches).' },
+            },
+        },
+    },
+    ['Maat (UC)'] = {
+        name = 'Maat (UC)',
+        job = {
+            {
+                { type = 'link', text = 'Monk', url = 'https://www.bg-wiki.com/ffxi/Monk' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Warrior', url = 'https://www.bg-wiki.com/ffxi/Warrior' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Chakra,', url = 'https://www.bg-wiki.com/ffxi/Chakra' },
+                { type = 'link', text = 'Counterstance,', url = 'https://www.bg-wiki.com/ffxi/Counterstance' },
+                { type = 'link', text = 'Impetus', url = 'https://www.bg-wiki.com/ffxi/Impetus' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'text', value = '(50)' },
+                { type = 'link', text = 'Hollow Smite', url = 'https://www.bg-wiki.com/ffxi/Hollow_Smite' },
+                { type = 'skillchain', value = 'Light' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Fragmentation' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Be a member of the Maat Unity Concord.' },
+            },
+            {
+                { type = 'text', value = 'Obtain 5000 Unity Accolades through' },
+                { type = 'link', text = 'Records of Eminence', url = 'https://www.bg-wiki.com/ffxi/Records_of_Eminence' },
+                { type = 'text', value = 'objectives for a Partial Personal Evaluation of 5pt.' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses increased' },
+                { type = 'link', text = 'Kick Attacks', url = 'https://www.bg-wiki.com/ffxi/Kick_Attacks' },
+                { type = 'text', value = 'rate.' },
+            },
+            {
+                { type = 'text', value = 'Exclusively uses' },
+                { type = 'link', text = 'Hollow Smite', url = 'https://www.bg-wiki.com/ffxi/Hollow_Smite' },
+                { type = 'text', value = 'as his weaponskill. If called below level 50, he will not have a way to spend TP.' },
+            },
+            {
+                { type = 'text', value = 'Uses' },
+                { type = 'link', text = 'Hollow Smite', url = 'https://www.bg-wiki.com/ffxi/Hollow_Smite' },
+                { type = 'text', value = 'under any the following conditions:' },
+            },
+            {
+                { type = 'text', value = 'To open skillchains for the player when they have 1000 TP.' },
+            },
+            {
+                { type = 'text', value = 'To close a skillchain started by other party members if possible.' },
+            },
+            {
+                { type = 'text', value = 'When Maat (UC) has 3000 TP.' },
+            },
+        },
+    },
+    ['Matsui-P'] = {
+        name = 'Matsui-P',
+        job = {
+            {
+                { type = 'link', text = 'Ninja', url = 'https://www.bg-wiki.com/ffxi/Ninja' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Black Mage', url = 'https://www.bg-wiki.com/ffxi/Black_Mage' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Utsusemi: Ichi', url = 'https://www.bg-wiki.com/ffxi/Utsusemi:_Ichi' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Ni', url = 'https://www.bg-wiki.com/ffxi/Utsusemi:_Ni' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'San,', url = 'https://www.bg-wiki.com/ffxi/Utsusemi:_San' },
+                { type = 'link', text = 'Elemental Ninjutsu (San),', url = 'https://www.bg-wiki.com/ffxi/Category:Ninjutsu#Elemental_Ninjutsu' },
+                { type = 'link', text = 'Single-target elemental nukes I,', url = 'https://www.bg-wiki.com/ffxi/Category:Elemental_Magic' },
+                { type = 'link', text = 'Burn,', url = 'https://www.bg-wiki.com/ffxi/Category:Elemental_Debuff' },
+                { type = 'link', text = 'Migawari: Ichi,', url = 'https://www.bg-wiki.com/ffxi/Migawari:_Ichi' },
+                { type = 'link', text = 'Kakka: Ichi,', url = 'https://www.bg-wiki.com/ffxi/Kakka:_Ichi' },
+                { type = 'link', text = 'Myoshu: Ichi,', url = 'https://www.bg-wiki.com/ffxi/Myoshu:_Ichi' },
+                { type = 'link', text = 'Yurin: Ichi,', url = 'https://www.bg-wiki.com/ffxi/Yurin:_Ichi' },
+                { type = 'link', text = 'Aisha: Ichi,', url = 'https://www.bg-wiki.com/ffxi/Aisha:_Ichi' },
+                { type = 'link', text = 'Aspir,', url = 'https://www.bg-wiki.com/ffxi/Aspir' },
+                { type = 'link', text = 'Stun', url = 'https://www.bg-wiki.com/ffxi/Stun' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Innin,', url = 'https://www.bg-wiki.com/ffxi/Innin' },
+                { type = 'link', text = 'Sange,', url = 'https://www.bg-wiki.com/ffxi/Sange' },
+                { type = 'link', text = 'Elemental Seal,', url = 'https://www.bg-wiki.com/ffxi/Elemental_Seal' },
+                { type = 'link', text = 'Futae,', url = 'https://www.bg-wiki.com/ffxi/Futae' },
+                { type = 'link', text = 'Mana Wall', url = 'https://www.bg-wiki.com/ffxi/Mana_Wall' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'text', value = '(1)' },
+                { type = 'link', text = 'Blade: Rin', url = 'https://www.bg-wiki.com/ffxi/Blade:_Rin' },
+                { type = 'skillchain', value = 'Transfixion' },
+                { type = 'text', value = ', (9)' },
+                { type = 'link', text = 'Blade: Retsu', url = 'https://www.bg-wiki.com/ffxi/Blade:_Retsu' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ', (55)' },
+                { type = 'link', text = 'Blade: Ei', url = 'https://www.bg-wiki.com/ffxi/Blade:_Ei' },
+                { type = 'skillchain', value = 'Compression' },
+                { type = 'text', value = ', (60)' },
+                { type = 'link', text = 'Blade: Jin', url = 'https://www.bg-wiki.com/ffxi/Blade:_Jin' },
+                { type = 'skillchain', value = 'Impaction' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Detonation' },
+                { type = 'text', value = ', (66)' },
+                { type = 'link', text = 'Blade: Ten', url = 'https://www.bg-wiki.com/ffxi/Blade:_Ten' },
+                { type = 'skillchain', value = 'Gravitation' },
+                { type = 'text', value = ', (72)' },
+                { type = 'link', text = 'Blade: Ku', url = 'https://www.bg-wiki.com/ffxi/Blade:_Ku' },
+                { type = 'skillchain', value = 'Gravitation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Transfixion' },
+                { type = 'text', value = ', (75)' },
+                { type = 'link', text = 'Blade: Kamu', url = 'https://www.bg-wiki.com/ffxi/Blade:_Kamu' },
+                { type = 'skillchain', value = 'Fragmentation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Compression' },
+                { type = 'text', value = ', (85)' },
+                { type = 'link', text = 'Blade: Hi', url = 'https://www.bg-wiki.com/ffxi/Blade:_Hi' },
+                { type = 'skillchain', value = 'Dark' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Gravitation' },
+                { type = 'text', value = ', (91)' },
+                { type = 'link', text = 'Blade: Shun', url = 'https://www.bg-wiki.com/ffxi/Blade:_Shun' },
+                { type = 'skillchain', value = 'Fusion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Impaction' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'If you have completed the quest' },
+                { type = 'link', text = 'Trust: Windurst,', url = 'https://www.bg-wiki.com/ffxi/Trust:_Windurst' },
+                { type = 'link', text = 'Trust: Bastok,', url = 'https://www.bg-wiki.com/ffxi/Trust:_Bastok' },
+                { type = 'text', value = 'or' },
+                { type = 'link', text = "Trust: San d'Oria,", url = 'https://www.bg-wiki.com/ffxi/Trust:_San_d%27Oria' },
+                { type = 'text', value = 'you will automatically obtain the alter ego upon logging in.' },
+            },
+            {
+                { type = 'text', value = 'No message will be displayed signifying that you have acquired the alter ego.' },
+            },
+            {
+                { type = 'text', value = 'If you have not completed the quest' },
+                { type = 'link', text = 'Trust: Windurst,', url = 'https://www.bg-wiki.com/ffxi/Trust:_Windurst' },
+                { type = 'link', text = 'Trust: Bastok,', url = 'https://www.bg-wiki.com/ffxi/Trust:_Bastok' },
+                { type = 'text', value = 'or' },
+                { type = 'link', text = "Trust: San d'Oria,", url = 'https://www.bg-wiki.com/ffxi/Trust:_San_d%27Oria' },
+                { type = 'text', value = 'you must first complete it and then relog or change areas.' },
+            },
+            {
+                { type = 'text', value = 'No message will be displayed signifying that you have acquired the alter ego. Matsui-P was/is only available during the following times: From December 2020 until May 2021. From November 2022 until May 2023. From March 2025 until September 2025.' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Prioritizes elemental ninjutsu and black magic spells.' },
+            },
+            {
+                { type = 'link', text = 'Magic bursts', url = 'https://www.bg-wiki.com/index.php?title=Magic_burst&amp;action=edit&amp;redlink=1' },
+                { type = 'text', value = 'skillchains with' },
+                { type = 'link', text = 'Ninjutsu', url = 'https://www.bg-wiki.com/ffxi/Category:Ninjutsu' },
+                { type = 'text', value = 'tier San and' },
+                { type = 'link', text = 'elemental magic', url = 'https://www.bg-wiki.com/ffxi/Category:Elemental_Magic' },
+                { type = 'text', value = 'tier I enhanced by' },
+                { type = 'link', text = 'Futae.', url = 'https://www.bg-wiki.com/ffxi/Futae' },
+            },
+            {
+                { type = 'text', value = 'Under specific conditions outlined below, uses weapon skills when the player reaches 1000 TP in order to open skillchains.' },
+            },
+            {
+                { type = 'text', value = 'Has callouts in party chat, making him easy to use.' },
+            },
+            {
+                { type = 'text', value = 'Announces when his TP is 1000.' },
+            },
+            {
+                { type = 'text', value = 'Before using a weapon skill, he will announce the skillchain property you can follow up with for a' },
+                { type = 'link', text = 'Light', url = 'https://www.bg-wiki.com/ffxi/Category:Light' },
+                { type = 'text', value = 'or' },
+                { type = 'link', text = 'Darkness', url = 'https://www.bg-wiki.com/ffxi/Darkness' },
+                { type = 'text', value = 'skillchain.' },
+            },
+            {
+                { type = 'text', value = 'You can see these callouts when the Chat Filter option for "Messages from alter egos" says OFF.' },
+            },
+            {
+                { type = 'text', value = 'Casts' },
+                { type = 'link', text = 'Burn', url = 'https://www.bg-wiki.com/ffxi/Burn' },
+                { type = 'text', value = 'to lower enemy' },
+                { type = 'link', text = 'INT', url = 'https://www.bg-wiki.com/ffxi/INT' },
+                { type = 'text', value = 'and prime them for' },
+                { type = 'link', text = 'Magical Damage.', url = 'https://www.bg-wiki.com/ffxi/Magic_Damage#D:_INT-adjusted_Base_Damage' },
+            },
+            {
+                { type = 'text', value = 'Casts' },
+                { type = 'link', text = 'Stun', url = 'https://www.bg-wiki.com/ffxi/Stun' },
+                { type = 'text', value = 'to interrupt enemy TP moves, and reduces' },
+                { type = 'link', text = 'monster TP gain', url = 'https://www.bg-wiki.com/ffxi/Monster_TP_gain' },
+                { type = 'text', value = 'with' },
+                { type = 'link', text = 'Myoshu.', url = 'https://www.bg-wiki.com/ffxi/Myoshu:_Ichi' },
+            },
+            {
+                { type = 'text', value = 'Generates TP rapidly with' },
+                { type = 'link', text = 'Daken,', url = 'https://www.bg-wiki.com/ffxi/Daken' },
+                { type = 'text', value = 'enhanced by' },
+                { type = 'link', text = 'Sange,', url = 'https://www.bg-wiki.com/ffxi/Sange' },
+                { type = 'text', value = 'though he often stops attacking to cast spells.' },
+            },
+            {
+                { type = 'text', value = 'High accuracy and damage for a trust.' },
+            },
+            {
+                { type = 'text', value = 'Prioritizes reapplying' },
+                { type = 'link', text = 'shadows', url = 'https://www.bg-wiki.com/ffxi/Category:Utsusemi' },
+                { type = 'text', value = "and doesn't perform weaponskills if shadows are removed." },
+            },
+            {
+                { type = 'text', value = 'Skillchains:' },
+            },
+            {
+                { type = 'text', value = 'Once the player uses a' },
+                { type = 'link', text = 'Weapon Skill', url = 'https://www.bg-wiki.com/ffxi/Weapon_Skill' },
+                { type = 'text', value = 'with' },
+                { type = 'link', text = 'Level 2 Skillchain Properties', url = 'https://www.bg-wiki.com/ffxi/Category:Skillchain#Level_2_Skillchains' },
+                { type = 'text', value = 'while Matsui-P is summoned, he will use weapon skills when the player has 1000 or more TP.' },
+            },
+            {
+                { type = 'text', value = 'He only starts skillchains that would create' },
+                { type = 'link', text = 'Light', url = 'https://www.bg-wiki.com/ffxi/Category:Light' },
+                { type = 'text', value = 'or' },
+                { type = 'link', text = 'Darkness', url = 'https://www.bg-wiki.com/ffxi/Darkness' },
+                { type = 'text', value = 'skillchains with the previously used weapon skill.' },
+            },
+            {
+                { type = 'text', value = 'He has no' },
+                { type = 'link', text = 'Distortion', url = 'https://www.bg-wiki.com/ffxi/Distortion' },
+                { type = 'text', value = 'weapon skills, so he has no reaction to players using' },
+                { type = 'link', text = 'Gravitation', url = 'https://www.bg-wiki.com/ffxi/Gravitation' },
+                { type = 'text', value = 'weapon skills.' },
+            },
+            {
+                { type = 'text', value = 'Holds TP until 3000 to open skillchains for the player. Uses a random weapon skill at 3000 TP if conditions are not met.' },
+            },
+            {
+                { type = 'text', value = [[Matsui-P's skills and behavior were decided by the winner of the "Alter Ego Design Campaign – One Venturous Tarutaru!" competition.]] },
+            },
+            {
+                { type = 'text', value = [[The development team made this comment on the contest entry: "This alter ego would be able deal lots of damage at once by using Ninjutsu to magic burst! Mana Wall doesn't seem possible due to the support job's level..."]] },
+            },
+            {
+                { type = 'text', value = 'SE stated that any equipment would be cosmetic.' },
+            },
+        },
+    },
+    ['Maximilian'] = {
+        name = 'Maximilian',
+        job = {
+            {
+                { type = 'link', text = 'Thief', url = 'https://www.bg-wiki.com/ffxi/Thief' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Ninja', url = 'https://www.bg-wiki.com/ffxi/Ninja' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Fast Blade', url = 'https://www.bg-wiki.com/ffxi/Fast_Blade' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Vorpal Blade', url = 'https://www.bg-wiki.com/ffxi/Vorpal_Blade' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Impaction' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Swift Blade', url = 'https://www.bg-wiki.com/ffxi/Swift_Blade' },
+                { type = 'skillchain', value = 'Gravitation' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Maximilian', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Maximilian' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Repeat Login Campaign', url = 'https://www.bg-wiki.com/ffxi/Repeat_Login_Campaign' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'link', text = 'Dual Wields', url = 'https://www.bg-wiki.com/ffxi/Dual_Wield' },
+                { type = 'text', value = 'swords.' },
+            },
+            {
+                { type = 'text', value = 'Possesses typical THF/NIN traits such as' },
+                { type = 'link', text = 'Treasure Hunter', url = 'https://www.bg-wiki.com/ffxi/Treasure_Hunter' },
+                { type = 'text', value = 'I,' },
+                { type = 'link', text = 'Dual Wield,', url = 'https://www.bg-wiki.com/ffxi/Dual_Wield' },
+                { type = 'link', text = 'Triple Attack.', url = 'https://www.bg-wiki.com/ffxi/Triple_Attack' },
+            },
+            {
+                { type = 'text', value = 'Tries to open skillchains when the player reaches 1500 TP. Does not try to open skillchains with other trusts.' },
+            },
+            {
+                { type = 'text', value = 'The weapon skill he opens with is random.' },
+            },
+            {
+                { type = 'text', value = 'Will close skillchains with players and other trusts if possible, otherwise uses a weapon skill at 2500 TP.' },
+            },
+        },
+    },
+    ['Mayakov'] = {
+        name = 'Mayakov',
+        job = {
+            {
+                { type = 'link', text = 'Dancer', url = 'https://www.bg-wiki.com/ffxi/Dancer' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Warrior', url = 'https://www.bg-wiki.com/ffxi/Warrior' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Drain Samba I - III,', url = 'https://www.bg-wiki.com/ffxi/Drain_Samba' },
+                { type = 'link', text = 'Haste Samba,', url = 'https://www.bg-wiki.com/ffxi/Haste_Samba' },
+                { type = 'link', text = 'Feather Step,', url = 'https://www.bg-wiki.com/ffxi/Feather_Step' },
+                { type = 'link', text = 'Saber Dance,', url = 'https://www.bg-wiki.com/ffxi/Saber_Dance' },
+                { type = 'link', text = 'Climactic Flourish', url = 'https://www.bg-wiki.com/ffxi/Climactic_Flourish' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Coming Up Roses', url = 'https://www.bg-wiki.com/ffxi/Coming_Up_Roses' },
+                { type = 'skillchain', value = 'Light' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Fusion' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Fast Blade', url = 'https://www.bg-wiki.com/ffxi/Fast_Blade' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Swift Blade', url = 'https://www.bg-wiki.com/ffxi/Swift_Blade' },
+                { type = 'skillchain', value = 'Gravitation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Vorpal Blade', url = 'https://www.bg-wiki.com/ffxi/Vorpal_Blade' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Impaction' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Mayakov', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Mayakov' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Repeat Login Campaign', url = 'https://www.bg-wiki.com/ffxi/Repeat_Login_Campaign' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Red)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Red)' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses 5/5' },
+                { type = 'link', text = 'Haste Samba', url = 'https://www.bg-wiki.com/ffxi/Haste_Samba' },
+                { type = 'text', value = 'Effect merits (10% job ability Haste).' },
+            },
+            {
+                { type = 'text', value = 'Uses' },
+                { type = 'link', text = 'Saber Dance', url = 'https://www.bg-wiki.com/ffxi/Saber_Dance' },
+                { type = 'text', value = 'upon engaging and refreshes it as often as possible.' },
+            },
+            {
+                { type = 'text', value = 'Uses' },
+                { type = 'link', text = 'Haste Samba', url = 'https://www.bg-wiki.com/ffxi/Haste_Samba' },
+                { type = 'text', value = 'when another party member is on a main job with access to' },
+                { type = 'link', text = 'Cure', url = 'https://www.bg-wiki.com/ffxi/Cure' },
+                { type = 'text', value = '(WHM,RDM,SCH,PLD) or when the enemy is undead, otherwise uses' },
+                { type = 'link', text = 'Drain Samba.', url = 'https://www.bg-wiki.com/ffxi/Drain_Samba' },
+            },
+            {
+                { type = 'text', value = 'Debuffs enemies using' },
+                { type = 'link', text = 'Feather Step', url = 'https://www.bg-wiki.com/ffxi/Feather_Step' },
+                { type = 'text', value = 'while building Finishing moves to perform' },
+                { type = 'link', text = 'Climactic Flourish.', url = 'https://www.bg-wiki.com/ffxi/Climactic_Flourish' },
+            },
+            {
+                { type = 'text', value = 'Tends not to weapon skill very frequently due to spending TP on Feather Step as often as possible.' },
+            },
+            {
+                { type = 'text', value = "Weapon skills more frequently once Feather Step's Daze reaches level 10; only occasionally using Feather Step to maintain the Daze effect." },
+            },
+            {
+                { type = 'text', value = 'If he has enough TP for a weapon skill, uses' },
+                { type = 'link', text = 'Climactic Flourish', url = 'https://www.bg-wiki.com/ffxi/Climactic_Flourish' },
+                { type = 'text', value = 'first.' },
+            },
+            {
+                { type = 'text', value = 'Holds up to 2000 TP to wait for Climactic Flourish recast: does not try to skillchain.' },
+            },
+        },
+    },
+    ['Mildaurion'] = {
+        name = 'Mildaurion',
+        job = {
+            {
+                { type = 'link', text = 'Paladin', url = 'https://www.bg-wiki.com/ffxi/Paladin' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Samurai', url = 'https://www.bg-wiki.com/ffxi/Samurai' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Light Blade', url = 'https://www.bg-wiki.com/index.php?title=Light_Blade&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Light' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Fusion' },
+                { type = 'text', value = '(Physical),' },
+                { type = 'link', text = 'Stellar Burst', url = 'https://www.bg-wiki.com/index.php?title=Stellar_Burst&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Dark' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Gravitation' },
+                { type = 'text', value = '(Magical),' },
+                { type = 'link', text = 'Great Wheel', url = 'https://www.bg-wiki.com/index.php?title=Great_Wheel&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Fragmentation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = '(Physical AoE + Knockback),' },
+                { type = 'link', text = 'Vortex', url = 'https://www.bg-wiki.com/index.php?title=Vortex&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Distortion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Reverberation' },
+                { type = 'text', value = '(Magical:Wind)' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Mildaurion', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Mildaurion' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Repeat Login Campaign', url = 'https://www.bg-wiki.com/ffxi/Repeat_Login_Campaign' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Red)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Red)' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = "Possesses MP+100% (but doesn't use MP)," },
+                { type = 'link', text = 'Double Attack.', url = 'https://www.bg-wiki.com/ffxi/Double_Attack' },
+            },
+            {
+                { type = 'text', value = 'Attacks with palm blasts that are blunt damage (tested on warder of temperance).' },
+            },
+            {
+                { type = 'text', value = "Her attacks and abilities are Zilartian themed: uses the fighting stance of the Mammets and weapon skills of Kam'lanaut and Eald'narche with some differences." },
+            },
+            {
+                { type = 'text', value = 'Tries to open skillchains when the player reaches 1500 TP. Does not try to open skillchains with other trusts.' },
+            },
+            {
+                { type = 'text', value = 'The weapon skill she opens with is random. Easy to skillchain with: all of her weapon skills have level 2 properties.' },
+            },
+            {
+                { type = 'text', value = 'Will close skillchains with players and other trusts if possible, otherwise uses a weapon skill at 3000 TP.' },
+            },
+        },
+    },
+    ['Morimar'] = {
+        name = 'Morimar',
+        job = {
+            {
+                { type = 'link', text = 'Beastmaster', url = 'https://www.bg-wiki.com/ffxi/Beastmaster' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Warrior', url = 'https://www.bg-wiki.com/ffxi/Warrior' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'text', value = 'Vehement Resolution' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = '12 Blades of Remorse', url = 'https://www.bg-wiki.com/ffxi/12_Blades_of_Remorse' },
+                { type = 'text', value = '(AoE)' },
+                { type = 'skillchain', value = 'Light' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Distortion' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Into the Light', url = 'https://www.bg-wiki.com/ffxi/Into_the_Light' },
+                { type = 'skillchain', value = 'Fusion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Impaction' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Arduous Decision', url = 'https://www.bg-wiki.com/ffxi/Arduous_Decision' },
+                { type = 'text', value = '(' },
+                { type = 'link', text = 'Silence', url = 'https://www.bg-wiki.com/ffxi/Silence' },
+                { type = 'text', value = ')' },
+                { type = 'skillchain', value = 'Fragmentation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Compression' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Camaraderie of the Crevasse', url = 'https://www.bg-wiki.com/ffxi/Camaraderie_of_the_Crevasse' },
+                { type = 'skillchain', value = 'Detonation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Impaction' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Morimar', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Morimar' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Repeat Login Campaign', url = 'https://www.bg-wiki.com/ffxi/Repeat_Login_Campaign' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses HP+10%' },
+            },
+            {
+                { type = 'text', value = "Vehement Resolution consumes Morimar's TP, fully heals him, erases his debuffs, and makes him glow. (3 minute cooldown)" },
+            },
+            {
+                { type = 'text', value = 'Morimar will not attempt to close skillchains in this glow-state and his next WS will be' },
+                { type = 'link', text = '12 Blades of Remorse', url = 'https://www.bg-wiki.com/ffxi/12_Blades_of_Remorse' },
+                { type = 'text', value = 'with 2000 TP.' },
+            },
+            {
+                { type = 'text', value = 'Since his attacks are special moves, he does not benefit from' },
+                { type = 'link', text = 'Sambas', url = 'https://www.bg-wiki.com/ffxi/Samba' },
+                { type = 'text', value = 'or' },
+                { type = 'link', text = 'Haste,', url = 'https://www.bg-wiki.com/ffxi/Haste' },
+                { type = 'text', value = 'but likewise is not affected by' },
+                { type = 'link', text = 'Slow', url = 'https://www.bg-wiki.com/ffxi/Slow' },
+                { type = 'text', value = 'or' },
+                { type = 'link', text = 'Spikes.', url = 'https://www.bg-wiki.com/ffxi/Spikes' },
+            },
+            {
+                { type = 'text', value = 'Saves up to 2000 TP waiting to close a skillchain.' },
+            },
+        },
+    },
+    ['Mumor'] = {
+        name = 'Mumor',
+        job = {
+            {
+                { type = 'link', text = 'Dancer', url = 'https://www.bg-wiki.com/ffxi/Dancer' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Warrior', url = 'https://www.bg-wiki.com/ffxi/Warrior' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Stutter Step,', url = 'https://www.bg-wiki.com/ffxi/Stutter_Step' },
+                { type = 'link', text = 'Haste Samba,', url = 'https://www.bg-wiki.com/ffxi/Haste_Samba' },
+                { type = 'link', text = 'Drain Samba', url = 'https://www.bg-wiki.com/ffxi/Drain_Samba' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'II', url = 'https://www.bg-wiki.com/ffxi/Drain_Samba_II' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'III,', url = 'https://www.bg-wiki.com/ffxi/Drain_Samba_III' },
+                { type = 'link', text = 'Saber Dance,', url = 'https://www.bg-wiki.com/ffxi/Saber_Dance' },
+                { type = 'link', text = 'Violent Flourish', url = 'https://www.bg-wiki.com/ffxi/Violent_Flourish' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Skullbreaker', url = 'https://www.bg-wiki.com/ffxi/Skullbreaker' },
+                { type = 'skillchain', value = 'Induration' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Reverberation' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Mumor', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Mumor' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Sunbreeze Festival', url = 'https://www.bg-wiki.com/ffxi/Sunbreeze_Festival' },
+            },
+            {
+                { type = 'text', value = "Fully finish Fantastic Fraulein Mumor: Dynamic Dopplegangers twice, wearing this year's garments the second time, and talk with a Moogle at:" },
+                { type = 'link', text = "Northern San d'Oria", url = 'https://www.bg-wiki.com/ffxi/Northern_San_d%27Oria' },
+                { type = 'text', value = '(G-8) /' },
+                { type = 'link', text = 'Bastok Markets', url = 'https://www.bg-wiki.com/ffxi/Bastok_Markets' },
+                { type = 'text', value = '(I-7) /' },
+                { type = 'link', text = 'Windurst Walls', url = 'https://www.bg-wiki.com/ffxi/Windurst_Walls' },
+                { type = 'text', value = '(G-11). You will obtain the Trust spell automatically during the cutscene.' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Always uses' },
+                { type = 'link', text = 'Saber Dance', url = 'https://www.bg-wiki.com/ffxi/Saber_Dance' },
+                { type = 'text', value = 'and does not use waltzes.' },
+            },
+            {
+                { type = 'text', value = 'Will attempt to use' },
+                { type = 'link', text = 'Violent Flourish', url = 'https://www.bg-wiki.com/ffxi/Violent_Flourish' },
+                { type = 'text', value = 'to stun TP moves.' },
+            },
+            {
+                { type = 'text', value = 'Once' },
+                { type = 'link', text = 'Stutter Step', url = 'https://www.bg-wiki.com/ffxi/Stutter_Step' },
+                { type = 'text', value = "is at daze lv.5, only re-applies it when it's <10s from expiring." },
+            },
+            {
+                { type = 'text', value = 'Uses' },
+                { type = 'link', text = 'Skullbreaker', url = 'https://www.bg-wiki.com/ffxi/Skullbreaker' },
+                { type = 'text', value = 'when at 1000 TP.' },
+            },
+            {
+                { type = 'text', value = 'Uses' },
+                { type = 'link', text = 'Haste Samba', url = 'https://www.bg-wiki.com/ffxi/Haste_Samba' },
+                { type = 'text', value = 'when another party member is on a main job with access to' },
+                { type = 'link', text = 'Cure', url = 'https://www.bg-wiki.com/ffxi/Cure' },
+                { type = 'text', value = '(WHM,RDM,SCH,PLD) or when the enemy is undead, otherwise uses' },
+                { type = 'link', text = 'Drain Samba.', url = 'https://www.bg-wiki.com/ffxi/Drain_Samba' },
+            },
+        },
+    },
+    ['Naja Salaheem'] = {
+        name = 'Naja Salaheem',
+        job = {
+            {
+                { type = 'link', text = 'Monk', url = 'https://www.bg-wiki.com/ffxi/Monk' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Warrior', url = 'https://www.bg-wiki.com/ffxi/Warrior' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Focus,', url = 'https://www.bg-wiki.com/ffxi/Focus' },
+                { type = 'link', text = 'Dodge,', url = 'https://www.bg-wiki.com/ffxi/Dodge' },
+                { type = 'link', text = 'Counterstance', url = 'https://www.bg-wiki.com/ffxi/Counterstance' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'True Strike', url = 'https://www.bg-wiki.com/ffxi/True_Strike' },
+                { type = 'skillchain', value = 'Detonation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Impaction' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Black Halo', url = 'https://www.bg-wiki.com/ffxi/Black_Halo' },
+                { type = 'skillchain', value = 'Fragmentation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Compression' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Hexa Strike', url = 'https://www.bg-wiki.com/ffxi/Hexa_Strike' },
+                { type = 'skillchain', value = 'Fusion' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Peacebreaker', url = 'https://www.bg-wiki.com/ffxi/Peacebreaker' },
+                { type = 'skillchain', value = 'Distortion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Reverberation' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Naja', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Naja' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Repeat Login Campaign', url = 'https://www.bg-wiki.com/ffxi/Repeat_Login_Campaign' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Red)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Red)' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Peacebreaker is a single-target, low damage weaponskill with an additional effect of 20%' },
+                { type = 'link', text = 'Defense Down', url = 'https://www.bg-wiki.com/ffxi/Defense_Down' },
+                { type = 'text', value = 'and 20%' },
+                { type = 'link', text = 'Magic Defense Down', url = 'https://www.bg-wiki.com/ffxi/Magic_Defense_Down' },
+                { type = 'text', value = '(lasts up to 30s).' },
+            },
+            {
+                { type = 'text', value = 'Naja gains 100 TP per Hit.' },
+            },
+            {
+                { type = 'text', value = 'Uses weapon skills at 1000 TP.' },
+            },
+        },
+    },
+    ['Naja Salaheem (UC)'] = {
+        name = 'Naja Salaheem (UC)',
+        job = {
+            {
+                { type = 'link', text = 'Monk', url = 'https://www.bg-wiki.com/ffxi/Monk' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Warrior', url = 'https://www.bg-wiki.com/ffxi/Warrior' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'text', value = '(5)' },
+                { type = 'link', text = 'Peacebreaker', url = 'https://www.bg-wiki.com/ffxi/Peacebreaker' },
+                { type = 'skillchain', value = 'Distortion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Reverberation' },
+                { type = 'text', value = ', (25)' },
+                { type = 'link', text = 'Hexa Strike', url = 'https://www.bg-wiki.com/ffxi/Hexa_Strike' },
+                { type = 'skillchain', value = 'Fusion' },
+                { type = 'text', value = ', (50)' },
+                { type = 'link', text = 'Nott', url = 'https://www.bg-wiki.com/ffxi/Nott' },
+                { type = 'skillchain', value = 'Status_Ability' },
+                { type = 'text', value = ', (60)' },
+                { type = 'link', text = 'Black Halo', url = 'https://www.bg-wiki.com/ffxi/Black_Halo' },
+                { type = 'skillchain', value = 'Fragmentation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Compression' },
+                { type = 'text', value = ', (70)' },
+                { type = 'link', text = 'Justicebreaker', url = 'https://www.bg-wiki.com/ffxi/Justicebreaker' },
+                { type = 'skillchain', value = 'Dark' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Gravitation' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Be a member of the Naja Salaheem Unity Concord.' },
+            },
+            {
+                { type = 'text', value = 'Obtain 5000 Unity Accolades through' },
+                { type = 'link', text = 'Records of Eminence', url = 'https://www.bg-wiki.com/ffxi/Records_of_Eminence' },
+                { type = 'text', value = 'objectives for a Partial Personal Evaluation of 5pt.' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses' },
+                { type = 'link', text = 'Quadruple Attack,', url = 'https://www.bg-wiki.com/ffxi/Quadruple_Attack' },
+                { type = 'link', text = 'Triple Attack,', url = 'https://www.bg-wiki.com/ffxi/Triple_Attack' },
+                { type = 'link', text = 'Store TP,', url = 'https://www.bg-wiki.com/ffxi/Store_TP' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = 'Gilfinder', url = 'https://www.bg-wiki.com/ffxi/Gilfinder' },
+                { type = 'text', value = 'traits.' },
+            },
+            {
+                { type = 'text', value = 'On summoning will pick a club weapon skill from her list and use that exclusively, re-summoning her will randomize the choice of weapon skill again, in this way you can "pick" her weapon skill.' },
+            },
+            {
+                { type = 'text', value = '200 TP per hit.' },
+            },
+            {
+                { type = 'text', value = 'Uses weapon skills when another party member has 1000 TP, otherwise holds TP indefinitely.' },
+            },
+            {
+                { type = 'text', value = 'Her' },
+                { type = 'link', text = 'Multi-Attack', url = 'https://www.bg-wiki.com/ffxi/Multi-Attack' },
+                { type = 'text', value = 'rate is very high: can a great skillchain partner for other trusts or yourself.' },
+            },
+            {
+                { type = 'text', value = 'But the damage is low to balance out the number of swings, and you may worry about' },
+                { type = 'link', text = 'feeding TP (Monster TP Gain).', url = 'https://www.bg-wiki.com/ffxi/Monster_TP_Gain' },
+            },
+            {
+                { type = 'text', value = 'Peacebreaker applies a 20%' },
+                { type = 'link', text = 'Defense Down', url = 'https://www.bg-wiki.com/ffxi/Defense_Down' },
+                { type = 'text', value = 'and 20%' },
+                { type = 'link', text = 'Magic Defense Down', url = 'https://www.bg-wiki.com/ffxi/Magic_Defense_Down' },
+                { type = 'text', value = 'to the target for up to 30 seconds.' },
+            },
+            {
+                { type = 'text', value = 'Justicebreaker applies a 10%' },
+                { type = 'link', text = 'Defense Down', url = 'https://www.bg-wiki.com/ffxi/Defense_Down' },
+                { type = 'text', value = 'and 10%' },
+                { type = 'link', text = 'Magic Defense Down', url = 'https://www.bg-wiki.com/ffxi/Magic_Defense_Down' },
+                { type = 'text', value = 'to the target for up to 60 seconds.' },
+            },
+            {
+                { type = 'text', value = 'She has no MP so' },
+                { type = 'link', text = 'Nott', url = 'https://www.bg-wiki.com/ffxi/Nott' },
+                { type = 'text', value = 'only serves to restore her HP, which can make her very survivable if she has the required accuracy.' },
+            },
+            {
+                { type = 'text', value = "With another party member like Ajido-Marujido who builds but doesn't spend TP, you may get Naja to self-skillchain" },
+                { type = 'link', text = 'Darkness', url = 'https://www.bg-wiki.com/ffxi/Darkness' },
+                { type = 'text', value = 'with Justicebreaker.' },
+            },
+        },
+    },
+    ['Naji'] = {
+        name = 'Naji',
+        job = {
+            {
+                { type = 'link', text = 'Warrior', url = 'https://www.bg-wiki.com/ffxi/Warrior' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Warrior', url = 'https://www.bg-wiki.com/ffxi/Warrior' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Provoke', url = 'https://www.bg-wiki.com/ffxi/Provoke' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Burning Blade', url = 'https://www.bg-wiki.com/ffxi/Burning_Blade' },
+                { type = 'skillchain', value = 'Liquefaction' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Red Lotus Blade', url = 'https://www.bg-wiki.com/ffxi/Red_Lotus_Blade' },
+                { type = 'skillchain', value = 'Liquefaction' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Detonation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Vorpal Blade', url = 'https://www.bg-wiki.com/ffxi/Vorpal_Blade' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Impaction' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Complete the initiation quest in' },
+                { type = 'link', text = 'Bastok.', url = 'https://www.bg-wiki.com/ffxi/Trust:_Bastok' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Uses weapon skills at 1000 TP, does not try to skillchain.' },
+            },
+            {
+                { type = 'link', text = 'Provokes', url = 'https://www.bg-wiki.com/ffxi/Provoke' },
+                { type = 'text', value = 'on cooldown.' },
+            },
+        },
+    },
+    ['Nanaa Mihgo'] = {
+        name = 'Nanaa Mihgo',
+        job = {
+            {
+                { type = 'link', text = 'Thief', url = 'https://www.bg-wiki.com/ffxi/Thief' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Thief', url = 'https://www.bg-wiki.com/ffxi/Thief' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Despoil', url = 'https://www.bg-wiki.com/ffxi/Despoil' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Wasp Sting', url = 'https://www.bg-wiki.com/ffxi/Wasp_Sting' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Dancing Edge', url = 'https://www.bg-wiki.com/ffxi/Dancing_Edge' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Detonation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'King Cobra Clamp', url = 'https://www.bg-wiki.com/ffxi/King_Cobra_Clamp' },
+                { type = 'text', value = '(AoE)' },
+                { type = 'skillchain', value = 'Fragmentation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Distortion' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Complete the initiation quest in' },
+                { type = 'link', text = 'Windurst.', url = 'https://www.bg-wiki.com/ffxi/Trust:_Windurst' },
+            },
+            {
+                { type = 'text', value = 'Must be Rank 3 or higher in any nation.' },
+            },
+            {
+                { type = 'text', value = 'Complete' },
+                { type = 'link', text = "Mihgo's Amigo.", url = 'https://www.bg-wiki.com/ffxi/Mihgo%27s_Amigo' },
+            },
+            {
+                { type = 'text', value = 'After completing this quest, zone out and/or wait one game day. If you happen to pick up' },
+                { type = 'link', text = 'Rock Racketeer', url = 'https://www.bg-wiki.com/ffxi/Rock_Racketeer' },
+                { type = 'text', value = 'quest, then it means next visit to' },
+                { type = 'link', text = 'Nanaa Mihgo', url = 'https://www.bg-wiki.com/ffxi/Nanaa_Mihgo' },
+                { type = 'text', value = 'will be for the Trust of her.' },
+            },
+            {
+                { type = 'text', value = 'Speak with' },
+                { type = 'link', text = 'Nanaa Mihgo', url = 'https://www.bg-wiki.com/ffxi/Nanaa_Mihgo' },
+                { type = 'text', value = 'in' },
+                { type = 'link', text = 'Windurst Woods', url = 'https://www.bg-wiki.com/ffxi/Windurst_Woods' },
+                { type = 'text', value = 'at (J-3).' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses' },
+                { type = 'link', text = 'Treasure Hunter I', url = 'https://www.bg-wiki.com/ffxi/Treasure_Hunter' },
+            },
+            {
+                { type = 'text', value = 'King Cobra Clamp stuns the target(s).' },
+            },
+            {
+                { type = 'link', text = 'Despoil', url = 'https://www.bg-wiki.com/ffxi/Despoil' },
+                { type = 'text', value = "places the stolen item in the summoner's inventory." },
+            },
+            {
+                { type = 'text', value = 'Can be resummoned to reset the' },
+                { type = 'link', text = 'Despoil', url = 'https://www.bg-wiki.com/ffxi/Despoil' },
+                { type = 'text', value = 'timer (5 minutes) after use.' },
+            },
+            {
+                { type = 'text', value = 'Uses TP as soon as she gets it.' },
+            },
+        },
+    },
+    ['Nashmeira'] = {
+        name = 'Nashmeira',
+        job = {
+            {
+                { type = 'link', text = 'Puppetmaster', url = 'https://www.bg-wiki.com/ffxi/Puppetmaster' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'White Mage', url = 'https://www.bg-wiki.com/ffxi/White_Mage' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = '-na spells,', url = 'https://www.bg-wiki.com/ffxi/Category:-na_Spell' },
+                { type = 'link', text = 'Cure I - IV', url = 'https://www.bg-wiki.com/ffxi/Category:Cure_Spell' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Imperial Authority', url = 'https://www.bg-wiki.com/ffxi/Imperial_Authority' },
+                { type = 'text', value = '(' },
+                { type = 'link', text = 'Stun', url = 'https://www.bg-wiki.com/ffxi/Stun' },
+                { type = 'text', value = ')' },
+                { type = 'skillchain', value = 'Fragmentation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Distortion' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Complete' },
+                { type = 'link', text = 'Eternal Mercenary.', url = 'https://www.bg-wiki.com/ffxi/Aht_Urhgan_Mission_48' },
+            },
+            {
+                { type = 'text', value = 'Examine the' },
+                { type = 'link', text = 'Imperial Whitegate', url = 'https://www.bg-wiki.com/ffxi/Imperial_Whitegate' },
+                { type = 'text', value = 'in' },
+                { type = 'link', text = 'Aht Urhgan Whitegate', url = 'https://www.bg-wiki.com/ffxi/Aht_Urhgan_Whitegate' },
+                { type = 'text', value = '(L-9).' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses MP+70%' },
+            },
+            {
+                { type = 'text', value = 'Uses' },
+                { type = 'link', text = 'Imperial Authority', url = 'https://www.bg-wiki.com/ffxi/Imperial_Authority' },
+                { type = 'text', value = 'at 1000 TP.' },
+            },
+            {
+                { type = 'text', value = 'Casts' },
+                { type = 'link', text = 'Cure', url = 'https://www.bg-wiki.com/ffxi/Category:Cure_Spell' },
+                { type = 'text', value = 'on party members at low HP (<33%).' },
+            },
+        },
+    },
+    ['Noillurie'] = {
+        name = 'Noillurie',
+        job = {
+            {
+                { type = 'link', text = 'Samurai', url = 'https://www.bg-wiki.com/ffxi/Samurai' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Paladin', url = 'https://www.bg-wiki.com/ffxi/Paladin' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Cure I - IV', url = 'https://www.bg-wiki.com/ffxi/Category:Cure_Spell' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Hasso,', url = 'https://www.bg-wiki.com/ffxi/Hasso' },
+                { type = 'link', text = 'Third Eye,', url = 'https://www.bg-wiki.com/ffxi/Third_Eye' },
+                { type = 'link', text = 'Meditate,', url = 'https://www.bg-wiki.com/ffxi/Meditate' },
+                { type = 'link', text = 'Sekkanoki', url = 'https://www.bg-wiki.com/ffxi/Sekkanoki' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Tachi: Jinpu', url = 'https://www.bg-wiki.com/ffxi/Tachi:_Jinpu' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Detonation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Tachi: Yukikaze', url = 'https://www.bg-wiki.com/ffxi/Tachi:_Yukikaze' },
+                { type = 'skillchain', value = 'Induration' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Detonation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Tachi: Gekko', url = 'https://www.bg-wiki.com/ffxi/Tachi:_Gekko' },
+                { type = 'skillchain', value = 'Distortion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Reverberation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Tachi: Kasha', url = 'https://www.bg-wiki.com/ffxi/Tachi:_Kasha' },
+                { type = 'skillchain', value = 'Fusion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Compression' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Tachi: Kaiten', url = 'https://www.bg-wiki.com/ffxi/Tachi:_Kaiten' },
+                { type = 'skillchain', value = 'Light' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Fragmentation' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Noillurie', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Noillurie' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Repeat Login Campaign', url = 'https://www.bg-wiki.com/ffxi/Repeat_Login_Campaign' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses MP+65%' },
+            },
+            {
+                { type = 'text', value = 'Favors' },
+                { type = 'link', text = 'Tachi: Kaiten,', url = 'https://www.bg-wiki.com/ffxi/Tachi:_Kaiten' },
+                { type = 'text', value = 'but will use other weapon skills to close' },
+                { type = 'link', text = 'Skillchain', url = 'https://www.bg-wiki.com/ffxi/Skillchain' },
+                { type = 'text', value = '(However, she favors opening skillchains most times).' },
+            },
+            {
+                { type = 'text', value = 'Noilluie will perform' },
+                { type = 'link', text = 'Tachi: Kaiten', url = 'https://www.bg-wiki.com/ffxi/Tachi:_Kaiten' },
+                { type = 'text', value = 'on an existing' },
+                { type = 'link', text = 'Light', url = 'https://www.bg-wiki.com/ffxi/Light' },
+                { type = 'text', value = 'skillchain in order to create a double' },
+                { type = 'link', text = 'Light', url = 'https://www.bg-wiki.com/ffxi/Light' },
+                { type = 'text', value = 'skillchain (She can accomplish this even if she opened the initial skillchain thanks to her high rate of TP gain).' },
+            },
+            {
+                { type = 'text', value = 'Will attempt to perform a 4-step double' },
+                { type = 'link', text = 'Light', url = 'https://www.bg-wiki.com/ffxi/Light' },
+                { type = 'text', value = 'self-skillchain based on' },
+                { type = 'link', text = 'Sekkanoki', url = 'https://www.bg-wiki.com/ffxi/Sekkanoki' },
+                { type = 'text', value = 'recast:' },
+            },
+            {
+                { type = 'link', text = 'Tachi: Yukikaze', url = 'https://www.bg-wiki.com/ffxi/Tachi:_Yukikaze' },
+                { type = 'text', value = '>' },
+                { type = 'link', text = 'Tachi: Gekko', url = 'https://www.bg-wiki.com/ffxi/Tachi:_Gekko' },
+                { type = 'text', value = '>' },
+                { type = 'link', text = 'Tachi: Kasha', url = 'https://www.bg-wiki.com/ffxi/Tachi:_Kasha' },
+                { type = 'text', value = '>' },
+                { type = 'link', text = 'Tachi: Kaiten', url = 'https://www.bg-wiki.com/ffxi/Tachi:_Kaiten' },
+            },
+            {
+                { type = 'text', value = 'When' },
+                { type = 'link', text = 'Sekkanoki', url = 'https://www.bg-wiki.com/ffxi/Sekkanoki' },
+                { type = 'text', value = 'is on cooldown, uses weapon skills at 1000 TP.' },
+            },
+            {
+                { type = 'text', value = 'Uses' },
+                { type = 'link', text = 'Cure', url = 'https://www.bg-wiki.com/ffxi/Category:Cure_Spell' },
+                { type = 'text', value = 'spells on party members <50% HP or asleep.' },
+            },
+            {
+                { type = 'text', value = 'Learns her weapon skills at low levels: has' },
+                { type = 'link', text = 'Tachi: Jinpu', url = 'https://www.bg-wiki.com/ffxi/Tachi:_Jinpu' },
+                { type = 'text', value = 'by level 30 or earlier,' },
+                { type = 'link', text = 'Tachi: Kaiten', url = 'https://www.bg-wiki.com/ffxi/Tachi:_Kaiten' },
+                { type = 'text', value = 'by level 50.' },
+            },
+        },
+    },
+    ['Prishe'] = {
+        name = 'Prishe',
+        job = {
+            {
+                { type = 'link', text = 'Monk', url = 'https://www.bg-wiki.com/ffxi/Monk' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'White Mage', url = 'https://www.bg-wiki.com/ffxi/White_Mage' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Cure I - IV', url = 'https://www.bg-wiki.com/ffxi/Category:Cure_Spell' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Knuckle Sandwich', url = 'https://www.bg-wiki.com/ffxi/Knuckle_Sandwich' },
+                { type = 'text', value = '( damage)' },
+                { type = 'skillchain', value = 'Fusion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Compression' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Nullifying Dropkick', url = 'https://www.bg-wiki.com/ffxi/Nullifying_Dropkick' },
+                { type = 'skillchain', value = 'Induration' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Detonation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Impaction' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Auroral Uppercut', url = 'https://www.bg-wiki.com/ffxi/Auroral_Uppercut' },
+                { type = 'text', value = '( damage)' },
+                { type = 'skillchain', value = 'Light' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Fragmentation' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Complete' },
+                { type = 'link', text = 'Dawn,', url = 'https://www.bg-wiki.com/ffxi/Promathia_Mission_8-4' },
+                { type = 'text', value = 'including the final cutscene in' },
+                { type = 'link', text = 'Lufaise Meadows.', url = 'https://www.bg-wiki.com/ffxi/Lufaise_Meadows' },
+            },
+            {
+                { type = 'text', value = 'Examine the Walnut Door in' },
+                { type = 'link', text = 'Tavnazian Safehold', url = 'https://www.bg-wiki.com/ffxi/Tavnazian_Safehold' },
+                { type = 'text', value = '(K-7, Top floor). Players will be unable to receive the alter ego if the quests' },
+                { type = 'link', text = 'Storms of Fate', url = 'https://www.bg-wiki.com/ffxi/Storms_of_Fate' },
+                { type = 'text', value = 'or' },
+                { type = 'link', text = 'Shadows of the Departed', url = 'https://www.bg-wiki.com/ffxi/Shadows_of_the_Departed' },
+                { type = 'text', value = 'are in progress or if' },
+                { type = 'link', text = 'Apocalypse Nigh', url = 'https://www.bg-wiki.com/ffxi/Apocalypse_Nigh' },
+                { type = 'text', value = 'is in progress and the event scene occurring in' },
+                { type = 'link', text = "Sealion's Den", url = 'https://www.bg-wiki.com/ffxi/Sealion%27s_Den' },
+                { type = 'text', value = [[is not completed. During the scene where you acquire her trust, she will ask if you've "...been to see her yet?" regarding Ulmia. Assuming that Ulmia is not a pre-requisite for getting Prishe's trust (), Prishe will have different dialogue depending on whether or not you've unlocked her already. If you have already unlocked]] },
+                { type = 'link', text = 'Ulmia,', url = 'https://www.bg-wiki.com/ffxi/BGWiki:Trusts#Ulmia' },
+                { type = 'text', value = [[she'll respond "You actually got her to go along with it!?" ..."Well done, pal!"]] },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses HP-5%, MP+75%' },
+            },
+            {
+                { type = 'text', value = 'Will only cast' },
+                { type = 'link', text = 'Cure', url = 'https://www.bg-wiki.com/ffxi/Category:Cure_Spell' },
+                { type = 'text', value = 'when a party member is at very low health.' },
+            },
+            {
+                { type = 'text', value = 'Uses TP as soon as she gets it.' },
+            },
+        },
+    },
+    ['Prishe II'] = {
+        name = 'Prishe II',
+        job = {
+            {
+                { type = 'link', text = 'White Mage', url = 'https://www.bg-wiki.com/ffxi/White_Mage' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Monk', url = 'https://www.bg-wiki.com/ffxi/Monk' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Curaga I - V', url = 'https://www.bg-wiki.com/ffxi/Curaga_V' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'text', value = 'Psychoanima, Hysteroanima' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Knuckle Sandwich', url = 'https://www.bg-wiki.com/ffxi/Knuckle_Sandwich' },
+                { type = 'text', value = '()' },
+                { type = 'skillchain', value = 'Fusion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Compression' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Nullifying Dropkick', url = 'https://www.bg-wiki.com/ffxi/Nullifying_Dropkick' },
+                { type = 'skillchain', value = 'Induration' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Detonation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Impaction' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Auroral Uppercut', url = 'https://www.bg-wiki.com/ffxi/Auroral_Uppercut' },
+                { type = 'text', value = '()' },
+                { type = 'skillchain', value = 'Light' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Fragmentation' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Prishe II', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Prishe_II' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'text', value = 'Complete' },
+                { type = 'link', text = 'Call to Serve.', url = 'https://www.bg-wiki.com/ffxi/Call_to_Serve' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses HP+10%, MP+10%' },
+            },
+            {
+                { type = 'text', value = 'Psychoanima : Prishe gains physical damage immunity for <5 seconds. Used when brought to low HP with a physical attack, only available once per summon.' },
+            },
+            {
+                { type = 'text', value = 'Hysteroanima : Prishe gains magical damage immunity for <5 seconds. Used preemptively in response to her target starting to cast a high-tier damaging AoE spell, only available once per summon.' },
+            },
+            {
+                { type = 'text', value = 'Log will read "Prishe resists the effects of the spell!"' },
+            },
+            {
+                { type = 'text', value = 'Prishe will cast' },
+                { type = 'link', text = 'Curaga', url = 'https://www.bg-wiki.com/ffxi/Curaga' },
+                { type = 'text', value = 'spells to wake up any players/trusts affected by sleep or when players are in critical HP.' },
+            },
+            {
+                { type = 'text', value = 'Uses TP as soon as she gets it.' },
+            },
+            {
+                { type = 'text', value = 'Does damage equivalent to a melee fighter trust, but as a WHM it may be difficult to get support spells like Haste II.' },
+            },
+        },
+    },
+    ['Rainemard'] = {
+        name = 'Rainemard',
+        job = {
+            {
+                { type = 'link', text = 'Red Mage', url = 'https://www.bg-wiki.com/ffxi/Red_Mage' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Paladin', url = 'https://www.bg-wiki.com/ffxi/Paladin' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Enspells,', url = 'https://www.bg-wiki.com/ffxi/Category:Enspell' },
+                { type = 'link', text = 'Haste', url = 'https://www.bg-wiki.com/ffxi/Haste' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'II,', url = 'https://www.bg-wiki.com/ffxi/Haste_II' },
+                { type = 'link', text = 'Distract', url = 'https://www.bg-wiki.com/ffxi/Distract' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'II,', url = 'https://www.bg-wiki.com/ffxi/Distract_II' },
+                { type = 'link', text = 'Frazzle', url = 'https://www.bg-wiki.com/ffxi/Frazzle' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'II,', url = 'https://www.bg-wiki.com/ffxi/Frazzle_II' },
+                { type = 'link', text = 'Phalanx', url = 'https://www.bg-wiki.com/ffxi/Phalanx' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'II,', url = 'https://www.bg-wiki.com/ffxi/Phalanx_II' },
+                { type = 'link', text = 'Protect I - V,', url = 'https://www.bg-wiki.com/ffxi/Category:Protect_Spell' },
+                { type = 'link', text = 'Shell I - V,', url = 'https://www.bg-wiki.com/ffxi/Category:Shell_Spell' },
+                { type = 'link', text = 'Refresh', url = 'https://www.bg-wiki.com/ffxi/Refresh' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Composure', url = 'https://www.bg-wiki.com/ffxi/Composure' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Burning Blade', url = 'https://www.bg-wiki.com/ffxi/Burning_Blade' },
+                { type = 'skillchain', value = 'Liquefaction' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Red Lotus Blade', url = 'https://www.bg-wiki.com/ffxi/Red_Lotus_Blade' },
+                { type = 'skillchain', value = 'Liquefaction' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Detonation' },
+                { type = 'link', text = 'Vorpal Blade', url = 'https://www.bg-wiki.com/ffxi/Vorpal_Blade' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Impaction' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Savage Blade', url = 'https://www.bg-wiki.com/ffxi/Savage_Blade' },
+                { type = 'skillchain', value = 'Fragmentation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Scission' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Rainemard', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Rainemard' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'text', value = 'Be in possession of the' },
+                { type = 'link', text = 'Bundle of scrolls', url = 'https://www.bg-wiki.com/ffxi/Bundle_of_scrolls' },
+                { type = 'text', value = 'key item.' },
+            },
+            {
+                { type = 'text', value = 'Speak with' },
+                { type = 'link', text = 'Shanene', url = 'https://www.bg-wiki.com/ffxi/Shanene' },
+                { type = 'text', value = 'in' },
+                { type = 'link', text = 'Batallia Downs (S)', url = 'https://www.bg-wiki.com/ffxi/Batallia_Downs_(S)' },
+                { type = 'text', value = '(J/I-7).' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Will only cast' },
+                { type = 'link', text = 'Haste II', url = 'https://www.bg-wiki.com/ffxi/Haste_II' },
+                { type = 'text', value = 'and other enhancing magic spells on himself.' },
+            },
+            {
+                { type = 'text', value = 'Casts' },
+                { type = 'link', text = 'Enspells', url = 'https://www.bg-wiki.com/ffxi/Enspell' },
+                { type = 'text', value = "on himself based on the enemy's weaknesses (Note: he may change his Enspell each time he engages with a different enemy family)." },
+            },
+            {
+                { type = 'text', value = "Rainemard's" },
+                { type = 'link', text = 'Enspells', url = 'https://www.bg-wiki.com/ffxi/Enspell' },
+                { type = 'text', value = 'are extremely powerful: capable of dealing 50-350+ damage depending on his level/ilevel and stat buffs (MAB, etc).' },
+            },
+            {
+                { type = 'text', value = 'Casts' },
+                { type = 'link', text = 'Refresh', url = 'https://www.bg-wiki.com/ffxi/Refresh' },
+                { type = 'text', value = 'when he falls below 50% MP.' },
+            },
+        },
+    },
+    ['Romaa Mihgo'] = {
+        name = 'Romaa Mihgo',
+        job = {
+            {
+                { type = 'link', text = 'Thief', url = 'https://www.bg-wiki.com/ffxi/Thief' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Warrior', url = 'https://www.bg-wiki.com/ffxi/Warrior' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Feint,', url = 'https://www.bg-wiki.com/ffxi/Feint' },
+                { type = 'link', text = 'Aura Steal,', url = 'https://www.bg-wiki.com/ffxi/Aura_Steal' },
+                { type = 'link', text = 'Sneak Attack,', url = 'https://www.bg-wiki.com/ffxi/Sneak_Attack' },
+                { type = 'link', text = 'Trick Attack', url = 'https://www.bg-wiki.com/ffxi/Trick_Attack' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Fast Blade', url = 'https://www.bg-wiki.com/ffxi/Fast_Blade' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Vorpal Blade', url = 'https://www.bg-wiki.com/ffxi/Vorpal_Blade' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Impaction' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Savage Blade', url = 'https://www.bg-wiki.com/ffxi/Savage_Blade' },
+                { type = 'skillchain', value = 'Fragmentation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Cobra Clamp', url = 'https://www.bg-wiki.com/ffxi/Cobra_Clamp' },
+                { type = 'text', value = '(Conal AoE, Stun, Paralyze)' },
+                { type = 'skillchain', value = 'Fragmentation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Distortion' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Notice: Acquiring this trust is a long process of 12 quests of which a few have "a game day of waiting" between them. Setting aside a good amount of time is advised to see this done. The starting quest =' },
+                { type = 'link', text = 'The Tigress Stirs', url = 'https://www.bg-wiki.com/ffxi/The_Tigress_Stirs' },
+                { type = 'text', value = "and you don't need to be allied to" },
+                { type = 'link', text = 'Windurst (S)', url = 'https://www.bg-wiki.com/index.php?title=Windurst_(S)&amp;action=edit&amp;redlink=1' },
+                { type = 'text', value = 'in order to start or obtain this trust.' },
+            },
+            {
+                { type = 'text', value = 'Be in possession of the' },
+                { type = 'link', text = 'Bundle of scrolls', url = 'https://www.bg-wiki.com/ffxi/Bundle_of_scrolls' },
+                { type = 'text', value = 'key item.' },
+            },
+            {
+                { type = 'text', value = 'Complete' },
+                { type = 'link', text = "At Journey's End.", url = 'https://www.bg-wiki.com/ffxi/At_Journey%27s_End' },
+            },
+            {
+                { type = 'text', value = 'Speak with' },
+                { type = 'link', text = 'Romaa Mihgo', url = 'https://www.bg-wiki.com/ffxi/Romaa_Mihgo' },
+                { type = 'text', value = 'in' },
+                { type = 'link', text = 'Windurst Waters (S)', url = 'https://www.bg-wiki.com/ffxi/Windurst_Waters_(S)' },
+                { type = 'text', value = '(G-11).' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Will use' },
+                { type = 'link', text = 'Aura Steal', url = 'https://www.bg-wiki.com/ffxi/Aura_Steal' },
+                { type = 'text', value = 'to take buffs off mobs. This can' },
+                { type = 'link', text = 'Steal', url = 'https://www.bg-wiki.com/ffxi/Steal' },
+                { type = 'text', value = "items also, which will be added to the player's inventory." },
+            },
+            {
+                { type = 'text', value = 'Will only use' },
+                { type = 'link', text = 'Trick Attack', url = 'https://www.bg-wiki.com/ffxi/Trick_Attack' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = 'Sneak Attack', url = 'https://www.bg-wiki.com/ffxi/Sneak_Attack' },
+                { type = 'text', value = 'when positioned correctly with the player, does not try to combine with weapon skills.' },
+            },
+            {
+                { type = 'text', value = 'Uses TP as soon as she gets it.' },
+            },
+        },
+    },
+    ['Rongelouts'] = {
+        name = 'Rongelouts',
+        job = {
+            {
+                { type = 'link', text = 'Warrior', url = 'https://www.bg-wiki.com/ffxi/Warrior' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Warrior', url = 'https://www.bg-wiki.com/ffxi/Warrior' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Berserk,', url = 'https://www.bg-wiki.com/ffxi/Berserk' },
+                { type = 'link', text = 'Aggressor,', url = 'https://www.bg-wiki.com/ffxi/Aggressor' },
+                { type = 'link', text = 'Warcry', url = 'https://www.bg-wiki.com/ffxi/Warcry' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Tongue Lash', url = 'https://www.bg-wiki.com/ffxi/Tongue_Lash' },
+                { type = 'text', value = '(AoE' },
+                { type = 'link', text = 'Terror', url = 'https://www.bg-wiki.com/ffxi/Terror' },
+                { type = 'text', value = ')' },
+                { type = 'skillchain', value = 'Status_Ability' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Red Lotus Blade', url = 'https://www.bg-wiki.com/ffxi/Red_Lotus_Blade' },
+                { type = 'skillchain', value = 'Liquefaction' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Detonation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Savage Blade', url = 'https://www.bg-wiki.com/ffxi/Savage_Blade' },
+                { type = 'skillchain', value = 'Fragmentation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Seraph Blade', url = 'https://www.bg-wiki.com/ffxi/Seraph_Blade' },
+                { type = 'skillchain', value = 'Scission' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Rongelouts', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Rongelouts' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Repeat Login Campaign', url = 'https://www.bg-wiki.com/ffxi/Repeat_Login_Campaign' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Red)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Red)' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses enhanced' },
+                { type = 'link', text = 'Warcry', url = 'https://www.bg-wiki.com/ffxi/Warcry' },
+                { type = 'text', value = 'duration (50 seconds)' },
+            },
+            {
+                { type = 'text', value = 'Has a unique' },
+                { type = 'link', text = 'Beastmen Killer', url = 'https://www.bg-wiki.com/ffxi/Beastmen_Killer' },
+                { type = 'text', value = 'trait.' },
+            },
+            {
+                { type = 'text', value = 'Gains 75 TP on hit.' },
+            },
+            {
+                { type = 'text', value = 'Uses TP as soon as he gets it.' },
+            },
+            {
+                { type = 'link', text = 'Tongue Lash', url = 'https://www.bg-wiki.com/ffxi/Tongue_Lash' },
+                { type = 'text', value = 'causes an AoE' },
+                { type = 'link', text = 'Terror', url = 'https://www.bg-wiki.com/ffxi/Terror' },
+                { type = 'text', value = 'effect. Seems to have a short duration (~2 seconds)' },
+            },
+        },
+    },
+    ["Selh'teus"] = {
+        name = "Selh'teus",
+        job = {
+            {
+                { type = 'link', text = 'Paladin', url = 'https://www.bg-wiki.com/ffxi/Paladin' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Samurai', url = 'https://www.bg-wiki.com/ffxi/Samurai' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Luminous Lance', url = 'https://www.bg-wiki.com/ffxi/Luminous_Lance' },
+                { type = 'skillchain', value = 'Light' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Fusion' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Rejuvenation', url = 'https://www.bg-wiki.com/ffxi/Rejuvenation' },
+                { type = 'text', value = '(HP+MP+TP restore)' },
+                { type = 'skillchain', value = 'Status_Ability' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Revelation', url = 'https://www.bg-wiki.com/ffxi/Revelation' },
+                { type = 'skillchain', value = 'Fusion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Transfixion' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = "Cipher: Selh'teus", url = 'https://www.bg-wiki.com/ffxi/Cipher:_Selh%27teus' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'text', value = 'Complete' },
+                { type = 'link', text = 'Call of the Void.', url = 'https://www.bg-wiki.com/ffxi/Call_of_the_Void' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = "Has 50 Regain. MP+100% (but doesn't use MP)." },
+            },
+            {
+                { type = 'text', value = 'Uses unique weaponskill' },
+                { type = 'link', text = 'Rejuvenation', url = 'https://www.bg-wiki.com/ffxi/Rejuvenation' },
+                { type = 'text', value = 'in response to the player taking a hit that depletes them to at least yellow HP or when the player is asleep. Restores HP, MP, TP to the entire party. Used every 30 seconds.' },
+            },
+            {
+                { type = 'text', value = 'Be aware that he will not move into range to engage in combat on his own; it is recommended to summon him early in your trust order to ensure he will be in range to attack.' },
+            },
+            {
+                { type = 'text', value = 'Holds TP until 3000 to try to close skillchains.' },
+            },
+            {
+                { type = 'text', value = 'Luminous Lance is a ranged weapon skill.' },
+            },
+            {
+                { type = 'text', value = 'Is treated as a Paladin: Does not use Paladin abilities, but impacts behavior of trust supports or off-tanks like Ark HM and behavior of certain enemies like' },
+                { type = 'link', text = 'Bozetto Necronura.', url = 'https://www.bg-wiki.com/ffxi/Ambuscade_Archive#Poroggo' },
+            },
+        },
+    },
+    ['Shikaree Z'] = {
+        name = 'Shikaree Z',
+        job = {
+            {
+                { type = 'link', text = 'Dragoon', url = 'https://www.bg-wiki.com/ffxi/Dragoon' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'White Mage', url = 'https://www.bg-wiki.com/ffxi/White_Mage' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Cure I - IV,', url = 'https://www.bg-wiki.com/ffxi/Category:Cure_Spell' },
+                { type = 'link', text = 'Haste,', url = 'https://www.bg-wiki.com/ffxi/Haste' },
+                { type = 'link', text = '-na Spells,', url = 'https://www.bg-wiki.com/ffxi/Category:-na_Spell' },
+                { type = 'link', text = 'Erase.', url = 'https://www.bg-wiki.com/ffxi/Erase' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Jump,', url = 'https://www.bg-wiki.com/ffxi/Jump' },
+                { type = 'link', text = 'High Jump,', url = 'https://www.bg-wiki.com/ffxi/High_Jump' },
+                { type = 'link', text = 'Super Jump,', url = 'https://www.bg-wiki.com/ffxi/Super_Jump' },
+                { type = 'link', text = 'Ancient Circle', url = 'https://www.bg-wiki.com/ffxi/Ancient_Circle' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Raiden Thrust', url = 'https://www.bg-wiki.com/ffxi/Raiden_Thrust' },
+                { type = 'skillchain', value = 'Transfixion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Impaction' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Skewer', url = 'https://www.bg-wiki.com/ffxi/Skewer' },
+                { type = 'skillchain', value = 'Transfixion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Impaction' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Wheeling Thrust', url = 'https://www.bg-wiki.com/ffxi/Wheeling_Thrust' },
+                { type = 'skillchain', value = 'Fusion' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Impulse Drive', url = 'https://www.bg-wiki.com/ffxi/Impulse_Drive' },
+                { type = 'skillchain', value = 'Gravitation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Induration' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Complete' },
+                { type = 'link', text = 'Three Paths.', url = 'https://www.bg-wiki.com/ffxi/Promathia_Mission_5-3' },
+            },
+            {
+                { type = 'text', value = 'Speak to' },
+                { type = 'link', text = 'Perih Vashai', url = 'https://www.bg-wiki.com/ffxi/Perih_Vashai' },
+                { type = 'text', value = 'in' },
+                { type = 'link', text = 'Windurst Woods', url = 'https://www.bg-wiki.com/ffxi/Windurst_Woods' },
+                { type = 'text', value = '(K-7) Note: you must have the Windurst Trust Permit.' },
+            },
+            {
+                { type = 'text', value = 'If you are on some Promathia Missions after 5-3 (8-2 for sure) you will not be able to acquire this trust until completing those missions.' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses HP-10%, MP+100%' },
+            },
+            {
+                { type = 'text', value = 'Uses' },
+                { type = 'link', text = 'Ancient Circle', url = 'https://www.bg-wiki.com/ffxi/Ancient_Circle' },
+                { type = 'text', value = 'if the enemy is a dragon' },
+            },
+            {
+                { type = 'link', text = 'Super Jump', url = 'https://www.bg-wiki.com/ffxi/Super_Jump' },
+                { type = 'text', value = 'is used when ShikareeZ is in the top enmity slot' },
+            },
+            {
+                { type = 'text', value = 'Gains 205 TP on hit; has high TP return on Jump (655 TP) and High Jump (1065 TP).' },
+            },
+            {
+                { type = 'text', value = 'Holds TP to 2000 to try to close skillchains.' },
+            },
+            {
+                { type = 'text', value = 'Saves' },
+                { type = 'link', text = 'Cure', url = 'https://www.bg-wiki.com/ffxi/Cure' },
+                { type = 'text', value = 'for party members under 50% HP or affected by' },
+                { type = 'link', text = 'Sleep', url = 'https://www.bg-wiki.com/ffxi/Sleep' },
+            },
+            {
+                { type = 'text', value = 'Prioritizes' },
+                { type = 'link', text = 'Haste', url = 'https://www.bg-wiki.com/ffxi/Haste' },
+                { type = 'text', value = 'over other spells, except to cast' },
+                { type = 'link', text = 'Erase', url = 'https://www.bg-wiki.com/ffxi/Erase' },
+                { type = 'text', value = 'when' },
+                { type = 'link', text = 'Slow', url = 'https://www.bg-wiki.com/ffxi/Slow' },
+                { type = 'text', value = 'would prevent' },
+                { type = 'link', text = 'Haste.', url = 'https://www.bg-wiki.com/ffxi/Haste' },
+            },
+        },
+    },
+    ['Tenzen'] = {
+        name = 'Tenzen',
+        job = {
+            {
+                { type = 'link', text = 'Samurai', url = 'https://www.bg-wiki.com/ffxi/Samurai' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Samurai', url = 'https://www.bg-wiki.com/ffxi/Samurai' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Hasso,', url = 'https://www.bg-wiki.com/ffxi/Hasso' },
+                { type = 'link', text = 'Save TP', url = 'https://www.bg-wiki.com/ffxi/Save_TP' },
+                { type = 'text', value = '(400),' },
+                { type = 'link', text = 'Meditate,', url = 'https://www.bg-wiki.com/ffxi/Meditate' },
+                { type = 'link', text = 'Hagakure,', url = 'https://www.bg-wiki.com/ffxi/Hagakure' },
+                { type = 'link', text = 'Third Eye', url = 'https://www.bg-wiki.com/ffxi/Third_Eye' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Amatsu: Torimai', url = 'https://www.bg-wiki.com/ffxi/Tachi:_Enpi' },
+                { type = 'skillchain', value = 'Transfixion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Amatsu: Kazakiri', url = 'https://www.bg-wiki.com/ffxi/Tachi:_Jinpu' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Detonation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Amatsu: Yukiarashi', url = 'https://www.bg-wiki.com/ffxi/Tachi:_Yukikaze' },
+                { type = 'skillchain', value = 'Induration' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Detonation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Amatsu: Tsukioboro', url = 'https://www.bg-wiki.com/ffxi/Tachi:_Gekko' },
+                { type = 'skillchain', value = 'Distortion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Reverberation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Amatsu: Hanaikusa', url = 'https://www.bg-wiki.com/ffxi/Tachi:_Kasha' },
+                { type = 'skillchain', value = 'Fusion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Compression' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Amatsu: Tsukikage', url = 'https://www.bg-wiki.com/index.php?title=Amatsu:_Tsukikage&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Dark' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Fragmentation' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Tenzen', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Tenzen' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Records of Eminence: Basic Tutorial Objective', url = 'https://www.bg-wiki.com/ffxi/Category:Records_of_Eminence#Tutorial' },
+                { type = 'text', value = 'Reward' },
+            },
+            {
+                { type = 'link', text = 'Repeat Login Campaign', url = 'https://www.bg-wiki.com/ffxi/Repeat_Login_Campaign' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Gains 203 TP per hit.' },
+            },
+            {
+                { type = 'text', value = 'Holds TP until 1500 to try to close skillchains.' },
+            },
+            {
+                { type = 'text', value = 'If' },
+                { type = 'link', text = 'Meditate', url = 'https://www.bg-wiki.com/ffxi/Meditate' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = 'Hagakure', url = 'https://www.bg-wiki.com/ffxi/Hagakure' },
+                { type = 'text', value = 'are both available, can do 3-step self-skillchains.' },
+            },
+            {
+                { type = 'text', value = "Nearly all of Tenzen's weapon skills are variants of normal" },
+                { type = 'link', text = 'Great Katana', url = 'https://www.bg-wiki.com/ffxi/Great_Katana' },
+                { type = 'text', value = 'weapon skills.' },
+            },
+            {
+                { type = 'text', value = 'Amatsu: Tsukikage is a unique weapon skill only usable by Tenzen.' },
+            },
+        },
+    },
+    ['Teodor'] = {
+        name = 'Teodor',
+        job = {
+            {
+                { type = 'link', text = 'Black Mage', url = 'https://www.bg-wiki.com/ffxi/Black_Mage' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Dark Knight', url = 'https://www.bg-wiki.com/ffxi/Dark_Knight' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = '-ja Spells,', url = 'https://www.bg-wiki.com/ffxi/Category:Cumulative_Magic' },
+                { type = 'link', text = '-ga Spells', url = 'https://www.bg-wiki.com/ffxi/Category:Elemental_Magic' },
+                { type = 'text', value = '(' },
+                { type = 'link', text = 'Magic Burst', url = 'https://www.bg-wiki.com/ffxi/Magic_Burst' },
+                { type = 'text', value = 'only)' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'text', value = 'Start from Scratch' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = "Sinner's Cross", url = 'https://www.bg-wiki.com/index.php?title=Sinner%27s_Cross&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Gravitation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Ravenous Assault', url = 'https://www.bg-wiki.com/index.php?title=Ravenous_Assault&amp;action=edit&amp;redlink=1' },
+                { type = 'text', value = '(' },
+                { type = 'link', text = 'Drain', url = 'https://www.bg-wiki.com/ffxi/Drain' },
+                { type = 'text', value = ')' },
+                { type = 'skillchain', value = 'Status_Ability' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Frenzied Thrust', url = 'https://www.bg-wiki.com/index.php?title=Frenzied_Thrust&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Fragmentation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Transfixion' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Open Coffin', url = 'https://www.bg-wiki.com/index.php?title=Open_Coffin&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Fusion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Compression' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Hemocladis', url = 'https://www.bg-wiki.com/index.php?title=Hemocladis&amp;action=edit&amp;redlink=1' },
+                { type = 'text', value = "(Restores Teodor's HP)" },
+                { type = 'skillchain', value = 'Dark' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Distortion' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Teodor', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Teodor' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Repeat Login Campaign', url = 'https://www.bg-wiki.com/ffxi/Repeat_Login_Campaign' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses HP+35%, MP+50%' },
+            },
+            {
+                { type = 'text', value = 'Teodor cannot be healed via curative magic. (Trusts with healing magic will not attempt to heal him)' },
+            },
+            {
+                { type = 'link', text = 'Regen', url = 'https://www.bg-wiki.com/ffxi/Regen' },
+                { type = 'text', value = 'spells,' },
+                { type = 'link', text = 'Indi-Regen,', url = 'https://www.bg-wiki.com/ffxi/Indi-Regen' },
+                { type = 'link', text = 'Blue Magic,', url = 'https://www.bg-wiki.com/ffxi/Blue_Magic' },
+                { type = 'text', value = 'and curative' },
+                { type = 'link', text = 'Blood Pacts', url = 'https://www.bg-wiki.com/ffxi/Blood_Pact' },
+                { type = 'text', value = '( ) all can heal him.' },
+            },
+            {
+                { type = 'text', value = 'Normal attacks have different attributes depending on their motion.' },
+            },
+            {
+                { type = 'text', value = 'A slash with his cane is slashing' },
+            },
+            {
+                { type = 'text', value = 'An attack causing an explosion with his left hand is a darkness attribute special attack' },
+            },
+            {
+                { type = 'text', value = 'Horizontal striking attack has a' },
+                { type = 'link', text = 'Silence', url = 'https://www.bg-wiki.com/ffxi/Silence' },
+                { type = 'link', text = 'Additional Effect.', url = 'https://www.bg-wiki.com/ffxi/Additional_Effect' },
+            },
+            {
+                { type = 'text', value = 'Since his attacks are treated as special techniques, his attack interval is not affected or influenced by' },
+                { type = 'link', text = 'Haste,', url = 'https://www.bg-wiki.com/ffxi/Haste' },
+                { type = 'link', text = 'Slow,', url = 'https://www.bg-wiki.com/ffxi/Slow' },
+                { type = 'link', text = 'En-spell,', url = 'https://www.bg-wiki.com/ffxi/En-spell' },
+                { type = 'link', text = 'Samba,', url = 'https://www.bg-wiki.com/ffxi/Samba' },
+                { type = 'link', text = 'Spikes,', url = 'https://www.bg-wiki.com/ffxi/Spikes' },
+                { type = 'text', value = 'etc.' },
+            },
+            {
+                { type = 'text', value = 'Uses TP randomly and does not try to skillchain.' },
+            },
+            {
+                { type = 'text', value = 'Uses Start from Scratch under 50%, which consumes TP, erases negative status effects, and gives him a dark aura.' },
+            },
+            {
+                { type = 'text', value = 'When he has the dark aura on, he will build TP to 2000 and use Hemocladis, and loses the aura.' },
+            },
+            {
+                { type = 'text', value = 'Only uses his elemental magic to magic burst.' },
+            },
+        },
+    },
+    ['Uka Totlihn'] = {
+        name = 'Uka Totlihn',
+        job = {
+            {
+                { type = 'link', text = 'Dancer', url = 'https://www.bg-wiki.com/ffxi/Dancer' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Warrior', url = 'https://www.bg-wiki.com/ffxi/Warrior' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Quickstep,', url = 'https://www.bg-wiki.com/ffxi/Quickstep' },
+                { type = 'link', text = 'Drain Samba', url = 'https://www.bg-wiki.com/ffxi/Drain_Samba' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'II', url = 'https://www.bg-wiki.com/ffxi/Drain_Samba_II' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'III,', url = 'https://www.bg-wiki.com/ffxi/Drain_Samba_III' },
+                { type = 'link', text = 'Reverse Flourish,', url = 'https://www.bg-wiki.com/ffxi/Reverse_Flourish' },
+                { type = 'link', text = 'Haste Samba,', url = 'https://www.bg-wiki.com/ffxi/Haste_Samba' },
+                { type = 'link', text = 'Curing Waltz I - V,', url = 'https://www.bg-wiki.com/ffxi/Category:Waltz' },
+                { type = 'link', text = 'Healing Waltz', url = 'https://www.bg-wiki.com/ffxi/Healing_Waltz' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Judgment', url = 'https://www.bg-wiki.com/ffxi/Judgment' },
+                { type = 'skillchain', value = 'Impaction' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Uka', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Uka' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Repeat Login Campaign', url = 'https://www.bg-wiki.com/ffxi/Repeat_Login_Campaign' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Red)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Red)' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Heals party members with' },
+                { type = 'link', text = 'Curing Waltzes', url = 'https://www.bg-wiki.com/ffxi/Category:Waltz' },
+                { type = 'text', value = "when they're below 66% HP." },
+            },
+            {
+                { type = 'text', value = 'Builds finishing moves using' },
+                { type = 'link', text = 'Quickstep', url = 'https://www.bg-wiki.com/ffxi/Quickstep' },
+                { type = 'text', value = 'and expends them on' },
+                { type = 'link', text = 'Reverse Flourish', url = 'https://www.bg-wiki.com/ffxi/Reverse_Flourish' },
+                { type = 'text', value = 'to gain TP.' },
+            },
+            {
+                { type = 'text', value = 'Once' },
+                { type = 'link', text = 'Quickstep', url = 'https://www.bg-wiki.com/ffxi/Quickstep' },
+                { type = 'text', value = "is at daze lv.5, only re-applies it when it's <10s from expiring." },
+            },
+            {
+                { type = 'text', value = 'Uses' },
+                { type = 'link', text = 'Reverse Flourish', url = 'https://www.bg-wiki.com/ffxi/Reverse_Flourish' },
+                { type = 'text', value = 'only with 5 finishing moves and when TP is low.' },
+            },
+            {
+                { type = 'text', value = 'When above 2000 TP, uses' },
+                { type = 'link', text = 'Judgment.', url = 'https://www.bg-wiki.com/ffxi/Judgment' },
+                { type = 'text', value = 'Does not try to skillchain.' },
+            },
+            {
+                { type = 'text', value = 'Has' },
+                { type = 'link', text = 'Healing Waltz', url = 'https://www.bg-wiki.com/ffxi/Healing_Waltz' },
+                { type = 'text', value = 'but only removes status effects from herself.' },
+            },
+            {
+                { type = 'text', value = 'Uses' },
+                { type = 'link', text = 'Haste Samba', url = 'https://www.bg-wiki.com/ffxi/Haste_Samba' },
+                { type = 'text', value = 'when another party member is on a main job with access to' },
+                { type = 'link', text = 'Cure', url = 'https://www.bg-wiki.com/ffxi/Cure' },
+                { type = 'text', value = '(WHM,RDM,SCH,PLD) or when the enemy is undead, otherwise uses' },
+                { type = 'link', text = 'Drain Samba.', url = 'https://www.bg-wiki.com/ffxi/Drain_Samba' },
+            },
+        },
+    },
+    ['Volker'] = {
+        name = 'Volker',
+        job = {
+            {
+                { type = 'link', text = 'Warrior', url = 'https://www.bg-wiki.com/ffxi/Warrior' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Warrior', url = 'https://www.bg-wiki.com/ffxi/Warrior' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Aggressor,', url = 'https://www.bg-wiki.com/ffxi/Aggressor' },
+                { type = 'link', text = 'Berserk,', url = 'https://www.bg-wiki.com/ffxi/Berserk' },
+                { type = 'link', text = 'Defender,', url = 'https://www.bg-wiki.com/ffxi/Defender' },
+                { type = 'link', text = 'Provoke,', url = 'https://www.bg-wiki.com/ffxi/Provoke' },
+                { type = 'link', text = 'Retaliation,', url = 'https://www.bg-wiki.com/ffxi/Retaliation' },
+                { type = 'link', text = "Warrior's Charge,", url = 'https://www.bg-wiki.com/ffxi/Warrior%27s_Charge' },
+                { type = 'link', text = 'Warcry', url = 'https://www.bg-wiki.com/ffxi/Warcry' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Berserk-Ruf', url = 'https://www.bg-wiki.com/ffxi/Berserk-Ruf' },
+                { type = 'text', value = '(Attack Boost)' },
+                { type = 'skillchain', value = 'Status_Ability' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Fast Blade', url = 'https://www.bg-wiki.com/ffxi/Fast_Blade' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Savage Blade', url = 'https://www.bg-wiki.com/ffxi/Savage_Blade' },
+                { type = 'skillchain', value = 'Fragmentation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Spirits Within', url = 'https://www.bg-wiki.com/ffxi/Spirits_Within' },
+                { type = 'skillchain', value = 'Status_Ability' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Vorpal Blade', url = 'https://www.bg-wiki.com/ffxi/Vorpal_Blade' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Impaction' },
+                { type = 'text', value = ',' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Complete the initiation quest in' },
+                { type = 'link', text = 'Bastok.', url = 'https://www.bg-wiki.com/ffxi/Trust:_Bastok' },
+            },
+            {
+                { type = 'text', value = 'Must be Rank 6 or higher in any nation.' },
+            },
+            {
+                { type = 'text', value = 'Speak to' },
+                { type = 'link', text = 'Lucius', url = 'https://www.bg-wiki.com/ffxi/Lucius' },
+                { type = 'text', value = 'in the' },
+                { type = 'link', text = 'Metalworks', url = 'https://www.bg-wiki.com/ffxi/Metalworks' },
+                { type = 'text', value = 'at (I-9).' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'If there is a NIN, PLD, or RUN in the party, behaves as a damage dealer: Uses' },
+                { type = 'link', text = 'Aggressor,', url = 'https://www.bg-wiki.com/ffxi/Aggressor' },
+                { type = 'link', text = 'Berserk.', url = 'https://www.bg-wiki.com/ffxi/Berserk' },
+            },
+            {
+                { type = 'text', value = 'If there are no other tanks in the party, behaves as a tank: Uses' },
+                { type = 'link', text = 'Defender,', url = 'https://www.bg-wiki.com/ffxi/Defender' },
+                { type = 'link', text = 'Retaliation.', url = 'https://www.bg-wiki.com/ffxi/Retaliation' },
+            },
+            {
+                { type = 'text', value = 'Uses' },
+                { type = 'link', text = 'Provoke', url = 'https://www.bg-wiki.com/ffxi/Provoke' },
+                { type = 'text', value = 'in either role to maintain enmity as a tank or off-tank.' },
+            },
+            {
+                { type = 'text', value = 'Uses weapon skills at 2000 TP with' },
+                { type = 'link', text = "Warrior's Charge", url = 'https://www.bg-wiki.com/ffxi/Warrior%27s_Charge' },
+                { type = 'text', value = "if it's available; does not try to skillchain." },
+            },
+        },
+    },
+    ['Zazarg'] = {
+        name = 'Zazarg',
+        job = {
+            {
+                { type = 'link', text = 'Monk', url = 'https://www.bg-wiki.com/ffxi/Monk' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Monk', url = 'https://www.bg-wiki.com/ffxi/Monk' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Focus', url = 'https://www.bg-wiki.com/ffxi/Focus' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Howling Fist', url = 'https://www.bg-wiki.com/ffxi/Howling_Fist' },
+                { type = 'skillchain', value = 'Transfixion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Impaction' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Dragon Kick', url = 'https://www.bg-wiki.com/ffxi/Dragon_Kick' },
+                { type = 'skillchain', value = 'Fragmentation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Asuran Fists', url = 'https://www.bg-wiki.com/ffxi/Asuran_Fists' },
+                { type = 'skillchain', value = 'Gravitation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Liquefaction' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Meteoric Impact', url = 'https://www.bg-wiki.com/ffxi/Meteoric_Impact' },
+                { type = 'skillchain', value = 'Dark' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Fragmentation' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Complete' },
+                { type = 'link', text = 'Fist of the People.', url = 'https://www.bg-wiki.com/ffxi/Fist_of_the_People' },
+            },
+            {
+                { type = 'text', value = 'Speak with' },
+                { type = 'link', text = 'Fari-Wari', url = 'https://www.bg-wiki.com/ffxi/Fari-Wari' },
+                { type = 'text', value = 'in' },
+                { type = 'link', text = 'Aht Urhgan Whitegate', url = 'https://www.bg-wiki.com/ffxi/Aht_Urhgan_Whitegate' },
+                { type = 'text', value = '(K-12). Players will be unable to receive the alter ego if he is being held prisoner by beastmen forces in Beseiged.' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Uses the unique weapon skill Meteoric Impact.' },
+            },
+            {
+                { type = 'link', text = 'Focuses', url = 'https://www.bg-wiki.com/ffxi/Focus' },
+                { type = 'text', value = 'when needed based on high enemy evasion.' },
+            },
+            {
+                { type = 'text', value = 'Uses TP as soon as he gets it.' },
+            },
+        },
+    },
+    ['Zeid'] = {
+        name = 'Zeid',
+        job = {
+            {
+                { type = 'link', text = 'Dark Knight', url = 'https://www.bg-wiki.com/ffxi/Dark_Knight' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Dark Knight', url = 'https://www.bg-wiki.com/ffxi/Dark_Knight' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Absorb spells', url = 'https://www.bg-wiki.com/ffxi/Category:Absorb_Spell' },
+                { type = 'text', value = '(Includes' },
+                { type = 'link', text = 'Absorb-Attri', url = 'https://www.bg-wiki.com/ffxi/Absorb-Attri' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = 'Absorb-TP', url = 'https://www.bg-wiki.com/ffxi/Absorb-TP' },
+                { type = 'text', value = '),' },
+                { type = 'link', text = 'Endark,', url = 'https://www.bg-wiki.com/ffxi/Endark' },
+                { type = 'link', text = 'Drain/Aspir I/II,', url = 'https://www.bg-wiki.com/ffxi/Category:Drain/Aspir_Spell' },
+                { type = 'link', text = 'Stun', url = 'https://www.bg-wiki.com/ffxi/Stun' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Last Resort,', url = 'https://www.bg-wiki.com/ffxi/Last_Resort' },
+                { type = 'link', text = 'Nether Void,', url = 'https://www.bg-wiki.com/ffxi/Nether_Void' },
+                { type = 'link', text = 'Souleater', url = 'https://www.bg-wiki.com/ffxi/Souleater' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Freezebite', url = 'https://www.bg-wiki.com/ffxi/Freezebite' },
+                { type = 'skillchain', value = 'Induration' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Detonation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Ground Strike', url = 'https://www.bg-wiki.com/ffxi/Ground_Strike' },
+                { type = 'skillchain', value = 'Fragmentation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Distortion' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Abyssal Drain', url = 'https://www.bg-wiki.com/ffxi/Abyssal_Drain' },
+                { type = 'text', value = '(' },
+                { type = 'link', text = 'Drain', url = 'https://www.bg-wiki.com/ffxi/Drain' },
+                { type = 'text', value = ')' },
+                { type = 'skillchain', value = 'Status_Ability' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Abyssal Strike', url = 'https://www.bg-wiki.com/ffxi/Abyssal_Strike' },
+                { type = 'text', value = '(Stun)' },
+                { type = 'skillchain', value = 'Status_Ability' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Zeid', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Zeid' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Repeat Login Campaign', url = 'https://www.bg-wiki.com/ffxi/Repeat_Login_Campaign' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Red)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Red)' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'At low HP, uses' },
+                { type = 'link', text = 'HP', url = 'https://www.bg-wiki.com/ffxi/HP' },
+                { type = 'text', value = 'draining weapon skills and' },
+                { type = 'link', text = 'Nether Void', url = 'https://www.bg-wiki.com/ffxi/Nether_Void' },
+                { type = 'text', value = 'for' },
+                { type = 'link', text = 'Drain II.', url = 'https://www.bg-wiki.com/ffxi/Drain_II' },
+            },
+            {
+                { type = 'text', value = 'Uses' },
+                { type = 'link', text = 'Absorb-TP', url = 'https://www.bg-wiki.com/ffxi/Absorb-TP' },
+                { type = 'text', value = 'in the second half of the battle (when an enemy has TP).' },
+            },
+            {
+                { type = 'text', value = 'Only uses' },
+                { type = 'link', text = 'Souleater', url = 'https://www.bg-wiki.com/ffxi/Souleater' },
+                { type = 'text', value = "when a healer is present (Automaton doesn't count)." },
+            },
+            {
+                { type = 'text', value = 'Uses TP as soon as he gets it.' },
+            },
+            {
+                { type = 'text', value = 'If the enemy is readying a TP move when he is ready to use a weapon skill, attempts to stun it with Abyssal Strike.' },
+            },
+            {
+                { type = 'text', value = 'Casts' },
+                { type = 'link', text = 'Stun', url = 'https://www.bg-wiki.com/ffxi/Stun' },
+                { type = 'text', value = 'to interrupt enemy TP moves.' },
+            },
+        },
+    },
+    ['Zeid II'] = {
+        name = 'Zeid II',
+        job = {
+            {
+                { type = 'link', text = 'Dark Knight', url = 'https://www.bg-wiki.com/ffxi/Dark_Knight' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Warrior', url = 'https://www.bg-wiki.com/ffxi/Warrior' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Stun,', url = 'https://www.bg-wiki.com/ffxi/Stun' },
+                { type = 'link', text = 'Absorb-Attri', url = 'https://www.bg-wiki.com/ffxi/Absorb-Attri' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Last Resort,', url = 'https://www.bg-wiki.com/ffxi/Last_Resort' },
+                { type = 'link', text = 'Souleater', url = 'https://www.bg-wiki.com/ffxi/Souleater' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Ground Strike', url = 'https://www.bg-wiki.com/ffxi/Ground_Strike' },
+                { type = 'skillchain', value = 'Fragmentation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Distortion' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Zeid II', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Zeid_II' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'text', value = 'Complete' },
+                { type = 'link', text = 'Volto Oscuro.', url = 'https://www.bg-wiki.com/ffxi/Volto_Oscuro' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Will exclusively use Ground Strike for his' },
+                { type = 'link', text = 'Weapon Skill', url = 'https://www.bg-wiki.com/ffxi/Weapon_Skill' },
+                { type = 'text', value = '(Note: he will not know Ground Strike until a specific level (appears to be level 50), leading him to hold 3000 TP indefinitely if summoned below said level).' },
+            },
+            {
+                { type = 'text', value = 'Tries to' },
+                { type = 'link', text = 'Skillchain', url = 'https://www.bg-wiki.com/ffxi/Skillchain' },
+                { type = 'text', value = 'with others, otherwise saves TP to 3000 and then uses it.' },
+            },
+            {
+                { type = 'text', value = 'Due to' },
+                { type = 'link', text = 'Ground Strike', url = 'https://www.bg-wiki.com/ffxi/Ground_Strike' },
+                { type = 'text', value = "'s skillchain properties, Zeid can close level 3 skillchains with weapon skills that possess" },
+                { type = 'link', text = 'Fusion', url = 'https://www.bg-wiki.com/ffxi/Fusion' },
+                { type = 'text', value = 'or' },
+                { type = 'link', text = 'Gravitation', url = 'https://www.bg-wiki.com/ffxi/Gravitation' },
+                { type = 'text', value = 'properties.' },
+            },
+            {
+                { type = 'text', value = 'Uses' },
+                { type = 'link', text = 'Stun', url = 'https://www.bg-wiki.com/ffxi/Stun' },
+                { type = 'text', value = 'to stop enemy abilities.' },
+            },
+            {
+                { type = 'text', value = 'Only uses' },
+                { type = 'link', text = 'Souleater', url = 'https://www.bg-wiki.com/ffxi/Souleater' },
+                { type = 'text', value = 'when a healer is present (' },
+                { type = 'link', text = 'Automaton', url = 'https://www.bg-wiki.com/ffxi/Automaton' },
+                { type = 'text', value = "doesn't count)." },
+            },
+            {
+                { type = 'text', value = 'Tends to gain TP very fast due to' },
+                { type = 'link', text = 'Desperate Blows', url = 'https://www.bg-wiki.com/ffxi/Desperate_Blows' },
+                { type = 'text', value = 'while using' },
+                { type = 'link', text = 'Last Resort.', url = 'https://www.bg-wiki.com/ffxi/Last_Resort' },
+            },
+        },
+    },
+    ['Elivira'] = {
+        name = 'Elivira',
+        job = {
+            {
+                { type = 'link', text = 'Ranger', url = 'https://www.bg-wiki.com/ffxi/Ranger' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Warrior', url = 'https://www.bg-wiki.com/ffxi/Warrior' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Berserk,', url = 'https://www.bg-wiki.com/ffxi/Berserk' },
+                { type = 'link', text = 'Barrage,', url = 'https://www.bg-wiki.com/ffxi/Barrage' },
+                { type = 'link', text = 'Decoy Shot,', url = 'https://www.bg-wiki.com/ffxi/Decoy_Shot' },
+                { type = 'link', text = 'Double Shot', url = 'https://www.bg-wiki.com/ffxi/Double_Shot' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Coronach', url = 'https://www.bg-wiki.com/ffxi/Coronach' },
+                { type = 'skillchain', value = 'Dark' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Fragmentation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Slug Shot', url = 'https://www.bg-wiki.com/ffxi/Slug_Shot' },
+                { type = 'skillchain', value = 'Reverberation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Transfixion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Detonation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Heavy Shot', url = 'https://www.bg-wiki.com/ffxi/Heavy_Shot' },
+                { type = 'skillchain', value = 'Fusion' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Split Shot', url = 'https://www.bg-wiki.com/ffxi/Split_Shot' },
+                { type = 'skillchain', value = 'Reverberation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Transfixion' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Elivira', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Elivira' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Repeat Login Campaign', url = 'https://www.bg-wiki.com/ffxi/Repeat_Login_Campaign' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses' },
+                { type = 'link', text = 'Store TP', url = 'https://www.bg-wiki.com/ffxi/Store_TP' },
+                { type = 'text', value = '-30, Melee Attacks and Ranged Attacks: TP+100%' },
+            },
+            {
+                { type = 'text', value = 'When using' },
+                { type = 'link', text = 'Coronach,', url = 'https://www.bg-wiki.com/ffxi/Coronach' },
+                { type = 'text', value = 'Elivira benefits from the relic aftermath (enmity -10).' },
+            },
+            {
+                { type = 'text', value = 'Elivira will melee the enemy if in range and perform ranged attacks regardless of position.' },
+            },
+            {
+                { type = 'text', value = 'Elivira will hold her position when engaging an enemy, she will neither move in or out.' },
+            },
+            {
+                { type = 'text', value = 'Summoning Elivira early in the trust order helps to ensure she is in melee range and increase her TP gain.' },
+            },
+            {
+                { type = 'text', value = 'Elivira tends to use TP immediately upon reaching 1000%; however, she will close a skillchain if possible.' },
+            },
+            {
+                { type = 'text', value = 'Gains 127 TP with Sword hits, 178 TP with Marksmanship.' },
+            },
+        },
+    },
+    ['Makki-Chebukki'] = {
+        name = 'Makki-Chebukki',
+        job = {
+            {
+                { type = 'link', text = 'Ranger', url = 'https://www.bg-wiki.com/ffxi/Ranger' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Black Mage', url = 'https://www.bg-wiki.com/ffxi/Black_Mage' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Flashy Shot,', url = 'https://www.bg-wiki.com/ffxi/Flashy_Shot' },
+                { type = 'link', text = 'Sharpshot,', url = 'https://www.bg-wiki.com/ffxi/Sharpshot' },
+                { type = 'link', text = 'Barrage', url = 'https://www.bg-wiki.com/ffxi/Barrage' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Sidewinder', url = 'https://www.bg-wiki.com/ffxi/Sidewinder' },
+                { type = 'skillchain', value = 'Reverberation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Transfixion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Detonation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Empyreal Arrow', url = 'https://www.bg-wiki.com/ffxi/Empyreal_Arrow' },
+                { type = 'skillchain', value = 'Fusion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Transfixion' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Dulling Arrow', url = 'https://www.bg-wiki.com/ffxi/Dulling_Arrow' },
+                { type = 'skillchain', value = 'Liquefaction' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Transfixion' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Flaming Arrow', url = 'https://www.bg-wiki.com/ffxi/Flaming_Arrow' },
+                { type = 'skillchain', value = 'Liquefaction' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Transfixion' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Makki', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Makki' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Repeat Login Campaign', url = 'https://www.bg-wiki.com/ffxi/Repeat_Login_Campaign' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses MP+100%,' },
+                { type = 'link', text = 'Store TP', url = 'https://www.bg-wiki.com/ffxi/Store_TP' },
+                { type = 'text', value = '-40, Ranged Attacks: TP+100%' },
+            },
+            {
+                { type = 'text', value = 'Will try to stay out of melee range.' },
+            },
+            {
+                { type = 'text', value = 'Uses weapon skills at 2000 TP and does not try to skillchain.' },
+            },
+            {
+                { type = 'text', value = 'During Lightsday, Makki-Chebukki will move out of range but take no other actions. As soon as the day changes he will resume fighting normally (resummoning is not necessary).' },
+            },
+            {
+                { type = 'text', value = 'Gains 168 TP per attack.' },
+            },
+        },
+    },
+    ['Margret'] = {
+        name = 'Margret',
+        job = {
+            {
+                { type = 'link', text = 'Ranger', url = 'https://www.bg-wiki.com/ffxi/Ranger' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Thief', url = 'https://www.bg-wiki.com/ffxi/Thief' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Decoy Shot,', url = 'https://www.bg-wiki.com/ffxi/Decoy_Shot' },
+                { type = 'link', text = 'Double Shot,', url = 'https://www.bg-wiki.com/ffxi/Double_Shot' },
+                { type = 'link', text = 'Barrage,', url = 'https://www.bg-wiki.com/ffxi/Barrage' },
+                { type = 'link', text = 'Sharpshot,', url = 'https://www.bg-wiki.com/ffxi/Sharpshot' },
+                { type = 'link', text = 'Stealth Shot', url = 'https://www.bg-wiki.com/ffxi/Stealth_Shot' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Sidewinder', url = 'https://www.bg-wiki.com/ffxi/Sidewinder' },
+                { type = 'skillchain', value = 'Reverberation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Transfixion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Detonation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Arching Arrow', url = 'https://www.bg-wiki.com/ffxi/Arching_Arrow' },
+                { type = 'skillchain', value = 'Fusion' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Refulgent Arrow', url = 'https://www.bg-wiki.com/ffxi/Refulgent_Arrow' },
+                { type = 'skillchain', value = 'Reverberation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Transfixion' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Piercing Arrow', url = 'https://www.bg-wiki.com/ffxi/Piercing_Arrow' },
+                { type = 'skillchain', value = 'Reverberation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Transfixion' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Margret', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Margret' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Repeat Login Campaign', url = 'https://www.bg-wiki.com/ffxi/Repeat_Login_Campaign' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses' },
+                { type = 'link', text = 'Treasure Hunter,', url = 'https://www.bg-wiki.com/ffxi/Treasure_Hunter' },
+                { type = 'link', text = 'Store TP', url = 'https://www.bg-wiki.com/ffxi/Store_TP' },
+                { type = 'text', value = '+40, Ranged Attacks: TP+100%' },
+            },
+            {
+                { type = 'text', value = 'Will try to stay out of melee range.' },
+            },
+            {
+                { type = 'text', value = 'Margret tends to support her TP-abilities with as many job abilities as possible.' },
+            },
+            {
+                { type = 'text', value = 'Uses weapon skills at 2000 TP and does not try to skillchain.' },
+            },
+            {
+                { type = 'text', value = 'If the enemy has less than a certain threshold of HP (10-15%), Margret will hold off using weapon skills or abilities and only auto-attack.' },
+            },
+            {
+                { type = 'text', value = 'Margret is fairly poor at opening or closing high tier skillchains due to only having a single weaponskill with dual element properties (Arching Arrow).' },
+            },
+            {
+                { type = 'text', value = 'Gains 252 TP per attack.' },
+            },
+        },
+    },
+    ['Najelith'] = {
+        name = 'Najelith',
+        job = {
+            {
+                { type = 'link', text = 'Ranger', url = 'https://www.bg-wiki.com/ffxi/Ranger' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Ranger', url = 'https://www.bg-wiki.com/ffxi/Ranger' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Barrage,', url = 'https://www.bg-wiki.com/ffxi/Barrage' },
+                { type = 'link', text = 'Double Shot', url = 'https://www.bg-wiki.com/ffxi/Double_Shot' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Cyclone', url = 'https://www.bg-wiki.com/ffxi/Cyclone' },
+                { type = 'skillchain', value = 'Detonation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Impaction' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Sidewinder', url = 'https://www.bg-wiki.com/ffxi/Sidewinder' },
+                { type = 'skillchain', value = 'Reverberation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Transfixion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Detonation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Empyreal Arrow', url = 'https://www.bg-wiki.com/ffxi/Empyreal_Arrow' },
+                { type = 'skillchain', value = 'Fusion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Transfixion' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Typhonic Arrow', url = 'https://www.bg-wiki.com/ffxi/Typhonic_Arrow' },
+                { type = 'text', value = '(Conal AoE)' },
+                { type = 'skillchain', value = 'Light' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Fragmentation' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Najelith', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Najelith' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Repeat Login Campaign', url = 'https://www.bg-wiki.com/ffxi/Repeat_Login_Campaign' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Red)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Red)' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses enhanced' },
+                { type = 'link', text = 'Critical Hit Rate,', url = 'https://www.bg-wiki.com/ffxi/Critical_Hit_Rate' },
+                { type = 'text', value = 'Melee Attacks and Ranged Attacks: TP+100%.' },
+            },
+            {
+                { type = 'text', value = 'Holds position while engaged and performs ranged attacks.' },
+            },
+            {
+                { type = 'text', value = 'Melee attacks and performs ranged attacks if in melee range.' },
+            },
+            {
+                { type = 'text', value = 'Holds TP till about 1500% in an attempt to close a skillchain.' },
+            },
+            {
+                { type = 'text', value = 'Tends to use' },
+                { type = 'link', text = 'Cyclone', url = 'https://www.bg-wiki.com/ffxi/Cyclone' },
+                { type = 'text', value = 'if allowed to weapon skill outside of a skillchain.' },
+            },
+        },
+    },
+    ['Semih Lafihna'] = {
+        name = 'Semih Lafihna',
+        job = {
+            {
+                { type = 'link', text = 'Ranger', url = 'https://www.bg-wiki.com/ffxi/Ranger' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Warrior', url = 'https://www.bg-wiki.com/ffxi/Warrior' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Sharpshot,', url = 'https://www.bg-wiki.com/ffxi/Sharpshot' },
+                { type = 'link', text = 'Barrage,', url = 'https://www.bg-wiki.com/ffxi/Barrage' },
+                { type = 'link', text = 'Stealth Shot,', url = 'https://www.bg-wiki.com/ffxi/Stealth_Shot' },
+                { type = 'link', text = 'Double Shot', url = 'https://www.bg-wiki.com/ffxi/Double_Shot' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Sidewinder', url = 'https://www.bg-wiki.com/ffxi/Sidewinder' },
+                { type = 'skillchain', value = 'Reverberation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Transfixion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Detonation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Arching Arrow', url = 'https://www.bg-wiki.com/ffxi/Arching_Arrow' },
+                { type = 'skillchain', value = 'Fusion' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Stellar Arrow', url = 'https://www.bg-wiki.com/ffxi/Stellar_Arrow' },
+                { type = 'skillchain', value = 'Dark' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Gravitation' },
+                { type = 'text', value = '(AoE),' },
+                { type = 'link', text = 'Lux Arrow', url = 'https://www.bg-wiki.com/index.php?title=Lux_Arrow&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Fragmentation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Distortion' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Semih', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Semih' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'text', value = 'Speak to' },
+                { type = 'link', text = 'Kupipi', url = 'https://www.bg-wiki.com/ffxi/Kupipi' },
+                { type = 'text', value = 'in' },
+                { type = 'link', text = 'Heavens Tower', url = 'https://www.bg-wiki.com/ffxi/Heavens_Tower' },
+                { type = 'text', value = 'during Mission 2-3 for any nation (' },
+                { type = 'link', text = 'Journey Abroad', url = 'https://www.bg-wiki.com/ffxi/Journey_Abroad' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'The Emissary', url = 'https://www.bg-wiki.com/ffxi/The_Emissary' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'The Three Kingdoms', url = 'https://www.bg-wiki.com/ffxi/The_Three_Kingdoms' },
+                { type = 'text', value = ').' },
+            },
+            {
+                { type = 'text', value = 'Alternatively speak to Kupipi in Heavens Tower once the' },
+                { type = 'link', text = 'Rhapsodies of Vanadiel Mission 1-7', url = 'https://www.bg-wiki.com/ffxi/Rhapsodies_of_Vanadiel_Mission_1-7' },
+                { type = 'text', value = '(The Path Untraveled) is complete.' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses' },
+                { type = 'link', text = 'Store TP', url = 'https://www.bg-wiki.com/ffxi/Store_TP' },
+                { type = 'text', value = '+40, Ranged Attacks: TP+100%' },
+            },
+            {
+                { type = 'text', value = 'Will try to stay out of melee range.' },
+            },
+            {
+                { type = 'text', value = 'Semih Lafihna will hold up to 2000 TP to try to close skillchains.' },
+            },
+            {
+                { type = 'text', value = 'Lux Arrow and Stellar Arrow are both able to close Tier 3 skillchains and can close double tier 3 skillchains as well.' },
+            },
+            {
+                { type = 'text', value = 'Exercise caution when using Semih around multiple foes as Stellar Arrow is an AoE attack centered around its target.' },
+            },
+            {
+                { type = 'text', value = 'She is an extremely strong trust to use while leveling up due to her access to' },
+                { type = 'link', text = 'Sidewinder', url = 'https://www.bg-wiki.com/ffxi/Sidewinder' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = 'Arching Arrow', url = 'https://www.bg-wiki.com/ffxi/Arching_Arrow' },
+                { type = 'text', value = 'at low levels.' },
+            },
+            {
+                { type = 'link', text = 'Sidewinder', url = 'https://www.bg-wiki.com/ffxi/Sidewinder' },
+                { type = 'text', value = 'is her best WS for damage, use' },
+                { type = 'link', text = 'Lux Arrow', url = 'https://www.bg-wiki.com/index.php?title=Lux_Arrow&amp;action=edit&amp;redlink=1' },
+                { type = 'text', value = 'for' },
+                { type = 'link', text = 'Defense Down,', url = 'https://www.bg-wiki.com/ffxi/Defense_Down' },
+                { type = 'link', text = 'Stellar Arrow', url = 'https://www.bg-wiki.com/ffxi/Stellar_Arrow' },
+                { type = 'text', value = 'for' },
+                { type = 'link', text = 'Evasion Down.', url = 'https://www.bg-wiki.com/ffxi/Evasion_Down' },
+            },
+            {
+                { type = 'text', value = 'Gains 252 TP per hit.' },
+            },
+        },
+    },
+    ['Tenzen II'] = {
+        name = 'Tenzen II',
+        job = {
+            {
+                { type = 'link', text = 'Samurai', url = 'https://www.bg-wiki.com/ffxi/Samurai' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Ranger', url = 'https://www.bg-wiki.com/ffxi/Ranger' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Oisoya', url = 'https://www.bg-wiki.com/index.php?title=Oisoya&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Light' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Distortion' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Tenzen II', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Tenzen_II' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'text', value = 'Complete' },
+                { type = 'link', text = 'Crashing Waves.', url = 'https://www.bg-wiki.com/ffxi/Crashing_Waves' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses' },
+                { type = 'link', text = 'Store TP', url = 'https://www.bg-wiki.com/ffxi/Store_TP' },
+                { type = 'text', value = '+10, Ranged Attacks: TP+100%' },
+            },
+            {
+                { type = 'text', value = 'Will try to stay out of melee range.' },
+            },
+            {
+                { type = 'text', value = 'Oisoya is a variant of' },
+                { type = 'link', text = 'Namas Arrow', url = 'https://www.bg-wiki.com/ffxi/Namas_Arrow' },
+                { type = 'text', value = 'with identical enmity properties.' },
+            },
+            {
+                { type = 'text', value = 'Gains 252 TP per hit maximum when over level 90, based on Samurai' },
+                { type = 'link', text = 'Store TP', url = 'https://www.bg-wiki.com/ffxi/Store_TP' },
+                { type = 'text', value = 'traits.' },
+            },
+            {
+                { type = 'text', value = 'Only uses his weaponskill to open skillchains when another party member has 1000 TP. Will wait at 3000 TP indefinitely if no other party members gain TP.' },
+            },
+        },
+    },
+    ['Adelheid'] = {
+        name = 'Adelheid',
+        job = {
+            {
+                { type = 'link', text = 'Scholar', url = 'https://www.bg-wiki.com/ffxi/Scholar' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Black Mage', url = 'https://www.bg-wiki.com/ffxi/Black_Mage' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Cure I - IV,', url = 'https://www.bg-wiki.com/ffxi/Category:Cure_Spell' },
+                { type = 'link', text = 'Helices,', url = 'https://www.bg-wiki.com/ffxi/Category:Helix' },
+                { type = 'link', text = 'Single-target elemental nukes I - V,', url = 'https://www.bg-wiki.com/ffxi/Category:Elemental_Magic' },
+                { type = 'link', text = 'Storms,', url = 'https://www.bg-wiki.com/ffxi/Category:Storm' },
+                { type = 'link', text = 'Stun', url = 'https://www.bg-wiki.com/ffxi/Stun' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Dark Arts,', url = 'https://www.bg-wiki.com/ffxi/Dark_Arts' },
+                { type = 'link', text = 'Addendum: Black', url = 'https://www.bg-wiki.com/ffxi/Addendum:_Black' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Binding Microtube', url = 'https://www.bg-wiki.com/index.php?title=Binding_Microtube&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Gravitation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Induration' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Paralyzing Microtube', url = 'https://www.bg-wiki.com/index.php?title=Paralyzing_Microtube&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Induration' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Reverberation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Silencing Microtube', url = 'https://www.bg-wiki.com/index.php?title=Silencing_Microtube&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Liquefaction' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Detonation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Twirling Dervish', url = 'https://www.bg-wiki.com/index.php?title=Twirling_Dervish&amp;action=edit&amp;redlink=1' },
+                { type = 'text', value = '(AoE)' },
+                { type = 'skillchain', value = 'Light' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Fusion' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Adelheid', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Adelheid' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Records of Eminence: Basic Tutorial Objective', url = 'https://www.bg-wiki.com/ffxi/Category:Records_of_Eminence#Tutorial' },
+                { type = 'text', value = 'Reward' },
+            },
+            {
+                { type = 'link', text = 'Repeat Login Campaign', url = 'https://www.bg-wiki.com/ffxi/Repeat_Login_Campaign' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Adelheid casts a' },
+                { type = 'link', text = 'Storm', url = 'https://www.bg-wiki.com/ffxi/Category:Storm' },
+                { type = 'text', value = "on herself corresponding to the enemy's weakness if possible, otherwise matches the current day, followed by a -helix and nukes of her storm's element unless magic bursting a skillchain." },
+            },
+            {
+                { type = 'text', value = 'Will change storms under certain conditions such as BLMs casting' },
+                { type = 'link', text = 'Freeze', url = 'https://www.bg-wiki.com/ffxi/Freeze' },
+                { type = 'text', value = '(which modifies enemy resistances).' },
+            },
+            {
+                { type = 'text', value = 'For Light/Dark storms, she only casts helix since there are no matching elemental nukes.' },
+            },
+            {
+                { type = 'text', value = "During a skillchain, magic bursts a helix matching the skillchain's element without preparing a -storm first." },
+            },
+            {
+                { type = 'text', value = 'Casts' },
+                { type = 'link', text = 'Stun', url = 'https://www.bg-wiki.com/ffxi/Stun' },
+                { type = 'text', value = 'to interrupt enemy TP moves.' },
+            },
+            {
+                { type = 'text', value = 'Casts' },
+                { type = 'link', text = 'Cure', url = 'https://www.bg-wiki.com/ffxi/Cure' },
+                { type = 'text', value = 'spells on party members under 33% (red) hp, with a higher threshold and priority for the tank.' },
+            },
+            {
+                { type = 'text', value = 'Despite using' },
+                { type = 'link', text = 'Dark Arts,', url = 'https://www.bg-wiki.com/ffxi/Dark_Arts' },
+                { type = 'text', value = 'her healing potency/cost/cast times do not appear to suffer any detrimental effects.' },
+            },
+            {
+                { type = 'text', value = 'Gains 100 TP per hit with her melee attacks. Tries to use TP as soon as she gets it, but may have other priorities.' },
+            },
+            {
+                { type = 'text', value = "Adelheid's weapon skills all do magic damage and the Microtubes additionally apply status effects." },
+            },
+            {
+                { type = 'text', value = 'Her weapon skills seem to have a longer delay before you can skillchain with them: try timing follow-up weapon skills starting from when the vial explodes, not from when the ability is used.' },
+            },
+            {
+                { type = 'text', value = 'Twirling Dervish requires level 50.' },
+            },
+        },
+    },
+    ['Ajido-Marujido'] = {
+        name = 'Ajido-Marujido',
+        job = {
+            {
+                { type = 'link', text = 'Black Mage', url = 'https://www.bg-wiki.com/ffxi/Black_Mage' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Red Mage', url = 'https://www.bg-wiki.com/ffxi/Red_Mage' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Cure I - IV,', url = 'https://www.bg-wiki.com/ffxi/Category:Cure_Spell' },
+                { type = 'link', text = 'Dispel,', url = 'https://www.bg-wiki.com/ffxi/Dispel' },
+                { type = 'link', text = 'Single-target elemental nukes I - V,', url = 'https://www.bg-wiki.com/ffxi/Category:Elemental_Magic' },
+                { type = 'link', text = 'Slow,', url = 'https://www.bg-wiki.com/ffxi/Slow' },
+                { type = 'link', text = 'Paralyze', url = 'https://www.bg-wiki.com/ffxi/Paralyze' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Complete the initiation quest in' },
+                { type = 'link', text = 'Windurst.', url = 'https://www.bg-wiki.com/ffxi/Trust:_Windurst' },
+            },
+            {
+                { type = 'text', value = 'Must be Rank 6 or higher in any nation.' },
+            },
+            {
+                { type = 'text', value = 'Speak to' },
+                { type = 'link', text = 'Apururu', url = 'https://www.bg-wiki.com/ffxi/Apururu' },
+                { type = 'text', value = 'in' },
+                { type = 'link', text = 'Windurst Woods', url = 'https://www.bg-wiki.com/ffxi/Windurst_Woods' },
+                { type = 'text', value = 'at (H-9).' },
+            },
+            {
+                { type = 'text', value = 'May not be obtained if the player is currently between' },
+                { type = 'link', text = 'Windurst Missions', url = 'https://www.bg-wiki.com/ffxi/Windurst_Missions' },
+                { type = 'text', value = '6-1 to 9-2. Even if you changed Nations - you must change back to Windurst and complete Missions.' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses' },
+                { type = 'link', text = 'Cure Potency Bonus', url = 'https://www.bg-wiki.com/ffxi/Cure_Potency' },
+                { type = 'text', value = '+25%,' },
+                { type = 'link', text = 'Fast Cast Bonus,', url = 'https://www.bg-wiki.com/ffxi/Fast_Cast' },
+                { type = 'link', text = 'Magic Burst Bonus,', url = 'https://www.bg-wiki.com/ffxi/Magic_Burst_Bonus' },
+                { type = 'text', value = 'A+ skill in Elemental, Enfeebling, and Healing magic skill.' },
+            },
+            {
+                { type = 'text', value = 'Does not melee, but instead uses short-ranged palm blasts.' },
+            },
+            {
+                { type = 'text', value = 'Possesses neither TP moves nor abilities that utilize TP.' },
+            },
+            {
+                { type = 'text', value = 'Ajido-Marujido prioritizes' },
+                { type = 'link', text = 'Dispel', url = 'https://www.bg-wiki.com/ffxi/Dispel' },
+                { type = 'text', value = 'over' },
+                { type = 'link', text = 'elemental spells.', url = 'https://www.bg-wiki.com/ffxi/Category:Elemental_Magic' },
+            },
+            {
+                { type = 'text', value = 'Ajido-Marujido will not attempt to cast' },
+                { type = 'link', text = 'elemental', url = 'https://www.bg-wiki.com/ffxi/Category:Elemental_Magic' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'enfeebling', url = 'https://www.bg-wiki.com/ffxi/Category:Enfeebling_Magic' },
+                { type = 'text', value = 'magic on an enemy that is sure to' },
+                { type = 'link', text = 'resist', url = 'https://www.bg-wiki.com/ffxi/SDT' },
+                { type = 'text', value = 'it.' },
+            },
+            {
+                { type = 'text', value = 'When he draws' },
+                { type = 'link', text = 'hate,', url = 'https://www.bg-wiki.com/ffxi/Enmity' },
+                { type = 'text', value = 'he will stop casting spells and start to use his weak attacks until the enemy attacks someone else.' },
+            },
+            {
+                { type = 'text', value = 'Ajido-Marujido has higher ratings in his' },
+                { type = 'link', text = 'magic skills', url = 'https://www.bg-wiki.com/ffxi/Black_Mage#Combat_Skills' },
+                { type = 'text', value = 'than normal black mages.' },
+            },
+        },
+    },
+    ['Ark Angel TT'] = {
+        name = 'Ark Angel TT',
+        job = {
+            {
+                { type = 'link', text = 'Black Mage', url = 'https://www.bg-wiki.com/ffxi/Black_Mage' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Dark Knight', url = 'https://www.bg-wiki.com/ffxi/Dark_Knight' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Single-target elemental nukes I - V,', url = 'https://www.bg-wiki.com/ffxi/Category:Elemental_Magic' },
+                { type = 'link', text = 'Sleepga', url = 'https://www.bg-wiki.com/ffxi/Sleepga' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'II,', url = 'https://www.bg-wiki.com/ffxi/Sleepga_II' },
+                { type = 'link', text = 'Bio', url = 'https://www.bg-wiki.com/ffxi/Bio' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'II,', url = 'https://www.bg-wiki.com/ffxi/Bio_II' },
+                { type = 'link', text = 'Poison', url = 'https://www.bg-wiki.com/ffxi/Poison' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'II,', url = 'https://www.bg-wiki.com/ffxi/Poison_II' },
+                { type = 'link', text = 'Aspir,', url = 'https://www.bg-wiki.com/ffxi/Aspir' },
+                { type = 'link', text = 'Stun', url = 'https://www.bg-wiki.com/ffxi/Stun' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Elemental Seal,', url = 'https://www.bg-wiki.com/ffxi/Elemental_Seal' },
+                { type = 'link', text = 'Last Resort,', url = 'https://www.bg-wiki.com/ffxi/Last_Resort' },
+                { type = 'link', text = 'Souleater', url = 'https://www.bg-wiki.com/ffxi/Souleater' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Guillotine', url = 'https://www.bg-wiki.com/ffxi/Guillotine' },
+                { type = 'skillchain', value = 'Induration' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Amon Drive', url = 'https://www.bg-wiki.com/index.php?title=Amon_Drive&amp;action=edit&amp;redlink=1' },
+                { type = 'text', value = '(AoE' },
+                { type = 'link', text = 'Paralyze', url = 'https://www.bg-wiki.com/ffxi/Paralyze' },
+                { type = 'text', value = '+' },
+                { type = 'link', text = 'Petrify', url = 'https://www.bg-wiki.com/ffxi/Petrify' },
+                { type = 'text', value = ')' },
+                { type = 'skillchain', value = 'Status_Ability' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Ark TT', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Ark_TT' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'text', value = 'Complete' },
+                { type = 'link', text = 'Dawn', url = 'https://www.bg-wiki.com/ffxi/Dawn' },
+                { type = 'text', value = 'and all its cutscenes.' },
+            },
+            {
+                { type = 'text', value = 'Be in possession of the' },
+                { type = 'link', text = 'Bundle of scrolls', url = 'https://www.bg-wiki.com/ffxi/Bundle_of_scrolls' },
+                { type = 'text', value = 'key item.' },
+            },
+            {
+                { type = 'text', value = 'Have obtained the additional following Trust spells: Rainemard, Ark Angel GK, Ark Angel EV, & Ark Angel MR' },
+            },
+            {
+                { type = 'text', value = 'Speak with' },
+                { type = 'link', text = 'Jamal', url = 'https://www.bg-wiki.com/ffxi/Jamal' },
+                { type = 'text', value = 'in' },
+                { type = 'link', text = "Ru'Lude Gardens", url = 'https://www.bg-wiki.com/ffxi/Ru%27Lude_Gardens' },
+                { type = 'text', value = '(H-5).' },
+            },
+            {
+                { type = 'text', value = "After trading Ark Angel MR 's cipher, you must speak to" },
+                { type = 'link', text = 'Jamal,', url = 'https://www.bg-wiki.com/ffxi/Jamal' },
+                { type = 'text', value = 'zone, and speak to' },
+                { type = 'link', text = 'Jamal', url = 'https://www.bg-wiki.com/ffxi/Jamal' },
+                { type = 'text', value = 'again to unlock the Objective for' },
+                { type = 'link', text = 'Cipher: Ark TT.', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Ark_TT' },
+                { type = 'text', value = 'Be sure before zoning' },
+                { type = 'link', text = 'Jamal', url = 'https://www.bg-wiki.com/ffxi/Jamal' },
+                { type = 'text', value = 'asks you to "Please come by again later."' },
+            },
+            {
+                { type = 'text', value = 'Complete the' },
+                { type = 'link', text = 'Records of Eminence Objective:', url = 'https://www.bg-wiki.com/ffxi/Category:Records_of_Eminence#RoE_Quests_3' },
+                { type = 'text', value = 'Overcome your Cowardice Warp to' },
+                { type = 'link', text = "Tu'Lia", url = 'https://www.bg-wiki.com/ffxi/Tu%27Lia' },
+                { type = 'text', value = '→' },
+                { type = 'link', text = "Ru'Aun Gardens", url = 'https://www.bg-wiki.com/ffxi/Ru%27Aun_Gardens' },
+                { type = 'text', value = '#2 to battle the Ark Angel with a' },
+                { type = 'link', text = 'Phantom gem of cowardice', url = 'https://www.bg-wiki.com/ffxi/Phantom_gem_of_cowardice' },
+                { type = 'text', value = 'on any difficulty. Players will be unable to receive the alter ego when trading the Cipher if they have not completed the' },
+                { type = 'link', text = "Rhapsodies of Vana'diel", url = 'https://www.bg-wiki.com/ffxi/Rhapsodies_of_Vana%27diel' },
+                { type = 'text', value = 'mission "' },
+                { type = 'link', text = 'Exploring the Ruins.', url = 'https://www.bg-wiki.com/ffxi/Exploring_the_Ruins' },
+                { type = 'text', value = '" Completing that cutscene/mission will allow the cipher to be traded.' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses HP+20%, MP+50%' },
+            },
+            {
+                { type = 'text', value = 'Ark Angel Tarutaru uses' },
+                { type = 'link', text = 'Last Resort', url = 'https://www.bg-wiki.com/ffxi/Last_Resort' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = 'Souleater', url = 'https://www.bg-wiki.com/ffxi/Souleater' },
+                { type = 'text', value = 'whenever the recast is ready and tries to keep up' },
+                { type = 'link', text = 'Poison', url = 'https://www.bg-wiki.com/ffxi/Poison' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = 'Bio', url = 'https://www.bg-wiki.com/ffxi/Bio' },
+                { type = 'text', value = 'fulltime on the enemy.' },
+            },
+            {
+                { type = 'text', value = 'At the start of the fight and each time after using Amon Drive, he casts' },
+                { type = 'link', text = 'Sleepga,', url = 'https://www.bg-wiki.com/ffxi/Sleepga' },
+                { type = 'text', value = 'augmented by Elemental Seal if the recast is ready.' },
+            },
+            {
+                { type = 'text', value = 'He only uses elemental spells to magic burst skillchains, often trying to burst two spells on the same skillchain (the second burst failing most of the time due to high casting times).' },
+            },
+            {
+                { type = 'link', text = 'Aspir', url = 'https://www.bg-wiki.com/ffxi/Aspir' },
+                { type = 'text', value = 'is used to burst' },
+                { type = 'link', text = 'Compression', url = 'https://www.bg-wiki.com/ffxi/Compression' },
+                { type = 'text', value = '-skillchains and also casted freely when his MP is below 50%, but are only used against enemies which have MP.' },
+            },
+            {
+                { type = 'text', value = 'Will also' },
+                { type = 'link', text = 'Sleep', url = 'https://www.bg-wiki.com/ffxi/Sleep' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Sleep II', url = 'https://www.bg-wiki.com/ffxi/Sleep_II' },
+                { type = 'text', value = 'single target enemies.' },
+            },
+            {
+                { type = 'text', value = 'Casts' },
+                { type = 'link', text = 'Stun', url = 'https://www.bg-wiki.com/ffxi/Stun' },
+                { type = 'text', value = 'based on enemy TP moves.' },
+            },
+            {
+                { type = 'text', value = 'Uses weapon skills at 2000 TP and does not try to skillchain.' },
+            },
+            {
+                { type = 'text', value = 'Avoids casting spells that would be resisted.' },
+            },
+            {
+                { type = 'link', text = 'Elemental Seal', url = 'https://www.bg-wiki.com/ffxi/Elemental_Seal' },
+                { type = 'text', value = 'prioritized' },
+                { type = 'link', text = 'Sleep', url = 'https://www.bg-wiki.com/ffxi/Sleep' },
+                { type = 'text', value = 'spells, but can be used for' },
+                { type = 'link', text = 'Poison II', url = 'https://www.bg-wiki.com/ffxi/Poison_II' },
+                { type = 'text', value = 'on Sleep-immune enemies.' },
+            },
+            {
+                { type = 'text', value = "Does not magic burst targets where he doesn't have enough magic accuracy." },
+            },
+        },
+    },
+    ['Domina Shantotto'] = {
+        name = 'Domina Shantotto',
+        job = {
+            {
+                { type = 'link', text = 'Black Mage', url = 'https://www.bg-wiki.com/ffxi/Black_Mage' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Dark Knight', url = 'https://www.bg-wiki.com/ffxi/Dark_Knight' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Single-target elemental nukes I - V', url = 'https://www.bg-wiki.com/ffxi/Category:Elemental_Magic' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Guillotine', url = 'https://www.bg-wiki.com/ffxi/Guillotine' },
+                { type = 'skillchain', value = 'Induration' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Cross Reaper', url = 'https://www.bg-wiki.com/ffxi/Cross_Reaper' },
+                { type = 'skillchain', value = 'Distortion' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Shadow of Death', url = 'https://www.bg-wiki.com/ffxi/Shadow_of_Death' },
+                { type = 'skillchain', value = 'Induration' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Reverberation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Salvation Scythe', url = 'https://www.bg-wiki.com/index.php?title=Salvation_Scythe&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Dark' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Domina', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Domina' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Repeat Login Campaign', url = 'https://www.bg-wiki.com/ffxi/Repeat_Login_Campaign' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Red)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Red)' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Starts battles with Tier V nukes before meleeing.' },
+            },
+            {
+                { type = 'text', value = "Occasionally nukes as long as she isn't in the top enmity slot, does not try to magic burst." },
+            },
+            {
+                { type = 'text', value = 'Spells are used more often against enemies resistant to slashing damage, such as elementals.' },
+            },
+            {
+                { type = 'text', value = 'Only uses darkness-aligned elemental spells (), ignoring enemy weakness.' },
+            },
+            {
+                { type = 'text', value = 'Salvation Scythe inflicts' },
+                { type = 'link', text = 'Poison,', url = 'https://www.bg-wiki.com/ffxi/Poison' },
+                { type = 'link', text = 'Bio,', url = 'https://www.bg-wiki.com/ffxi/Bio' },
+                { type = 'link', text = 'Paralyze', url = 'https://www.bg-wiki.com/ffxi/Paralyze' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = 'Slow.', url = 'https://www.bg-wiki.com/ffxi/Slow' },
+            },
+            {
+                { type = 'text', value = 'Uses weapon skills at 1000 TP.' },
+            },
+        },
+    },
+    ['Gadalar'] = {
+        name = 'Gadalar',
+        job = {
+            {
+                { type = 'link', text = 'Black Mage', url = 'https://www.bg-wiki.com/ffxi/Black_Mage' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Black Mage', url = 'https://www.bg-wiki.com/ffxi/Black_Mage' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Firaga I - III,', url = 'https://www.bg-wiki.com/ffxi/Firaga_III' },
+                { type = 'link', text = 'Blaze Spikes', url = 'https://www.bg-wiki.com/ffxi/Blaze_Spikes' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Spinning Scythe', url = 'https://www.bg-wiki.com/ffxi/Spinning_Scythe' },
+                { type = 'skillchain', value = 'Reverberation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Spiral Hell', url = 'https://www.bg-wiki.com/ffxi/Spiral_Hell' },
+                { type = 'skillchain', value = 'Distortion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Salamander Flame', url = 'https://www.bg-wiki.com/ffxi/Salamander_Flame' },
+                { type = 'text', value = '(aoe fire)' },
+                { type = 'skillchain', value = 'Light' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Fusion' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Vorpal Scythe', url = 'https://www.bg-wiki.com/ffxi/Vorpal_Scythe' },
+                { type = 'skillchain', value = 'Transfixion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Scission' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Complete' },
+                { type = 'link', text = 'Embers of His Past.', url = 'https://www.bg-wiki.com/ffxi/Embers_of_His_Past' },
+            },
+            {
+                { type = 'text', value = 'Speak to' },
+                { type = 'link', text = 'Fari-Wari', url = 'https://www.bg-wiki.com/ffxi/Fari-Wari' },
+                { type = 'text', value = 'in' },
+                { type = 'link', text = 'Aht Urhgan Whitegate', url = 'https://www.bg-wiki.com/ffxi/Aht_Urhgan_Whitegate' },
+                { type = 'text', value = '(K-12). Players will be unable to receive the alter ego if he is being held prisoner by beastmen forces in Besieged.' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses MP+25%,' },
+                { type = 'link', text = 'Magic Attack Bonus', url = 'https://www.bg-wiki.com/ffxi/Magic_Attack_Bonus' },
+                { type = 'text', value = '+25' },
+            },
+            {
+                { type = 'text', value = 'Favors' },
+                { type = 'link', text = 'Firaga III', url = 'https://www.bg-wiki.com/ffxi/Firaga_III' },
+                { type = 'text', value = 'regardless of surrounding enemies.' },
+            },
+            {
+                { type = 'text', value = 'Avoids casting spells that would have a low' },
+                { type = 'link', text = 'Magic Hit Rate,', url = 'https://www.bg-wiki.com/ffxi/Magic_Hit_Rate' },
+                { type = 'text', value = 'also uses lower tier spells depending on magic accuracy and level.' },
+            },
+            {
+                { type = 'text', value = 'Gadalar recovers MP when he is hit with physical attacks.' },
+            },
+            {
+                { type = 'text', value = 'Uses TP as soon as he gets it.' },
+            },
+            {
+                { type = 'text', value = 'Favors' },
+                { type = 'link', text = 'Salamander Flame,', url = 'https://www.bg-wiki.com/ffxi/Salamander_Flame' },
+                { type = 'text', value = 'a unique AoE weapon skill that also applies' },
+                { type = 'link', text = 'Dia III', url = 'https://www.bg-wiki.com/ffxi/Dia_III' },
+                { type = 'text', value = 'for 30 seconds.' },
+            },
+        },
+    },
+    ['Ingrid'] = {
+        name = 'Ingrid',
+        job = {
+            {
+                { type = 'link', text = 'White Mage', url = 'https://www.bg-wiki.com/ffxi/White_Mage' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'White Mage', url = 'https://www.bg-wiki.com/ffxi/White_Mage' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Haste,', url = 'https://www.bg-wiki.com/ffxi/Haste' },
+                { type = 'link', text = 'Banish I - III,', url = 'https://www.bg-wiki.com/ffxi/Category:Banish_Spells' },
+                { type = 'link', text = 'Cursna', url = 'https://www.bg-wiki.com/ffxi/Cursna' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Seraph Strike', url = 'https://www.bg-wiki.com/ffxi/Seraph_Strike' },
+                { type = 'skillchain', value = 'Impaction' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Judgment', url = 'https://www.bg-wiki.com/ffxi/Judgment' },
+                { type = 'skillchain', value = 'Impaction' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Hexa Strike', url = 'https://www.bg-wiki.com/ffxi/Hexa_Strike' },
+                { type = 'skillchain', value = 'Fusion' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Complete' },
+                { type = 'link', text = 'The Merciless One.', url = 'https://www.bg-wiki.com/ffxi/The_Merciless_One' },
+            },
+            {
+                { type = 'text', value = 'Speak with' },
+                { type = 'link', text = 'Rigobertine', url = 'https://www.bg-wiki.com/ffxi/Rigobertine' },
+                { type = 'text', value = 'in' },
+                { type = 'link', text = 'Eastern Adoulin', url = 'https://www.bg-wiki.com/ffxi/Eastern_Adoulin' },
+                { type = 'text', value = '(J-7). Players will be unable to receive the alter ego between the time the mission' },
+                { type = 'link', text = 'Beauty and the Beast', url = 'https://www.bg-wiki.com/ffxi/Beauty_and_the_Beast' },
+                { type = 'text', value = 'is undertaken and the mission' },
+                { type = 'link', text = 'Glimmer of Portent', url = 'https://www.bg-wiki.com/ffxi/Glimmer_of_Portent' },
+                { type = 'text', value = 'is completed.' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses' },
+                { type = 'link', text = 'Undead Killer,', url = 'https://www.bg-wiki.com/ffxi/Undead_Killer' },
+                { type = 'link', text = 'Banish', url = 'https://www.bg-wiki.com/ffxi/Category:Banish_Spells' },
+                { type = 'text', value = 'effectiveness vs' },
+                { type = 'link', text = 'Undead', url = 'https://www.bg-wiki.com/ffxi/Category:Undead' },
+                { type = 'text', value = '+10 (28/256) .' },
+            },
+            {
+                { type = 'text', value = 'Engages and closes in to melee her target. (Ingrid gains 100 TP/hit)' },
+            },
+            {
+                { type = 'text', value = 'Holds up to 1500 TP in order to close skillchains.' },
+            },
+            {
+                { type = 'text', value = 'Cycles through Banish spells (highest tier to lowest), making her useful for' },
+                { type = 'link', text = 'Undead', url = 'https://www.bg-wiki.com/ffxi/Undead' },
+                { type = 'text', value = 'targets.' },
+            },
+            {
+                { type = 'text', value = 'Places extreme priority on using' },
+                { type = 'link', text = 'Cursna', url = 'https://www.bg-wiki.com/ffxi/Cursna' },
+                { type = 'text', value = 'should any party members be Doomed/Cursed.' },
+            },
+            {
+                { type = 'text', value = 'Casts' },
+                { type = 'link', text = 'Haste', url = 'https://www.bg-wiki.com/ffxi/Haste' },
+                { type = 'text', value = 'on the player regardless of job and on other party members with melee jobs.' },
+            },
+        },
+    },
+    ['Kayeel-Payeel'] = {
+        name = 'Kayeel-Payeel',
+        job = {
+            {
+                { type = 'link', text = 'Black Mage', url = 'https://www.bg-wiki.com/ffxi/Black_Mage' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Summoner', url = 'https://www.bg-wiki.com/ffxi/Summoner' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Single-target elemental nukes I - V,', url = 'https://www.bg-wiki.com/ffxi/Category:Elemental_Magic' },
+                { type = 'link', text = 'Multi-target elemental nukes I - III, -aja,', url = 'https://www.bg-wiki.com/ffxi/Category:Elemental_Magic' },
+                { type = 'link', text = 'Ancient Magic', url = 'https://www.bg-wiki.com/ffxi/Ancient_Magic' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'II', url = 'https://www.bg-wiki.com/ffxi/Ancient_Magic_II' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Gate of Tartarus', url = 'https://www.bg-wiki.com/ffxi/Gate_of_Tartarus' },
+                { type = 'skillchain', value = 'Dark' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Distortion' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Tartarus Torpor', url = 'https://www.bg-wiki.com/ffxi/Tartarus_Torpor' },
+                { type = 'text', value = '(AOE Sleep, M.Def/M.Eva down)' },
+                { type = 'skillchain', value = 'Status_Ability' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Sunburst', url = 'https://www.bg-wiki.com/ffxi/Sunburst' },
+                { type = 'skillchain', value = 'Compression' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Reverberation' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Kayeel', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Kayeel' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Repeat Login Campaign', url = 'https://www.bg-wiki.com/ffxi/Repeat_Login_Campaign' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Kayeel-Payeel has a very high amount of' },
+                { type = 'link', text = 'Fast Cast', url = 'https://www.bg-wiki.com/ffxi/Fast_Cast' },
+                { type = 'text', value = 'and tries to magic burst spells.' },
+            },
+            {
+                { type = 'text', value = 'He can only cast spells of the' },
+                { type = 'link', text = 'Ice', url = 'https://www.bg-wiki.com/ffxi/Blizzard' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = 'Lightning', url = 'https://www.bg-wiki.com/ffxi/Thunder' },
+                { type = 'text', value = 'elements, ignores enemy weaknesses.' },
+            },
+            {
+                { type = 'text', value = 'Quickly burns through his MP with spells like' },
+                { type = 'link', text = 'Burst II', url = 'https://www.bg-wiki.com/ffxi/Burst_II' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Freeze II', url = 'https://www.bg-wiki.com/ffxi/Freeze_II' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = '-aja III', url = 'https://www.bg-wiki.com/ffxi/Category:Elemental_Magic' },
+                { type = 'text', value = 'spells.' },
+            },
+            {
+                { type = 'text', value = 'He benefits from the relic aftermath of' },
+                { type = 'link', text = 'Gate of Tartarus', url = 'https://www.bg-wiki.com/ffxi/Gate_of_Tartarus' },
+                { type = 'text', value = '(refresh 8 mp/tick) and will use it when he runs out of MP.' },
+            },
+            {
+                { type = 'text', value = 'Does not engage, but will attack with his staff if the enemy is nearby.' },
+            },
+            {
+                { type = 'text', value = 'Uses weapon skills at 1500 TP but does not try to skillchain.' },
+            },
+        },
+    },
+    ['Kukki-Chebukki'] = {
+        name = 'Kukki-Chebukki',
+        job = {
+            {
+                { type = 'link', text = 'Black Mage', url = 'https://www.bg-wiki.com/ffxi/Black_Mage' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Black Mage', url = 'https://www.bg-wiki.com/ffxi/Black_Mage' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Single-target elemental nukes I - V,', url = 'https://www.bg-wiki.com/ffxi/Category:Elemental_Magic' },
+                { type = 'link', text = 'Multi-target elemental nukes I - III, -aja,', url = 'https://www.bg-wiki.com/ffxi/Category:Elemental_Magic' },
+                { type = 'link', text = 'Elemental Debuff spells,', url = 'https://www.bg-wiki.com/ffxi/Category:Elemental_Debuff' },
+                { type = 'link', text = 'Sleepga I - II', url = 'https://www.bg-wiki.com/ffxi/Sleepga' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Kukki', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Kukki' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Repeat Login Campaign', url = 'https://www.bg-wiki.com/ffxi/Repeat_Login_Campaign' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = "Tries to stay a distance (~15') away from the monster when he doesn't have hate." },
+            },
+            {
+                { type = 'text', value = 'Kukki-Chebukki just uses spells matching the element the current day.' },
+            },
+            {
+                { type = 'text', value = 'On Darksday, he only casts' },
+                { type = 'link', text = 'Sleepga II', url = 'https://www.bg-wiki.com/ffxi/Sleepga_II' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = 'Sleepga', url = 'https://www.bg-wiki.com/ffxi/Sleepga' },
+                { type = 'text', value = "(doesn't have Bio, Drain, or Aspir)." },
+            },
+            {
+                { type = 'text', value = 'On Lightsday, does nothing along with Makki-Chebukki since he has no Light-based spells.' },
+            },
+            {
+                { type = 'text', value = 'Casts lower-tier spells against enemies with low HP to conserve MP.' },
+            },
+            {
+                { type = 'text', value = 'Gains TP from' },
+                { type = 'link', text = 'Occult Acumen', url = 'https://www.bg-wiki.com/ffxi/Occult_Acumen' },
+                { type = 'text', value = "trait but can't use it." },
+            },
+        },
+    },
+    ['Leonoyne'] = {
+        name = 'Leonoyne',
+        job = {
+            {
+                { type = 'link', text = 'Black Mage', url = 'https://www.bg-wiki.com/ffxi/Black_Mage' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Paladin', url = 'https://www.bg-wiki.com/ffxi/Paladin' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Ice Spikes,', url = 'https://www.bg-wiki.com/ffxi/Ice_Spikes' },
+                { type = 'link', text = 'Blizzaga I - III', url = 'https://www.bg-wiki.com/ffxi/Category:Blizzard_Spells' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Freezebite', url = 'https://www.bg-wiki.com/ffxi/Freezebite' },
+                { type = 'skillchain', value = 'Induration' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Detonation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Herculean Slash', url = 'https://www.bg-wiki.com/ffxi/Herculean_Slash' },
+                { type = 'skillchain', value = 'Induration' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Detonation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Impaction' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Shockwave', url = 'https://www.bg-wiki.com/ffxi/Shockwave' },
+                { type = 'skillchain', value = 'Reverberation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Spine Chiller', url = 'https://www.bg-wiki.com/ffxi/Spine_Chiller' },
+                { type = 'text', value = '(Terror)' },
+                { type = 'skillchain', value = 'Distortion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Detonation' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Leonoyne', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Leonoyne' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Repeat Login Campaign', url = 'https://www.bg-wiki.com/ffxi/Repeat_Login_Campaign' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses MP+25%' },
+            },
+            {
+                { type = 'text', value = 'Spine Chiller causes a short duration' },
+                { type = 'link', text = 'Terror', url = 'https://www.bg-wiki.com/ffxi/Terror' },
+                { type = 'text', value = 'effect (Extremely low proc rate).' },
+            },
+            {
+                { type = 'text', value = 'Casts' },
+                { type = 'link', text = 'Ice Spikes', url = 'https://www.bg-wiki.com/ffxi/Ice_Spikes' },
+                { type = 'text', value = 'if its not active.' },
+            },
+            {
+                { type = 'text', value = 'WSs at 1000% regardless of SC condition.' },
+            },
+            {
+                { type = 'text', value = 'Favors' },
+                { type = 'link', text = 'Blizzaga III', url = 'https://www.bg-wiki.com/ffxi/Blizzaga_III' },
+                { type = 'text', value = 'regardless of surrounding enemies.' },
+            },
+            {
+                { type = 'text', value = 'Avoids casting spells that would have a low' },
+                { type = 'link', text = 'Magic Hit Rate,', url = 'https://www.bg-wiki.com/ffxi/Magic_Hit_Rate' },
+                { type = 'text', value = 'also uses lower tier spells depending on magic accuracy and level.' },
+            },
+            {
+                { type = 'text', value = 'Has permanent' },
+                { type = 'link', text = 'Enblizzard', url = 'https://www.bg-wiki.com/ffxi/Enblizzard' },
+                { type = 'text', value = 'effect (30+ damage even at low levels).' },
+            },
+            {
+                { type = 'text', value = 'Leonyone recovers MP when he is hit with physical attacks.' },
+            },
+        },
+    },
+    ['Mumor II'] = {
+        name = 'Mumor II',
+        job = {
+            {
+                { type = 'link', text = 'Black Mage', url = 'https://www.bg-wiki.com/ffxi/Black_Mage' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Dancer', url = 'https://www.bg-wiki.com/ffxi/Dancer' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Single-target elemental nukes I - V,', url = 'https://www.bg-wiki.com/ffxi/Category:Elemental_Magic' },
+                { type = 'link', text = 'Stun,', url = 'https://www.bg-wiki.com/ffxi/Stun' },
+                { type = 'text', value = '-ja Spells (Magic Burst + Aura only)' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'text', value = 'Firesday Night Fever (boost to all status, grants visible aura)' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Lovely Miracle Waltz', url = 'https://www.bg-wiki.com/index.php?title=Lovely_Miracle_Waltz&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Liquefaction' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Impaction' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Shining Summer Samba', url = 'https://www.bg-wiki.com/index.php?title=Shining_Summer_Samba&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Liquefaction' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Transfixion' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Neo Crystal Jig', url = 'https://www.bg-wiki.com/index.php?title=Neo_Crystal_Jig&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Fusion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Transfixion' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Super Crusher Jig', url = 'https://www.bg-wiki.com/index.php?title=Super_Crusher_Jig&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Gravitation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Reverberation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Eternal Vana Illusion', url = 'https://www.bg-wiki.com/index.php?title=Eternal_Vana_Illusion&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Fusion' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Final Eternal Heart', url = 'https://www.bg-wiki.com/index.php?title=Final_Eternal_Heart&amp;action=edit&amp;redlink=1' },
+                { type = 'text', value = '(AoE)' },
+                { type = 'skillchain', value = 'Fragmentation' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Mumor II', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Mumor_II' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Sunbreeze Festivals', url = 'https://www.bg-wiki.com/ffxi/Sunbreeze_Festival' },
+            },
+            {
+                { type = 'text', value = 'You have to get a "perfect score" (8 dancing syncs) twice. (First to get the costume outfit, and then a second time in said outfit to get the Trust Cipher.)' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses HP+15%' },
+            },
+            {
+                { type = 'text', value = "Uses highest-tier elemental magic spell available, avoids casting spells that the enemy is resistant to but doesn't accurately target enemy weaknesses." },
+            },
+            {
+                { type = 'text', value = 'Tends to run out of MP very quickly. Firesday Night Fever will fully recover MP, but she only uses it at low HP' },
+            },
+            {
+                { type = 'text', value = 'Stays in melee range and attacks with her wands, does not appear to be affected by' },
+                { type = 'link', text = 'Haste', url = 'https://www.bg-wiki.com/ffxi/Haste' },
+            },
+            {
+                { type = 'text', value = 'Casts' },
+                { type = 'link', text = 'Stun', url = 'https://www.bg-wiki.com/ffxi/Stun' },
+                { type = 'text', value = 'to interrupt enemy TP moves' },
+            },
+            {
+                { type = 'text', value = 'Firesday Night Fever (5 min cooldown, ~4 min duration)' },
+            },
+            {
+                { type = 'text', value = "When her HP drops below 50%, uses Firesday Night Fever if it's available which fully recovers her HP and MP" },
+            },
+            {
+                { type = 'text', value = 'Has a pink sparkling aura' },
+            },
+            {
+                { type = 'text', value = 'No longer freely casts single target nukes. Only casts during magic burst using -ja spells or to cast' },
+                { type = 'link', text = 'Stun', url = 'https://www.bg-wiki.com/ffxi/Stun' },
+            },
+            {
+                { type = 'text', value = 'Will use her weapon skills in this order: Neo Crystal Jig -> Super Crusher Jig -> Eternal Vana Illusion-> Final Eternal Heart (aoe)' },
+            },
+            {
+                { type = 'text', value = 'Firesday Night Fever ends when she uses Final Eternal Heart*' },
+            },
+            {
+                { type = 'text', value = 'Firesday Night Fever lasts about 4 minutes, based on her low attack rate and TP gain' },
+            },
+            {
+                { type = 'text', value = '*There is a glitch where if Mumor lands the finishing blow on an enemy with Final Eternal Heart: the aura does not stop, she no longer uses weapon skills, and cannot re-activate Firesday Night Fever to heal herself.' },
+            },
+        },
+    },
+    ['Ovjang'] = {
+        name = 'Ovjang',
+        job = {
+            {
+                { type = 'link', text = 'Red Mage', url = 'https://www.bg-wiki.com/ffxi/Red_Mage' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Black Mage', url = 'https://www.bg-wiki.com/ffxi/Black_Mage' },
+                { type = 'text', value = '"' },
+                { type = 'link', text = 'Stormwaker', url = 'https://www.bg-wiki.com/ffxi/Stormwaker' },
+                { type = 'text', value = '"' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Slow,', url = 'https://www.bg-wiki.com/ffxi/Slow' },
+                { type = 'link', text = 'Silence,', url = 'https://www.bg-wiki.com/ffxi/Silence' },
+                { type = 'link', text = 'Paralyze,', url = 'https://www.bg-wiki.com/ffxi/Paralyze' },
+                { type = 'link', text = 'Dispel,', url = 'https://www.bg-wiki.com/ffxi/Dispel' },
+                { type = 'link', text = 'Single-target elemental nukes I - IV', url = 'https://www.bg-wiki.com/ffxi/Category:Elemental_Magic' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Sixth Element', url = 'https://www.bg-wiki.com/ffxi/Sixth_Element' },
+                { type = 'skillchain', value = 'Dark' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Gravitation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Knockout', url = 'https://www.bg-wiki.com/ffxi/Knockout' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Detonation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Slapstick', url = 'https://www.bg-wiki.com/ffxi/Slapstick' },
+                { type = 'skillchain', value = 'Reverberation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Impaction' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Ovjang', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Ovjang' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Repeat Login Campaign', url = 'https://www.bg-wiki.com/ffxi/Repeat_Login_Campaign' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses MP+20%' },
+            },
+            {
+                { type = 'text', value = 'Holds TP until 1500 to try to close skillchains.' },
+            },
+            {
+                { type = 'text', value = 'Gains TP slowly: she occasionally attacks between casts.' },
+            },
+            {
+                { type = 'text', value = 'Prioritizes' },
+                { type = 'link', text = 'Dispel.', url = 'https://www.bg-wiki.com/ffxi/Dispel' },
+            },
+            {
+                { type = 'text', value = 'Prefers' },
+                { type = 'link', text = 'Sixth Element.', url = 'https://www.bg-wiki.com/ffxi/Sixth_Element' },
+            },
+        },
+    },
+    ['Robel-Akbel'] = {
+        name = 'Robel-Akbel',
+        job = {
+            {
+                { type = 'link', text = 'Black Mage', url = 'https://www.bg-wiki.com/ffxi/Black_Mage' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Summoner', url = 'https://www.bg-wiki.com/ffxi/Summoner' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Single-target elemental nukes I - V, -aja,', url = 'https://www.bg-wiki.com/ffxi/Category:Elemental_Magic' },
+                { type = 'link', text = 'Stun', url = 'https://www.bg-wiki.com/ffxi/Stun' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Spirit Taker', url = 'https://www.bg-wiki.com/ffxi/Spirit_Taker' },
+                { type = 'skillchain', value = 'Status_Ability' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Null Blast', url = 'https://www.bg-wiki.com/index.php?title=Null_Blast&amp;action=edit&amp;redlink=1' },
+                { type = 'text', value = '(restores MP equal to damage dealt)' },
+                { type = 'skillchain', value = 'Fusion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Compression' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Quietus Sphere', url = 'https://www.bg-wiki.com/index.php?title=Quietus_Sphere&amp;action=edit&amp;redlink=1' },
+                { type = 'text', value = '(AOE Dark)' },
+                { type = 'skillchain', value = 'Dark' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Gravitation' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Robel-Akbel', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Robel-Akbel' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Repeat Login Campaign', url = 'https://www.bg-wiki.com/ffxi/Repeat_Login_Campaign' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Robel-Akbel avoids casting elemental magic that his target would resist. Does not accurately target weaknesses.' },
+            },
+            {
+                { type = 'text', value = 'Attempts to magic burst off skillchains using -aja tier spells.' },
+            },
+            {
+                { type = 'text', value = 'Robel will often try to double burst a skillchain but rarely succeeds without some kind of external fast cast bonus.' },
+            },
+            {
+                { type = 'text', value = 'Robel-Akbel will use elemental magic of a tier that is sufficient to KO his current target (assuming the attack is not resisted), thus conserving his MP for future battles.' },
+            },
+            {
+                { type = 'text', value = 'Unlike most magic wielding trusts, Robel-Akbel can sustain his magic attacks for long periods of time due to Occult Acumen and Null Blast (which he prioritizes when low on MP).' },
+            },
+            {
+                { type = 'text', value = 'Casts' },
+                { type = 'link', text = 'Stun', url = 'https://www.bg-wiki.com/ffxi/Stun' },
+                { type = 'text', value = 'in response to enemy TP moves.' },
+            },
+            {
+                { type = 'text', value = 'Will stand in place after engaging, only attacking enemies with his staff if they are within melee range.' },
+            },
+            {
+                { type = 'text', value = 'Gains TP from casting spells and can use certain weapon skills at range.' },
+            },
+            {
+                { type = 'text', value = 'Uses weapon skills at 2000 TP. Does not try to skillchain.' },
+            },
+            {
+                { type = 'text', value = 'Null Blast - Converts damage dealt to MP. Additional effect: Magic evasion down.' },
+            },
+        },
+    },
+    ['Rosulatia'] = {
+        name = 'Rosulatia',
+        job = {
+            {
+                { type = 'link', text = 'Black Mage', url = 'https://www.bg-wiki.com/ffxi/Black_Mage' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Dark Knight', url = 'https://www.bg-wiki.com/ffxi/Dark_Knight' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Stone I-V', url = 'https://www.bg-wiki.com/ffxi/Category:Stone_Spells' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Baneful Blades', url = 'https://www.bg-wiki.com/index.php?title=Baneful_Blades&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Status_Ability' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Depraved Dandia', url = 'https://www.bg-wiki.com/index.php?title=Depraved_Dandia&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Status_Ability' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Dryad Kiss', url = 'https://www.bg-wiki.com/index.php?title=Dryad_Kiss&amp;action=edit&amp;redlink=1' },
+                { type = 'text', value = '(' },
+                { type = 'link', text = 'Haste', url = 'https://www.bg-wiki.com/ffxi/Haste' },
+                { type = 'text', value = '+' },
+                { type = 'link', text = 'Regen', url = 'https://www.bg-wiki.com/ffxi/Regen' },
+                { type = 'text', value = ')' },
+                { type = 'skillchain', value = 'Status_Ability' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Matriarchal Fiat', url = 'https://www.bg-wiki.com/index.php?title=Matriarchal_Fiat&amp;action=edit&amp;redlink=1' },
+                { type = 'text', value = '(AoE)' },
+                { type = 'skillchain', value = 'Status_Ability' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Wildwood Indignation', url = 'https://www.bg-wiki.com/index.php?title=Wildwood_Indignation&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Status_Ability' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Rosulatia', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Rosulatia' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Sinister Reign', url = 'https://www.bg-wiki.com/ffxi/Sinister_Reign' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+            {
+                { type = 'link', text = 'Records of Eminence', url = 'https://www.bg-wiki.com/ffxi/Records_of_Eminence' },
+                { type = 'text', value = 'Quest' },
+                { type = 'link', text = 'Over Capacity', url = 'https://www.bg-wiki.com/ffxi/Over_Capacity' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses HP+30%, MP+100%' },
+            },
+            {
+                { type = 'text', value = 'Casts only earth elemental magic spells.' },
+            },
+            {
+                { type = 'text', value = 'Like other non-humanoids, has a large amount of max HP and MP.' },
+            },
+            {
+                { type = 'text', value = 'Stops casting spells when in the top enmity slot.' },
+            },
+            {
+                { type = 'text', value = 'Melee attacks are special moves; she does not benefit from' },
+                { type = 'link', text = 'Sambas', url = 'https://www.bg-wiki.com/ffxi/Sambas' },
+                { type = 'text', value = 'or' },
+                { type = 'link', text = 'Haste,', url = 'https://www.bg-wiki.com/ffxi/Haste' },
+                { type = 'text', value = 'but likewise is not affected by' },
+                { type = 'link', text = 'Slow', url = 'https://www.bg-wiki.com/ffxi/Slow' },
+                { type = 'text', value = 'or' },
+                { type = 'link', text = 'Spikes.', url = 'https://www.bg-wiki.com/ffxi/Spikes' },
+            },
+            {
+                { type = 'text', value = 'Tree Spike:, Vines: +' },
+                { type = 'link', text = 'Bind,', url = 'https://www.bg-wiki.com/ffxi/Bind' },
+                { type = 'text', value = 'Twister: +' },
+                { type = 'link', text = 'Silence', url = 'https://www.bg-wiki.com/ffxi/Silence' },
+            },
+            {
+                { type = 'text', value = 'Uses Dryad Kiss at yellow HP (<75%) to gain a strong' },
+                { type = 'link', text = 'Regen', url = 'https://www.bg-wiki.com/ffxi/Regen' },
+                { type = 'text', value = '(amount depends on lvl)' },
+            },
+            {
+                { type = 'text', value = 'Uses TP randomly.' },
+            },
+            {
+                { type = 'text', value = 'Does not try to magic burst.' },
+            },
+            {
+                { type = 'text', value = 'Rosulatia is a plantoid, so she can intimidate beasts and is intimidated by vermin.' },
+            },
+        },
+    },
+    ['Shantotto'] = {
+        name = 'Shantotto',
+        job = {
+            {
+                { type = 'link', text = 'Black Mage', url = 'https://www.bg-wiki.com/ffxi/Black_Mage' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Black Mage', url = 'https://www.bg-wiki.com/ffxi/Black_Mage' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Single-target elemental nukes I - V', url = 'https://www.bg-wiki.com/ffxi/Category:Elemental_Magic' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Complete the initiation quest in' },
+                { type = 'link', text = 'San d’Oria,', url = 'https://www.bg-wiki.com/ffxi/Trust:_San_d%27Oria' },
+                { type = 'link', text = 'Bastok,', url = 'https://www.bg-wiki.com/ffxi/Trust:_Bastok' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = 'Windurst.', url = 'https://www.bg-wiki.com/ffxi/Trust:_Windurst' },
+            },
+            {
+                { type = 'text', value = 'Have obtained the following Trust spells: Kupipi, Nanaa Mihgo, Ajido-Marujido, Excenmille, Curilla, Trion, Ayame, Naji, & Volker' },
+            },
+            {
+                { type = 'text', value = 'Complete' },
+                { type = 'link', text = 'Curses, Foiled A-Golem!?.', url = 'https://www.bg-wiki.com/ffxi/Curses,_Foiled_A-Golem!%3F' },
+            },
+            {
+                { type = 'text', value = 'Speak to' },
+                { type = 'link', text = 'Shantotto', url = 'https://www.bg-wiki.com/ffxi/Shantotto' },
+                { type = 'text', value = 'in' },
+                { type = 'link', text = 'Windurst Walls', url = 'https://www.bg-wiki.com/ffxi/Windurst_Walls' },
+                { type = 'text', value = 'at (K-7).' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'When Shantotto draws hate, she will stop casting until the enemy attacks someone else.' },
+            },
+            {
+                { type = 'text', value = 'Shantotto will use the highest tier of elemental magic she can access by default.' },
+            },
+            {
+                { type = 'text', value = 'If fighting a weaker enemy or an enemy at low HP, Shantotto will use use lower tier spells in order to conserve her MP.' },
+            },
+        },
+    },
+    ['Shantotto II'] = {
+        name = 'Shantotto II',
+        job = {
+            {
+                { type = 'link', text = 'Black Mage', url = 'https://www.bg-wiki.com/ffxi/Black_Mage' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'White Mage', url = 'https://www.bg-wiki.com/ffxi/White_Mage' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Single-target elemental nukes I', url = 'https://www.bg-wiki.com/ffxi/Category:Elemental_Magic' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'text', value = '(5)' },
+                { type = 'link', text = 'Lesson in Pain', url = 'https://www.bg-wiki.com/index.php?title=Lesson_in_Pain&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Distortion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ', (25)' },
+                { type = 'link', text = 'Empirical Research', url = 'https://www.bg-wiki.com/index.php?title=Empirical_Research&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Fragmentation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Transfixion' },
+                { type = 'text', value = ', (50)' },
+                { type = 'link', text = 'Final Exam', url = 'https://www.bg-wiki.com/index.php?title=Final_Exam&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Light' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Fusion' },
+                { type = 'text', value = ', (60)' },
+                { type = 'link', text = 'Doctor’s Orders', url = 'https://www.bg-wiki.com/index.php?title=Doctor%E2%80%99s_Orders&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Dark' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Gravitation' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Shantotto II', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Shantotto_II' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Repeat Login Campaign', url = 'https://www.bg-wiki.com/ffxi/Repeat_Login_Campaign' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses HP-10%, BLM/WHM traits with additional' },
+                { type = 'link', text = 'Magic Burst Bonus', url = 'https://www.bg-wiki.com/ffxi/Magic_Burst_Bonus' },
+                { type = 'text', value = '+30, Elemental Magic Damage+ based on lvl' },
+            },
+            {
+                { type = 'text', value = 'Auto-attacks are magic damage of all elements, damage type is the element with the lowest resistance.' },
+            },
+            {
+                { type = 'text', value = 'Shantotto only uses tier 1 spells; however, she possesses extremely high Elemental Magic Damage+.' },
+            },
+            {
+                { type = 'text', value = 'This Elemental Magic Damage+ only affects spells, unlike the' },
+                { type = 'link', text = 'Magic Damage (Statistic)', url = 'https://www.bg-wiki.com/ffxi/Magic_Damage_(Statistic)' },
+                { type = 'text', value = 'which would affect Weapon Skill and' },
+                { type = 'link', text = 'Skillchain Damage.', url = 'https://www.bg-wiki.com/ffxi/Skillchain_Damage' },
+            },
+            {
+                { type = 'text', value = 'Elemental Magic Damage+ varies by level: +784 at' },
+                { type = 'link', text = 'ilvl 120', url = 'https://www.bg-wiki.com/ffxi/Filled_memory_gem' },
+                { type = 'text', value = '(total of +979 with the standard Magic Damage+195 that caster trusts receive at ilvl)' },
+            },
+            {
+                { type = 'text', value = 'Magic Attack Bonus is the standard amount: BLM Trait value, with an additional +25 at ilvl which may require' },
+                { type = 'link', text = 'Rhapsody in Fuchsia', url = 'https://www.bg-wiki.com/ffxi/Rhapsody_in_Fuchsia' },
+                { type = 'text', value = 'for total of +65.' },
+            },
+            {
+                { type = 'text', value = "Shantotto's tier 1 magic spells are comparable in power to spells appropriate to her actual level." },
+            },
+            {
+                { type = 'text', value = 'As a result of only using tier 1 magic she will almost never run out of MP regardless of the duration of a battle.' },
+            },
+            {
+                { type = 'text', value = 'Shantotto will magic burst any skillchains, and she often double bursts for massive damage in a very short period of time.' },
+            },
+            {
+                { type = 'text', value = 'Due to all of these factors Shantotto is widely regarded as the absolute best trust available for magic damage and magic bursting.' },
+            },
+            {
+                { type = 'text', value = 'However, she has relatively low HP and defenses making her very fragile and susceptible to dying from enemy AoE attacks.' },
+            },
+            {
+                { type = 'text', value = 'When aiming for magic burst and casting normally, avoids casting spells based on enemy' },
+                { type = 'link', text = 'resistances', url = 'https://www.bg-wiki.com/ffxi/Resist' },
+                { type = 'text', value = "but doesn't accurately target weaknesses if multiple elements meet a certain magic accuracy threshold." },
+            },
+            {
+                { type = 'text', value = 'Shantotto will hold up to 2500 TP to close skillchains.' },
+            },
+            {
+                { type = 'text', value = 'Lesson in Pain - Damage and' },
+                { type = 'link', text = 'Magic Evasion Down.', url = 'https://www.bg-wiki.com/ffxi/Magic_Evasion_Down' },
+            },
+            {
+                { type = 'text', value = 'Empirical Research - Damage and 25' },
+                { type = 'link', text = 'Magic Defense Down.', url = 'https://www.bg-wiki.com/ffxi/Magic_Defense_Down' },
+            },
+            {
+                { type = 'text', value = 'Final Exam - Damage.' },
+            },
+            {
+                { type = 'text', value = "Doctor's Orders - Damage." },
+            },
+        },
+    },
+    ['Ullegore'] = {
+        name = 'Ullegore',
+        job = {
+            {
+                { type = 'link', text = 'Black Mage', url = 'https://www.bg-wiki.com/ffxi/Black_Mage' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Dark Knight', url = 'https://www.bg-wiki.com/ffxi/Dark_Knight' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Single-target elemental nukes I - V,', url = 'https://www.bg-wiki.com/ffxi/Category:Elemental_Magic' },
+                { type = 'link', text = 'Comet,', url = 'https://www.bg-wiki.com/ffxi/Comet' },
+                { type = 'link', text = 'Stun', url = 'https://www.bg-wiki.com/ffxi/Stun' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Bored to Tears', url = 'https://www.bg-wiki.com/index.php?title=Bored_to_Tears&amp;action=edit&amp;redlink=1' },
+                { type = 'text', value = '(Slow)' },
+                { type = 'skillchain', value = 'Status_Ability' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Envoutement', url = 'https://www.bg-wiki.com/index.php?title=Envoutement&amp;action=edit&amp;redlink=1' },
+                { type = 'text', value = '()' },
+                { type = 'skillchain', value = 'Status_Ability' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Memento Mori', url = 'https://www.bg-wiki.com/ffxi/Memento_Mori' },
+                { type = 'text', value = '(M.Atk. Boost)' },
+                { type = 'skillchain', value = 'Status_Ability' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Silence Seal', url = 'https://www.bg-wiki.com/index.php?title=Silence_Seal&amp;action=edit&amp;redlink=1' },
+                { type = 'text', value = '(AoE Silence)' },
+                { type = 'skillchain', value = 'Status_Ability' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Ullegore', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Ullegore' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Repeat Login Campaign', url = 'https://www.bg-wiki.com/ffxi/Repeat_Login_Campaign' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses a massive MP pool (approx 5000 at i119). HP+30%, MP+300%' },
+            },
+            {
+                { type = 'text', value = 'Will use' },
+                { type = 'link', text = 'Memento Mori', url = 'https://www.bg-wiki.com/ffxi/Memento_Mori' },
+                { type = 'text', value = 'before casting' },
+                { type = 'link', text = 'Comet.', url = 'https://www.bg-wiki.com/ffxi/Comet' },
+            },
+            {
+                { type = 'text', value = 'Casts' },
+                { type = 'link', text = 'Stun', url = 'https://www.bg-wiki.com/ffxi/Stun' },
+                { type = 'text', value = 'to interrupt enemy TP moves.' },
+            },
+            {
+                { type = 'text', value = 'Ullegore is thematically a' },
+                { type = 'link', text = 'Corse:', url = 'https://www.bg-wiki.com/ffxi/Category:Corse' },
+                { type = 'text', value = 'he uses Corse abilities as weaponskills, and can intimidate' },
+                { type = 'link', text = 'Arcana.', url = 'https://www.bg-wiki.com/ffxi/Arcana' },
+            },
+            {
+                { type = 'text', value = 'But since he is a man in a costume, does not exhibit' },
+                { type = 'link', text = 'Undead', url = 'https://www.bg-wiki.com/ffxi/Undead' },
+                { type = 'text', value = 'traits: Ullegore can be cured, he is not intimidated by Arcana, and HP/MP can be drained from him with' },
+                { type = 'link', text = 'Drain', url = 'https://www.bg-wiki.com/ffxi/Drain' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Aspir.', url = 'https://www.bg-wiki.com/ffxi/Aspir' },
+            },
+            {
+                { type = 'text', value = 'Likewise, he does not exhibit' },
+                { type = 'link', text = 'Demon', url = 'https://www.bg-wiki.com/ffxi/Demon' },
+                { type = 'text', value = 'traits, even if he is called a Demon King on his Trust cipher.' },
+            },
+            {
+                { type = 'text', value = "Ullegore's Envoutement skill does not apply" },
+                { type = 'link', text = 'Curse', url = 'https://www.bg-wiki.com/ffxi/Curse' },
+                { type = 'text', value = 'like a normal Corse.' },
+            },
+            {
+                { type = 'text', value = 'Uses a unique attack Bored to Tears, which is accompanied by a message stating that "The <target> has become noticeably bored"; This applies a' },
+                { type = 'link', text = 'Slow', url = 'https://www.bg-wiki.com/ffxi/Slow_(Status)' },
+                { type = 'text', value = 'less potent than' },
+                { type = 'link', text = 'Slow II', url = 'https://www.bg-wiki.com/ffxi/Slow_II' },
+            },
+        },
+    },
+    ['Apururu (UC)'] = {
+        name = 'Apururu (UC)',
+        job = {
+            {
+                { type = 'link', text = 'White Mage', url = 'https://www.bg-wiki.com/ffxi/White_Mage' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Red Mage', url = 'https://www.bg-wiki.com/ffxi/Red_Mage' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Cure I - VI,', url = 'https://www.bg-wiki.com/ffxi/Category:Cure_Spell' },
+                { type = 'link', text = 'Curaga I - V,', url = 'https://www.bg-wiki.com/ffxi/Curaga_V' },
+                { type = 'link', text = 'Protect/ra I - V,', url = 'https://www.bg-wiki.com/ffxi/Category:Protect_Spell' },
+                { type = 'link', text = 'Shell/ra I - V,', url = 'https://www.bg-wiki.com/ffxi/Category:Shell_Spell' },
+                { type = 'link', text = '-na Spells,', url = 'https://www.bg-wiki.com/ffxi/Category:-na_Spell' },
+                { type = 'link', text = 'Erase,', url = 'https://www.bg-wiki.com/ffxi/Erase' },
+                { type = 'link', text = 'Stoneskin,', url = 'https://www.bg-wiki.com/ffxi/Stoneskin' },
+                { type = 'link', text = 'Haste', url = 'https://www.bg-wiki.com/ffxi/Haste' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Martyr,', url = 'https://www.bg-wiki.com/ffxi/Martyr' },
+                { type = 'link', text = 'Devotion,', url = 'https://www.bg-wiki.com/ffxi/Devotion' },
+                { type = 'link', text = 'Convert', url = 'https://www.bg-wiki.com/ffxi/Convert' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'text', value = '(50)' },
+                { type = 'link', text = 'Nott', url = 'https://www.bg-wiki.com/ffxi/Nott' },
+                { type = 'skillchain', value = 'Status_Ability' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Be a member of the Apururu Unity Concord.' },
+            },
+            {
+                { type = 'text', value = 'Obtain 5000 Unity Accolades through' },
+                { type = 'link', text = 'Records of Eminence', url = 'https://www.bg-wiki.com/ffxi/Records_of_Eminence' },
+                { type = 'text', value = "objectives for a Partial Personal Evaluation of 5pt (this is also how you re-obtain it in the event you've lost it)." },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses' },
+                { type = 'link', text = 'Regain', url = 'https://www.bg-wiki.com/ffxi/Regain' },
+                { type = 'text', value = '(75 TP/tick).' },
+            },
+            {
+                { type = 'text', value = 'Does not melee or cast spells on enemies, relying on' },
+                { type = 'link', text = 'Regain', url = 'https://www.bg-wiki.com/ffxi/Regain' },
+                { type = 'text', value = 'for TP.' },
+            },
+            {
+                { type = 'text', value = 'Uses TP to recover MP. It is a low priority, and at 3000 TP she may continue casting Cure until she is out of MP.' },
+            },
+            {
+                { type = 'text', value = 'The really high' },
+                { type = 'link', text = 'Regain', url = 'https://www.bg-wiki.com/ffxi/Regain' },
+                { type = 'text', value = 'compared to other trusts is balanced by the high MP cost of' },
+                { type = 'link', text = 'Curaga.', url = 'https://www.bg-wiki.com/ffxi/Curaga' },
+            },
+            {
+                { type = 'text', value = 'Will use' },
+                { type = 'link', text = 'Curaga', url = 'https://www.bg-wiki.com/ffxi/Curaga' },
+                { type = 'text', value = 'spells when 3 or more party members are in yellow HP (<75%) or' },
+                { type = 'link', text = 'asleep.', url = 'https://www.bg-wiki.com/ffxi/Sleep_(Status)' },
+            },
+            {
+                { type = 'text', value = 'Casts' },
+                { type = 'link', text = 'Haste', url = 'https://www.bg-wiki.com/ffxi/Haste' },
+                { type = 'text', value = 'on the player, herself, and melee damage dealers in the party (with the exception of NIN).' },
+            },
+            {
+                { type = 'text', value = 'Uses' },
+                { type = 'link', text = 'Convert', url = 'https://www.bg-wiki.com/ffxi/Convert' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = 'Martyr', url = 'https://www.bg-wiki.com/ffxi/Martyr' },
+                { type = 'text', value = 'only at very low MP (<10%).' },
+            },
+            {
+                { type = 'text', value = 'Casts' },
+                { type = 'link', text = 'Stoneskin', url = 'https://www.bg-wiki.com/ffxi/Stoneskin' },
+                { type = 'text', value = 'on herself and tries to keep it applied.' },
+            },
+            {
+                { type = 'text', value = 'Uses' },
+                { type = 'link', text = 'Devotion', url = 'https://www.bg-wiki.com/ffxi/Devotion' },
+                { type = 'text', value = 'on party members that have <20% MP.' },
+            },
+            {
+                { type = 'text', value = "Tries to stay a distance (~15') away from the monster when she doesn't have hate." },
+            },
+            {
+                { type = 'link', text = 'Devotion', url = 'https://www.bg-wiki.com/ffxi/Devotion' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = 'Martyr', url = 'https://www.bg-wiki.com/ffxi/Martyr' },
+                { type = 'text', value = "have a shorter range (10.6'), so pay attention to her movements if you need those effects." },
+            },
+        },
+    },
+    ['Cherukiki'] = {
+        name = 'Cherukiki',
+        job = {
+            {
+                { type = 'link', text = 'White Mage', url = 'https://www.bg-wiki.com/ffxi/White_Mage' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Black Mage', url = 'https://www.bg-wiki.com/ffxi/Black_Mage' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Cure I - VI,', url = 'https://www.bg-wiki.com/ffxi/Category:Cure_Spell' },
+                { type = 'link', text = 'Protect/ra I - V,', url = 'https://www.bg-wiki.com/ffxi/Category:Protect_Spell' },
+                { type = 'link', text = 'Shell/ra I - V,', url = 'https://www.bg-wiki.com/ffxi/Category:Shell_Spell' },
+                { type = 'link', text = 'Regen I - IV,', url = 'https://www.bg-wiki.com/ffxi/Category:Regen_Spell' },
+                { type = 'link', text = 'Haste,', url = 'https://www.bg-wiki.com/ffxi/Haste' },
+                { type = 'link', text = 'Slow,', url = 'https://www.bg-wiki.com/ffxi/Slow' },
+                { type = 'link', text = 'Paralyze,', url = 'https://www.bg-wiki.com/ffxi/Paralyze' },
+                { type = 'link', text = 'Silence', url = 'https://www.bg-wiki.com/ffxi/Silence' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Complete' },
+                { type = 'link', text = 'One to be Feared.', url = 'https://www.bg-wiki.com/ffxi/Promathia_Mission_6-4' },
+            },
+            {
+                { type = 'text', value = 'Speak with' },
+                { type = 'link', text = 'Taillegeas', url = 'https://www.bg-wiki.com/ffxi/Taillegeas' },
+                { type = 'text', value = 'in' },
+                { type = 'link', text = "Ru'Lude Gardens", url = 'https://www.bg-wiki.com/ffxi/Ru%27Lude_Gardens' },
+                { type = 'text', value = '(I-7). Players will be unable to receive the alter ego between the time the mission' },
+                { type = 'link', text = "The Warrior's Path", url = 'https://www.bg-wiki.com/ffxi/Promathia_Mission_7-5' },
+                { type = 'text', value = 'is offered and the boss of the mission' },
+                { type = 'link', text = 'Dawn', url = 'https://www.bg-wiki.com/ffxi/Promathia_Mission_8-4' },
+                { type = 'text', value = 'is defeated.' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses Regen Effect merits, Enhanced Regen potency.' },
+            },
+            {
+                { type = 'text', value = 'Does not engage.' },
+            },
+            {
+                { type = 'text', value = 'Favors' },
+                { type = 'link', text = 'Regen spells', url = 'https://www.bg-wiki.com/ffxi/Category:Regen_Spell' },
+                { type = 'text', value = 'over' },
+                { type = 'link', text = 'Cure spells.', url = 'https://www.bg-wiki.com/ffxi/Category:Cure_Spell' },
+            },
+            {
+                { type = 'text', value = "Tries to stay a distance (~15') away from the monster when she doesn't have hate." },
+            },
+            {
+                { type = 'text', value = 'Native Regen effect of 5hp/tick.' },
+            },
+            {
+                { type = 'text', value = 'Casts' },
+                { type = 'link', text = 'Haste', url = 'https://www.bg-wiki.com/ffxi/Haste' },
+                { type = 'text', value = 'on the player, herself, and melee damage dealers in the party (with the exception of NIN).' },
+            },
+        },
+    },
+    ['Ferreous Coffin'] = {
+        name = 'Ferreous Coffin',
+        job = {
+            {
+                { type = 'link', text = 'White Mage', url = 'https://www.bg-wiki.com/ffxi/White_Mage' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Warrior', url = 'https://www.bg-wiki.com/ffxi/Warrior' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Cure I - VI,', url = 'https://www.bg-wiki.com/ffxi/Category:Cure_Spell' },
+                { type = 'link', text = 'Raise I - III,', url = 'https://www.bg-wiki.com/ffxi/Category:Raise_Spell' },
+                { type = 'link', text = '-na Spells,', url = 'https://www.bg-wiki.com/ffxi/Category:-na_Spell' },
+                { type = 'link', text = 'Haste', url = 'https://www.bg-wiki.com/ffxi/Haste' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Randgrith', url = 'https://www.bg-wiki.com/ffxi/Randgrith' },
+                { type = 'skillchain', value = 'Light' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Fragmentation' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: F. Coffin', url = 'https://www.bg-wiki.com/ffxi/Cipher:_F._Coffin' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Repeat Login Campaign', url = 'https://www.bg-wiki.com/ffxi/Repeat_Login_Campaign' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'link', text = 'Auto Refresh II.', url = 'https://www.bg-wiki.com/ffxi/Auto_Refresh' },
+                { type = 'text', value = 'HP-10%, MP+35%' },
+            },
+            {
+                { type = 'text', value = 'Will only cast' },
+                { type = 'link', text = 'Raise III', url = 'https://www.bg-wiki.com/ffxi/Category:Raise_Spell' },
+                { type = 'text', value = 'on KO party members in casting range.' },
+            },
+            {
+                { type = 'text', value = 'Will only cast status ailment removal spells on the player with the highest enmity.' },
+            },
+            {
+                { type = 'text', value = 'Has a high' },
+                { type = 'link', text = 'Cursna', url = 'https://www.bg-wiki.com/ffxi/Cursna' },
+                { type = 'text', value = 'success rate (only casts on the highest threat player)' },
+                { type = 'link', text = 'Official note', url = 'https://forum.square-enix.com/ffxi/threads/46976-May-14-2015-%28JST%29-Version-Update' },
+            },
+            {
+                { type = 'text', value = 'Ferreous Coffin only uses Randgrith and benefits from relic aftermath (acc +20).' },
+            },
+            {
+                { type = 'text', value = 'Will use TP as soon as he gets it, so he is good at maintaining enemy' },
+                { type = 'link', text = 'Evasion Down', url = 'https://www.bg-wiki.com/ffxi/Evasion_Down' },
+                { type = 'text', value = 'and initiating Light skillchains.' },
+            },
+            {
+                { type = 'text', value = 'Casts' },
+                { type = 'link', text = 'Haste', url = 'https://www.bg-wiki.com/ffxi/Haste' },
+                { type = 'text', value = 'on party members regardless of job.' },
+            },
+        },
+    },
+    ['Karaha-Baruha'] = {
+        name = 'Karaha-Baruha',
+        job = {
+            {
+                { type = 'link', text = 'White Mage', url = 'https://www.bg-wiki.com/ffxi/White_Mage' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Summoner', url = 'https://www.bg-wiki.com/ffxi/Summoner' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Cure I - VI,', url = 'https://www.bg-wiki.com/ffxi/Category:Cure_Spell' },
+                { type = 'link', text = 'Protect/ra I - V,', url = 'https://www.bg-wiki.com/ffxi/Category:Protect_Spell' },
+                { type = 'link', text = 'Shell/ra I - V,', url = 'https://www.bg-wiki.com/ffxi/Category:Shell_Spell' },
+                { type = 'link', text = '-na Spells,', url = 'https://www.bg-wiki.com/ffxi/Category:-na_Spell' },
+                { type = 'link', text = 'Haste,', url = 'https://www.bg-wiki.com/ffxi/Haste' },
+                { type = 'link', text = 'Barelementra', url = 'https://www.bg-wiki.com/ffxi/Category:Barspell' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Spirit Taker', url = 'https://www.bg-wiki.com/ffxi/Spirit_Taker' },
+                { type = 'skillchain', value = 'Status_Ability' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Sunburst', url = 'https://www.bg-wiki.com/ffxi/Sunburst' },
+                { type = 'skillchain', value = 'Compression' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Reverberation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Starburst', url = 'https://www.bg-wiki.com/ffxi/Starburst' },
+                { type = 'skillchain', value = 'Compression' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Reverberation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Howling Moon', url = 'https://www.bg-wiki.com/ffxi/Howling_Moon' },
+                { type = 'text', value = '(AoE)' },
+                { type = 'skillchain', value = 'Dark' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Distortion' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Lunar Bay', url = 'https://www.bg-wiki.com/ffxi/Lunar_Bay' },
+                { type = 'skillchain', value = 'Gravitation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Transfixion' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Karaha', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Karaha' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Repeat Login Campaign', url = 'https://www.bg-wiki.com/ffxi/Repeat_Login_Campaign' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Red)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Red)' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'HP-10%, MP+20%' },
+            },
+            {
+                { type = 'text', value = 'Possesses very high max MP and low HP on par with Summoner main-job. Has the lowest HP among the healers.' },
+            },
+            {
+                { type = 'text', value = 'Will attempt to close a' },
+                { type = 'link', text = 'Skillchain', url = 'https://www.bg-wiki.com/ffxi/Skillchain' },
+                { type = 'text', value = 'so long as he has 1000 or more TP.' },
+            },
+            {
+                { type = 'text', value = 'Will save his TP until 3000 to use' },
+                { type = 'link', text = 'Spirit Taker', url = 'https://www.bg-wiki.com/ffxi/Spirit_Taker' },
+                { type = 'text', value = 'if unable to close a skillchain and he has less than full MP.' },
+            },
+            {
+                { type = 'text', value = 'Will cast' },
+                { type = 'link', text = 'Barelementra', url = 'https://www.bg-wiki.com/ffxi/Category:Barspell' },
+                { type = 'text', value = 'after taking damage from a skill or spell with elemental properties.' },
+            },
+        },
+    },
+    ['Kupipi'] = {
+        name = 'Kupipi',
+        job = {
+            {
+                { type = 'link', text = 'White Mage', url = 'https://www.bg-wiki.com/ffxi/White_Mage' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'White Mage', url = 'https://www.bg-wiki.com/ffxi/White_Mage' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Cure I - VI,', url = 'https://www.bg-wiki.com/ffxi/Category:Cure_Spell' },
+                { type = 'link', text = 'Protect/ra I - V,', url = 'https://www.bg-wiki.com/ffxi/Category:Protect_Spell' },
+                { type = 'link', text = 'Shell/ra I - V,', url = 'https://www.bg-wiki.com/ffxi/Category:Shell_Spell' },
+                { type = 'link', text = '-na Spells,', url = 'https://www.bg-wiki.com/ffxi/Category:-na_Spell' },
+                { type = 'link', text = 'Slow,', url = 'https://www.bg-wiki.com/ffxi/Slow' },
+                { type = 'link', text = 'Paralyze,', url = 'https://www.bg-wiki.com/ffxi/Paralyze' },
+                { type = 'link', text = 'Erase', url = 'https://www.bg-wiki.com/ffxi/Erase' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Starlight', url = 'https://www.bg-wiki.com/ffxi/Starlight' },
+                { type = 'skillchain', value = 'Status_Ability' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Moonlight', url = 'https://www.bg-wiki.com/ffxi/Moonlight' },
+                { type = 'skillchain', value = 'Status_Ability' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Complete the initiation quest in' },
+                { type = 'link', text = 'Windurst.', url = 'https://www.bg-wiki.com/ffxi/Trust:_Windurst' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Prioritizes immediate removal of status ailments.' },
+            },
+            {
+                { type = 'text', value = 'Will stay in place after engaging up to 20 yalms, allowing the player to pull the monster away. If pulled beyond that, she will move to be within 15 yalms.' },
+            },
+            {
+                { type = 'text', value = 'Uses' },
+                { type = 'link', text = 'Cure', url = 'https://www.bg-wiki.com/ffxi/Cure' },
+                { type = 'text', value = 'spells on party members in orange HP (<50%) or asleep, with higher priority for the tank or current target of the foe (<75%).' },
+            },
+            {
+                { type = 'text', value = 'Will cast single target Protect and Shell on players that get dispelled or otherwise lack the buff.' },
+            },
+            {
+                { type = 'text', value = 'Prioritizes -na and then healing spells over buffing and finally enfeebling.' },
+            },
+            {
+                { type = 'text', value = 'Enfeebling is the lowest priority. Casts Slow first followed by Paralyze, and casts no other enfeebles.' },
+            },
+            {
+                { type = 'text', value = 'Overwrites a lower tier Protect of Shell with a higher tier single target if applicable.' },
+            },
+        },
+    },
+    ['Mihli Aliapoh'] = {
+        name = 'Mihli Aliapoh',
+        job = {
+            {
+                { type = 'link', text = 'White Mage', url = 'https://www.bg-wiki.com/ffxi/White_Mage' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'White Mage', url = 'https://www.bg-wiki.com/ffxi/White_Mage' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Cure I - VI,', url = 'https://www.bg-wiki.com/ffxi/Category:Cure_Spell' },
+                { type = 'link', text = 'Protect/ra I - V,', url = 'https://www.bg-wiki.com/ffxi/Category:Protect_Spell' },
+                { type = 'link', text = 'Shell/ra I - V,', url = 'https://www.bg-wiki.com/ffxi/Category:Shell_Spell' },
+                { type = 'link', text = '-na Spells,', url = 'https://www.bg-wiki.com/ffxi/Category:-na_Spell' },
+                { type = 'link', text = 'Slow,', url = 'https://www.bg-wiki.com/ffxi/Slow' },
+                { type = 'link', text = 'Paralyze', url = 'https://www.bg-wiki.com/ffxi/Paralyze' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Afflatus Solace', url = 'https://www.bg-wiki.com/ffxi/Afflatus_Solace' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'True Strike', url = 'https://www.bg-wiki.com/ffxi/True_Strike' },
+                { type = 'skillchain', value = 'Detonation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Impaction' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Brainshaker', url = 'https://www.bg-wiki.com/ffxi/Brainshaker' },
+                { type = 'skillchain', value = 'Reverberation' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Hexa Strike', url = 'https://www.bg-wiki.com/ffxi/Hexa_Strike' },
+                { type = 'skillchain', value = 'Fusion' },
+                { type = 'text', value = ', Scouring Bubbles (AoE)' },
+                { type = 'skillchain', value = 'Dark' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Distortion' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Mihli', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Mihli' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Records of Eminence: Basic Tutorial Objective', url = 'https://www.bg-wiki.com/ffxi/Category:Records_of_Eminence#Tutorial' },
+                { type = 'text', value = 'Reward' },
+            },
+            {
+                { type = 'link', text = 'Repeat Login Campaign', url = 'https://www.bg-wiki.com/ffxi/Repeat_Login_Campaign' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses' },
+                { type = 'link', text = 'Cure Potency Bonus', url = 'https://www.bg-wiki.com/ffxi/Cure_Potency' },
+                { type = 'text', value = '+5%.' },
+            },
+            {
+                { type = 'text', value = 'Possesses' },
+                { type = 'link', text = 'Healing Magic Skill', url = 'https://www.bg-wiki.com/ffxi/Healing_Magic_Skill' },
+                { type = 'text', value = '+: estimated to be 500.' },
+            },
+            {
+                { type = 'text', value = 'Compared to other trusts, this translates to about another 5% increase to the base Cure and +2%' },
+                { type = 'link', text = 'Cursna', url = 'https://www.bg-wiki.com/ffxi/Cursna' },
+                { type = 'text', value = 'success rate.' },
+            },
+            {
+                { type = 'text', value = 'Prioritizes herself first with status removal.' },
+            },
+            {
+                { type = 'text', value = 'Uses Cure spells on party members in orange HP (<50%) or asleep, with higher priority for the tank (<75%).' },
+            },
+            {
+                { type = 'text', value = 'Uses TP randomly and does not try to skillchain.' },
+            },
+            {
+                { type = 'text', value = 'Prefers using' },
+                { type = 'link', text = 'Scouring Bubbles', url = 'https://www.bg-wiki.com/ffxi/Scouring_Bubbles' },
+                { type = 'text', value = 'WS.' },
+            },
+        },
+    },
+    ['Monberaux'] = {
+        name = 'Monberaux',
+        job = {
+            {
+                { type = 'link', text = 'Paladin', url = 'https://www.bg-wiki.com/ffxi/Paladin' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Rune Fencer', url = 'https://www.bg-wiki.com/ffxi/Rune_Fencer' },
+                { type = 'text', value = '"' },
+                { type = 'link', text = 'Chemist', url = 'https://www.bg-wiki.com/ffxi/Chemist' },
+                { type = 'text', value = '"' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Cover,', url = 'https://www.bg-wiki.com/ffxi/Cover' },
+                { type = 'text', value = 'Mix (See Below)' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Acquired from' },
+                { type = 'link', text = 'A.M.A.N. Validator', url = 'https://www.bg-wiki.com/ffxi/A.M.A.N._Validator' },
+                { type = 'text', value = 'after reaching a total of 480' },
+                { type = 'link', text = 'Deeds.', url = 'https://www.bg-wiki.com/ffxi/Deeds' },
+                { type = 'text', value = '(They are not spent.)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses MP-90%.' },
+            },
+            {
+                { type = 'text', value = "His ilvl stat gains are the same as a tank's. Fashioned after the Final Fantasy V job, Chemists have high stamina and a magic penalty." },
+            },
+            {
+                { type = 'text', value = 'Has typical PLD/RUN traits such as' },
+                { type = 'link', text = 'Resist Sleep', url = 'https://www.bg-wiki.com/ffxi/Resist_Sleep' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = 'Tenacity.', url = 'https://www.bg-wiki.com/ffxi/Tenacity' },
+            },
+            {
+                { type = 'text', value = 'Internal PLD job impacts behavior of trust supports like Koru-Moru or off-tanks like Ark HM and behavior of certain enemies like' },
+                { type = 'link', text = 'Bozetto Necronura.', url = 'https://www.bg-wiki.com/ffxi/Ambuscade_Archive#Poroggo' },
+            },
+            {
+                { type = 'text', value = 'If you drew' },
+                { type = 'link', text = 'enmity', url = 'https://www.bg-wiki.com/ffxi/Enmity' },
+                { type = 'text', value = 'and are being targeted, Monberaux will use' },
+                { type = 'link', text = 'Cover', url = 'https://www.bg-wiki.com/ffxi/Cover' },
+                { type = 'text', value = 'if you stand behind him.' },
+            },
+            {
+                { type = 'text', value = 'Does not engage.' },
+            },
+            {
+                { type = 'text', value = 'Functionally immune to' },
+                { type = 'link', text = 'Paralyze.', url = 'https://www.bg-wiki.com/ffxi/Paralyze' },
+            },
+            {
+                { type = 'text', value = "Can be affected by the Paralysis status, but it cannot proc in any meaningful way as all weaponskills (which Monberaux's item uses count as) cannot be paralyzed." },
+            },
+            {
+                { type = 'link', text = 'Muddle,', url = 'https://www.bg-wiki.com/ffxi/Muddle' },
+                { type = 'text', value = 'the status preventing usage of items, will prevent him from using Chemist abilities.' },
+            },
+            {
+                { type = 'text', value = 'Chemist abilities can still be used while under the effect of' },
+                { type = 'link', text = 'Amnesia.', url = 'https://www.bg-wiki.com/ffxi/Amnesia' },
+            },
+            {
+                { type = 'text', value = 'Status removal abilities (listed below) become AoE after donating' },
+                { type = 'link', text = 'Gil', url = 'https://www.bg-wiki.com/ffxi/Gil' },
+                { type = 'text', value = 'to' },
+                { type = 'link', text = 'Monberaux.', url = 'https://www.bg-wiki.com/ffxi/Monberaux' },
+                { type = 'text', value = 'Donation amount is 10% of the Gil you currently have on hand, with a 10,000g lower limit and 100,000g upper limit. Donating more does not change the effect. Upgrade lasts until the next' },
+                { type = 'link', text = 'Conquest Tally.', url = 'https://www.bg-wiki.com/ffxi/Conquest_Tally' },
+            },
+            {
+                { type = 'text', value = 'Temporary moving your' },
+                { type = 'link', text = 'Gil', url = 'https://www.bg-wiki.com/ffxi/Gil' },
+                { type = 'text', value = 'in your' },
+                { type = 'link', text = 'Mog Garden', url = 'https://www.bg-wiki.com/ffxi/Mog_Garden' },
+                { type = 'link', text = 'Gil repository', url = 'https://www.bg-wiki.com/ffxi/Gil_repository' },
+                { type = 'text', value = 'chest or alt and keep 100,000' },
+                { type = 'link', text = 'Gil', url = 'https://www.bg-wiki.com/ffxi/Gil' },
+                { type = 'text', value = 'on you allow you to have the AoE effect for 10,000 Gil and can take your Gil back after the trade.' },
+            },
+            {
+                { type = 'text', value = 'Uses one ability every 3-4 seconds as needed.' },
+            },
+            {
+                { type = 'text', value = 'Uses the following abilities:' },
+            },
+            {
+                { type = 'text', value = 'Potion: Restores 50 HP.' },
+            },
+            {
+                { type = 'text', value = 'X-Potion: Restores 150 HP.' },
+            },
+            {
+                { type = 'text', value = 'Hyper Potion: Restores 250 HP.' },
+            },
+            {
+                { type = 'text', value = 'Max. Potion: Restores 500 HP.' },
+            },
+            {
+                { type = 'text', value = 'Mix: Max. Potion: Restores 700 HP.' },
+            },
+            {
+                { type = 'text', value = 'Mix: Final Elixir: Restores HP/MP fully in an area up to two times. Requires' },
+                { type = 'link', text = 'Elixir', url = 'https://www.bg-wiki.com/ffxi/Elixir' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = 'Hi-Elixir', url = 'https://www.bg-wiki.com/ffxi/Hi-Elixir' },
+                { type = 'text', value = 'donation to' },
+                { type = 'link', text = 'Monberaux', url = 'https://www.bg-wiki.com/ffxi/Monberaux' },
+                { type = 'text', value = 'in Upper Jeuno. Used when a party member is asleep.' },
+            },
+            {
+                { type = 'text', value = 'Mix: Panacea-1: Removes' },
+                { type = 'link', text = 'erasable', url = 'https://www.bg-wiki.com/ffxi/Erase' },
+                { type = 'text', value = 'ailments.' },
+            },
+            {
+                { type = 'text', value = 'Mix: Gold Needle: Removes' },
+                { type = 'link', text = 'Petrification.', url = 'https://www.bg-wiki.com/ffxi/Petrification' },
+            },
+            {
+                { type = 'text', value = 'Mix: Vaccine: Removes' },
+                { type = 'link', text = 'Plague.', url = 'https://www.bg-wiki.com/ffxi/Plague' },
+            },
+            {
+                { type = 'text', value = 'Mix: Para-b-gone: Removes' },
+                { type = 'link', text = 'Paralyze.', url = 'https://www.bg-wiki.com/ffxi/Paralyze' },
+            },
+            {
+                { type = 'text', value = 'Mix: Antidote: Removes' },
+                { type = 'link', text = 'Poison.', url = 'https://www.bg-wiki.com/ffxi/Poison' },
+            },
+            {
+                { type = 'text', value = 'Mix: Eye Drops: Removes' },
+                { type = 'link', text = 'Blind.', url = 'https://www.bg-wiki.com/ffxi/Blind' },
+            },
+            {
+                { type = 'text', value = 'Vaccine: Removes' },
+                { type = 'link', text = 'Plague.', url = 'https://www.bg-wiki.com/ffxi/Plague' },
+            },
+            {
+                { type = 'text', value = 'Echo Drops: Removes' },
+                { type = 'link', text = 'Silence.', url = 'https://www.bg-wiki.com/ffxi/Silence' },
+            },
+            {
+                { type = 'text', value = 'Holy Water: Removes' },
+                { type = 'link', text = 'Curse,', url = 'https://www.bg-wiki.com/ffxi/Curse' },
+                { type = 'link', text = 'Zombie,', url = 'https://www.bg-wiki.com/ffxi/Zombie' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = 'Doom.', url = 'https://www.bg-wiki.com/ffxi/Doom' },
+            },
+            {
+                { type = 'text', value = 'Mix: Guard Drink: Grants' },
+                { type = 'link', text = 'Protect', url = 'https://www.bg-wiki.com/ffxi/Category:Protect_Spell' },
+                { type = 'text', value = '(220 defense, 5 minutes, AoE) and' },
+                { type = 'link', text = 'Shell', url = 'https://www.bg-wiki.com/ffxi/Category:Shell_Spell' },
+                { type = 'text', value = '(-29% MDT, 5 Minutes, AoE).' },
+                { type = 'link', text = 'Sheltered Ring', url = 'https://www.bg-wiki.com/ffxi/Sheltered_Ring' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = 'Brachyura Earring', url = 'https://www.bg-wiki.com/ffxi/Brachyura_Earring' },
+                { type = 'text', value = 'do not apply.' },
+            },
+            {
+                { type = 'text', value = 'Mix: Insomniant: Grants Monberaux Negate Sleep.' },
+            },
+            {
+                { type = 'text', value = 'Mix II: These potions share a 60 second' },
+                { type = 'link', text = 'cooldown.', url = 'https://www.bg-wiki.com/ffxi/Cooldown' },
+                { type = 'text', value = 'Used with high priority.' },
+            },
+            {
+                { type = 'text', value = 'Mix: Life Water: Grants' },
+                { type = 'link', text = 'Regen', url = 'https://www.bg-wiki.com/ffxi/Regen' },
+                { type = 'text', value = '(20/tick, 1 minute, AoE).' },
+            },
+            {
+                { type = 'text', value = 'Mix: Elemental Power: Grants' },
+                { type = 'link', text = 'Magic Attack Boost', url = 'https://www.bg-wiki.com/index.php?title=Magic_Attack_Boost&amp;action=edit&amp;redlink=1' },
+                { type = 'text', value = '(+20, 1 minute, AoE).' },
+            },
+            {
+                { type = 'text', value = 'Mix: Dragon Shield: Grants' },
+                { type = 'link', text = 'Magic Defense Boost', url = 'https://www.bg-wiki.com/index.php?title=Magic_Defense_Boost&amp;action=edit&amp;redlink=1' },
+                { type = 'text', value = '(+10, 1 minute, AoE).' },
+            },
+            {
+                { type = 'text', value = "Mix: Samson's Strength: Grants STR/DEX/VIT/AGI/INT/MND/CHR Boost (+10, 1 minute, AoE)." },
+            },
+            {
+                { type = 'text', value = 'Mix: Dark Potion: Deals magical damage (666 fixed damage, ignores' },
+                { type = 'link', text = 'resistance', url = 'https://www.bg-wiki.com/ffxi/Resist' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = 'magic defense', url = 'https://www.bg-wiki.com/index.php?title=Magic_defense&amp;action=edit&amp;redlink=1' },
+                { type = 'text', value = ').' },
+            },
+            {
+                { type = 'text', value = 'Mix III: Potions with a separate 90 second cooldown.' },
+            },
+            {
+                { type = 'text', value = 'Mix: Dry Ether Concoction: Restores 160 MP.' },
+            },
+        },
+    },
+    ['Nashmeira II'] = {
+        name = 'Nashmeira II',
+        job = {
+            {
+                { type = 'link', text = 'White Mage', url = 'https://www.bg-wiki.com/ffxi/White_Mage' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Puppetmaster', url = 'https://www.bg-wiki.com/ffxi/Puppetmaster' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Cure I - VI,', url = 'https://www.bg-wiki.com/ffxi/Category:Cure_Spell' },
+                { type = 'link', text = 'Curaga I - V,', url = 'https://www.bg-wiki.com/ffxi/Curaga_V' },
+                { type = 'link', text = '-na spells,', url = 'https://www.bg-wiki.com/ffxi/Category:-na_Spell' },
+                { type = 'link', text = 'Erase', url = 'https://www.bg-wiki.com/ffxi/Erase' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Imperial Authority', url = 'https://www.bg-wiki.com/ffxi/Imperial_Authority' },
+                { type = 'text', value = '(' },
+                { type = 'link', text = 'Stun', url = 'https://www.bg-wiki.com/ffxi/Stun' },
+                { type = 'text', value = ')' },
+                { type = 'skillchain', value = 'Fragmentation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Distortion' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Nashmeira II', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Nashmeira_II' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'text', value = 'Complete' },
+                { type = 'link', text = "Aphmau's Light.", url = 'https://www.bg-wiki.com/ffxi/Aphmau%27s_Light' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses HP-10%, MP+15%' },
+            },
+            {
+                { type = 'text', value = 'Uses' },
+                { type = 'link', text = 'Curaga', url = 'https://www.bg-wiki.com/ffxi/Curaga' },
+                { type = 'text', value = 'spells when 3 or more party members are below 75% hp or affected by sleep.' },
+            },
+            {
+                { type = 'text', value = 'Uses' },
+                { type = 'link', text = 'Imperial Authority', url = 'https://www.bg-wiki.com/ffxi/Imperial_Authority' },
+                { type = 'text', value = 'at 1000 TP.' },
+            },
+        },
+    },
+    ['Pieuje (UC)'] = {
+        name = 'Pieuje (UC)',
+        job = {
+            {
+                { type = 'link', text = 'White Mage', url = 'https://www.bg-wiki.com/ffxi/White_Mage' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Paladin', url = 'https://www.bg-wiki.com/ffxi/Paladin' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Cure I - VI,', url = 'https://www.bg-wiki.com/ffxi/Category:Cure_Spell' },
+                { type = 'link', text = '-na Spells,', url = 'https://www.bg-wiki.com/ffxi/Category:-na_Spell' },
+                { type = 'link', text = 'Erase,', url = 'https://www.bg-wiki.com/ffxi/Erase' },
+                { type = 'link', text = 'Esuna,', url = 'https://www.bg-wiki.com/ffxi/Esuna' },
+                { type = 'link', text = 'Protect/ra I - V,', url = 'https://www.bg-wiki.com/ffxi/Category:Protect_Spell' },
+                { type = 'link', text = 'Shell/ra I - V,', url = 'https://www.bg-wiki.com/ffxi/Category:Shell_Spell' },
+                { type = 'link', text = 'Auspice,', url = 'https://www.bg-wiki.com/ffxi/Auspice' },
+                { type = 'link', text = 'Haste', url = 'https://www.bg-wiki.com/ffxi/Haste' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Afflatus Misery,', url = 'https://www.bg-wiki.com/ffxi/Afflatus_Misery' },
+                { type = 'link', text = 'Sacrosanctity', url = 'https://www.bg-wiki.com/ffxi/Sacrosanctity' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'text', value = '(5)' },
+                { type = 'link', text = 'Starlight', url = 'https://www.bg-wiki.com/ffxi/Starlight' },
+                { type = 'skillchain', value = 'Status_Ability' },
+                { type = 'text', value = ', (25)' },
+                { type = 'link', text = 'Moonlight', url = 'https://www.bg-wiki.com/ffxi/Moonlight' },
+                { type = 'skillchain', value = 'Status_Ability' },
+                { type = 'text', value = ', (50)' },
+                { type = 'link', text = 'Nott', url = 'https://www.bg-wiki.com/ffxi/Nott' },
+                { type = 'skillchain', value = 'Status_Ability' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Be a member of the Pieuje Unity Concord.' },
+            },
+            {
+                { type = 'text', value = 'Obtain 5000 Unity Accolades through' },
+                { type = 'link', text = 'Records of Eminence', url = 'https://www.bg-wiki.com/ffxi/Records_of_Eminence' },
+                { type = 'text', value = 'objectives for a Partial Personal Evaluation of 5pt.' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses' },
+                { type = 'link', text = 'Regain', url = 'https://www.bg-wiki.com/ffxi/Regain' },
+                { type = 'text', value = '(34tp/tick), WHM/PLD traits including' },
+                { type = 'link', text = 'Auto Refresh', url = 'https://www.bg-wiki.com/ffxi/Auto_Refresh' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = 'Resist Sleep.', url = 'https://www.bg-wiki.com/ffxi/Resist_Sleep' },
+            },
+            {
+                { type = 'text', value = 'Stays in place after engaging, but will attack with a club if the enemy is nearby.' },
+            },
+            {
+                { type = 'text', value = "When positioned in attack range, he'll be able to use MP recovery moves more often, making up for his lower max MP compared to Tarutaru trusts." },
+            },
+            {
+                { type = 'link', text = 'Afflatus Misery', url = 'https://www.bg-wiki.com/ffxi/Afflatus_Misery' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = 'Auspice', url = 'https://www.bg-wiki.com/ffxi/Auspice' },
+                { type = 'text', value = 'together give him an' },
+                { type = 'link', text = 'Enlight', url = 'https://www.bg-wiki.com/ffxi/Enlight' },
+                { type = 'text', value = 'effect, increasing his accuracy.' },
+            },
+            {
+                { type = 'text', value = 'Will use' },
+                { type = 'link', text = 'Esuna', url = 'https://www.bg-wiki.com/ffxi/Esuna' },
+                { type = 'text', value = 'in' },
+                { type = 'link', text = 'Misery', url = 'https://www.bg-wiki.com/ffxi/Afflatus_Misery' },
+                { type = 'text', value = 'stance, removing 2 debuffs from himself and any other party members in range with the same debuff.' },
+            },
+            {
+                { type = 'text', value = 'Casts' },
+                { type = 'link', text = 'Haste', url = 'https://www.bg-wiki.com/ffxi/Haste' },
+                { type = 'text', value = 'on players regardless of job.' },
+            },
+            {
+                { type = 'link', text = 'Sacrosanctity', url = 'https://www.bg-wiki.com/ffxi/Sacrosanctity' },
+                { type = 'text', value = 'defends your party from enemy SP abilities like' },
+                { type = 'link', text = 'Manafont,', url = 'https://www.bg-wiki.com/ffxi/Manafont' },
+                { type = 'link', text = 'Chainspell,', url = 'https://www.bg-wiki.com/ffxi/Chainspell' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = 'Astral Flow.', url = 'https://www.bg-wiki.com/ffxi/Astral_Flow' },
+            },
+            {
+                { type = 'text', value = 'Uses TP for MP recovery. Prefers' },
+                { type = 'link', text = 'Nott.', url = 'https://www.bg-wiki.com/ffxi/Nott' },
+            },
+        },
+    },
+    ['Yoran-Oran (UC)'] = {
+        name = 'Yoran-Oran (UC)',
+        job = {
+            {
+                { type = 'link', text = 'White Mage', url = 'https://www.bg-wiki.com/ffxi/White_Mage' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Black Mage', url = 'https://www.bg-wiki.com/ffxi/Black_Mage' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Protectra I - V,', url = 'https://www.bg-wiki.com/ffxi/Category:Protect_Spell' },
+                { type = 'link', text = 'Shellra I - V,', url = 'https://www.bg-wiki.com/ffxi/Category:Shell_Spell' },
+                { type = 'link', text = '-na spells,', url = 'https://www.bg-wiki.com/ffxi/Category:-na_Spell' },
+                { type = 'link', text = 'Cure I - VI,', url = 'https://www.bg-wiki.com/ffxi/Category:Cure_Spell' },
+                { type = 'link', text = 'Erase,', url = 'https://www.bg-wiki.com/ffxi/Erase' },
+                { type = 'link', text = 'Stoneskin', url = 'https://www.bg-wiki.com/ffxi/Stoneskin' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Afflatus Solace', url = 'https://www.bg-wiki.com/ffxi/Afflatus_Solace' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'text', value = '(50)' },
+                { type = 'link', text = 'Nott', url = 'https://www.bg-wiki.com/ffxi/Nott' },
+                { type = 'skillchain', value = 'Status_Ability' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Be a member of the Yoran-Oran Unity Concord.' },
+            },
+            {
+                { type = 'text', value = 'Obtain 5000 Unity Accolades through' },
+                { type = 'link', text = 'Records of Eminence', url = 'https://www.bg-wiki.com/ffxi/Records_of_Eminence' },
+                { type = 'text', value = 'objectives for a Partial Personal Evaluation of 5pt.' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses' },
+                { type = 'link', text = 'Cure Potency Bonus', url = 'https://www.bg-wiki.com/ffxi/Cure_Potency' },
+                { type = 'text', value = '+50%,' },
+                { type = 'link', text = 'Fast Cast,', url = 'https://www.bg-wiki.com/ffxi/Fast_Cast' },
+                { type = 'link', text = 'Regain', url = 'https://www.bg-wiki.com/ffxi/Regain' },
+                { type = 'text', value = '(50/tick).' },
+            },
+            {
+                { type = 'text', value = 'Depending on Unity rank: MP+15%~+25%' },
+            },
+            {
+                { type = 'text', value = 'Does not melee or cast spells on enemies, relying on' },
+                { type = 'link', text = 'Regain', url = 'https://www.bg-wiki.com/ffxi/Regain' },
+                { type = 'text', value = 'for TP.' },
+            },
+            {
+                { type = 'text', value = 'Uses TP to recover MP. It is a low priority, and at 3000 TP he may continue casting Cure until he is out of MP.' },
+            },
+            {
+                { type = 'text', value = 'Very high' },
+                { type = 'link', text = 'magic evasion', url = 'https://www.bg-wiki.com/ffxi/Magic_evasion' },
+                { type = 'text', value = 'for a trust. Will occasionally' },
+                { type = 'link', text = 'sleep', url = 'https://www.bg-wiki.com/ffxi/Sleep_(Status)' },
+                { type = 'text', value = 'but avoids' },
+                { type = 'link', text = 'silence', url = 'https://www.bg-wiki.com/ffxi/Silence_(Status)' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = 'other', url = 'https://www.bg-wiki.com/ffxi/Petrification' },
+                { type = 'link', text = 'enfeebles', url = 'https://www.bg-wiki.com/ffxi/Terror' },
+                { type = 'text', value = 'with a very high success rate.' },
+            },
+            {
+                { type = 'text', value = 'Is very mana efficient thanks to' },
+                { type = 'link', text = 'Afflatus Solace,', url = 'https://www.bg-wiki.com/ffxi/Afflatus_Solace' },
+                { type = 'link', text = 'Conserve MP,', url = 'https://www.bg-wiki.com/ffxi/Conserve_MP' },
+                { type = 'text', value = 'and capped' },
+                { type = 'link', text = 'Cure Potency.', url = 'https://www.bg-wiki.com/ffxi/Cure_Potency' },
+            },
+            {
+                { type = 'text', value = 'Tries to keep himself buffed with' },
+                { type = 'link', text = 'Stoneskin.', url = 'https://www.bg-wiki.com/ffxi/Stoneskin' },
+            },
+            {
+                { type = 'text', value = 'Stays at a distance from enemies while healing.' },
+            },
+        },
+    },
+    ['Ygnas'] = {
+        name = 'Ygnas',
+        job = {
+            {
+                { type = 'link', text = 'White Mage', url = 'https://www.bg-wiki.com/ffxi/White_Mage' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Paladin', url = 'https://www.bg-wiki.com/ffxi/Paladin' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Cure I - VI,', url = 'https://www.bg-wiki.com/ffxi/Category:Cure_Spell' },
+                { type = 'link', text = 'Protect/ra I - V,', url = 'https://www.bg-wiki.com/ffxi/Category:Protect_Spell' },
+                { type = 'link', text = 'Shell/ra I - V,', url = 'https://www.bg-wiki.com/ffxi/Category:Shell_Spell' },
+                { type = 'link', text = '-na Spells,', url = 'https://www.bg-wiki.com/ffxi/Category:-na_Spell' },
+                { type = 'link', text = 'Erase,', url = 'https://www.bg-wiki.com/ffxi/Erase' },
+                { type = 'link', text = 'Haste', url = 'https://www.bg-wiki.com/ffxi/Haste' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Deific Gambol', url = 'https://www.bg-wiki.com/ffxi/Category:Leafkin#Abilities' },
+                { type = 'text', value = '(AoE)' },
+                { type = 'skillchain', value = 'Status_Ability' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Phototropic Blessing', url = 'https://www.bg-wiki.com/ffxi/Category:Leafkin#Abilities' },
+                { type = 'skillchain', value = 'Status_Ability' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Phototropic Wrath', url = 'https://www.bg-wiki.com/ffxi/Category:Leafkin#Abilities' },
+                { type = 'skillchain', value = 'Status_Ability' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Sacred Caper', url = 'https://www.bg-wiki.com/ffxi/Category:Leafkin#Abilities' },
+                { type = 'skillchain', value = 'Status_Ability' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Complete' },
+                { type = 'link', text = 'The Ygnas Directive', url = 'https://www.bg-wiki.com/ffxi/The_Ygnas_Directive' },
+                { type = 'text', value = 'and then' },
+                { type = 'link', text = 'The Arciela Directive', url = 'https://www.bg-wiki.com/ffxi/The_Arciela_Directive' },
+                { type = 'link', text = 'Records of Eminence', url = 'https://www.bg-wiki.com/ffxi/Records_of_Eminence' },
+                { type = 'text', value = 'Objectives.' },
+            },
+            {
+                { type = 'text', value = 'Examine the Sandy Overlook in' },
+                { type = 'link', text = 'Ceizak Battlegrounds', url = 'https://www.bg-wiki.com/ffxi/Ceizak_Battlegrounds' },
+                { type = 'text', value = '(J-10) after fulfilling the other prerequisites.' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses HP+10%, MP+10%,' },
+                { type = 'link', text = 'Cure Potency', url = 'https://www.bg-wiki.com/ffxi/Cure_Potency' },
+                { type = 'text', value = '+50%,' },
+                { type = 'link', text = 'Fast Cast', url = 'https://www.bg-wiki.com/ffxi/Fast_Cast' },
+                { type = 'text', value = '+50%, Converts 5% of "Cure" amount to MP,' },
+                { type = 'link', text = 'Regain', url = 'https://www.bg-wiki.com/ffxi/Regain' },
+                { type = 'text', value = '(30 TP/tick).' },
+            },
+            {
+                { type = 'text', value = 'MP cost reduction can be over 50% for' },
+                { type = 'link', text = 'Cure III', url = 'https://www.bg-wiki.com/ffxi/Cure_III' },
+                { type = 'text', value = 'and over 30% for' },
+                { type = 'link', text = 'Cure VI', url = 'https://www.bg-wiki.com/ffxi/Cure_VI' },
+                { type = 'text', value = 'before' },
+                { type = 'link', text = 'Day/Weather', url = 'https://www.bg-wiki.com/ffxi/Cure_Formula' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Cure Potency Received', url = 'https://www.bg-wiki.com/ffxi/Cure_Potency_Received' },
+                { type = 'text', value = '+ bonuses.' },
+            },
+            {
+                { type = 'text', value = 'Ygnas prefers to heal with his most mp-efficient healing spell, which is Cure III at level 99.' },
+            },
+            {
+                { type = 'text', value = 'Uses Cure III on the tank at yellow HP(<75%) or other party members at orange HP(<66%).' },
+            },
+            {
+                { type = 'text', value = 'Uses Cure VI on party members at low HP (<45%).' },
+            },
+            {
+                { type = 'text', value = 'Can be' },
+                { type = 'link', text = 'intimidated', url = 'https://www.bg-wiki.com/ffxi/Intimidate' },
+                { type = 'text', value = 'when curing party members who have' },
+                { type = 'link', text = 'Plantoid Killer.', url = 'https://www.bg-wiki.com/ffxi/Plantoid_Killer' },
+            },
+            {
+                { type = 'text', value = 'Will not engage, and stands out of range.' },
+            },
+            {
+                { type = 'text', value = "Will not use a weaponskill until reaching 3,000 TP unless party members have taken damage, much like Selh'teus." },
+            },
+            {
+                { type = 'text', value = 'Deific Gambol causes AoE Damage.' },
+            },
+            {
+                { type = 'text', value = 'Phototropic Blessing is an AoE Heal, 30/tick Regen, +25% Defense, and MDB+ for 60 seconds.' },
+            },
+            {
+                { type = 'text', value = 'Phototrophic Wrath is an AoE Haste II , attack +25%, MAB +, and 23 damage Enlight (decays by 1 each hit) for 60 seconds.' },
+            },
+            {
+                { type = 'text', value = 'Sacred Caper inflicts damage and Rasp.' },
+            },
+        },
+    },
+    ['Arciela'] = {
+        name = 'Arciela',
+        job = {
+            {
+                { type = 'link', text = 'Red Mage', url = 'https://www.bg-wiki.com/ffxi/Red_Mage' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Paladin', url = 'https://www.bg-wiki.com/ffxi/Paladin' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Refresh', url = 'https://www.bg-wiki.com/ffxi/Refresh' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'II,', url = 'https://www.bg-wiki.com/ffxi/Refresh_II' },
+                { type = 'link', text = 'Haste', url = 'https://www.bg-wiki.com/ffxi/Haste' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'II,', url = 'https://www.bg-wiki.com/ffxi/Haste_II' },
+                { type = 'link', text = 'Protect I - V,', url = 'https://www.bg-wiki.com/ffxi/Category:Protect_Spell' },
+                { type = 'link', text = 'Shell I - V,', url = 'https://www.bg-wiki.com/ffxi/Category:Shell_Spell' },
+                { type = 'link', text = 'Slow', url = 'https://www.bg-wiki.com/ffxi/Slow' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'II,', url = 'https://www.bg-wiki.com/ffxi/Slow_II' },
+                { type = 'link', text = 'Paralyze', url = 'https://www.bg-wiki.com/ffxi/Paralyze' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'II,', url = 'https://www.bg-wiki.com/ffxi/Paralyze_II' },
+                { type = 'link', text = 'Addle,', url = 'https://www.bg-wiki.com/ffxi/Addle' },
+                { type = 'link', text = 'Dispel', url = 'https://www.bg-wiki.com/ffxi/Dispel' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'text', value = 'Bellatrix of Light, Bellatrix of Shadows' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Guiding Light', url = 'https://www.bg-wiki.com/index.php?title=Guiding_Light&amp;action=edit&amp;redlink=1' },
+                { type = 'text', value = '(AoE Atk+Def+M.Atk+M.Def Up)' },
+                { type = 'skillchain', value = 'Status_Ability' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Illustrious Aid', url = 'https://www.bg-wiki.com/index.php?title=Illustrious_Aid&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Status_Ability' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Dynastic Gravitas', url = 'https://www.bg-wiki.com/index.php?title=Dynastic_Gravitas&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Status_Ability' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Complete' },
+                { type = 'link', text = 'The Light Within.', url = 'https://www.bg-wiki.com/ffxi/The_Light_Within' },
+            },
+            {
+                { type = 'text', value = 'Speak to' },
+                { type = 'link', text = 'Ploh Trishbahk', url = 'https://www.bg-wiki.com/ffxi/Ploh_Trishbahk' },
+                { type = 'text', value = 'at the castle gates in' },
+                { type = 'link', text = 'Eastern Adoulin.', url = 'https://www.bg-wiki.com/ffxi/Eastern_Adoulin' },
+            },
+            {
+                { type = 'text', value = 'Examine the "Sandy Overlook" in Ceizak Battlegrounds (J-10).' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses MP+20%,' },
+                { type = 'link', text = 'Regain', url = 'https://www.bg-wiki.com/ffxi/Regain' },
+                { type = 'text', value = '(25 TP/tick), RDM/PLD traits including' },
+                { type = 'link', text = 'Auto-Refresh', url = 'https://www.bg-wiki.com/ffxi/Auto-Refresh' },
+                { type = 'text', value = 'I.' },
+            },
+            {
+                { type = 'text', value = 'Tends to behave more as a support as opposed to Arciela II.' },
+            },
+            {
+                { type = 'text', value = 'Uses' },
+                { type = 'link', text = 'Refresh', url = 'https://www.bg-wiki.com/ffxi/Refresh' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = 'Haste', url = 'https://www.bg-wiki.com/ffxi/Haste' },
+                { type = 'text', value = 'only on the player and herself, prioritizing the player.' },
+            },
+            {
+                { type = 'text', value = 'Will always overwrite' },
+                { type = 'link', text = 'Haste', url = 'https://www.bg-wiki.com/ffxi/Haste' },
+                { type = 'text', value = 'with' },
+                { type = 'link', text = 'Haste II.', url = 'https://www.bg-wiki.com/ffxi/Haste_II' },
+            },
+            {
+                { type = 'text', value = 'Auto-attacks seem to be light elemental regardless of stance, and are effected by MAB/MDB.' },
+            },
+            {
+                { type = 'text', value = 'Bellatrix of Light - Enables enhancing magic and Illustrious Aid' },
+            },
+            {
+                { type = 'text', value = 'Bellatrix of Shadows - Enables enfeebling magic and Dynastic Gravitas.' },
+            },
+            {
+                { type = 'text', value = 'No cooldown on changing between the two stances, she will switch as needed to cast spells based on priority.' },
+            },
+            {
+                { type = 'text', value = 'Dynastic Gravitas - Inflicts' },
+                { type = 'link', text = 'amnesia', url = 'https://www.bg-wiki.com/ffxi/Amnesia' },
+                { type = 'text', value = 'on nearby enemies.' },
+            },
+            {
+                { type = 'text', value = 'Guiding Light - Nearby party members gain increased attack, defense, magic attack, and magic defense for 30 seconds. Usable from either stance. The effect overwrites and prevents application of' },
+                { type = 'link', text = 'Cocoon', url = 'https://www.bg-wiki.com/ffxi/Cocoon' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = 'Saline Coat.', url = 'https://www.bg-wiki.com/ffxi/Saline_Coat' },
+            },
+            {
+                { type = 'text', value = 'Illustrious Aid - Restores HP to nearby party members. Used when multiple party members are in yellow HP (<75%).' },
+            },
+            {
+                { type = 'text', value = "Stationary Behavior: will stay in place after engaging. If allies/enemies are out of her casting range and in line of sight, she will slowly inch toward them until they're in casting range." },
+            },
+            {
+                { type = 'link', text = 'Haste II', url = 'https://www.bg-wiki.com/ffxi/Haste_II' },
+                { type = 'text', value = 'grants 307/1024 Magical Haste.' },
+            },
+        },
+    },
+    ['Arciela II'] = {
+        name = 'Arciela II',
+        job = {
+            {
+                { type = 'link', text = 'Red Mage', url = 'https://www.bg-wiki.com/ffxi/Red_Mage' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Black Mage', url = 'https://www.bg-wiki.com/ffxi/Black_Mage' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Refresh', url = 'https://www.bg-wiki.com/ffxi/Refresh' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'II,', url = 'https://www.bg-wiki.com/ffxi/Refresh_II' },
+                { type = 'link', text = 'Haste', url = 'https://www.bg-wiki.com/ffxi/Haste' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'II,', url = 'https://www.bg-wiki.com/ffxi/Haste_II' },
+                { type = 'link', text = 'Flurry II,', url = 'https://www.bg-wiki.com/ffxi/Flurry_II' },
+                { type = 'link', text = 'Protect I - V,', url = 'https://www.bg-wiki.com/ffxi/Category:Protect_Spell' },
+                { type = 'link', text = 'Shell I - V,', url = 'https://www.bg-wiki.com/ffxi/Category:Shell_Spell' },
+                { type = 'link', text = 'Slow', url = 'https://www.bg-wiki.com/ffxi/Slow' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'II,', url = 'https://www.bg-wiki.com/ffxi/Slow_II' },
+                { type = 'link', text = 'Paralyze', url = 'https://www.bg-wiki.com/ffxi/Paralyze' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'II,', url = 'https://www.bg-wiki.com/ffxi/Paralyze_II' },
+                { type = 'link', text = 'Addle,', url = 'https://www.bg-wiki.com/ffxi/Addle' },
+                { type = 'link', text = 'Dispel,', url = 'https://www.bg-wiki.com/ffxi/Dispel' },
+                { type = 'link', text = 'Single Target Elemental Nukes I - V', url = 'https://www.bg-wiki.com/ffxi/Category:Elemental_Magic' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'text', value = 'Ascension, Descension' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'text', value = 'Light aura:' },
+                { type = 'link', text = 'Expunge Magic', url = 'https://www.bg-wiki.com/index.php?title=Expunge_Magic&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Distortion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Harmonic Displacement', url = 'https://www.bg-wiki.com/index.php?title=Harmonic_Displacement&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Fusion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Reverberation' },
+            },
+            {
+                { type = 'text', value = 'Darkness aura:' },
+                { type = 'link', text = 'Darkest Hour', url = 'https://www.bg-wiki.com/index.php?title=Darkest_Hour&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Gravitation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Liquefaction' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Sight Unseen', url = 'https://www.bg-wiki.com/index.php?title=Sight_Unseen&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Fragmentation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Compression' },
+            },
+            {
+                { type = 'text', value = 'Neutral:' },
+                { type = 'link', text = 'Unceasing Dread', url = 'https://www.bg-wiki.com/index.php?title=Unceasing_Dread&amp;action=edit&amp;redlink=1' },
+                { type = 'text', value = '(Paralyze)' },
+                { type = 'skillchain', value = 'Status_Ability' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Dignified Awe', url = 'https://www.bg-wiki.com/index.php?title=Dignified_Awe&amp;action=edit&amp;redlink=1' },
+                { type = 'text', value = '(Amnesia)' },
+                { type = 'skillchain', value = 'Status_Ability' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = "Naakual's Vengeance", url = 'https://www.bg-wiki.com/index.php?title=Naakual%27s_Vengeance&amp;action=edit&amp;redlink=1' },
+                { type = 'text', value = '(Recover own HP + MP)' },
+                { type = 'skillchain', value = 'Light' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Fusion' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Arciela II', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Arciela_II' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'text', value = 'Complete' },
+                { type = 'link', text = 'What He Left Behind.', url = 'https://www.bg-wiki.com/ffxi/What_He_Left_Behind' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses MP+50%, increased' },
+                { type = 'link', text = 'Enhancing Magic', url = 'https://www.bg-wiki.com/ffxi/Enhancing_Magic' },
+                { type = 'text', value = 'duration (+25%).' },
+            },
+            {
+                { type = 'text', value = 'Tends to behave much more offensively as compared to Arciela I.' },
+            },
+            {
+                { type = 'text', value = 'Possesses an extremely potent' },
+                { type = 'link', text = 'Fast Cast,', url = 'https://www.bg-wiki.com/ffxi/Fast_Cast' },
+                { type = 'text', value = 'spells she casts appear to be cast instantly.' },
+            },
+            {
+                { type = 'text', value = 'She will often double magic burst with two tier 5 spells or a tier 5 and tier 4 spell.' },
+            },
+            {
+                { type = 'text', value = 'Uses weapon skills at 1000 TP.' },
+            },
+            {
+                { type = 'text', value = "When at low HP, can use TP move Naakual's Vengeance to fully restore HP and MP. (5 minute cooldown)" },
+            },
+            {
+                { type = 'text', value = 'Can have a tendency to run out of MP due to double magic bursting high tier elemental magic.' },
+            },
+            {
+                { type = 'text', value = 'Ascension (Light mode - Enhancing magic - Healing Magic - Light based WSs - Light-aligned Elemental Magic ()' },
+            },
+            {
+                { type = 'text', value = 'Descension (Dark mode - Enfeebling magic - Darkness based WSs - Darkness-aligned Elemental Magic ())' },
+            },
+            {
+                { type = 'text', value = 'Spends about 90 seconds in each mode before switching.' },
+            },
+            {
+                { type = 'text', value = 'Casts buffs on party members based on job:' },
+                { type = 'link', text = 'Flurry II:', url = 'https://www.bg-wiki.com/ffxi/Flurry_II' },
+                { type = 'text', value = 'RNG, COR' },
+                { type = 'link', text = 'Haste II:', url = 'https://www.bg-wiki.com/ffxi/Haste_II' },
+                { type = 'text', value = 'WAR, MNK, THF, PLD, DRK, BST, SAM, NIN, DRG, BLU, PUP, DNC, RUN *' },
+                { type = 'link', text = 'Haste II', url = 'https://www.bg-wiki.com/ffxi/Haste_II' },
+                { type = 'text', value = 'grants 307/1024 Magical Haste.' },
+                { type = 'link', text = 'Refresh II:', url = 'https://www.bg-wiki.com/ffxi/Refresh_II' },
+                { type = 'text', value = 'WHM, BLM, RDM, PLD, SMN, GEO, RUN, SCH*, or any character with WHM subjob. *Will stop casting Refresh on a SCH once they use' },
+                { type = 'link', text = 'Sublimation', url = 'https://www.bg-wiki.com/ffxi/Sublimation' },
+            },
+        },
+    },
+    ['Joachim'] = {
+        name = 'Joachim',
+        job = {
+            {
+                { type = 'link', text = 'Bard', url = 'https://www.bg-wiki.com/ffxi/Bard' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'White Mage', url = 'https://www.bg-wiki.com/ffxi/White_Mage' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Sword/Blade Madrigal,', url = 'https://www.bg-wiki.com/ffxi/Category:Madrigal' },
+                { type = 'link', text = 'Battlefield/Carnage Elegy,', url = 'https://www.bg-wiki.com/ffxi/Category:Elegy' },
+                { type = 'link', text = 'Advancing/Victory March,', url = 'https://www.bg-wiki.com/ffxi/Category:March' },
+                { type = 'link', text = "Army's Paeon I - VI,", url = 'https://www.bg-wiki.com/ffxi/Category:Paeon' },
+                { type = 'link', text = "Mage's Ballad I - III,", url = 'https://www.bg-wiki.com/ffxi/Category:Ballad' },
+                { type = 'link', text = 'Valor Minuet I - V,', url = 'https://www.bg-wiki.com/ffxi/Category:Minuet' },
+                { type = 'link', text = "Knight's Minne I - V,", url = 'https://www.bg-wiki.com/ffxi/Category:Minne' },
+                { type = 'link', text = 'Cure I - IV,', url = 'https://www.bg-wiki.com/ffxi/Category:Cure_Spell' },
+                { type = 'link', text = 'Erase,', url = 'https://www.bg-wiki.com/ffxi/Erase' },
+                { type = 'link', text = '-na Spells', url = 'https://www.bg-wiki.com/ffxi/Category:-na_Spell' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Joachim', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Joachim' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Records of Eminence: Basic Tutorial Objective', url = 'https://www.bg-wiki.com/ffxi/Category:Records_of_Eminence#Tutorial' },
+                { type = 'text', value = 'Reward' },
+            },
+            {
+                { type = 'link', text = 'Repeat Login Campaign', url = 'https://www.bg-wiki.com/ffxi/Repeat_Login_Campaign' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = "Doesn't melee but performs a throwing ranged attack (traverser stones?)." },
+            },
+            {
+                { type = 'text', value = 'By default he sings' },
+                { type = 'link', text = 'March', url = 'https://www.bg-wiki.com/ffxi/March' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = 'Madrigal', url = 'https://www.bg-wiki.com/ffxi/Madrigal' },
+                { type = 'text', value = '(level permitting).' },
+            },
+            {
+                { type = 'text', value = 'Waits for his songs to expire before changing songs; does not overwrite songs.' },
+            },
+            {
+                { type = 'text', value = 'Song Priority:' },
+            },
+            {
+                { type = 'link', text = 'Paeon', url = 'https://www.bg-wiki.com/ffxi/Paeon' },
+                { type = 'text', value = "x2 when Joachim's HP is below 90%. This is the only song he will double up." },
+            },
+            {
+                { type = 'link', text = 'Ballad', url = 'https://www.bg-wiki.com/ffxi/Ballad' },
+                { type = 'text', value = "when Joachim's MP is below 75%." },
+            },
+            {
+                { type = 'link', text = 'March:', url = 'https://www.bg-wiki.com/ffxi/March' },
+                { type = 'text', value = 'Unless another Bard is providing them,' },
+                { type = 'link', text = 'Victory March', url = 'https://www.bg-wiki.com/ffxi/Victory_March' },
+                { type = 'text', value = '>' },
+                { type = 'link', text = 'Advancing March.', url = 'https://www.bg-wiki.com/ffxi/Advancing_March' },
+            },
+            {
+                { type = 'link', text = 'Madrigal:', url = 'https://www.bg-wiki.com/ffxi/Madrigal' },
+                { type = 'text', value = 'Unless another Bard is providing them,' },
+                { type = 'link', text = 'Blade Madrigal', url = 'https://www.bg-wiki.com/ffxi/Blade_Madrigal' },
+                { type = 'text', value = '>' },
+                { type = 'link', text = 'Sword Madrigal.', url = 'https://www.bg-wiki.com/ffxi/Sword_Madrigal' },
+            },
+            {
+                { type = 'link', text = 'Minuet:', url = 'https://www.bg-wiki.com/ffxi/Minuet' },
+                { type = 'text', value = 'sometimes Ulmia plays both' },
+                { type = 'link', text = 'Marches,', url = 'https://www.bg-wiki.com/ffxi/March' },
+                { type = 'text', value = 'and Joachim does' },
+                { type = 'link', text = 'Valor Minuet V', url = 'https://www.bg-wiki.com/ffxi/Valor_Minuet_V' },
+                { type = 'text', value = 'for his second song.' },
+            },
+            {
+                { type = 'link', text = 'Minne:', url = 'https://www.bg-wiki.com/ffxi/Minne' },
+                { type = 'text', value = 'when both' },
+                { type = 'link', text = 'Marches', url = 'https://www.bg-wiki.com/ffxi/March' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = 'Madrigals', url = 'https://www.bg-wiki.com/ffxi/Madrigal' },
+                { type = 'text', value = 'are performed by other Bards,' },
+                { type = 'link', text = "Knight's Minne V.", url = 'https://www.bg-wiki.com/ffxi/Knight%27s_Minne_V' },
+            },
+            {
+                { type = 'text', value = 'Casting' },
+                { type = 'link', text = 'Cure', url = 'https://www.bg-wiki.com/ffxi/Category:Cure_Spell' },
+                { type = 'text', value = "takes higher priority than songs, so he's more likely to be using" },
+                { type = 'link', text = 'Ballad', url = 'https://www.bg-wiki.com/ffxi/Ballad' },
+                { type = 'text', value = 'than' },
+                { type = 'link', text = 'Paeon.', url = 'https://www.bg-wiki.com/ffxi/Paeon' },
+            },
+            {
+                { type = 'text', value = "Until the party's supports are out of MP, then he starts casting" },
+                { type = 'link', text = 'Paeons', url = 'https://www.bg-wiki.com/ffxi/Paeon' },
+                { type = 'text', value = 'due to the resulting lack of healing.' },
+            },
+            {
+                { type = 'link', text = 'Victory March', url = 'https://www.bg-wiki.com/ffxi/Victory_March' },
+                { type = 'text', value = 'grants 155/1024 (15.14%) Magical Haste.' },
+            },
+            {
+                { type = 'link', text = 'Blade Madrigal', url = 'https://www.bg-wiki.com/ffxi/Blade_Madrigal' },
+                { type = 'text', value = 'grants +60 Accuracy.' },
+            },
+            {
+                { type = 'text', value = "None of Joachim's songs gain any instrument/equipment bonuses." },
+            },
+        },
+    },
+    ['King of Hearts'] = {
+        name = 'King of Hearts',
+        job = {
+            {
+                { type = 'link', text = 'Red Mage', url = 'https://www.bg-wiki.com/ffxi/Red_Mage' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'White Mage', url = 'https://www.bg-wiki.com/ffxi/White_Mage' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Refresh', url = 'https://www.bg-wiki.com/ffxi/Refresh' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'II,', url = 'https://www.bg-wiki.com/ffxi/Refresh_II' },
+                { type = 'link', text = 'Haste', url = 'https://www.bg-wiki.com/ffxi/Haste' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'II,', url = 'https://www.bg-wiki.com/ffxi/Haste_II' },
+                { type = 'link', text = 'Dia', url = 'https://www.bg-wiki.com/ffxi/Dia' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'II', url = 'https://www.bg-wiki.com/ffxi/Dia_II' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'III,', url = 'https://www.bg-wiki.com/ffxi/Dia_III' },
+                { type = 'link', text = 'Temper,', url = 'https://www.bg-wiki.com/ffxi/Temper' },
+                { type = 'text', value = '(92)' },
+                { type = 'link', text = 'Firaga IV,', url = 'https://www.bg-wiki.com/ffxi/Firaga_IV' },
+                { type = 'link', text = 'Cure I - IV,', url = 'https://www.bg-wiki.com/ffxi/Category:Cure_Spell' },
+                { type = 'link', text = 'Phalanx', url = 'https://www.bg-wiki.com/ffxi/Phalanx' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'II,', url = 'https://www.bg-wiki.com/ffxi/Phalanx_II' },
+                { type = 'link', text = '-na Spells,', url = 'https://www.bg-wiki.com/ffxi/Category:-na_Spell' },
+                { type = 'link', text = 'Erase', url = 'https://www.bg-wiki.com/ffxi/Erase' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Bludgeon', url = 'https://www.bg-wiki.com/ffxi/Bludgeon' },
+                { type = 'skillchain', value = 'Fusion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Liquefaction' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Shuffle', url = 'https://www.bg-wiki.com/ffxi/Category:Cardian#Abilities' },
+                { type = 'text', value = '(Dispel)' },
+                { type = 'skillchain', value = 'Status_Ability' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Deal Out', url = 'https://www.bg-wiki.com/ffxi/Category:Cardian#Abilities' },
+                { type = 'text', value = '(AoE)' },
+                { type = 'skillchain', value = 'Status_Ability' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Double Down', url = 'https://www.bg-wiki.com/index.php?title=Double_Down&amp;action=edit&amp;redlink=1' },
+                { type = 'skillchain', value = 'Status_Ability' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: King', url = 'https://www.bg-wiki.com/ffxi/Cipher:_King' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Repeat Login Campaign', url = 'https://www.bg-wiki.com/ffxi/Repeat_Login_Campaign' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses HP+25%, MP+80%' },
+            },
+            {
+                { type = 'text', value = 'Benefits from a permanent' },
+                { type = 'link', text = 'Composure', url = 'https://www.bg-wiki.com/ffxi/Composure' },
+                { type = 'text', value = 'effect and gains +50%' },
+                { type = 'link', text = 'Enhancing Magic', url = 'https://www.bg-wiki.com/ffxi/Enhancing_Magic' },
+                { type = 'text', value = 'duration when casting on other targets than himself.' },
+            },
+            {
+                { type = 'text', value = 'Is considered' },
+                { type = 'link', text = 'Arcana,', url = 'https://www.bg-wiki.com/ffxi/Arcana' },
+                { type = 'text', value = 'thus is susceptible to' },
+                { type = 'link', text = 'Monster Correlation', url = 'https://www.bg-wiki.com/ffxi/Monster_Correlation' },
+                { type = 'text', value = 'effects.' },
+            },
+            {
+                { type = 'text', value = 'The King of Hearts mainly acts as a RDM but has access to spells of WHMs and BLMs.' },
+            },
+            {
+                { type = 'text', value = 'Opens the fight up with' },
+                { type = 'link', text = 'Dia', url = 'https://www.bg-wiki.com/ffxi/Dia' },
+                { type = 'text', value = 'before any other spells. (Will continually attempt to Dia an enemy even if the enemy is immune)' },
+            },
+            {
+                { type = 'text', value = 'Will cast' },
+                { type = 'link', text = 'Cure', url = 'https://www.bg-wiki.com/ffxi/Cure' },
+                { type = 'text', value = 'on any players at 50% or less HP.' },
+            },
+            {
+                { type = 'text', value = 'Prioritizes' },
+                { type = 'link', text = 'Erase', url = 'https://www.bg-wiki.com/ffxi/Erase' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = '-na spells', url = 'https://www.bg-wiki.com/ffxi/Category:-na_Spell' },
+                { type = 'text', value = 'above other spells. Will quickly cast these on any trust or party member immediately after being debuffed, starting with the master and itself.' },
+            },
+            {
+                { type = 'text', value = 'Casts' },
+                { type = 'link', text = 'Haste,', url = 'https://www.bg-wiki.com/ffxi/Haste' },
+                { type = 'link', text = 'Refresh,', url = 'https://www.bg-wiki.com/ffxi/Refresh' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = 'Phalanx', url = 'https://www.bg-wiki.com/ffxi/Phalanx' },
+                { type = 'text', value = 'on the player regardless of their job or enmity.' },
+            },
+            {
+                { type = 'text', value = 'Will not cast' },
+                { type = 'link', text = 'Haste', url = 'https://www.bg-wiki.com/ffxi/Haste' },
+                { type = 'text', value = 'or' },
+                { type = 'link', text = 'Refresh', url = 'https://www.bg-wiki.com/ffxi/Refresh' },
+                { type = 'text', value = 'on other players or trusts.' },
+            },
+            {
+                { type = 'text', value = 'King of Hearts thinks the player is his master, Ambassador Karababa (BLM).' },
+            },
+            {
+                { type = 'text', value = "Casts Phalanx on the party member or alter ego with the highest enmity on King's current target's list. -35 dmg Phalanx at level 99." },
+            },
+            {
+                { type = 'text', value = 'Will magic burst' },
+                { type = 'link', text = 'Firaga', url = 'https://www.bg-wiki.com/ffxi/Firaga' },
+                { type = 'text', value = 'off of' },
+                { type = 'skillchain', value = 'Liquefaction' },
+                { type = 'link', text = 'Liquefaction,', url = 'https://www.bg-wiki.com/ffxi/Liquefaction' },
+                { type = 'skillchain', value = 'Fusion' },
+                { type = 'link', text = 'Fusion,', url = 'https://www.bg-wiki.com/ffxi/Fusion' },
+                { type = 'text', value = 'or' },
+                { type = 'skillchain', value = 'Light' },
+                { type = 'link', text = 'Light', url = 'https://www.bg-wiki.com/ffxi/Light' },
+                { type = 'text', value = 'skillchains.' },
+            },
+            {
+                { type = 'text', value = 'From time to time the King of Hearts may randomly “Level Up”, which restores some HP and MP as well as unlocking access to' },
+                { type = 'link', text = 'Bludgeon.', url = 'https://www.bg-wiki.com/ffxi/Bludgeon' },
+                { type = 'text', value = 'It doesn’t seem to be actively triggered, but may occur at any time during combat.' },
+            },
+            {
+                { type = 'text', value = 'Uses TP randomly and does not try to skillchain.' },
+            },
+            {
+                { type = 'text', value = 'Prioritizes Shuffle when able to' },
+                { type = 'link', text = 'Dispel', url = 'https://www.bg-wiki.com/ffxi/Dispel' },
+                { type = 'text', value = 'an enemy buff.' },
+            },
+            {
+                { type = 'text', value = '*' },
+                { type = 'link', text = 'Haste II', url = 'https://www.bg-wiki.com/ffxi/Haste_II' },
+                { type = 'text', value = 'grants 307/1024 Magical Haste.' },
+            },
+        },
+    },
+    ['Koru-Moru'] = {
+        name = 'Koru-Moru',
+        job = {
+            {
+                { type = 'link', text = 'Red Mage', url = 'https://www.bg-wiki.com/ffxi/Red_Mage' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'White Mage', url = 'https://www.bg-wiki.com/ffxi/White_Mage' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Refresh', url = 'https://www.bg-wiki.com/ffxi/Refresh' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'II,', url = 'https://www.bg-wiki.com/ffxi/Refresh_II' },
+                { type = 'link', text = 'Haste', url = 'https://www.bg-wiki.com/ffxi/Haste' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'II,', url = 'https://www.bg-wiki.com/ffxi/Haste_II' },
+                { type = 'link', text = 'Flurry', url = 'https://www.bg-wiki.com/ffxi/Flurry' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'II,', url = 'https://www.bg-wiki.com/ffxi/Flurry_II' },
+                { type = 'link', text = 'Protect I - V,', url = 'https://www.bg-wiki.com/ffxi/Category:Protect_Spell' },
+                { type = 'link', text = 'Shell I - V,', url = 'https://www.bg-wiki.com/ffxi/Category:Shell_Spell' },
+                { type = 'link', text = 'Phalanx II,', url = 'https://www.bg-wiki.com/ffxi/Phalanx_II' },
+                { type = 'link', text = 'Slow', url = 'https://www.bg-wiki.com/ffxi/Slow' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'II,', url = 'https://www.bg-wiki.com/ffxi/Slow_II' },
+                { type = 'link', text = 'Dia', url = 'https://www.bg-wiki.com/ffxi/Dia' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'II', url = 'https://www.bg-wiki.com/ffxi/Dia_II' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'III,', url = 'https://www.bg-wiki.com/ffxi/Dia_III' },
+                { type = 'link', text = 'Distract', url = 'https://www.bg-wiki.com/ffxi/Distract' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'II,', url = 'https://www.bg-wiki.com/ffxi/Distract_II' },
+                { type = 'link', text = 'Dispel,', url = 'https://www.bg-wiki.com/ffxi/Dispel' },
+                { type = 'link', text = 'Cure I - IV', url = 'https://www.bg-wiki.com/ffxi/Category:Cure_Spell' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Convert', url = 'https://www.bg-wiki.com/ffxi/Convert' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Koru-Moru', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Koru-Moru' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Records of Eminence: Always Stand on 117 Objective', url = 'https://www.bg-wiki.com/ffxi/Category:Records_of_Eminence#Intermediate' },
+                { type = 'text', value = 'Reward' },
+            },
+            {
+                { type = 'link', text = 'Repeat Login Campaign', url = 'https://www.bg-wiki.com/ffxi/Repeat_Login_Campaign' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Does not engage.' },
+            },
+            {
+                { type = 'text', value = 'Will only use' },
+                { type = 'link', text = 'Convert', url = 'https://www.bg-wiki.com/ffxi/Convert' },
+                { type = 'text', value = 'at very low MP, making him susceptible to DoT or AoE death.' },
+            },
+            {
+                { type = 'text', value = 'Will not cast a higher-tier debuff if the enemy already has a lower-tier applied.' },
+            },
+            {
+                { type = 'text', value = 'Will cast' },
+                { type = 'link', text = 'Phalanx II', url = 'https://www.bg-wiki.com/ffxi/Phalanx_II' },
+                { type = 'text', value = 'even if' },
+                { type = 'link', text = 'Phalanx', url = 'https://www.bg-wiki.com/ffxi/Phalanx' },
+                { type = 'text', value = 'is already applied. However,' },
+                { type = 'link', text = 'Phalanx II', url = 'https://www.bg-wiki.com/ffxi/Phalanx_II' },
+                { type = 'text', value = 'will not be cast over' },
+                { type = 'link', text = 'Barrier Tusk.', url = 'https://www.bg-wiki.com/ffxi/Barrier_Tusk' },
+            },
+            {
+                { type = 'text', value = "Koru-Moru's" },
+                { type = 'link', text = 'Phalanx II', url = 'https://www.bg-wiki.com/ffxi/Phalanx_II' },
+                { type = 'text', value = 'reduces damage received by 31 at level 99.' },
+            },
+            {
+                { type = 'text', value = 'Will cast' },
+                { type = 'link', text = 'Distract II', url = 'https://www.bg-wiki.com/ffxi/Distract_II' },
+                { type = 'text', value = 'on enemies with High Evasion as classified by the /check command for the PC.' },
+            },
+            {
+                { type = 'text', value = 'Casts buffs on party members based on job:' },
+                { type = 'link', text = 'Flurry II:', url = 'https://www.bg-wiki.com/ffxi/Flurry_II' },
+                { type = 'text', value = 'RNG, COR' },
+                { type = 'link', text = 'Haste II:', url = 'https://www.bg-wiki.com/ffxi/Haste_II' },
+                { type = 'text', value = 'WAR, MNK, THF, PLD, DRK, BST, SAM, NIN, DRG, BLU, PUP, DNC, RUN *' },
+                { type = 'link', text = 'Haste II', url = 'https://www.bg-wiki.com/ffxi/Haste_II' },
+                { type = 'text', value = 'grants 307/1024 Magical Haste.' },
+                { type = 'link', text = 'Refresh II:', url = 'https://www.bg-wiki.com/ffxi/Refresh_II' },
+                { type = 'text', value = 'WHM, BLM, RDM, PLD, SMN, GEO, RUN, SCH*, or any character with WHM subjob. *Will stop casting Refresh on a SCH once they use' },
+                { type = 'link', text = 'Sublimation', url = 'https://www.bg-wiki.com/ffxi/Sublimation' },
+            },
+            {
+                { type = 'text', value = 'Does not overwrite' },
+                { type = 'link', text = 'Haste', url = 'https://www.bg-wiki.com/ffxi/Haste' },
+                { type = 'text', value = 'with' },
+                { type = 'link', text = 'Haste II', url = 'https://www.bg-wiki.com/ffxi/Haste_II' },
+                { type = 'text', value = 'or' },
+                { type = 'link', text = 'Flurry II.', url = 'https://www.bg-wiki.com/ffxi/Flurry_II' },
+            },
+        },
+    },
+    ['Qultada'] = {
+        name = 'Qultada',
+        job = {
+            {
+                { type = 'link', text = 'Corsair', url = 'https://www.bg-wiki.com/ffxi/Corsair' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Ranger', url = 'https://www.bg-wiki.com/ffxi/Ranger' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Triple Shot,', url = 'https://www.bg-wiki.com/ffxi/Triple_Shot' },
+                { type = 'link', text = 'Double-Up,', url = 'https://www.bg-wiki.com/ffxi/Double-Up' },
+                { type = 'link', text = 'Snake Eye,', url = 'https://www.bg-wiki.com/ffxi/Snake_Eye' },
+                { type = 'link', text = "Corsair's Roll,", url = 'https://www.bg-wiki.com/ffxi/Corsair%27s_Roll' },
+                { type = 'link', text = 'Chaos Roll,', url = 'https://www.bg-wiki.com/ffxi/Chaos_Roll' },
+                { type = 'link', text = "Hunter's Roll,", url = 'https://www.bg-wiki.com/ffxi/Hunter%27s_Roll' },
+                { type = 'link', text = "Evoker's Roll,", url = 'https://www.bg-wiki.com/ffxi/Evoker%27s_Roll' },
+                { type = 'link', text = "Fighter's Roll,", url = 'https://www.bg-wiki.com/ffxi/Fighter%27s_Roll' },
+                { type = 'link', text = 'Light Shot,', url = 'https://www.bg-wiki.com/ffxi/Quick_Draw' },
+                { type = 'link', text = 'Dark Shot', url = 'https://www.bg-wiki.com/ffxi/Quick_Draw' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'link', text = 'Savage Blade', url = 'https://www.bg-wiki.com/ffxi/Savage_Blade' },
+                { type = 'skillchain', value = 'Fragmentation' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Scission' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Burning Blade', url = 'https://www.bg-wiki.com/ffxi/Burning_Blade' },
+                { type = 'skillchain', value = 'Liquefaction' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Sniper Shot', url = 'https://www.bg-wiki.com/ffxi/Sniper_Shot' },
+                { type = 'skillchain', value = 'Liquefaction' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Transfixion' },
+                { type = 'text', value = ',' },
+                { type = 'link', text = 'Detonator', url = 'https://www.bg-wiki.com/ffxi/Detonator' },
+                { type = 'skillchain', value = 'Fusion' },
+                { type = 'text', value = ' / ' },
+                { type = 'skillchain', value = 'Transfixion' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Qultada', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Qultada' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Repeat Login Campaign', url = 'https://www.bg-wiki.com/ffxi/Repeat_Login_Campaign' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses' },
+                { type = 'link', text = 'Winning Streak', url = 'https://www.bg-wiki.com/ffxi/Winning_Streak' },
+                { type = 'text', value = '(level 75: +100s' },
+                { type = 'link', text = 'Phantom Roll', url = 'https://www.bg-wiki.com/ffxi/Phantom_Roll' },
+                { type = 'text', value = 'duration)' },
+            },
+            {
+                { type = 'text', value = 'Qultada dispels with' },
+                { type = 'link', text = 'Dark Shot', url = 'https://www.bg-wiki.com/ffxi/Quick_Draw' },
+                { type = 'text', value = 'and enhances' },
+                { type = 'link', text = 'Dia', url = 'https://www.bg-wiki.com/ffxi/Dia' },
+                { type = 'text', value = 'with' },
+                { type = 'link', text = 'Light Shot', url = 'https://www.bg-wiki.com/ffxi/Quick_Draw' },
+                { type = 'text', value = 'but never uses' },
+                { type = 'link', text = 'Quick Draw', url = 'https://www.bg-wiki.com/ffxi/Quick_Draw' },
+                { type = 'text', value = 'just to deal damage.' },
+            },
+            {
+                { type = 'text', value = 'Uses weapon skills at 1000 TP.' },
+            },
+            {
+                { type = 'text', value = "Qultada's standard" },
+                { type = 'link', text = 'Phantom Rolls', url = 'https://www.bg-wiki.com/ffxi/Phantom_Roll' },
+                { type = 'text', value = 'are' },
+                { type = 'link', text = 'Chaos Roll', url = 'https://www.bg-wiki.com/ffxi/Chaos_Roll' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = "Fighter's Roll.", url = 'https://www.bg-wiki.com/ffxi/Fighter%27s_Roll' },
+            },
+            {
+                { type = 'text', value = 'He replaces Chaos Roll with' },
+                { type = 'link', text = "Hunter's Roll", url = 'https://www.bg-wiki.com/ffxi/Hunter%27s_Roll' },
+                { type = 'text', value = "if his player's accuracy against the currently fought enemy is under a certain threshold." },
+            },
+            {
+                { type = 'text', value = "He replaces Fighter's Roll with" },
+                { type = 'link', text = "Evoker's Roll", url = 'https://www.bg-wiki.com/ffxi/Evoker%27s_Roll' },
+                { type = 'text', value = 'if any party member has low MP (<66%).' },
+            },
+            {
+                { type = 'text', value = "He replaces Fighter's Roll with" },
+                { type = 'link', text = "Corsair's Roll", url = 'https://www.bg-wiki.com/ffxi/Corsair%27s_Roll' },
+                { type = 'text', value = 'if his player has' },
+                { type = 'link', text = 'Dedication', url = 'https://www.bg-wiki.com/ffxi/Dedication' },
+                { type = 'text', value = 'or Commitment active (excluding the special Dedication status from' },
+                { type = 'link', text = 'Cipher: Kupofried', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Kupofried' },
+                { type = 'text', value = ').' },
+            },
+            {
+                { type = 'text', value = 'Will' },
+                { type = 'link', text = 'Double-Up', url = 'https://www.bg-wiki.com/ffxi/Double-Up' },
+                { type = 'text', value = 'on any non-lucky roll value between 1 and 6 and can' },
+                { type = 'link', text = 'bust', url = 'https://www.bg-wiki.com/ffxi/Bust' },
+                { type = 'text', value = 'his rolls.' },
+            },
+            {
+                { type = 'text', value = 'He uses Snake Eye when he is one point away from a lucky roll or from 11.' },
+            },
+            {
+                { type = 'text', value = "Doesn't perform weaponskills until finished applying Phantom Rolls." },
+            },
+            {
+                { type = 'text', value = "When he has a busted roll, he doesn't WS until the bust effect expires." },
+            },
+        },
+    },
+    ['Sylvie (UC)'] = {
+        name = 'Sylvie (UC)',
+        job = {
+            {
+                { type = 'link', text = 'Geomancer', url = 'https://www.bg-wiki.com/ffxi/Geomancer' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'White Mage', url = 'https://www.bg-wiki.com/ffxi/White_Mage' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Cure I - IV,', url = 'https://www.bg-wiki.com/ffxi/Category:Cure_Spell' },
+                { type = 'link', text = '-na Spells,', url = 'https://www.bg-wiki.com/ffxi/Category:-na_Spell' },
+                { type = 'link', text = 'Erase,', url = 'https://www.bg-wiki.com/ffxi/Erase' },
+                { type = 'link', text = 'Haste,', url = 'https://www.bg-wiki.com/ffxi/Haste' },
+                { type = 'link', text = 'Indi-Haste,', url = 'https://www.bg-wiki.com/ffxi/Indi-Haste' },
+                { type = 'link', text = 'Indi-Fury,', url = 'https://www.bg-wiki.com/ffxi/Indi-Fury' },
+                { type = 'link', text = 'Indi-Precision,', url = 'https://www.bg-wiki.com/ffxi/Indi-Precision' },
+                { type = 'link', text = 'Indi-Refresh,', url = 'https://www.bg-wiki.com/ffxi/Indi-Refresh' },
+                { type = 'link', text = 'Indi-Regen,', url = 'https://www.bg-wiki.com/ffxi/Indi-Regen' },
+                { type = 'link', text = 'Indi-Acumen,', url = 'https://www.bg-wiki.com/ffxi/Indi-Acumen' },
+                { type = 'link', text = 'Indi-Languor', url = 'https://www.bg-wiki.com/ffxi/Indi-Languor' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Entrust', url = 'https://www.bg-wiki.com/ffxi/Entrust' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'text', value = '(50)' },
+                { type = 'link', text = 'Nott', url = 'https://www.bg-wiki.com/ffxi/Nott' },
+                { type = 'skillchain', value = 'Status_Ability' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Be a member of the Sylvie Unity Concord.' },
+            },
+            {
+                { type = 'text', value = 'Obtain 5000 Unity Accolades through' },
+                { type = 'link', text = 'Records of Eminence', url = 'https://www.bg-wiki.com/ffxi/Records_of_Eminence' },
+                { type = 'text', value = 'objectives for a Partial Personal Evaluation of 5pt.' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Possesses' },
+                { type = 'link', text = 'Regain', url = 'https://www.bg-wiki.com/ffxi/Regain' },
+                { type = 'text', value = '+50,' },
+                { type = 'link', text = 'Damage Taken', url = 'https://www.bg-wiki.com/ffxi/Damage_Taken' },
+                { type = 'text', value = '-25%, Enhanced' },
+                { type = 'link', text = 'Indicolure', url = 'https://www.bg-wiki.com/ffxi/Indicolure' },
+                { type = 'text', value = 'duration (6 minutes total, includes' },
+                { type = 'link', text = 'Entrust', url = 'https://www.bg-wiki.com/ffxi/Entrust' },
+                { type = 'text', value = 'effects).' },
+            },
+            {
+                { type = 'text', value = 'Will change' },
+                { type = 'link', text = 'Indicolure', url = 'https://www.bg-wiki.com/ffxi/Indicolure' },
+                { type = 'text', value = 'spells based on accuracy requirements, and the main job of the player.' },
+            },
+            {
+                { type = 'text', value = 'Does not melee or cast spells on enemies, relying on' },
+                { type = 'link', text = 'Regain', url = 'https://www.bg-wiki.com/ffxi/Regain' },
+                { type = 'text', value = 'for TP.' },
+            },
+            {
+                { type = 'text', value = 'Follows the player or trust in front of her in the party lineup.' },
+            },
+            {
+                { type = 'text', value = 'Casts' },
+                { type = 'link', text = 'Haste', url = 'https://www.bg-wiki.com/ffxi/Haste' },
+                { type = 'text', value = 'on the player who summoned her (regardless of job) and any physical melee damage dealers in the party.' },
+            },
+            {
+                { type = 'text', value = 'Uses' },
+                { type = 'link', text = 'Entrust', url = 'https://www.bg-wiki.com/ffxi/Entrust' },
+                { type = 'text', value = 'on the player unless their main job is' },
+                { type = 'link', text = 'GEO', url = 'https://www.bg-wiki.com/ffxi/GEO' },
+                { type = 'text', value = 'where she will Entrust the first PLD, RUN, or NIN in the party instead.' },
+            },
+            {
+                { type = 'text', value = "Even if the player's Entrust is on that target, Sylvie will overwrite it with her Entrust." },
+            },
+            {
+                { type = 'text', value = 'Will cast' },
+                { type = 'link', text = 'Indicolure', url = 'https://www.bg-wiki.com/ffxi/Indicolure' },
+                { type = 'text', value = "spells based on the player's job and hit rate, ranged hit rate, or item level:" },
+                { type = 'link', text = 'Indi-Fury', url = 'https://www.bg-wiki.com/ffxi/Indi-Fury' },
+                { type = 'text', value = '(+37.5% Attack/Ranged Attack) or' },
+                { type = 'link', text = 'Indi-Precision', url = 'https://www.bg-wiki.com/ffxi/Indi-Precision' },
+                { type = 'text', value = '(+56 Accuracy/Ranged Accuracy) and' },
+                { type = 'link', text = 'Entrust', url = 'https://www.bg-wiki.com/ffxi/Entrust' },
+                { type = 'link', text = 'Indi-Frailty', url = 'https://www.bg-wiki.com/ffxi/Indi-Frailty' },
+                { type = 'text', value = '(-12.5% Defense):' },
+            },
+            {
+                { type = 'link', text = 'WAR,', url = 'https://www.bg-wiki.com/ffxi/WAR' },
+                { type = 'link', text = 'MNK,', url = 'https://www.bg-wiki.com/ffxi/MNK' },
+                { type = 'link', text = 'THF,', url = 'https://www.bg-wiki.com/ffxi/THF' },
+                { type = 'link', text = 'BST,', url = 'https://www.bg-wiki.com/ffxi/BST' },
+                { type = 'link', text = 'DRK,', url = 'https://www.bg-wiki.com/ffxi/DRK' },
+                { type = 'link', text = 'DRG,', url = 'https://www.bg-wiki.com/ffxi/DRG' },
+                { type = 'link', text = 'SAM,', url = 'https://www.bg-wiki.com/ffxi/SAM' },
+                { type = 'link', text = 'BLU,', url = 'https://www.bg-wiki.com/ffxi/BLU' },
+                { type = 'link', text = 'PUP,', url = 'https://www.bg-wiki.com/ffxi/PUP' },
+                { type = 'link', text = 'DNC', url = 'https://www.bg-wiki.com/ffxi/DNC' },
+                { type = 'text', value = 'based on hit rate' },
+            },
+            {
+                { type = 'link', text = 'RNG,', url = 'https://www.bg-wiki.com/ffxi/RNG' },
+                { type = 'link', text = 'COR', url = 'https://www.bg-wiki.com/ffxi/COR' },
+                { type = 'text', value = 'based on ranged hit rate' },
+                { type = 'link', text = 'Indi-Haste', url = 'https://www.bg-wiki.com/ffxi/Indi-Haste' },
+                { type = 'text', value = '(+28.8% haste) and' },
+                { type = 'link', text = 'Entrust', url = 'https://www.bg-wiki.com/ffxi/Entrust' },
+                { type = 'link', text = 'Indi-Refresh', url = 'https://www.bg-wiki.com/ffxi/Indi-Refresh' },
+                { type = 'text', value = '(+5/tick):' },
+                { type = 'link', text = 'PLD', url = 'https://www.bg-wiki.com/ffxi/PLD' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = 'RUN', url = 'https://www.bg-wiki.com/ffxi/RUN' },
+                { type = 'link', text = 'Indi-Haste', url = 'https://www.bg-wiki.com/ffxi/Indi-Haste' },
+                { type = 'text', value = '(+28.8% haste) and' },
+                { type = 'link', text = 'Entrust', url = 'https://www.bg-wiki.com/ffxi/Entrust' },
+                { type = 'link', text = 'Indi-Regen', url = 'https://www.bg-wiki.com/ffxi/Indi-Regen' },
+                { type = 'text', value = '(+30/tick):' },
+                { type = 'link', text = 'NIN', url = 'https://www.bg-wiki.com/ffxi/NIN' },
+                { type = 'link', text = 'Indi-Acumen', url = 'https://www.bg-wiki.com/ffxi/Indi-Acumen' },
+                { type = 'text', value = '(+21 Magic Attack) or' },
+                { type = 'link', text = 'Indi-Focus', url = 'https://www.bg-wiki.com/ffxi/Indi-Focus' },
+                { type = 'text', value = '(+55 Magic Accuracy ) and' },
+                { type = 'link', text = 'Entrust', url = 'https://www.bg-wiki.com/ffxi/Entrust' },
+                { type = 'link', text = 'Indi-Refresh', url = 'https://www.bg-wiki.com/ffxi/Indi-Refresh' },
+                { type = 'text', value = '(+5/tick):' },
+                { type = 'link', text = 'BLM,', url = 'https://www.bg-wiki.com/ffxi/BLM' },
+                { type = 'link', text = 'RDM,', url = 'https://www.bg-wiki.com/ffxi/RDM' },
+                { type = 'link', text = 'SCH', url = 'https://www.bg-wiki.com/ffxi/SCH' },
+                { type = 'text', value = "based on the difference between your level or item level and the enemy's level. Indi-Focus is used when the enemy's level is higher than the player's level or item level by 5 or more." },
+                { type = 'link', text = 'Indi-Refresh', url = 'https://www.bg-wiki.com/ffxi/Indi-Refresh' },
+                { type = 'text', value = '(+8/tick) and' },
+                { type = 'link', text = 'Entrust', url = 'https://www.bg-wiki.com/ffxi/Entrust' },
+                { type = 'link', text = 'Indi-Acumen', url = 'https://www.bg-wiki.com/ffxi/Indi-Acumen' },
+                { type = 'text', value = '(+12 Magic Attack):' },
+                { type = 'link', text = 'WHM,', url = 'https://www.bg-wiki.com/ffxi/WHM' },
+                { type = 'link', text = 'BRD,', url = 'https://www.bg-wiki.com/ffxi/BRD' },
+                { type = 'link', text = 'SMN', url = 'https://www.bg-wiki.com/ffxi/SMN' },
+                { type = 'link', text = 'Indi-Refresh', url = 'https://www.bg-wiki.com/ffxi/Indi-Refresh' },
+                { type = 'text', value = '(+8/tick) and' },
+                { type = 'link', text = 'Entrust', url = 'https://www.bg-wiki.com/ffxi/Entrust' },
+                { type = 'link', text = 'Indi-Languor', url = 'https://www.bg-wiki.com/ffxi/Indi-Languor' },
+                { type = 'text', value = '(-41 Magic Evasion ):' },
+                { type = 'link', text = 'GEO', url = 'https://www.bg-wiki.com/ffxi/GEO' },
+                { type = 'text', value = '*Sylvie only uses' },
+                { type = 'link', text = 'Entrust', url = 'https://www.bg-wiki.com/ffxi/Entrust' },
+                { type = 'text', value = 'with a player' },
+                { type = 'link', text = 'GEO', url = 'https://www.bg-wiki.com/ffxi/GEO' },
+                { type = 'text', value = "who does not have an Indicolure on themself, but Sylvie's" },
+                { type = 'link', text = 'Indi-Languor', url = 'https://www.bg-wiki.com/ffxi/Indi-Languor' },
+                { type = 'text', value = 'will go on the first' },
+                { type = 'link', text = 'PLD,', url = 'https://www.bg-wiki.com/ffxi/PLD' },
+                { type = 'link', text = 'RUN,', url = 'https://www.bg-wiki.com/ffxi/RUN' },
+                { type = 'text', value = 'or' },
+                { type = 'link', text = 'NIN', url = 'https://www.bg-wiki.com/ffxi/NIN' },
+                { type = 'text', value = 'in the party.' },
+            },
+            {
+                { type = 'text', value = "Below level 93, Sylvie won't use any of the above Indi- spells until everything's available, regardless of your job. (i.e., she is waiting until" },
+                { type = 'link', text = 'Indi-Haste', url = 'https://www.bg-wiki.com/ffxi/Indi-Haste' },
+                { type = 'text', value = "'s level, whether you need it or not)" },
+            },
+            {
+                { type = 'link', text = 'Indi-Regen', url = 'https://www.bg-wiki.com/ffxi/Indi-Regen' },
+                { type = 'text', value = 'available at Level 20.' },
+            },
+            {
+                { type = 'text', value = 'Provides about level÷3 hp/tick, reaching the maximum +30hp @ 89. About equivalent potency to the highest level' },
+                { type = 'link', text = 'Regen Spells', url = 'https://www.bg-wiki.com/ffxi/Regen_Spell' },
+                { type = 'text', value = 'available.' },
+            },
+            {
+                { type = 'link', text = 'Indi-Refresh', url = 'https://www.bg-wiki.com/ffxi/Indi-Refresh' },
+                { type = 'text', value = 'available at Level 30. Used instead of Indi-Regen if your main job has MP:' },
+                { type = 'link', text = 'WHM,', url = 'https://www.bg-wiki.com/ffxi/WHM' },
+                { type = 'link', text = 'RDM,', url = 'https://www.bg-wiki.com/ffxi/RDM' },
+                { type = 'link', text = 'BLM,', url = 'https://www.bg-wiki.com/ffxi/BLM' },
+                { type = 'link', text = 'SCH,', url = 'https://www.bg-wiki.com/ffxi/SCH' },
+                { type = 'link', text = 'SMN,', url = 'https://www.bg-wiki.com/ffxi/SMN' },
+                { type = 'link', text = 'GEO,', url = 'https://www.bg-wiki.com/ffxi/GEO' },
+                { type = 'link', text = 'PLD,', url = 'https://www.bg-wiki.com/ffxi/PLD' },
+                { type = 'link', text = 'RUN,', url = 'https://www.bg-wiki.com/ffxi/RUN' },
+                { type = 'link', text = 'BLU,', url = 'https://www.bg-wiki.com/ffxi/BLU' },
+                { type = 'link', text = 'DRK.', url = 'https://www.bg-wiki.com/ffxi/DRK' },
+            },
+            {
+                { type = 'text', value = 'Provides +2mp @ 32, +3mp @ 58, +4mp @ 84, +5mp @ 98.' },
+            },
+            {
+                { type = 'text', value = 'Gains' },
+                { type = 'link', text = 'Geomancy', url = 'https://www.bg-wiki.com/ffxi/Geomancy' },
+                { type = 'text', value = '+3 at level 99.' },
+            },
+            {
+                { type = 'text', value = 'Uses TP to recover MP.' },
+            },
+        },
+    },
+    ['Ulmia'] = {
+        name = 'Ulmia',
+        job = {
+            {
+                { type = 'link', text = 'Bard', url = 'https://www.bg-wiki.com/ffxi/Bard' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Bard', url = 'https://www.bg-wiki.com/ffxi/Bard' },
+            },
+        },
+        spells = {
+            {
+                { type = 'link', text = 'Sword/Blade Madrigal,', url = 'https://www.bg-wiki.com/ffxi/Category:Madrigal' },
+                { type = 'link', text = "Hunter's/Archer's Prelude,", url = 'https://www.bg-wiki.com/ffxi/Category:Prelude' },
+                { type = 'link', text = 'Advancing/Victory March,', url = 'https://www.bg-wiki.com/ffxi/Category:March' },
+                { type = 'link', text = 'Valor Minuet I - V,', url = 'https://www.bg-wiki.com/ffxi/Category:Minuet' },
+                { type = 'link', text = "Mage's Ballad I - III,", url = 'https://www.bg-wiki.com/ffxi/Category:Ballad' },
+                { type = 'link', text = "Sentinel's Scherzo", url = 'https://www.bg-wiki.com/ffxi/Sentinel%27s_Scherzo' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'link', text = 'Pianissimo', url = 'https://www.bg-wiki.com/ffxi/Pianissimo' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Complete' },
+                { type = 'link', text = 'Dawn.', url = 'https://www.bg-wiki.com/ffxi/Promathia_Mission_8-4' },
+            },
+            {
+                { type = 'text', value = 'Examine the Dilapidated Gate in' },
+                { type = 'link', text = 'Misareaux Coast', url = 'https://www.bg-wiki.com/ffxi/Misareaux_Coast' },
+                { type = 'text', value = '(I-11).' },
+            },
+            {
+                { type = 'text', value = 'Please note that there are two Dilapidated Gates in the zone. Players will be unable to receive the alter ego if the quest' },
+                { type = 'link', text = 'Storms of Fate', url = 'https://www.bg-wiki.com/ffxi/Storms_of_Fate' },
+                { type = 'text', value = 'is in progress after viewing the event at the Dilapidated Gate in' },
+                { type = 'link', text = 'Misareaux Coast', url = 'https://www.bg-wiki.com/ffxi/Misareaux_Coast' },
+                { type = 'text', value = '(F-7) until the battlefield is completed.' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Does not engage.' },
+            },
+            {
+                { type = 'text', value = 'Recasts her songs shortly before they wear off.' },
+            },
+            {
+                { type = 'text', value = 'Song Priority:' },
+            },
+            {
+                { type = 'link', text = 'Ballad:', url = 'https://www.bg-wiki.com/ffxi/Ballad' },
+                { type = 'text', value = "Based on party composition, rate of MP usage, and a target party member's remaining MP percentage (details below)." },
+            },
+            {
+                { type = 'link', text = 'March:', url = 'https://www.bg-wiki.com/ffxi/March' },
+                { type = 'text', value = 'Unless another Bard is providing them,' },
+                { type = 'link', text = 'Victory March', url = 'https://www.bg-wiki.com/ffxi/Victory_March' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = 'Advancing March.', url = 'https://www.bg-wiki.com/ffxi/Advancing_March' },
+            },
+            {
+                { type = 'link', text = 'Madrigal:', url = 'https://www.bg-wiki.com/ffxi/Madrigal' },
+                { type = 'text', value = 'Unless another Bard is providing them,' },
+                { type = 'link', text = 'Blade Madrigal', url = 'https://www.bg-wiki.com/ffxi/Blade_Madrigal' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = 'Sword Madrigal.', url = 'https://www.bg-wiki.com/ffxi/Sword_Madrigal' },
+            },
+            {
+                { type = 'link', text = 'Minuet:', url = 'https://www.bg-wiki.com/ffxi/Minuet' },
+                { type = 'text', value = 'when both' },
+                { type = 'link', text = 'Marches', url = 'https://www.bg-wiki.com/ffxi/March' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = 'Madrigals', url = 'https://www.bg-wiki.com/ffxi/Madrigal' },
+                { type = 'text', value = 'are performed by other Bards, plays the highest level' },
+                { type = 'link', text = 'Valor Minuets', url = 'https://www.bg-wiki.com/ffxi/Valor_Minuet' },
+                { type = 'text', value = 'not currently on the party.' },
+            },
+            {
+                { type = 'link', text = 'Pianissimo', url = 'https://www.bg-wiki.com/ffxi/Pianissimo' },
+                { type = 'text', value = 'will be used for the player under certain conditions after Ulmia has two songs on the party.' },
+            },
+            {
+                { type = 'link', text = 'Scherzo', url = 'https://www.bg-wiki.com/ffxi/Scherzo' },
+                { type = 'text', value = 'after taking a large amount of damage, or afflicted with the' },
+                { type = 'link', text = 'Weakness', url = 'https://www.bg-wiki.com/ffxi/Weakness' },
+                { type = 'text', value = 'status.' },
+            },
+            {
+                { type = 'link', text = 'Ballad', url = 'https://www.bg-wiki.com/ffxi/Ballad' },
+                { type = 'text', value = "if the player's MP is under 75% and main job is WHM, BLM, RDM, SMN, GEO, or SCH." },
+            },
+            {
+                { type = 'link', text = 'Prelude', url = 'https://www.bg-wiki.com/ffxi/Prelude' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = 'Minuet', url = 'https://www.bg-wiki.com/ffxi/Minuet' },
+                { type = 'text', value = 'if main job is RNG or COR.' },
+            },
+            {
+                { type = 'link', text = 'Ballad', url = 'https://www.bg-wiki.com/ffxi/Ballad' },
+                { type = 'text', value = 'logic:' },
+            },
+            {
+                { type = 'text', value = 'Ulmia tracks rate of MP usage to determine the target party member spending the highest percentage of their MP. (' },
+                { type = 'link', text = '[2]', url = 'https://www.bluegartr.com/threads/112776-Dev-Tracker-Findings-Posts-(NO-DISCUSSION)?p=6646517&amp;viewfull=1#post6646517' },
+                { type = 'text', value = 'BG-Forum)(' },
+                { type = 'link', text = 'Official explanation - In Japanese', url = 'https://forum.square-enix.com/ffxi/threads/38916-%E3%83%95%E3%82%A7%E3%82%A4%E3%82%B9%E3%81%AE%E4%BD%BF%E3%81%84%E5%8B%9D%E6%89%8B%E5%90%91%E4%B8%8A?p=573109&amp;viewfull=1#post573109' },
+                { type = 'text', value = ')' },
+            },
+            {
+                { type = 'text', value = 'It is possible for all party members to be at low MP and double' },
+                { type = 'link', text = 'Marches', url = 'https://www.bg-wiki.com/ffxi/March' },
+                { type = 'text', value = 'are still being played, due to failing this MP consumption check.' },
+            },
+            {
+                { type = 'text', value = 'You can try forcing yourself to be the ballad target by resummoning Ulmia then pulling with a spell.' },
+            },
+            {
+                { type = 'text', value = "Cast Ballad if target party member's MP is below a certain threshold:" },
+            },
+            {
+                { type = 'text', value = '75% if 3 or more party members (out of 6) have native MP, based on main and sub job.' },
+            },
+            {
+                { type = 'text', value = '33% if 2 or fewer party members (out of 6) have native MP.' },
+            },
+            {
+                { type = 'text', value = 'Can do double Ballads, depending on MP and timing of 2nd song expiration.' },
+            },
+            {
+                { type = 'text', value = '*' },
+                { type = 'link', text = 'Advancing March', url = 'https://www.bg-wiki.com/ffxi/Advancing_March' },
+                { type = 'text', value = 'grants 108/1024 Magical Haste.' },
+            },
+            {
+                { type = 'text', value = '*' },
+                { type = 'link', text = 'Victory March', url = 'https://www.bg-wiki.com/ffxi/Victory_March' },
+                { type = 'text', value = 'grants 155/1024 Magical Haste.' },
+            },
+        },
+    },
+    ['Brygid'] = {
+        name = 'Brygid',
+        job = {
+            {
+                { type = 'link', text = 'Geomancer', url = 'https://www.bg-wiki.com/ffxi/Geomancer' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Bard', url = 'https://www.bg-wiki.com/ffxi/Bard' },
+            },
+        },
+        spells = {
+            {
+                { type = 'text', value = 'None' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'text', value = 'None' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'text', value = 'None' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Brygid', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Brygid' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Repeat Login Campaign', url = 'https://www.bg-wiki.com/ffxi/Repeat_Login_Campaign' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Red)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Red)' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'link', text = 'Indi-CHR', url = 'https://www.bg-wiki.com/ffxi/Indi-CHR' },
+                { type = 'text', value = 'stacks with player' },
+                { type = 'link', text = 'Indi-CHR.', url = 'https://www.bg-wiki.com/ffxi/Indi-CHR' },
+            },
+            {
+                { type = 'text', value = 'This' },
+                { type = 'link', text = 'Indi-CHR', url = 'https://www.bg-wiki.com/ffxi/Indi-CHR' },
+                { type = 'text', value = 'grants a +9.7%' },
+                { type = 'link', text = 'Defense Bonus', url = 'https://www.bg-wiki.com/ffxi/Indi-Barrier' },
+                { type = 'text', value = 'and +5' },
+                { type = 'link', text = 'Magic Defense Bonus', url = 'https://www.bg-wiki.com/ffxi/Indi-Fend' },
+                { type = 'text', value = 'and +5' },
+                { type = 'link', text = 'CHR', url = 'https://www.bg-wiki.com/ffxi/CHR' },
+                { type = 'text', value = 'at lv. 99.' },
+            },
+        },
+    },
+    ['Cornelia'] = {
+        name = 'Cornelia',
+        job = {
+            {
+                { type = 'link', text = 'Geomancer', url = 'https://www.bg-wiki.com/ffxi/Geomancer' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Bard', url = 'https://www.bg-wiki.com/ffxi/Bard' },
+            },
+        },
+        spells = {
+            {
+                { type = 'text', value = 'None' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'text', value = 'None' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'text', value = 'None' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'If you have completed the quest Trust, you will automatically obtain the alter ego upon logging in after the Tuesday, December 9th, 2025, version update.' },
+            },
+            {
+                { type = 'text', value = 'No message will be displayed signifying that you have acquired the alter ego.' },
+            },
+            {
+                { type = 'text', value = 'If you have not completed the quest Trust, you must first complete it after the Tuesday, December 9th, 2025, version update and then relog or change areas.' },
+            },
+            {
+                { type = 'text', value = 'No message will be displayed signifying that you have acquired the alter ego.' },
+            },
+            {
+                { type = 'text', value = 'Cornelia was/is only available during the following times:' },
+            },
+            {
+                { type = 'text', value = 'From September 2017 until May 2018.' },
+            },
+            {
+                { type = 'text', value = 'From May 2022 until November 2022.' },
+            },
+            {
+                { type = 'text', value = 'From June 2024 until December 2024.' },
+            },
+            {
+                { type = 'text', value = 'From December 2025 until March 2026.' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'link', text = 'Haste', url = 'https://www.bg-wiki.com/ffxi/Haste' },
+                { type = 'text', value = '+20%,' },
+                { type = 'link', text = 'Accuracy', url = 'https://www.bg-wiki.com/ffxi/Accuracy' },
+                { type = 'text', value = '+30,' },
+                { type = 'link', text = 'Ranged Accuracy', url = 'https://www.bg-wiki.com/ffxi/Ranged_Accuracy' },
+                { type = 'text', value = '+30,' },
+                { type = 'link', text = 'Magic Accuracy', url = 'https://www.bg-wiki.com/ffxi/Magic_Accuracy' },
+                { type = 'text', value = '+30' },
+            },
+        },
+    },
+    ['Kupofried'] = {
+        name = 'Kupofried',
+        job = {
+            {
+                { type = 'link', text = 'Geomancer', url = 'https://www.bg-wiki.com/ffxi/Geomancer' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Bard', url = 'https://www.bg-wiki.com/ffxi/Bard' },
+            },
+        },
+        spells = {
+            {
+                { type = 'text', value = 'None' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'text', value = 'None' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'text', value = 'None' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Kupofried', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Kupofried' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Adventurer Appreciation Campaign', url = 'https://www.bg-wiki.com/ffxi/Adventurer_Appreciation_Campaign' },
+            },
+            {
+                { type = 'link', text = 'Adventurer Gratitude Campaign', url = 'https://www.bg-wiki.com/ffxi/Adventurer_Gratitude_Campaign' },
+            },
+            {
+                { type = 'text', value = 'Week three if not already obtained.' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Red)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Red)' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Grants a +20%' },
+                { type = 'link', text = 'dedication', url = 'https://www.bg-wiki.com/ffxi/Dedication' },
+                { type = 'text', value = 'effect for both' },
+                { type = 'link', text = 'Experience Points', url = 'https://www.bg-wiki.com/ffxi/Experience_Points' },
+                { type = 'text', value = 'and' },
+                { type = 'link', text = 'Capacity Points.', url = 'https://www.bg-wiki.com/ffxi/Capacity_Points' },
+            },
+            {
+                { type = 'text', value = 'This stacks with other forms of' },
+                { type = 'link', text = 'dedication', url = 'https://www.bg-wiki.com/ffxi/Dedication' },
+                { type = 'text', value = 'such as that gained from a' },
+                { type = 'link', text = 'Capacity Ring.', url = 'https://www.bg-wiki.com/ffxi/Capacity_Ring' },
+            },
+        },
+    },
+    ['Kuyin Hathdenna'] = {
+        name = 'Kuyin Hathdenna',
+        job = {
+            {
+                { type = 'link', text = 'Geomancer', url = 'https://www.bg-wiki.com/ffxi/Geomancer' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Bard', url = 'https://www.bg-wiki.com/ffxi/Bard' },
+            },
+        },
+        spells = {
+            {
+                { type = 'text', value = 'None' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'text', value = 'None' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'text', value = 'None' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Kuyin', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Kuyin' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Repeat Login Campaign', url = 'https://www.bg-wiki.com/ffxi/Repeat_Login_Campaign' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Red)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Red)' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'link', text = 'Indi-Precision', url = 'https://www.bg-wiki.com/ffxi/Indi-Precision' },
+                { type = 'text', value = 'stacks with player' },
+                { type = 'link', text = 'Indi-Precision.', url = 'https://www.bg-wiki.com/ffxi/Indi-Precision' },
+            },
+            {
+                { type = 'text', value = 'This' },
+                { type = 'link', text = 'Indi-Precision', url = 'https://www.bg-wiki.com/ffxi/Indi-Precision' },
+                { type = 'text', value = 'grants' },
+                { type = 'link', text = 'Accuracy', url = 'https://www.bg-wiki.com/ffxi/Accuracy' },
+                { type = 'text', value = '+24,' },
+                { type = 'link', text = 'Ranged accuracy', url = 'https://www.bg-wiki.com/ffxi/Ranged_accuracy' },
+                { type = 'text', value = '+24, and' },
+                { type = 'link', text = 'DEX', url = 'https://www.bg-wiki.com/ffxi/DEX' },
+                { type = 'text', value = '+5 at lv. 99.' },
+            },
+            {
+                { type = 'text', value = 'The amount of' },
+                { type = 'link', text = 'DEX', url = 'https://www.bg-wiki.com/ffxi/DEX' },
+                { type = 'text', value = 'increases when Kuyin in employed in your' },
+                { type = 'link', text = 'Mog Garden,', url = 'https://www.bg-wiki.com/ffxi/Mog_Garden' },
+                { type = 'text', value = 'depending on unknown factors possibly including the ranks of Mog Garden locations and number or length of Kuyin contracts.' },
+            },
+            {
+                { type = 'text', value = 'Up to +2 bonus.' },
+            },
+        },
+    },
+    ['Moogle'] = {
+        name = 'Moogle',
+        job = {
+            {
+                { type = 'link', text = 'Geomancer', url = 'https://www.bg-wiki.com/ffxi/Geomancer' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Bard', url = 'https://www.bg-wiki.com/ffxi/Bard' },
+            },
+        },
+        spells = {
+            {
+                { type = 'text', value = 'None' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'text', value = 'None' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'text', value = 'None' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Moogle', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Moogle' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Adventurer Appreciation Campaign', url = 'https://www.bg-wiki.com/ffxi/Adventurer_Appreciation_Campaign' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Red)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Red)' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'link', text = 'Indi-Refresh', url = 'https://www.bg-wiki.com/ffxi/Indi-Refresh' },
+                { type = 'text', value = '(3 MP/tick at lv. 99) stacks with player-cast' },
+                { type = 'link', text = 'Indi-Refresh.', url = 'https://www.bg-wiki.com/ffxi/Indi-Refresh' },
+            },
+            {
+                { type = 'text', value = 'This Indi-Refresh also grants an increase to magical skill gain rate.' },
+            },
+        },
+    },
+    ['Sakura'] = {
+        name = 'Sakura',
+        job = {
+            {
+                { type = 'link', text = 'Geomancer', url = 'https://www.bg-wiki.com/ffxi/Geomancer' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Bard', url = 'https://www.bg-wiki.com/ffxi/Bard' },
+            },
+        },
+        spells = {
+            {
+                { type = 'text', value = 'None' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'text', value = 'None' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'text', value = 'None' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: Sakura', url = 'https://www.bg-wiki.com/ffxi/Cipher:_Sakura' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Repeat Login Campaign', url = 'https://www.bg-wiki.com/ffxi/Repeat_Login_Campaign' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'link', text = 'Indi-Regen', url = 'https://www.bg-wiki.com/ffxi/Indi-Regen' },
+                { type = 'text', value = '(6 HP/tick at lv. 99) stacks with player-cast' },
+                { type = 'link', text = 'Indi-Regen.', url = 'https://www.bg-wiki.com/ffxi/Indi-Regen' },
+            },
+            {
+                { type = 'text', value = 'This Indi-Regen also grants an increase to physical combat skill gain rate.' },
+            },
+        },
+    },
+    ['Star Sibyl'] = {
+        name = 'Star Sibyl',
+        job = {
+            {
+                { type = 'link', text = 'Geomancer', url = 'https://www.bg-wiki.com/ffxi/Geomancer' },
+                { type = 'text', value = ' / ' },
+                { type = 'link', text = 'Bard', url = 'https://www.bg-wiki.com/ffxi/Bard' },
+            },
+        },
+        spells = {
+            {
+                { type = 'text', value = 'None' },
+            },
+        },
+        abilities = {
+            {
+                { type = 'text', value = 'None' },
+            },
+        },
+        weapon_skills = {
+            {
+                { type = 'text', value = 'None' },
+            },
+        },
+        acquisition = {
+            {
+                { type = 'text', value = 'Trade the' },
+                { type = 'link', text = 'Cipher: S. Sibyl', url = 'https://www.bg-wiki.com/ffxi/Cipher:_S._Sibyl' },
+                { type = 'text', value = 'item to one of the beginning Trust quest NPCs, which may be acquired via:' },
+            },
+            {
+                { type = 'link', text = 'Repeat Login Campaign', url = 'https://www.bg-wiki.com/ffxi/Repeat_Login_Campaign' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Red)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Red)' },
+            },
+            {
+                { type = 'link', text = 'Mog Pell (Ochre)', url = 'https://www.bg-wiki.com/ffxi/Mog_Pell_(Ochre)' },
+            },
+        },
+        special_features = {
+            {
+                { type = 'text', value = 'Has full time' },
+                { type = 'link', text = 'Indi-Acumen', url = 'https://www.bg-wiki.com/ffxi/Indi-Acumen' },
+                { type = 'text', value = '(Magic Attack Boost). +19 at level 99.' },
+            },
+            {
+                { type = 'text', value = 'This sphere effect also has a +19 Magic Accuracy boost at level 99. The Magic Accuracy boost can raise trusts M.ACC over breakpoints for certain spells like Dispel against some enemies.' },
+            },
+        },
+    },
+}
+
+return trustInformation
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the data generation scripts.
+Runs the parsers against a Category:Trust page at 1x and against synthetic pages scaled to 10x/100x
+the trust count, reports wall time and tracemalloc peak memory per case, and saves the results as
+JSON so regressions can be compared across commits.
+The synthetic pages are rendered by synthetic_page.py from the data files, so they only hold markup
+the parsers already accept and say nothing about how they handle the live wiki. --snapshot saves the
+live page to fixtures/Category_Trust.html, which is used at 1x instead when present. Every result
+records which page it was measured on.
+"""
+
+import re
+import gc
+import sys
+import json
+import time
+import platform
+import argparse
+import statistics
+import subprocess
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+import wiki_fetch
+import synthetic_page
+import generate_categories
+import generate_information
+
+SCRIPT_DIR = Path(__file__).parent
+# A saved copy of the live page, written by --snapshot
+SNAPSHOT_FILE = SCRIPT_DIR / "fixtures" / "Category_Trust.html"
+RESULTS_DIR = wiki_fetch.CACHE_DIR / "benchmarks"
+
+FIELD_NAMES = ('Job', 'Spells', 'Abilities', 'Weapon Skills')
+SECTION_NAMES = ('Acquisition', 'Special Features')
+
+
+def load_page(scale):
+    """
+    Return (page, source) for a scale: the saved live page at 1x when there is one, otherwise a
+    synthetic page rendered from the data files. source is 'snapshot' or 'synthetic'.
+    """
+    if scale == 1 and SNAPSHOT_FILE.exists():
+        with open(SNAPSHOT_FILE, 'r', encoding='utf-8') as f:
+            return f.read(), 'snapshot'
+    page = synthetic_page.render_page(synthetic_page.load_categories(), synthetic_page.load_trusts(), scale)
+    return page, 'synthetic'
+
+
+def trust_tables(content):
+    """Split a page into trust tables the way parse_html_content_from_string does."""
+    tables = re.split(r'<table class="wikitable"', content)[1:]
+    return [table for table in tables if '<td' in table and '<span' in table]
+
+
+def field_cells(tables):
+    """Return the raw cell HTML fed to parse_html_content by extract_field."""
+    cells = []
+    for table in tables:
+        for field_name in FIELD_NAMES:
+            pattern = rf'<td[^>]*>\s*{re.escape(field_name)}\s*</td>\s*<td[^>]*>(.*?)</td>'
+            match = re.search(pattern, table, re.DOTALL | re.IGNORECASE)
+            if match:
+                cells.append(match.group(1))
+    return cells
+
+
+def text_chunks(content):
+    """Split a page into the chunk size wiki_fetch.PageStream yields."""
+    return [content[i:i + wiki_fetch.CHUNK_SIZE] for i in range(0, len(content), wiki_fetch.CHUNK_SIZE)]
+
+
+def feed_category_stream(chunks):
+    parser = generate_categories.CategoryStreamParser()
+    for chunk in chunks:
+        parser.feed(chunk)
+    return parser.close()
+
+
+def benchmark_cases(content):
+    """Return (name, callable) pairs for every benchmarked function on one page."""
+    tables = trust_tables(content)
+    cells = field_cells(tables)
+    chunks = text_chunks(content)
+
+    cases = [
+        ('generate_information.parse_html_content_from_string',
+         lambda: generate_information.parse_html_content_from_string(content)),
+        ('generate_information.parse_html_stream',
+         lambda: generate_information.parse_html_stream(chunks)),
+        ('generate_information.extract_field',
+         lambda: [generate_information.extract_field(t, n) for t in tables for n in FIELD_NAMES]),
+        ('generate_information.extract_section',
+         lambda: [generate_information.extract_section(t, n) for t in tables for n in SECTION_NAMES]),
+        ('generate_information.parse_html_content',
+         lambda: [generate_information.parse_html_content(c) for c in cells]),
+        ('generate_categories.parse_html_content',
+         lambda: generate_categories.parse_html_content(content)),
+        ('generate_categories.CategoryStreamParser',
+         lambda: feed_category_stream(chunks)),
+    ]
+    return cases
+
+
+def measure(func, repeat):
+    """Time func repeat times, then run it once more under tracemalloc for the peak allocation."""
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'best_ms': round(min(timings) * 1000, 3),
+        'median_ms': round(statistics.median(timings) * 1000, 3),
+        'peak_kb': round(peak / 1024, 1)
+    }
+
+
+def current_commit():
+    """Return the short hash of HEAD, or None outside a git checkout."""
+    try:
+        result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=SCRIPT_DIR,
+                                capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def compare_results(previous, results):
+    """Print the change of every case against a previous results file."""
+    baseline = {(r['scale'], r['name']): r for r in previous['results']}
+    print(f"\nCompared to {previous.get('commit') or 'previous run'}:")
+    for result in results:
+        old = baseline.get((result['scale'], result['name']))
+        if not old:
+            continue
+        time_delta = (result['best_ms'] - old['best_ms']) / old['best_ms'] * 100 if old['best_ms'] else 0
+        peak_delta = (result['peak_kb'] - old['peak_kb']) / old['peak_kb'] * 100 if old['peak_kb'] else 0
+        print(f"  {result['scale']:>4}x {result['name']:<66} {time_delta:+7.1f}% time {peak_delta:+7.1f}% peak")
+
+
+def snapshot_fixture(url):
+    """Save the current live page as the 1x page."""
+    page = wiki_fetch.fetch_page(url, cache_dir=None)
+    SNAPSHOT_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with open(SNAPSHOT_FILE, 'w', encoding='utf-8') as f:
+        f.write(page.content)
+    print(f"Saved {url} to {SNAPSHOT_FILE}")
+
+
+def main(argv=None):
+    """Main function."""
+    parser = argparse.ArgumentParser(description='Benchmark the data generation scripts')
+    parser.add_argument('--scales', type=lambda s: [int(x) for x in s.split(',')], default=[1, 10, 100],
+                        help='comma separated trust count multipliers, 1 is the saved live page when there '
+                             'is one (default: 1,10,100)')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='timed runs per case, the best and median are reported (default: %(default)s)')
+    parser.add_argument('--filter', default='',
+                        help='only run cases whose name contains this text')
+    parser.add_argument('--output', type=Path,
+                        help='results file (default: scripts/.cache/benchmarks/<commit>.json)')
+    parser.add_argument('--compare', type=Path,
+                        help='previous results file to compare against')
+    parser.add_argument('--snapshot', action='store_true',
+                        help='download the live page to fixtures/Category_Trust.html and use it at 1x')
+    args = parser.parse_args(argv)
+
+    if args.snapshot:
+        try:
+            snapshot_fixture(wiki_fetch.WIKI_URL)
+        except Exception as e:
+            print(f"Error downloading HTML: {e}")
+            return 1
+
+    results = []
+    for scale in args.scales:
+        content, source = load_page(scale)
+        print(f"Page {scale}x ({source}): {len(content.encode('utf-8'))} bytes")
+
+        for name, func in benchmark_cases(content):
+            if args.filter not in name:
+                continue
+            result = {'scale': scale, 'page': source, 'name': name, **measure(func, args.repeat)}
+            results.append(result)
+            print(f"  {name:<66} {result['best_ms']:>10.1f} ms best "
+                  f"{result['median_ms']:>10.1f} ms median {result['peak_kb']:>10.1f} KB peak")
+
+    commit = current_commit()
+    report = {
+        'commit': commit,
+        'date': datetime.now().isoformat(timespec='seconds'),
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'repeat': args.repeat,
+        'results': results
+    }
+
+    output = args.output or RESULTS_DIR / f"{commit or 'results'}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"Saved results to {output}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            compare_results(json.load(f), results)
+
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
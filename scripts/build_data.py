@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Script to download https://www.bg-wiki.com/ffxi/Category:Trust once and generate
+both trustCategories.lua and trustInformation.json from the same page, then the indexes
+generate_indexes.py builds from them and the hand-maintained data files.
+Every data file is a step of a build graph (build_graph.py) with the fingerprints of the page,
+the scripts and the options it comes from, so a refresh only parses the page and writes the files
+when one of them changed, and a file whose content is the same is not rewritten.
+The icon atlas only depends on resources/icons and is built in a worker process.
+"""
+
+import hashlib
+import argparse
+import http.client
+import urllib.error
+from pathlib import Path
+
+import wiki_fetch
+import profiling
+import build_graph
+import crawl_details
+import build_icon_atlas
+import generate_categories
+import generate_information
+import generate_indexes
+import skillchain_index
+import lua_format
+import trust_ir
+
+
+def feed_chunks(chunks, parser):
+    """Pass text chunks through, feeding each one to parser on the way."""
+    for chunk in chunks:
+        parser.feed(chunk)
+        yield chunk
+
+
+def hash_file(path):
+    """SHA-256 of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(wiki_fetch.CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def parse_stream(page, args):
+    """Parse a streamed page with both parsers reading the same chunks as they arrive, returns (trusts, categories)."""
+    category_parser = generate_categories.CategoryStreamParser()
+    content = feed_chunks(page, category_parser)
+    if args.no_cache:
+        trusts = generate_information.parse_html_stream(content)
+    else:
+        cache_path = args.cache_dir / generate_information.TABLE_CACHE_FILE
+        trusts = generate_information.parse_html_content_cached(content, cache_path)
+    return trusts, category_parser.close()
+
+
+def parse_information(content, args):
+    """Parse the trust tables of the page content."""
+    if args.no_cache:
+        return generate_information.parse_html_content_from_string(content)
+    cache_path = args.cache_dir / generate_information.TABLE_CACHE_FILE
+    return generate_information.parse_html_content_cached(content, cache_path)
+
+
+def define_graph(args, page, project_root):
+    """Return the build graph of every data file for a downloaded page."""
+    # Output paths
+    categories_file = project_root / "data" / "trustCategories.lua"
+    category_index_file = project_root / "data" / "trustCategoryIndex.lua"
+    information_file = project_root / "data" / "trustInformation.json"
+    information_lua_file = project_root / "data" / "trustInformation.lua"
+    skillchain_index_file = project_root / "data" / "skillchainIndex.lua"
+    skillchain_names_file = project_root / "data" / "skillchainNames.lua"
+    trust_data_file = project_root / "data" / "trustData.lua"
+    aliases_file = project_root / "data" / "trustAliases.lua"
+    cipher_data_file = project_root / "data" / "cipherData.lua"
+    cipher_index_file = project_root / "data" / "cipherIndex.lua"
+    trust_index_file = project_root / "data" / "trustIndex.lua"
+    search_index_file = project_root / "data" / "searchIndex.lua"
+    atlas_file = project_root / "resources" / "iconAtlas.png"
+    atlas_lua_file = project_root / "data" / "iconAtlas.lua"
+    icon_files = sorted((project_root / "resources" / "icons").glob('*.png'))
+
+    manifest_path = None if args.no_cache else args.cache_dir / build_graph.MANIFEST_FILE
+    graph = build_graph.BuildGraph(manifest_path, force=args.force)
+
+    information_code = (generate_information.__file__, trust_ir.__file__, lua_format.__file__)
+    categories_code = (generate_categories.__file__, trust_ir.__file__)
+
+    if args.stream:
+        # A fresh stream is parsed before its digest is known, so only a revalidated copy is fingerprinted
+        graph.source('page', page, hash_file(page.cached_body) if page.not_modified else None)
+        graph.step('parse_page', lambda stream: parse_stream(stream, args), ['page'],
+                   code=information_code + categories_code)
+        graph.step('parse_information', lambda parsed: parsed[0], ['parse_page'])
+        graph.step('parse_categories', lambda parsed: parsed[1], ['parse_page'])
+    else:
+        graph.source('page', page.content, build_graph.digest_bytes(page.content.encode('utf-8')))
+        graph.step('parse_information', lambda content: parse_information(content, args), ['page'],
+                   code=information_code)
+        graph.step('parse_categories', generate_categories.parse_html_content, ['page'],
+                   code=categories_code, process=True)
+
+    graph.source('skillchain_names', skillchain_names_file, build_graph.digest_files([skillchain_names_file]))
+    graph.source('trust_data', trust_data_file, build_graph.digest_files([trust_data_file]))
+    graph.source('trust_aliases', aliases_file, build_graph.digest_files([aliases_file]))
+    graph.source('cipher_data', cipher_data_file, build_graph.digest_files([cipher_data_file]))
+    graph.source('icons', icon_files, build_graph.digest_files(icon_files))
+
+    # The linked pages are not fingerprinted, so crawled details always rebuild what depends on them
+    trusts = 'parse_information'
+    if args.details:
+        graph.step('crawl_details',
+                   lambda parsed: crawl_details.crawl_details(parsed, crawl_details.crawler_args(args), args.fields),
+                   [trusts], volatile=True)
+        trusts = 'crawl_details'
+    if args.render_runs:
+        graph.step('render_runs', generate_information.add_render_runs, [trusts], code=information_code)
+        trusts = 'render_runs'
+
+    graph.step('write_categories', generate_categories.generate_category_files,
+               ['parse_categories', 'trust_data', 'trust_aliases'], code=categories_code + (lua_format.__file__,),
+               outputs=[categories_file, category_index_file])
+    graph.step('write_json',
+               lambda parsed, path: generate_information.generate_json_file(parsed, path, layout=args.layout),
+               [trusts], code=information_code, options={'layout': args.layout}, outputs=[information_file])
+    graph.step('write_lua', generate_information.generate_lua_file, [trusts],
+               code=information_code, outputs=[information_lua_file])
+    graph.step('write_skillchain_index', skillchain_index.generate_index_file, [trusts, 'skillchain_names'],
+               code=(skillchain_index.__file__, lua_format.__file__), outputs=[skillchain_index_file])
+    graph.step('write_indexes', generate_indexes.generate_index_files, ['cipher_data', 'trust_data'],
+               code=(generate_indexes.__file__, lua_format.__file__), outputs=[cipher_index_file, trust_index_file])
+    # The search index reads trustCategories.lua and trustInformation.json back once they are written
+    graph.step('write_search_index',
+               lambda json_written, categories_written, trust_data, aliases, path:
+                   generate_indexes.generate_search_files(trust_data, aliases, categories_file, information_file, path),
+               ['write_json', 'write_categories', 'trust_data', 'trust_aliases'],
+               code=(generate_indexes.__file__,) + information_code + categories_code,
+               outputs=[search_index_file])
+    graph.step('build_icon_atlas', build_icon_atlas.write_atlas, ['icons'],
+               code=(build_icon_atlas.__file__, lua_format.__file__), outputs=[atlas_file, atlas_lua_file],
+               process=True)
+
+    return graph
+
+
+def main(argv=None):
+    """Main function."""
+    parser = argparse.ArgumentParser(description='Generate every data file from a single download of the FFXI wiki')
+    wiki_fetch.add_fetch_arguments(parser)
+    parser.add_argument('--layout', choices=generate_information.LAYOUTS, default=generate_information.DEFAULT_LAYOUT,
+                        help='trustInformation.json layout (default: %(default)s)')
+    parser.add_argument('--render-runs', action='store_true',
+                        help='add pre-split, pre-measured render runs to text and link items')
+    parser.add_argument('--details', action='store_true',
+                        help='crawl the pages linked from every trust and merge their details into the records')
+    crawl_details.add_crawl_arguments(parser)
+    profiling.add_profile_arguments(parser)
+    args = parser.parse_args(argv)
+
+    with profiling.session(args, 'build_data'):
+        return build(args)
+
+
+def build(args):
+    """Download the page once and bring every data file described by the command line options up to date."""
+    # Get script directory
+    script_dir = Path(__file__).parent
+    project_root = script_dir.parent
+
+    # Download HTML from URL
+    print(f"Downloading HTML from {args.url}...")
+    try:
+        with profiling.stage('download'):
+            page = wiki_fetch.open_args(args) if args.stream else wiki_fetch.fetch_args(args)
+    except urllib.error.URLError as e:
+        print(f"Error downloading HTML: {e}")
+        return 1
+    except Exception as e:
+        print(f"Error: {e}")
+        return 1
+
+    graph = define_graph(args, page, project_root)
+    try:
+        statuses = graph.build()
+    except (OSError, http.client.HTTPException) as e:
+        # A streamed download can still fail halfway through
+        print(f"Error downloading HTML: {e}")
+        return 1
+    except ValueError as e:
+        # Category names that do not resolve to trustData
+        print(f"Error: {e}")
+        return 1
+    finally:
+        if args.stream:
+            page.close()
+
+    print("Build summary:")
+    for name, node in graph.nodes.items():
+        if name in statuses:
+            files = ', '.join(Path(path).name for path in node.outputs)
+            print(f"  {files}: {statuses[name]}")
+
+    print("Done!")
+    return 0
+
+if __name__ == '__main__':
+    exit(main())
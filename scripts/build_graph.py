@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Dependency graph of the generated data files, run by build_data.py.
+Every node is a build step with the nodes it reads, the source files of its code and the options
+that change its result. Its key is a digest of these and of the keys of its inputs, so it changes
+whenever anything upstream does. Nodes that write files record their key and the digest of those
+files in a manifest, a node is stale when either no longer matches, and only the stale nodes and
+the steps they read from are run. Steps marked process run in worker processes, next to the steps
+of the main process.
+Files are written to a temporary directory first and only replace an output whose content changed,
+the generated date of the headers aside, so a rebuild of the same data leaves the file untouched.
+"""
+
+import io
+import os
+import re
+import json
+import shutil
+import hashlib
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from contextlib import redirect_stdout
+from dataclasses import dataclass
+from pathlib import Path
+
+import profiling
+
+MANIFEST_FILE = 'build_manifest.json'
+# The generated date of the Lua headers and of the JSON metadata
+GENERATED_PATTERN = re.compile(rb'^-- Generated: [^\r\n]*|"generated": ?"[^"]*"', re.MULTILINE)
+
+
+def digest_bytes(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def digest_files(paths):
+    """Digest of the names and contents of files, in the given order. A missing file digests as missing."""
+    digest = hashlib.sha256()
+    for path in paths:
+        path = Path(path)
+        digest.update(path.name.encode('utf-8') + b'\0')
+        try:
+            digest.update(path.read_bytes())
+        except FileNotFoundError:
+            digest.update(b'\0missing')
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def strip_generated(data):
+    return GENERATED_PATTERN.sub(b'', data)
+
+
+def replace_if_changed(temporary, path):
+    """Move a freshly written file over path unless only its generated date differs. Returns True if path was written."""
+    data = Path(temporary).read_bytes()
+    try:
+        if strip_generated(path.read_bytes()) == strip_generated(data):
+            return False
+    except FileNotFoundError:
+        pass
+    os.replace(temporary, path)
+    return True
+
+
+def run_step(function, args, replacements):
+    """Run a step, returning its result and what it printed with the temporary paths replaced by the final ones."""
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        value = function(*args)
+    text = buffer.getvalue()
+    for temporary, final in replacements:
+        text = text.replace(temporary, final)
+    return value, text
+
+
+@dataclass
+class Node:
+    """
+    A source or a build step. function(*input values, *output paths) returns the value of the step,
+    outputs are the files it writes. A volatile step depends on something that cannot be fingerprinted,
+    such as other wiki pages, and always runs.
+    """
+    name: str
+    function: object = None
+    inputs: tuple = ()
+    code: tuple = ()
+    options: dict = None
+    outputs: tuple = ()
+    volatile: bool = False
+    process: bool = False
+    key: str = None
+
+
+class BuildGraph:
+    """Nodes in the order they were added, which must list the inputs of a node before it."""
+
+    def __init__(self, manifest_path=None, force=False):
+        self.manifest_path = manifest_path
+        self.force = force
+        self.nodes = {}
+        self.values = {}
+        self.manifest = {}
+        if manifest_path:
+            try:
+                with open(manifest_path, 'r', encoding='utf-8') as f:
+                    self.manifest = json.load(f)
+            except (OSError, ValueError):
+                self.manifest = {}
+
+    def source(self, name, value, key=None):
+        """Add an input that is already available, key=None when it cannot be fingerprinted."""
+        self.values[name] = value
+        node = self.nodes[name] = Node(name, volatile=key is None)
+        node.key = key if key is not None else digest_bytes(os.urandom(16))
+
+    def step(self, name, function, inputs=(), code=(), options=None, outputs=(), volatile=False, process=False):
+        """Add a build step, code lists the files whose changes invalidate it."""
+        node = self.nodes[name] = Node(name, function, tuple(inputs), tuple(code), options, tuple(outputs),
+                                       volatile, process)
+        if volatile:
+            node.key = digest_bytes(os.urandom(16))
+        else:
+            node.key = digest_bytes(json.dumps({
+                'code': digest_files(node.code),
+                'options': options,
+                'inputs': [self.nodes[name].key for name in node.inputs]
+            }, sort_keys=True).encode('utf-8'))
+
+    def is_stale(self, node):
+        """True if a step with outputs has to run: forced, volatile, new inputs or outputs changed since."""
+        entry = self.manifest.get(node.name)
+        if self.force or node.volatile or entry is None or entry.get('key') != node.key:
+            return True
+        for path in node.outputs:
+            try:
+                if digest_bytes(Path(path).read_bytes()) != entry['outputs'].get(str(path)):
+                    return True
+            except FileNotFoundError:
+                return True
+        return False
+
+    def plan(self):
+        """Return (steps to run in order, up-to-date steps with outputs)."""
+        needed = set()
+
+        def need(name):
+            if name in needed or name in self.values:
+                return
+            needed.add(name)
+            for input_name in self.nodes[name].inputs:
+                need(input_name)
+
+        fresh = []
+        for node in self.nodes.values():
+            if node.outputs:
+                if self.is_stale(node):
+                    need(node.name)
+                else:
+                    fresh.append(node.name)
+
+        return [name for name in self.nodes if name in needed], fresh
+
+    def build(self):
+        """Run the stale steps, returning {step: 'written', 'unchanged' or 'up to date'} for the steps with outputs."""
+        steps, fresh = self.plan()
+        statuses = {name: 'up to date' for name in fresh}
+        pending = list(steps)
+        processes = [name for name in steps if self.nodes[name].process]
+        executor = ProcessPoolExecutor(max_workers=len(processes)) if processes else None
+        futures = {}
+
+        try:
+            while pending or futures:
+                ready = [name for name in pending if all(i in self.values for i in self.nodes[name].inputs)]
+
+                # Worker steps are started first, so they run while the main process works
+                for name in ready:
+                    if self.nodes[name].process:
+                        print(f"Running {name} in a worker process...")
+                        pending.remove(name)
+                        function, args, temporaries, replacements = self.prepare(self.nodes[name])
+                        future = executor.submit(run_step, function, args, replacements)
+                        futures[future] = (name, temporaries)
+
+                local = [name for name in ready if not self.nodes[name].process]
+                if local:
+                    name = local[0]
+                    print(f"Running {name}...")
+                    pending.remove(name)
+                    function, args, temporaries, replacements = self.prepare(self.nodes[name])
+                    try:
+                        with profiling.stage(name):
+                            value, text = run_step(function, args, replacements)
+                    except BaseException:
+                        self.discard(temporaries)
+                        raise
+                    statuses.update(self.finish(name, value, text, temporaries))
+                    continue
+
+                if not futures:
+                    raise RuntimeError(f"build steps wait on missing inputs: {', '.join(pending)}")
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name, temporaries = futures.pop(future)
+                    try:
+                        value, text = future.result()
+                    except BaseException:
+                        self.discard(temporaries)
+                        raise
+                    statuses.update(self.finish(name, value, text, temporaries))
+        finally:
+            for _, temporaries in futures.values():
+                self.discard(temporaries)
+            if executor:
+                executor.shutdown(cancel_futures=True)
+            self.save_manifest()
+
+        return statuses
+
+    def prepare(self, node):
+        """Return (function, args, temporary directories, path replacements) to run a step."""
+        args = [self.values[name] for name in node.inputs]
+        temporaries = {}
+        for path in node.outputs:
+            path = Path(path)
+            if path.parent not in temporaries:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                temporaries[path.parent] = Path(tempfile.mkdtemp(prefix='.build-', dir=path.parent))
+            args.append(temporaries[path.parent] / path.name)
+        replacements = [(str(temporary), str(parent)) for parent, temporary in temporaries.items()]
+        return node.function, args, temporaries, replacements
+
+    def finish(self, name, value, text, temporaries):
+        """Record the value of a finished step and move its changed outputs into place."""
+        print(text, end='')
+        self.values[name] = value
+        node = self.nodes[name]
+        if not node.outputs:
+            return {}
+
+        written = False
+        digests = {}
+        try:
+            for path in node.outputs:
+                path = Path(path)
+                written = replace_if_changed(temporaries[path.parent] / path.name, path) or written
+                digests[str(path)] = digest_bytes(path.read_bytes())
+        finally:
+            self.discard(temporaries)
+
+        self.manifest[name] = {'key': node.key, 'outputs': digests}
+        return {name: 'written' if written else 'unchanged'}
+
+    def discard(self, temporaries):
+        for temporary in temporaries.values():
+            shutil.rmtree(temporary, ignore_errors=True)
+
+    def save_manifest(self):
+        if not self.manifest_path:
+            return
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.manifest_path.with_suffix(self.manifest_path.suffix + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.manifest_path)
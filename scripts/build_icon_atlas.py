@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+"""
+Script to pack every PNG in resources/icons into a single atlas texture, resources/iconAtlas.png,
+and to write data/iconAtlas.lua with the position, size and UV rectangle of every icon, so the addon
+creates one texture at startup instead of one per icon.
+PNGs are decoded and encoded with the standard library only (zlib and struct), and the atlas is
+decoded again after it is written to check that every icon matches its source pixels.
+"""
+
+import zlib
+import struct
+import argparse
+from datetime import datetime
+from pathlib import Path
+
+from lua_format import lua_key, lua_value
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+# Samples per pixel of the 8-bit color types: grayscale, RGB, palette, grayscale + alpha, RGBA
+CHANNELS = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}
+# Transparent pixels between icons, so filtering a scaled-down icon does not pick up its neighbours
+PADDING = 2
+# Largest atlas side tried, D3D8 cards are guaranteed 2048
+MAX_SIZE = 2048
+
+
+def read_chunks(data):
+    """Yield (type, payload) for every chunk of a PNG file, checking the signature and CRCs."""
+    if not data.startswith(PNG_SIGNATURE):
+        raise ValueError('not a PNG file')
+    position = len(PNG_SIGNATURE)
+    while position < len(data):
+        length, chunk_type = struct.unpack('>I4s', data[position:position + 8])
+        payload = data[position + 8:position + 8 + length]
+        crc, = struct.unpack('>I', data[position + 8 + length:position + 12 + length])
+        if zlib.crc32(chunk_type + payload) != crc:
+            raise ValueError(f'bad CRC in {chunk_type.decode("ascii", "replace")} chunk')
+        yield chunk_type, payload
+        position += 12 + length
+
+
+def paeth(a, b, c):
+    p = a + b - c
+    pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+    if pa <= pb and pa <= pc:
+        return a
+    return b if pb <= pc else c
+
+
+def unfilter(raw, width, height, bpp):
+    """Undo the per-scanline filters of decompressed image data and return the bare pixel rows."""
+    stride = width * bpp
+    pixels = bytearray(stride * height)
+    previous = bytearray(stride)
+    position = 0
+    for y in range(height):
+        filter_type = raw[position]
+        line = bytearray(raw[position + 1:position + 1 + stride])
+        position += 1 + stride
+        if filter_type == 1:
+            for i in range(bpp, stride):
+                line[i] = (line[i] + line[i - bpp]) & 0xFF
+        elif filter_type == 2:
+            for i in range(stride):
+                line[i] = (line[i] + previous[i]) & 0xFF
+        elif filter_type == 3:
+            for i in range(stride):
+                left = line[i - bpp] if i >= bpp else 0
+                line[i] = (line[i] + ((left + previous[i]) >> 1)) & 0xFF
+        elif filter_type == 4:
+            for i in range(stride):
+                left = line[i - bpp] if i >= bpp else 0
+                up_left = previous[i - bpp] if i >= bpp else 0
+                line[i] = (line[i] + paeth(left, previous[i], up_left)) & 0xFF
+        elif filter_type != 0:
+            raise ValueError(f'unknown filter type {filter_type}')
+        pixels[y * stride:(y + 1) * stride] = line
+        previous = line
+    return pixels
+
+
+def read_png(path):
+    """Decode an 8-bit, non-interlaced PNG into (width, height, RGBA bytes)."""
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    header = None
+    palette = b''
+    transparency = b''
+    compressed = []
+    for chunk_type, payload in read_chunks(data):
+        if chunk_type == b'IHDR':
+            header = struct.unpack('>IIBBBBB', payload)
+        elif chunk_type == b'PLTE':
+            palette = payload
+        elif chunk_type == b'tRNS':
+            transparency = payload
+        elif chunk_type == b'IDAT':
+            compressed.append(payload)
+        elif chunk_type == b'IEND':
+            break
+
+    if header is None:
+        raise ValueError('missing IHDR chunk')
+    width, height, bit_depth, color_type, _, _, interlace = header
+    if bit_depth != 8 or color_type not in CHANNELS or interlace:
+        raise ValueError(f'unsupported PNG (bit depth {bit_depth}, color type {color_type}, interlace {interlace})')
+
+    channels = CHANNELS[color_type]
+    pixels = unfilter(zlib.decompress(b''.join(compressed)), width, height, channels)
+
+    if color_type == 6:
+        return width, height, bytes(pixels)
+
+    rgba = bytearray(width * height * 4)
+    for i in range(width * height):
+        if color_type == 4:
+            gray, alpha = pixels[i * 2], pixels[i * 2 + 1]
+            rgba[i * 4:i * 4 + 4] = (gray, gray, gray, alpha)
+        elif color_type == 3:
+            index = pixels[i]
+            alpha = transparency[index] if index < len(transparency) else 255
+            rgba[i * 4:i * 4 + 4] = palette[index * 3:index * 3 + 3] + bytes((alpha,))
+        else:
+            sample = bytes(pixels[i * channels:(i + 1) * channels])
+            # tRNS holds the one fully transparent color as 16-bit samples
+            transparent = len(transparency) == 2 * channels and sample == transparency[1::2]
+            rgb = sample * 3 if color_type == 0 else sample
+            rgba[i * 4:i * 4 + 4] = rgb + bytes((0 if transparent else 255,))
+    return width, height, bytes(rgba)
+
+
+def write_png(path, width, height, rgba):
+    """Encode RGBA bytes as an 8-bit RGBA PNG, every scanline with the Sub filter."""
+    stride = width * 4
+    raw = bytearray()
+    for y in range(height):
+        line = rgba[y * stride:(y + 1) * stride]
+        raw.append(1)
+        raw.extend(line[:4])
+        raw.extend((line[i] - line[i - 4]) & 0xFF for i in range(4, stride))
+
+    def chunk(chunk_type, payload):
+        return (struct.pack('>I', len(payload)) + chunk_type + payload
+                + struct.pack('>I', zlib.crc32(chunk_type + payload)))
+
+    with open(path, 'wb') as f:
+        f.write(PNG_SIGNATURE)
+        f.write(chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 6, 0, 0, 0)))
+        f.write(chunk(b'IDAT', zlib.compress(bytes(raw), 9)))
+        f.write(chunk(b'IEND', b''))
+
+
+def skyline_pack(sizes, atlas_width, atlas_height, padding):
+    """
+    Place (width, height) rectangles in the given order with the bottom-left skyline heuristic.
+    Returns their (x, y) positions, or None if they do not fit. Padding is kept to the right of and
+    below every rectangle, except along the atlas edges.
+    """
+    # Skyline segments as [x, y, width], left to right
+    skyline = [[0, 0, atlas_width]]
+    positions = []
+
+    for width, height in sizes:
+        best = None
+        for start in range(len(skyline)):
+            x = skyline[start][0]
+            if x + width > atlas_width:
+                break
+            # The rectangle rests on the highest segment it spans
+            y = 0
+            end = start
+            while end < len(skyline) and skyline[end][0] < x + width + padding:
+                y = max(y, skyline[end][1])
+                end += 1
+            if y + height <= atlas_height and (best is None or (y, x) < (best[1], best[0])):
+                best = (x, y)
+        if best is None:
+            return None
+
+        x, y = best
+        right = min(x + width + padding, atlas_width)
+        top = y + height + padding
+        updated = []
+        for segment_x, segment_y, segment_width in skyline:
+            segment_end = segment_x + segment_width
+            if segment_end <= x or segment_x >= right:
+                updated.append([segment_x, segment_y, segment_width])
+                continue
+            if segment_x < x:
+                updated.append([segment_x, segment_y, x - segment_x])
+            if segment_end > right:
+                updated.append([right, segment_y, segment_end - right])
+        updated.append([x, top, right - x])
+        updated.sort()
+        skyline = updated
+        positions.append(best)
+
+    return positions
+
+
+def pack_icons(sizes, padding=PADDING):
+    """
+    Return (atlas_width, atlas_height, positions) for the smallest power of two atlas holding every
+    rectangle, which D3DX loads as is (other sizes are stretched to a power of two).
+    """
+    # Tallest first, then widest, is a good order for the skyline heuristic
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0]))
+    candidates = sorted(((width, height) for width in (2 ** n for n in range(12)) for height in (2 ** n for n in range(12))
+                         if width <= MAX_SIZE and height <= MAX_SIZE),
+                        key=lambda size: (size[0] * size[1], abs(size[0] - size[1])))
+
+    for atlas_width, atlas_height in candidates:
+        placed = skyline_pack([sizes[i] for i in order], atlas_width, atlas_height, padding)
+        if placed is not None:
+            positions = [None] * len(sizes)
+            for i, position in zip(order, placed):
+                positions[i] = position
+            return atlas_width, atlas_height, positions
+
+    raise ValueError(f'icons do not fit in a {MAX_SIZE}x{MAX_SIZE} atlas')
+
+
+def build_atlas(icon_files, padding=PADDING):
+    """Return (atlas_width, atlas_height, RGBA bytes, {icon name: entry}) for a list of PNG files."""
+    images = [(Path(path).stem, read_png(path)) for path in icon_files]
+    atlas_width, atlas_height, positions = pack_icons([(width, height) for _, (width, height, _) in images], padding)
+
+    atlas = bytearray(atlas_width * atlas_height * 4)
+    entries = {}
+    for (name, (width, height, rgba)), (x, y) in zip(images, positions):
+        for row in range(height):
+            start = ((y + row) * atlas_width + x) * 4
+            atlas[start:start + width * 4] = rgba[row * width * 4:(row + 1) * width * 4]
+        entries[name] = {
+            'x': x,
+            'y': y,
+            'width': width,
+            'height': height,
+            'uv0': [x / atlas_width, y / atlas_height],
+            'uv1': [(x + width) / atlas_width, (y + height) / atlas_height]
+        }
+
+    return atlas_width, atlas_height, bytes(atlas), entries
+
+
+def verify_atlas(atlas_path, icon_files, entries):
+    """Decode the written atlas and return the names of the icons whose pixels differ from their source."""
+    atlas_width, _, atlas = read_png(atlas_path)
+    mismatches = []
+    for path in icon_files:
+        name = Path(path).stem
+        width, height, rgba = read_png(path)
+        entry = entries.get(name)
+        if entry is None or (entry['width'], entry['height']) != (width, height):
+            mismatches.append(name)
+            continue
+        for row in range(height):
+            start = ((entry['y'] + row) * atlas_width + entry['x']) * 4
+            if atlas[start:start + width * 4] != rgba[row * width * 4:(row + 1) * width * 4]:
+                mismatches.append(name)
+                break
+    return mismatches
+
+
+def generate_lua_file(atlas_file, atlas_width, atlas_height, entries, output_path, generated=None):
+    """Generate iconAtlas.lua: the atlas file and size, and the region of every icon by file name."""
+    current_date = (generated or datetime.now()).strftime('%Y-%m-%d')
+
+    lua_content = ['-- Auto-generated icon atlas from resources/icons',
+                   f'-- Generated: {current_date}',
+                   '',
+                   'local iconAtlas = {',
+                   f'    file = {lua_value(atlas_file)},',
+                   f'    width = {atlas_width},',
+                   f'    height = {atlas_height},',
+                   '    -- Icon file name without .png -> pixel rectangle and UVs in the atlas',
+                   '    icons = {']
+    for name, entry in sorted(entries.items()):
+        lua_content.append(f'        {lua_key(name)} = {lua_value(entry)},')
+    lua_content.append('    }')
+    lua_content.append('}')
+    lua_content.append('')
+    lua_content.append('return iconAtlas')
+    lua_content.append('')
+
+    with open(output_path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write('\n'.join(lua_content))
+
+    print(f"Generated {output_path}")
+
+
+def check_atlas(atlas_file, icon_files, entries):
+    """Raise ValueError unless every icon of the atlas matches its source pixels."""
+    mismatches = verify_atlas(atlas_file, icon_files, entries)
+    if mismatches:
+        raise ValueError(f"atlas pixels differ from {', '.join(mismatches)}")
+    print(f"Verified {len(icon_files)} icons against {atlas_file}")
+
+
+def write_atlas(icon_files, atlas_file, lua_output_file, padding=PADDING, generated=None):
+    """Pack icon_files into atlas_file, write lua_output_file and check the atlas once it is written."""
+    atlas_width, atlas_height, rgba, entries = build_atlas(icon_files, padding)
+    write_png(atlas_file, atlas_width, atlas_height, rgba)
+    print(f"Packed {len(entries)} icons into {atlas_file} ({atlas_width}x{atlas_height})")
+    generate_lua_file(Path(atlas_file).name, atlas_width, atlas_height, entries, lua_output_file, generated=generated)
+    check_atlas(atlas_file, icon_files, entries)
+
+
+def main(argv=None):
+    """Main function."""
+    parser = argparse.ArgumentParser(description='Pack resources/icons into resources/iconAtlas.png and data/iconAtlas.lua')
+    parser.add_argument('--padding', type=int, default=PADDING,
+                        help='transparent pixels between icons (default: %(default)s)')
+    parser.add_argument('--verify', action='store_true',
+                        help='only check the existing atlas against the icons, without rebuilding it')
+    args = parser.parse_args(argv)
+
+    # Get script directory
+    script_dir = Path(__file__).parent
+    project_root = script_dir.parent
+
+    # Input and output paths
+    icons_dir = project_root / "resources" / "icons"
+    atlas_file = project_root / "resources" / "iconAtlas.png"
+    lua_output_file = project_root / "data" / "iconAtlas.lua"
+
+    icon_files = sorted(icons_dir.glob('*.png'))
+    if not icon_files:
+        print(f"No icons found in {icons_dir}")
+        return 1
+
+    try:
+        if args.verify:
+            # Packing is deterministic, so laying the icons out again gives the regions of iconAtlas.lua
+            _, _, _, entries = build_atlas(icon_files, args.padding)
+            check_atlas(atlas_file, icon_files, entries)
+        else:
+            write_atlas(icon_files, atlas_file, lua_output_file, args.padding)
+    except (OSError, ValueError, zlib.error) as e:
+        print(f"Error: {e}")
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
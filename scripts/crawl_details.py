@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Script to crawl the wiki pages linked from every trust in trustInformation.json and merge
+the details found there (page title, summary and infobox properties) into the trust records.
+Pages are fetched concurrently over keep-alive connections, with a per-host rate limit,
+the same FetchPolicy and the same on-disk HTTP cache as the other scripts.
+"""
+
+import re
+import html
+import time
+import threading
+import http.client
+import urllib.error
+import urllib.parse
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from pathlib import Path
+
+import wiki_fetch
+import generate_information
+from trust_ir import Link
+
+# Fields whose links are crawled, the job and zone/quest pages are not specific to a trust
+DETAIL_FIELDS = ('spells', 'abilities', 'weapon_skills')
+WORKERS = 4
+RATE_LIMIT = 1.0
+
+TITLE_PATTERN = re.compile(r'<h1[^>]*id="firstHeading"[^>]*>(.*?)</h1>', re.DOTALL)
+HTML_TITLE_PATTERN = re.compile(r'<title>(.*?)(?: - [^<-]*)?</title>', re.DOTALL)
+PARAGRAPH_PATTERN = re.compile(r'<p>(.*?)</p>', re.DOTALL)
+TABLE_PATTERN = re.compile(r'<table[^>]*>(.*?)</table>', re.DOTALL)
+# A property row: one label cell followed by one value cell
+PROPERTY_PATTERN = re.compile(r'<tr[^>]*>\s*<t[hd][^>]*>(.*?)</t[hd]>\s*<td[^>]*>(.*?)</td>\s*</tr>', re.DOTALL)
+TAG_PATTERN = re.compile(r'<[^>]+>')
+
+
+def detail_urls(trust_data, fields=DETAIL_FIELDS):
+    """Return the wiki pages linked from the given fields of a trust, in order, without red links."""
+    urls = []
+    for field in fields:
+        for line in getattr(trust_data, field) or []:
+            for item in line:
+                if not isinstance(item, Link) or item.url in urls:
+                    continue
+                if 'redlink=1' in item.url or '/ffxi/' not in item.url:
+                    continue
+                urls.append(item.url)
+    return urls
+
+
+def clean_text(fragment):
+    """Strip tags and entities from an HTML fragment and collapse whitespace."""
+    return ' '.join(html.unescape(TAG_PATTERN.sub(' ', fragment)).split())
+
+
+def parse_detail_page(content):
+    """Extract the title, the first paragraph and the label/value rows of the first infobox of a wiki page."""
+    title_match = TITLE_PATTERN.search(content) or HTML_TITLE_PATTERN.search(content)
+    title = clean_text(title_match.group(1)) if title_match else None
+
+    summary = None
+    for paragraph_match in PARAGRAPH_PATTERN.finditer(content):
+        summary = clean_text(paragraph_match.group(1))
+        if summary:
+            break
+
+    properties = []
+    for table_match in TABLE_PATTERN.finditer(content):
+        for row_match in PROPERTY_PATTERN.finditer(table_match.group(1)):
+            label = clean_text(row_match.group(1))
+            value = clean_text(row_match.group(2))
+            if label and value:
+                properties.append([label, value])
+        if properties:
+            break
+
+    return {'title': title, 'summary': summary or None, 'properties': properties}
+
+
+class HostRateLimiter:
+    """Spaces out the requests to each host by at least 1 / rate seconds, across every worker."""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self.lock = threading.Lock()
+        self.next_slot = {}
+
+    def wait(self, host):
+        if not self.interval:
+            return
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot.get(host, now))
+            self.next_slot[host] = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class DetailCrawler:
+    """
+    Fetches pages over a bounded thread pool, every request following a wiki_fetch.FetchPolicy.
+    Connections are kept open in a per-host pool shared by the workers and by hedged requests,
+    and cached pages are revalidated with conditional requests.
+    """
+
+    def __init__(self, workers=WORKERS, rate=RATE_LIMIT, policy=None, cache_dir=wiki_fetch.CACHE_DIR, origin=None):
+        self.workers = workers
+        self.limiter = HostRateLimiter(rate)
+        self.policy = policy or wiki_fetch.FetchPolicy()
+        self.cache_dir = cache_dir
+        self.origin = urllib.parse.urlsplit(origin) if origin else None
+        self.connection_classes = {
+            'http': wiki_fetch.timeout_connection(http.client.HTTPConnection, self.policy.read_timeout),
+            'https': wiki_fetch.timeout_connection(http.client.HTTPSConnection, self.policy.read_timeout)
+        }
+        self.idle = {}
+        self.connections_lock = threading.Lock()
+        self.stats = {'fetched': 0, 'not_modified': 0, 'missing': 0, 'failed': 0, 'retries': 0, 'hedged': 0}
+        self.stats_lock = threading.Lock()
+
+    def count(self, stat, amount=1):
+        with self.stats_lock:
+            self.stats[stat] += amount
+
+    def count_attempts(self, attempts):
+        """Count the retries and hedged requests among the attempts of one fetch."""
+        hedged = sum(attempt.hedged for attempt in attempts)
+        self.count('hedged', hedged)
+        self.count('retries', max(len(attempts) - hedged - 1, 0))
+
+    def connection(self, scheme, host):
+        """Take an idle connection to a host from the pool, or open a new one."""
+        with self.connections_lock:
+            idle = self.idle.get((scheme, host))
+            if idle:
+                return idle.pop()
+        return self.connection_classes[scheme](host, timeout=self.policy.connect_timeout)
+
+    def release(self, scheme, host, connection):
+        """Put back a connection whose response has been read in full."""
+        with self.connections_lock:
+            self.idle.setdefault((scheme, host), []).append(connection)
+
+    def close(self):
+        with self.connections_lock:
+            for connections in self.idle.values():
+                for connection in connections:
+                    connection.close()
+            self.idle.clear()
+
+    def fetch(self, url):
+        """Return the content of a page, or None if the server does not have it or every attempt failed."""
+        # The cache is keyed by the wiki URL even when the request goes to a stand-in origin
+        cached = wiki_fetch.load_cache_entry(url, self.cache_dir) if self.cache_dir else None
+        headers = dict(wiki_fetch.build_request(url, cached[0] if cached else None).header_items())
+
+        parts = urllib.parse.urlsplit(url)
+        if self.origin:
+            parts = parts._replace(scheme=self.origin.scheme, netloc=self.origin.netloc)
+        path = urllib.parse.urlunsplit(('', '', parts.path or '/', parts.query, ''))
+
+        def attempt():
+            self.limiter.wait(parts.netloc)
+            connection = self.connection(parts.scheme, parts.netloc)
+            try:
+                connection.request('GET', path, headers=headers)
+                response = connection.getresponse()
+                if response.status == 200:
+                    content = wiki_fetch.read_body(response)
+                else:
+                    # Read the rest of the response so the connection can be reused
+                    response.read()
+            except Exception:
+                # The server may have dropped the keep-alive connection, the next attempt opens a new one
+                connection.close()
+                raise
+            self.release(parts.scheme, parts.netloc, connection)
+
+            if response.status != 200:
+                raise urllib.error.HTTPError(url, response.status, response.reason, response.headers, None)
+            return content, response.headers
+
+        try:
+            (content, response_headers), attempts = wiki_fetch.request_with_policy(attempt, self.policy)
+        except (urllib.error.HTTPError, wiki_fetch.FetchError) as e:
+            self.count_attempts(e.attempts)
+            code = e.code if isinstance(e, urllib.error.HTTPError) else None
+            if code == 304 and cached:
+                self.count('not_modified')
+                return cached[1]
+            if code == 404:
+                self.count('missing')
+                return None
+            self.count('failed')
+            print(f"Error fetching {url}: {e if code else e.reason}")
+            return None
+
+        self.count_attempts(attempts)
+        if self.cache_dir:
+            wiki_fetch.store_cache_entry(url, self.cache_dir, response_headers, content)
+        self.count('fetched')
+        return content
+
+    def crawl(self, urls):
+        """Fetch and parse every page, returning {url: details} for the pages that could be read."""
+        def fetch_details(url):
+            content = self.fetch(url)
+            return url, parse_detail_page(content) if content is not None else None
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                return {url: details for url, details in executor.map(fetch_details, urls) if details is not None}
+        finally:
+            self.close()
+
+
+def crawl_details(trusts, crawler, fields=DETAIL_FIELDS):
+    """Crawl the pages linked from every trust and return a copy of trusts with their details merged in."""
+    trust_urls = {trust_name: detail_urls(trust_data, fields) for trust_name, trust_data in trusts.items()}
+    urls = list(dict.fromkeys(url for urls in trust_urls.values() for url in urls))
+
+    print(f"Crawling {len(urls)} pages with {crawler.workers} workers...")
+    start = time.perf_counter()
+    pages = crawler.crawl(urls)
+    stats = ', '.join(f"{stat}: {count}" for stat, count in crawler.stats.items())
+    print(f"Crawled {len(pages)} pages in {time.perf_counter() - start:.1f}s ({stats})")
+
+    result = {}
+    for trust_name, trust_data in trusts.items():
+        details = {url: pages[url] for url in trust_urls[trust_name] if url in pages}
+        result[trust_name] = replace(trust_data, details=details or None)
+
+    return result
+
+
+def add_crawl_arguments(parser):
+    """Add the command line options of the crawler, the FetchPolicy ones come from add_fetch_arguments or main."""
+    parser.add_argument('--fields', nargs='+', choices=generate_information.TRUST_FIELDS, default=list(DETAIL_FIELDS),
+                        help='fields whose links are crawled (default: %(default)s)')
+    parser.add_argument('--workers', type=int, default=WORKERS,
+                        help='concurrent page fetches (default: %(default)s)')
+    parser.add_argument('--rate', type=float, default=RATE_LIMIT,
+                        help='requests per second per host, 0 disables the limit (default: %(default)s)')
+    parser.add_argument('--origin',
+                        help='send the requests to this scheme://host[:port] instead, e.g. a local stand-in server')
+
+
+def crawler_args(args):
+    """Build the crawler described by the options from add_crawl_arguments and add_fetch_arguments."""
+    return DetailCrawler(workers=args.workers, rate=args.rate, policy=wiki_fetch.policy_args(args),
+                         cache_dir=None if args.no_cache else args.cache_dir, origin=args.origin)
+
+
+def main(argv=None):
+    """Main function."""
+    parser = argparse.ArgumentParser(description='Merge the linked wiki pages into data/trustInformation.json')
+    parser.add_argument('--layout', choices=generate_information.LAYOUTS, default=generate_information.DEFAULT_LAYOUT,
+                        help='trustInformation.json layout (default: %(default)s)')
+    parser.add_argument('--cache-dir', type=Path, default=wiki_fetch.CACHE_DIR,
+                        help='directory for the HTTP response cache (default: scripts/.cache)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='always download the full pages and do not touch the cache')
+    wiki_fetch.add_policy_arguments(parser)
+    add_crawl_arguments(parser)
+    args = parser.parse_args(argv)
+
+    # Get script directory
+    script_dir = Path(__file__).parent
+    project_root = script_dir.parent
+
+    # Input and output paths
+    information_file = project_root / "data" / "trustInformation.json"
+    information_lua_file = project_root / "data" / "trustInformation.lua"
+
+    try:
+        trusts = generate_information.load_json_file(information_file)
+    except (OSError, ValueError) as e:
+        print(f"Error reading {information_file}: {e}")
+        return 1
+
+    trusts = crawl_details(trusts, crawler_args(args), args.fields)
+
+    print(f"Generating {information_file}...")
+    generate_information.generate_json_file(trusts, information_file, layout=args.layout)
+
+    print(f"Generating {information_lua_file}...")
+    generate_information.generate_lua_file(trusts, information_lua_file)
+
+    print("Done!")
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
@@ -2,165 +2,145 @@
 """
 Script to parse https://www.bg-wiki.com/ffxi/Category:Trust and generate trustCategories.lua
 Extracts trust names organized by their categories.
+Also generates trustCategoryIndex.lua, the categories of every trust as a bitmask keyed by its
+trustData id and by its names, after resolving every wiki name to a trust of trustData.lua.
 """
 
 import re
-from html.parser import HTMLParser
 from pathlib import Path
-import urllib.request
+import argparse
+import http.client
 import urllib.error
 
-WIKI_URL = "https://www.bg-wiki.com/ffxi/Category:Trust"
+import wiki_fetch
+import profiling
+from lua_format import lua_index, lua_value, load_lua_records, load_aliases
+from trust_ir import Category
 
-class TrustCategoryParser(HTMLParser):
-    """Parser to extract trust names from category sections in HTML."""
-    
-    def __init__(self):
-        super().__init__()
-        self.categories = {
-            'Tank': [],
-            'Melee Fighter': [],
-            'Ranged Fighter': [],
-            'Offensive Caster': [],
-            'Healer': [],
-            'Support': [],
-            'Special': [],
-            'Unity Concord': []
-        }
-        self.current_category = None
-        self.in_category_row = False
-        self.in_trust_links_cell = False
-        self.in_link = False
-        self.current_link_text = []
-        self.row_count = 0
-        
-    def handle_starttag(self, tag, attrs):
-        attrs_dict = dict(attrs)
-        
-        # Track table rows
-        if tag == 'tr':
-            self.row_count += 1
-        
-        # Check if we're in a table cell with category header
-        if tag == 'td':
-            # Check for category header (has background color and contains category name)
-            if 'style' in attrs_dict and 'background: rgb(166, 219, 253)' in attrs_dict['style']:
-                self.in_category_row = True
-                self.in_trust_links_cell = False
-            # If previous cell was category header, this cell has the trust links
-            elif self.current_category and not self.in_trust_links_cell:
-                self.in_trust_links_cell = True
-        
-        # Check for links to trusts
-        if tag == 'a':
-            href = attrs_dict.get('href', '')
-            # Links to individual trusts contain BGWiki:Trusts#
-            if 'BGWiki:Trusts#' in href and self.in_trust_links_cell:
-                self.in_link = True
-                self.current_link_text = []
-    
-    def handle_endtag(self, tag):
-        if tag == 'tr':
-            self.in_category_row = False
-            self.in_trust_links_cell = False
-        
-        if tag == 'td':
-            if self.in_trust_links_cell:
-                # Keep the cell open for multiple links
-                pass
-        
-        if tag == 'a' and self.in_link:
-            # Save the trust name to the current category
-            if self.current_link_text and self.current_category:
-                trust_name = ''.join(self.current_link_text).strip()
-                if trust_name and trust_name not in ['Tanks', 'Melee Fighter', 'Ranged Fighter', 
-                                                       'Offensive Caster', 'Healer', 'Support', 
-                                                       'Special', 'Unity Concord']:
-                    if trust_name not in self.categories[self.current_category]:
-                        self.categories[self.current_category].append(trust_name)
-            self.in_link = False
-            self.current_link_text = []
-    
-    def handle_data(self, data):
-        data = data.strip()
-        
-        # Check if this is a category header
-        if self.in_category_row and data and not self.in_link:
-            # Remove "Tanks" -> "Tank", keep others as-is
-            if data == 'Tanks':
-                self.current_category = 'Tank'
-            elif data in self.categories:
-                self.current_category = data
-        
-        # Collect link text
-        if self.in_link:
-            self.current_link_text.append(data)
+WIKI_URL = wiki_fetch.WIKI_URL
+
+# Category name mapping, from the wiki header to the category name
+CATEGORY_MAP = {
+    'Tanks': 'Tank',
+    'Melee Fighter': 'Melee Fighter',
+    'Ranged Fighter': 'Ranged Fighter',
+    'Offensive Caster': 'Offensive Caster',
+    'Healer': 'Healer',
+    'Support': 'Support',
+    'Special': 'Special',
+    'Unity Concord': 'Unity Concord'
+}
 
+# Category headers are <big>CategoryName</big>, surrounding whitespace is allowed
+CATEGORY_HEADER_PATTERN = re.compile(r'<big>([^<]*)</big>')
+TRUST_LINK_PATTERN = re.compile(r'<a[^>]+href="[^"]*"[^>]*>([^<]+)</a>')
 
 def parse_html_content(html_content):
-    """Parse the HTML content and extract trust categories using regex."""
+    """Parse the HTML content and extract trust categories using regex, returns a Category per CATEGORY_MAP entry."""
     # Use regex since live HTML structure differs from saved file
-    categories = {
-        'Tank': [],
-        'Melee Fighter': [],
-        'Ranged Fighter': [],
-        'Offensive Caster': [],
-        'Healer': [],
-        'Support': [],
-        'Special': [],
-        'Unity Concord': []
-    }
+    categories = {name: Category(name) for name in CATEGORY_MAP.values()}
     
-    # Category name mapping
-    category_map = {
-        'Tanks': 'Tank',
-        'Melee Fighter': 'Melee Fighter',
-        'Ranged Fighter': 'Ranged Fighter',
-        'Offensive Caster': 'Offensive Caster',
-        'Healer': 'Healer',
-        'Support': 'Support',
-        'Special': 'Special',
-        'Unity Concord': 'Unity Concord'
-    }
+    with profiling.stage('find_sections'):
+        sections, _ = find_category_sections(html_content)
     
-    # Find sections by <big> tags containing category names
-    for wiki_name, category in category_map.items():
-        # Pattern to find category section and extract trusts
-        # Look for <big>CategoryName</big> then find all trust links until next <big>
-        pattern = rf'<big>\s*{re.escape(wiki_name)}\s*</big>(.*?)(?=<big>|$)'
-        match = re.search(pattern, html_content, re.DOTALL)
+    for category, (section_start, section_end) in sections.items():
+        seen = set()
         
-        if match:
-            section = match.group(1)
-            # Extract trust names from links
-            trust_pattern = r'<a[^>]+href="[^"]*"[^>]*>([^<]+)</a>'
+        # Extract trust names from links
+        for trust_match in TRUST_LINK_PATTERN.finditer(html_content, section_start, section_end):
+            trust_name = trust_match.group(1).strip()
             
-            for trust_match in re.finditer(trust_pattern, section):
-                trust_name = trust_match.group(1).strip()
-                
-                # Skip category headers and navigation
-                if trust_name in ['Tanks', 'Melee Fighter', 'Ranged Fighter', 
-                                 'Offensive Caster', 'Healer', 'Support', 
-                                 'Special', 'Unity Concord', 'Trust', 'Category:Trust',
-                                 'Category', 'Main Page', 'Random page', 'Help', 'Edit']:
-                    continue
-                
-                # Skip empty or very short names
-                if len(trust_name) < 2:
-                    continue
-                
-                if trust_name and trust_name not in categories[category]:
-                    categories[category].append(trust_name)
+            # Skip category headers and navigation
+            if trust_name in ['Tanks', 'Melee Fighter', 'Ranged Fighter', 
+                             'Offensive Caster', 'Healer', 'Support', 
+                             'Special', 'Unity Concord', 'Trust', 'Category:Trust',
+                             'Category', 'Main Page', 'Random page', 'Help', 'Edit']:
+                continue
+            
+            # Skip empty or very short names
+            if len(trust_name) < 2:
+                continue
+            
+            if trust_name and trust_name not in seen:
+                seen.add(trust_name)
+                categories[category].trusts.append(trust_name)
     
-    return categories
+    return list(categories.values())
 
 
-def generate_lua_file(categories, output_path):
-    """Generate the Lua file with trust categories."""
+def find_category_sections(html_content):
+    """
+    Find the section of every category in a single forward pass.
+    A section runs from the end of the first <big>CategoryName</big> header to the next <big>.
+    Returns ({category: (start, end)}, complete), complete once every section is closed by a later <big>.
+    """
+    sections = {}
+    complete = False
+    position = html_content.find('<big>')
+    while position != -1 and len(sections) < len(CATEGORY_MAP):
+        next_position = html_content.find('<big>', position + 1)
+        header_match = CATEGORY_HEADER_PATTERN.match(html_content, position)
+        if header_match:
+            category = CATEGORY_MAP.get(header_match.group(1).strip())
+            # Only the first header of a category counts
+            if category and category not in sections:
+                section_end = next_position if next_position != -1 else len(html_content)
+                sections[category] = (header_match.end(), section_end)
+                complete = len(sections) == len(CATEGORY_MAP) and next_position != -1
+        position = next_position
+    
+    return sections, complete
+
+
+class CategoryStreamParser:
+    """
+    Incremental parse_html_content: feed text chunks, then close() to get the categories.
+    The category table is at the top of the page, so only the text up to the end of the last
+    category section is kept and feeding stops mattering once it has arrived.
+    Chunks are kept in a list and joined once by close(). feed() only scans the new chunk for <big>
+    headers, with what is left of the previous one, so feeding a page is linear in its size.
+    """
+    
+    def __init__(self):
+        self.chunks = []
+        # Text not scanned yet: a <big> whose header has not fully arrived, or the end of the last chunk
+        self.pending = ''
+        self.categories = set()
+        self.complete = False
+    
+    def feed(self, chunk):
+        if self.complete:
+            return
+        self.chunks.append(chunk)
+        text = self.pending + chunk
+        position = text.find('<big>')
+        while position != -1:
+            # The section of the last category ends at the next <big>, as in find_category_sections
+            if len(self.categories) == len(CATEGORY_MAP):
+                self.complete = True
+                return
+            # A header is decided once the first '<' after <big> and the '/big>' it may start are here
+            tag_start = text.find('<', position + len('<big>'))
+            if tag_start == -1 or len(text) < tag_start + len('</big>'):
+                self.pending = text[position:]
+                return
+            header_match = CATEGORY_HEADER_PATTERN.match(text, position)
+            if header_match and header_match.group(1).strip() in CATEGORY_MAP:
+                self.categories.add(CATEGORY_MAP[header_match.group(1).strip()])
+            position = text.find('<big>', position + 1)
+        # Keep what could be the beginning of a <big> cut by the end of the chunk
+        self.pending = text[-(len('<big>') - 1):]
+    
+    def close(self):
+        return parse_html_content(''.join(self.chunks))
+
+
+def generate_lua_file(categories, output_path, generated=None):
+    """Generate the Lua file with trust categories, generated is the datetime written in the header (now by default)."""
     
     # Get current date
     from datetime import datetime
-    current_date = datetime.now().strftime('%Y-%m-%d')
+    current_date = (generated or datetime.now()).strftime('%Y-%m-%d')
     
     # Start building the Lua content
     lua_content = ['-- Auto-generated trust categories from FFXI Wiki',
@@ -170,48 +150,177 @@ def generate_lua_file(categories, output_path):
                    'local trustCategories = {']
     
     # Add each category
-    for category, trusts in categories.items():
-        lua_content.append(f'    ["{category}"] = {{')
-        
-        for trust in trusts:
-            # Escape quotes in trust names
-            escaped_name = trust.replace('"', '\\"')
-            lua_content.append(f'        "{escaped_name}",')
-        
-        lua_content.append('    },')
+    for category in categories:
+        lua_content.extend(category.to_lua())
     
     lua_content.append('}')
     lua_content.append('')
     lua_content.append('return trustCategories')
     
     # Write to file
-    with open(output_path, 'w', encoding='utf-8') as f:
+    with open(output_path, 'w', encoding='utf-8', newline='\n') as f:
         f.write('\n'.join(lua_content))
     
     print(f"Generated {output_path}")
     
     # Print summary
     print("\nCategory summary:")
-    for category, trusts in categories.items():
-        print(f"  {category}: {len(trusts)} trusts")
-    print(f"  Total trusts: {sum(len(trusts) for trusts in categories.values())}")
+    for category in categories:
+        print(f"  {category.name}: {len(category.trusts)} trusts")
+    print(f"  Total trusts: {sum(len(category.trusts) for category in categories)}")
+
+
+def build_category_index(categories, trusts, aliases):
+    """
+    Return (index, errors) for the parsed categories and the trustData and trustAliases records.
+    index holds 'bits' (category on the page -> bit, in CATEGORY_MAP order), 'categories' (mask -> category names),
+    'ids' (trust id -> mask) and 'names' (in-game and wiki name -> mask). errors lists the wiki names
+    that match no trust and the trusts that resolve to the same wiki name.
+    """
+    page_names = [category.name for category in categories]
+    category_names = [name for name in dict.fromkeys(list(CATEGORY_MAP.values()) + page_names) if name in page_names]
+    bits = {name: 1 << i for i, name in enumerate(category_names)}
+    errors = []
+
+    # The wiki names trusts as trustAliases.lua does, trustData uses the in-game names
+    wiki_ids = {}
+    for trust_id, trust in trusts.items():
+        wiki_name = aliases.get(trust['en'], trust['en'])
+        if wiki_name in wiki_ids:
+            errors.append(f"Trusts {wiki_ids[wiki_name]} and {trust_id} both resolve to '{wiki_name}'")
+        wiki_ids[wiki_name] = trust_id
+
+    masks = {}
+    for category in categories:
+        for name in category.trusts:
+            trust_id = wiki_ids.get(name)
+            if trust_id is None:
+                errors.append(f"{category.name}: '{name}' matches no trust in trustData, "
+                              f"map its in-game name to it in trustAliases.lua")
+                continue
+            masks[trust_id] = masks.get(trust_id, 0) | bits[category.name]
+
+    ids = {trust_id: masks[trust_id] for trust_id in trusts if trust_id in masks}
+    names = {}
+    for trust_id, mask in ids.items():
+        in_game_name = trusts[trust_id]['en']
+        names[in_game_name] = mask
+        names[aliases.get(in_game_name, in_game_name)] = mask
+
+    index = {
+        'bits': bits,
+        'categories': {mask: [name for name, bit in bits.items() if mask & bit] for mask in sorted(set(ids.values()))},
+        'ids': ids,
+        'names': names
+    }
+    return index, errors
+
+
+def resolve_category_index(categories, trust_data_file, aliases_file):
+    """Build the category index of the parsed categories, raising ValueError if a trust does not resolve."""
+    index, errors = build_category_index(categories, load_lua_records(trust_data_file), load_aliases(aliases_file))
+    if errors:
+        raise ValueError(f"{len(errors)} category entries do not resolve to trustData:\n  " + '\n  '.join(errors))
+    return index
 
 
-def main():
+def generate_index_file(index, output_path, generated=None):
+    """Generate trustCategoryIndex.lua from build_category_index."""
+    from datetime import datetime
+    current_date = (generated or datetime.now()).strftime('%Y-%m-%d')
+
+    lua_content = ['-- Auto-generated trust category index from FFXI Wiki, data/trustData.lua and data/trustAliases.lua',
+                   f'-- Source: {WIKI_URL}',
+                   f'-- Generated: {current_date}',
+                   '',
+                   'local trustCategoryIndex = {',
+                   '    -- Category -> bit of the masks',
+                   '    bits = {']
+    for name, bit in index['bits'].items():
+        lua_content.append(f'        {lua_index(name)} = {bit},')
+    lua_content.append('    },')
+
+    lua_content.append('    -- Mask -> its categories, in bit order')
+    lua_content.append('    categories = {')
+    for mask, names in index['categories'].items():
+        lua_content.append(f'        [{mask}] = {lua_value(names)},')
+    lua_content.append('    },')
+
+    lua_content.append('    -- Trust id in trustData -> mask')
+    lua_content.append('    ids = {')
+    for trust_id, mask in index['ids'].items():
+        lua_content.append(f'        [{trust_id}] = {mask},')
+    lua_content.append('    },')
+
+    lua_content.append('    -- In-game and wiki name -> mask')
+    lua_content.append('    names = {')
+    for name, mask in index['names'].items():
+        lua_content.append(f'        {lua_index(name)} = {mask},')
+    lua_content.append('    },')
+
+    lua_content.append('}')
+    lua_content.append('')
+    lua_content.append('return trustCategoryIndex')
+    lua_content.append('')
+
+    with open(output_path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write('\n'.join(lua_content))
+
+    print(f"Generated {output_path}")
+
+
+def generate_category_files(categories, trust_data_file, aliases_file, output_path, index_output_path):
+    """Resolve every trust of the categories first, then write trustCategories.lua and trustCategoryIndex.lua."""
+    index = resolve_category_index(categories, trust_data_file, aliases_file)
+    generate_lua_file(categories, output_path)
+    generate_index_file(index, index_output_path)
+
+
+def load_lua_file(path):
+    """Read a trustCategories.lua written by generate_lua_file back into the Category list parse_html_content returns."""
+    categories = []
+    current = None
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            category_match = re.match(r'\s*\["(.+)"\] = \{', line)
+            if category_match:
+                current = Category(category_match.group(1))
+                categories.append(current)
+                continue
+            name_match = re.match(r'\s*"(.*)",', line)
+            if name_match and current is not None:
+                current.trusts.append(name_match.group(1).replace('\\"', '"'))
+    return categories
+
+
+def main(argv=None):
     """Main function."""
+    parser = argparse.ArgumentParser(description='Generate data/trustCategories.lua from the FFXI wiki')
+    wiki_fetch.add_fetch_arguments(parser)
+    profiling.add_profile_arguments(parser)
+    args = parser.parse_args(argv)
+    
+    with profiling.session(args, 'generate_categories'):
+        return generate(args)
+
+
+def generate(args):
+    """Download, parse and write the trust categories described by the command line options."""
     # Get script directory
     script_dir = Path(__file__).parent
     project_root = script_dir.parent
     
-    # URL and output path
-    wiki_url = WIKI_URL
+    # Input and output paths
+    trust_data_file = project_root / "data" / "trustData.lua"
+    aliases_file = project_root / "data" / "trustAliases.lua"
     output_file = project_root / "data" / "trustCategories.lua"
+    index_output_file = project_root / "data" / "trustCategoryIndex.lua"
     
     # Download HTML from URL
-    print(f"Downloading HTML from {wiki_url}...")
+    print(f"Downloading HTML from {args.url}...")
     try:
-        with urllib.request.urlopen(wiki_url) as response:
-            html_content = response.read().decode('utf-8')
+        with profiling.stage('download'):
+            page = wiki_fetch.open_args(args) if args.stream else wiki_fetch.fetch_args(args)
     except urllib.error.URLError as e:
         print(f"Error downloading HTML: {e}")
         return 1
@@ -219,12 +328,40 @@ def main():
         print(f"Error: {e}")
         return 1
     
+    if not args.force and wiki_fetch.is_up_to_date(page, output_file, index_output_file):
+        print(f"Page not modified since last run, {output_file.name} and {index_output_file.name} are up to date")
+        if args.stream:
+            page.close()
+        return 0
+    
     print(f"Parsing HTML content...")
-    categories = parse_html_content(html_content)
+    if args.stream:
+        # The category table is at the top of the page, the rest is only downloaded for the cache
+        try:
+            with page, profiling.stage('parse'):
+                stream_parser = CategoryStreamParser()
+                for chunk in page:
+                    stream_parser.feed(chunk)
+                    if stream_parser.complete:
+                        break
+                # Without the whole body in the cache, the next run could not be answered with a 304
+                page.drain()
+        except (OSError, http.client.HTTPException) as e:
+            print(f"Error downloading HTML: {e}")
+            return 1
+        categories = stream_parser.close()
+    else:
+        with profiling.stage('parse'):
+            categories = parse_html_content(page.content)
     
-    # Generate Lua file
-    print(f"Generating {output_file}...")
-    generate_lua_file(categories, output_file)
+    # Generate Lua files, nothing is written if a trust does not resolve
+    print(f"Generating {output_file} and {index_output_file}...")
+    try:
+        with profiling.stage('write_lua'):
+            generate_category_files(categories, trust_data_file, aliases_file, output_file, index_output_file)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        return 1
     
     print("Done!")
     return 0
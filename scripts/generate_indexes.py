@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Script to generate cipherIndex.lua, trustIndex.lua and searchIndex.lua from the data files.
+The indexes map lowercase names to ids so the addon resolves ciphers and owned trusts with
+a single table lookup, and generation fails if a cipher does not resolve to a known trust.
+The search index holds the searchable terms of every trust and their n-gram posting lists.
+"""
+
+import re
+import argparse
+from pathlib import Path
+from datetime import datetime
+
+import generate_categories
+import generate_information
+from lua_format import lua_index, lua_value, lua_lower, load_lua_records, load_aliases
+from trust_ir import TextRun, Link
+
+UC_MARKER = '(UC)'
+
+# Trust information fields searched besides the names and categories
+SEARCH_FIELDS = ('job', 'spells', 'abilities', 'weapon_skills')
+# Posting lists are kept for every substring of 1 to GRAM_SIZE characters
+GRAM_SIZE = 3
+
+# Spell tiers as the wiki writes them, a range like 'Cure I - IV' is also indexed as every tier
+ROMAN_TIERS = ('I', 'II', 'III', 'IV', 'V', 'VI', 'VII', 'VIII', 'IX', 'X', 'XI', 'XII')
+TIER_RANGE_PATTERN = re.compile(r'^(.*\S)\s+([IVX]+)\s*-\s*([IVX]+)$')
+
+
+def build_indexes(ciphers, trusts):
+    """Return (cipher_index, trust_index, errors) for the cipherData and trustData records."""
+    errors = []
+
+    trust_ids = {}
+    uc = []
+    for trust_id, trust in trusts.items():
+        key = lua_lower(trust['en'])
+        if key in trust_ids:
+            errors.append(f"Trusts {trust_ids[key]} and {trust_id} share the name '{trust['en']}'")
+        trust_ids[key] = trust_id
+        if UC_MARKER in trust['en']:
+            uc.append(trust_id)
+
+    cipher_ids = {}
+    cipher_trust_ids = {}
+    for cipher_id, cipher in ciphers.items():
+        key = lua_lower(cipher['en'])
+        if key in cipher_ids:
+            errors.append(f"Ciphers {cipher_ids[key]} and {cipher_id} share the name '{cipher['en']}'")
+
+        trust = trusts.get(cipher.get('trust_id'))
+        if trust is None:
+            errors.append(f"{cipher['en']} ({cipher_id}) points to unknown trust_id {cipher.get('trust_id')}")
+            continue
+        if trust['en'] != cipher.get('trust_en'):
+            errors.append(f"{cipher['en']} ({cipher_id}) names '{cipher.get('trust_en')}' but trust "
+                          f"{cipher['trust_id']} is '{trust['en']}'")
+
+        cipher_ids[key] = cipher_id
+        cipher_trust_ids[key] = cipher['trust_id']
+
+    cipher_index = {'cipherIds': cipher_ids, 'trustIds': cipher_trust_ids}
+    trust_index = {'ids': trust_ids, 'uc': uc}
+    return cipher_index, trust_index, errors
+
+
+def search_terms(names, categories, record):
+    """Return the lowercase search terms of a trust: its names, categories and the texts of SEARCH_FIELDS."""
+    texts = list(names) + list(categories)
+    for field in SEARCH_FIELDS:
+        for line in (getattr(record, field) if record else None) or []:
+            for item in line:
+                if isinstance(item, TextRun):
+                    texts.append(item.value)
+                elif isinstance(item, Link):
+                    texts.append(item.text)
+
+    terms = []
+    punctuation = ' ()' + ''.join(generate_information.PUNCTUATION)
+    for text in texts:
+        text = ' '.join(text.split()).strip(punctuation)
+        for term in [text] + expand_tiers(text):
+            term = lua_lower(term)
+            if any(c.isalpha() for c in term) and term not in terms:
+                terms.append(term)
+    return terms
+
+
+def expand_tiers(text):
+    """Return every tier of a spell range such as 'Cure I - IV', or an empty list for any other text."""
+    range_match = TIER_RANGE_PATTERN.match(text)
+    if not range_match or range_match.group(2) not in ROMAN_TIERS or range_match.group(3) not in ROMAN_TIERS:
+        return []
+    first = ROMAN_TIERS.index(range_match.group(2))
+    last = ROMAN_TIERS.index(range_match.group(3))
+    return [f'{range_match.group(1)} {tier}' for tier in ROMAN_TIERS[first:last + 1]]
+
+
+def build_search_index(trusts, aliases, categories, information):
+    """
+    Return (search_index, unmatched) where search_index holds the terms of every trust id and the
+    posting lists of their n-grams, and unmatched lists the trusts with no trustInformation record.
+    Only ASCII n-grams are indexed, they are the same in Lua where strings are bytes.
+    """
+    trust_categories = {}
+    for category in categories:
+        for name in category.trusts:
+            trust_categories.setdefault(name, []).append(category.name)
+
+    terms = {}
+    grams = {}
+    unmatched = []
+    for trust_id, trust in trusts.items():
+        wiki_name = aliases.get(trust['en'], trust['en'])
+        if wiki_name not in information:
+            unmatched.append(trust['en'])
+
+        names = dict.fromkeys([trust['en'], wiki_name])
+        terms[trust_id] = search_terms(names, trust_categories.get(wiki_name, []), information.get(wiki_name))
+        for term in terms[trust_id]:
+            for size in range(1, GRAM_SIZE + 1):
+                for i in range(len(term) - size + 1):
+                    gram = term[i:i + size]
+                    if gram.isascii():
+                        grams.setdefault(gram, set()).add(trust_id)
+
+    search_index = {
+        'terms': terms,
+        'grams': {gram: sorted(ids) for gram, ids in sorted(grams.items())}
+    }
+    return search_index, unmatched
+
+
+def lua_header(description, sources='data/cipherData.lua and data/trustData.lua', generated=None):
+    """Return the header lines of an index, generated is the datetime written in it (now by default)."""
+    current_date = (generated or datetime.now()).strftime('%Y-%m-%d')
+    return [f'-- Auto-generated {description} from {sources}',
+            f'-- Generated: {current_date}',
+            '']
+
+
+def generate_cipher_index_file(cipher_index, output_path, generated=None):
+    """Generate cipherIndex.lua: lowercase cipher name -> cipher_id and -> trust_id."""
+    lua_content = lua_header('cipher index', generated=generated) + ['local cipherIndex = {',
+                                                '    -- Lowercase cipher name -> cipher_id in cipherData',
+                                                '    cipherIds = {']
+    for name, cipher_id in cipher_index['cipherIds'].items():
+        lua_content.append(f'        {lua_index(name)} = {cipher_id},')
+    lua_content.append('    },')
+
+    lua_content.append('    -- Lowercase cipher name -> trust_id in trustData')
+    lua_content.append('    trustIds = {')
+    for name, trust_id in cipher_index['trustIds'].items():
+        lua_content.append(f'        {lua_index(name)} = {trust_id},')
+    lua_content.append('    },')
+
+    lua_content.extend(['}', '', 'return cipherIndex', ''])
+
+    with open(output_path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write('\n'.join(lua_content))
+
+    print(f"Generated {output_path}")
+
+
+def generate_trust_index_file(trust_index, output_path, generated=None):
+    """Generate trustIndex.lua: lowercase trust name -> id, and the set of Unity Concord trust ids."""
+    lua_content = lua_header('trust index', 'data/trustData.lua', generated) + ['local trustIndex = {',
+                                               '    -- Lowercase English name -> id in trustData',
+                                               '    ids = {']
+    for name, trust_id in trust_index['ids'].items():
+        lua_content.append(f'        {lua_index(name)} = {trust_id},')
+    lua_content.append('    },')
+
+    lua_content.append(f'    -- Unity Concord trusts, named {UC_MARKER}')
+    lua_content.append('    uc = {')
+    for trust_id in trust_index['uc']:
+        lua_content.append(f'        [{trust_id}] = true,')
+    lua_content.append('    },')
+
+    lua_content.extend(['}', '', 'return trustIndex', ''])
+
+    with open(output_path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write('\n'.join(lua_content))
+
+    print(f"Generated {output_path}")
+
+
+def generate_search_index_file(search_index, output_path, generated=None):
+    """Generate searchIndex.lua: the search terms of every trust id and the posting list of every n-gram."""
+    sources = 'data/trustData.lua, data/trustAliases.lua, data/trustCategories.lua and data/trustInformation.json'
+    lua_content = lua_header('search index', sources, generated) + [
+        'local searchIndex = {',
+        '    -- Lowercase search terms of every trust id: names, categories, job, spells, abilities and weapon skills',
+        '    terms = {']
+    for trust_id, terms in search_index['terms'].items():
+        lua_content.append(f'        [{trust_id}] = {lua_value(terms)},')
+    lua_content.append('    },')
+
+    lua_content.append(f'    -- Every ASCII substring of 1 to {GRAM_SIZE} characters of the terms -> ids of the trusts having it')
+    lua_content.append('    grams = {')
+    for gram, ids in search_index['grams'].items():
+        lua_content.append(f'        {lua_index(gram)} = {lua_value(ids)},')
+    lua_content.append('    },')
+
+    lua_content.extend(['}', '', 'return searchIndex', ''])
+
+    with open(output_path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write('\n'.join(lua_content))
+
+    print(f"Generated {output_path}")
+
+
+def generate_index_files(cipher_data_file, trust_data_file, cipher_index_file, trust_index_file):
+    """Resolve every cipher first, then write cipherIndex.lua and trustIndex.lua."""
+    ciphers = load_lua_records(cipher_data_file)
+    trusts = load_lua_records(trust_data_file)
+    cipher_index, trust_index, errors = build_indexes(ciphers, trusts)
+    if errors:
+        raise ValueError(f"{len(errors)} ciphers or trusts do not resolve:\n  " + '\n  '.join(errors))
+
+    print(f"Every cipher resolves: {len(ciphers)} ciphers, {len(trusts)} trusts, {len(trust_index['uc'])} Unity Concord")
+    generate_cipher_index_file(cipher_index, cipher_index_file)
+    generate_trust_index_file(trust_index, trust_index_file)
+
+
+def generate_search_files(trust_data_file, aliases_file, categories_file, information_file, output_path):
+    """Write searchIndex.lua from the trust data, aliases, categories and information files."""
+    trusts = load_lua_records(trust_data_file)
+    aliases = load_aliases(aliases_file)
+    categories = generate_categories.load_lua_file(categories_file)
+    information = generate_information.load_json_file(information_file)
+
+    search_index, unmatched = build_search_index(trusts, aliases, categories, information)
+    if unmatched:
+        print(f"Warning: no trust information for {', '.join(unmatched)}, only their names are searchable")
+    print(f"Search index: {len(search_index['grams'])} n-grams over {len(search_index['terms'])} trusts")
+    generate_search_index_file(search_index, output_path)
+
+
+def main(argv=None):
+    """Main function."""
+    parser = argparse.ArgumentParser(
+        description='Generate data/cipherIndex.lua, data/trustIndex.lua and data/searchIndex.lua')
+    parser.parse_args(argv)
+
+    # Get script directory
+    script_dir = Path(__file__).parent
+    project_root = script_dir.parent
+
+    # Input and output paths
+    cipher_data_file = project_root / "data" / "cipherData.lua"
+    trust_data_file = project_root / "data" / "trustData.lua"
+    aliases_file = project_root / "data" / "trustAliases.lua"
+    categories_file = project_root / "data" / "trustCategories.lua"
+    information_file = project_root / "data" / "trustInformation.json"
+    cipher_index_file = project_root / "data" / "cipherIndex.lua"
+    trust_index_file = project_root / "data" / "trustIndex.lua"
+    search_index_file = project_root / "data" / "searchIndex.lua"
+
+    try:
+        generate_index_files(cipher_data_file, trust_data_file, cipher_index_file, trust_index_file)
+        generate_search_files(trust_data_file, aliases_file, categories_file, information_file, search_index_file)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        return 1
+
+    print("Done!")
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
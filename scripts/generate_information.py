@@ -5,15 +5,63 @@ Extracts comprehensive data for each trust including job, spells, abilities, wea
 """
 
 import re
+import os
 import json
 import html
-from html.parser import HTMLParser
+import hashlib
 from pathlib import Path
 from datetime import datetime
-import urllib.request
+from dataclasses import replace
+import argparse
+import http.client
 import urllib.error
 
-WIKI_URL = "https://www.bg-wiki.com/ffxi/Category:Trust"
+import wiki_fetch
+import profiling
+import trust_ir
+import skillchain_index
+from trust_ir import Trust, Line, TextRun, Link, SkillchainIcon
+
+WIKI_URL = wiki_fetch.WIKI_URL
+TABLE_CACHE_FILE = 'trustTables.json'
+
+# Every trust table (and the category table) starts with this, the page is split on it
+TABLE_START = '<table class="wikitable"'
+
+# trustInformation.json layouts and their schema version (metadata.version)
+LAYOUTS = {'pretty': 1, 'compact': 2, 'indexed': 3}
+# The layout shipped in data/, read one trust at a time by src/information.lua
+DEFAULT_LAYOUT = 'indexed'
+
+# Fields of a trust record, in output order
+# A record can also carry 'details', the linked pages merged in by crawl_details.py
+TRUST_FIELDS = trust_ir.TRUST_FIELDS
+ITEM_TYPES = trust_ir.ITEM_TYPES
+URL_PREFIX = trust_ir.URL_PREFIX
+
+# Glyph advance of ProggyClean 13px, the default (monospaced) ImGui font, used for render run widths
+RUN_GLYPH_WIDTH = 7
+# Words of a text item as the info window splits them with Lua's %S+: runs of anything but ASCII whitespace
+RUN_WORD_RE = re.compile(r'[^ \t\n\v\f\r]+')
+
+# Punctuation that sticks to the preceding link or text item
+PUNCTUATION = ('.', ',', ':', ';', '!', '?')
+
+# A field is split into lines on <li> (bullet points) and <br>
+LINE_BREAK_RE = re.compile(r'<li[^>]*>|<br\s*/?>')
+# Dropped from every line before it is tokenized, after </li>. The order matters for stray '<'
+# characters: removing these first keeps '<y</p>' as the text '<y' instead of one unknown tag
+P_TAG_RE = re.compile(r'</?p[^>]*>')
+# One alternation per element kind, so a line is tokenized in a single scan:
+# links, skillchain icons and the Status_Ability "none" icon.
+# The shared '<' is factored out so the scanner only tries the alternatives at tag starts
+LINE_TOKEN_RE = re.compile(
+    r'<(?:(?P<link>a\s+[^>]*href="(?P<link_url>[^"]*)"[^>]*>(?P<link_text>[^<]*)</a>)'
+    r'|(?P<sc>img[^>]*alt="(?P<sc_alt>[^"]*SC Icon[^"]*)"[^>]*>)'
+    r'|(?P<status>(?i:img[^>]*alt="None"[^>]*src="[^"]*Status_Ability\.png"[^>]*>'
+    r'|img[^>]*src="[^"]*Status_Ability\.png"[^>]*alt="None"[^>]*>)))'
+)
+TAG_RE = re.compile(r'<[^>]+>')
 
 
 def parse_html_file(html_path):
@@ -25,8 +73,56 @@ def parse_html_file(html_path):
     return parse_html_content_from_string(content)
 
 
-def parse_html_content_from_string(content):
-    """Parse HTML content string using regex to extract trust information."""
+def parse_html_content_from_string(content, table_cache=None):
+    """
+    Parse HTML content string using regex to extract trust information.
+    If a TableCache is given, tables whose raw HTML is unchanged since the last run reuse their cached record.
+    """
+    # Split content by wikitable to process each trust table
+    with profiling.stage('split'):
+        tables = re.split(re.escape(TABLE_START), content)
+    
+    return parse_trust_sections(tables[1:], table_cache)  # Skip first split (before any table)
+
+
+def parse_html_stream(chunks, table_cache=None):
+    """
+    Parse trust information from an iterable of text chunks, such as a wiki_fetch.PageStream.
+    Each trust table is parsed as soon as the next one starts, so only one table is held in memory.
+    """
+    return parse_trust_sections(split_trust_tables(chunks), table_cache)
+
+
+def split_trust_tables(chunks):
+    """Incremental re.split on TABLE_START: yield the text after each table start once the next one begins."""
+    buffer = ''
+    search_from = 0
+    started = False
+    
+    for chunk in chunks:
+        buffer += chunk
+        start = 0
+        while True:
+            index = buffer.find(TABLE_START, max(start, search_from))
+            if index == -1:
+                break
+            if started:
+                yield buffer[start:index]
+            started = True
+            start = index + len(TABLE_START)
+        
+        # Text before the first table is dropped, except what could be the beginning of a table start
+        if not started:
+            start = max(0, len(buffer) - len(TABLE_START) + 1)
+        buffer = buffer[start:]
+        search_from = max(0, len(buffer) - len(TABLE_START) + 1)
+    
+    if started:
+        yield buffer
+
+
+def parse_trust_sections(tables, table_cache=None):
+    """Parse the pieces of the page that follow each table start, keeping the first table of every trust."""
     trusts = {}
     
     # Find all trust tables - they are in divs with class "two-column-flex-item"
@@ -35,10 +131,7 @@ def parse_html_content_from_string(content):
     # Pattern to find trust name headers
     name_pattern = r'<big>([^<]+)</big>'
     
-    # Split content by wikitable to process each trust table
-    tables = re.split(r'<table class="wikitable"', content)
-    
-    for table in tables[1:]:  # Skip first split (before any table)
+    for table in tables:
         # Try to find trust name
         name_match = re.search(name_pattern, table)
         if not name_match:
@@ -52,22 +145,115 @@ def parse_html_content_from_string(content):
                                                    'Special', 'Unity Concord']:
             continue
         
-        # Initialize trust data
-        trust_data = {
-            'name': trust_name,
-            'job': extract_field(table, 'Job'),
-            'spells': extract_field(table, 'Spells'),
-            'abilities': extract_field(table, 'Abilities'),
-            'weapon_skills': extract_field(table, 'Weapon Skills'),
-            'acquisition': extract_section(table, 'Acquisition'),
-            'special_features': extract_section(table, 'Special Features')
-        }
-        
+        key, trust_data = table_cache.lookup(table) if table_cache is not None else (None, None)
+        if trust_data is None:
+            trust_data = parse_trust_table(table, trust_name)
+            if table_cache is not None:
+                table_cache.store(key, trust_data)
         trusts[trust_name] = trust_data
     
     return trusts
 
 
+def parse_trust_table(table, trust_name):
+    """Extract every field of a single trust table, timing each one when profiling."""
+    with profiling.table(trust_name, table) as timed:
+        return Trust(
+            name=trust_name,
+            job=timed('job', extract_field, table, 'Job'),
+            spells=timed('spells', extract_field, table, 'Spells'),
+            abilities=timed('abilities', extract_field, table, 'Abilities'),
+            weapon_skills=timed('weapon_skills', extract_field, table, 'Weapon Skills'),
+            acquisition=timed('acquisition', extract_section, table, 'Acquisition'),
+            special_features=timed('special_features', extract_section, table, 'Special Features')
+        )
+
+
+class TableCache:
+    """
+    Sidecar cache of raw trust table hash -> parsed trust record, stored as Trust.to_dict().
+    Entries are keyed by the table HTML only and the whole cache is dropped when this script or the IR
+    changes, so a cached record is always what parse_trust_table would return today.
+    """
+    
+    def __init__(self, entries=None):
+        self.previous = entries or {}
+        self.entries = {}
+        # Records built during this run, so a table seen again (e.g. in the next snapshot) is shared
+        self.records = {}
+        self.reused = 0
+        self.parsed = 0
+    
+    @staticmethod
+    def parser_fingerprint():
+        return hashlib.sha256(Path(__file__).read_bytes() + Path(trust_ir.__file__).read_bytes()).hexdigest()
+    
+    @classmethod
+    def load(cls, path):
+        """Load a cache file, starting empty if it is missing, unreadable or from another parser version."""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return cls()
+        
+        if data.get('parser') != cls.parser_fingerprint():
+            return cls()
+        return cls(data.get('tables'))
+    
+    def is_dirty(self):
+        return self.parsed > 0 or len(self.entries) != len(self.previous)
+    
+    def save(self, path):
+        """Write only the entries used by the last parse, so tables removed from the wiki are dropped."""
+        path = Path(path)
+        if path.exists() and not self.is_dirty():
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {'parser': self.parser_fingerprint(), 'tables': self.entries}
+        tmp_path = path.with_suffix(path.suffix + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            # dumps() goes through the C encoder, dump() streams through the pure Python one
+            f.write(json.dumps(data, ensure_ascii=False, separators=(',', ':')))
+        os.replace(tmp_path, path)
+    
+    def lookup(self, table):
+        """Return (key, cached record or None) for a raw table."""
+        key = hashlib.blake2b(table.encode('utf-8'), digest_size=16).hexdigest()
+        trust_data = self.records.get(key)
+        if trust_data is None:
+            record = self.previous.get(key)
+            if record is None:
+                return key, None
+            trust_data = self.records[key] = Trust.from_dict(record)
+            self.entries[key] = record
+        self.reused += 1
+        return key, trust_data
+    
+    def store(self, key, trust_data):
+        """Record a freshly parsed table."""
+        self.parsed += 1
+        self.records[key] = trust_data
+        self.entries[key] = trust_data.to_dict()
+
+
+def parse_html_content_cached(content, cache_path):
+    """
+    Parse HTML content, re-parsing only the trust tables that changed since the cache was written.
+    content is the page text or an iterable of text chunks, which is parsed as a stream.
+    """
+    with profiling.stage('table_cache.load'):
+        table_cache = TableCache.load(cache_path)
+    if isinstance(content, str):
+        trusts = parse_html_content_from_string(content, table_cache)
+    else:
+        trusts = parse_html_stream(content, table_cache)
+    with profiling.stage('table_cache.save'):
+        table_cache.save(cache_path)
+    print(f"Trust tables reused from cache: {table_cache.reused}, re-parsed: {table_cache.parsed}")
+    return trusts
+
+
 def extract_field(table_html, field_name):
     """Extract a field value (Job, Spells, Abilities, Weapon Skills) from table HTML."""
     # Pattern: <td>field_name</td> followed by <td>content</td>
@@ -118,196 +304,294 @@ def parse_html_content(html_content):
     if not html_content or html_content.strip() == 'None':
         return None
     
-    # Split by <li> tags for bullet points, or <br> for line breaks
-    lines_raw = re.split(r'<li[^>]*>|<br\s*/?>', html_content)
-    
     result = []
     
-    for line_html in lines_raw:
-        if not line_html or not line_html.strip():
+    for line_html in LINE_BREAK_RE.split(html_content):
+        if not line_html or line_html.isspace():
             continue
         
         # Clean up closing tags
-        line_html = re.sub(r'</li>', '', line_html)
-        line_html = re.sub(r'</?p[^>]*>', '', line_html)
-        
-        line_items = []
-        
-        # First pass: extract all elements with their positions
-        elements = []
-        
-        # Extract links with positions
-        link_pattern = r'<a\s+[^>]*href="([^"]*)"[^>]*>([^<]*)</a>'
-        for match in re.finditer(link_pattern, line_html):
-            url = match.group(1)
-            # Convert relative URLs to absolute URLs
-            if url.startswith('/'):
-                url = 'https://www.bg-wiki.com' + url
-            elif not url.startswith('http'):
-                url = 'https://www.bg-wiki.com/ffxi/' + url
-            elements.append({
-                'pos': match.start(),
-                'end': match.end(),
-                'type': 'link',
-                'text': match.group(2).strip(),
-                'url': url
-            })
-        
-        # Extract skillchain icons with positions
-        sc_pattern = r'<img[^>]*alt="([^"]*SC Icon[^"]*)"[^>]*>'
-        for match in re.finditer(sc_pattern, line_html):
-            sc_name = match.group(1).replace(' SC Icon.png', '').replace(' SC Icon', '')
-            if sc_name:
-                elements.append({
-                    'pos': match.start(),
-                    'end': match.end(),
-                    'type': 'skillchain',
-                    'value': sc_name
-                })
-        
-        # Extract Status_Ability icon (used for "none" skillchain indicator)
-        # Match various possible patterns for the status ability icon
-        status_patterns = [
-            r'<img[^>]*alt="None"[^>]*src="[^"]*Status_Ability\.png"[^>]*>',
-            r'<img[^>]*src="[^"]*Status_Ability\.png"[^>]*alt="None"[^>]*>'
-        ]
-        for pattern in status_patterns:
-            for match in re.finditer(pattern, line_html, re.IGNORECASE):
-                elements.append({
-                    'pos': match.start(),
-                    'end': match.end(),
-                    'type': 'skillchain',
-                    'value': 'Status_Ability'
-                })
+        line_html = P_TAG_RE.sub('', line_html.replace('</li>', ''))
         
-        # Sort elements by position
-        elements.sort(key=lambda x: x['pos'])
+        line_items = Line()
+        gap_start = 0
         
-        # Build line_items by interleaving text and elements in order
-        pos = 0
-        for elem in elements:
-            # Add text before this element
-            text_before = line_html[pos:elem['pos']]
-            text_before = re.sub(r'<[^>]+>', '', text_before)  # Remove other tags
-            text_before = html.unescape(text_before)  # Decode HTML entities
-            text_before = re.sub(r'\s+', ' ', text_before)  # Normalize whitespace to single spaces
-            text_before = text_before.strip()
-            # If text is just "/" with optional spaces, preserve as " / "
-            if re.match(r'^\s*/\s*$', text_before):
-                text_before = ' / '
-            if text_before:
-                line_items.append({'type': 'text', 'value': text_before})
+        # Single forward scan: every match is a link or a skillchain icon, and the text
+        # between two matches is a gap that gets cleaned and emitted as a text item.
+        # An <img> carrying two alt attributes is read once, where the per-pattern passes
+        # this replaced could read it twice
+        for match in LINE_TOKEN_RE.finditer(line_html):
+            kind = match.lastgroup
             
-            # Add the element itself
-            if elem['type'] == 'link':
-                if elem['text']:
-                    line_items.append({
-                        'type': 'link',
-                        'text': elem['text'],
-                        'url': elem['url']
-                    })
-            elif elem['type'] == 'skillchain':
-                line_items.append({
-                    'type': 'skillchain',
-                    'value': elem['value']
-                })
+            if kind == 'sc':
+                sc_name = match.group('sc_alt').replace(' SC Icon.png', '').replace(' SC Icon', '')
+                if not sc_name:
+                    # Not an element, leave the tag in the gap so it gets stripped with the text
+                    continue
             
-            pos = elem['end']
-        
-        # Add remaining text after all elements
-        text_after = line_html[pos:]
-        text_after = re.sub(r'<[^>]+>', '', text_after)  # Remove all HTML tags
-        text_after = html.unescape(text_after)  # Decode HTML entities
-        text_after = re.sub(r'\s+', ' ', text_after)  # Normalize whitespace to single spaces
-        text_after = text_after.strip()
-        # If text is just "/" with optional spaces, preserve as " / "
-        if re.match(r'^\s*/\s*$', text_after):
-            text_after = ' / '
-        if text_after:
-            line_items.append({'type': 'text', 'value': text_after})
-        
-        # Merge trailing punctuation into preceding elements
-        i = 0
-        while i < len(line_items):
-            item = line_items[i]
-            if item['type'] == 'text' and item['value'] in ['.', ',', ':', ';', '!', '?']:
-                # Attach punctuation to previous item (but NOT to skillchains, they need exact names for icon lookup)
-                if i > 0:
-                    prev = line_items[i - 1]
-                    if prev['type'] == 'link':
-                        prev['text'] += item['value']
-                        line_items.pop(i)
-                        continue
-                    elif prev['type'] == 'text':
-                        prev['value'] += item['value']
-                        line_items.pop(i)
-                        continue
-                    # Don't attach to skillchains - leave punctuation as separate text
-            elif item['type'] == 'text':
-                # Check if text starts with punctuation
-                value = item['value']
-                if value and value[0] in ['.', ',', ':', ';', '!', '?']:
-                    if i > 0:
-                        prev = line_items[i - 1]
-                        if prev['type'] == 'link':
-                            prev['text'] += value[0]
-                            # Remove punctuation from current text
-                            item['value'] = value[1:].lstrip()
-                            if not item['value']:
-                                line_items.pop(i)
-                                continue
-                        elif prev['type'] == 'text':
-                            prev['value'] += value[0]
-                            # Remove punctuation from current text
-                            item['value'] = value[1:].lstrip()
-                            if not item['value']:
-                                line_items.pop(i)
-                                continue
-                        # Don't attach to skillchains
-            i += 1
+            append_text_item(line_items, line_html[gap_start:match.start()])
+            gap_start = match.end()
+            
+            if kind == 'link':
+                link_text = match.group('link_text').strip()
+                if link_text:
+                    url = match.group('link_url')
+                    # Convert relative URLs to absolute URLs
+                    if url.startswith('/'):
+                        url = 'https://www.bg-wiki.com' + url
+                    elif not url.startswith('http'):
+                        url = 'https://www.bg-wiki.com/ffxi/' + url
+                    line_items.append(Link(link_text, url))
+            elif kind == 'sc':
+                line_items.append(SkillchainIcon(sc_name))
+            else:
+                # Status_Ability icon (used for "none" skillchain indicator)
+                line_items.append(SkillchainIcon('Status_Ability'))
         
+        append_text_item(line_items, line_html[gap_start:])
         if line_items:
             result.append(line_items)
     
     return result if result else None
 
 
-def generate_json_file(trusts, output_path):
-    """Generate the JSON file with trust information."""
+def append_text_item(line_items, text_html):
+    """Clean a raw HTML gap and append it as a text item, merging leading punctuation into the previous item."""
+    text = TAG_RE.sub('', text_html)  # Remove other tags
+    text = html.unescape(text)  # Decode HTML entities
+    text = ' '.join(text.split())  # Normalize whitespace to single spaces
+    if not text:
+        return
+    # If text is just "/" with optional spaces, preserve as " / "
+    if text == '/':
+        text = ' / '
+    
+    # Attach punctuation to previous item (but NOT to skillchains, they need exact names for icon lookup)
+    if text[0] in PUNCTUATION and line_items:
+        prev = line_items[-1]
+        key = 'text' if isinstance(prev, Link) else 'value' if isinstance(prev, TextRun) else None
+        if key:
+            if text in PUNCTUATION:
+                setattr(prev, key, getattr(prev, key) + text)
+                return
+            setattr(prev, key, getattr(prev, key) + text[0])
+            # Remove punctuation from current text
+            text = text[1:].lstrip()
+            if not text:
+                return
+    
+    line_items.append(TextRun(text))
+
+
+def add_render_runs(trusts):
+    """
+    Return a copy of trusts where items carry pre-split, pre-measured render runs for the info window:
+    text items get 'words' (the value split like Lua's %S+) with their 'widths', and text and link
+    items get the 'width' of their whole label. Widths are in pixels of the default ImGui font.
+    """
+    def with_runs(item):
+        if isinstance(item, TextRun):
+            words = RUN_WORD_RE.findall(item.value)
+            return replace(item, words=words, widths=[text_width(word) for word in words], width=text_width(item.value))
+        if isinstance(item, Link):
+            return replace(item, width=text_width(item.text))
+        return item
+    
+    return {trust_name: trust_data.map_items(with_runs) for trust_name, trust_data in trusts.items()}
+
+
+def text_width(text):
+    """Width of text in the default ImGui font, which advances every glyph (and the '?' fallback) by the same amount."""
+    return len(text) * RUN_GLYPH_WIDTH
+
+
+def generate_json_file(trusts, output_path, layout='pretty', generated=None, record_cache=None):
+    """
+    Generate the JSON file with trust information in one of LAYOUTS:
+    - pretty: the plain document, indented (version 1)
+    - compact: string-interned and minified, see encode_compact (version 2)
+    - indexed: a one-line header with a byte offset index, then one JSON record per trust (version 3)
+    generated is the datetime written to the metadata, now by default. record_cache is passed to encode_indexed.
+    """
     
     # Create output structure
-    output = {
-        'metadata': {
-            'source': WIKI_URL,
-            'generated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'trust_count': len(trusts)
-        },
-        'trusts': trusts
+    metadata = {
+        'source': WIKI_URL,
+        'generated': (generated or datetime.now()).strftime('%Y-%m-%d %H:%M:%S'),
+        'trust_count': len(trusts),
+        'version': LAYOUTS[layout]
     }
     
-    # Write to file with pretty formatting
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
+    if layout == 'indexed':
+        # Written in binary so the offsets are exact bytes on every platform
+        with open(output_path, 'wb') as f:
+            f.write(encode_indexed(trusts, metadata, record_cache))
+    else:
+        if layout == 'compact':
+            output = encode_compact(trusts)
+            output['metadata'] = {**metadata, **output['metadata']}
+            content = json.dumps(output, ensure_ascii=False, separators=(',', ':'))
+        else:
+            output = {'metadata': metadata, 'trusts': {trust_name: trust_data.to_dict()
+                                                       for trust_name, trust_data in trusts.items()}}
+            content = json.dumps(output, indent=2, ensure_ascii=False)
+        
+        # Write to file
+        with open(output_path, 'w', encoding='utf-8', newline='\n') as f:
+            f.write(content)
     
     print(f"Generated {output_path}")
     print(f"Total trusts parsed: {len(trusts)}")
 
 
-def main():
+def generate_lua_file(trusts, output_path, generated=None):
+    """
+    Generate trustInformation.lua, the same data as trustInformation.json as a plain Lua table
+    so the addon can load it with require instead of decoding JSON at startup.
+    Trusts keep the parser order, fields follow TRUST_FIELDS and empty fields are omitted (nil).
+    """
+    current_date = (generated or datetime.now()).strftime('%Y-%m-%d')
+    
+    lua_content = ['-- Auto-generated trust information from FFXI Wiki',
+                   f'-- Source: {WIKI_URL}',
+                   f'-- Generated: {current_date}',
+                   '',
+                   'local trustInformation = {']
+    
+    for trust_data in trusts.values():
+        lua_content.extend(trust_data.to_lua())
+    
+    lua_content.append('}')
+    lua_content.append('')
+    lua_content.append('return trustInformation')
+    lua_content.append('')
+    
+    with open(output_path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write('\n'.join(lua_content))
+    
+    print(f"Generated {output_path}")
+
+
+def encode_indexed(trusts, metadata, record_cache=None):
+    """
+    Encode trusts in the indexed layout. The first line is {"metadata": ..., "index": {name: [offset, length]}}
+    where offsets are in bytes from the start of the second line, and every trust record after it is a
+    self-contained minified JSON object on its own line, so a loader can seek to and decode a single trust.
+    record_cache, if given, is a dict of id(trust) -> encoded record reused across calls; the caller
+    keeps the Trust objects alive (as TableCache.records does) so their ids are never recycled.
+    """
+    index = {}
+    records = []
+    offset = 0
+    for trust_name, trust_data in trusts.items():
+        record = record_cache.get(id(trust_data)) if record_cache is not None else None
+        if record is None:
+            record = json.dumps(trust_data.to_dict(), ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+            if record_cache is not None:
+                record_cache[id(trust_data)] = record
+        index[trust_name] = [offset, len(record)]
+        records.append(record)
+        offset += len(record) + 1
+    
+    header = json.dumps({'metadata': metadata, 'index': index}, ensure_ascii=False, separators=(',', ':'))
+    return b'\n'.join([header.encode('utf-8')] + records) + b'\n'
+
+
+def load_json_file(path):
+    """Read a trustInformation.json in any of LAYOUTS back into the {name: Trust} dict produced by the parser."""
+    with open(path, 'rb') as f:
+        first_line = f.readline()
+        try:
+            header = json.loads(first_line)
+        except ValueError:
+            header = None
+        
+        if header and header.get('metadata', {}).get('version') == LAYOUTS['indexed']:
+            # Records follow the header one per line, in index order
+            return {trust_name: Trust.from_dict(json.loads(f.readline())) for trust_name in header['index']}
+        
+        data = header if header is not None else json.loads(first_line + f.read())
+    
+    if data['metadata'].get('version') == LAYOUTS['compact']:
+        return decode_compact(data)
+    return {trust_name: Trust.from_dict(trust_data) for trust_name, trust_data in data['trusts'].items()}
+
+
+def read_indexed_trust(path, trust_name):
+    """Read a single trust record from an indexed layout file without decoding the others."""
+    with open(path, 'rb') as f:
+        header_line = f.readline()
+        entry = json.loads(header_line)['index'].get(trust_name)
+        if entry is None:
+            return None
+        offset, length = entry
+        f.seek(len(header_line) + offset)
+        return Trust.from_dict(json.loads(f.read(length)))
+
+
+def encode_compact(trusts):
+    """
+    Encode trusts in the compact schema:
+    - every text, link text and skillchain name is stored once in 'strings'
+    - every URL is stored once in 'urls', without URL_PREFIX when it has it
+    - items are positional arrays [type, string] or [type, string, url] where type indexes 'item_types'
+    - trust records drop their name (it is the key) and any empty field
+    All references are 1-based so a Lua loader can index the tables directly.
+    """
+    strings = {}
+    urls = {}
+    encoded = {trust_name: trust_data.to_compact(strings, urls) for trust_name, trust_data in trusts.items()}
+    
+    return {
+        'metadata': {
+            'url_prefix': URL_PREFIX,
+            'item_types': list(ITEM_TYPES)
+        },
+        'strings': list(strings),
+        'urls': list(urls),
+        'trusts': encoded
+    }
+
+
+def decode_compact(data):
+    """Expand a compact schema document back into the {name: Trust} dict produced by the parser."""
+    metadata = data['metadata']
+    tables = (metadata['item_types'], data['strings'], data['urls'], metadata['url_prefix'])
+    return {trust_name: Trust.from_compact(trust_name, record, *tables) for trust_name, record in data['trusts'].items()}
+
+
+def main(argv=None):
     """Main function."""
+    parser = argparse.ArgumentParser(description='Generate data/trustInformation.json from the FFXI wiki')
+    wiki_fetch.add_fetch_arguments(parser)
+    parser.add_argument('--layout', choices=LAYOUTS, default=DEFAULT_LAYOUT,
+                        help='trustInformation.json layout (default: %(default)s)')
+    parser.add_argument('--render-runs', action='store_true',
+                        help='add pre-split, pre-measured render runs to text and link items')
+    profiling.add_profile_arguments(parser)
+    args = parser.parse_args(argv)
+    
+    with profiling.session(args, 'generate_information'):
+        return generate(args)
+
+
+def generate(args):
+    """Download, parse and write the trust information described by the command line options."""
     # Get script directory
     script_dir = Path(__file__).parent
     project_root = script_dir.parent
     
-    # URL and output paths
-    wiki_url = WIKI_URL
+    # Output paths
     output_file = project_root / "data" / "trustInformation.json"
+    lua_output_file = project_root / "data" / "trustInformation.lua"
+    skillchain_index_file = project_root / "data" / "skillchainIndex.lua"
+    skillchain_names_file = project_root / "data" / "skillchainNames.lua"
     
     # Download HTML from URL
-    print(f"Downloading HTML from {wiki_url}...")
+    print(f"Downloading HTML from {args.url}...")
     try:
-        with urllib.request.urlopen(wiki_url) as response:
-            html_content = response.read().decode('utf-8')
+        with profiling.stage('download'):
+            page = wiki_fetch.open_args(args) if args.stream else wiki_fetch.fetch_args(args)
     except urllib.error.URLError as e:
         print(f"Error downloading HTML: {e}")
         return 1
@@ -315,12 +599,48 @@ def main():
         print(f"Error: {e}")
         return 1
     
+    if not args.force and wiki_fetch.is_up_to_date(page, output_file, lua_output_file, skillchain_index_file):
+        print(f"Page not modified since last run, {output_file.name}, {lua_output_file.name} "
+              f"and {skillchain_index_file.name} are up to date")
+        if args.stream:
+            page.close()
+        return 0
+    
+    # A streamed page is parsed while it downloads, one trust table at a time
     print(f"Parsing HTML content...")
-    trusts = parse_html_content_from_string(html_content)
+    content = page if args.stream else page.content
+    try:
+        # A streamed page is still downloading here, so its download time is part of the parse stage
+        with profiling.stage('parse'):
+            if args.no_cache and args.stream:
+                trusts = parse_html_stream(content)
+            elif args.no_cache:
+                trusts = parse_html_content_from_string(content)
+            else:
+                trusts = parse_html_content_cached(content, args.cache_dir / TABLE_CACHE_FILE)
+    except (OSError, http.client.HTTPException) as e:
+        # A streamed download can still fail halfway through
+        print(f"Error downloading HTML: {e}")
+        return 1
+    
+    if args.render_runs:
+        with profiling.stage('render_runs'):
+            trusts = add_render_runs(trusts)
     
     # Generate JSON file
     print(f"Generating {output_file}...")
-    generate_json_file(trusts, output_file)
+    with profiling.stage('write_json'):
+        generate_json_file(trusts, output_file, layout=args.layout)
+    
+    # Generate Lua file
+    print(f"Generating {lua_output_file}...")
+    with profiling.stage('write_lua'):
+        generate_lua_file(trusts, lua_output_file)
+    
+    # Generate the skillchain index derived from the weapon skills
+    print(f"Generating {skillchain_index_file}...")
+    with profiling.stage('write_skillchain_index'):
+        skillchain_index.generate_index_file(trusts, skillchain_names_file, skillchain_index_file)
     
     print("Done!")
     return 0
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Helpers to write Lua source literals from the data generation scripts.
+Strings follow the data files' conventions: single quotes by default, double quotes when the
+value contains a single quote, and a long bracket (or escapes as a last resort) otherwise.
+The readers load the hand-maintained data files made of one record per line, such as trustData.lua.
+"""
+
+import re
+
+LUA_IDENTIFIER = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+LUA_KEYWORDS = {
+    'and', 'break', 'do', 'else', 'elseif', 'end', 'false', 'for', 'function', 'goto', 'if', 'in',
+    'local', 'nil', 'not', 'or', 'repeat', 'return', 'then', 'true', 'until', 'while'
+}
+
+# Bytes that cannot appear raw in a quoted Lua string or that a long bracket would rewrite
+CONTROL_CHARS = re.compile(r'[\x00-\x1f\x7f]')
+ESCAPES = {'\\': '\\\\', '\n': '\\n', '\r': '\\r', '\t': '\\t'}
+
+# One record per line: [id] = { key = value, ... },
+RECORD_PATTERN = re.compile(r'^\s*\[(\d+)\] = \{(.*)\},?\s*$')
+FIELD_PATTERN = re.compile(r"""\s*(\w+) = ('(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*"|-?\d+(?:\.\d+)?)\s*,?""")
+ESCAPE_PATTERN = re.compile(r'\\(.)')
+UNESCAPES = {'n': '\n', 'r': '\r', 't': '\t'}
+LUA_STRING = r"""('(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")"""
+ALIAS_PATTERN = re.compile(rf'^\s*\[{LUA_STRING}\] = {LUA_STRING},?\s*$')
+
+
+def lua_string(value):
+    """Return a Lua string literal for value. Non-ASCII text is written as raw UTF-8."""
+    has_control = CONTROL_CHARS.search(value) is not None
+
+    if not has_control and '\\' not in value:
+        if "'" not in value:
+            return f"'{value}'"
+        if '"' not in value:
+            return f'"{value}"'
+
+    # Long brackets keep the text verbatim but normalize line breaks and drop a leading newline,
+    # so they are only used for text without control characters
+    if not has_control:
+        level = 0
+        while f']{"=" * level}]' in value + ']':
+            level += 1
+        equals = '=' * level
+        return f'[{equals}[{value}]{equals}]'
+
+    escaped = ''.join(ESCAPES.get(c) or (f'\\{ord(c):03d}' if CONTROL_CHARS.match(c) else c) for c in value)
+    return "'" + escaped.replace("'", "\\'") + "'"
+
+
+def lua_index(key):
+    """Return a bracketed table constructor key, such as ['Kupipi']."""
+    literal = lua_value(key)
+    # '[[[' would open a long bracket, so one is set apart from the key brackets
+    return f'[ {literal} ]' if literal.startswith('[') else f'[{literal}]'
+
+
+def lua_key(key):
+    """Return a table constructor key: a bare name when possible, otherwise a bracketed literal."""
+    if isinstance(key, str) and LUA_IDENTIFIER.match(key) and key not in LUA_KEYWORDS:
+        return key
+    return lua_index(key)
+
+
+def lua_value(value):
+    """Return a single-line Lua literal for a scalar value, or a list or dict of them."""
+    if isinstance(value, (list, tuple)):
+        return '{ ' + ', '.join(lua_value(v) for v in value) + ' }' if value else '{}'
+    if isinstance(value, dict):
+        return '{ ' + ', '.join(f'{lua_key(k)} = {lua_value(v)}' for k, v in value.items()) + ' }' if value else '{}'
+    if value is None:
+        return 'nil'
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, (int, float)):
+        return repr(value)
+    return lua_string(value)
+
+
+def parse_lua_value(literal):
+    """Decode a Lua string or number literal."""
+    if literal[0] in '\'"':
+        return ESCAPE_PATTERN.sub(lambda m: UNESCAPES.get(m.group(1), m.group(1)), literal[1:-1])
+    return float(literal) if '.' in literal else int(literal)
+
+
+def load_lua_records(path):
+    """Read a data file made of one '[id] = { key = value, ... },' record per line into {id: record}."""
+    records = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            record_match = RECORD_PATTERN.match(line)
+            if not record_match:
+                continue
+
+            body = record_match.group(2)
+            record = {}
+            position = 0
+            while position < len(body.rstrip()):
+                field_match = FIELD_PATTERN.match(body, position)
+                if not field_match:
+                    raise ValueError(f"{path}:{line_number}: cannot parse '{body[position:].strip()}'")
+                record[field_match.group(1)] = parse_lua_value(field_match.group(2))
+                position = field_match.end()
+
+            records[int(record_match.group(1))] = record
+    return records
+
+
+def load_aliases(path):
+    """Read trustAliases.lua into {in-game name: wiki name}."""
+    aliases = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            alias_match = ALIAS_PATTERN.match(line)
+            if alias_match:
+                aliases[parse_lua_value(alias_match.group(1))] = parse_lua_value(alias_match.group(2))
+    return aliases
+
+
+def lua_lower(name):
+    """Lowercase like Lua's string.lower, which only maps ASCII letters."""
+    return re.sub(r'[A-Z]', lambda m: m.group(0).lower(), name)
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Script to parse archived Category:Trust pages offline, for reproducible builds and regression tests.
+Takes a directory or tarball of HTML snapshots, writes the data files of every snapshot to its own
+directory and a change log of the trusts added, removed or modified between consecutive snapshots.
+Snapshots are processed in order in contiguous batches over a process pool, and within a batch every
+trust table that did not change since the previous snapshot reuses its parsed and encoded record.
+Outputs are stamped with the snapshot modification time instead of the current time, so they are reproducible.
+"""
+
+import io
+import os
+import math
+import json
+import time
+import hashlib
+import tarfile
+import argparse
+import tempfile
+from contextlib import redirect_stdout
+from datetime import datetime, timezone
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import wiki_fetch
+import generate_categories
+import generate_information
+
+SNAPSHOT_SUFFIXES = ('.html', '.htm')
+TARBALL_SUFFIXES = ('.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tar.xz')
+OUTPUT_DIR = wiki_fetch.CACHE_DIR / "snapshots"
+CHANGES_FILE = 'changes.json'
+
+
+def is_snapshot(name):
+    return name.lower().endswith(SNAPSHOT_SUFFIXES)
+
+
+def snapshot_name(path):
+    """Output directory name of a snapshot: its file name without the extension."""
+    return Path(path).name.rsplit('.', 1)[0]
+
+
+def list_snapshots(directory):
+    """Return the snapshot files under a directory, sorted by path so dated names come out in order."""
+    return sorted(path for path in Path(directory).rglob('*') if path.is_file() and is_snapshot(path.name))
+
+
+def extract_tarball(tarball, directory):
+    """Extract the snapshots of a tarball into directory, leaving any other member out."""
+    with tarfile.open(tarball) as tar:
+        members = [member for member in tar.getmembers() if member.isfile() and is_snapshot(member.name)]
+        tar.extractall(directory, members=members, filter='data')
+
+
+def field_fingerprints(trust_data):
+    """Return {field: digest} for a trust record, used to tell which fields changed between snapshots."""
+    record = trust_data.to_dict()
+    return {field: hashlib.blake2b(json.dumps(record[field], ensure_ascii=False).encode('utf-8'),
+                                   digest_size=8).hexdigest()
+            for field in generate_information.TRUST_FIELDS + ('details',) if record.get(field)}
+
+
+def process_batch(paths, output_dir, layout, lua):
+    """
+    Process pool worker: parse and write a run of consecutive snapshots.
+    Returns one summary per snapshot with the field fingerprints of its trusts and its categories.
+    """
+    table_cache = generate_information.TableCache()
+    record_cache = {}
+    fingerprints = {}
+    summaries = []
+
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        generated = datetime.fromtimestamp(path.stat().st_mtime, timezone.utc)
+
+        trusts = generate_information.parse_html_content_from_string(content, table_cache)
+        categories = generate_categories.parse_html_content(content)
+
+        snapshot_dir = output_dir / snapshot_name(path)
+        snapshot_dir.mkdir(parents=True, exist_ok=True)
+        # The generators report every file they write, which is noise for hundreds of snapshots
+        with redirect_stdout(io.StringIO()):
+            generate_information.generate_json_file(trusts, snapshot_dir / "trustInformation.json", layout=layout,
+                                                    generated=generated, record_cache=record_cache)
+            generate_categories.generate_lua_file(categories, snapshot_dir / "trustCategories.lua", generated=generated)
+            if lua:
+                generate_information.generate_lua_file(trusts, snapshot_dir / "trustInformation.lua", generated=generated)
+
+        # Unchanged tables share their record across snapshots, so each one is fingerprinted once
+        trust_fingerprints = {}
+        for trust_name, trust_data in trusts.items():
+            if id(trust_data) not in fingerprints:
+                fingerprints[id(trust_data)] = field_fingerprints(trust_data)
+            trust_fingerprints[trust_name] = fingerprints[id(trust_data)]
+
+        summaries.append({
+            'name': snapshot_name(path),
+            'trusts': trust_fingerprints,
+            'categories': {category.name: category.trusts for category in categories}
+        })
+
+    return summaries, table_cache.reused, table_cache.parsed
+
+
+def process_snapshots(paths, output_dir, layout='indexed', lua=False, jobs=1):
+    """
+    Process snapshots in order, returning (summaries, reused, parsed) where reused and parsed count
+    the trust tables taken from a previous snapshot and the ones actually parsed.
+    With jobs > 1 the snapshots are split into that many contiguous batches, jobs=0 uses every CPU.
+    """
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    if jobs <= 1 or len(paths) < 2:
+        return process_batch(paths, output_dir, layout, lua)
+
+    batch_size = math.ceil(len(paths) / jobs)
+    batches = [paths[i:i + batch_size] for i in range(0, len(paths), batch_size)]
+
+    summaries = []
+    reused = parsed = 0
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [executor.submit(process_batch, batch, output_dir, layout, lua) for batch in batches]
+        for future in futures:
+            batch_summaries, batch_reused, batch_parsed = future.result()
+            summaries.extend(batch_summaries)
+            reused += batch_reused
+            parsed += batch_parsed
+    return summaries, reused, parsed
+
+
+def diff_snapshots(previous, current):
+    """Return the changes from one snapshot summary to the next, only the non-empty keys are kept."""
+    old_trusts = previous['trusts']
+    new_trusts = current['trusts']
+
+    change = {
+        'from': previous['name'],
+        'to': current['name'],
+        'added': [name for name in new_trusts if name not in old_trusts],
+        'removed': [name for name in old_trusts if name not in new_trusts],
+        'modified': {},
+        'categories': {}
+    }
+
+    for name, fingerprints in new_trusts.items():
+        old_fingerprints = old_trusts.get(name)
+        if old_fingerprints is None or old_fingerprints == fingerprints:
+            continue
+        change['modified'][name] = [field for field in dict.fromkeys(list(old_fingerprints) + list(fingerprints))
+                                    if old_fingerprints.get(field) != fingerprints.get(field)]
+
+    for category in dict.fromkeys(list(previous['categories']) + list(current['categories'])):
+        old_names = previous['categories'].get(category, [])
+        new_names = current['categories'].get(category, [])
+        category_change = {
+            'added': [name for name in new_names if name not in old_names],
+            'removed': [name for name in old_names if name not in new_names]
+        }
+        category_change = {key: names for key, names in category_change.items() if names}
+        if category_change:
+            change['categories'][category] = category_change
+
+    return {key: value for key, value in change.items() if value}
+
+
+def build_change_log(summaries):
+    """Return the change log of consecutive snapshots, leaving out the pairs where nothing changed."""
+    changes = []
+    for previous, current in zip(summaries, summaries[1:]):
+        change = diff_snapshots(previous, current)
+        if len(change) > 2:
+            changes.append(change)
+    return {'snapshots': [summary['name'] for summary in summaries], 'changes': changes}
+
+
+def main(argv=None):
+    """Main function."""
+    parser = argparse.ArgumentParser(description='Parse archived Category:Trust pages and log the changes between them')
+    parser.add_argument('snapshots', type=Path,
+                        help='directory or tarball (.tar, .tar.gz, .tgz, ...) of saved .html pages')
+    parser.add_argument('--output', type=Path,
+                        help='output directory (default: scripts/.cache/snapshots/<snapshots name>)')
+    parser.add_argument('--layout', choices=generate_information.LAYOUTS, default='indexed',
+                        help='trustInformation.json layout, indexed reuses the encoded records of unchanged '
+                             'trusts (default: %(default)s)')
+    parser.add_argument('--lua', action='store_true',
+                        help='also write trustInformation.lua for every snapshot')
+    parser.add_argument('--jobs', type=int, default=0,
+                        help='process snapshots over N processes, 0 uses every CPU (default: %(default)s)')
+    args = parser.parse_args(argv)
+
+    output_dir = args.output or OUTPUT_DIR / snapshot_name(args.snapshots).removesuffix('.tar')
+
+    start = time.perf_counter()
+    with tempfile.TemporaryDirectory() as extract_dir:
+        try:
+            if args.snapshots.is_dir():
+                paths = list_snapshots(args.snapshots)
+            else:
+                if not args.snapshots.name.lower().endswith(TARBALL_SUFFIXES):
+                    print(f"Error: {args.snapshots} is neither a directory nor a tarball")
+                    return 1
+                extract_tarball(args.snapshots, extract_dir)
+                paths = list_snapshots(extract_dir)
+        except (OSError, tarfile.TarError) as e:
+            print(f"Error reading {args.snapshots}: {e}")
+            return 1
+
+        if not paths:
+            print(f"No snapshots found in {args.snapshots}")
+            return 1
+
+        names = [snapshot_name(path) for path in paths]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            print(f"Error: snapshots would share an output directory: {', '.join(duplicates)}")
+            return 1
+
+        print(f"Processing {len(paths)} snapshots...")
+        summaries, reused, parsed = process_snapshots(paths, output_dir, layout=args.layout, lua=args.lua,
+                                                      jobs=args.jobs)
+
+    change_log = build_change_log(summaries)
+    changes_file = output_dir / CHANGES_FILE
+    with open(changes_file, 'w', encoding='utf-8') as f:
+        json.dump(change_log, f, indent=1, ensure_ascii=False)
+
+    for change in change_log['changes']:
+        counts = ', '.join(f"{len(change[key])} {key}" for key in ('added', 'removed', 'modified') if key in change)
+        print(f"  {change['from']} -> {change['to']}: {counts or 'categories changed'}")
+
+    print(f"Processed {len(summaries)} snapshots in {time.perf_counter() - start:.1f}s "
+          f"(trust tables parsed: {parsed}, reused: {reused})")
+    print(f"Generated {output_dir}, change log in {changes_file}")
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
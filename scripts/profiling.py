@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Opt-in instrumentation for the data generation scripts.
+Code marks its stages with profiling.stage(name) and the trust table parser reports every
+table and field; both are no-ops unless a script was started with --profile, in which case
+wall time and tracemalloc allocations are recorded and written to a JSON report.
+Tracing allocations slows down allocation-heavy stages, only compare timings between profiled runs.
+"""
+
+import sys
+import json
+import time
+import cProfile
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from pathlib import Path
+
+import wiki_fetch
+
+REPORT_DIR = wiki_fetch.CACHE_DIR / "profiles"
+SLOWEST_COUNT = 20
+
+# The running profiler, None when profiling is off
+active = None
+
+
+class Profiler:
+    """Collects per-stage and per-table wall time and allocations for one script run."""
+
+    def __init__(self, script):
+        self.script = script
+        self.stages = {}
+        self.tables = []
+        # Highest traced memory seen by each open stage, tracemalloc only has one peak so every stage resets it
+        self.peaks = []
+        self.start_time = time.perf_counter()
+        self.cprofile = None
+
+    @contextmanager
+    def stage(self, name):
+        """
+        Time a stage, repeated stages with the same name are added up.
+        peak_kb is the highest memory use above what was allocated when the stage started.
+        """
+        allocated_before, peak = tracemalloc.get_traced_memory()
+        if self.peaks:
+            self.peaks[-1] = max(self.peaks[-1], peak)
+        self.peaks.append(0)
+        tracemalloc.reset_peak()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            allocated, peak = tracemalloc.get_traced_memory()
+            peak = max(peak, self.peaks.pop())
+            if self.peaks:
+                self.peaks[-1] = max(self.peaks[-1], peak)
+            stage = self.stages.setdefault(name, {'name': name, 'calls': 0, 'seconds': 0.0,
+                                                  'allocated_kb': 0.0, 'peak_kb': 0.0})
+            stage['calls'] += 1
+            stage['seconds'] += seconds
+            stage['allocated_kb'] += (allocated - allocated_before) / 1024
+            stage['peak_kb'] = max(stage['peak_kb'], (peak - allocated_before) / 1024)
+
+    @contextmanager
+    def table(self, trust_name, table):
+        """Time the parse of one trust table, yielding the timed() function its fields are extracted through."""
+        fields = {}
+
+        def timed(field, extract, *args):
+            field_start = time.perf_counter()
+            try:
+                return extract(*args)
+            finally:
+                fields[field] = time.perf_counter() - field_start
+
+        allocated_before, _ = tracemalloc.get_traced_memory()
+        start = time.perf_counter()
+        try:
+            yield timed
+        finally:
+            seconds = time.perf_counter() - start
+            allocated, _ = tracemalloc.get_traced_memory()
+            self.tables.append({
+                'trust': trust_name,
+                'table_bytes': len(table.encode('utf-8')),
+                'seconds': seconds,
+                'allocated_kb': (allocated - allocated_before) / 1024,
+                'fields': fields
+            })
+
+    def report(self):
+        """Return the machine-readable report of the run so far."""
+        fields = [{'trust': table['trust'], 'field': field, 'seconds': seconds}
+                  for table in self.tables for field, seconds in table['fields'].items()]
+        field_totals = {}
+        for field in fields:
+            field_totals[field['field']] = field_totals.get(field['field'], 0.0) + field['seconds']
+
+        return {
+            'script': self.script,
+            'date': datetime.now().isoformat(timespec='seconds'),
+            'python': sys.version.split()[0],
+            'argv': sys.argv[1:],
+            'total_seconds': time.perf_counter() - self.start_time,
+            'stages': list(self.stages.values()),
+            'tables': {
+                'count': len(self.tables),
+                'seconds': sum(table['seconds'] for table in self.tables),
+                'field_seconds': field_totals
+            },
+            'slowest_trusts': sorted(self.tables, key=lambda table: table['seconds'], reverse=True)[:SLOWEST_COUNT],
+            'slowest_fields': sorted(fields, key=lambda field: field['seconds'], reverse=True)[:SLOWEST_COUNT]
+        }
+
+
+def untimed(field, extract, *args):
+    return extract(*args)
+
+
+def stage(name):
+    """Context manager timing a stage of the running profiler, or doing nothing when profiling is off."""
+    return active.stage(name) if active else nullcontext()
+
+
+def table(trust_name, table):
+    """Context manager for the parse of one trust table, see Profiler.table."""
+    return active.table(trust_name, table) if active else nullcontext(untimed)
+
+
+def add_profile_arguments(parser):
+    """Add the --profile and --cprofile options."""
+    parser.add_argument('--profile', nargs='?', type=Path, const=True, metavar='REPORT',
+                        help='record per-stage and per-table time and allocations to a JSON report '
+                             '(default: scripts/.cache/profiles/<script>.json)')
+    parser.add_argument('--cprofile', type=Path, metavar='PSTATS',
+                        help='also dump cProfile statistics to this file, implies --profile')
+
+
+@contextmanager
+def session(args, script):
+    """Profile the body of the with statement if the options ask for it."""
+    start(args, script)
+    try:
+        yield
+    finally:
+        finish(args)
+
+
+def start(args, script):
+    """Start profiling if the options ask for it."""
+    global active
+    if not args.profile and not args.cprofile:
+        return
+
+    tracemalloc.start()
+    active = Profiler(script)
+    if args.cprofile:
+        active.cprofile = cProfile.Profile()
+        active.cprofile.enable()
+
+
+def finish(args):
+    """Stop profiling, write the report and print the stage summary."""
+    global active
+    if not active:
+        return
+
+    profiler, active = active, None
+    if profiler.cprofile:
+        profiler.cprofile.disable()
+        profiler.cprofile.dump_stats(args.cprofile)
+        print(f"Saved cProfile statistics to {args.cprofile}")
+
+    report = profiler.report()
+    tracemalloc.stop()
+
+    output = args.profile if isinstance(args.profile, Path) else REPORT_DIR / f"{profiler.script}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+    print(f"\nProfile ({report['total_seconds']:.2f}s total):")
+    for stage_report in report['stages']:
+        print(f"  {stage_report['name']:<24} {stage_report['seconds'] * 1000:>10.1f} ms "
+              f"{stage_report['allocated_kb']:>12.1f} KB allocated {stage_report['peak_kb']:>12.1f} KB peak")
+    if report['slowest_trusts']:
+        slowest = report['slowest_trusts'][0]
+        print(f"  Slowest trust table: {slowest['trust']} ({slowest['seconds'] * 1000:.2f} ms)")
+    print(f"Saved profile report to {output}")
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Derived skillchain index written next to trustInformation.lua by the information generator.
+The skillchain icons of a trust only exist as items inside its weapon_skills lines, this index
+turns them into direct lookups: weapon skill -> skillchain properties, trust -> weapon skills
+and skillchain property -> trusts, using the element names of data/skillchainNames.lua.
+"""
+
+import re
+from datetime import datetime
+
+import wiki_fetch
+import generate_information
+from lua_format import lua_index, lua_key, lua_string
+from trust_ir import TextRun, Link, SkillchainIcon
+
+WIKI_URL = wiki_fetch.WIKI_URL
+# Icon of the weapon skills that do not open or close a skillchain
+NO_SKILLCHAIN = 'Status_Ability'
+# What the wiki lists for a trust without weapon skills, the addon shows it the same way
+NO_WEAPON_SKILLS = 'None'
+SKILLCHAIN_NAME_PATTERN = re.compile(r"'([^']+)'")
+
+
+def load_skillchain_names(path):
+    """Read the element names listed in skillchainNames.lua."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return SKILLCHAIN_NAME_PATTERN.findall(f.read())
+
+
+def parse_weapon_skills(lines):
+    """
+    Return [(weapon skill, [skillchain properties])] for the weapon_skills lines of a trust.
+    Entries are separated by commas outside parentheses. The name of an entry is its first link
+    outside parentheses, or its text before the first '(' when it has no such link (the wiki then
+    links the monster ability in parentheses), and every skillchain icon of the entry is a property.
+    Level requirements such as '(25)' and labels such as 'Neutral:' are not part of the name,
+    and an entry named NO_WEAPON_SKILLS is left out.
+    """
+    # Imported at call time, generate_information imports this module
+    punctuation = ''.join(generate_information.PUNCTUATION)
+    weapon_skills = []
+
+    for line in lines or []:
+        depth = 0
+        name = None
+        text = []
+        # Only the text before the first '(' or icon of an entry can be its name
+        text_done = False
+        properties = []
+
+        def end_entry():
+            entry_name = name
+            if entry_name is None:
+                # Drop a label such as 'Light aura:' in front of a plain text name
+                entry_name = ''.join(text).rsplit(':', 1)[-1].strip(' ' + punctuation)
+            if entry_name and entry_name != NO_WEAPON_SKILLS and any(c.isalpha() for c in entry_name):
+                weapon_skills.append((entry_name, properties))
+
+        for item in line:
+            if isinstance(item, SkillchainIcon):
+                text_done = True
+                if item.value != NO_SKILLCHAIN and item.value not in properties:
+                    properties.append(item.value)
+            elif isinstance(item, Link):
+                # A link after the icons of an entry starts the next one even when the comma is missing
+                if depth == 0 and name is not None and properties:
+                    end_entry()
+                    name, text, text_done, properties = None, [], False, []
+                if depth == 0 and name is None:
+                    name = item.text.rstrip(punctuation).strip()
+                # Punctuation after a link is merged into its text, so a trailing comma ends the entry
+                if depth == 0 and item.text.endswith(','):
+                    end_entry()
+                    name, text, text_done, properties = None, [], False, []
+            elif isinstance(item, TextRun):
+                for char in item.value:
+                    if char == '(':
+                        depth += 1
+                        text_done = text_done or any(c.isalpha() for c in text)
+                    elif char == ')':
+                        depth = max(0, depth - 1)
+                    elif char == ',' and depth == 0:
+                        end_entry()
+                        name, text, text_done, properties = None, [], False, []
+                    elif depth == 0 and not text_done:
+                        text.append(char)
+
+        end_entry()
+
+    return weapon_skills
+
+
+def build_skillchain_index(trusts, skillchain_names):
+    """
+    Return (index, warnings) for a {name: Trust} dict. index holds 'weaponSkills' (weapon skill ->
+    properties), 'trusts' (trust -> weapon skills) and 'elements' (property -> trusts), all in page order.
+    A weapon skill whose properties differ between trusts is not in 'weaponSkills' but in
+    'trustWeaponSkills' (trust -> weapon skill -> properties), once for every trust that has it.
+    Icons that are not in skillchain_names are left out and reported in warnings.
+    """
+    elements = {name: [] for name in skillchain_names if name != NO_SKILLCHAIN}
+    # Weapon skill -> {trust: properties}
+    listings = {}
+    trust_weapon_skills = {}
+    warnings = []
+
+    for trust_name, trust_data in trusts.items():
+        names = []
+        for weapon_skill, properties in parse_weapon_skills(trust_data.weapon_skills):
+            unknown = [prop for prop in properties if prop not in elements]
+            for prop in unknown:
+                warnings.append(f"{trust_name}: unknown skillchain property '{prop}' on {weapon_skill}")
+            properties = [prop for prop in properties if prop in elements]
+
+            listings.setdefault(weapon_skill, {}).setdefault(trust_name, properties)
+            if weapon_skill not in names:
+                names.append(weapon_skill)
+            for prop in properties:
+                if trust_name not in elements[prop]:
+                    elements[prop].append(trust_name)
+
+        if names:
+            trust_weapon_skills[trust_name] = names
+
+    weapon_skills = {}
+    trust_properties = {}
+    for weapon_skill, trust_listings in listings.items():
+        listed = list(trust_listings.values())
+        if all(properties == listed[0] for properties in listed):
+            weapon_skills[weapon_skill] = listed[0]
+            continue
+        for trust_name, properties in trust_listings.items():
+            trust_properties.setdefault(trust_name, {})[weapon_skill] = properties
+    # In page order of the trusts
+    trust_properties = {trust_name: trust_properties[trust_name] for trust_name in trusts if trust_name in trust_properties}
+
+    index = {'weaponSkills': weapon_skills, 'trustWeaponSkills': trust_properties, 'trusts': trust_weapon_skills,
+             'elements': elements}
+    return index, warnings
+
+
+def lua_list(values):
+    return '{ ' + ', '.join(lua_string(value) for value in values) + ' }' if values else '{}'
+
+
+def generate_lua_file(index, output_path, generated=None):
+    """Generate skillchainIndex.lua from build_skillchain_index."""
+    current_date = (generated or datetime.now()).strftime('%Y-%m-%d')
+
+    lua_content = ['-- Auto-generated skillchain index from FFXI Wiki',
+                   f'-- Source: {WIKI_URL}',
+                   f'-- Generated: {current_date}',
+                   '',
+                   'local skillchainIndex = {',
+                   '    -- Weapon skill -> skillchain properties, empty when it does not skillchain',
+                   '    weaponSkills = {']
+    for weapon_skill, properties in index['weaponSkills'].items():
+        lua_content.append(f'        {lua_index(weapon_skill)} = {lua_list(properties)},')
+    lua_content.append('    },')
+
+    lua_content.append('    -- Trust -> weapon skill -> skillchain properties, for the weapon skills whose properties differ')
+    lua_content.append('    -- between trusts and are not in weaponSkills')
+    lua_content.append('    trustWeaponSkills = {')
+    for trust_name, weapon_skills in index['trustWeaponSkills'].items():
+        entries = ', '.join(f'{lua_index(weapon_skill)} = {lua_list(properties)}'
+                            for weapon_skill, properties in weapon_skills.items())
+        lua_content.append(f'        {lua_index(trust_name)} = {{ {entries} }},')
+    lua_content.append('    },')
+
+    lua_content.append('    -- Trust -> weapon skills')
+    lua_content.append('    trusts = {')
+    for trust_name, weapon_skills in index['trusts'].items():
+        lua_content.append(f'        {lua_index(trust_name)} = {lua_list(weapon_skills)},')
+    lua_content.append('    },')
+
+    lua_content.append('    -- Skillchain property -> trusts with a weapon skill that has it')
+    lua_content.append('    elements = {')
+    for element, trust_names in index['elements'].items():
+        lua_content.append(f'        {lua_key(element)} = {lua_list(trust_names)},')
+    lua_content.append('    },')
+
+    lua_content.append('}')
+    lua_content.append('')
+    lua_content.append('return skillchainIndex')
+    lua_content.append('')
+
+    with open(output_path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write('\n'.join(lua_content))
+
+    print(f"Generated {output_path}")
+
+
+def generate_index_file(trusts, skillchain_names_file, output_path):
+    """Build the index of trusts with the names of skillchain_names_file, report its warnings and write it."""
+    index, warnings = build_skillchain_index(trusts, load_skillchain_names(skillchain_names_file))
+    for warning in warnings:
+        print(f"Warning: {warning}")
+    generate_lua_file(index, output_path)
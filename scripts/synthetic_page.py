@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Script to rebuild a Category:Trust page from the generated data files, for offline benchmarks.
+The page follows the wiki markup the generators expect, parses back to the same trustCategories.lua
+and trustInformation.json content, and can be scaled by repeating every trust under a numbered name.
+"""
+
+import html
+import argparse
+from pathlib import Path
+
+import generate_categories
+import generate_information
+from trust_ir import TextRun, Link
+
+PROJECT_ROOT = Path(__file__).parent.parent
+CATEGORIES_FILE = PROJECT_ROOT / "data" / "trustCategories.lua"
+INFORMATION_FILE = PROJECT_ROOT / "data" / "trustInformation.json"
+
+# Category names as the wiki spells them in the <big> headers
+WIKI_CATEGORY_NAMES = {'Tank': 'Tanks'}
+PUNCTUATION = '.,:;!?'
+
+
+def load_categories(path=CATEGORIES_FILE):
+    """Read trustCategories.lua back into the Category list generate_categories.parse_html_content returns."""
+    return generate_categories.load_lua_file(path)
+
+
+def load_trusts(path=INFORMATION_FILE):
+    """Read the trusts of trustInformation.json, in any layout."""
+    return generate_information.load_json_file(path)
+
+
+def relative_url(url):
+    if url.startswith('https://www.bg-wiki.com/'):
+        return url[len('https://www.bg-wiki.com'):]
+    return url
+
+
+def render_item(item):
+    if isinstance(item, TextRun):
+        # A lone "None" would be read as an empty field, the wiki wraps it in markup
+        if item.value == 'None':
+            return '<i>None</i>'
+        return ' ' + html.escape(item.value, quote=False) + ' '
+
+    if isinstance(item, Link):
+        # The parser merges trailing punctuation into the link, put it back outside
+        text, tail = item.text, ''
+        if text and text[-1] in PUNCTUATION:
+            text, tail = text[:-1], text[-1]
+        return f'<a href="{relative_url(item.url)}" title="{html.escape(text)}">{html.escape(text, quote=False)}</a>{tail}'
+
+    if item.value == 'Status_Ability':
+        return '<img alt="None" src="/images/thumb/a/ab/Status_Ability.png/16px-Status_Ability.png" width="16" height="16" />'
+
+    name = item.value
+    return (f'<a href="/ffxi/File:{name}_SC_Icon.png" class="image">'
+            f'<img alt="{name} SC Icon.png" src="/images/1/12/{name}_SC_Icon.png" width="16" height="16" /></a>')
+
+
+def render_lines(lines, bullets):
+    if not lines:
+        return 'None'
+    rendered = [''.join(render_item(item) for item in line) for line in lines]
+    if bullets:
+        return '<ul>' + ''.join(f'<li>{line}</li>\n' for line in rendered) + '</ul>'
+    return '<br />\n'.join(rendered)
+
+
+def render_trust_table(trust_name, trust_data):
+    rows = ['<div class="two-column-flex-item"><table class="wikitable" style="width:100%"><tbody>',
+            f'<tr><th colspan="3" style="text-align:center"><big>{html.escape(trust_name, quote=False)}</big></th></tr>']
+    for label, field in (('Job', 'job'), ('Spells', 'spells'), ('Abilities', 'abilities'), ('Weapon Skills', 'weapon_skills')):
+        rows.append(f'<tr><td style="width:20%"> {label} </td>\n<td>{render_lines(getattr(trust_data, field), False)}</td></tr>')
+    for label, field in (('Acquisition', 'acquisition'), ('Special Features', 'special_features')):
+        rows.append(f'<tr><td colspan="3" style="background:#ccc"><span class="mw-headline">{label}</span></td></tr>')
+        rows.append(f'<tr><td colspan="3">\n{render_lines(getattr(trust_data, field), True)}\n</td></tr>')
+    rows.append('</tbody></table></div>')
+    return '\n'.join(rows)
+
+
+def scaled_name(name, copy):
+    return name if copy == 0 else f'{name} {copy}'
+
+
+def render_page(categories, trusts, scale=1):
+    """Render a full Category:Trust page, repeating every trust scale times."""
+    out = ['<!DOCTYPE html>',
+           '<html><head><title>Category:Trust - BG FFXI Wiki</title></head><body><div id="mw-content-text">',
+           '<table class="wikitable"><tbody>']
+
+    for category in categories:
+        links = ' &#8226; '.join(
+            f'<a href="/ffxi/BGWiki:Trusts#{html.escape(scaled_name(name, copy))}" title="BGWiki:Trusts">'
+            f'{html.escape(scaled_name(name, copy), quote=False)}</a>'
+            for copy in range(scale) for name in category.trusts)
+        out.append(f'<tr><td style="background: rgb(166, 219, 253); width:15%">'
+                   f'<big>{WIKI_CATEGORY_NAMES.get(category.name, category.name)}</big></td><td>{links}</td></tr>')
+    out.append('</tbody></table>')
+
+    for copy in range(scale):
+        for trust_name, trust_data in trusts.items():
+            out.append(render_trust_table(scaled_name(trust_name, copy), trust_data))
+
+    out.append('</div></body></html>')
+    return '\n'.join(out) + '\n'
+
+
+def main(argv=None):
+    """Main function."""
+    parser = argparse.ArgumentParser(description='Rebuild a Category:Trust page from the data files')
+    parser.add_argument('output', type=Path, help='HTML file to write')
+    parser.add_argument('--scale', type=int, default=1, help='repeat every trust N times (default: %(default)s)')
+    args = parser.parse_args(argv)
+
+    content = render_page(load_categories(), load_trusts(), args.scale)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+    print(f"Generated {args.output} ({len(content.encode('utf-8'))} bytes)")
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
@@ -0,0 +1,12 @@
+"""
+Tests of the data generation scripts. The scripts import each other by module name, so the scripts
+directory is put on the path first. Run from the repository root with:
+    python -m unittest discover -s scripts -p "test_*.py"
+"""
+
+import sys
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
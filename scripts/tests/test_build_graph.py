@@ -0,0 +1,93 @@
+"""Tests of the staleness, fingerprints and manifest of build_graph.py."""
+
+import io
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+import build_graph
+
+
+class BuildGraphTest(unittest.TestCase):
+    def setUp(self):
+        temporary = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary.cleanup)
+        self.directory = Path(temporary.name)
+        self.manifest = self.directory / 'cache' / build_graph.MANIFEST_FILE
+        (self.directory / 'a.txt').write_text('a', encoding='utf-8')
+        (self.directory / 'b.txt').write_text('b', encoding='utf-8')
+        self.date = '2026-01-02'
+
+    def build(self, force=False):
+        """Build a.txt -> upper_a -> A.lua, b.txt -> B.lua and both -> AB.lua, returning (statuses, steps run)."""
+        ran = []
+
+        def upper(path):
+            ran.append('upper_a')
+            return Path(path).read_text(encoding='utf-8').upper()
+
+        def write(name, *values_and_path):
+            *values, path = values_and_path
+            ran.append(name)
+            with open(path, 'w', encoding='utf-8', newline='\n') as f:
+                f.write(f'-- Generated: {self.date}\n' + ''.join(
+                    value if isinstance(value, str) else Path(value).read_text(encoding='utf-8') for value in values))
+
+        graph = build_graph.BuildGraph(self.manifest, force=force)
+        for name in ('a', 'b'):
+            path = self.directory / f'{name}.txt'
+            graph.source(name, path, build_graph.digest_files([path]))
+        graph.step('upper_a', upper, ['a'])
+        graph.step('write_a', lambda value, path: write('write_a', value, path), ['upper_a'],
+                   outputs=[self.directory / 'A.lua'])
+        graph.step('write_b', lambda value, path: write('write_b', value, path), ['b'],
+                   outputs=[self.directory / 'B.lua'])
+        graph.step('write_ab', lambda a, b, path: write('write_ab', a, b, path), ['upper_a', 'b'],
+                   options={'order': 'ab'}, outputs=[self.directory / 'AB.lua'])
+
+        with redirect_stdout(io.StringIO()):
+            statuses = graph.build()
+        return statuses, ran
+
+    def test_second_build_does_nothing(self):
+        statuses, ran = self.build()
+        self.assertEqual(statuses, {'write_a': 'written', 'write_b': 'written', 'write_ab': 'written'})
+        self.assertEqual(sorted(ran), ['upper_a', 'write_a', 'write_ab', 'write_b'])
+        self.assertEqual((self.directory / 'AB.lua').read_text(encoding='utf-8'), '-- Generated: 2026-01-02\nAb')
+
+        statuses, ran = self.build()
+        self.assertEqual(statuses, {'write_a': 'up to date', 'write_b': 'up to date', 'write_ab': 'up to date'})
+        self.assertEqual(ran, [])
+
+    def test_edited_input_reruns_its_dependents(self):
+        self.build()
+        (self.directory / 'b.txt').write_text('c', encoding='utf-8')
+        statuses, ran = self.build()
+        self.assertEqual(sorted(ran), ['upper_a', 'write_ab', 'write_b'])
+        self.assertEqual(statuses, {'write_a': 'up to date', 'write_b': 'written', 'write_ab': 'written'})
+
+    def test_edited_output_is_rebuilt(self):
+        self.build()
+        (self.directory / 'B.lua').write_text('edited by hand', encoding='utf-8')
+        statuses, ran = self.build()
+        self.assertEqual(ran, ['write_b'])
+        self.assertEqual(statuses['write_b'], 'written')
+        self.assertEqual((self.directory / 'B.lua').read_text(encoding='utf-8'), '-- Generated: 2026-01-02\nb')
+
+    def test_only_the_date_changed(self):
+        self.build()
+        before = (self.directory / 'A.lua').stat().st_mtime_ns
+        self.date = '2026-10-17'
+        statuses, ran = self.build(force=True)
+        # Every step runs, but a file whose content only differs by its date is left as it was
+        self.assertEqual(sorted(ran), ['upper_a', 'write_a', 'write_ab', 'write_b'])
+        self.assertEqual(set(statuses.values()), {'unchanged'})
+        self.assertEqual((self.directory / 'A.lua').stat().st_mtime_ns, before)
+        self.assertIn('2026-01-02', (self.directory / 'A.lua').read_text(encoding='utf-8'))
+        self.assertEqual(sorted(path.name for path in self.directory.iterdir()),
+                         ['A.lua', 'AB.lua', 'B.lua', 'a.txt', 'b.txt', 'cache'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+"""Tests of the icon atlas of build_icon_atlas.py, decoding the atlas and comparing its regions with the icons."""
+
+import io
+import random
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+import build_icon_atlas
+from tests.test_lua_format import read_lua_chunk
+from tests.test_generate_indexes import generated_date
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+ICON_FILES = sorted((PROJECT_ROOT / 'resources' / 'icons').glob('*.png'))
+# Largest size the addon draws an icon at, category icons are drawn at 16 and 24 pixels
+DRAWN_SIZE = 32
+
+
+def uv_region(atlas_width, atlas_height, atlas, entry):
+    """Return the RGBA rows of the atlas under the UV rectangle of an entry."""
+    x0, y0 = entry['uv0'][0] * atlas_width, entry['uv0'][1] * atlas_height
+    x1, y1 = entry['uv1'][0] * atlas_width, entry['uv1'][1] * atlas_height
+    if not all(value == int(value) for value in (x0, y0, x1, y1)):
+        raise AssertionError(f'UVs {entry["uv0"]} {entry["uv1"]} are not on pixel boundaries')
+    x0, y0, x1, y1 = int(x0), int(y0), int(x1), int(y1)
+    return x1 - x0, y1 - y0, b''.join(atlas[((y0 + row) * atlas_width + x0) * 4:((y0 + row) * atlas_width + x1) * 4]
+                                      for row in range(y1 - y0))
+
+
+class IconAtlasTest(unittest.TestCase):
+    def assert_regions_match(self, atlas_file, lua_file, icon_files):
+        atlas_width, atlas_height, atlas = build_icon_atlas.read_png(atlas_file)
+        atlas_lua = read_lua_chunk(Path(lua_file).read_text(encoding='utf-8'))
+        self.assertEqual((atlas_lua['width'], atlas_lua['height']), (atlas_width, atlas_height))
+        self.assertEqual(sorted(atlas_lua['icons']), sorted(Path(path).stem for path in icon_files))
+
+        for path in icon_files:
+            entry = atlas_lua['icons'][Path(path).stem]
+            self.assertEqual(uv_region(atlas_width, atlas_height, atlas, entry),
+                             build_icon_atlas.read_png(path), Path(path).name)
+
+    def test_committed_atlas(self):
+        self.assert_regions_match(PROJECT_ROOT / 'resources' / 'iconAtlas.png', PROJECT_ROOT / 'data' / 'iconAtlas.lua',
+                                  ICON_FILES)
+
+    def test_rebuild_committed_atlas(self):
+        # Written with the date of the committed file, the atlas and its Lua come out byte for byte the same
+        with tempfile.TemporaryDirectory() as directory:
+            atlas_file, lua_file = Path(directory) / 'iconAtlas.png', Path(directory) / 'iconAtlas.lua'
+            with redirect_stdout(io.StringIO()):
+                build_icon_atlas.write_atlas(ICON_FILES, atlas_file, lua_file,
+                                             generated=generated_date(PROJECT_ROOT / 'data' / 'iconAtlas.lua'))
+            self.assertEqual(lua_file.read_bytes(), (PROJECT_ROOT / 'data' / 'iconAtlas.lua').read_bytes())
+            self.assertEqual(atlas_file.read_bytes(), (PROJECT_ROOT / 'resources' / 'iconAtlas.png').read_bytes())
+
+    def test_icons_fit_their_drawn_size(self):
+        # A larger icon only grows the atlas, D3D scales it down to the drawn size anyway
+        for path in ICON_FILES:
+            width, height, _ = build_icon_atlas.read_png(path)
+            self.assertLessEqual(max(width, height), DRAWN_SIZE, path.name)
+
+    def test_write_atlas(self):
+        rng = random.Random(19)
+        with tempfile.TemporaryDirectory() as directory:
+            directory = Path(directory)
+            icon_files = []
+            for i, (width, height) in enumerate([(16, 16), (32, 32), (24, 8), (1, 40), (7, 3)] * 3):
+                path = directory / f'icon{i}.png'
+                build_icon_atlas.write_png(path, width, height, bytes(rng.randrange(256) for _ in range(width * height * 4)))
+                icon_files.append(path)
+
+            with redirect_stdout(io.StringIO()):
+                build_icon_atlas.write_atlas(icon_files, directory / 'atlas.png', directory / 'atlas.lua')
+            self.assert_regions_match(directory / 'atlas.png', directory / 'atlas.lua', icon_files)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,211 @@
+"""Tests of the detail crawler of crawl_details.py against a local stand-in for the wiki."""
+
+import io
+import tempfile
+import threading
+import time
+import unittest
+from contextlib import redirect_stdout
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import crawl_details
+import wiki_fetch
+from trust_ir import Trust, Line, TextRun, Link
+
+WIKI = 'https://www.bg-wiki.com/ffxi/'
+
+FULL_PAGE = '''<html><head><title>Cure - BG Wiki</title></head><body>
+<h1 id="firstHeading" class="firstHeading">Cure</h1>
+<p></p>
+<p>Restores <b>HP</b> of target&#39;s party member.</p>
+<table class="infobox">
+<tr><th>Type</th><td>White Magic</td></tr>
+<tr><th>MP Cost</th><td>8</td></tr>
+<tr><th>Notes</th><td></td></tr>
+</table>
+</body></html>'''
+# No heading, no paragraph and no infobox, only the <title> is left to read
+PARTIAL_PAGE = '<html><head><title>Provoke - BG Wiki</title></head><body><div>Stub</div></body></html>'
+
+PAGES = {
+    '/ffxi/Cure': (200, FULL_PAGE),
+    '/ffxi/Provoke': (200, PARTIAL_PAGE),
+    '/ffxi/Missing': (404, 'Not Found'),
+    '/ffxi/Broken': (503, 'Service Unavailable'),
+}
+ETAG = '"v1"'
+# How long the first request to /ffxi/Slow and /ffxi/Stalled goes unanswered
+STALL = 1.0
+
+
+class WikiHandler(BaseHTTPRequestHandler):
+    """
+    Serves PAGES, keep-alive, with an ETag on the pages it has. The first request to /ffxi/Flaky gets
+    a 503 and the first to /ffxi/Busy a 429 with Retry-After, the first to /ffxi/Slow and /ffxi/Stalled
+    is answered after STALL seconds. Every later request to them gets /ffxi/Cure.
+    """
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        with self.server.lock:
+            self.server.requests.append((self.path, self.headers.get('If-None-Match')))
+            first = [path for path, _ in self.server.requests].count(self.path) == 1
+
+        path = self.path
+        if path in ('/ffxi/Flaky', '/ffxi/Busy', '/ffxi/Slow', '/ffxi/Stalled'):
+            if first and path in ('/ffxi/Slow', '/ffxi/Stalled'):
+                time.sleep(STALL)
+            path = path if first and path in ('/ffxi/Flaky', '/ffxi/Busy') else '/ffxi/Cure'
+        status, body = PAGES.get(path, (404, 'Not Found'))
+        if path == '/ffxi/Flaky':
+            status, body = 503, 'Service Unavailable'
+        if path == '/ffxi/Busy':
+            status, body = 429, 'Too Many Requests'
+        if status == 200 and self.headers.get('If-None-Match') == ETAG:
+            status, body = 304, ''
+
+        data = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        if status == 200:
+            self.send_header('ETag', ETAG)
+        if status == 429:
+            self.send_header('Retry-After', '1')
+        if status != 304:
+            self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class WikiServer(ThreadingHTTPServer):
+    """The stand-in wiki, recording (path, If-None-Match) for every request."""
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), WikiHandler)
+        self.lock = threading.Lock()
+        self.requests = []
+
+    def handle_error(self, request, client_address):
+        # A client that timed out has closed the connection a stalled answer is written to
+        pass
+
+
+class DetailCrawlerTest(unittest.TestCase):
+    def setUp(self):
+        self.server = WikiServer()
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+    def crawler(self, cache_dir=None, **policy):
+        # The retries are not spaced out unless a test asks for it
+        policy = {'retries': 2, 'backoff': 0, 'read_timeout': 5, **policy}
+        return crawl_details.DetailCrawler(workers=2, rate=0, policy=wiki_fetch.FetchPolicy(**policy),
+                                           cache_dir=cache_dir,
+                                           origin=f'http://127.0.0.1:{self.server.server_port}')
+
+    def crawl(self, crawler, *pages):
+        with redirect_stdout(io.StringIO()) as output:
+            result = crawler.crawl([WIKI + page for page in pages])
+        return result, output.getvalue()
+
+    def test_full_and_partial_pages(self):
+        pages, _ = self.crawl(self.crawler(), 'Cure', 'Provoke')
+        self.assertEqual(pages, {
+            WIKI + 'Cure': {'title': 'Cure', 'summary': "Restores HP of target's party member.",
+                            'properties': [['Type', 'White Magic'], ['MP Cost', '8']]},
+            WIKI + 'Provoke': {'title': 'Provoke', 'summary': None, 'properties': []},
+        })
+
+    def test_missing_page(self):
+        crawler = self.crawler()
+        pages, output = self.crawl(crawler, 'Missing', 'Cure')
+        self.assertEqual(list(pages), [WIKI + 'Cure'])
+        self.assertEqual(crawler.stats['missing'], 1)
+        self.assertEqual(crawler.stats['retries'], 0)
+        self.assertEqual(output, '')
+
+    def test_server_errors(self):
+        crawler = self.crawler()
+        pages, output = self.crawl(crawler, 'Broken', 'Flaky')
+        # Broken is tried three times and given up on, Flaky succeeds on its second attempt
+        self.assertEqual(list(pages), [WIKI + 'Flaky'])
+        self.assertEqual(pages[WIKI + 'Flaky']['title'], 'Cure')
+        self.assertEqual(crawler.stats['failed'], 1)
+        self.assertEqual(crawler.stats['fetched'], 1)
+        self.assertEqual(crawler.stats['retries'], 3)
+        self.assertEqual([path for path, _ in self.server.requests].count('/ffxi/Broken'), 3)
+        self.assertIn(f'Error fetching {WIKI}Broken: HTTP 503 after 3 attempts', output)
+
+    def test_retry_after(self):
+        crawler = self.crawler(max_backoff=0.3)
+        start = time.perf_counter()
+        pages, _ = self.crawl(crawler, 'Busy')
+        # Retry-After asks for 1 second, max_backoff caps the wait
+        self.assertGreaterEqual(time.perf_counter() - start, 0.3)
+        self.assertLess(time.perf_counter() - start, STALL)
+        self.assertEqual(pages[WIKI + 'Busy']['title'], 'Cure')
+        self.assertEqual(crawler.stats['retries'], 1)
+
+    def test_read_timeout(self):
+        crawler = self.crawler(read_timeout=0.2)
+        start = time.perf_counter()
+        pages, output = self.crawl(crawler, 'Slow')
+        self.assertLess(time.perf_counter() - start, STALL)
+        self.assertEqual(pages[WIKI + 'Slow']['title'], 'Cure')
+        self.assertEqual((crawler.stats['retries'], crawler.stats['failed']), (1, 0))
+        self.assertEqual(output, '')
+
+    def test_read_timeout_without_retries(self):
+        crawler = self.crawler(read_timeout=0.2, retries=0)
+        pages, output = self.crawl(crawler, 'Slow')
+        self.assertEqual(pages, {})
+        self.assertEqual(crawler.stats['failed'], 1)
+        self.assertIn(f'Error fetching {WIKI}Slow: timeout after 1 attempts', output)
+
+    def test_hedged_request(self):
+        crawler = self.crawler(hedge_after=0.2)
+        start = time.perf_counter()
+        pages, _ = self.crawl(crawler, 'Stalled')
+        # The hedged request is answered at once, the first one is left to finish in the background
+        self.assertLess(time.perf_counter() - start, STALL)
+        self.assertEqual(pages[WIKI + 'Stalled']['title'], 'Cure')
+        self.assertEqual((crawler.stats['hedged'], crawler.stats['retries']), (1, 0))
+        self.assertEqual([path for path, _ in self.server.requests], ['/ffxi/Stalled'] * 2)
+
+    def test_cache_revalidation(self):
+        with tempfile.TemporaryDirectory() as directory:
+            first = self.crawler(Path(directory))
+            pages, _ = self.crawl(first, 'Cure')
+            second = self.crawler(Path(directory))
+            self.assertEqual(self.crawl(second, 'Cure')[0], pages)
+        self.assertEqual(self.server.requests, [('/ffxi/Cure', None), ('/ffxi/Cure', ETAG)])
+        self.assertEqual((first.stats['fetched'], second.stats['not_modified']), (1, 1))
+
+    def test_crawl_details(self):
+        trusts = {
+            'Kupipi': Trust('Kupipi', spells=[Line([Link('Cure', WIKI + 'Cure'), TextRun(' '),
+                                                     Link('Missing', WIKI + 'Missing')])]),
+            'Shikaree Z': Trust('Shikaree Z', abilities=[Line([Link('Provoke', WIKI + 'Provoke'),
+                                                                Link('Broken', WIKI + 'Broken')])]),
+            'Ayame': Trust('Ayame', abilities=[Line([Link('Red', WIKI + 'Red?action=edit&redlink=1')])]),
+        }
+        with redirect_stdout(io.StringIO()):
+            result = crawl_details.crawl_details(trusts, self.crawler())
+
+        self.assertEqual(list(result['Kupipi'].details), [WIKI + 'Cure'])
+        self.assertEqual(result['Shikaree Z'].details, {WIKI + 'Provoke': {'title': 'Provoke', 'summary': None,
+                                                                            'properties': []}})
+        self.assertIsNone(result['Ayame'].details)
+        self.assertNotIn('/ffxi/Red', [path.split('?')[0] for path, _ in self.server.requests])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+"""Tests of the streaming category parser and of the category index of generate_categories.py."""
+
+import io
+import random
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+import synthetic_page
+import generate_categories
+from trust_ir import Category
+from tests.test_generate_indexes import DATA_DIR, generated_date
+
+
+def feed(chunks):
+    parser = generate_categories.CategoryStreamParser()
+    for chunk in chunks:
+        parser.feed(chunk)
+    return parser
+
+
+def random_chunks(page, rng, count):
+    cuts = sorted(rng.sample(range(1, len(page)), count))
+    return [page[start:end] for start, end in zip([0] + cuts, cuts + [len(page)])]
+
+
+class CategoryStreamParserTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.page = synthetic_page.render_page(synthetic_page.load_categories(), synthetic_page.load_trusts(), 1)
+        cls.categories = generate_categories.parse_html_content(cls.page)
+
+    def test_random_chunks(self):
+        rng = random.Random(10)
+        for count in (0, 1, 50, 5000):
+            parser = feed(random_chunks(self.page, rng, count))
+            self.assertTrue(parser.complete)
+            self.assertEqual(parser.close(), self.categories)
+
+    def test_headers_cut_by_chunks(self):
+        # One character at a time cuts every <big> header and its closing tag
+        prefix = self.page[:self.page.index('<table class="wikitable"', self.page.index('Unity Concord'))]
+        parser = feed(prefix)
+        self.assertEqual(parser.close(), generate_categories.parse_html_content(prefix))
+
+    def test_stops_after_the_last_section(self):
+        parser = feed(random_chunks(self.page, random.Random(1), 200))
+        self.assertLess(sum(map(len, parser.chunks)), len(self.page))
+
+
+class CategoryIndexTest(unittest.TestCase):
+    def resolve(self, categories):
+        return generate_categories.resolve_category_index(categories, DATA_DIR / 'trustData.lua',
+                                                          DATA_DIR / 'trustAliases.lua')
+
+    def test_committed_index(self):
+        index = self.resolve(generate_categories.load_lua_file(DATA_DIR / 'trustCategories.lua'))
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / 'trustCategoryIndex.lua'
+            with redirect_stdout(io.StringIO()):
+                generate_categories.generate_index_file(index, path,
+                                                        generated=generated_date(DATA_DIR / 'trustCategoryIndex.lua'))
+            self.assertEqual(path.read_bytes(), (DATA_DIR / 'trustCategoryIndex.lua').read_bytes())
+
+    def test_masks_and_aliases(self):
+        # Pages list trusts by their wiki names, trustAliases.lua maps AAEV and D. Shantotto to theirs
+        index = self.resolve([Category('Tank', ['Ark Angel EV']),
+                              Category('Healer', ['Kupipi', 'Ark Angel EV']),
+                              Category('Offensive Caster', ['Domina Shantotto', 'Shantotto'])])
+        # Bits follow CATEGORY_MAP, not the page, and only cover the categories on the page
+        self.assertEqual(index['bits'], {'Tank': 1, 'Offensive Caster': 2, 'Healer': 4})
+        self.assertEqual(index['ids'], {896: 2, 898: 4, 934: 2, 993: 5})
+        self.assertEqual(index['names'], {'Shantotto': 2, 'Kupipi': 4, 'D. Shantotto': 2, 'Domina Shantotto': 2,
+                                          'AAEV': 5, 'Ark Angel EV': 5})
+        self.assertEqual(index['categories'], {2: ['Offensive Caster'], 4: ['Healer'], 5: ['Tank', 'Healer']})
+
+    def test_unmatched_name(self):
+        # The in-game name of an aliased trust is not a wiki name
+        with self.assertRaisesRegex(ValueError, r"2 category entries(.|\n)*'AAEV'(.|\n)*'Nobody'"):
+            self.resolve([Category('Tank', ['AAEV', 'Ark Angel HM']), Category('Healer', ['Nobody'])])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+"""Tests of the index files written by generate_indexes.py."""
+
+import io
+import re
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from datetime import datetime
+from pathlib import Path
+
+import generate_categories
+import generate_information
+import generate_indexes
+from lua_format import load_lua_records, load_aliases
+
+DATA_DIR = Path(__file__).resolve().parent.parent.parent / 'data'
+GENERATED_PATTERN = re.compile(r'^-- Generated: (\d{4}-\d{2}-\d{2})$', re.MULTILINE)
+
+
+def generated_date(path):
+    return datetime.strptime(GENERATED_PATTERN.search(path.read_text(encoding='utf-8')).group(1), '%Y-%m-%d')
+
+
+class IndexFilesTest(unittest.TestCase):
+    def test_committed_indexes(self):
+        # Written with the date of the committed files, the indexes come out byte for byte the same
+        trusts = load_lua_records(DATA_DIR / 'trustData.lua')
+        cipher_index, trust_index, errors = generate_indexes.build_indexes(load_lua_records(DATA_DIR / 'cipherData.lua'),
+                                                                           trusts)
+        self.assertEqual(errors, [])
+        search_index, _ = generate_indexes.build_search_index(
+            trusts, load_aliases(DATA_DIR / 'trustAliases.lua'),
+            generate_categories.load_lua_file(DATA_DIR / 'trustCategories.lua'),
+            generate_information.load_json_file(DATA_DIR / 'trustInformation.json'))
+
+        writers = [(generate_indexes.generate_cipher_index_file, cipher_index, 'cipherIndex.lua'),
+                   (generate_indexes.generate_trust_index_file, trust_index, 'trustIndex.lua'),
+                   (generate_indexes.generate_search_index_file, search_index, 'searchIndex.lua')]
+        with tempfile.TemporaryDirectory() as directory:
+            for writer, index, file_name in writers:
+                path = Path(directory) / file_name
+                with redirect_stdout(io.StringIO()):
+                    writer(index, path, generated=generated_date(DATA_DIR / file_name))
+                self.assertEqual(path.read_bytes(), (DATA_DIR / file_name).read_bytes(), file_name)
+
+    def test_generated_date(self):
+        header = generate_indexes.lua_header('trust index', generated=datetime(2026, 1, 2, 15, 8, 57))
+        self.assertEqual(header[1], '-- Generated: 2026-01-02')
+
+
+if __name__ == '__main__':
+    unittest.main()
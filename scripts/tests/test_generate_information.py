@@ -0,0 +1,312 @@
+"""
+Tests of the field tokenizer, the page and stream parsers, the table cache, the JSON layouts and the
+render runs of generate_information.py.
+"""
+
+import re
+import html
+import io
+import json
+import random
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+import synthetic_page
+import generate_information
+from tests.test_generate_categories import random_chunks
+from generate_information import RUN_GLYPH_WIDTH
+from trust_ir import Trust, Line, TextRun, Link, SkillchainIcon
+
+DATA_DIR = Path(__file__).resolve().parent.parent.parent / 'data'
+# What Lua's %s matches in the C locale
+LUA_SPACE = r'[ \t\n\v\f\r]+'
+
+
+def reference_parse_html_content(html_content):
+    """
+    The tokenizer as it was before the single compiled pass: split into lines, drop </li> and <p>,
+    find every element kind with its own pattern, then clean the text between them.
+    """
+    if not html_content or html_content.strip() == 'None':
+        return None
+
+    result = []
+    for line_html in re.split(r'<li[^>]*>|<br\s*/?>', html_content):
+        if not line_html or not line_html.strip():
+            continue
+
+        line_html = re.sub(r'</li>', '', line_html)
+        line_html = re.sub(r'</?p[^>]*>', '', line_html)
+
+        elements = []
+        for match in re.finditer(r'<a\s+[^>]*href="([^"]*)"[^>]*>([^<]*)</a>', line_html):
+            url = match.group(1)
+            if url.startswith('/'):
+                url = 'https://www.bg-wiki.com' + url
+            elif not url.startswith('http'):
+                url = 'https://www.bg-wiki.com/ffxi/' + url
+            elements.append((match.start(), match.end(), 'link', match.group(2).strip(), url))
+        for match in re.finditer(r'<img[^>]*alt="([^"]*SC Icon[^"]*)"[^>]*>', line_html):
+            sc_name = match.group(1).replace(' SC Icon.png', '').replace(' SC Icon', '')
+            if sc_name:
+                elements.append((match.start(), match.end(), 'skillchain', sc_name, None))
+        for pattern in (r'<img[^>]*alt="None"[^>]*src="[^"]*Status_Ability\.png"[^>]*>',
+                        r'<img[^>]*src="[^"]*Status_Ability\.png"[^>]*alt="None"[^>]*>'):
+            for match in re.finditer(pattern, line_html, re.IGNORECASE):
+                elements.append((match.start(), match.end(), 'skillchain', 'Status_Ability', None))
+        elements.sort(key=lambda element: element[0])
+
+        def clean(text):
+            text = re.sub(r'<[^>]+>', '', text)
+            text = html.unescape(text)
+            text = re.sub(r'\s+', ' ', text).strip()
+            return ' / ' if re.match(r'^\s*/\s*$', text) else text
+
+        line_items = []
+        pos = 0
+        for start, end, kind, value, url in elements:
+            text = clean(line_html[pos:start])
+            if text:
+                line_items.append({'type': 'text', 'value': text})
+            if kind == 'link':
+                if value:
+                    line_items.append({'type': 'link', 'text': value, 'url': url})
+            else:
+                line_items.append({'type': 'skillchain', 'value': value})
+            pos = end
+        text = clean(line_html[pos:])
+        if text:
+            line_items.append({'type': 'text', 'value': text})
+
+        # Merge punctuation into the preceding text or link
+        i = 0
+        while i < len(line_items):
+            item = line_items[i]
+            if item['type'] == 'text' and i > 0 and line_items[i - 1]['type'] != 'skillchain':
+                prev = line_items[i - 1]
+                key = 'text' if prev['type'] == 'link' else 'value'
+                value = item['value']
+                if value in ['.', ',', ':', ';', '!', '?']:
+                    prev[key] += value
+                    line_items.pop(i)
+                    continue
+                if value[0] in ['.', ',', ':', ';', '!', '?']:
+                    prev[key] += value[0]
+                    item['value'] = value[1:].lstrip()
+                    if not item['value']:
+                        line_items.pop(i)
+                        continue
+            i += 1
+
+        if line_items:
+            result.append(line_items)
+
+    return result if result else None
+
+
+def parse(html_content):
+    lines = generate_information.parse_html_content(html_content)
+    return [[item.to_dict() for item in line] for line in lines] if lines else None
+
+
+# Pieces of field HTML, including stray '<' and '>' that do not start or end a tag
+FRAGMENTS = [
+    '<br />', '<br>', '<li>', '<li class="q">', '</li>', '<p>', '</p>', '<p', '<b>', '</a>', '<a ',
+    '<', '>', '<y', 'x', 'y?', '?', '.', ',', ' ', '/', '&lt;', '&amp;', 'li', 'br', 'href="w">',
+    '<a href="u">b</a>', '<a href="/v">c</a>', '<a href="http://x/y"> d </a>',
+    '<img alt="Fire SC Icon.png">', '<img alt=" SC Icon">', '<img alt="None" src="/Status_Ability.png">',
+    '<IMG SRC="/Status_Ability.png" ALT="None">', 'Lv.50 ', 'é', '\n',
+]
+
+
+class ParseHtmlContentTest(unittest.TestCase):
+    def assert_same(self, html_content):
+        self.assertEqual(parse(html_content), reference_parse_html_content(html_content), repr(html_content))
+
+    def test_stray_angle_brackets(self):
+        for html_content in ['<br />x<y?', 'x<y?', '<y</li>', '<p>br<<p><a href="/v">c</a>',
+                             '<pbr<img alt="None" src="/Status_Ability.png">y?', 'a &lt;b&gt; c']:
+            self.assert_same(html_content)
+
+    def test_punctuation(self):
+        self.assertEqual(parse('<a href="u">b</a>. c'),
+                         [[{'type': 'link', 'text': 'b.', 'url': 'https://www.bg-wiki.com/ffxi/u'},
+                           {'type': 'text', 'value': 'c'}]])
+        self.assert_same('<img alt="Fire SC Icon.png">, x')
+
+    def test_random_fragments(self):
+        rng = random.Random(20240601)
+        for _ in range(20000):
+            self.assert_same(''.join(rng.choice(FRAGMENTS) for _ in range(rng.randint(1, 10))))
+
+
+class ParseHtmlStreamTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.page = synthetic_page.render_page(synthetic_page.load_categories(), synthetic_page.load_trusts(), 1)
+        cls.trusts = generate_information.parse_html_content_from_string(cls.page)
+
+    def assert_same(self, chunks):
+        self.assertEqual(''.join(chunks), self.page)
+        trusts = generate_information.parse_html_stream(iter(chunks))
+        self.assertEqual(list(trusts), list(self.trusts))
+        self.assertEqual(trusts, self.trusts)
+
+    def test_random_chunks(self):
+        rng = random.Random(11)
+        for count in (0, 1, 50, 5000, 50000):
+            self.assert_same(random_chunks(self.page, rng, count))
+
+    def test_table_starts_cut_by_chunks(self):
+        # A cut at every position inside every table start, and in the tags around it
+        table_start = generate_information.TABLE_START
+        starts = [match.start() for match in re.finditer(re.escape(table_start), self.page)]
+        for offset in range(-8, len(table_start) + 8):
+            cuts = sorted({start + offset for start in starts if 0 < start + offset < len(self.page)})
+            self.assert_same([self.page[start:end] for start, end in zip([0] + cuts, cuts + [len(self.page)])])
+
+    def test_one_character_at_a_time(self):
+        end = self.page.index(generate_information.TABLE_START, self.page.index('</big>', self.page.index('two-column')))
+        prefix = self.page[:end + 40]
+        self.assertEqual(generate_information.parse_html_stream(iter(prefix)),
+                         generate_information.parse_html_content_from_string(prefix))
+
+    def test_table_cache(self):
+        chunks = random_chunks(self.page, random.Random(3), 500)
+        table_cache = generate_information.TableCache()
+        generate_information.parse_html_stream(iter(chunks), table_cache)
+        trusts = generate_information.parse_html_stream(iter(chunks), table_cache)
+        self.assertEqual(trusts, self.trusts)
+        self.assertEqual((table_cache.reused, table_cache.parsed), (len(self.trusts), len(self.trusts)))
+
+
+class TableCacheTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.page = synthetic_page.render_page(synthetic_page.load_categories(), synthetic_page.load_trusts(), 1)
+        cls.trusts = generate_information.parse_html_content_from_string(cls.page)
+
+    def setUp(self):
+        temporary = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary.cleanup)
+        self.cache_path = Path(temporary.name) / 'tables.json'
+
+    def parse(self, page):
+        table_cache = generate_information.TableCache.load(self.cache_path)
+        trusts = generate_information.parse_html_content_from_string(page, table_cache)
+        table_cache.save(self.cache_path)
+        return trusts, table_cache
+
+    def test_unchanged_tables_are_reused(self):
+        trusts, table_cache = self.parse(self.page)
+        self.assertEqual(trusts, self.trusts)
+        self.assertEqual((table_cache.reused, table_cache.parsed), (0, len(self.trusts)))
+
+        modified = self.cache_path.stat().st_mtime_ns
+        trusts, table_cache = self.parse(self.page)
+        self.assertEqual(trusts, self.trusts)
+        self.assertEqual((table_cache.reused, table_cache.parsed), (len(self.trusts), 0))
+        # Nothing was parsed, so the cache file is not rewritten
+        self.assertEqual(self.cache_path.stat().st_mtime_ns, modified)
+
+    def test_edited_table_is_parsed(self):
+        self.parse(self.page)
+        name = list(self.trusts)[5]
+        page = self.page.replace(f'<big>{name}</big>', f'<big>{name} II</big>', 1)
+        trusts, table_cache = self.parse(page)
+        self.assertEqual(trusts, generate_information.parse_html_content_from_string(page))
+        self.assertIn(f'{name} II', trusts)
+        self.assertEqual((table_cache.reused, table_cache.parsed), (len(self.trusts) - 1, 1))
+        # Only the tables of the last parse are kept
+        with open(self.cache_path, 'r', encoding='utf-8') as f:
+            self.assertEqual(len(json.load(f)['tables']), len(self.trusts))
+
+    def test_other_parser_version(self):
+        self.parse(self.page)
+        with open(self.cache_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        data['parser'] = 'an older parser'
+        with open(self.cache_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        _, table_cache = self.parse(self.page)
+        self.assertEqual((table_cache.reused, table_cache.parsed), (0, len(self.trusts)))
+
+
+class LayoutTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        page = synthetic_page.render_page(synthetic_page.load_categories(), synthetic_page.load_trusts(), 1)
+        cls.trusts = generate_information.parse_html_content_from_string(page)
+        # A URL outside the wiki keeps its prefix, and an item type can start a line
+        cls.trusts['Test'] = Trust('Test', job=[Line([SkillchainIcon('Fire'), TextRun('WAR / WHM')])],
+                                   acquisition=[Line([Link('Forum', 'https://example.com/forum?t=1'), TextRun('.')])])
+
+    def test_compact_round_trip(self):
+        encoded = generate_information.encode_compact(self.trusts)
+        self.assertEqual(generate_information.decode_compact(encoded), self.trusts)
+        # Every string and URL is stored once
+        self.assertEqual(len(set(encoded['strings'])), len(encoded['strings']))
+        self.assertEqual(len(set(encoded['urls'])), len(encoded['urls']))
+        self.assertEqual(generate_information.decode_compact(json.loads(json.dumps(encoded))), self.trusts)
+
+    def test_layouts_round_trip(self):
+        with tempfile.TemporaryDirectory() as directory:
+            for layout in generate_information.LAYOUTS:
+                path = Path(directory) / f'{layout}.json'
+                with redirect_stdout(io.StringIO()):
+                    generate_information.generate_json_file(self.trusts, path, layout=layout)
+                self.assertEqual(generate_information.load_json_file(path), self.trusts, layout)
+
+
+class RenderRunsTest(unittest.TestCase):
+    def assert_runs(self, item, original):
+        """Check the runs of one item against the item they were computed from."""
+        if isinstance(original, TextRun):
+            self.assertEqual(item.value, original.value)
+            # The info window draws the words separated by single spaces, Lua whitespace collapsed
+            self.assertEqual(' '.join(item.words), re.sub(LUA_SPACE, ' ', original.value).strip(' \t\n\v\f\r'))
+            self.assertEqual(item.widths, [len(word) * RUN_GLYPH_WIDTH for word in item.words])
+            self.assertEqual(item.width, len(original.value) * RUN_GLYPH_WIDTH)
+        elif isinstance(original, Link):
+            self.assertEqual((item.text, item.url), (original.text, original.url))
+            self.assertEqual(item.width, len(original.text) * RUN_GLYPH_WIDTH)
+        else:
+            self.assertEqual(item, original)
+
+    def test_committed_data(self):
+        trusts = generate_information.load_json_file(DATA_DIR / 'trustInformation.json')
+        with_runs = generate_information.add_render_runs(trusts)
+        self.assertEqual(list(with_runs), list(trusts))
+
+        for trust_name, trust in trusts.items():
+            for field_name, lines in trust.fields():
+                run_lines = getattr(with_runs[trust_name], field_name)
+                self.assertEqual(len(run_lines), len(lines))
+                for run_line, line in zip(run_lines, lines):
+                    self.assertEqual(len(run_line), len(line))
+                    for item, original in zip(run_line, line):
+                        self.assert_runs(item, original)
+                        if isinstance(original, TextRun):
+                            # Parsed text is whitespace-normalized (' / ' keeps its spaces), so the words join
+                            # back to the value
+                            self.assertEqual(' '.join(item.words), original.value.strip(' '))
+                            self.assertEqual(sum(item.widths) + (len(item.words) - 1) * RUN_GLYPH_WIDTH,
+                                             len(original.value.strip(' ')) * RUN_GLYPH_WIDTH)
+                        # The parsed trusts are left as they were
+                        self.assertIsNone(original.to_dict().get('width'))
+
+    def test_lua_words(self):
+        text = TextRun(' Lv.50 \tCure\xa0IV\n  日本 ')
+        trust = Trust('Test', spells=[Line([text, Link('Éclair', 'https://www.bg-wiki.com/ffxi/E'), SkillchainIcon('Fire')])])
+        with_runs = generate_information.add_render_runs({'Test': trust})['Test']
+        # A no-break space is not Lua whitespace, so it stays inside a word
+        self.assertEqual(with_runs.spells[0][0].words, ['Lv.50', 'Cure\xa0IV', '日本'])
+        for item, original in zip(with_runs.spells[0], trust.spells[0]):
+            self.assert_runs(item, original)
+        self.assertEqual(with_runs.spells[0][1].width, 6 * RUN_GLYPH_WIDTH)
+
+
+if __name__ == '__main__':
+    unittest.main()
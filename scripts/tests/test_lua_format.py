@@ -0,0 +1,261 @@
+"""Tests of the Lua literals of lua_format.py and of trustInformation.lua against trustInformation.json."""
+
+import io
+import random
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+import generate_information
+from lua_format import lua_string, lua_value
+from trust_ir import Trust, Line, TextRun, Link, SkillchainIcon
+
+DATA_DIR = Path(__file__).resolve().parent.parent.parent / 'data'
+
+LUA_ESCAPES = {'a': '\a', 'b': '\b', 'f': '\f', 'n': '\n', 'r': '\r', 't': '\t', 'v': '\v',
+               '\\': '\\', '"': '"', "'": "'", '\n': '\n'}
+
+
+class LuaReader:
+    """
+    Reader for the subset of Lua the generators emit: a 'local name = <table>' chunk made of table
+    constructors, strings (quoted or long brackets), numbers, booleans and nil. Strings are read
+    following the Lua 5.1 lexer, independently of lua_format, so a round trip checks the writer.
+    """
+
+    def __init__(self, text):
+        self.text = text
+        self.position = 0
+
+    def error(self, message):
+        line = self.text.count('\n', 0, self.position) + 1
+        return ValueError(f'line {line}: {message}')
+
+    def skip_space(self):
+        while self.position < len(self.text):
+            if self.text[self.position].isspace():
+                self.position += 1
+            elif self.text.startswith('--', self.position):
+                end = self.text.find('\n', self.position)
+                self.position = len(self.text) if end == -1 else end
+            else:
+                break
+
+    def peek(self):
+        self.skip_space()
+        return self.text[self.position:self.position + 1]
+
+    def expect(self, token):
+        self.skip_space()
+        if not self.text.startswith(token, self.position):
+            raise self.error(f'expected {token!r}')
+        self.position += len(token)
+
+    def read_chunk(self):
+        """Read 'local name = value ... return name' and return value."""
+        self.expect('local')
+        self.read_name()
+        self.expect('=')
+        value = self.read_value()
+        self.expect('return')
+        self.read_name()
+        self.skip_space()
+        if self.position != len(self.text):
+            raise self.error('trailing text')
+        return value
+
+    def read_name(self):
+        self.skip_space()
+        start = self.position
+        while self.position < len(self.text) and (self.text[self.position].isalnum() or self.text[self.position] == '_'):
+            self.position += 1
+        if start == self.position:
+            raise self.error('expected a name')
+        return self.text[start:self.position]
+
+    def long_bracket_level(self):
+        """Level of a long bracket opening at the current position, or None."""
+        end = self.position + 1
+        while self.text[end:end + 1] == '=':
+            end += 1
+        if self.text[self.position] == '[' and self.text[end:end + 1] == '[':
+            return end - self.position - 1
+        return None
+
+    def read_value(self):
+        char = self.peek()
+        if char == '{':
+            return self.read_table()
+        if char in ('"', "'"):
+            return self.read_quoted()
+        if char == '[' and self.long_bracket_level() is not None:
+            return self.read_long_string()
+        if char == '-' or char.isdigit():
+            start = self.position
+            self.position += 1
+            while self.position < len(self.text) and (self.text[self.position].isdigit() or self.text[self.position] in '.eE+-'):
+                self.position += 1
+            literal = self.text[start:self.position]
+            return float(literal) if any(c in literal for c in '.eE') else int(literal)
+        name = self.read_name()
+        if name in ('true', 'false', 'nil'):
+            return {'true': True, 'false': False, 'nil': None}[name]
+        raise self.error(f'unexpected {name!r}')
+
+    def read_quoted(self):
+        quote = self.text[self.position]
+        self.position += 1
+        value = []
+        while True:
+            char = self.text[self.position]
+            self.position += 1
+            if char == quote:
+                return ''.join(value)
+            if char in '\r\n':
+                raise self.error('unfinished string')
+            if char != '\\':
+                value.append(char)
+                continue
+            char = self.text[self.position]
+            if char.isdigit():
+                digits = ''
+                while len(digits) < 3 and self.text[self.position].isdigit():
+                    digits += self.text[self.position]
+                    self.position += 1
+                if int(digits) > 255:
+                    raise self.error('escape sequence too large')
+                value.append(chr(int(digits)))
+                continue
+            if char not in LUA_ESCAPES:
+                raise self.error(f'invalid escape \\{char}')
+            value.append(LUA_ESCAPES[char])
+            self.position += 1
+
+    def read_long_string(self):
+        level = self.long_bracket_level()
+        self.position += level + 2
+        close = ']' + '=' * level + ']'
+        end = self.text.find(close, self.position)
+        if end == -1:
+            raise self.error('unfinished long string')
+        value = self.text[self.position:end]
+        self.position = end + len(close)
+        # Every end of line sequence reads as '\n', and one right after the opening bracket is skipped
+        value = value.replace('\r\n', '\n').replace('\n\r', '\n').replace('\r', '\n')
+        return value[1:] if value.startswith('\n') else value
+
+    def read_table(self):
+        """Read a table constructor, as a list when it only has positional values, otherwise a dict."""
+        self.expect('{')
+        entries = []
+        positional = []
+        while self.peek() != '}':
+            if self.peek() == '[' and self.long_bracket_level() is None:
+                self.expect('[')
+                key = self.read_value()
+                self.expect(']')
+                self.expect('=')
+                entries.append((key, self.read_value()))
+            else:
+                start = self.position
+                name = None
+                if self.peek().isalpha() or self.peek() == '_':
+                    name = self.read_name()
+                if name is not None and self.peek() == '=' and self.text[self.position + 1] != '=':
+                    self.expect('=')
+                    entries.append((name, self.read_value()))
+                else:
+                    self.position = start
+                    positional.append(self.read_value())
+            if self.peek() in (',', ';'):
+                self.position += 1
+            elif self.peek() != '}':
+                raise self.error("expected ',' or '}'")
+        self.expect('}')
+        if entries and positional:
+            raise self.error('mixed table')
+        return dict(entries) if entries else positional
+
+
+def read_lua_chunk(text):
+    return LuaReader(text).read_chunk()
+
+
+def read_lua_literal(literal):
+    reader = LuaReader(literal)
+    value = reader.read_value()
+    reader.skip_space()
+    if reader.position != len(literal):
+        raise reader.error('trailing text')
+    return value
+
+
+# Values that exercise every path of lua_string: both quotes, long brackets at several levels,
+# backslashes, control characters and non-ASCII text
+TRICKY_STRINGS = [
+    '', 'plain', "it's", 'say "hi"', 'both \' and "', 'a]]b', ']]', ']=]', ']==]]]', 'ends with ]',
+    'back\\slash', "back\\slash's", 'tab\there', 'line\nbreak', 'cr\rlf\r\n', '\nleading newline',
+    'nul\x00byte', 'bell\x07', '\x1f\x7f', '\\n is not a newline', 'é', 'Ark Angel É.V.', '日本語',
+    'emoji 🙂', "mixed ]] ' \" \\ \n é",
+]
+ALPHABET = ['a', ' ', "'", '"', '[', ']', '=', '\\', '\n', '\r', '\t', '\x00', '\x1b', '\x7f', 'é', '語', '🙂']
+
+
+class LuaStringTest(unittest.TestCase):
+    def test_tricky_strings(self):
+        for value in TRICKY_STRINGS:
+            self.assertEqual(read_lua_literal(lua_string(value)), value, repr(value))
+
+    def test_random_strings(self):
+        rng = random.Random(6)
+        for _ in range(20000):
+            value = ''.join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 12)))
+            literal = lua_string(value)
+            self.assertNotIn('\n', literal)
+            self.assertEqual(read_lua_literal(literal), value, repr(value))
+
+    def test_data_file_style(self):
+        self.assertEqual(lua_string('Kupipi'), "'Kupipi'")
+        self.assertEqual(lua_string("Shantotto's"), '"Shantotto\'s"')
+        self.assertEqual(lua_string('a]]b\'"'), '[=[a]]b\'"]=]')
+
+    def test_values(self):
+        value = {'words': ['a', "b'c"], 'widths': [7, 21], 'width': 35, 'set': True, 'empty': []}
+        self.assertEqual(read_lua_literal(lua_value(value)), value)
+
+
+def lua_records(trusts):
+    """The Lua view of trust records: fields that are None are absent from the table."""
+    return {trust_name: {key: value for key, value in trust.to_dict().items() if value is not None}
+            for trust_name, trust in trusts.items()}
+
+
+class TrustInformationLuaTest(unittest.TestCase):
+    def test_committed_data_matches_json(self):
+        lua_trusts = read_lua_chunk((DATA_DIR / 'trustInformation.lua').read_text(encoding='utf-8'))
+        json_trusts = generate_information.load_json_file(DATA_DIR / 'trustInformation.json')
+        self.assertEqual(list(lua_trusts), list(json_trusts))
+        self.assertEqual(lua_trusts, lua_records(json_trusts))
+
+    def test_generated_file_round_trip(self):
+        trusts = {}
+        for i, value in enumerate(TRICKY_STRINGS):
+            name = f'Trust {i} {value.splitlines()[0] if value.strip() else "x"}'
+            trusts[name] = Trust(name, job=[Line([Link(value or 'x', f'https://www.bg-wiki.com/ffxi/{i}')])],
+                                 spells=[Line([TextRun(value or 'x'), SkillchainIcon('Fire')])],
+                                 details={f'https://example.com/{i}': {'title': value, 'fields': [value]}})
+        trusts = generate_information.add_render_runs(trusts)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / 'trustInformation.lua'
+            with redirect_stdout(io.StringIO()):
+                generate_information.generate_lua_file(trusts, path)
+            lua_trusts = read_lua_chunk(path.read_text(encoding='utf-8'))
+
+        self.assertEqual(list(lua_trusts), list(trusts))
+        self.assertEqual(lua_trusts, lua_records(trusts))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+"""Tests of the snapshot processing and change log of process_snapshots.py."""
+
+import os
+import tempfile
+import unittest
+from dataclasses import replace
+from pathlib import Path
+
+import synthetic_page
+import generate_information
+import process_snapshots
+from trust_ir import Category, TRUST_FIELDS
+
+
+class ProcessSnapshotsTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        trusts = list(synthetic_page.load_trusts().items())
+        names = [name for name, _ in trusts]
+        first = dict(trusts[:8])
+
+        # Drop one trust, add another and change the job of a third
+        second = dict(trusts[1:9])
+        second[names[2]] = replace(second[names[2]], job=first[names[3]].job)
+        # Shorten the acquisition of a fourth and move it to another category
+        third = dict(second)
+        third[names[4]] = replace(third[names[4]], acquisition=third[names[4]].acquisition[:1])
+
+        cls.pages = [
+            synthetic_page.render_page([Category('Tank', names[:3]), Category('Healer', names[3:8])], first),
+            synthetic_page.render_page([Category('Tank', names[1:4]), Category('Healer', names[4:9])], second),
+            synthetic_page.render_page([Category('Tank', names[1:5]), Category('Healer', names[5:9])], third),
+            synthetic_page.render_page([Category('Tank', names[1:5]), Category('Healer', names[5:9])], third)
+        ]
+        cls.names = names
+
+    def setUp(self):
+        temporary = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary.cleanup)
+        self.directory = Path(temporary.name)
+        self.paths = []
+        for i, page in enumerate(self.pages):
+            path = self.directory / 'snapshots' / f'2026-01-0{i + 1}.html'
+            path.parent.mkdir(exist_ok=True)
+            path.write_text(page, encoding='utf-8')
+            # Outputs are stamped with the modification time of their snapshot
+            os.utime(path, (1767225600 + i * 86400,) * 2)
+            self.paths.append(path)
+
+    def read_outputs(self, output_dir):
+        return {str(path.relative_to(output_dir)): path.read_bytes()
+                for path in sorted(output_dir.rglob('*')) if path.is_file()}
+
+    def test_jobs_give_the_same_output(self):
+        serial = process_snapshots.process_snapshots(self.paths, self.directory / 'serial', jobs=1)
+        pooled = process_snapshots.process_snapshots(self.paths, self.directory / 'pooled', jobs=2)
+        self.assertEqual(serial[0], pooled[0])
+        self.assertEqual(self.read_outputs(self.directory / 'serial'), self.read_outputs(self.directory / 'pooled'))
+        self.assertEqual(len(self.read_outputs(self.directory / 'serial')), 2 * len(self.paths))
+        # The first snapshot is parsed in full, then only the changed, added and no longer last tables
+        self.assertEqual(serial[1:], (5 + 7 + 8, 8 + 3 + 1))
+
+    def test_change_log(self):
+        summaries, _, _ = process_snapshots.process_snapshots(self.paths, self.directory / 'output')
+        change_log = process_snapshots.build_change_log(summaries)
+
+        # The same changes, from the records parsed without the table cache
+        records = [{name: trust.to_dict() for name, trust in
+                    generate_information.parse_html_content_from_string(page).items()} for page in self.pages]
+        expected = []
+        for i, (old, new) in enumerate(zip(records, records[1:])):
+            change = {
+                'from': f'2026-01-0{i + 1}',
+                'to': f'2026-01-0{i + 2}',
+                'added': [name for name in new if name not in old],
+                'removed': [name for name in old if name not in new],
+                'modified': {name: [field for field in TRUST_FIELDS if old[name].get(field) != record.get(field)]
+                             for name, record in new.items() if name in old and old[name] != record}
+            }
+            change = {key: value for key, value in change.items() if value}
+            if len(change) > 2:
+                expected.append(change)
+
+        names = self.names
+        self.assertEqual(expected[0], {'from': '2026-01-01', 'to': '2026-01-02', 'added': [names[8]],
+                                       'removed': [names[0]], 'modified': {names[2]: ['job']}})
+        self.assertEqual(expected[1], {'from': '2026-01-02', 'to': '2026-01-03', 'modified': {names[4]: ['acquisition']}})
+        self.assertEqual(change_log['snapshots'], ['2026-01-01', '2026-01-02', '2026-01-03', '2026-01-04'])
+        # Nothing changed in the last snapshot, so it has no entry
+        self.assertEqual([{key: value for key, value in change.items() if key != 'categories'}
+                          for change in change_log['changes']], expected)
+        self.assertEqual(change_log['changes'][0]['categories'], {
+            'Tank': {'added': [names[3]], 'removed': [names[0]]},
+            'Healer': {'added': [names[8]], 'removed': [names[3]]}
+        })
+        self.assertEqual(change_log['changes'][1]['categories'], {
+            'Tank': {'added': [names[4]]},
+            'Healer': {'removed': [names[4]]}
+        })
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+"""Tests of the skillchain index of skillchain_index.py."""
+
+import io
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+import skillchain_index
+from tests.test_lua_format import read_lua_chunk
+from trust_ir import Trust, Line, TextRun, Link, SkillchainIcon
+
+NAMES = ['Fusion', 'Compression', 'Scission', 'Detonation', skillchain_index.NO_SKILLCHAIN]
+
+
+def weapon_skill(name, *properties):
+    return [Link(name, f'https://www.bg-wiki.com/ffxi/{name}')] + [SkillchainIcon(prop) for prop in properties]
+
+
+def trust(name, *entries):
+    items = []
+    for entry in entries:
+        items += ([TextRun(', ')] if items else []) + entry
+    return Trust(name, weapon_skills=[Line(items)])
+
+
+class SkillchainIndexTest(unittest.TestCase):
+    def test_no_weapon_skills(self):
+        trusts = {'Moogle': Trust('Moogle', weapon_skills=[Line([TextRun('None')])])}
+        self.assertEqual(skillchain_index.parse_weapon_skills(trusts['Moogle'].weapon_skills), [])
+        index, warnings = skillchain_index.build_skillchain_index(trusts, NAMES)
+        self.assertEqual((index['weaponSkills'], index['trusts'], warnings), ({}, {}, []))
+
+    def test_punctuation(self):
+        lines = [Line([TextRun('Neutral: Dragonfall. ('), Link('25', 'https://www.bg-wiki.com/ffxi/25'),
+                       TextRun(')')]),
+                 Line([Link('Tachi: Jinpu,', 'https://www.bg-wiki.com/ffxi/Tachi:_Jinpu'), SkillchainIcon('Scission')])]
+        self.assertEqual(skillchain_index.parse_weapon_skills(lines), [('Dragonfall', []), ('Tachi: Jinpu', [])])
+
+    def test_conflicting_properties(self):
+        trusts = {
+            'Ayame': trust('Ayame', weapon_skill('Tachi: Jinpu', 'Scission', 'Detonation'),
+                           weapon_skill('Tachi: Kasha', 'Fusion', 'Compression')),
+            'Ayame (UC)': trust('Ayame (UC)', weapon_skill('Tachi: Jinpu', 'Scission'),
+                                weapon_skill('Tachi: Kasha', 'Fusion', 'Compression')),
+            'Noillurie': trust('Noillurie', weapon_skill('Tachi: Jinpu', 'Scission', 'Detonation')),
+        }
+        index, warnings = skillchain_index.build_skillchain_index(trusts, NAMES)
+        self.assertEqual(warnings, [])
+        self.assertEqual(index['weaponSkills'], {'Tachi: Kasha': ['Fusion', 'Compression']})
+        self.assertEqual(index['trustWeaponSkills'], {
+            'Ayame': {'Tachi: Jinpu': ['Scission', 'Detonation']},
+            'Ayame (UC)': {'Tachi: Jinpu': ['Scission']},
+            'Noillurie': {'Tachi: Jinpu': ['Scission', 'Detonation']},
+        })
+        self.assertEqual(index['elements']['Detonation'], ['Ayame', 'Noillurie'])
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / 'skillchainIndex.lua'
+            with redirect_stdout(io.StringIO()):
+                skillchain_index.generate_lua_file(index, path)
+            self.assertEqual(read_lua_chunk(path.read_text(encoding='utf-8')), index)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+"""Tests of the cached, conditional fetches of wiki_fetch.py against a local stand-in for the wiki."""
+
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import wiki_fetch
+
+ETAG = '"rev-1"'
+LAST_MODIFIED = 'Fri, 02 Jan 2026 15:08:57 GMT'
+# Several chunks, so a reader that stops early leaves most of the body unread
+BODY = ''.join(f'<p>Trust {i}: Kupipi, Shantotto and Ayame (UC) é</p>\n' for i in range(20000))
+
+
+class PageHandler(BaseHTTPRequestHandler):
+    """Serves BODY with validators, and a 304 to a request carrying either of them."""
+
+    def do_GET(self):
+        with self.server.lock:
+            self.server.requests.append((self.headers.get('If-None-Match'), self.headers.get('If-Modified-Since')))
+        if self.headers.get('If-None-Match') == ETAG or self.headers.get('If-Modified-Since') == LAST_MODIFIED:
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        data = BODY.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('ETag', ETAG)
+        self.send_header('Last-Modified', LAST_MODIFIED)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        try:
+            self.wfile.write(data)
+        except OSError:
+            # A client that stopped reading early
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+
+class CachedFetchTest(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), PageHandler)
+        self.server.daemon_threads = True
+        self.server.lock = threading.Lock()
+        self.server.requests = []
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+        temporary = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary.cleanup)
+        self.cache_dir = Path(temporary.name)
+        self.url = f'http://127.0.0.1:{self.server.server_port}/ffxi/Category:Trust'
+        self.policy = wiki_fetch.FetchPolicy(retries=0, read_timeout=5)
+
+    def test_fetch_page(self):
+        first = wiki_fetch.fetch_page(self.url, self.cache_dir, self.policy)
+        self.assertEqual((first.content, first.not_modified), (BODY, False))
+        meta = wiki_fetch.load_cache_meta(self.url, self.cache_dir)
+        self.assertEqual((meta['etag'], meta['last_modified']), (ETAG, LAST_MODIFIED))
+
+        second = wiki_fetch.fetch_page(self.url, self.cache_dir, self.policy)
+        self.assertEqual((second.content, second.not_modified), (BODY, True))
+        self.assertEqual(second.stored_at, meta['stored_at'])
+        self.assertEqual(self.server.requests, [(None, None), (ETAG, LAST_MODIFIED)])
+
+    def test_no_cache(self):
+        wiki_fetch.fetch_page(self.url, None, self.policy)
+        page = wiki_fetch.fetch_page(self.url, None, self.policy)
+        self.assertFalse(page.not_modified)
+        self.assertEqual(self.server.requests, [(None, None), (None, None)])
+        self.assertEqual(list(self.cache_dir.iterdir()), [])
+
+    def test_open_page(self):
+        with wiki_fetch.open_page(self.url, self.cache_dir, self.policy) as stream:
+            self.assertEqual(''.join(stream), BODY)
+        with wiki_fetch.open_page(self.url, self.cache_dir, self.policy) as stream:
+            self.assertTrue(stream.not_modified)
+            self.assertEqual(''.join(stream), BODY)
+        # The revalidated body also serves a full fetch
+        self.assertEqual(wiki_fetch.fetch_page(self.url, self.cache_dir, self.policy).content, BODY)
+        self.assertEqual(self.server.requests[1:], [(ETAG, LAST_MODIFIED)] * 2)
+
+    def test_stream_left_early(self):
+        with wiki_fetch.open_page(self.url, self.cache_dir, self.policy) as stream:
+            next(iter(stream))
+        # An unfinished body is not stored, so the next request cannot be conditional
+        self.assertIsNone(wiki_fetch.load_cache_meta(self.url, self.cache_dir))
+        self.assertEqual(sorted(path.name for path in self.cache_dir.iterdir()), [])
+
+        with wiki_fetch.open_page(self.url, self.cache_dir, self.policy) as stream:
+            start = next(iter(stream))
+            stream.drain()
+        self.assertTrue(BODY.startswith(start))
+        page = wiki_fetch.fetch_page(self.url, self.cache_dir, self.policy)
+        self.assertEqual((page.content, page.not_modified), (BODY, True))
+        self.assertEqual(self.server.requests, [(None, None), (None, None), (ETAG, LAST_MODIFIED)])
+
+
+if __name__ == '__main__':
+    unittest.main()
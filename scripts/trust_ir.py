@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Typed intermediate representation shared by generate_information.py and generate_categories.py.
+The parsers build these slotted records instead of dicts, and every output format is serialized
+from them: plain JSON dicts, the compact schema and the Lua tables of the data files.
+"""
+
+from dataclasses import dataclass, field, replace
+
+from lua_format import lua_index, lua_key, lua_string, lua_value
+
+# Fields of a trust record, in output order
+TRUST_FIELDS = ('job', 'spells', 'abilities', 'weapon_skills', 'acquisition', 'special_features')
+ITEM_TYPES = ('text', 'link', 'skillchain')
+URL_PREFIX = 'https://www.bg-wiki.com/ffxi/'
+
+
+def intern(table, value):
+    """Return the 1-based reference of value in a compact string table, adding it if needed."""
+    ref = table.get(value)
+    if ref is None:
+        ref = table[value] = len(table) + 1
+    return ref
+
+
+class Item:
+    """Base of the line items, type is the 'type' of their JSON form."""
+    __slots__ = ()
+    type = None
+
+    def to_lua(self):
+        """Lua table constructor with the same keys as to_dict()."""
+        return '{ ' + ', '.join(f'{key} = {lua_value(value)}' for key, value in self.to_dict().items()) + ' }'
+
+
+@dataclass(slots=True)
+class TextRun(Item):
+    """Plain text. words, widths and width are the render runs added by add_render_runs."""
+    value: str
+    words: list = None
+    widths: list = None
+    width: int = None
+    type = 'text'
+
+    def to_dict(self):
+        data = {'type': self.type, 'value': self.value}
+        if self.words is not None:
+            data.update(words=self.words, widths=self.widths, width=self.width)
+        return data
+
+    def to_compact(self, strings, urls):
+        return [ITEM_TYPES.index(self.type) + 1, intern(strings, self.value)]
+
+
+@dataclass(slots=True)
+class Link(Item):
+    """A link to a wiki page, width is the render run added by add_render_runs."""
+    text: str
+    url: str
+    width: int = None
+    type = 'link'
+
+    def to_dict(self):
+        data = {'type': self.type, 'text': self.text, 'url': self.url}
+        if self.width is not None:
+            data['width'] = self.width
+        return data
+
+    def to_compact(self, strings, urls):
+        url = self.url[len(URL_PREFIX):] if self.url.startswith(URL_PREFIX) else self.url
+        return [ITEM_TYPES.index(self.type) + 1, intern(strings, self.text), intern(urls, url)]
+
+
+@dataclass(slots=True)
+class SkillchainIcon(Item):
+    """A skillchain element icon, value is the element name or 'Status_Ability' for none."""
+    value: str
+    type = 'skillchain'
+
+    def to_dict(self):
+        return {'type': self.type, 'value': self.value}
+
+    def to_compact(self, strings, urls):
+        return [ITEM_TYPES.index(self.type) + 1, intern(strings, self.value)]
+
+
+ITEM_CLASSES = {item_class.type: item_class for item_class in (TextRun, Link, SkillchainIcon)}
+
+
+def item_from_dict(data):
+    """Build an item from its to_dict() form."""
+    item_class = ITEM_CLASSES[data['type']]
+    if item_class is Link:
+        return Link(data['text'], data['url'], data.get('width'))
+    if item_class is TextRun:
+        return TextRun(data['value'], data.get('words'), data.get('widths'), data.get('width'))
+    return SkillchainIcon(data['value'])
+
+
+def item_from_compact(item, item_types, strings, urls, url_prefix):
+    """Build an item from its to_compact() form and the tables of a compact document."""
+    item_class = ITEM_CLASSES[item_types[item[0] - 1]]
+    if item_class is Link:
+        url = urls[item[2] - 1]
+        if '://' not in url:
+            url = url_prefix + url
+        return Link(strings[item[1] - 1], url)
+    return item_class(strings[item[1] - 1])
+
+
+class Line(list):
+    """The items of one line of a field. A plain list underneath, so it costs nothing over one."""
+    __slots__ = ()
+
+
+@dataclass(slots=True)
+class Trust:
+    """
+    A trust record. Every field of TRUST_FIELDS is a list of Lines or None when the wiki has nothing,
+    details holds the linked pages merged in by crawl_details.py.
+    """
+    name: str
+    job: list = None
+    spells: list = None
+    abilities: list = None
+    weapon_skills: list = None
+    acquisition: list = None
+    special_features: list = None
+    details: dict = None
+
+    def fields(self):
+        """Yield (field, lines) for the non-empty fields, in TRUST_FIELDS order."""
+        for field_name in TRUST_FIELDS:
+            lines = getattr(self, field_name)
+            if lines:
+                yield field_name, lines
+
+    def map_items(self, function):
+        """Return a copy where every item is replaced by function(item)."""
+        return replace(self, **{field_name: [Line(function(item) for item in line) for line in lines]
+                                for field_name, lines in self.fields()})
+
+    def to_dict(self):
+        data = {'name': self.name}
+        for field_name in TRUST_FIELDS:
+            lines = getattr(self, field_name)
+            data[field_name] = [[item.to_dict() for item in line] for line in lines] if lines else None
+        if self.details:
+            data['details'] = self.details
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        trust = cls(data['name'], details=data.get('details') or None)
+        for field_name in TRUST_FIELDS:
+            lines = data.get(field_name)
+            if lines:
+                setattr(trust, field_name, [Line(item_from_dict(item) for item in line) for line in lines])
+        return trust
+
+    def to_compact(self, strings, urls):
+        """Compact record: the name is the key so it is dropped, and so is every empty field."""
+        record = {field_name: [[item.to_compact(strings, urls) for item in line] for line in lines]
+                  for field_name, lines in self.fields()}
+        if self.details:
+            record['details'] = self.details
+        return record
+
+    @classmethod
+    def from_compact(cls, name, record, item_types, strings, urls, url_prefix):
+        trust = cls(name, details=record.get('details') or None)
+        for field_name in TRUST_FIELDS:
+            lines = record.get(field_name)
+            if lines:
+                setattr(trust, field_name, [Line(item_from_compact(item, item_types, strings, urls, url_prefix)
+                                                 for item in line) for line in lines])
+        return trust
+
+    def to_lua(self):
+        """Return the lines of the [name] = { ... }, entry of trustInformation.lua, empty fields are omitted (nil)."""
+        lua_content = [f'    {lua_index(self.name)} = {{',
+                       f'        name = {lua_string(self.name)},']
+
+        for field_name, lines in self.fields():
+            lua_content.append(f'        {lua_key(field_name)} = {{')
+            for line in lines:
+                lua_content.append('            {')
+                for item in line:
+                    lua_content.append(f'                {item.to_lua()},')
+                lua_content.append('            },')
+            lua_content.append('        },')
+
+        if self.details:
+            lua_content.append('        details = {')
+            for url, page in self.details.items():
+                lua_content.append(f'            {lua_index(url)} = {lua_value(page)},')
+            lua_content.append('        },')
+
+        lua_content.append('    },')
+        return lua_content
+
+
+@dataclass(slots=True)
+class Category:
+    """A trust category and the names of its trusts, in page order."""
+    name: str
+    trusts: list = field(default_factory=list)
+
+    def to_lua(self):
+        """Return the lines of the ["name"] = { ... }, entry of trustCategories.lua."""
+        lua_content = [f'    ["{self.name}"] = {{']
+        for trust_name in self.trusts:
+            # Escape quotes in trust names
+            escaped_name = trust_name.replace('"', '\\"')
+            lua_content.append(f'        "{escaped_name}",')
+        lua_content.append('    },')
+        return lua_content
@@ -0,0 +1,611 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP layer for the data generation scripts.
+Keeps an on-disk cache of wiki responses keyed by URL and revalidates it with
+conditional requests (If-None-Match / If-Modified-Since), so an unchanged page
+is neither downloaded nor parsed again.
+open_page streams the body in chunks for callers that parse it while it downloads.
+Every request follows a FetchPolicy: separate connect and read timeouts, bounded retries with
+exponential backoff and an optional hedged second request, with the timing of each attempt recorded.
+"""
+
+import codecs
+import gzip
+import hashlib
+import json
+import os
+import queue
+import random
+import threading
+import time
+import urllib.request
+import urllib.error
+import zlib
+import http.client
+from dataclasses import dataclass, field
+from pathlib import Path
+
+WIKI_URL = "https://www.bg-wiki.com/ffxi/Category:Trust"
+CACHE_DIR = Path(__file__).parent / '.cache'
+USER_AGENT = 'trustme-data-generator (+https://github.com/loonsies/trustme)'
+TIMEOUT = 30
+CONNECT_TIMEOUT = 10
+RETRIES = 3
+BACKOFF = 1.0
+MAX_BACKOFF = 30.0
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+CHUNK_SIZE = 64 * 1024
+PREFETCH_CHUNKS = 16
+
+
+@dataclass
+class Page:
+    """A fetched page, either fresh from the server or revalidated from the cache."""
+    url: str
+    content: str
+    not_modified: bool = False
+    stored_at: float = 0.0
+    attempts: list = field(default_factory=list)
+
+
+@dataclass
+class FetchPolicy:
+    """
+    How a page is requested. connect_timeout bounds opening the connection and read_timeout every
+    wait for data after that. A timeout, connection error or RETRY_STATUSES response is retried up
+    to retries times, after backoff seconds doubling each time, capped at max_backoff and with up to
+    a jitter fraction taken off at random so clients do not retry in lockstep. A Retry-After header
+    is honored up to max_backoff. With hedge_after set, an attempt that has not completed after that
+    many seconds is raced by a second identical request, and whichever succeeds first is used.
+    """
+    connect_timeout: float = CONNECT_TIMEOUT
+    read_timeout: float = TIMEOUT
+    retries: int = RETRIES
+    backoff: float = BACKOFF
+    max_backoff: float = MAX_BACKOFF
+    jitter: float = 0.5
+    hedge_after: float = None
+
+    def delay(self, retry, retry_after=None):
+        """Seconds to wait before the given retry, counting from 1."""
+        delay = min(self.max_backoff, self.backoff * 2 ** (retry - 1)) * (1 - random.uniform(0, self.jitter))
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_backoff))
+        return delay
+
+    def opener(self):
+        """Return a URL opener that switches every connection to read_timeout once it is open."""
+        return urllib.request.build_opener(TimeoutHTTPHandler(self.read_timeout),
+                                           TimeoutHTTPSHandler(self.read_timeout))
+
+
+@dataclass
+class Attempt:
+    """Timing of one request: when it started after the first one, how long it took and how it ended."""
+    number: int
+    hedged: bool
+    started: float
+    elapsed: float = None
+    outcome: str = None
+
+    def __str__(self):
+        label = f"attempt {self.number}{' (hedged)' if self.hedged else ''}"
+        return f"{label} at +{self.started:.2f}s: {self.outcome} after {self.elapsed:.2f}s"
+
+
+class FetchError(urllib.error.URLError):
+    """Every attempt at a request failed, error is the last failure and attempts their timing."""
+
+    def __init__(self, error, attempts):
+        super().__init__(f"{describe_error(error)} after {len(attempts)} attempts")
+        self.error = error
+        self.attempts = attempts
+
+
+def timeout_connection(connection_class, read_timeout):
+    """Subclass an http.client connection to use read_timeout on its socket once connected."""
+    class TimeoutConnection(connection_class):
+        def connect(self):
+            super().connect()
+            self.sock.settimeout(read_timeout)
+
+    return TimeoutConnection
+
+
+class TimeoutHTTPHandler(urllib.request.HTTPHandler):
+    """HTTP handler whose connections are opened with the request timeout and read with read_timeout."""
+
+    def __init__(self, read_timeout):
+        super().__init__()
+        self.connection_class = timeout_connection(http.client.HTTPConnection, read_timeout)
+
+    def http_open(self, request):
+        return self.do_open(self.connection_class, request)
+
+
+class TimeoutHTTPSHandler(urllib.request.HTTPSHandler):
+    """HTTPS counterpart of TimeoutHTTPHandler, the TLS handshake is part of connecting."""
+
+    def __init__(self, read_timeout):
+        super().__init__()
+        self.connection_class = timeout_connection(http.client.HTTPSConnection, read_timeout)
+
+    def https_open(self, request):
+        return self.do_open(self.connection_class, request, context=self._context)
+
+
+def describe_error(error):
+    """Short outcome of a failed attempt for the attempt log."""
+    if isinstance(error, urllib.error.HTTPError):
+        return f"HTTP {error.code}"
+    reason = error.reason if isinstance(error, urllib.error.URLError) else error
+    if isinstance(reason, TimeoutError):
+        return 'timeout'
+    return f"{type(reason).__name__}: {reason}" if str(reason) else type(reason).__name__
+
+
+def is_retryable(error):
+    """True for the failures a new attempt may not hit: timeouts, connection errors and RETRY_STATUSES."""
+    if isinstance(error, urllib.error.HTTPError):
+        return error.code in RETRY_STATUSES
+    return isinstance(error, (OSError, http.client.HTTPException, EOFError))
+
+
+def retry_after(error):
+    """Seconds asked for by the Retry-After header of an HTTP error, if any."""
+    if isinstance(error, urllib.error.HTTPError) and error.headers:
+        value = error.headers.get('Retry-After', '')
+        if value.strip().isdigit():
+            return float(value)
+    return None
+
+
+def run_hedged(attempt, policy, attempts, start, discard):
+    """
+    Run attempt() once, racing it with a second call if it has not completed after policy.hedge_after.
+    Returns the first successful result. If every call fails, raises the most significant error:
+    a non-retryable one as soon as it arrives, otherwise the last one. discard(result) is called from a
+    background thread on the result of a call that finishes after the race is decided.
+    """
+    results = queue.Queue()
+    running = []
+
+    def run(record):
+        try:
+            results.put((record, attempt(), None, time.perf_counter()))
+        except Exception as e:
+            results.put((record, None, e, time.perf_counter()))
+
+    def launch(hedged):
+        record = Attempt(len(attempts) + 1, hedged, time.perf_counter() - start)
+        attempts.append(record)
+        running.append(record)
+        threading.Thread(target=run, args=(record,), daemon=True).start()
+
+    def abandon():
+        """Leave the calls still running to finish in the background."""
+        now = time.perf_counter() - start
+        for record in running:
+            record.elapsed = now - record.started
+            record.outcome = 'abandoned'
+        if running:
+            threading.Thread(target=drain, args=(results, len(running), discard), daemon=True).start()
+
+    launch(False)
+    hedge_pending = policy.hedge_after is not None
+    error = None
+    while running:
+        try:
+            record, result, e, finished = results.get(timeout=policy.hedge_after if hedge_pending else None)
+        except queue.Empty:
+            hedge_pending = False
+            launch(True)
+            continue
+
+        running.remove(record)
+        record.elapsed = finished - start - record.started
+        if e is None:
+            record.outcome = 'ok'
+            abandon()
+            return result
+
+        record.outcome = describe_error(e)
+        error = e
+        if not is_retryable(e):
+            abandon()
+            break
+        # A failure before the hedge threshold is retried rather than hedged
+        hedge_pending = False
+
+    raise error
+
+
+def drain(results, count, discard):
+    """Collect the results of abandoned calls and release them."""
+    for _ in range(count):
+        _, result, _, _ = results.get()
+        if result is not None and discard:
+            discard(result)
+
+
+def request_with_policy(attempt, policy):
+    """
+    Call attempt() under a FetchPolicy, returning (result, attempts) with the timing of every attempt.
+    A non-retryable error is raised as is with the attempts attached to it, and FetchError once the
+    retries are used up. Results of hedged calls that lose the race are closed if they can be.
+    """
+    attempts = []
+    start = time.perf_counter()
+    for retry in range(policy.retries + 1):
+        if retry:
+            time.sleep(policy.delay(retry, retry_after(error)))
+        try:
+            return run_hedged(attempt, policy, attempts, start, close_result), attempts
+        except Exception as e:
+            if not is_retryable(e):
+                e.attempts = attempts
+                raise
+            error = e
+
+    raise FetchError(error, attempts) from error
+
+
+def close_result(result):
+    """Close a result that holds a response, the loser of a hedged race."""
+    close = getattr(result, 'close', None)
+    if close:
+        close()
+
+
+def report_attempts(attempts):
+    """Print the attempt log of a request that needed more than one attempt."""
+    if len(attempts) > 1:
+        print(f"Request took {len(attempts)} attempts:")
+        for attempt in attempts:
+            print(f"  {attempt}")
+
+
+def add_fetch_arguments(parser):
+    """Add the command line options shared by every script that downloads the wiki page."""
+    parser.add_argument('--url', default=WIKI_URL,
+                        help='page to download (default: %(default)s)')
+    parser.add_argument('--cache-dir', type=Path, default=CACHE_DIR,
+                        help='directory for the HTTP response cache (default: scripts/.cache)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='always download the full page and do not touch the cache')
+    parser.add_argument('--force', action='store_true',
+                        help='regenerate outputs even if the page has not changed')
+    parser.add_argument('--stream', action='store_true',
+                        help='parse the page while it downloads instead of holding all of it in memory')
+    add_policy_arguments(parser)
+
+
+def add_policy_arguments(parser):
+    """Add the command line options of the FetchPolicy, read back by policy_args."""
+    parser.add_argument('--timeout', type=float, default=TIMEOUT,
+                        help='seconds to wait for data from the server before retrying (default: %(default)s)')
+    parser.add_argument('--connect-timeout', type=float, default=CONNECT_TIMEOUT,
+                        help='seconds to wait for a connection before retrying (default: %(default)s)')
+    parser.add_argument('--retries', type=int, default=RETRIES,
+                        help='retries after a timeout, a connection error or a 429/5xx (default: %(default)s)')
+    parser.add_argument('--hedge-after', type=float, metavar='SECONDS',
+                        help='send a second request if the first one has not completed after SECONDS, '
+                             'the full download or, with --stream, the response headers')
+
+
+def policy_args(args):
+    """Build the FetchPolicy described by the options from add_policy_arguments."""
+    return FetchPolicy(connect_timeout=args.connect_timeout, read_timeout=args.timeout, retries=args.retries,
+                       hedge_after=args.hedge_after)
+
+
+def fetch_args(args):
+    """Fetch the page described by the options from add_fetch_arguments, reporting any retries."""
+    try:
+        page = fetch_page(args.url, cache_dir=None if args.no_cache else args.cache_dir, policy=policy_args(args))
+    except FetchError as e:
+        report_attempts(e.attempts)
+        raise
+    report_attempts(page.attempts)
+    return page
+
+
+def open_args(args):
+    """Open a streamed download of the page described by the options from add_fetch_arguments, reporting any retries."""
+    try:
+        stream = open_page(args.url, cache_dir=None if args.no_cache else args.cache_dir, policy=policy_args(args))
+    except FetchError as e:
+        report_attempts(e.attempts)
+        raise
+    report_attempts(stream.attempts)
+    return stream
+
+
+def cache_paths(url, cache_dir):
+    """Return the (metadata, body) cache file paths for a URL."""
+    key = hashlib.sha256(url.encode('utf-8')).hexdigest()[:32]
+    return cache_dir / f'{key}.json', cache_dir / f'{key}.html'
+
+
+def load_cache_meta(url, cache_dir):
+    """Load the cached metadata for a URL, or None if there is no usable entry."""
+    meta_path, body_path = cache_paths(url, cache_dir)
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if meta.get('url') != url or not body_path.exists():
+        return None
+
+    return meta
+
+
+def load_cache_entry(url, cache_dir):
+    """Load the cached metadata and body for a URL, or None if there is no usable entry."""
+    meta = load_cache_meta(url, cache_dir)
+    if meta is None:
+        return None
+
+    _, body_path = cache_paths(url, cache_dir)
+    try:
+        with open(body_path, 'r', encoding='utf-8') as f:
+            body = f.read()
+    except OSError:
+        return None
+
+    return meta, body
+
+
+def store_cache_entry(url, cache_dir, headers, body):
+    """Write the body and its validators to the cache, atomically replacing any previous entry."""
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    _, body_path = cache_paths(url, cache_dir)
+
+    tmp_path = body_path.with_suffix(body_path.suffix + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(body)
+    os.replace(tmp_path, body_path)
+
+    return store_cache_meta(url, cache_dir, headers)
+
+
+def store_cache_meta(url, cache_dir, headers):
+    """Write the validators of a cached body, once the body itself is in place."""
+    meta_path, _ = cache_paths(url, cache_dir)
+    meta = {
+        'url': url,
+        'etag': headers.get('ETag'),
+        'last_modified': headers.get('Last-Modified'),
+        'stored_at': time.time()
+    }
+
+    tmp_path = meta_path.with_suffix(meta_path.suffix + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(json.dumps(meta, indent=2))
+    os.replace(tmp_path, meta_path)
+
+    return meta
+
+
+def read_body(response):
+    """Read and decode a response body, handling gzip transfer compression."""
+    data = response.read()
+    if response.headers.get('Content-Encoding', '').lower() == 'gzip':
+        data = gzip.decompress(data)
+    charset = response.headers.get_content_charset() or 'utf-8'
+    return data.decode(charset)
+
+
+def build_request(url, meta):
+    """Build the GET request for a URL, conditional on the validators of a cached entry."""
+    request = urllib.request.Request(url, headers={
+        'User-Agent': USER_AGENT,
+        'Accept-Encoding': 'gzip'
+    })
+
+    if meta:
+        if meta.get('etag'):
+            request.add_header('If-None-Match', meta['etag'])
+        if meta.get('last_modified'):
+            request.add_header('If-Modified-Since', meta['last_modified'])
+
+    return request
+
+
+def fetch_page(url, cache_dir=CACHE_DIR, policy=None):
+    """
+    Download a page, revalidating any cached copy with a conditional request.
+    Pass cache_dir=None to bypass the cache entirely. An attempt covers the whole download,
+    so a body that stalls or breaks off is requested again.
+    """
+    policy = policy or FetchPolicy()
+    opener = policy.opener()
+    cached = load_cache_entry(url, cache_dir) if cache_dir else None
+
+    def attempt():
+        # Every attempt gets its own request, a hedged one runs at the same time
+        request = build_request(url, cached[0] if cached else None)
+        with opener.open(request, timeout=policy.connect_timeout) as response:
+            return read_body(response), response.headers
+
+    try:
+        (content, headers), attempts = request_with_policy(attempt, policy)
+    except urllib.error.HTTPError as e:
+        if e.code == 304 and cached:
+            meta, body = cached
+            return Page(url, body, not_modified=True, stored_at=meta.get('stored_at', 0.0),
+                        attempts=getattr(e, 'attempts', []))
+        raise
+
+    stored_at = time.time()
+    if cache_dir:
+        stored_at = store_cache_entry(url, cache_dir, headers, content)['stored_at']
+
+    return Page(url, content, stored_at=stored_at, attempts=attempts)
+
+
+class PageStream:
+    """
+    A page download read incrementally, either from the server or from the cached copy.
+    Iterating yields decoded text chunks. A background thread keeps reading the socket,
+    up to PREFETCH_CHUNKS chunks ahead, so parsing overlaps with the transfer.
+    A fresh body is written to the cache as it arrives and committed only once it is complete.
+    """
+
+    def __init__(self, url, response=None, cache_dir=None, cached_body=None, not_modified=False, stored_at=0.0,
+                 attempts=None):
+        self.url = url
+        self.response = response
+        self.cache_dir = cache_dir
+        self.cached_body = cached_body
+        self.not_modified = not_modified
+        self.stored_at = stored_at
+        self.attempts = attempts or []
+        self.stop = threading.Event()
+        self.chunks = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Stop the download, an unfinished body is not stored in the cache."""
+        self.stop.set()
+        if self.response:
+            self.response.close()
+        # Runs the cleanup of a body left unfinished now, instead of whenever the generator is collected
+        if self.chunks is not None:
+            self.chunks.close()
+
+    def __iter__(self):
+        # One iterator per stream, so reading can stop and pick up again where it left off
+        if self.chunks is None:
+            self.chunks = self.read_cached() if self.not_modified else self.read_response()
+        return self.chunks
+
+    def drain(self):
+        """Read the rest of a fresh body, so a page that was only parsed in part is still stored in the cache."""
+        if self.cache_dir and not self.not_modified:
+            for _ in self:
+                pass
+
+    def read_cached(self):
+        with open(self.cached_body, 'r', encoding='utf-8') as f:
+            while not self.stop.is_set():
+                text = f.read(CHUNK_SIZE)
+                if not text:
+                    break
+                yield text
+
+    def read_raw(self, chunks):
+        """Reader thread: push raw body chunks, then None, or the exception that stopped the read."""
+        try:
+            while not self.stop.is_set():
+                data = self.response.read(CHUNK_SIZE)
+                while not self.stop.is_set():
+                    try:
+                        chunks.put(data, timeout=0.1)
+                        break
+                    except queue.Full:
+                        pass
+                if not data:
+                    return
+        except Exception as e:
+            chunks.put(e)
+
+    def read_response(self):
+        chunks = queue.Queue(maxsize=PREFETCH_CHUNKS)
+        reader = threading.Thread(target=self.read_raw, args=(chunks,), daemon=True)
+        reader.start()
+
+        headers = self.response.headers
+        decompressor = None
+        if headers.get('Content-Encoding', '').lower() == 'gzip':
+            decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        decoder = codecs.getincrementaldecoder(headers.get_content_charset() or 'utf-8')()
+
+        body = None
+        tmp_path = None
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            _, body_path = cache_paths(self.url, self.cache_dir)
+            tmp_path = body_path.with_suffix(body_path.suffix + '.tmp')
+            body = open(tmp_path, 'w', encoding='utf-8')
+
+        try:
+            while True:
+                data = chunks.get()
+                if isinstance(data, Exception):
+                    raise data
+                if not data:
+                    break
+                if decompressor:
+                    data = decompressor.decompress(data)
+                text = decoder.decode(data)
+                if body:
+                    body.write(text)
+                if text:
+                    yield text
+
+            text = decoder.decode(decompressor.flush() if decompressor else b'', final=True)
+            if body:
+                body.write(text)
+            if text:
+                yield text
+
+            if body:
+                body.close()
+                os.replace(tmp_path, body_path)
+                body = None
+                self.stored_at = store_cache_meta(self.url, self.cache_dir, headers)['stored_at']
+            else:
+                self.stored_at = time.time()
+        finally:
+            self.stop.set()
+            self.response.close()
+            if body:
+                body.close()
+                os.remove(tmp_path)
+
+
+def open_page(url, cache_dir=CACHE_DIR, policy=None):
+    """
+    Start downloading a page and return a PageStream over its body, revalidating any cached
+    copy with a conditional request. Pass cache_dir=None to bypass the cache entirely.
+    Only opening the response is retried, once the body is being parsed a failure is final.
+    """
+    policy = policy or FetchPolicy()
+    opener = policy.opener()
+    # Only the validators are loaded, a cached body is read in chunks if the server reports no change
+    meta = load_cache_meta(url, cache_dir) if cache_dir else None
+
+    def attempt():
+        return opener.open(build_request(url, meta), timeout=policy.connect_timeout)
+
+    try:
+        response, attempts = request_with_policy(attempt, policy)
+    except urllib.error.HTTPError as e:
+        if e.code == 304 and meta:
+            _, body_path = cache_paths(url, cache_dir)
+            return PageStream(url, cached_body=body_path, not_modified=True, stored_at=meta.get('stored_at', 0.0),
+                              attempts=getattr(e, 'attempts', []))
+        raise
+
+    return PageStream(url, response=response, cache_dir=cache_dir, attempts=attempts)
+
+
+def is_up_to_date(page, *output_paths):
+    """True if the server reported no change and every output was generated from the cached copy."""
+    if not page.not_modified:
+        return False
+
+    for path in output_paths:
+        path = Path(path)
+        if not path.exists() or path.stat().st_mtime < page.stored_at:
+            return False
+
+    return True
@@ -1,12 +1,16 @@
 local settings = require('settings')
 local profiles = require('src.profiles')
+local information = require('src.information')
 
 local config = {}
 
 local default = T {
     profiles = {},
     lastProfileLoaded = nil,
-    favorites = {}
+    favorites = {},
+    -- Trust information window data: 'lua' loads the whole data/trustInformation.lua table at startup,
+    -- 'json' reads data/trustInformation.json one trust at a time when it is first shown
+    informationSource = 'lua'
 }
 
 config.load = function ()
@@ -16,6 +20,7 @@ end
 config.init = function (cfg)
     tme.config = cfg
     tme.selectedProfile = tme.config.lastProfileLoaded or nil
+    information.load(tme.config.informationSource)
 
     if tme.selectedProfile then
         profiles.loadTrusts(tme.selectedProfile)
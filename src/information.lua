@@ -0,0 +1,152 @@
+local json = require('json')
+
+local information = {}
+
+-- Fields of a trust record, matches TRUST_FIELDS in scripts/generate_information.py
+local trustFields = { 'job', 'spells', 'abilities', 'weapon_skills', 'acquisition', 'special_features' }
+
+local trusts = {}
+local compact = nil
+local indexed = nil
+
+-- Expand one line of the compact schema (version 2) into the regular item tables
+local function expandLine(line)
+    local items = {}
+    for i, item in ipairs(line) do
+        local itemType = compact.metadata.item_types[item[1]]
+        if itemType == 'link' then
+            local url = compact.urls[item[3]]
+            if not url:find('://', 1, true) then
+                url = compact.metadata.url_prefix .. url
+            end
+            items[i] = { type = itemType, text = compact.strings[item[2]], url = url }
+        else
+            items[i] = { type = itemType, value = compact.strings[item[2]] }
+        end
+    end
+    return items
+end
+
+local function expandTrust(trustName, record)
+    local trust = { name = trustName }
+    for _, field in ipairs(trustFields) do
+        if record[field] then
+            local lines = {}
+            for i, line in ipairs(record[field]) do
+                lines[i] = expandLine(line)
+            end
+            trust[field] = lines
+        end
+    end
+    trust.details = record.details
+    return trust
+end
+
+-- source is the informationSource setting:
+-- 'lua' requires data/trustInformation.lua, the whole table at once, and falls back to the JSON when it is missing
+-- 'json' reads data/trustInformation.json in the layout it was generated with (--layout of the scripts)
+function information.load(source)
+    trusts = {}
+    compact = nil
+    indexed = nil
+
+    if source == 'lua' then
+        local ok, luaTrusts = pcall(require, 'data.trustInformation')
+        if ok and type(luaTrusts) == 'table' then
+            trusts = luaTrusts
+            return
+        end
+    end
+
+    local jsonPath = string.format('%s\\addons\\%s\\data\\trustInformation.json', AshitaCore:GetInstallPath(), addon.name)
+    local file = io.open(jsonPath, 'rb')
+    if not file then
+        return
+    end
+
+    -- The indexed layout (version 3) starts with a one-line header holding the byte offset index,
+    -- the compact layout (version 2) is a single line, and the pretty layout fails to decode here
+    local firstLine = file:read('*l') or ''
+    local ok, data = pcall(json.decode, firstLine)
+    if ok and type(data) == 'table' and data.metadata and data.metadata.version == 3 then
+        file:close()
+        indexed = { path = jsonPath, dataStart = #firstLine + 1, index = data.index or {} }
+        return
+    end
+
+    if not ok or type(data) ~= 'table' then
+        data = json.decode(firstLine .. '\n' .. (file:read('*all') or ''))
+    end
+    file:close()
+
+    if not data or not data.trusts then
+        return
+    end
+
+    -- Version 2 is the compact schema, trusts are expanded on first access
+    if data.metadata and data.metadata.version == 2 then
+        compact = data
+    else
+        trusts = data.trusts
+    end
+end
+
+-- Decode every record of the indexed layout, one per line after the header, without the byte offsets
+local function loadIndexedTrusts()
+    local file = io.open(indexed.path, 'rb')
+    indexed = nil
+    if not file then
+        return
+    end
+
+    file:read('*l')
+    for line in file:lines() do
+        -- A checkout that converted the line endings leaves a '\r' at the end of every record
+        local ok, record = pcall(json.decode, (line:gsub('\r$', '')))
+        if ok and type(record) == 'table' and record.name then
+            trusts[record.name] = record
+        end
+    end
+    file:close()
+end
+
+-- Read and decode a single trust record from the indexed layout
+local function readIndexedTrust(trustName)
+    local entry = indexed.index[trustName]
+    if not entry then
+        return nil
+    end
+
+    local file = io.open(indexed.path, 'rb')
+    if not file then
+        return nil
+    end
+
+    file:seek('set', indexed.dataStart + entry[1])
+    local record = file:read(entry[2])
+    file:close()
+
+    local ok, trust = pcall(json.decode, record or '')
+    if ok and type(trust) == 'table' and trust.name == trustName then
+        return trust
+    end
+
+    -- The offsets do not match the file, read all of it instead
+    loadIndexedTrusts()
+    return trusts[trustName]
+end
+
+function information.get(trustName)
+    local trust = trusts[trustName]
+    if trust == nil then
+        if compact and compact.trusts[trustName] then
+            trust = expandTrust(trustName, compact.trusts[trustName])
+        elseif indexed then
+            trust = readIndexedTrust(trustName)
+        end
+        trusts[trustName] = trust
+    end
+    return trust
+end
+
+return information
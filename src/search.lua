@@ -1,16 +1,96 @@
 local trustUtils = require('src.trustUtils')
 local searchStatus = require('data.searchStatus')
+local searchIndex = require('data.searchIndex')
+local trustIndex = require('data.trustIndex')
 
 local search = {}
 
-function search.updateSearch()
+-- Owned trusts come from walking the spell resources, keep them between keystrokes
+local ownedTrustsTTL = 5
+local ownedTrusts = nil
+local ownedTrustsTime = 0
+
+local function getOwnedTrusts(refresh)
+    if refresh or not ownedTrusts or os.clock() - ownedTrustsTime > ownedTrustsTTL then
+        ownedTrusts = trustUtils.getTrustNames(trustUtils.getTrusts())
+        ownedTrustsTime = os.clock()
+    end
+    return ownedTrusts
+end
+
+local function hasTerm(terms, query)
+    for _, term in ipairs(terms or {}) do
+        if string.find(term, query, 1, true) then
+            return true
+        end
+    end
+    return false
+end
+
+-- Set of the trust ids with a search term containing query
+local function findTrustIds(query)
+    local ids = {}
+
+    -- Only ASCII n-grams are indexed, anything else is checked term by term
+    if query:find('[\128-\255]') then
+        for trustId, terms in pairs(searchIndex.terms) do
+            if hasTerm(terms, query) then
+                ids[trustId] = true
+            end
+        end
+        return ids
+    end
+
+    -- Intersect the posting lists of every n-gram of the query, shortest list first
+    local size = math.min(3, #query)
+    local lists = {}
+    for i = 1, #query - size + 1 do
+        local postings = searchIndex.grams[query:sub(i, i + size - 1)]
+        if not postings then
+            return ids
+        end
+        table.insert(lists, postings)
+    end
+    table.sort(lists, function (a, b)
+        return #a < #b
+    end)
+
+    for _, trustId in ipairs(lists[1]) do
+        ids[trustId] = true
+    end
+    for i = 2, #lists do
+        local inList = {}
+        for _, trustId in ipairs(lists[i]) do
+            if ids[trustId] then
+                inList[trustId] = true
+            end
+        end
+        ids = inList
+    end
+
+    -- The n-grams of a longer query can come from different terms
+    if #query > size then
+        for trustId in pairs(ids) do
+            if not hasTerm(searchIndex.terms[trustId], query) then
+                ids[trustId] = nil
+            end
+        end
+    end
+
+    return ids
+end
+
+function search.updateSearch(refresh)
     tme.search.results = {}
-    local trusts = trustUtils.getTrusts()
-    local input = table.concat(tme.search.input)
+    local trusts = getOwnedTrusts(refresh)
+    local input = table.concat(tme.search.input):lower()
+    local ids = #input > 0 and findTrustIds(input) or nil
 
-    for id, trust in pairs(trusts) do
-        if #input == 0 or trust.Name[1] and (string.find(trust.Name[1]:lower(), input:lower(), 1, true)) then
-            table.insert(tme.search.results, trust.Name[1])
+    for _, trustName in ipairs(trusts) do
+        local trustId = trustIndex.ids[trustName:lower()]
+        -- Trusts missing from the index can still be found by name
+        if not ids or (trustId and ids[trustId]) or (not trustId and string.find(trustName:lower(), input, 1, true)) then
+            table.insert(tme.search.results, trustName)
         end
     end
 
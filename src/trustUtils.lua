@@ -1,6 +1,8 @@
 local chat = require('chat')
 local http = require('libs.nonBlockingRequests')
-local cipherData = require('data.cipherData')
+local trustData = require('data.trustData')
+local cipherIndex = require('data.cipherIndex')
+local trustIndex = require('data.trustIndex')
 
 local trustUtils = {}
 
@@ -107,31 +109,28 @@ function trustUtils.getTrustNames(t)
     return names
 end
 
+-- Ids of the owned trusts, names are matched case-insensitively through trustIndex
+function trustUtils.getOwnedTrustIds(ownedTrusts)
+    local ownedIds = {}
+    for _, ownedName in ipairs(ownedTrusts) do
+        local trustId = trustIndex.ids[ownedName:lower()]
+        if trustId then
+            ownedIds[trustId] = true
+        end
+    end
+    return ownedIds
+end
+
 function trustUtils.findMissingCiphers(ciphers, ownedTrusts)
     local missing = {}
+    local ownedIds = trustUtils.getOwnedTrustIds(ownedTrusts)
 
     for _, cipherName in ipairs(ciphers) do
-        local trustName = nil
-
-        for _, entry in pairs(cipherData) do
-            if entry.en and entry.en:lower() == cipherName:lower() then
-                trustName = entry.trust_en
-                break
-            end
-        end
-
-        if trustName then
-            local owned = false
-
-            for _, ownedName in ipairs(ownedTrusts) do
-                if ownedName:lower() == trustName:lower() then
-                    owned = true
-                    break
-                end
-            end
+        local trustId = cipherIndex.trustIds[cipherName:lower()]
 
-            if not owned then
-                table.insert(missing, { cipher = cipherName, name = trustName })
+        if trustId then
+            if not ownedIds[trustId] then
+                table.insert(missing, { cipher = cipherName, name = trustData[trustId].en })
             end
         else
             print(chat.header(addon.name):append(chat.error(string.format('Could not find corresponding trust name for %s', cipherName))))
@@ -143,27 +142,11 @@ end
 
 function trustUtils.findMissingTrusts(ownedTrusts, hideUC)
     local missing = {}
-    local trustData = require('data/trustData')
-
-    for _, entry in pairs(trustData) do
-        local trustName = nil
-        if entry.en then
-            trustName = entry.en
-        end
-
-        if trustName then
-            local owned = false
+    local ownedIds = trustUtils.getOwnedTrustIds(ownedTrusts)
 
-            for _, ownedName in ipairs(ownedTrusts) do
-                if ownedName:lower() == trustName:lower() then
-                    owned = true
-                    break
-                end
-            end
-
-            if not owned and (not hideUC or (hideUC and not string.find(trustName, '%(UC%)'))) then
-                table.insert(missing, trustName)
-            end
+    for trustId, entry in pairs(trustData) do
+        if entry.en and not ownedIds[trustId] and (not hideUC or not trustIndex.uc[trustId]) then
+            table.insert(missing, entry.en)
         end
     end
 
@@ -8,12 +8,15 @@ local profiles = require('src.profiles')
 local utils = require('src.utils')
 local searchStatus = require('data.searchStatus')
 local profileActions = require('data.profileActions')
-local trustCategories = require('data.trustCategories')
+local trustCategoryIndex = require('data.trustCategoryIndex')
 local categoryNames = require('data.categoryNames')
 local skillchainNames = require('data.skillchainNames')
+local skillchainIndex = require('data.skillchainIndex')
+local iconAtlas = require('data.iconAtlas')
+local trustAliases = require('data.trustAliases')
 local trustUtils = require('src.trustUtils')
 local ffi = require('ffi')
-local json = require('json')
+local information = require('src.information')
 
 local ui = {}
 local categoryIcons = {}
@@ -53,109 +56,87 @@ local categoryOrder = {
     'Unity Concord'
 }
 
--- Name mapping: in-game name -> wiki name (for info/category lookup)
-local nameMapping = {
-    ['AAEV'] = 'Ark Angel EV',
-    ['AAGK'] = 'Ark Angel GK',
-    ['AAHM'] = 'Ark Angel HM',
-    ['AAMR'] = 'Ark Angel MR',
-    ['AATT'] = 'Ark Angel TT',
-    ['D. Shantotto'] = 'Domina Shantotto'
-}
+-- Icons are regions of the atlas texture built by scripts/build_icon_atlas.py, one texture for all of them
+local atlasTexture = nil
 
--- Load trust information data
-local trustInformation = {}
-do
-    local jsonPath = string.format('%s\\addons\\%s\\data\\trustInformation.json', AshitaCore:GetInstallPath(), addon.name)
-    local file = io.open(jsonPath, 'r')
-    if file then
-        local content = file:read('*all')
-        file:close()
-        local data = json.decode(content)
-        if data and data.trusts then
-            trustInformation = data.trusts
-        end
+local function loadIconAtlas()
+    local atlasPath = string.format('%s\\addons\\%s\\resources\\%s',
+        AshitaCore:GetInstallPath(), addon.name, iconAtlas.file)
+
+    local textureData = utils.createTextureFromFile(atlasPath)
+    if textureData and textureData.Texture then
+        atlasTexture = textureData
     end
 end
 
-local function loadCategoryIcons()
-    for category, fileName in pairs(categoryNames) do
-        local iconPath = string.format('%s\\addons\\%s\\resources\\icons\\%s.png',
-            AshitaCore:GetInstallPath(), addon.name, fileName)
-
-        if categoryIcons[category] == nil then
-            categoryIcons[category] = {}
-
-            local textureData = utils.createTextureFromFile(iconPath)
-            if textureData and textureData.Texture then
-                categoryIcons[category].Texture = textureData.Texture
-                categoryIcons[category].Pointer = tonumber(ffi.cast('uint32_t', textureData.Texture))
-                categoryIcons[category].Width = textureData.Width
-                categoryIcons[category].Height = textureData.Height
-            end
-        end
+-- Load an icon of resources/icons by file name, from the atlas or from its own file when the atlas is missing
+local function loadIcon(fileName)
+    local region = iconAtlas.icons[fileName]
+    if atlasTexture and region then
+        return {
+            Texture = atlasTexture.Texture,
+            Pointer = tonumber(ffi.cast('uint32_t', atlasTexture.Texture)),
+            Width = region.width,
+            Height = region.height,
+            UV0 = region.uv0,
+            UV1 = region.uv1
+        }
     end
 
-    -- Load favorite icon
-    local favoriteIconPath = string.format('%s\\addons\\%s\\resources\\icons\\favorite.png',
-        AshitaCore:GetInstallPath(), addon.name)
-    local textureData = utils.createTextureFromFile(favoriteIconPath)
+    local iconPath = string.format('%s\\addons\\%s\\resources\\icons\\%s.png',
+        AshitaCore:GetInstallPath(), addon.name, fileName)
+    local textureData = utils.createTextureFromFile(iconPath)
     if textureData and textureData.Texture then
-        favoriteIcon = {
+        return {
             Texture = textureData.Texture,
             Pointer = tonumber(ffi.cast('uint32_t', textureData.Texture)),
             Width = textureData.Width,
-            Height = textureData.Height
+            Height = textureData.Height,
+            UV0 = { 0, 0 },
+            UV1 = { 1, 1 }
         }
     end
 end
 
+local function loadCategoryIcons()
+    for category, fileName in pairs(categoryNames) do
+        if categoryIcons[category] == nil then
+            categoryIcons[category] = loadIcon(fileName) or {}
+        end
+    end
+
+    -- Load favorite icon
+    favoriteIcon = loadIcon('favorite')
+end
+
 -- Load skillchain icons
 local function loadSkillchainIcons()
     for _, scName in ipairs(skillchainNames) do
-        -- Try with _SC_Icon suffix first, then without
-        local iconPath = string.format('%s\\addons\\%s\\resources\\icons\\%s_SC_Icon.png',
-            AshitaCore:GetInstallPath(), addon.name, scName)
-
         -- For Status_Ability, use the direct filename
-        if scName == 'Status_Ability' then
-            iconPath = string.format('%s\\addons\\%s\\resources\\icons\\%s.png',
-                AshitaCore:GetInstallPath(), addon.name, scName)
-        end
+        local fileName = scName == 'Status_Ability' and scName or scName .. '_SC_Icon'
 
         if skillchainIcons[scName] == nil then
-            skillchainIcons[scName] = {}
-
-            local textureData = utils.createTextureFromFile(iconPath)
-            if textureData and textureData.Texture then
-                skillchainIcons[scName].Texture = textureData.Texture
-                skillchainIcons[scName].Pointer = tonumber(ffi.cast('uint32_t', textureData.Texture))
-                skillchainIcons[scName].Width = textureData.Width
-                skillchainIcons[scName].Height = textureData.Height
-            end
+            skillchainIcons[scName] = loadIcon(fileName) or {}
         end
     end
 end
 
--- Get categories for a trust
+local noCategories = {}
+
+-- Get categories for a trust, by in-game or wiki name. The returned list is shared, do not modify it
 local function getTrustCategories(trustName)
-    local categories = {}
+    local mask = trustCategoryIndex.names[trustName]
+    local categories = mask and trustCategoryIndex.categories[mask] or noCategories
 
     -- Check if trust is favorited
     if tme.config.favorites and tme.config.favorites[trustName] then
-        table.insert(categories, 'Favorites')
-    end
-
-    -- Map in-game name to wiki name for lookup
-    local lookupName = nameMapping[trustName] or trustName
-
-    for category, trusts in pairs(trustCategories) do
-        for _, name in ipairs(trusts) do
-            if name == lookupName then
-                table.insert(categories, category)
-            end
+        local withFavorites = { 'Favorites' }
+        for _, category in ipairs(categories) do
+            table.insert(withFavorites, category)
         end
+        return withFavorites
     end
+
     return categories
 end
 
@@ -213,8 +194,8 @@ function ui.drawSearch()
         end
         imgui.Separator()
         for _, category in ipairs(categoryOrder) do
-            -- Show Favorites always, others only if they exist in trustCategories
-            if category == 'Favorites' or trustCategories[category] then
+            -- Show Favorites always, others only if the wiki lists them
+            if category == 'Favorites' or trustCategoryIndex.bits[category] then
                 if imgui.Selectable(category, categoryFilter.selected == category) then
                     categoryFilter.selected = category
                 end
@@ -277,22 +258,22 @@ function ui.drawSearch()
                     -- Draw category icons after the trust name
                     local categories = getTrustCategories(trustName)
                     for _, category in ipairs(categories) do
-                        local iconPtr = nil
+                        local icon = nil
                         local tintColor = categoryColors[category] or { 1.0, 1.0, 1.0, 1.0 }
 
                         if category == 'Favorites' then
-                            iconPtr = favoriteIcon and favoriteIcon.Pointer or nil
+                            icon = favoriteIcon
                             -- Use custom color if set
                             if tme.config.favorites and tme.config.favorites[trustName] then
                                 tintColor = tme.config.favorites[trustName]
                             end
                         else
-                            iconPtr = categoryIcons[category] and categoryIcons[category].Pointer or nil
+                            icon = categoryIcons[category]
                         end
 
-                        if iconPtr then
+                        if icon and icon.Pointer then
                             imgui.SameLine()
-                            imgui.ImageWithBg(iconPtr, { 16, 16 }, { 0, 0 }, { 1, 1 }, { 0, 0, 0, 0 }, tintColor)
+                            imgui.ImageWithBg(icon.Pointer, { 16, 16 }, icon.UV0, icon.UV1, { 0, 0, 0, 0 }, tintColor)
                             if imgui.IsItemHovered() then
                                 imgui.SetTooltip(category)
                             end
@@ -304,7 +285,7 @@ function ui.drawSearch()
                     if imgui.Button('Info##' .. trustName, { 0, 0 }) then
                         infoWindow.visible[1] = true
                         -- Map in-game name to wiki name for info lookup
-                        infoWindow.trustName = nameMapping[trustName] or trustName
+                        infoWindow.trustName = trustAliases[trustName] or trustName
                         infoWindow.scrollY[1] = 0
                     end
                     imgui.PopStyleVar()
@@ -399,22 +380,22 @@ function ui.drawSelected()
                     -- Draw category icons right next to name
                     local categories = getTrustCategories(trustName)
                     for _, category in ipairs(categories) do
-                        local iconPtr = nil
+                        local icon = nil
                         local tintColor = categoryColors[category] or { 1.0, 1.0, 1.0, 1.0 }
 
                         if category == 'Favorites' then
-                            iconPtr = favoriteIcon and favoriteIcon.Pointer or nil
+                            icon = favoriteIcon
                             -- Use custom color if set
                             if tme.config.favorites and tme.config.favorites[trustName] then
                                 tintColor = tme.config.favorites[trustName]
                             end
                         else
-                            iconPtr = categoryIcons[category] and categoryIcons[category].Pointer or nil
+                            icon = categoryIcons[category]
                         end
 
-                        if iconPtr then
+                        if icon and icon.Pointer then
                             imgui.SameLine()
-                            imgui.ImageWithBg(iconPtr, { 16, 16 }, { 0, 0 }, { 1, 1 }, { 0, 0, 0, 0 }, tintColor)
+                            imgui.ImageWithBg(icon.Pointer, { 16, 16 }, icon.UV0, icon.UV1, { 0, 0, 0, 0 }, tintColor)
                             if imgui.IsItemHovered() then
                                 imgui.SetTooltip(category)
                             end
@@ -506,7 +487,7 @@ end
 
 function ui.drawCommands()
     if imgui.Button('Refresh') then
-        search.updateSearch()
+        search.updateSearch(true)
     end
     imgui.SameLine()
 
@@ -810,7 +791,46 @@ local function renderHyperlink(text, url)
     end
 end
 
+-- Scale applied to the pre-measured widths of generated render runs, nil when they cannot be used
+local runScale = nil
+local RUN_GLYPH_WIDTH = 7 -- glyph advance of the default ImGui font the runs were measured with
+
+-- Pre-measured widths are only valid for a monospaced font, scaled to its glyph advance
+local function updateRunScale()
+    local glyphWidth = imgui.CalcTextSize('W')
+    if imgui.CalcTextSize('i') == glyphWidth and imgui.CalcTextSize(' ') == glyphWidth then
+        runScale = glyphWidth / RUN_GLYPH_WIDTH
+    else
+        runScale = nil
+    end
+end
+
+-- Width of a label, from its pre-measured run width when available
+local function measureLabel(label, width, withSpace)
+    if runScale and width then
+        return (width + (withSpace and RUN_GLYPH_WIDTH or 0)) * runScale
+    end
+    return imgui.CalcTextSize(label)
+end
+
 -- Helper function to render a single line of mixed content
+-- Tooltip of a skillchain icon: the property and the trusts with a weapon skill that has it
+local function renderSkillchainTooltip(scName)
+    local trusts = skillchainIndex.elements[scName]
+    if trusts == nil or #trusts == 0 then
+        imgui.SetTooltip(scName == 'Status_Ability' and 'None' or scName)
+        return
+    end
+
+    imgui.BeginTooltip()
+    imgui.PushTextWrapPos(imgui.GetFontSize() * 30)
+    imgui.Text(scName)
+    imgui.Separator()
+    imgui.TextWrapped(string.format('Trusts with %s (%i): %s', scName, #trusts, table.concat(trusts, ', ')))
+    imgui.PopTextWrapPos()
+    imgui.EndTooltip()
+end
+
 local function renderLine(lineItems)
     -- Save current spacing and reduce it for wrapped lines
     local style = imgui.GetStyle()
@@ -831,7 +851,7 @@ local function renderLine(lineItems)
             if isPunctuation then
                 -- Render punctuation without preceding space
                 local label = item.value
-                local labelWidth = imgui.CalcTextSize(label)
+                local labelWidth = measureLabel(label, item.width)
 
                 if not firstInLine and (lineWidth + labelWidth > availWidth) then
                     firstInLine = true
@@ -853,7 +873,7 @@ local function renderLine(lineItems)
             -- Check if text is an operator with spaces (like " / ") - preserve as-is
             if item.value:match('^%s*/%s*$') or item.value:match('^%s*[%-%+%*]%s*$') then
                 local label = item.value
-                local labelWidth = imgui.CalcTextSize(label)
+                local labelWidth = measureLabel(label, item.width)
 
                 if not firstInLine and (lineWidth + labelWidth > availWidth) then
                     firstInLine = true
@@ -872,15 +892,19 @@ local function renderLine(lineItems)
                 return
             end
 
-            -- Split text into words and render each
-            local words = {}
-            for word in item.value:gmatch('%S+') do
-                table.insert(words, word)
+            -- Split text into words and render each, generated data may already carry the words
+            local words = item.words
+            local widths = item.widths or {}
+            if not words then
+                words = {}
+                for word in item.value:gmatch('%S+') do
+                    table.insert(words, word)
+                end
             end
 
             for i, word in ipairs(words) do
                 local label = (addSpace and ' ' or '') .. word
-                local labelWidth = imgui.CalcTextSize(label)
+                local labelWidth = measureLabel(label, widths[i], addSpace)
 
                 if not firstInLine and (lineWidth + labelWidth > availWidth) then
                     -- Wrap to next line
@@ -888,7 +912,7 @@ local function renderLine(lineItems)
                     lineWidth = 0
                     availWidth = imgui.GetContentRegionAvail()
                     label = word
-                    labelWidth = imgui.CalcTextSize(label)
+                    labelWidth = measureLabel(label, widths[i])
                     addSpace = false
                 end
 
@@ -911,14 +935,14 @@ local function renderLine(lineItems)
             end
         elseif item.type == 'link' then
             local label = (addSpace and ' ' or '') .. item.text
-            local labelWidth = imgui.CalcTextSize(label)
+            local labelWidth = measureLabel(label, item.width, addSpace)
 
             if not firstInLine and (lineWidth + labelWidth > availWidth) then
                 firstInLine = true
                 lineWidth = 0
                 availWidth = imgui.GetContentRegionAvail()
                 label = item.text
-                labelWidth = imgui.CalcTextSize(label)
+                labelWidth = measureLabel(label, item.width)
             end
 
             if not firstInLine then
@@ -934,7 +958,7 @@ local function renderLine(lineItems)
             local scIcon = skillchainIcons[item.value]
             if scIcon and scIcon.Pointer then
                 local iconSize = 16
-                local spaceWidth = addSpace and imgui.CalcTextSize(' ') or 0
+                local spaceWidth = addSpace and measureLabel(' ', RUN_GLYPH_WIDTH) or 0
 
                 if not firstInLine and (lineWidth + iconSize + spaceWidth > availWidth) then
                     firstInLine = true
@@ -955,10 +979,9 @@ local function renderLine(lineItems)
                     lineWidth = lineWidth + spaceWidth
                 end
 
-                imgui.Image(scIcon.Pointer, { iconSize, iconSize })
+                imgui.Image(scIcon.Pointer, { iconSize, iconSize }, scIcon.UV0, scIcon.UV1)
                 if imgui.IsItemHovered() then
-                    local displayName = item.value == 'Status_Ability' and 'None' or item.value
-                    imgui.SetTooltip(displayName)
+                    renderSkillchainTooltip(item.value)
                 end
 
                 lineWidth = lineWidth + iconSize
@@ -981,6 +1004,9 @@ local function renderLine(lineItems)
                     imgui.SameLine(0, 0)
                 end
                 imgui.TextColored({ 0.8, 0.6, 1.0, 1.0 }, label)
+                if imgui.IsItemHovered() then
+                    renderSkillchainTooltip(item.value)
+                end
 
                 lineWidth = lineWidth + labelWidth
                 firstInLine = false
@@ -1033,7 +1059,7 @@ function ui.drawInfoWindow()
         return
     end
 
-    local trustData = trustInformation[infoWindow.trustName]
+    local trustData = information.get(infoWindow.trustName)
     if not trustData then
         infoWindow.visible[1] = false
         return
@@ -1043,27 +1069,28 @@ function ui.drawInfoWindow()
     imgui.SetNextWindowPos({ imgui.GetIO().DisplaySize.x * 0.5, imgui.GetIO().DisplaySize.y * 0.5 }, ImGuiCond_FirstUseEver, { 0.5, 0.5 })
 
     if imgui.Begin(string.format('Trust information: %s###TrustInfoWindow', infoWindow.trustName), infoWindow.visible, ImGuiWindowFlags_None) then
+        updateRunScale()
         imgui.Text(infoWindow.trustName)
 
         local categories = getTrustCategories(infoWindow.trustName)
         if #categories > 0 then
             imgui.SameLine()
             for _, category in ipairs(categories) do
-                local iconPtr = nil
+                local icon = nil
                 local tintColor = categoryColors[category] or { 1.0, 1.0, 1.0, 1.0 }
 
                 if category == 'Favorites' then
-                    iconPtr = favoriteIcon and favoriteIcon.Pointer or nil
+                    icon = favoriteIcon
                     -- Use custom color if set
                     if tme.config.favorites and tme.config.favorites[infoWindow.trustName] then
                         tintColor = tme.config.favorites[infoWindow.trustName]
                     end
                 else
-                    iconPtr = categoryIcons[category] and categoryIcons[category].Pointer or nil
+                    icon = categoryIcons[category]
                 end
 
-                if iconPtr then
-                    imgui.ImageWithBg(iconPtr, { 24, 24 }, { 0, 0 }, { 1, 1 }, { 0, 0, 0, 0 }, tintColor)
+                if icon and icon.Pointer then
+                    imgui.ImageWithBg(icon.Pointer, { 24, 24 }, icon.UV0, icon.UV1, { 0, 0, 0, 0 }, tintColor)
                     if imgui.IsItemHovered() then
                         imgui.SetTooltip(category)
                     end
@@ -1312,6 +1339,7 @@ function ui.updateUI()
 end
 
 function ui.init()
+    loadIconAtlas()
     loadCategoryIcons()
     loadSkillchainIcons()
 end